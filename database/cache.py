@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:05:12 2026
+
+@author: C. David
+"""
+import os
+import os.path as osp
+import marshal
+import sqlite3
+import hashlib
+from construct.lib import HexDisplayedBytes, HexDisplayedInteger
+from datatype.compiler import (get_schema_digest, get_schema_paths,
+                               COMMON_PATH, DECODER_GENERATOR)
+import logger
+
+
+CACHE_NAME = 'decode_cache.sqlite'
+
+MAX_SIZE = 1 << 30
+
+COMMIT_EVERY = 1000
+
+MISSING = object()
+
+HEX_INT = 'x'
+
+HEX_BYTES = 'b'
+
+
+PLAIN = frozenset((int, str, bytes, float, bool, type(None)))
+
+
+def to_marshal(obj):
+    '''
+    A pythonic value as marshal stores it, the Hex displayed integers and
+    bytes as tagged tuples, pythonic values have no tuple of their own.
+    '''
+    kind = type(obj)
+    if kind in PLAIN:
+        return obj
+    if kind is dict:
+        return {x: y if type(y) in PLAIN else to_marshal(y)
+                for x, y in obj.items()}
+    if kind is list:
+        return [x if type(x) in PLAIN else to_marshal(x) for x in obj]
+    if kind is HexDisplayedInteger:
+        return HEX_INT, int(obj), obj.fmtstr
+    if kind is HexDisplayedBytes:
+        return HEX_BYTES, bytes(obj)
+    return obj
+
+
+def from_marshal(obj):
+    '''The pythonic value of what to_marshal returns.'''
+    kind = type(obj)
+    if kind in PLAIN:
+        return obj
+    if kind is dict:
+        return {x: y if type(y) in PLAIN else from_marshal(y)
+                for x, y in obj.items()}
+    if kind is list:
+        return [x if type(x) in PLAIN else from_marshal(x) for x in obj]
+    if obj[0] == HEX_INT:
+        return HexDisplayedInteger.new(obj[1], obj[2])
+    return HexDisplayedBytes(obj[1])
+
+
+class DecodeCache:
+    '''
+    Parsed blobs stored in a side SQLite file, keyed by a hash of the raw
+    blob bytes, the schema LAYER and the parse mode, strict or salvage, so
+    that later runs over the same database skip decoding. The entries of a
+    layer are dropped when its schema or the decoders change, once the file
+    holds more than max_size bytes the least recently used entries are
+    evicted.
+
+    The values are stored with marshal, not pickle, reading them never runs
+    code. Still, as for the databases, only use a cache directory written
+    by teleparser.
+    '''
+
+    def __init__(self, directory, layer, max_size=MAX_SIZE, salvage=False):
+        os.makedirs(directory, exist_ok=True)
+        self.path = path = osp.join(directory, CACHE_NAME)
+        self.layer = layer
+        self.max_size = max_size
+        self.salvage = salvage
+        mode = 'salvage' if salvage else 'strict'
+        self.prefix = f'{layer}:{mode}:'.encode()
+        self.pending = 0
+        self.clock = 0
+        self.size = 0
+        self.hits = {}
+        self.connection = sqlite3.connect(path)
+        self.open()
+
+    def open(self):
+        con = self.connection
+        columns = [x[1] for x in con.execute('PRAGMA table_info(blobs)')]
+        if columns and 'layer' not in columns:
+            logger.info('clearing decode cache %s of an older format',
+                        self.path)
+            con.execute('DROP TABLE blobs')
+            con.execute('DROP TABLE IF EXISTS meta')
+        con.execute('CREATE TABLE IF NOT EXISTS meta '
+                    '(key TEXT PRIMARY KEY, value TEXT)')
+        con.execute('CREATE TABLE IF NOT EXISTS blobs '
+                    '(key BLOB PRIMARY KEY, layer INTEGER, value BLOB, '
+                    'size INTEGER, used INTEGER)')
+        con.execute('CREATE INDEX IF NOT EXISTS blobs_used ON blobs (used)')
+        digest = get_schema_digest(*get_schema_paths(layer=self.layer),
+                                   COMMON_PATH, DECODER_GENERATOR)
+        name = f'schema:{self.layer}'
+        row = con.execute('SELECT value FROM meta WHERE key = ?', (name,))
+        if (row := row.fetchone()) is None or row[0] != digest:
+            if row is not None:
+                logger.info('schema layer %d changed, clearing its entries '
+                            'of decode cache %s', self.layer, self.path)
+            con.execute('DELETE FROM blobs WHERE layer = ?', (self.layer,))
+            con.execute('REPLACE INTO meta VALUES (?, ?)', (name, digest))
+            con.commit()
+        self.clock, self.size = con.execute(
+            'SELECT COALESCE(MAX(used), 0), COALESCE(SUM(size), 0) '
+            'FROM blobs').fetchone()
+
+    def get_key(self, data):
+        return hashlib.sha1(self.prefix + bytes(data)).digest()
+
+    def get(self, data, default=MISSING):
+        '''The cached parse result of the blob data, else default.'''
+        key = self.get_key(data)
+        row = self.connection.execute('SELECT value FROM blobs WHERE key = ?',
+                                      (key,)).fetchone()
+        if row is None:
+            return default
+        self.clock += 1
+        self.hits[key] = self.clock
+        return from_marshal(marshal.loads(row[0]))
+
+    def put(self, data, value):
+        '''Store the parse result value of the blob data.'''
+        try:
+            content = marshal.dumps(to_marshal(value))
+        except ValueError:
+            logger.debug('decode cache: value of type %s not stored',
+                         type(value).__name__)
+            return
+        key = self.get_key(data)
+        con = self.connection
+        # a replaced entry no longer counts
+        row = con.execute('SELECT size FROM blobs WHERE key = ?',
+                          (key,)).fetchone()
+        self.clock += 1
+        con.execute('REPLACE INTO blobs VALUES (?, ?, ?, ?, ?)',
+                    (key, self.layer, content, len(content), self.clock))
+        self.size += len(content) - (row[0] if row else 0)
+        self.pending += 1
+        if self.pending >= COMMIT_EVERY:
+            self.commit()
+
+    def evict(self):
+        '''Drop the least recently used entries down to 90% of max_size.'''
+        limit = self.max_size * 9 // 10
+        cursor = self.connection.execute(
+            'SELECT used, size FROM blobs ORDER BY used DESC')
+        total = 0
+        for used, size in cursor.fetchall():
+            total += size
+            if total > limit:
+                self.connection.execute('DELETE FROM blobs WHERE used <= ?',
+                                        (used,))
+                total -= size
+                break
+        logger.info('decode cache evicted down to %d bytes', total)
+        self.size = total
+
+    def commit(self):
+        con = self.connection
+        if self.hits:
+            con.executemany('UPDATE blobs SET used = ? WHERE key = ?',
+                            ((y, x) for x, y in self.hits.items()))
+            self.hits.clear()
+        if self.size > self.max_size:
+            self.evict()
+        con.commit()
+        self.pending = 0
+
+    def close(self):
+        if self.connection is not None:
+            self.commit()
+            self.connection.close()
+            self.connection = None
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:26:53 2026
+
+@author: C. David
+"""
+from construct import FlagsEnum, SizeofError
+from datatype.common import INT32
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None
+try:
+    import pyarrow as pa
+except ModuleNotFoundError:
+    pa = None
+
+
+MESSAGE_FIELDS = ('id', 'date', 'peer_id', 'from_id', 'views', 'forwards',
+                  'message')
+
+FLAG_FIELDS = ('flags', 'flags2')
+
+MESSAGE_DTYPE = [('signature', '<u4'),
+                 ('id', '<u4'),
+                 ('date', '<u4'),
+                 ('flags', '<u4'),
+                 ('flags2', '<u4'),
+                 ('views', '<u4'),
+                 ('forwards', '<u4'),
+                 ('peer_id', '<i8'),
+                 ('from_id', '<i8')]
+
+
+def to_int64(value):
+    '''A 64 bits integer as the clients store it, signed.'''
+    return (value + (1 << 63)) % (1 << 64) - (1 << 63)
+
+
+def get_peer_id(peer):
+    '''
+    Dialog id of a peer as the clients store it, negative for chats and
+    channels, 0 when there is none.
+    '''
+    if not peer:
+        return 0
+    if isinstance(peer, int):
+        return to_int64(peer)
+    if (user_id := peer.get('user_id')) is not None:
+        return to_int64(user_id)
+    return to_int64(-(peer.get('channel_id') or peer.get('chat_id') or 0))
+
+
+def get_flag_offsets(struct):
+    '''
+    Map the FlagsEnum fields of struct to their offset in its blobs, those
+    only preceded by fixed size fields, as the flags of messages are.
+    '''
+    result = {}
+    offset = 0
+    for subcon in struct.subcons:
+        if isinstance(getattr(subcon, 'subcon', None), FlagsEnum):
+            result[subcon.name] = offset
+        try:
+            offset += subcon.sizeof()
+        except (SizeofError, KeyError):
+            break
+    return result
+
+
+def get_flag_bits(struct, name):
+    '''Map the flag names of the FlagsEnum field name of struct to bits.'''
+    for subcon in struct.subcons:
+        if subcon.name == name:
+            return getattr(subcon.subcon, 'flags', {})
+    return {}
+
+
+def get_flags_value(flags, bits):
+    '''The integer of a pythonic flags dict.'''
+    if not flags:
+        return 0
+    return sum(bits.get(x, 0) for x, y in flags.items() if y)
+
+
+def read_flags(parser, struct, offsets, data):
+    '''
+    The raw integers of the FLAG_FIELDS of a blob of struct, read at their
+    offsets, a flags field past a variable size one is decoded instead.
+    '''
+    result = [0] * len(FLAG_FIELDS)
+    missing = []
+    for i, name in enumerate(FLAG_FIELDS):
+        if (offset := offsets.get(name)) is not None:
+            result[i] = INT32(data, offset)[0]
+        elif get_flag_bits(struct, name):
+            missing.append(name)
+    if missing:
+        fields = parser.parse_fields(data, missing)
+        for name in missing:
+            result[FLAG_FIELDS.index(name)] = get_flags_value(
+                fields.get(name), get_flag_bits(struct, name))
+    return result
+
+
+def decode_messages(db, size):
+    '''
+    Decode the messages table of a TelegramDB, reading size rows at a
+    time, into a NumPy structured array of MESSAGE_DTYPE preallocated for
+    the whole table and a list of the message texts in the same order. Only
+    the fields of MESSAGE_FIELDS are decoded from the blobs, the rest of
+    them is skipped by length, and the flags are read as raw integers. Rows
+    without blob or with an unknown constructor are left out.
+    '''
+    if np is None:
+        raise ModuleNotFoundError("No module named 'numpy'")
+    parser = db.parser
+    structs = parser.unprofiled.structs
+    model = db.get_table_model('messages')
+    rows = np.zeros(db.table_count(model.__table__.name), MESSAGE_DTYPE)
+    texts = []
+    offsets = {}
+    index = 0
+    for chunk in db.iter_blobs('messages', 'data', size):
+        for _key, data in chunk:
+            signature = int.from_bytes(data[:4], 'little')
+            if signature not in structs:
+                continue
+            fields = parser.parse_fields(data, MESSAGE_FIELDS)
+            struct = structs[signature]
+            if (flag_offsets := offsets.get(signature)) is None:
+                flag_offsets = offsets[signature] = get_flag_offsets(struct)
+            flags, flags2 = read_flags(parser, struct, flag_offsets, data)
+            rows[index] = (signature,
+                           fields.get('id') or 0,
+                           fields.get('date') or 0,
+                           flags,
+                           flags2,
+                           fields.get('views') or 0,
+                           fields.get('forwards') or 0,
+                           get_peer_id(fields.get('peer_id')),
+                           get_peer_id(fields.get('from_id')))
+            texts.append(fields.get('message'))
+            index += 1
+    return rows[:index], texts
+
+
+def to_arrow(rows, texts):
+    '''
+    A pyarrow Table of the columns decode_messages returns, the texts which
+    are not valid UTF-8, left as bytes, go to message_bytes instead.
+    '''
+    if pa is None:
+        raise ModuleNotFoundError("No module named 'pyarrow'")
+    columns = {x: pa.array(rows[x]) for x in rows.dtype.names}
+    columns['message'] = pa.array(
+        [None if isinstance(x, bytes) else x for x in texts], pa.string())
+    columns['message_bytes'] = pa.array(
+        [x if isinstance(x, bytes) else None for x in texts], pa.binary())
+    return pa.table(columns)
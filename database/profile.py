@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 09:42:17 2026
+
+@author: C. David
+"""
+import csv
+import json
+import os.path as osp
+import logger
+from datatype import get_extractor
+
+
+FORMATS = ('csv', 'jsonl')
+
+BLOB_COLUMN = 'data'
+
+JSON = {'ensure_ascii': False, 'default': str}
+
+
+class TableProfile:
+    '''
+    What to extract from one table into the output name: columns are
+    copied as they are, fields maps the name of an output column to a
+    dotted path of the blob column, as get_obj_value takes them. The paths
+    are compiled once into an Extractor and only they are decoded from the
+    blobs.
+    '''
+
+    def __init__(self, name, fields, columns=(), blob=BLOB_COLUMN,
+                 format='csv', table=None):  # pylint: disable=W0622,R0913
+        if format not in FORMATS:
+            raise ValueError(f'{name}: format must be one of '
+                             f'{", ".join(FORMATS)}, not {format}')
+        if not isinstance(fields, dict):
+            fields = {x: x for x in fields}
+        self.name = name
+        self.table = table or name
+        self.fields = fields
+        self.columns = tuple(columns)
+        self.blob = blob
+        self.format = format
+        self.names = (*self.columns, *self.fields)
+        if len(set(self.names)) != len(self.names):
+            raise ValueError(f'{name}: duplicated output columns')
+        self.paths = tuple(dict.fromkeys(self.fields.values()))
+        self.index = [self.paths.index(x) for x in self.fields.values()]
+        self.extractor = get_extractor(self.paths)
+
+    @classmethod
+    def from_dict(cls, name, data: dict):
+        return cls(name, data.get('fields', ()), data.get('columns', ()),
+                   data.get('blob', BLOB_COLUMN), data.get('format', 'csv'),
+                   data.get('table'))
+
+    def get_path(self, outdir):
+        return osp.join(outdir, f'extract_{self.name}.{self.format}')
+
+    def get_rows(self, rows, values):
+        '''
+        The output rows of (*columns, blob) table rows and the values of
+        extract_blobs for their blobs.
+        '''
+        index = self.index
+        return [(*x[:-1], *(y[i] for i in index))
+                for x, y in zip(rows, values)]
+
+    def open(self, outdir):
+        '''A writer of the output rows into the file of the table.'''
+        if self.format == 'jsonl':
+            return JsonLinesWriter(self.get_path(outdir), self.names)
+        return CsvWriter(self.get_path(outdir), self.names)
+
+
+def load_profile(data):
+    '''
+    The TableProfiles of an extraction profile, a dict or a YAML or JSON
+    file of it, mapping output names, the table names unless given, to
+    their fields, like:
+
+    messages:
+      table: messages       # the output name by default
+      format: jsonl         # csv by default
+      blob: data            # the blob column, data by default
+      columns: [mid, uid]   # table columns, copied as they are
+      fields:               # output column: dotted path of the blob
+        date: date
+        from: from_id.user_id
+        text: message
+    '''
+    if isinstance(data, str):
+        from generater.utils import load_data
+        data = load_data(data)
+    return [TableProfile.from_dict(x, y or {}) for x, y in data.items()]
+
+
+def extract_blobs(parser, paths, blobs):
+    '''
+    The values of the dotted paths of every blob, as tuples in the order of
+    paths, decoding only those paths. A blob failing to decode is logged and
+    gets no values, parser salvages what it can of it in salvage mode.
+    '''
+    extractor = get_extractor(paths)
+    empty = (None,) * len(paths)
+    result = []
+    for data in blobs:
+        if data is None:
+            result.append(empty)
+            continue
+        try:
+            fields = parser.parse_fields(data, paths)
+        except Exception as e:  # pylint: disable=W0718
+            logger.error('unable to decode a blob of %d bytes: %s',
+                         len(data), e)
+            result.append(empty)
+        else:
+            result.append(tuple(extractor(fields).values()))
+    return result
+
+
+def to_cell(value):
+    '''A value of a CSV cell, nested values as JSON, bytes as hex.'''
+    if value is None:
+        return ''
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    if isinstance(value, (dict, list, bool)):
+        return json.dumps(value, **JSON)
+    return value
+
+
+class CsvWriter:
+    def __init__(self, path, names):
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(names)
+        self.count = 0
+
+    def write(self, rows):
+        self.writer.writerows([to_cell(x) for x in row] for row in rows)
+        self.count += len(rows)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class JsonLinesWriter(CsvWriter):
+    def __init__(self, path, names):  # pylint: disable=W0231
+        self.file = open(path, 'w', encoding='utf-8')
+        self.names = names
+        self.count = 0
+
+    def write(self, rows):
+        names = self.names
+        self.file.writelines(f'{json.dumps(dict(zip(names, x)), **JSON)}\n'
+                             for x in rows)
+        self.count += len(rows)
@@ -4,15 +4,23 @@ Created on Thu Dec  1 15:43:28 2022
 @author: C. David
 """
 import re
+from collections import deque
 from functools import lru_cache
-from sqlalchemy import Table, Column, BLOB, inspect
-from datatype import TLStruct
+from sqlalchemy import Table, Column, BLOB, inspect, select
+from datatype import (TLStruct, Compactor, pythonic, get_layer,
+                      get_layer_class)
 from tools.utils import name_convert_to_pascal
+from tools.lazy import lazy_property
 from .base import BaseDB
+from .cache import DecodeCache, MISSING, MAX_SIZE
+from .columns import decode_messages
+from .profile import extract_blobs
 
 
 PARSER = TLStruct()
 
+CHUNK_SIZE = 256
+
 
 def get_column_param(**kwargs):
     if "type" in kwargs:
@@ -20,16 +28,57 @@ def get_column_param(**kwargs):
     return kwargs
 
 
-def get_parser(name):
+def get_parser(name, parse_blob=PARSER.parse_blob, decoded=None):
     def wrapper(self):
         if (data := getattr(self, name, None)) is None:
             return None
-        return PARSER.parse_blob(data)
+        if decoded and (key := inspect(self).identity) in decoded:
+            return decoded[key]
+        return parse_blob(data)
     return wrapper
 
 
+def get_options(parser):
+    '''
+    The options of a TLStruct parser, as the arguments of its class. They
+    are sent with the work of the worker processes, which do not share the
+    options of this process once started by spawn.
+    '''
+    return (parser.raise_error, parser.compiled, parser.cache_dir,
+            parser.decoder, parser.salvage)
+
+
+@lru_cache()
+def get_layer_parser(layer, options):
+    '''PARSER, or a parser of another schema layer or other options.'''
+    if layer == PARSER.LAYER and options == get_options(PARSER):
+        return PARSER
+    parser = get_layer_class(layer)(*options)
+    parser.profiler = PARSER.profiler
+    return parser
+
+
+def decode_chunk(chunk, layer, options):
+    '''Pythonic values of (key, blob) rows, run by the worker processes.'''
+    parser = get_layer_parser(layer, options)
+    values = parser.parse_many(x for _, x in chunk)
+    result = []
+    for (key, _), (value, error) in zip(chunk, values):
+        if error is not None:
+            raise error
+        result.append((key, pythonic(value)))
+    return result
+
+
+def extract_chunk(blobs, paths, layer, options):
+    '''Values of the dotted paths of blobs, run by the worker processes.'''
+    return extract_blobs(get_layer_parser(layer, options), paths, blobs)
+
+
 class TModel:  # pylint: disable=R0903
     '''A base class to represent an Telegram Data object'''
+    PARSER = PARSER
+    COMPACTOR = None
 
     def __repr__(self) -> str:
         state = inspect(self)
@@ -48,6 +97,138 @@ class TelegramDB(BaseDB):
                'params': {'pbytes'},
                'stickers_featured': {'unread'}}
 
+    def __init__(self, path, cache_dir=None, cache_size=MAX_SIZE,
+                 compact=False):
+        super().__init__(path)
+        self.decoded = {}
+        self.cache = None
+        if cache_dir:
+            self.cache = DecodeCache(cache_dir, self.layer, cache_size,
+                                     self.parser.salvage)
+        self.compactor = Compactor() if compact else None
+
+    @lazy_property
+    def layer(self):
+        '''Schema layer of the database, by its user_version and tables.'''
+        return get_layer(self.user_version, self.tables())
+
+    @lazy_property
+    def parser(self):
+        '''The TLStruct parser of the schema layer of the database.'''
+        return get_layer_parser(self.layer, get_options(PARSER))
+
+    def parse_blob(self, data):
+        '''
+        parser.parse_blob, through the decode cache when there is one. The
+        cache holds and returns the pythonic() value of the parse result, as
+        does compact with the Records of compactor.
+        '''
+        if self.cache is None:
+            result = self.parser.parse_blob(data)
+        elif (result := self.cache.get(data)) is MISSING:
+            result = pythonic(self.parser.parse_blob(data))
+            self.cache.put(data, result)
+        if self.compactor is not None:
+            result = self.compactor.compact(pythonic(result))
+        return result
+
+    def iter_blobs(self, name: str, column: str, size=CHUNK_SIZE):
+        '''Yield lists of (primary key, blob) rows of a table blob column'''
+        table = self.get_table_model(name).__table__
+        query = select(*table.primary_key.columns, table.c[column])
+        result = self.session.execute(query)
+        while (rows := result.fetchmany(size)):
+            yield [(tuple(x[:-1]), x[-1]) for x in rows if x[-1] is not None]
+
+    def decode_blobs(self, name: str, column: str, executor, window=64):
+        '''
+        Decode a blob column of a table in the worker processes of executor,
+        at most window chunks at a time. The *_blob property of the column
+        then returns the pythonic value decoded for its row, in place of
+        parsing the blob again. Blobs in the decode cache are not sent.
+        '''
+        if (model := self.get_table_model(name)) is None:
+            return
+        table_name = model.__table__.name
+        if column not in self.get_blob_columns(table_name):
+            return
+        decoded = self.decoded.setdefault((table_name, column), {})
+        pending = deque()
+        for chunk in self.iter_blobs(name, column):
+            if self.cache is not None:
+                missed = []
+                for key, data in chunk:
+                    if (value := self.cache.get(data)) is MISSING:
+                        missed.append((key, data))
+                    elif self.compactor is not None:
+                        decoded[key] = self.compactor.compact(value)
+                    else:
+                        decoded[key] = value
+                chunk = missed
+            future = executor.submit(decode_chunk, chunk, self.layer,
+                                     get_options(self.parser))
+            pending.append((chunk, future))
+            while len(pending) >= window:
+                self.__store_chunk(decoded, *pending.popleft())
+        while pending:
+            self.__store_chunk(decoded, *pending.popleft())
+
+    def __store_chunk(self, decoded, chunk, future):
+        result = future.result()
+        if self.cache is not None:
+            for (_key, data), (_, value) in zip(chunk, result):
+                self.cache.put(data, value)
+        if self.compactor is not None:
+            result = [(x, self.compactor.compact(y)) for x, y in result]
+        decoded.update(result)
+
+    def extract(self, profile, outdir, executor=None, window=64):
+        '''
+        Write the columns and blob fields of the tables of an extraction
+        profile, a list of TableProfiles, to a file per table in outdir. The
+        blobs are decoded in the worker processes of executor if given, at
+        most window chunks at a time. Returns the rows written per output
+        name, tables missing in the database are left out.
+        '''
+        result = {}
+        for table in profile:
+            if (model := self.get_table_model(table.table)) is None:
+                continue
+            columns = model.__table__.c
+            if table.blob not in self.get_blob_columns(model.__table__.name):
+                raise ValueError(f'{model.__table__.name}: no blob column '
+                                 f'{table.blob}')
+            if (missing := [x for x in table.columns if x not in columns]):
+                raise ValueError(f'{model.__table__.name}: no column '
+                                 f'{", ".join(missing)}')
+            query = select(*(columns[x] for x in table.columns),
+                           columns[table.blob])
+            rows = self.session.execute(query)
+            pending = deque()
+            with table.open(outdir) as writer:
+                while (chunk := rows.fetchmany(CHUNK_SIZE)):
+                    blobs = [x[-1] for x in chunk]
+                    if executor is None:
+                        values = extract_blobs(self.parser, table.paths, blobs)
+                        writer.write(table.get_rows(chunk, values))
+                        continue
+                    future = executor.submit(extract_chunk, blobs, table.paths,
+                                             self.layer,
+                                             get_options(self.parser))
+                    pending.append((chunk, future))
+                    while len(pending) >= window:
+                        chunk, future = pending.popleft()
+                        writer.write(table.get_rows(chunk, future.result()))
+                while pending:
+                    chunk, future = pending.popleft()
+                    writer.write(table.get_rows(chunk, future.result()))
+            result[table.name] = writer.count
+        return result
+
+    def close(self):
+        if self.cache is not None:
+            self.cache.close()
+
     @lru_cache()
     def get_columns(self, table_name: str):
         '''Get all columns from a given table'''
@@ -72,8 +253,11 @@ class TelegramDB(BaseDB):
             return None
         class_name = name_convert_to_pascal(table_name)
         bases = tuple([TModel])
-        blob_columns = self.get_blob_columns(table_name)
-        attrs = {f'{x}_blob': property(get_parser(x)) for x in blob_columns}
+        attrs = {'PARSER': self.parser, 'COMPACTOR': self.compactor}
+        for column in self.get_blob_columns(table_name):
+            decoded = self.decoded.setdefault((table_name, column), {})
+            parser = get_parser(column, self.parse_blob, decoded)
+            attrs[f'{column}_blob'] = property(parser)
         columns = self.get_columns(table_name)
         schemas = [Column(**get_column_param(**x)) for x in columns]
         if all(x['primary_key'] == 0 for x in columns):
@@ -114,6 +298,13 @@ class TelegramDB(BaseDB):
         '''Retrieve message data'''
         return self.get_table_data('messages')
 
+    def get_message_columns(self):
+        '''
+        Retrieve the fixed width message fields as a NumPy structured array
+        and the message texts as a list, see columns.decode_messages
+        '''
+        return decode_messages(self, CHUNK_SIZE)
+
     def get_sent_files(self) -> list:
         '''Retrieve sent file data'''
         return self.get_table_data('sent_files')
@@ -4,5 +4,7 @@ Created on Tue Dec  6 00:47:50 2022
 
 @author: C. David
 """
-from .telegram import TLStruct
-from .utils import MIME_TYPE, get_obj_value, pythonic, format_dict
+from .telegram import TLStruct, get_layer, get_layer_class
+from .utils import (MIME_TYPE, get_obj_value, get_obj_values, get_accessor,
+                    get_extractor, pythonic, format_dict, JsonWriter)
+from .compact import Record, Compactor
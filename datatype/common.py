@@ -4,15 +4,30 @@ Created on Tue Dec  6 00:45:38 2022
 
 @author: C. David
 """
+import hashlib
+from functools import lru_cache
+from io import BytesIO
+from collections.abc import Mapping
+from struct import Struct as PackStruct, pack, unpack, calcsize
 from datetime import datetime, UTC
-from construct import (Struct, Computed, Int32ul, Hex, Byte, Bytes,
-                       IfThenElse, If, Padding, Peek, this)
+import construct
+from construct import (Construct, Subconstruct, Container, ListContainer,
+                       Array, FormatField, SizeofError)
+from construct.core import stream_read, stream_write, evaluate
+from construct.lib import HexDisplayedBytes, HexDisplayedInteger
 import logger
 
 
-def decode_string(ctx):
+INT32 = PackStruct('<I').unpack_from
+INT64 = PackStruct('<Q').unpack_from
+DOUBLE = PackStruct('>d').unpack_from  # same byte order as construct Double
+
+BOOL_TRUE = 0x997275b5
+BOOL_FALSE = 0xbc799737
+
+
+def decode_string(value):
     '''Decodes UTF-8 encoded strings.'''
-    value = ctx._value  # pylint: disable=W0212
     try:
         result = value.decode('utf-8')
     except UnicodeDecodeError:
@@ -21,61 +36,426 @@ def decode_string(ctx):
     return result
 
 
-def parse_boolean(ctx):
+def parse_boolean(value):
     '''Parse boolean values'''
-    value = ctx._value  # pylint: disable=W0212
-    if value == 0x997275b5:
+    if value == BOOL_TRUE:
         return True
-    elif value == 0xbc799737:
+    elif value == BOOL_FALSE:
         return False
     else:
         logger.error('Not bool value: %s', value)
         return False
 
 
-def parse_timestamp(ctx):
+def parse_timestamp(epoch):
     '''Convert an integer timestamp into ISO format'''
-    epoch = ctx.epoch
     return datetime.fromtimestamp(epoch, UTC).isoformat()
 
 
-def parse_varint(ctx):
-    '''Parse a varint from the context object.'''
-    check = ctx._check  # pylint: disable=W0212
-    pl = ctx._pl  # pylint: disable=W0212
-    return pl >> 8 if check >= 254 else pl
-
-
-TString = Struct(
-    'sname' / Computed('string'),
-    '_check' / Peek(Byte),
-    '_pl' / IfThenElse(this._check >= 254, Int32ul, Byte),  # pylint: disable=W0212
-    'len' / Computed(parse_varint),
-    '_value' / Bytes(this.len),
-    'value' / Computed(decode_string),
-    IfThenElse(this._check >= 254,    # pylint: disable=W0212
-               If(this.len % 4, Padding(4 - this.len % 4)),
-               If((this.len + 1) % 4, Padding(4 - (this.len + 1) % 4))))
-
-
-TBytes = Struct(
-    'sname' / Computed('bytes'),
-    '_check' / Peek(Byte),
-    '_pl' / IfThenElse(this._check >= 254, Int32ul, Byte),  # pylint: disable=W0212
-    'len' / Computed(parse_varint),
-    'value' / Hex(Bytes(this.len)),
-    IfThenElse(this._check >= 254,    # pylint: disable=W0212
-               If(this.len % 4, Padding(4 - this.len % 4)),
-               If((this.len + 1) % 4, Padding(4 - (this.len + 1) % 4))))
-
-TBool = Struct(
-    'sname' / Computed('boolean'),
-    '_value' / Int32ul,
-    'value' / Computed(parse_boolean))
-
-# This is not struct define by Telegram, but it's useful to get human readable
-# timestamps.
-TTimestamp = Struct(
-    'sname' / Computed('timestamp'),
-    'epoch' / Int32ul,
-    'date' / Computed(parse_timestamp))
+class BufferStream:
+    '''Read only stream over a buffer, reads copy only the bytes they return.'''
+    __slots__ = ('view', 'pos')
+
+    def __init__(self, buffer, offset=0):
+        self.view = memoryview(buffer).cast('B')
+        self.pos = offset
+
+    def read(self, size=-1):
+        start = self.pos
+        end = len(self.view) if size is None or size < 0 else start + size
+        data = self.view[start:end].tobytes()
+        self.pos = start + len(data)
+        return data
+
+    def tell(self):
+        return self.pos
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self.pos
+        elif whence == 2:
+            offset += len(self.view)
+        self.pos = max(offset, 0)
+        return self.pos
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+
+def open_stream(buffer, offset=0):
+    '''
+    Return a stream positioned at offset of buffer without copying it, a
+    BytesIO shares the memory of a bytes object until it is written.
+    '''
+    if isinstance(buffer, bytes):
+        stream = BytesIO(buffer)
+        stream.seek(offset)
+        return stream
+    return BufferStream(buffer, offset)
+
+
+def read_tl_bytes(buf, offset):
+    '''Read a TL length prefixed byte string from a buffer at offset.
+
+    Returns the payload and the offset after the padding.'''
+    check = buf[offset]
+    if check >= 254:
+        length = int.from_bytes(buf[offset + 1:offset + 4], 'little')
+        start = offset + 4
+        end = start + length
+        padding = -length % 4
+    else:
+        length = check
+        start = offset + 1
+        end = start + length
+        padding = -(length + 1) % 4
+    if end + padding > len(buf):
+        raise ValueError(f'TL bytes at {offset} exceed the buffer, '
+                         f'length: {length}, size: {len(buf)}')
+    return bytes(buf[start:end]), end + padding
+
+
+def skip_tl_bytes(buf, offset):
+    '''Return the offset after the TL length prefixed byte string at offset.'''
+    check = buf[offset]
+    if check >= 254:
+        length = int.from_bytes(buf[offset + 1:offset + 4], 'little')
+        end = offset + 4 + length + (-length % 4)
+    else:
+        end = offset + 1 + check + (-(check + 1) % 4)
+    if end > len(buf):
+        raise ValueError(f'TL bytes at {offset} exceed the buffer, '
+                         f'size: {len(buf)}')
+    return end
+
+
+def read_string(buf, offset):
+    '''Read a TL string, same value as TString's value field.'''
+    value, offset = read_tl_bytes(buf, offset)
+    return decode_string(value), offset
+
+
+def read_bytes(buf, offset):
+    '''Read TL bytes, same value as TBytes's value field.'''
+    value, offset = read_tl_bytes(buf, offset)
+    return HexDisplayedBytes(value), offset
+
+
+def read_bool(buf, offset):
+    '''Read a TL boolean, same value as TBool's value field.'''
+    return parse_boolean(INT32(buf, offset)[0]), offset + 4
+
+
+def hex_int(value, size):
+    '''An integer of size bytes as Hex displays it, 0x and upper case.'''
+    return HexDisplayedInteger.new(value, f'0{2 * size}X')
+
+
+@lru_cache(maxsize=None)
+def hex_const(value, size=4):
+    '''The hex_int of a constant, as a signature, shared by its parses.'''
+    return hex_int(value, size)
+
+
+def stream_tl_bytes(stream, path='(compiled)'):
+    '''Read the payload of a TL length prefixed byte string from stream.'''
+    check = stream_read(stream, 1, path)[0]
+    if check >= 254:
+        length = int.from_bytes(stream_read(stream, 3, path), 'little')
+        padding = -length % 4
+    else:
+        length = check
+        padding = -(length + 1) % 4
+    data = stream_read(stream, length + padding, path)
+    return data[:length] if padding else data
+
+
+def pack_tl_bytes(value):
+    '''Serialize a payload as a TL length prefixed byte string.'''
+    length = len(value)
+    if length < 254:
+        data = bytes([length]) + value
+    else:
+        data = b'\xfe' + length.to_bytes(3, 'little') + value
+    return data + b'\x00' * (-len(data) % 4)
+
+
+def parse_tl_bytes(stream, sname, decode, path='(compiled)'):
+    data = stream_tl_bytes(stream, path)
+    return Container(sname=sname, len=len(data), value=decode(data))
+
+
+def parse_tl_boolean(stream, path='(compiled)'):
+    value = int.from_bytes(stream_read(stream, 4, path), 'little')
+    return Container(sname='boolean', value=parse_boolean(value))
+
+
+def parse_tl_timestamp(stream, path='(compiled)'):
+    epoch = int.from_bytes(stream_read(stream, 4, path), 'little')
+    return Container(sname='timestamp', epoch=epoch,
+                     date=parse_timestamp(epoch))
+
+
+def parse_numbers(stream, count, fmtstr, path='(compiled)'):
+    '''Read count numbers of a FormatField format with a single unpack.'''
+    fmt = f'{fmtstr[0]}{count}{fmtstr[1:]}'
+    return ListContainer(unpack(fmt, stream_read(stream, calcsize(fmt),
+                                                 path)))
+
+
+class TLBytes(Construct):
+    '''
+    TL string or bytes, the length prefix, payload and padding are read by a
+    single _parse call into Container(sname, len, value), value is the
+    payload passed through decode.
+    '''
+
+    def __init__(self, sname, decode):
+        super().__init__()
+        self.sname = sname
+        self.decode = decode
+
+    def _parse(self, stream, context, path):
+        return parse_tl_bytes(stream, self.sname, self.decode, path)
+
+    def _build(self, obj, stream, context, path):
+        value = obj['value'] if isinstance(obj, dict) else obj
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        data = pack_tl_bytes(value)
+        stream_write(stream, data, len(data), path)
+        return obj
+
+    def _sizeof(self, context, path):
+        raise SizeofError('TL bytes have a variable size', path=path)
+
+    def _emitparse(self, code):
+        decode = self.decode.__name__
+        code.append(f'from {__name__} import parse_tl_bytes')
+        code.append(f'from {self.decode.__module__} import {decode}')
+        return f'parse_tl_bytes(io, {self.sname!r}, {decode})'
+
+
+class TLBoolean(Construct):
+    '''TL boolean parsed into Container(sname, value).'''
+
+    def _parse(self, stream, context, path):
+        return parse_tl_boolean(stream, path)
+
+    def _build(self, obj, stream, context, path):
+        value = obj['value'] if isinstance(obj, dict) else obj
+        data = (BOOL_TRUE if value else BOOL_FALSE).to_bytes(4, 'little')
+        stream_write(stream, data, 4, path)
+        return obj
+
+    def _sizeof(self, context, path):
+        return 4
+
+    def _emitparse(self, code):
+        code.append(f'from {__name__} import parse_tl_boolean')
+        return 'parse_tl_boolean(io)'
+
+
+class TLTimestamp(Construct):
+    '''
+    Unix time parsed into Container(sname, epoch, date). This is not a type
+    defined by Telegram, but it's useful to get human readable timestamps.
+    '''
+
+    def _parse(self, stream, context, path):
+        return parse_tl_timestamp(stream, path)
+
+    def _build(self, obj, stream, context, path):
+        epoch = obj['epoch'] if isinstance(obj, dict) else obj
+        stream_write(stream, epoch.to_bytes(4, 'little'), 4, path)
+        return obj
+
+    def _sizeof(self, context, path):
+        return 4
+
+    def _emitparse(self, code):
+        code.append(f'from {__name__} import parse_tl_timestamp')
+        return 'parse_tl_timestamp(io)'
+
+
+def parse_tl_union(stream, this, cases, name):
+    '''
+    Parse the object at the stream position with the parse(io, this)
+    function cases maps its signature to, into a Container of the signature
+    and the object under name, None when the signature is unknown or
+    missing.
+    '''
+    data = stream.read(4)
+    stream.seek(-len(data), 1)
+    if len(data) < 4:
+        return Container(_signature=None, **{name: None})
+    signature = int.from_bytes(data, 'little')
+    if (func := cases.get(signature)) is None:
+        return Container(_signature=signature, **{name: None})
+    return Container(_signature=signature, **{name: func(stream, this)})
+
+
+class TLUnion(Construct):
+    '''
+    A *_structures union, the signature is read once and the object parsed
+    by the constructor cases maps it to. It is returned under the union
+    name in a Container with the _signature, as the Peek and Switch Struct
+    of the union did. The LazyBound cases are resolved on first use and
+    kept in resolved.
+    '''
+
+    def __init__(self, name, cases):
+        super().__init__()
+        self.name = name
+        self.cases = cases
+        self.resolved = {}
+
+    def resolve(self, cid):
+        if (struct := self.resolved.get(cid)) is None:
+            if (case := self.cases.get(cid)) is None:
+                return None
+            struct = self.resolved[cid] = case.subconfunc()
+        return struct
+
+    def load(self):
+        '''Resolve every case up front.'''
+        for cid in self.cases:
+            self.resolve(cid)
+        return self
+
+    def _parse(self, stream, context, path):
+        data = stream.read(4)
+        stream.seek(-len(data), 1)
+        if len(data) < 4:
+            return Container(_signature=None, **{self.name: None})
+        signature = int.from_bytes(data, 'little')
+        if (struct := self.resolve(signature)) is None:
+            return Container(_signature=signature, **{self.name: None})
+        obj = struct._parsereport(stream, context, path)
+        return Container(_signature=signature, **{self.name: obj})
+
+    def _build(self, obj, stream, context, path):
+        value = obj[self.name]
+        if (struct := self.resolve(value['signature'])) is None:
+            raise construct.SwitchError(
+                f'unknown signature: 0x{value["signature"]:08x}', path=path)
+        struct._build(value, stream, context, path)
+        return obj
+
+    def _sizeof(self, context, path):
+        raise SizeofError('TL unions have a variable size', path=path)
+
+    def _emitparse(self, code):
+        items = ''.join(f'\n    0x{x:08x}: lambda io, this: {y._compileparse(code)},'
+                        for x, y in self.cases.items())
+        table = f'UNION_{hashlib.sha1(items.encode()).hexdigest()[:12]}'
+        code.append(f'from {__name__} import parse_tl_union')
+        code.append(f'{table} = {{{items}\n}}')
+        return f'parse_tl_union(io, this, {table}, {self.name!r})'
+
+
+class NumberArray(Subconstruct):
+    '''
+    Array of a fixed size number, such as the items of Vector<int>,
+    Vector<long> and Vector<double>. The whole payload is read and unpacked
+    at once into a ListContainer, without a context per element.
+    '''
+
+    def __init__(self, count, subcon: FormatField):
+        super().__init__(subcon)
+        self.count = count
+
+    def _parse(self, stream, context, path):
+        count = evaluate(self.count, context)
+        return parse_numbers(stream, count, self.subcon.fmtstr, path)
+
+    def _build(self, obj, stream, context, path):
+        fmtstr = self.subcon.fmtstr
+        data = pack(f'{fmtstr[0]}{len(obj)}{fmtstr[1:]}', *obj)
+        stream_write(stream, data, len(data), path)
+        return obj
+
+    def _sizeof(self, context, path):
+        return evaluate(self.count, context) * self.subcon.length
+
+    def _emitparse(self, code):
+        code.append(f'from {__name__} import parse_numbers')
+        return f'parse_numbers(io, {self.count}, {self.subcon.fmtstr!r})'
+
+
+class Flags(Mapping):
+    '''
+    Flags of an object as the raw integer and the name to mask table shared
+    by every object of its constructor, a flag is only tested when read,
+    by key or attribute.
+    '''
+    __slots__ = ('value', 'names')
+
+    def __init__(self, value, names):
+        self.value = value
+        self.names = names
+
+    def __getitem__(self, name):
+        mask = self.names[name]
+        return self.value & mask == mask
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name in self.__slots__:
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getstate__(self):
+        return self.value, self.names
+
+    def __setstate__(self, state):
+        self.value, self.names = state
+
+    def __repr__(self):
+        return f'Flags({dict(self)})'
+
+
+class FlagsEnum(construct.FlagsEnum):
+    '''FlagsEnum parsing into Flags rather than a Container of booleans.'''
+
+    def _decode(self, obj, context, path):
+        return Flags(obj, self.flags)
+
+    def _encode(self, obj, context, path):
+        if isinstance(obj, Flags):
+            return obj.value
+        return super()._encode(obj, context, path)
+
+    def _emitparse(self, code):
+        names = repr(self.flags)
+        table = f'FLAGS_{hashlib.sha1(names.encode()).hexdigest()[:12]}'
+        code.append(f'from {__name__} import Flags')
+        code.append(f'{table} = {names}')
+        return f'Flags({self.subcon._compileparse(code)}, {table})'
+
+
+def TLArray(count, subcon):
+    '''Array of count subcon, a NumberArray when subcon is a number.'''
+    if isinstance(subcon, FormatField):
+        return NumberArray(count, subcon)
+    return Array(count, subcon)
+
+
+TString = TLBytes('string', decode_string)
+
+TBytes = TLBytes('bytes', HexDisplayedBytes)
+
+TBool = TLBoolean()
+
+TTimestamp = TLTimestamp()
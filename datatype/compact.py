@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 10:05:31 2026
+
+@author: C. David
+"""
+from collections.abc import Mapping
+from keyword import iskeyword
+from math import copysign
+from operator import attrgetter
+
+
+class Record(Mapping):
+    '''
+    A decoded object of the pythonic shape with its fields as slots, read
+    as a dict. A class is made per tuple of field names, the names being
+    slot names are interned and stored once per class instead of once per
+    object. Records of the same class compare and hash by their values,
+    and the types of their values, so that a record of True is not equal
+    to one of 1 or 1.0, nor one of -0.0 to one of 0.0, although these
+    values compare equal: Compactor shares the records equal to each other.
+    '''
+    __slots__ = ()
+    _fields = ()
+    _names = frozenset()
+    _getter = staticmethod(lambda obj: ())
+
+    def __init__(self, values):
+        for name, value in zip(self._fields, values):
+            setattr(self, name, value)
+
+    def __getitem__(self, key):
+        if key in self._names:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._names
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def _astuple(self):
+        return self._getter(self)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            values, others = self._astuple(), other._astuple()
+            return values == others and all(map(same_kind, values, others))
+        return super().__eq__(other)
+
+    def __hash__(self):
+        return hash((self._fields, self._astuple()))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def __reduce__(self):
+        return make_record, (self._fields, self._astuple())
+
+
+def same_kind(value, other):
+    '''Whether two equal values are of the same type, and zero sign.'''
+    kind = type(value)
+    if kind is not type(other):
+        return False
+    if kind is float and value == 0:
+        return copysign(1, value) == copysign(1, other)
+    return True
+
+
+RESERVED = frozenset(dir(Record))
+
+RECORDS = {}
+
+
+def get_record_class(fields: tuple):
+    '''
+    The Record class of a tuple of field names, None for names that can not
+    be slots: not identifiers, private or those of the Mapping methods.
+    '''
+    if (cls := RECORDS.get(fields)) is not None:
+        return cls
+    if not all(x.isidentifier() and not x.startswith('_') and
+               x not in RESERVED for x in fields):
+        return None
+    namespace = {'__slots__': fields, '_fields': fields,
+                 '_names': frozenset(fields)}
+    if len(fields) > 1:
+        namespace['_getter'] = staticmethod(attrgetter(*fields))
+    elif fields:
+        getter = attrgetter(*fields)
+        namespace['_getter'] = staticmethod(lambda obj: (getter(obj),))
+    if fields and not any(map(iskeyword, fields)):
+        source = (f'def __init__(self, values):\n'
+                  f'    {", ".join(f"self.{x}" for x in fields)}, = values\n')
+        code = {}
+        exec(source, code)  # pylint: disable=W0122
+        namespace['__init__'] = code['__init__']
+    cls = type(Record.__name__, (Record,), namespace)
+    return RECORDS.setdefault(fields, cls)
+
+
+def make_record(fields, values):
+    return get_record_class(fields)(values)
+
+
+class Compactor:
+    '''
+    Convert pythonic values into a compact form with the same read access:
+    dicts become Records, and the records holding only immutable values,
+    as the same peer_user or photo_size in many objects, are shared, one
+    object per distinct value.
+    '''
+
+    def __init__(self):
+        self.records = {}
+
+    def compact(self, obj):
+        return self.convert(obj)[0]
+
+    def convert(self, obj):
+        '''The compact obj and whether it is immutable.'''
+        if isinstance(obj, dict):
+            if (cls := get_record_class(tuple(obj))) is None:
+                return {x: self.compact(y) for x, y in obj.items()}, False
+            values = list(obj.values())
+            frozen = True
+            kinds = set(map(type, values))
+            if dict in kinds or list in kinds:
+                for i, value in enumerate(values):
+                    if isinstance(value, (dict, list)):
+                        values[i], shared = self.convert(value)
+                        frozen = frozen and shared
+            record = cls(values)
+            if frozen:
+                record = self.records.setdefault(record, record)
+            return record, frozen
+        if isinstance(obj, list):
+            return [self.compact(x) for x in obj], False
+        return obj, True
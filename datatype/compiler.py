@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:02:17 2026
+
+@author: C. David
+"""
+import os
+import os.path as osp
+import sys
+import types
+import marshal
+import hashlib
+import tempfile
+from glob import glob
+from threading import RLock
+from construct import Computed, Compiled, Const, FormatField, Hex, LazyBound
+from construct.core import CodeGen
+from construct.expr import ExprMixin
+import logger
+
+
+DIR = osp.realpath(osp.dirname(__file__))
+COMPILER_PATH = osp.realpath(__file__)
+SCHEMA_PATH = osp.join(DIR, 'telegram.py')
+COMMON_PATH = osp.join(DIR, 'common.py')
+DECODER_GENERATOR = osp.join(osp.dirname(DIR), 'generater', 'decoder.py')
+
+
+def get_user_cache_dir():
+    '''
+    The per-user directory of the compiled caches, TELEPARSER_CACHE when
+    set, else teleparser in the cache directory of the platform.
+    '''
+    if (path := os.environ.get('TELEPARSER_CACHE')):
+        return path
+    if sys.platform == 'win32':
+        base = (os.environ.get('LOCALAPPDATA') or
+                osp.join(osp.expanduser('~'), 'AppData', 'Local'))
+    elif sys.platform == 'darwin':
+        base = osp.join(osp.expanduser('~'), 'Library', 'Caches')
+    else:
+        base = (os.environ.get('XDG_CACHE_HOME') or
+                osp.join(osp.expanduser('~'), '.cache'))
+    return osp.join(base, 'teleparser')
+
+
+COMPILED_CACHE = get_user_cache_dir()
+
+HEADER = '''
+# generated by teleparser from the construct schema, do not edit!
+# schema: {digest}
+
+from construct import *
+from construct.lib import *
+from io import BytesIO
+import struct
+import collections
+import itertools
+from datatype.common import hex_int, hex_const
+
+def restream(data, func):
+    return func(BytesIO(data))
+def reuse(obj, func):
+    return func(obj)
+
+len_ = len
+sum_ = sum
+min_ = min
+max_ = max
+abs_ = abs
+'''
+
+
+class SchemaCodeGen(CodeGen):
+    '''CodeGen with constant time block deduplication.'''
+
+    def __init__(self):
+        super().__init__()
+        self.block_set = set()
+
+    def append(self, block):
+        block = [s for s in block.splitlines() if s.strip()]
+        trim = len(block[0]) - len(block[0].lstrip())
+        block = "\n".join(s[trim:] for s in block)
+        if block not in self.block_set:
+            self.block_set.add(block)
+            self.blocks.append(block)
+
+
+def get_schema_paths(path=SCHEMA_PATH, layer=None):
+    '''
+    The TLStruct module at path and the modules of its schema groups, with
+    layer, followed by the modules of that layer package next to them.
+    '''
+    directory = osp.dirname(path)
+    paths = [path, *sorted(glob(osp.join(directory, 'schema', '*.py')))]
+    if layer is not None:
+        package = osp.join(directory, 'layers', f'layer_{layer}')
+        paths.extend(sorted(glob(osp.join(package, '*.py'))))
+    return paths
+
+
+def get_schema_digest(*paths):
+    '''
+    Hash of the schema modules, a compiled cache is only valid for them.
+    Extra paths, such as the generator of the cache, are hashed along with
+    them.
+    '''
+    digest = hashlib.sha1()
+    for path in paths or get_schema_paths():
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def iter_subcons(obj):
+    '''Yield the direct children of a construct.'''
+    if (subcons := getattr(obj, 'subcons', None)):
+        yield from subcons
+    for name in ('subcon', 'thensubcon', 'elsesubcon', 'default'):
+        if (subcon := getattr(obj, name, None)) is not None:
+            yield subcon
+    if (cases := getattr(obj, 'cases', None)):
+        yield from cases.values()
+
+
+def get_lazy_cid(obj: LazyBound):
+    '''Return the constructor id a LazyBound resolves to.'''
+    name = getattr(obj.subconfunc, '__name__', '')
+    if not name.startswith('struct_0x'):
+        raise TypeError(f'LazyBound is not bound to a constructor: {name}')
+    return int(name[7:], 16)
+
+
+def link_hex(code: CodeGen, obj: Hex):
+    '''
+    Pre-fill the parser cache of code for a Hex of an integer, so that its
+    value is displayed as the interpreted Hex does, construct only emits
+    the parser of the subcon. Other Hex constructs are left to construct.
+    '''
+    subcon = obj.subcon
+    field = subcon.subcon if isinstance(subcon, Const) else subcon
+    if not isinstance(field, FormatField) or field.fmtstr[-1] in 'efd':
+        return
+    func = 'hex_const' if isinstance(subcon, Const) else 'hex_int'
+    code.parsercache[id(obj)] = (f'{func}({subcon._compileparse(code)}, '
+                                 f'{field.length})')
+
+
+def link_schema(code: CodeGen, dispatch: dict):
+    '''
+    Pre-fill the parser cache of code, so that every LazyBound calls the
+    compiled constructor function by name, every Computed callable is
+    imported by name and every Hex integer is displayed as such. The
+    emitted source then has no reference to objects of the current process
+    and can be cached on disk.
+    '''
+    visited = set()
+    stack = list(dispatch.values())
+    while stack:
+        obj = stack.pop()
+        if id(obj) in visited:
+            continue
+        visited.add(id(obj))
+        if isinstance(obj, LazyBound):
+            cid = get_lazy_cid(obj)
+            if cid not in dispatch:
+                dispatch[cid] = obj.subconfunc()
+                stack.append(dispatch[cid])
+            code.parsercache[id(obj)] = f'parse_0x{cid:08x}(io, this)'
+            continue
+        if isinstance(obj, Computed):
+            func = obj.func
+            if callable(func) and not isinstance(func, ExprMixin):
+                code.append(f'from {func.__module__} import {func.__name__}')
+                code.parsercache[id(obj)] = f'{func.__name__}(this)'
+            continue
+        if isinstance(obj, Hex):
+            link_hex(code, obj)
+        stack.extend(iter_subcons(obj))
+
+
+def generate_source(dispatch: dict, digest: str):
+    '''Generate the python source of all constructors in dispatch.'''
+    dispatch = dict(dispatch)
+    code = SchemaCodeGen()
+    code.append(HEADER.format(digest=digest))
+    link_schema(code, dispatch)
+    for cid, struct in dispatch.items():
+        code.append(f'''
+            def parse_0x{cid:08x}(io, this):
+                return {struct._compileparse(code)}
+        ''')
+    if code.linkedinstances:
+        raise TypeError(f'{len(code.linkedinstances)} constructs can not be '
+                        'compiled into cacheable source')
+    items = ',\n'.join(f'    0x{x:08x}: parse_0x{x:08x}' for x in dispatch)
+    code.append(f'PARSERS = {{\n{items}\n}}')
+    return code.toString()
+
+
+def read_digest(path):
+    '''Read the schema digest recorded in a compiled cache file.'''
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('# schema: '):
+                return line[10:].strip()
+    return None
+
+
+def write_file(path, data: bytes):
+    '''
+    Write data to path through a temporary file next to it that replaces
+    path at once, other processes never read a partly written file.
+    '''
+    directory = osp.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp = tempfile.mkstemp(suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def load_code(path, digest):
+    '''
+    Load the code object of a compiled cache file, the bytecode is cached
+    next to it with the schema digest so later runs skip both code
+    generation and compilation.
+    '''
+    code_path = f'{osp.splitext(path)[0]}.{sys.implementation.cache_tag}.bin'
+    if osp.isfile(code_path):
+        with open(code_path, 'rb') as f:
+            try:
+                code_digest, code = marshal.load(f)
+            except (EOFError, ValueError, TypeError):
+                code_digest = None
+        if code_digest == digest:
+            return code
+    with open(path, encoding='utf-8') as f:
+        code = compile(f.read(), path, 'exec')
+    try:
+        write_file(code_path, marshal.dumps((digest, code)))
+    except OSError as e:
+        logger.warning('can not cache the bytecode of %s: %s', path, e)
+    return code
+
+
+def write_source(path, source):
+    '''
+    Write a generated source file, when its directory can not be written
+    it goes to a temporary directory for this run only.
+    '''
+    try:
+        write_file(path, source.encode('utf-8'))
+    except OSError as e:
+        logger.warning('can not write %s: %s', path, e)
+        directory = tempfile.mkdtemp(prefix='teleparser-')
+        path = osp.join(directory, osp.basename(path))
+        write_file(path, source.encode('utf-8'))
+    return path
+
+
+def load_compiled(dispatch: dict, layer: int, cache_dir=None, profiler=None,
+                  names=None):
+    '''
+    Return a dispatch table of Compiled constructs for the given interpreted
+    one. The generated source is cached per layer in cache_dir and only
+    regenerated when the schema module changes. With a ConstructorProfiler,
+    the constructor functions record into it, names maps their ids to names.
+    '''
+    cache_dir = cache_dir or COMPILED_CACHE
+    path = osp.join(cache_dir, f'layer_{layer}.py')
+    digest = get_schema_digest(*get_schema_paths(layer=layer), COMMON_PATH,
+                               COMPILER_PATH)
+    if not (osp.isfile(path) and read_digest(path) == digest):
+        logger.info('compiling schema layer %d into %s', layer, path)
+        path = write_source(path, generate_source(dispatch, digest))
+    module = types.ModuleType(f'teleparser_compiled_layer_{layer}')
+    module.__file__ = path
+    exec(load_code(path, digest), module.__dict__)  # pylint: disable=W0122
+    if profiler is not None:
+        profiler.instrument(module.__dict__, 'parse_0x',
+                            profiler.wrap_compiled, names or {})
+    return {cid: Compiled(func, None) for cid, func in module.PARSERS.items()}
+
+
+def load_decoders(parser):
+    '''
+    Return the module of plain python decoders, DECODERS maps a constructor
+    id to decode(buf, offset) returning the pythonic value of the object at
+    offset and the offset after it, SKIPPERS to skip(buf, offset) returning
+    only that offset and UNION_SKIPPERS does the same per *_structures name.
+    The module is generated from the structs and unions of the TLStruct
+    parser on the first use and cached per layer in its cache_dir like the
+    compiled constructs.
+    '''
+    layer = parser.LAYER
+    cache_dir = parser.cache_dir or COMPILED_CACHE
+    path = osp.join(cache_dir, f'decoder_{layer}.py')
+    digest = get_schema_digest(*get_schema_paths(layer=layer),
+                               DECODER_GENERATOR)
+    if not (osp.isfile(path) and read_digest(path) == digest):
+        from generater.decoder import generate_decoder_source
+        logger.info('generating schema layer %d decoders into %s',
+                    layer, path)
+        path = write_source(path, generate_decoder_source(
+            parser.structs, digest, parser.unions))
+    module = types.ModuleType(f'teleparser_decoder_layer_{layer}')
+    module.__file__ = path
+    exec(load_code(path, digest), module.__dict__)  # pylint: disable=W0122
+    return module
+
+
+class Projector(dict):
+    '''
+    Decoders of only the given dotted paths, one per constructor id, every
+    other field is skipped by its length. They are generated on first use
+    next to the functions of a decoder module, and record into profiler
+    when there is one.
+    '''
+
+    def __init__(self, module, dispatch: dict, paths, profiler=None,
+                 names=None):
+        super().__init__()
+        from generater.decoder import DecoderGenerator
+        self.paths = tuple(paths)
+        self.profiler = profiler
+        self.names = names or {}
+        self.namespace = dict(vars(module))
+        self.generator = DecoderGenerator(dispatch, self.namespace, 'P')
+        self.lock = RLock()
+
+    def __missing__(self, cid):
+        with self.lock:
+            if (func := self.get(cid)) is not None:
+                return func
+            if cid not in self.generator.dispatch:
+                raise KeyError(cid)
+            name, source = self.generator.generate_projection(cid,
+                                                              self.paths)
+            code = compile(source, f'<projection 0x{cid:08x}>', 'exec')
+            exec(code, self.namespace)  # pylint: disable=W0122
+            func = self.namespace[name]
+            if self.profiler is not None:
+                func = self.profiler.wrap_decoder(cid, self.names.get(cid),
+                                                  func)
+            self[cid] = func
+            return func
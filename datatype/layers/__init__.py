@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""
+Registry of the schema layers besides the one of TLStruct, generated by
+generater.schema, do not edit! LAYERS maps a layer to the newest database
+user_version written by its clients, the package layer_<layer> holds only
+the schema functions of the layer differing from TLStruct. The TLRPC sources
+of repo/files do not record that user_version, see generater.parser
+generate_layers, so a layer is only registered once it is known.
+"""
+
+LAYERS = {
+}
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:14:36 2026
+
+@author: C. David
+"""
+import csv
+import json
+from time import perf_counter
+from construct import Subconstruct
+
+
+FIELDS = ('cid', 'name', 'count', 'bytes', 'seconds', 'self_seconds',
+          'mean_us')
+
+
+class Profiled(Subconstruct):
+    '''A constructor Struct recording each parse into a ConstructorProfiler.'''
+
+    def __init__(self, subcon, profiler, stat):
+        super().__init__(subcon)
+        self.profiler = profiler
+        self.stat = stat
+
+    def _parse(self, stream, context, path):
+        offset = stream.tell()
+        start = self.profiler.enter()
+        try:
+            obj = self.subcon._parsereport(stream, context, path)
+        except BaseException:
+            self.profiler.stack.pop()
+            raise
+        self.profiler.leave(self.stat, start, stream.tell() - offset)
+        return obj
+
+
+class ConstructorProfiler:
+    '''
+    Number of objects, bytes and time spent decoding them per constructor
+    id. Times include the nested objects, self times exclude them. It wraps
+    the built Structs of the interpreted backend and the functions of the
+    compiled and decoder modules, every nested call included.
+    '''
+
+    def __init__(self):
+        self.stats = {}
+        self.stack = []
+        self.structs = {}
+
+    def get_stat(self, cid, name):
+        '''The [name, count, bytes, seconds, self seconds] of cid.'''
+        if (stat := self.stats.get(cid)) is None:
+            self.stats[cid] = stat = [name, 0, 0, 0.0, 0.0]
+        return stat
+
+    def enter(self):
+        self.stack.append(0.0)
+        return perf_counter()
+
+    def leave(self, stat, start, size):
+        elapsed = perf_counter() - start
+        stack = self.stack
+        children = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        stat[1] += 1
+        stat[2] += size
+        stat[3] += elapsed
+        stat[4] += elapsed - children
+
+    def wrap_struct(self, cid, name, struct):
+        '''The Struct of a constructor, recording its parses.'''
+        if (result := self.structs.get(id(struct))) is None:
+            result = Profiled(struct, self, self.get_stat(cid, name))
+            self.structs[id(struct)] = result
+        return result
+
+    def wrap_decoder(self, cid, name, func):
+        '''A decode(buf, offset) function of a decoder module, profiled.'''
+        stat = self.get_stat(cid, name)
+        enter, leave, stack = self.enter, self.leave, self.stack
+
+        def decode(buf, offset):
+            start = enter()
+            try:
+                result = func(buf, offset)
+            except BaseException:
+                stack.pop()
+                raise
+            leave(stat, start, result[1] - offset)
+            return result
+        return decode
+
+    def wrap_compiled(self, cid, name, func):
+        '''A parse(io, this) function of a compiled module, profiled.'''
+        stat = self.get_stat(cid, name)
+        enter, leave, stack = self.enter, self.leave, self.stack
+
+        def parse(io, this):
+            offset = io.tell()
+            start = enter()
+            try:
+                result = func(io, this)
+            except BaseException:
+                stack.pop()
+                raise
+            leave(stat, start, io.tell() - offset)
+            return result
+        return parse
+
+    def instrument(self, namespace: dict, prefix, wrap, names):
+        '''
+        Replace the functions named prefix + constructor id of a module
+        namespace by their wrap(cid, name, func) version, in the namespace
+        and in all its tables holding them, so nested calls are recorded.
+        '''
+        wrapped = {}
+        for key, func in list(namespace.items()):
+            if (key.startswith(prefix) and len(key) == len(prefix) + 8 and
+                    callable(func)):
+                cid = int(key[len(prefix):], 16)
+                name = names.get(cid, f'0x{cid:08x}')
+                wrapped[func] = namespace[key] = wrap(cid, name, func)
+        for table in list(namespace.values()):
+            if isinstance(table, dict):
+                for key, func in table.items():
+                    if callable(func) and func in wrapped:
+                        table[key] = wrapped[func]
+
+    def report(self):
+        '''Rows of the statistics, by descending self time.'''
+        rows = []
+        for cid, (name, count, size, seconds, own) in self.stats.items():
+            if not count:
+                continue
+            rows.append({'cid': f'0x{cid:08x}', 'name': name,
+                         'count': count, 'bytes': size,
+                         'seconds': round(seconds, 6),
+                         'self_seconds': round(own, 6),
+                         'mean_us': round(seconds / count * 1e6, 3)})
+        rows.sort(key=lambda x: (-x['self_seconds'], x['cid']))
+        return rows
+
+    def save(self, path):
+        '''Write the report as CSV for a .csv path, else as JSON.'''
+        rows = self.report()
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            if path.lower().endswith('.csv'):
+                writer = csv.DictWriter(f, FIELDS)
+                writer.writeheader()
+                writer.writerows(rows)
+            else:
+                json.dump(rows, f, ensure_ascii=False, indent=2)
+        return rows
@@ -0,0 +1,5438 @@
+# -*- coding: utf-8 -*-
+"""
+Index of the TLStruct schema groups, generated by generater.schema, do not
+edit! INFO maps a constructor id to its name, GROUPS maps a schema function
+name to the module of this package defining it.
+"""
+# pylint: disable=too-many-lines
+
+INFO = {
+    0x0194cb3b: 'account_input_business_greeting_message',
+    0x032da4cf: 'account_verify_email',
+    0x06dd654c: 'account_get_reactions_notify_settings',
+    0x07967d36: 'account_get_wall_papers',
+    0x08fc711d: 'account_get_account_ttl',
+    0x09c469cd: 'account_input_business_intro',
+    0x0f578105: 'account_get_recent_emoji_statuses',
+    0x114ff30d: 'account_contact_birthdays',
+    0x11679fa7: 'account_input_business_chat_link',
+    0x12b3ad31: 'account_get_notify_settings',
+    0x1527bcac: 'secure_secret_settings',
+    0x17d7f87b: 'account_connected_bots',
+    0x18201aae: 'account_clear_recent_emoji_statuses',
+    0x182e6d6f: 'account_get_web_authorizations',
+    0x187fa0ca: 'secure_value',
+    0x1b3faa88: 'account_send_confirm_phone_code',
+    0x1c3db333: 'account_upload_theme',
+    0x1d998733: 'account_contact_birthday',
+    0x1e109708: 'account_paid_messages_revenue',
+    0x1edaaac2: 'account_set_global_privacy_settings',
+    0x2442485e: 'account_set_account_ttl',
+    0x2714d86c: 'account_check_username',
+    0x2d01b9ef: 'account_reset_web_authorization',
+    0x316ce548: 'account_set_reactions_notify_settings',
+    0x33f0ea47: 'secure_credentials_encrypted',
+    0x35a9e0d5: 'account_get_channel_restricted_status_emojis',
+    0x38df3532: 'account_update_device_locked',
+    0x3dea5b03: 'account_save_ringtone',
+    0x3e0bdd7c: 'account_update_username',
+    0x40f48462: 'account_change_authorization_settings',
+    0x418d4e0b: 'account_delete_account',
+    0x43d8521d: 'account_update_connected_bot',
+    0x449e0b51: 'account_get_tmp_password',
+    0x4b00e066: 'account_update_business_work_hours',
+    0x4bff8ea0: 'account_authorizations',
+    0x4c9409f6: 'account_decline_password_reset',
+    0x4dd3a7f6: 'account_verify_phone',
+    0x4ea4c80f: 'account_get_connected_bots',
+    0x50a04e45: 'account_privacy_rules',
+    0x53577479: 'account_get_notify_exceptions',
+    0x548a30f5: 'account_get_password',
+    0x5492e5ee: 'account_resolve_business_chat_link',
+    0x56da0b3f: 'account_get_auto_download_settings',
+    0x56e34970: 'account_reactions_notify_settings',
+    0x570d6f6f: 'account_get_web_page_preview',
+    0x57e28221: 'account_content_settings',
+    0x58d6b376: 'account_toggle_username',
+    0x5cb367d5: 'account_update_theme',
+    0x5e437ed9: 'account_disable_peer_connected_bot',
+    0x5f2178c3: 'account_confirm_phone',
+    0x60073674: 'account_delete_business_chat_link',
+    0x63cacf26: 'account_auto_download_settings',
+    0x646e1097: 'account_toggle_connected_bot_paused',
+    0x65ad71dc: 'account_get_multi_wall_papers',
+    0x6628562c: 'account_update_status',
+    0x66cdafc4: 'account_update_business_greeting_message',
+    0x682d2594: 'account_reset_web_authorizations',
+    0x6a0d3206: 'account_unregister_device',
+    0x6c5a5b37: 'account_save_wall_paper',
+    0x6c8e1e06: 'account_birthday',
+    0x6f688aa7: 'account_add_no_paid_messages_exception',
+    0x6f70dde1: 'account_get_business_chat_links',
+    0x6f8b32aa: 'account_input_business_recipients',
+    0x70c32edb: 'account_change_phone',
+    0x7206e458: 'account_get_themes',
+    0x73665bc2: 'account_get_secure_value',
+    0x76f36233: 'account_save_auto_download_settings',
+    0x7727a7d5: 'account_get_channel_default_emoji_statuses',
+    0x78515775: 'account_update_profile',
+    0x7a7f2a15: 'account_resend_password_email',
+    0x7ae43737: 'account_install_theme',
+    0x7cefa15d: 'account_update_color',
+    0x811f854f: 'account_sent_email_code',
+    0x82574ae5: 'account_send_change_phone_code',
+    0x831a83a2: 'account_upload_ringtone',
+    0x832175e0: 'account_input_business_away_message',
+    0x8432c21f: 'account_create_theme',
+    0x84be5b93: 'account_update_notify_settings',
+    0x8851e68e: 'account_create_business_chat_link',
+    0x899fe31d: 'account_save_secure_value',
+    0x8aeabec3: 'secure_data',
+    0x8b9b4dae: 'account_get_content_settings',
+    0x8c3410af: 'account_edit_business_chat_link',
+    0x8d9d742b: 'account_get_theme',
+    0x8fde504f: 'input_theme_settings',
+    0x8fdf1920: 'account_confirm_password_email',
+    0x915860ae: 'account_get_default_group_photo_emojis',
+    0x9308ce1b: 'account_reset_password',
+    0x98e037bb: 'account_send_verify_email_code',
+    0x9a23af21: 'account_resolved_business_chat_links',
+    0x9a5c33e5: 'account_password_settings',
+    0x9c2d527d: 'account_update_connected_bot',
+    0x9cd4eaf9: 'account_get_password_settings',
+    0x9e6b131a: 'account_update_business_location',
+    0x9f07c728: 'account_get_contact_sign_up_notification',
+    0xa26a7fa5: 'account_update_business_away_message',
+    0xa59b102f: 'account_update_password_settings',
+    0xa5a356f9: 'account_send_verify_phone_code',
+    0xa60ab9ce: 'account_get_default_background_emojis',
+    0xa614d034: 'account_update_business_intro',
+    0xa6f8f452: 'web_authorization',
+    0xa929597a: 'account_get_authorization_form',
+    0xad01d61d: 'authorization',
+    0xad253d78: 'code_settings',
+    0xad2e1cd8: 'account_authorization_form',
+    0xb288bc7d: 'account_get_all_secure_values',
+    0xb4ae666f: 'account_business_chat_link',
+    0xb53e8b21: 'account_web_page_preview',
+    0xb574b16b: 'account_set_content_settings',
+    0xb880bc4b: 'account_delete_secure_value',
+    0xb88cf373: 'account_business_bot_recipients',
+    0xb8d0afdf: 'account_days_ttl',
+    0xb9d9a38d: 'account_toggle_sponsored_messages',
+    0xbaa57628: 'auto_download_settings',
+    0xbb3b9804: 'account_reset_wall_papers',
+    0xbd068601: 'account_connected_bot',
+    0xbf899aa0: 'account_set_authorization_ttl',
+    0xc1cbd5b6: 'account_cancel_password_email',
+    0xc4e5921e: 'account_input_business_bot_recipients',
+    0xc5ba3d86: 'account_report_peer',
+    0xc9d8df1c: 'global_privacy_settings',
+    0xc9f81ce8: 'account_set_privacy',
+    0xcacb6ae2: 'input_peer_notify_settings',
+    0xcc6e0c11: 'account_update_birthday',
+    0xcff43f61: 'account_set_contact_sign_up_notification',
+    0xd638de89: 'account_get_chat_themes',
+    0xd6753386: 'account_get_default_emoji_statuses',
+    0xd89a83a3: 'account_get_requirements_to_contact',
+    0xd94305e0: 'account_update_personal_channel',
+    0xdadbc950: 'account_get_privacy',
+    0xdaeda864: 'account_get_birthdays',
+    0xdb21d0a7: 'input_secure_value',
+    0xdb64fd34: 'account_tmp_password',
+    0xdb7e1747: 'account_reset_notify_settings',
+    0xdd853661: 'account_upload_wall_paper',
+    0xdf77f3bc: 'account_reset_authorization',
+    0xe1902288: 'account_get_saved_ringtones',
+    0xe2750328: 'account_get_default_profile_photo_emojis',
+    0xe320c158: 'account_get_authorizations',
+    0xeb2b4cf6: 'account_get_global_privacy_settings',
+    0xec43a2d1: 'account_business_chat_links',
+    0xec86017a: 'account_register_device',
+    0xed1ecdb0: 'secure_value_hash',
+    0xed56c9fc: 'account_web_authorizations',
+    0xef500eab: 'account_reorder_usernames',
+    0xf1266f38: 'account_get_paid_messages_revenue',
+    0xf257106c: 'account_save_theme',
+    0xf3ed4c73: 'account_accept_authorization',
+    0xfa8cc6f5: 'account_report_profile_photo',
+    0xfbd3de6b: 'account_update_emoji_status',
+    0xfc8ddbea: 'account_get_wall_paper',
+    0xfeed5769: 'account_install_wall_paper',
+    0xc9b9e2b9: 'account_business_away_message_schedule_always',
+    0xc3f2f501: 'account_business_away_message_schedule_outside_work_hours',
+    0xcc4d9ecc: 'account_business_away_message_schedule_custom',
+    0x2b96cd1b: 'account_email_verified',
+    0xe1bb0d61: 'account_email_verified_login',
+    0xd08ce645: 'account_emoji_statuses_not_modified',
+    0x90c467d1: 'account_emoji_statuses',
+    0x957b50fb: 'account_password',
+    0x185b184f: 'account_password_layer144',
+    0xbac3a61a: 'account_reaction_notifications_from_contacts',
+    0x4b9e22a0: 'account_reaction_notifications_from_all',
+    0x050a9839: 'account_requirement_to_contact_empty',
+    0xe581e4e9: 'account_requirement_to_contact_premium',
+    0xb4f67e93: 'account_requirement_to_contact_paid_messages',
+    0xe3779861: 'account_reset_password_failed_wait',
+    0xe9effc7d: 'account_reset_password_requested_wait',
+    0xe926d63e: 'account_reset_password_ok',
+    0x1f307eb7: 'account_saved_ringtone_converted',
+    0xb7263f6d: 'account_saved_ringtone',
+    0xfbf6e8b1: 'account_saved_ringtones_not_modified',
+    0xc1e92cc5: 'account_saved_ringtones',
+    0x9a3d8c6d: 'account_themes',
+    0xf41eb622: 'account_themes_not_modified',
+    0x1c199183: 'account_wall_papers_not_modified',
+    0xcdc3858c: 'account_wall_papers',
+    0x3c1b4f0d: 'app_web_view_result_url',
+    0x93bf667f: 'attach_menu_bots_bot',
+    0xd90d8dfe: 'attach_menu_bot',
+    0xc8aa2cd2: 'attach_menu_bot_layer162',
+    0xe93cb772: 'attach_menu_bot_layer140',
+    0x4576f3f0: 'attach_menu_bot_icon_color',
+    0xb2a7386b: 'attach_menu_bot_icon',
+    0xf1d88a5c: 'attach_menu_bots_not_modified',
+    0x3c4301c0: 'attach_menu_bots',
+    0xc32bfa1a: 'attach_menu_peer_type_bot_pm',
+    0xf146d31f: 'attach_menu_peer_type_pm',
+    0x7bfbdefc: 'attach_menu_peer_type_broadcast',
+    0x0509113f: 'attach_menu_peer_type_chat',
+    0x7d6be90e: 'attach_menu_peer_type_same_bot_pm',
+    0x586988d8: 'audio_empty_layer45',
+    0xf9e35055: 'audio_layer45',
+    0x427425e7: 'audio_old',
+    0x555555f6: 'audio_encrypted',
+    0xc7ac6496: 'audio_old2',
+    0x0d36bf79: 'auth_check_recovery_password',
+    0x137948a5: 'auth_password_recovery',
+    0x1f040578: 'auth_cancel_code',
+    0x37096c70: 'auth_recover_password',
+    0x3e72ba19: 'auth_log_out',
+    0x3ef1a9bf: 'auth_resend_code',
+    0x7e960193: 'auth_reset_login_email',
+    0x80eee427: 'auth_sign_up',
+    0x89464b50: 'auth_request_firebase_sms',
+    0x8d52a951: 'auth_sign_in',
+    0x8e39261e: 'auth_request_firebase_sms',
+    0x95ac5ce4: 'auth_import_login_token',
+    0x9fab0d1a: 'auth_reset_authorizations',
+    0xa57a7dad: 'auth_import_authorization',
+    0xa677244f: 'auth_send_code',
+    0xb434e2b8: 'auth_exported_authorization',
+    0xb7e085fe: 'auth_export_login_token',
+    0xbcd51581: 'auth_sign_in_old',
+    0xc23727c9: 'account_password_input_settings',
+    0xc3a2835f: 'auth_logged_out',
+    0xcae47523: 'auth_resend_code',
+    0xcb9deff6: 'auth_report_missing_code',
+    0xd18b4d16: 'auth_check_password',
+    0xd897bc66: 'auth_request_password_recovery',
+    0xe5bfffcd: 'auth_export_authorization',
+    0xe894ad4d: 'auth_accept_login_token',
+    0x44747e9a: 'auth_authorization_sign_up_required',
+    0x33fb7bb8: 'auth_authorization_old',
+    0x2ea2c0d4: 'auth_authorization',
+    0x72a3158c: 'auth_code_type_sms',
+    0x741cd3e3: 'auth_code_type_call',
+    0x226ccefb: 'auth_code_type_flash_call',
+    0xd61ad6ee: 'auth_code_type_missed_call',
+    0x06ed998c: 'auth_code_type_fragment_sms',
+    0x629f1980: 'auth_login_token',
+    0x068e9916: 'auth_login_token_migrate_to',
+    0x390d5c5e: 'auth_login_token_success',
+    0x2390fe44: 'auth_sent_code_success',
+    0x5e002502: 'auth_sent_code',
+    0x3dbb5986: 'auth_sent_code_type_app',
+    0x5353e5a7: 'auth_sent_code_type_call',
+    0xf450f59b: 'auth_sent_code_type_email_code',
+    0xa5491dea: 'auth_sent_code_type_set_up_email_required',
+    0xab03c6d9: 'auth_sent_code_type_flash_call',
+    0x82006484: 'auth_sent_code_type_missed_call',
+    0xc000bba2: 'auth_sent_code_type_sms',
+    0xd9565c39: 'auth_sent_code_type_fragment_sms',
+    0x009fd736: 'auth_sent_code_type_firebase_sms',
+    0xa416ac81: 'auth_sent_code_type_sms_word',
+    0xb37794af: 'auth_sent_code_type_sms_phrase',
+    0x5b11125a: 'base_theme_arctic',
+    0xb7b31ea8: 'base_theme_night',
+    0xc3a12462: 'base_theme_classic',
+    0x6d5f77ee: 'base_theme_tinted',
+    0xfbd81688: 'base_theme_day',
+    0x997275b5: 'bool_true',
+    0xbc799737: 'bool_false',
+    0x5da674b7: 'bot_app_not_modified',
+    0x95fcd1d6: 'bot_app',
+    0xe4169b5d: 'bot_info_layer140',
+    0xbb2e37ce: 'bot_info_empty_layer48',
+    0x98e81d3a: 'bot_info_layer131',
+    0x09cf585d: 'bot_info_layer48',
+    0x1b74b335: 'bot_info_layer139',
+    0x8f300b57: 'bot_info_layer185',
+    0x82437e74: 'bot_info_layer192',
+    0x36607333: 'bot_info_layer195',
+    0x4d8a0299: 'bot_info',
+    0xb0cd6617: 'bot_verifier_settings',
+    0xc27ac8c7: 'bot_command',
+    0xc99b1950: 'bot_app_settings',
+    0x4366232e: 'bot_inline_message_media_venue_layer77',
+    0x8a86659c: 'bot_inline_message_media_venue',
+    0x3a8fd8b8: 'bot_inline_message_media_geo_layer71',
+    0x764cf810: 'bot_inline_message_media_auto',
+    0x0a74b15b: 'bot_inline_message_media_auto_layer74',
+    0x35edb4d4: 'bot_inline_message_media_contact_layer81',
+    0x18d1cdc2: 'bot_inline_message_media_contact',
+    0x8c7f65e2: 'bot_inline_message_text',
+    0xb722de65: 'bot_inline_message_media_geo_layer119',
+    0x051846fd: 'bot_inline_message_media_geo',
+    0x354a9b09: 'bot_inline_message_media_invoice',
+    0x809ad9a6: 'bot_inline_message_media_web_page',
+    0x11965f3a: 'bot_inline_result',
+    0x17db940b: 'bot_inline_media_result',
+    0xc7b57ce6: 'bot_menu_button',
+    0x7533a588: 'bot_menu_button_default',
+    0x4258c205: 'bot_menu_button_commands',
+    0x053ca973: 'bots_toggle_username',
+    0x06de6392: 'bots_toggle_user_emoji_status_permission',
+    0x087fc5e7: 'bots_invoke_web_view_custom_method',
+    0x0ca71d64: 'bots_preview_info',
+    0x10cf3123: 'bots_set_bot_info',
+    0x1359f4e6: 'bots_can_send_message',
+    0x17aeb75a: 'bots_add_preview_media',
+    0x1991b13b: 'bots_popular_app_bots',
+    0x23e91ba3: 'bot_preview_media',
+    0x2d0135b3: 'bots_delete_preview_media',
+    0x423ab3ad: 'bots_get_preview_info',
+    0x4504d54f: 'bots_set_bot_menu_button',
+    0x50077589: 'bots_check_download_file_params',
+    0x778b5ab3: 'bots_update_star_ref_program',
+    0x7d748d04: 'data_json',
+    0x8525606f: 'bots_edit_preview_media',
+    0x8b89dfbd: 'bots_set_custom_verification',
+    0x9709b1c2: 'bots_reorder_usernames',
+    0x9c60eb28: 'bots_get_bot_menu_button',
+    0xa1b70815: 'bots_get_bot_recommendations',
+    0xa2a5594d: 'bots_get_preview_medias',
+    0xb0711d83: 'bots_get_admined_bots',
+    0xb627f3aa: 'bots_reorder_preview_medias',
+    0xc2510192: 'bots_get_popular_app_bots',
+    0xdcd914fd: 'bots_get_bot_info',
+    0xf132e3ef: 'bots_allow_send_message',
+    0xc3ff71e7: 'broadcast_revenue_balances',
+    0x8438f1c6: 'broadcast_revenue_balances_layer186',
+    0x278f2868: 'channel_admin_log_event_action_send_message',
+    0xdb9f9140: 'channel_admin_log_event_action_discard_group_call',
+    0xb1c3caa7: 'channel_admin_log_event_action_change_sticker_set',
+    0x46d840ab: 'channel_admin_log_event_action_change_emoji_sticker_set',
+    0xf92424d2: 'channel_admin_log_event_action_participant_mute',
+    0x2df5fc0a: 'channel_admin_log_event_action_default_banned_rights',
+    0xfe69018d: 'channel_admin_log_event_action_change_theme',
+    0xf89777f2: 'channel_admin_log_event_action_participant_leave',
+    0x709b2405: 'channel_admin_log_event_action_edit_message',
+    0xe90ebb59: 'channel_admin_log_event_action_exported_invite_edit',
+    0x6a4afc38: 'channel_admin_log_event_action_change_username',
+    0x0e6b76ae: 'channel_admin_log_event_action_change_location',
+    0x434bd2af: 'channel_admin_log_event_action_change_photo',
+    0xd5676710: 'channel_admin_log_event_action_participant_toggle_admin',
+    0x53909779: 'channel_admin_log_event_action_toggle_slow_mode',
+    0xfe9fc158: 'channel_admin_log_event_action_participant_join_by_invite',
+    0x410a134e: 'channel_admin_log_event_action_exported_invite_revoke',
+    0x8f079643: 'channel_admin_log_event_action_stop_poll',
+    0x5a50fca4: 'channel_admin_log_event_action_exported_invite_delete',
+    0x26ae0971: 'channel_admin_log_event_action_toggle_signatures',
+    0x3e7f6847: 'channel_admin_log_event_action_participant_volume',
+    0x02cc6383: 'channel_admin_log_event_action_toggle_forum',
+    0xf06fe208: 'channel_admin_log_event_action_edit_topic',
+    0x5d8d353b: 'channel_admin_log_event_action_pin_topic',
+    0xe6d83d7e: 'channel_admin_log_event_action_participant_toggle_ban',
+    0x183040d3: 'channel_admin_log_event_action_participant_join',
+    0x5f5c95f1: 'channel_admin_log_event_action_toggle_pre_history_hidden',
+    0xafb6144a: 'channel_admin_log_event_action_participant_join_by_request',
+    0xe9e82c18: 'channel_admin_log_event_action_update_pinned',
+    0x56d6a247: 'channel_admin_log_event_action_toggle_group_call_setting',
+    0xe31c34d8: 'channel_admin_log_event_action_participant_invite',
+    0x55188a2e: 'channel_admin_log_event_action_change_about',
+    0x23209745: 'channel_admin_log_event_action_start_group_call',
+    0xbe4e0ef8: 'channel_admin_log_event_action_change_available_reactions',
+    0x050c7ac8: 'channel_admin_log_event_action_change_linked_chat',
+    0x1b7907ae: 'channel_admin_log_event_action_toggle_invites',
+    0xe64429c0: 'channel_admin_log_event_action_participant_unmute',
+    0x42e047bb: 'channel_admin_log_event_action_delete_message',
+    0xe6dfb825: 'channel_admin_log_event_action_change_title',
+    0x6e941a38: 'channel_admin_log_event_action_change_history_ttl',
+    0xcb2ac766: 'channel_admin_log_event_action_toggle_no_forwards',
+    0xf04fb3a9: 'channel_admin_log_event_action_change_usernames',
+    0x58707d28: 'channel_admin_log_event_action_create_topic',
+    0xae168909: 'channel_admin_log_event_action_delete_topic',
+    0x64f36dfc: 'channel_admin_log_event_action_toggle_anti_spam',
+    0x3c2b247b: 'channel_admin_log_event_action_change_color',
+    0x445fc434: 'channel_admin_log_event_action_change_background_emoji',
+    0x5796e780: 'channel_admin_log_event_action_change_peer_color',
+    0x5e477b25: 'channel_admin_log_event_action_change_profile_peer_color',
+    0x31bb5d52: 'channel_admin_log_event_action_change_wallpaper',
+    0x3ea9feb1: 'channel_admin_log_event_action_change_emoji_status',
+    0x60a79c79: 'channel_admin_log_event_action_toggle_signature_profiles',
+    0x64642db3: 'channel_admin_log_event_action_participant_sub_extend',
+    0x67753ac8: 'group_call_participant_video',
+    0xdcb118b7: 'group_call_participant_video_source_group',
+    0xeba636fe: 'group_call_participant',
+    0xbfb5ad8b: 'channel_location_empty',
+    0x209b82db: 'channel_location',
+    0x94d42ee7: 'channel_messages_filter_empty',
+    0xcd77d957: 'channel_messages_filter',
+    0x0ae30253: 'message_range',
+    0x222c1886: 'channel_participant_banned_layer92',
+    0x15ebac1d: 'channel_participant_layer131',
+    0x808d15a4: 'channel_participant_creator_layer118',
+    0x447dca4b: 'channel_participant_creator_layer131',
+    0xe3e2e1f9: 'channel_participant_creator_layer103',
+    0xa3289a6d: 'channel_participant_self_layer131',
+    0x6df8014e: 'channel_participant_banned',
+    0x34c3bb53: 'channel_participant_admin',
+    0xcb397619: 'channel_participant',
+    0xc00c07c0: 'channel_participant_layer185',
+    0x2fe601d3: 'channel_participant_creator',
+    0xccbebbaf: 'channel_participant_admin_layer131',
+    0xa82fa898: 'channel_participant_admin_layer92',
+    0x4f607bef: 'channel_participant_self',
+    0x35a8bfa7: 'channel_participant_self_layer185',
+    0x28a8bc67: 'channel_participant_self_layer133',
+    0x50a1dfd6: 'channel_participant_banned_layer131',
+    0x98192d61: 'channel_participant_editor_layer67',
+    0x1b03f006: 'channel_participant_left',
+    0x1c0facaf: 'channel_participant_banned_layer125',
+    0x5daa6e23: 'channel_participant_admin_layer103',
+    0xc3c6796b: 'channel_participant_left_layer125',
+    0x91057fef: 'channel_participant_moderator_layer67',
+    0x8cc5e69a: 'channel_participant_kicked_layer67',
+    0xe04b5ceb: 'channel_participants_mentions',
+    0xbb6ae88d: 'channel_participants_contacts',
+    0xb4608969: 'channel_participants_admins',
+    0xa3b54985: 'channel_participants_kicked',
+    0x0656ac4b: 'channel_participants_search',
+    0xb0d1865b: 'channel_participants_bots',
+    0x1427a5e1: 'channel_participants_banned',
+    0xde3f3c79: 'channel_participants_recent',
+    0x08736a09: 'channels_get_full_channel',
+    0x0a245dd3: 'channels_deactivate_all_usernames',
+    0x0a7f6bbb: 'channels_get_channels',
+    0x0b290c69: 'channels_convert_to_gigagroup',
+    0x0dc770ee: 'channels_get_send_as',
+    0x0de560d1: 'channels_get_forum_topics',
+    0x10e6bd2c: 'channels_check_username',
+    0x11e831ee: 'channels_get_inactive_channels',
+    0x18afbc93: 'channels_click_sponsored_message',
+    0x199f3a6c: 'channels_invite_to_channel',
+    0x1f69b606: 'channels_toggle_signatures',
+    0x1fad68cd: 'channel_admin_log_event',
+    0x24b524c5: 'channels_join_channel',
+    0x25a71742: 'channels_get_channel_recommendations',
+    0x2950a18f: 'channels_reorder_pinned_forum_topics',
+    0x33ddf480: 'channels_get_admin_log',
+    0x34435f2d: 'channels_delete_topic_history',
+    0x3514b3de: 'channels_update_username',
+    0x367544db: 'channels_delete_participant_history',
+    0x3cd930b7: 'channels_set_emoji_stickers',
+    0x40582bb2: 'channels_set_discussion_group',
+    0x418d549c: 'channels_toggle_signatures',
+    0x43a0a7e2: 'channels_search_posts',
+    0x4c2985b6: 'channels_toggle_join_request',
+    0x50f24105: 'channels_toggle_username',
+    0x566decd0: 'channels_edit_title',
+    0x58e63f6d: 'channels_edit_location',
+    0x68f3e4eb: 'channels_toggle_anti_spam',
+    0x6a6e7854: 'channels_toggle_participants_hidden',
+    0x6c2d9026: 'channels_update_pinned_forum_topic',
+    0x77ced9d0: 'channels_get_participants',
+    0x83b70d97: 'channels_get_channel_recommendations',
+    0x84c1fd4e: 'channels_delete_messages',
+    0x8f38cd1f: 'channels_edit_creator',
+    0x91006707: 'channels_create_channel',
+    0x93d7b347: 'channels_get_messages',
+    0x96e6cd81: 'channels_edit_banned',
+    0x9738bb15: 'channels_toggle_view_forum_as_messages',
+    0x9ae91519: 'channels_restrict_sponsored_messages',
+    0x9baa9647: 'channels_delete_history',
+    0xa0ab6cc6: 'channels_get_participant',
+    0xa4298b29: 'channels_toggle_forum',
+    0xa850a693: 'channels_report_anti_spam_false_positive',
+    0xad399cee: 'channels_set_boosts_to_unblock_restrictions',
+    0xb0831eb9: 'channels_get_forum_topics_by_id',
+    0xb45ced1d: 'channels_reorder_usernames',
+    0xb81c7034: 'send_as_peer',
+    0xbeaedb94: 'channels_view_sponsored_message',
+    0xc0111fe3: 'channels_delete_channel',
+    0xcc104937: 'channels_read_history',
+    0xd19f987b: 'channels_search_posts',
+    0xd33c8902: 'channels_edit_admin',
+    0xd8aa3671: 'channels_update_color',
+    0xdfb80317: 'channels_channel_participant',
+    0xe4cb9580: 'channels_toggle_join_to_send',
+    0xe63fadeb: 'channels_export_message_link',
+    0xea107ae4: 'channel_admin_log_events_filter',
+    0xea8ca4f9: 'channels_set_stickers',
+    0xeab5dc38: 'channels_read_message_contents',
+    0xeabbb94c: 'channels_toggle_pre_history_hidden',
+    0xec210fbf: 'channels_get_sponsored_messages',
+    0xed8af74d: 'channels_admin_log_results',
+    0xedd49ef0: 'channels_toggle_slow_mode',
+    0xf0d3e6a8: 'channels_update_emoji_status',
+    0xf12e57c9: 'channels_edit_photo',
+    0xf40c0224: 'channels_create_forum_topic',
+    0xf44a8315: 'channels_report_spam',
+    0xf496b0c6: 'channels_send_as_peers',
+    0xf4dfa185: 'channels_edit_forum_topic',
+    0xf5dad378: 'channels_get_groups_for_discussion',
+    0xf836aa95: 'channels_leave_channel',
+    0xf8b036af: 'channels_get_admined_public_channels',
+    0x9ab0feaf: 'channels_channel_participants',
+    0xf0173fe9: 'channels_channel_participants_not_modified',
+    0x846f9e42: 'channels_sponsored_message_report_result_choose_option',
+    0x3e3bcf2f: 'channels_sponsored_message_report_result_ads_hidden',
+    0xad798849: 'channels_sponsored_message_report_result_reported',
+    0x430d3150: 'sponsored_message_report_option',
+    0x2d85832c: 'channel_forbidden_layer52',
+    0x9ba2d800: 'chat_empty_layer131',
+    0x07328bdb: 'chat_forbidden_layer131',
+    0x4df30834: 'channel_layer104',
+    0x7482147e: 'channel',
+    0xe00998b7: 'channel_layer199',
+    0x46aeac06: 'channel_layer196_1',
+    0xfe4478bd: 'channel_layer195',
+    0x0aadfc8f: 'channel_layer185',
+    0x0db12acb: 'channel_layer167_3',
+    0xa636a3e2: 'channel_layer167_2',
+    0x8e87ccd8: 'channel_layer167',
+    0x1981ea7e: 'channel_layer166',
+    0x94f592db: 'channel_layer165',
+    0x450b7115: 'channel_layer77',
+    0x29562865: 'chat_empty',
+    0x41cbf256: 'chat',
+    0xd31a961e: 'channel_layer131',
+    0x4b1b7506: 'channel_layer48',
+    0x678e9587: 'channel_old',
+    0x0cb44b1c: 'channel_layer72',
+    0x8537784f: 'channel_forbidden_layer67',
+    0xd91cdd54: 'chat_layer92',
+    0xc88974ac: 'channel_layer92',
+    0x17d493d5: 'channel_forbidden',
+    0x3bda1bde: 'chat_layer131',
+    0x289da732: 'channel_forbidden_layer131',
+    0x7312bc48: 'chat_old2',
+    0xa14dca52: 'channel_layer67',
+    0x83259464: 'channel_layer161',
+    0x8261ac61: 'channel_layer147',
+    0xfb0ccc41: 'chat_forbidden_old',
+    0x6e9c9bc7: 'chat_old',
+    0x6592a1a7: 'chat_forbidden',
+    0x58cf4249: 'channel_banned_rights_layer92',
+    0x5d7ceba5: 'channel_admin_rights_layer92',
+    0x5fb224d5: 'chat_admin_rights',
+    0x9f120418: 'chat_banned_rights',
+    0xf041e250: 'chat_onlines',
+    0x2633421b: 'chat_full',
+    0x52d6806b: 'channel_full',
+    0x9ff3b858: 'channel_full_layer197',
+    0xbbab348d: 'channel_full_layer195',
+    0xc9d31138: 'chat_full_layer177',
+    0x44c054a7: 'channel_full_layer177',
+    0x680b773c: 'channel_full_layer176',
+    0x723027bd: 'channel_full_layer167',
+    0x0f2bcb6f: 'channel_full_layer173',
+    0xf2355507: 'channel_full_layer162',
+    0xd18ee226: 'chat_full_layer144',
+    0xea68a619: 'channel_full_layer144',
+    0xe13c3d20: 'channel_full_layer139',
+    0x56662e2e: 'channel_full_layer135',
+    0x59cff963: 'channel_full_layer134',
+    0x1c87a71a: 'channel_full_layer98',
+    0x03648977: 'channel_full_layer99',
+    0x2e02a614: 'chat_full_layer87',
+    0xef3a6acd: 'channel_full_layer122',
+    0xf0e6672a: 'channel_full_layer121',
+    0x2d895c74: 'channel_full_layer110',
+    0x10916653: 'channel_full_layer103',
+    0x9882e516: 'channel_full_layer101',
+    0x17f45fcf: 'channel_full_layer71',
+    0x76af5481: 'channel_full_layer72',
+    0x97bee562: 'channel_full_layer52',
+    0xc3d5512f: 'channel_full_layer67',
+    0x9e341ddf: 'channel_full_layer48',
+    0x0dc8c181: 'chat_full_layer122',
+    0xf3474af6: 'chat_full_layer123',
+    0x7a7de4f7: 'channel_full_layer123',
+    0xf06c4018: 'chat_full_layer124',
+    0x2548c037: 'channel_full_layer124',
+    0x8a1e2983: 'chat_full_layer131',
+    0x548c3f93: 'channel_full_layer131',
+    0x49a0a5d9: 'chat_full_layer132',
+    0x2f532f3c: 'channel_full_layer132',
+    0x4dbdc099: 'chat_full_layer133',
+    0xe9b27a17: 'channel_full_layer133',
+    0x1b7c9db3: 'chat_full_layer121',
+    0x22a235da: 'chat_full_layer98',
+    0xedd2a791: 'chat_full_layer92',
+    0x46a6ffb4: 'chat_full_layer135',
+    0xfab31aa3: 'channel_full_old',
+    0x95cb5f57: 'channel_full_layer70',
+    0xcbb62890: 'channel_full_layer89',
+    0x5c9d3702: 'chat_invite',
+    0xfe65389d: 'chat_invite_layer195',
+    0xcde0ec40: 'chat_invite_layer185',
+    0x300c44c1: 'chat_invite_layer165',
+    0x61695cb0: 'chat_invite_peek',
+    0x5a686d7c: 'chat_invite_already',
+    0xe2d6e436: 'chat_participant_admin_layer131',
+    0xa0933f5b: 'chat_participant_admin',
+    0xc8d7493e: 'chat_participant_layer131',
+    0xda13538a: 'chat_participant_creator_layer131',
+    0xc02d4007: 'chat_participant',
+    0xe46bcee4: 'chat_participant_creator',
+    0xfc900c2b: 'chat_participants_forbidden_layer131',
+    0x3f460fed: 'chat_participants_layer131',
+    0x8763d3e1: 'chat_participants_forbidden',
+    0x3cbc93f8: 'chat_participants',
+    0x7841b415: 'chat_participants_old',
+    0x0fd2bb8a: 'chat_participants_forbidden_old',
+    0x1c6e1c11: 'chat_photo',
+    0x475cdbd5: 'chat_photo_layer115',
+    0x37c1011c: 'chat_photo_empty',
+    0x6153276a: 'chat_photo_layer97',
+    0xd20b9f3c: 'chat_photo_layer126',
+    0x4790ee05: 'chat_photo_layer127',
+    0x661d4037: 'chat_reactions_some',
+    0xeafc32bc: 'chat_reactions_none',
+    0x52928bca: 'chat_reactions_all',
+    0xfa87f659: 'chatlists_chatlist_invite_already',
+    0x1dcd839d: 'chatlists_chatlist_invite',
+    0x0c5181ac: 'exported_chatlist_invite',
+    0x10ab6dc7: 'chatlists_exported_invites',
+    0x10e6e3a6: 'chatlists_exported_chatlist_invite',
+    0x41c10fff: 'chatlists_check_chatlist_invite',
+    0x653db63d: 'chatlists_edit_exported_invite',
+    0x66e486fb: 'chatlists_hide_chatlist_updates',
+    0x719c5c5e: 'chatlists_delete_exported_invite',
+    0x74fae13a: 'chatlists_leave_chatlist',
+    0x8472478e: 'chatlists_export_chatlist_invite',
+    0x89419521: 'chatlists_get_chatlist_updates',
+    0x93bd878d: 'chatlists_chatlist_updates',
+    0xa6b1e39a: 'chatlists_join_chatlist_invite',
+    0xce03da83: 'chatlists_get_exported_invites',
+    0xe089f8f5: 'chatlists_join_chatlist_updates',
+    0xf3e0da33: 'input_chatlist_dialog_filter',
+    0xfdbcd714: 'chatlists_get_leave_chatlist_suggestions',
+    0xcc1a241e: 'config',
+    0xe7e999e7: 'connected_bot',
+    0x16d9703b: 'contact_status',
+    0xfeedd3ad: 'contact_link_none',
+    0xd502c2d0: 'contact_link_contact',
+    0x5f4f9247: 'contact_link_unknown',
+    0x096a0e00: 'contacts_delete_contacts',
+    0x1013fd9e: 'contacts_delete_by_phones',
+    0x11f812d8: 'contacts_search',
+    0x13005788: 'contacts_import_contact_token',
+    0x1ae373ac: 'contacts_reset_top_peer_rating',
+    0x29a8962c: 'contacts_block_from_replies',
+    0x2c800be5: 'contacts_import_contacts',
+    0x2e2e8734: 'contacts_block',
+    0x4fe196fe: 'contacts_import_card',
+    0x5ce14175: 'popular_contact',
+    0x5dd69e12: 'contacts_get_contacts',
+    0x725afbbc: 'contacts_resolve_username',
+    0x77d01c3b: 'contacts_imported_contacts',
+    0x7f077ad9: 'contacts_resolved_peer',
+    0x84e53737: 'contacts_export_card',
+    0x8514bdda: 'contacts_toggle_top_peers',
+    0x879537f1: 'contacts_reset_saved',
+    0x8af94344: 'contacts_resolve_phone',
+    0x94c65c76: 'contacts_set_blocked',
+    0x973478b6: 'contacts_get_top_peers',
+    0x9a868f80: 'contacts_get_blocked',
+    0xb3134d9d: 'contacts_found',
+    0xb550d328: 'contacts_unblock',
+    0xc13e3c50: 'imported_contact',
+    0xc4a353ee: 'contacts_get_statuses',
+    0xd348bc44: 'contacts_get_located',
+    0xe8f463d0: 'contacts_add_contact',
+    0xf392b7f4: 'input_phone_contact',
+    0xf831a20f: 'contacts_accept_contact',
+    0xf8654027: 'contacts_export_contact_token',
+    0xf93ccba3: 'contacts_resolve_username',
+    0x0ade1591: 'contacts_blocked',
+    0xe1664194: 'contacts_blocked_slice',
+    0xe8fd8014: 'peer_blocked',
+    0xb74ba9d2: 'contacts_contacts_not_modified',
+    0xeae87e42: 'contacts_contacts',
+    0x145ade0b: 'contact',
+    0x70b772a8: 'contacts_top_peers',
+    0xb52c939d: 'contacts_top_peers_disabled',
+    0xde266ef5: 'contacts_top_peers_not_modified',
+    0xedcdc05b: 'top_peer',
+    0xfb834291: 'top_peer_category_peers',
+    0x1be31789: 'decrypted_message_layer',
+    0x204d3878: 'decrypted_message_layer17',
+    0x73164160: 'decrypted_message_service',
+    0xaa48327d: 'decrypted_message_service_layer8',
+    0x1f814f1f: 'decrypted_message_layer8',
+    0x91cc4674: 'decrypted_message',
+    0x36b091de: 'decrypted_message_layer45',
+    0xa1733aec: 'decrypted_message_action_set_message_ttl',
+    0xf3048883: 'decrypted_message_action_notify_layer',
+    0x65614304: 'decrypted_message_action_delete_messages',
+    0xec2e0b9b: 'decrypted_message_action_commit_key',
+    0xdd05ec6b: 'decrypted_message_action_abort_key',
+    0x6719e45c: 'decrypted_message_action_flush_history',
+    0xccb27641: 'decrypted_message_action_typing',
+    0x6fe1735b: 'decrypted_message_action_accept_key',
+    0x0c4f40be: 'decrypted_message_action_read_messages',
+    0x511110b0: 'decrypted_message_action_resend',
+    0xf3c9611b: 'decrypted_message_action_request_key',
+    0x8ac1f475: 'decrypted_message_action_screenshot_messages',
+    0xa82fdd63: 'decrypted_message_action_noop',
+    0x57e0a9cb: 'decrypted_message_media_audio',
+    0x35480a59: 'decrypted_message_media_geo_point',
+    0x588a0a97: 'decrypted_message_media_contact',
+    0x089f5c4a: 'decrypted_message_media_empty',
+    0x6abd9782: 'decrypted_message_media_document',
+    0x7afe8ae2: 'decrypted_message_media_document_layer101',
+    0xe50511d8: 'decrypted_message_media_web_page',
+    0xf1fa8d78: 'decrypted_message_media_photo',
+    0x970c8c0e: 'decrypted_message_media_video',
+    0xb095434b: 'decrypted_message_media_document_layer8',
+    0x4cee6ef3: 'decrypted_message_media_video_layer8',
+    0x8a0df56f: 'decrypted_message_media_venue',
+    0xfa95b0dd: 'decrypted_message_media_external_document',
+    0x524a415d: 'decrypted_message_media_video_layer17',
+    0x6080758f: 'decrypted_message_media_audio_layer8',
+    0x32798a8c: 'decrypted_message_media_photo_layer8',
+    0x43b46b20: 'default_history_ttl',
+    0xd1da940c: 'delete_fact_check',
+    0xd58a08c6: 'dialog',
+    0xa8edd0f5: 'dialog_layer149',
+    0x71bd134c: 'dialog_folder',
+    0x77744d4a: 'dialog_filter_suggested',
+    0xff544e65: 'folder',
+    0x363293ae: 'dialog_filter_default',
+    0xaa472651: 'dialog_filter',
+    0x5fb5523b: 'dialog_filter_layer195',
+    0x7438f7e8: 'dialog_filter_layer175',
+    0x96537bd7: 'dialog_filter_chatlist',
+    0x9fe28ea4: 'dialog_filter_chatlist_layer195',
+    0xd64a04a8: 'dialog_filter_chatlist_layer175',
+    0xe56dbf05: 'dialog_peer',
+    0x514519e2: 'dialog_peer_folder',
+    0x9ba29cc1: 'document_layer113',
+    0x59534e4c: 'document_layer92',
+    0x87232bc7: 'document_layer82',
+    0x55555556: 'document_encrypted_old',
+    0x8fd4c4d8: 'document',
+    0x1e87342b: 'document_layer142',
+    0x9efc6326: 'document_old',
+    0x36f8c871: 'document_empty',
+    0x55555558: 'document_encrypted',
+    0xf9a39f4f: 'document_layer53',
+    0x3a556302: 'document_attribute_sticker_layer55',
+    0x0ef02ce6: 'document_attribute_video_layer159',
+    0x051448e5: 'document_attribute_audio_old',
+    0x6319d612: 'document_attribute_sticker',
+    0x11b58939: 'document_attribute_animated',
+    0x15590068: 'document_attribute_filename',
+    0x43c57c48: 'document_attribute_video',
+    0x17399fad: 'document_attribute_video_layer187',
+    0xd38ff1c2: 'document_attribute_video_layer184',
+    0x5910cccb: 'document_attribute_video_layer65',
+    0xded218e0: 'document_attribute_audio_layer45',
+    0xfb0a5727: 'document_attribute_sticker_old',
+    0x9801d2f7: 'document_attribute_has_stickers',
+    0x994c9882: 'document_attribute_sticker_old2',
+    0x6c37c15c: 'document_attribute_image_size',
+    0x9852f9c6: 'document_attribute_audio',
+    0xfd149899: 'document_attribute_custom_emoji',
+    0xaed6dbb2: 'mask_coords',
+    0x1b0c841a: 'draft_message_empty',
+    0xba4baec5: 'draft_message_empty_layer81',
+    0xfd8e711f: 'draft_message_layer165',
+    0x3fccf7ef: 'draft_message_layer181',
+    0x2d65321f: 'draft_message',
+    0x0589ee75: 'edit_fact_check',
+    0x751f3146: 'text_with_entities',
+    0xba6705f0: 'edit_close_friends',
+    0x922e55a9: 'email_verification_code',
+    0xdb909ec2: 'email_verification_google',
+    0x96d074fd: 'email_verification_apple',
+    0x4345be73: 'email_verify_purpose_login_setup',
+    0x527d22eb: 'email_verify_purpose_login_change',
+    0xbbf51685: 'email_verify_purpose_passport',
+    0x5cc761bd: 'emoji_keywords_difference',
+    0xa575739d: 'emoji_url',
+    0xb3fb5361: 'emoji_language',
+    0x7a9abda9: 'emoji_group',
+    0x80d26cc7: 'emoji_group_greeting',
+    0x093bcf34: 'emoji_group_premium',
+    0x236df622: 'emoji_keyword_deleted',
+    0xd5b3b9f9: 'emoji_keyword',
+    0x7a1e11d1: 'emoji_list',
+    0x481eadfa: 'emoji_list_not_modified',
+    0x2de11aae: 'emoji_status_empty',
+    0xe7ff068a: 'emoji_status',
+    0x7184603b: 'emoji_status_collectible',
+    0x07141dbf: 'input_emoji_status_collectible',
+    0x929b619d: 'emoji_status_layer197',
+    0xfa30a8c7: 'emoji_status_until_layer197',
+    0xfda9a7b7: 'encrypted_chat_requested_old',
+    0xc878527e: 'encrypted_chat_requested_layer115',
+    0xfa56ce36: 'encrypted_chat_layer131',
+    0x62718a82: 'encrypted_chat_requested_layer131',
+    0x6601d14f: 'encrypted_chat_old',
+    0xab7ec0a0: 'encrypted_chat_empty',
+    0x3bf703dc: 'encrypted_chat_waiting_layer131',
+    0x13d6dd27: 'encrypted_chat_discarded_layer122',
+    0x1e1c7c45: 'encrypted_chat_discarded',
+    0x66b25953: 'encrypted_chat_waiting',
+    0x48f1d94c: 'encrypted_chat_requested',
+    0x61f0d4c7: 'encrypted_chat',
+    0xa8008cd8: 'encrypted_file',
+    0x4a70994c: 'encrypted_file_layer142',
+    0xc21f497e: 'encrypted_file_empty',
+    0x23734b06: 'encrypted_message_service',
+    0xed18c118: 'encrypted_message',
+    0xc4b9f9bb: 'error',
+    0x41bf109b: 'exported_contact_token',
+    0x5dab1af4: 'exported_message_link',
+    0xa22cbd96: 'chat_invite_exported',
+    0x0ab4a819: 'chat_invite_exported_layer185',
+    0xb18105e8: 'chat_invite_exported_layer133',
+    0x69df3769: 'chat_invite_empty_layer122',
+    0x6e24fc9d: 'chat_invite_exported_layer131',
+    0xfc2e05bc: 'chat_invite_exported_layer122',
+    0xed107ab7: 'chat_invite_public_join_requests',
+    0x7c596b46: 'file_location_unavailable',
+    0x53d69076: 'file_location_layer82',
+    0x091d11eb: 'file_location_layer97',
+    0xbc7fc6cd: 'file_location_to_be_deprecated',
+    0x55555554: 'file_encrypted_location',
+    0x1c295881: 'folders_delete_folder',
+    0x6847d0ab: 'folders_edit_peer_folders',
+    0xfbd2c296: 'input_folder_peer',
+    0x023f109b: 'forum_topic_deleted',
+    0x5920d6dc: 'forum_topic_layer147',
+    0x71701da9: 'forum_topic',
+    0x0296f104: 'geo_point_layer119',
+    0x2049d70c: 'geo_point_layer81',
+    0x1117dd5f: 'geo_point_empty',
+    0xb2a2f663: 'geo_point',
+    0xb9cdc5ee: 'get_fact_check',
+    0x734c4ccb: 'global_privacy_settings',
+    0x7780bcb4: 'group_call_discarded',
+    0xcdf8d3e3: 'group_call',
+    0xd597650c: 'group_call_layer195',
+    0x038a08d3: 'help_get_user_info',
+    0x0e0310d7: 'help_recent_me_urls',
+    0x17c6b5f6: 'help_support',
+    0x18cb9f78: 'help_invite_text',
+    0x1d1b1245: 'input_app_event',
+    0x1e251c95: 'help_hide_promo_data',
+    0x1fb33026: 'help_get_nearest_dc',
+    0x2ca51fd1: 'help_get_terms_of_service_update',
+    0x3dc0f114: 'help_get_recent_me_urls',
+    0x3fedc75f: 'help_get_deep_link_info',
+    0x49b30240: 'help_get_timezones_list',
+    0x4d392343: 'help_get_invite_text',
+    0x522d5a7d: 'help_get_app_update',
+    0x61e3f854: 'help_get_app_config',
+    0x66b91b70: 'help_edit_user_info',
+    0x6f02f748: 'help_save_app_log',
+    0x735787a8: 'help_get_countries_list',
+    0x8c05f1c9: 'help_support_name',
+    0x9010ef6f: 'help_get_app_changelog',
+    0x9cdf08cd: 'help_get_support',
+    0xabcfa9fd: 'help_get_peer_profile_colors',
+    0xb81b93d4: 'help_get_premium_promo',
+    0xc0977421: 'help_get_promo_data',
+    0xc4f9186b: 'help_get_config',
+    0xc661ad08: 'help_get_passport_config',
+    0xd360e72c: 'help_get_support_name',
+    0xda80f42f: 'help_get_peer_colors',
+    0xec22cfcd: 'help_set_bot_updates_status',
+    0xee72f79a: 'help_accept_terms_of_service',
+    0xf50dbaa1: 'help_dismiss_suggestion',
+    0xdd18782e: 'help_app_config',
+    0x7cde641d: 'help_app_config_not_modified',
+    0xccbbce30: 'help_app_update',
+    0xc45a6536: 'help_no_app_update',
+    0x93cc1f32: 'help_countries_list_not_modified',
+    0x87d0759e: 'help_countries_list',
+    0x4203c5ef: 'help_country_code',
+    0xc3878e23: 'help_country',
+    0x66afa166: 'help_deep_link_info_empty',
+    0x6a4ee832: 'help_deep_link_info',
+    0xbfb9f457: 'help_passport_config_not_modified',
+    0xa098d6af: 'help_passport_config',
+    0x26219a58: 'help_peer_color_set',
+    0x767d61eb: 'help_peer_color_profile_set',
+    0x2ba1f5ce: 'help_peer_colors_not_modified',
+    0x00f8ed08: 'help_peer_colors',
+    0xadec6ebe: 'help_peer_color_option',
+    0x5334759c: 'help_premium_promo',
+    0x8a4f3c29: 'help_premium_promo_layer144',
+    0xe0360f1b: 'help_premium_promo_layer140',
+    0x8c39793f: 'help_promo_data',
+    0x98f6ac75: 'help_promo_data_empty',
+    0x28ecf961: 'help_terms_of_service_update',
+    0xe3309f7f: 'help_terms_of_service_update_empty',
+    0x780a0310: 'help_terms_of_service',
+    0x970708cc: 'help_timezones_list_not_modified',
+    0x7b74ed71: 'help_timezones_list',
+    0xff9289f5: 'timezone',
+    0xf3ae2eed: 'help_user_info_empty',
+    0x01eb3758: 'help_user_info',
+    0x6334ee9a: 'inline_query_peer_type_broadcast',
+    0xd766c50a: 'inline_query_peer_type_chat',
+    0x833c0fac: 'inline_query_peer_type_pm',
+    0x0e3b2d0c: 'inline_query_peer_type_bot_pm',
+    0x5ec4be43: 'inline_query_peer_type_megagroup',
+    0x3081ed9d: 'inline_query_peer_type_same_bot_pm',
+    0x0a8eb2be: 'input_report_reason_illegal_drugs',
+    0x1f9338fe: 'input_media_invoice',
+    0x405fef0d: 'input_media_invoice',
+    0x89fdd778: 'input_media_story',
+    0x9bed434d: 'input_web_document',
+    0x9ec7863d: 'input_report_reason_personal_details',
+    0xa920bd7a: 'input_bot_app_id',
+    0x908c0407: 'input_bot_app_short_name',
+    0x2a286531: 'input_channel_from_message_layer131',
+    0xafeb712e: 'input_channel_layer131',
+    0xf35aec28: 'input_channel',
+    0xee8c1e86: 'input_channel_empty',
+    0x5b934f9d: 'input_channel_from_message',
+    0x8953ad37: 'input_chat_photo',
+    0x1ca48f57: 'input_chat_photo_empty',
+    0xbdcdaec0: 'input_chat_uploaded_photo',
+    0x9880f658: 'input_check_password_empty',
+    0xd27ff082: 'input_check_password_srp',
+    0xfcaafeb7: 'input_dialog_peer',
+    0x64600527: 'input_dialog_peer_folder',
+    0x72f0eaae: 'input_document_empty',
+    0x1abfb575: 'input_document',
+    0x5a17b5e5: 'input_encrypted_file',
+    0x2dc173c8: 'input_encrypted_file_big_uploaded',
+    0x1837c364: 'input_encrypted_file_empty',
+    0x64bd0306: 'input_encrypted_file_uploaded',
+    0xfa4f0bb5: 'input_file_big',
+    0xf52ff27f: 'input_file',
+    0x62dc8b48: 'input_file_story_document',
+    0x40181ffe: 'input_photo_file_location',
+    0xbad07584: 'input_document_file_location',
+    0x37257e99: 'input_peer_photo_file_location',
+    0xf5235d55: 'input_encrypted_file_location',
+    0x9d84f3db: 'input_sticker_set_thumb',
+    0x0598a92a: 'input_group_call_stream',
+    0xdfdaabe1: 'input_file_location',
+    0xcbc7ee28: 'input_secure_file_location',
+    0xc331e80a: 'input_game_short_name',
+    0x032c3e77: 'input_game_id',
+    0x48222faf: 'input_geo_point',
+    0xe4c123d6: 'input_geo_point_empty',
+    0x98986c0d: 'input_invoice_premium_gift_code',
+    0xc5b56859: 'input_invoice_message',
+    0xc326caef: 'input_invoice_slug',
+    0x65f00ce3: 'input_invoice_stars',
+    0x34e793f1: 'input_invoice_chat_invite_subscription',
+    0xe8625e92: 'input_invoice_star_gift',
+    0x4d818d5d: 'input_invoice_star_gift_upgrade',
+    0x4a5f5bd9: 'input_invoice_star_gift_transfer',
+    0xdabab2ef: 'input_invoice_premium_gift_stars',
+    0x257e962b: 'premium_gift_code_option',
+    0xf8ab7dfb: 'input_media_contact',
+    0xa8763ab5: 'input_media_document',
+    0xd33f43f3: 'input_media_game',
+    0xe66fbf7b: 'input_media_dice',
+    0xf9c44144: 'input_media_geo_point',
+    0x779600f9: 'input_media_document_external',
+    0x9664f57f: 'input_media_empty',
+    0x0f94e5f1: 'input_media_poll',
+    0x1e287d04: 'input_media_uploaded_photo',
+    0xc13d1c11: 'input_media_venue',
+    0x971fa843: 'input_media_geo_live',
+    0x037c9330: 'input_media_uploaded_document',
+    0xe5bbfe1a: 'input_media_photo_external',
+    0xb3ba0635: 'input_media_photo',
+    0xc21b8849: 'input_media_web_page',
+    0xaa661fc3: 'input_media_paid_media_layer186',
+    0xc4103386: 'input_media_paid_media',
+    0x4a95e84e: 'input_notify_chats',
+    0xb8bc5b0c: 'input_notify_peer',
+    0x193b4417: 'input_notify_users',
+    0xb1db7c7e: 'input_notify_broadcasts',
+    0x5c467992: 'input_notify_forum_topic',
+    0x3417d728: 'input_payment_credentials',
+    0x8ac32801: 'input_payment_credentials_google_pay',
+    0xc10eb2cf: 'input_payment_credentials_saved',
+    0x7da07ec9: 'input_peer_self',
+    0xa87b0a1c: 'input_peer_user_from_message',
+    0xdde8a54c: 'input_peer_user',
+    0x179be863: 'input_peer_chat_layer131',
+    0x27bcbbfc: 'input_peer_channel',
+    0x7b8e7de6: 'input_peer_user_layer131',
+    0x7f3b18ea: 'input_peer_empty',
+    0xbd2a0840: 'input_peer_channel_from_message',
+    0x35a95cb9: 'input_peer_chat',
+    0x20adaef8: 'input_peer_channel_layer131',
+    0x9c95f7bb: 'input_peer_channel_from_message_layer131',
+    0x17bae2e6: 'input_peer_user_from_message_layer131',
+    0x1cd7bf0d: 'input_photo_empty',
+    0x3bb3b94a: 'input_photo',
+    0x4f96cb18: 'input_privacy_key_status_timestamp',
+    0xbdfb0426: 'input_privacy_key_chat_invite',
+    0xfabadc5f: 'input_privacy_key_phone_call',
+    0xa4dd4c08: 'input_privacy_key_forwards',
+    0x5719bacc: 'input_privacy_key_profile_photo',
+    0x0352dafa: 'input_privacy_key_phone_number',
+    0xd1219bdd: 'input_privacy_key_added_by_phone',
+    0xaee69d68: 'input_privacy_key_voice_messages',
+    0xdb9e70d2: 'input_privacy_key_phonep2p',
+    0x3823cc40: 'input_privacy_key_about',
+    0xd65a11cc: 'input_privacy_key_birthday',
+    0xe1732341: 'input_privacy_key_star_gifts_auto_save',
+    0xbdc597b4: 'input_privacy_key_no_paid_messages',
+    0xd66b66c9: 'input_privacy_value_disallow_all',
+    0x90110467: 'input_privacy_value_disallow_users',
+    0x0d09e07b: 'input_privacy_value_allow_contacts',
+    0x840649cf: 'input_privacy_value_allow_chat_participants',
+    0x0ba52007: 'input_privacy_value_disallow_contacts',
+    0x184b35ce: 'input_privacy_value_allow_all',
+    0x131cc67f: 'input_privacy_value_allow_users',
+    0xe94f0f86: 'input_privacy_value_disallow_chat_participants',
+    0x2f453e49: 'input_privacy_value_allow_close_friends',
+    0x77cdc9f1: 'input_privacy_value_allow_premium',
+    0x5a4fcce5: 'input_privacy_value_allow_bots',
+    0xc4e57915: 'input_privacy_value_disallow_bots',
+    0x24596d41: 'input_quick_reply_shortcut',
+    0x01190cf1: 'input_quick_reply_shortcut_id',
+    0x22c0f6d5: 'input_reply_to_message',
+    0x073ec805: 'input_reply_to_message_layer166',
+    0x5881323a: 'input_reply_to_story',
+    0x3334b0f0: 'input_secure_file_uploaded',
+    0x5367e5be: 'input_secure_file',
+    0xffb62b95: 'input_sticker_set_empty',
+    0x9de7a269: 'input_sticker_set_id',
+    0x861cc8a0: 'input_sticker_set_short_name',
+    0x028703c8: 'input_sticker_set_animated_emoji',
+    0xe67f520e: 'input_sticker_set_dice',
+    0xc88b3b02: 'input_sticker_set_premium_gifts',
+    0x29d0f5ee: 'input_sticker_set_emoji_default_statuses',
+    0x04c4d4ce: 'input_sticker_set_emoji_generic_animations',
+    0x44c1f8e9: 'input_sticker_set_emoji_default_topic_icons',
+    0x49748553: 'input_sticker_set_emoji_channel_default_statuses',
+    0x0438865b: 'input_stickered_media_document',
+    0x4a992157: 'input_stickered_media_photo',
+    0x616f7fe8: 'input_store_payment_gift_premium',
+    0xfb790393: 'input_store_payment_premium_gift_code',
+    0xa6751e66: 'input_store_payment_premium_subscription',
+    0x160544ca: 'input_store_payment_premium_giveaway',
+    0x1d741ef7: 'input_store_payment_stars_gift',
+    0xdddd0f56: 'input_store_payment_stars_topup',
+    0x751f08fa: 'input_store_payment_stars_giveaway',
+    0xf5890df1: 'input_theme_slug',
+    0x3c5693e9: 'input_theme',
+    0xf7c1b13f: 'input_user_self',
+    0xf21158c6: 'input_user',
+    0xb98886cf: 'input_user_empty',
+    0x1da448e2: 'input_user_from_message',
+    0xe630b979: 'input_wall_paper',
+    0x967a462e: 'input_wall_paper_no_file',
+    0x72091c80: 'input_wall_paper_slug',
+    0x9f2221c9: 'input_web_file_geo_point_location',
+    0xc239d686: 'input_web_file_location',
+    0x049ee584: 'invoice',
+    0x5db95a15: 'invoice_layer193',
+    0x3e85a91b: 'invoice_layer163',
+    0xcb296bf8: 'labeled_price',
+    0xc7345e6a: 'json_bool',
+    0x3f6d7b68: 'json_null',
+    0xb71e767a: 'json_string',
+    0xf7444763: 'json_array',
+    0x99c1d49d: 'json_object',
+    0x2be0dfa4: 'json_number',
+    0xc0de1bd9: 'json_object_value',
+    0xa0c0505c: 'keyboard_button_simple_web_view',
+    0xb16a6c29: 'keyboard_button_request_phone',
+    0x50f41ccf: 'keyboard_button_game',
+    0x258aff05: 'keyboard_button_url',
+    0x0568a748: 'keyboard_button_switch_inline_layer157',
+    0xfc796b3f: 'keyboard_button_request_geo_location',
+    0x10b78d29: 'keyboard_button_url_auth',
+    0xd02e7fd4: 'input_keyboard_button_url_auth',
+    0xbbc7515d: 'keyboard_button_request_poll',
+    0xafd93fbb: 'keyboard_button_buy',
+    0x683a5e46: 'keyboard_button_callback_layer117',
+    0x93b9fbb5: 'keyboard_button_switch_inline',
+    0xa2fa4880: 'keyboard_button',
+    0x35bbdb6b: 'keyboard_button_callback',
+    0xe988037b: 'input_keyboard_button_user_profile',
+    0x308660c1: 'keyboard_button_user_profile',
+    0x13767230: 'keyboard_button_web_view',
+    0x0d0b468c: 'keyboard_button_request_peer_layer168',
+    0x53d7bfd8: 'keyboard_button_request_peer',
+    0x75d2698e: 'keyboard_button_copy',
+    0xeeca5ce3: 'lang_pack_language',
+    0x6c47ac9f: 'lang_pack_string_pluralized',
+    0xcad181f6: 'lang_pack_string',
+    0x2979eeb2: 'lang_pack_string_deleted',
+    0x2e1ee318: 'langpack_get_strings',
+    0x6a596502: 'langpack_get_language',
+    0x800fd57d: 'langpack_get_languages',
+    0x9ab5c58e: 'langpack_get_lang_pack',
+    0xcd984aa5: 'langpack_get_difference',
+    0x1d86f70e: 'message_service_old2',
+    0xa7ab1991: 'message_old3',
+    0xc3060325: 'message_old4',
+    0x555555fa: 'message_secret',
+    0x555555f9: 'message_secret_layer72',
+    0x90dddc11: 'message_layer72',
+    0xc09be45f: 'message_layer68',
+    0xc992e15c: 'message_layer47',
+    0x5ba66c13: 'message_old7',
+    0xc06b9607: 'message_service_layer48',
+    0x83e5de54: 'message_empty_layer122',
+    0x2bebfa86: 'message_old6',
+    0x44f9b43d: 'message_layer104',
+    0x90a6ca84: 'message_empty',
+    0x1c9b1027: 'message_layer104_2',
+    0xa367e716: 'message_forwarded_old2',
+    0x05f46804: 'message_forwarded_old',
+    0x567699b3: 'message_old2',
+    0x9f8d60bb: 'message_service_old',
+    0x22eb6aba: 'message_old',
+    0x555555f8: 'message_secret_old',
+    0x9789dac4: 'message_layer104_3',
+    0x452c0e65: 'message_layer117',
+    0xf52e6b7f: 'message_layer118',
+    0x58ae39c9: 'message_layer123',
+    0xbce383d2: 'message_layer131',
+    0x85d6cbe2: 'message_layer135',
+    0xeabcdd4d: 'message',
+    0x96fdbbe9: 'message_layer199',
+    0x94345242: 'message_layer195',
+    0xbde09c2e: 'message_layer180',
+    0xa4e97f37: 'message_layer179_1',
+    0x2357bf25: 'message_layer179',
+    0xa66c7efc: 'message_layer176',
+    0x1e4c8a69: 'message_layer175',
+    0x38116ee0: 'message_layer169',
+    0x76bec211: 'message_layer173',
+    0x9e19a1f6: 'message_service_layer118',
+    0x286fa604: 'message_service_layer123',
+    0x2b085862: 'message_service_layer195',
+    0xd3d28540: 'message_service',
+    0xf07814c8: 'message_old5',
+    0xb89bfccf: 'fact_check',
+    0x555555f5: 'message_action_login_unknown_location',
+    0x555555f7: 'message_encrypted_action',
+    0xfae69f56: 'message_action_custom_action',
+    0xa6638b9a: 'message_action_chat_create_layer131',
+    0xbd47cbad: 'message_action_chat_create',
+    0x502f92f7: 'message_action_invite_to_group_call',
+    0x15cefd00: 'message_action_chat_add_user',
+    0xa43f30cc: 'message_action_chat_delete_user',
+    0x51bdb021: 'message_action_chat_migrate_to_layer131',
+    0xe1037f92: 'message_action_chat_migrate_to',
+    0xa80f51e4: 'message_action_giveaway_launch',
+    0x332ba9ed: 'message_action_giveaway_launch_layer186',
+    0x87e2f155: 'message_action_giveaway_results',
+    0x2a9fadc5: 'message_action_giveaway_results_layer186',
+    0xea3948e9: 'message_action_channel_migrate_from',
+    0x7a0d7f42: 'message_action_group_call',
+    0xaa786345: 'message_action_set_chat_theme',
+    0x4792929b: 'message_action_screenshot_taken',
+    0x01baa035: 'message_action_phone_number_request',
+    0xebbca3cb: 'message_action_chat_joined_by_request',
+    0x9fbab604: 'message_action_history_clear',
+    0x7fcb13a8: 'message_action_chat_edit_photo',
+    0x031224c3: 'message_action_chat_joined_by_link',
+    0xb055eaee: 'message_action_channel_migrate_from_layer131',
+    0x488a7337: 'message_action_chat_add_user_layer131',
+    0xb2ae9b0c: 'message_action_chat_delete_user_layer131',
+    0x55555557: 'message_action_created_broadcast_list',
+    0xbc44a927: 'message_action_set_chat_wall_paper_layer166',
+    0x5060a3f4: 'message_action_set_chat_wall_paper',
+    0x55555550: 'message_action_user_joined',
+    0x56d03994: 'message_action_gift_code',
+    0x678c2e09: 'message_action_gift_code_layer189',
+    0xd2cfdb0e: 'message_action_gift_code_layer167',
+    0xb18a431c: 'message_action_topic_edit_layer149',
+    0xc0944820: 'message_action_topic_edit',
+    0x55555551: 'message_action_user_updated_photo',
+    0x5e3cfc4b: 'message_action_chat_add_user_old',
+    0x55555552: 'message_action_ttl_change',
+    0x3c134d7b: 'message_action_set_messages_ttl',
+    0xaa1afbfd: 'message_action_set_messages_ttl_layer149',
+    0xd95c6154: 'message_action_secure_values_sent',
+    0x47dd8079: 'message_action_web_view_data_sent_me',
+    0xb4c38cb5: 'message_action_web_view_data_sent',
+    0xf89cf5e8: 'message_action_chat_joined_by_link_layer131',
+    0xf3f25f76: 'message_action_contact_sign_up',
+    0x95d2ac92: 'message_action_channel_create',
+    0x94bd38ed: 'message_action_pin_message',
+    0x98e0d697: 'message_action_geo_proximity_reached',
+    0x57de635e: 'message_action_suggest_profile_photo',
+    0xe7e75f97: 'message_action_attach_menu_bot_allowed',
+    0xc0787d6d: 'message_action_set_same_chat_wall_paper',
+    0x95e3fbef: 'message_action_chat_delete_photo',
+    0x76b9f11a: 'message_action_invite_to_group_call_layer131',
+    0x80e11a7f: 'message_action_phone_call',
+    0x0d999256: 'message_action_topic_create',
+    0xb5a1ce5a: 'message_action_chat_edit_title',
+    0xabe9affe: 'message_action_bot_allowed_layer153',
+    0xc516d679: 'message_action_bot_allowed',
+    0xc624b16e: 'message_action_payment_sent',
+    0x96163f56: 'message_action_payment_sent_layer193',
+    0x40699cd0: 'message_action_payment_sent_layer140',
+    0xb6aef7b0: 'message_action_empty',
+    0x92a72876: 'message_action_game_score',
+    0xb3a07661: 'message_action_group_call_scheduled',
+    0xcc02aa6d: 'message_action_boost_apply',
+    0xffa00ccc: 'message_action_payment_sent_me',
+    0x8f31b327: 'message_action_payment_sent_me_layer193',
+    0x6c6274fa: 'message_action_gift_premium',
+    0xc83d6aec: 'message_action_gift_premium_layer189',
+    0xfe77345d: 'message_action_requested_peer_layer168',
+    0x31518e9b: 'message_action_requested_peer',
+    0x41b3e202: 'message_action_payment_refunded',
+    0x45d5b021: 'message_action_gift_stars',
+    0xb00c47a2: 'message_action_prize_stars',
+    0x4717e8a4: 'message_action_star_gift',
+    0xd8f4f0a7: 'message_action_star_gift_layer197',
+    0x08557637: 'message_action_star_gift_layer195',
+    0x9bb3ef44: 'message_action_star_gift_layer192',
+    0x26077b99: 'message_action_star_gift_unique_layer197',
+    0xacdfcb81: 'message_action_star_gift_unique',
+    0x5cd2501f: 'message_action_paid_message',
+    0xea02c27e: 'payment_charge',
+    0x76a6d327: 'message_entity_text_url',
+    0x6cef8ac7: 'message_entity_bot_command',
+    0x64e475c2: 'message_entity_email',
+    0x73924be0: 'message_entity_pre',
+    0xbb92ba95: 'message_entity_unknown',
+    0x6ed02538: 'message_entity_url',
+    0x826f8b60: 'message_entity_italic',
+    0xfa04579d: 'message_entity_mention',
+    0x32ca960f: 'message_entity_spoiler',
+    0x352dca58: 'message_entity_mention_name_layer131',
+    0x208e68c9: 'input_message_entity_mention_name',
+    0x4c4e743f: 'message_entity_cashtag',
+    0xbd610bc9: 'message_entity_bold',
+    0x6f635b0d: 'message_entity_hashtag',
+    0x28a20571: 'message_entity_code',
+    0xbf0693d4: 'message_entity_strike',
+    0xf1ccaaac: 'message_entity_blockquote',
+    0x020df5d0: 'message_entity_blockquote_layer180',
+    0x9c4e7e8b: 'message_entity_underline',
+    0x761e6af4: 'message_entity_bank_card',
+    0x9b69e34b: 'message_entity_phone',
+    0xdc7b1140: 'message_entity_mention_name',
+    0xc8cf05f8: 'message_entity_custom_emoji',
+    0xad628cc8: 'message_extended_media_preview',
+    0xee479c64: 'message_extended_media',
+    0xc786ddcb: 'message_fwd_header_layer68',
+    0x353a686b: 'message_fwd_header_layer118',
+    0xec338270: 'message_fwd_header_layer112',
+    0xfadff4ac: 'message_fwd_header_layer72',
+    0x4e4df4bb: 'message_fwd_header',
+    0x5f777dce: 'message_fwd_header_layer169',
+    0x559ebe6d: 'message_fwd_header_layer96',
+    0x29632a36: 'message_media_unsupported_old',
+    0xc6b68300: 'message_media_audio_layer45',
+    0xc8c45a2a: 'message_media_photo_old',
+    0x84551347: 'message_media_invoice_layer145',
+    0xf6a548d3: 'message_media_invoice',
+    0x9f84f49e: 'message_media_unsupported',
+    0x3ded6320: 'message_media_empty',
+    0x68cb6283: 'message_media_story',
+    0xcbb20d88: 'message_media_story_layer162',
+    0xc79aee1d: 'message_media_story_full',
+    0xc79aee1f: 'message_media_story_full_old',
+    0x7912b71f: 'message_media_venue_layer71',
+    0xb940c666: 'message_media_geo_live',
+    0x7c3c2609: 'message_media_geo_live_layer119',
+    0x2ec0533f: 'message_media_venue',
+    0xa2d24290: 'message_media_video_old',
+    0x2fda2204: 'message_media_document_old',
+    0xf3e02ea8: 'message_media_document_layer68',
+    0xfdb19008: 'message_media_game',
+    0x7c4414d3: 'message_media_document_layer74',
+    0x5e7d2f39: 'message_media_contact_layer81',
+    0x695150d7: 'message_media_photo',
+    0x4bd6e798: 'message_media_poll',
+    0xceaa3ea1: 'message_media_giveaway_results',
+    0xc6991068: 'message_media_giveaway_results_layer186',
+    0xaa073beb: 'message_media_giveaway',
+    0xdaad85b0: 'message_media_giveaway_layer186',
+    0x58260664: 'message_media_giveaway_layer167',
+    0xa8852491: 'message_media_paid_media',
+    0xb5223b0f: 'message_media_photo_layer74',
+    0x3d8ce53d: 'message_media_photo_layer68',
+    0x5bcf1675: 'message_media_video_layer45',
+    0x3f7ee58b: 'message_media_dice',
+    0x638fe46b: 'message_media_dice_layer111',
+    0x56e0d474: 'message_media_geo',
+    0xa32dd600: 'message_media_web_page_layer165',
+    0xddf10c3b: 'message_media_web_page',
+    0x52d8ccd9: 'message_media_document',
+    0xdbbdf614: 'message_media_document_layer197_2',
+    0xdd570bd5: 'message_media_document_layer197',
+    0x4cf4d72d: 'message_media_document_layer187',
+    0x9cb070d7: 'message_media_document_layer159',
+    0xcbf24940: 'message_media_contact_layer131',
+    0x70322949: 'message_media_contact',
+    0xbdf9653b: 'game',
+    0x8c79b63c: 'message_peer_reaction',
+    0xb156fe9c: 'message_peer_reaction_layer154',
+    0x51b67eff: 'message_peer_reaction_layer144',
+    0x932844fa: 'message_peer_reaction_layer137',
+    0x4628f6e6: 'message_peer_vote_multiple',
+    0xb6cc2d5c: 'message_peer_vote',
+    0x74cda504: 'message_peer_vote_input_option',
+    0x087b6e36: 'message_reactions_old',
+    0x0a339f0b: 'message_reactions',
+    0x4f2b9479: 'message_reactions_layer185',
+    0xb87a24d1: 'message_reactions_layer137',
+    0x4ba3a95a: 'message_reactor',
+    0xef00d448: 'message_reactor_old',
+    0x4128faac: 'message_replies_layer131',
+    0x83d60fc2: 'message_replies',
+    0x0e5af939: 'message_reply_story_header',
+    0x9c98bfc1: 'message_reply_story_header_layer174',
+    0xafbc09db: 'message_reply_header',
+    0x6eebcabd: 'message_reply_header_layer166',
+    0x3d5c1693: 'message_reply_header_layer165_2',
+    0xa6d57763: 'message_reply_header_layer165',
+    0x0034a818: 'messages_create_chat',
+    0x04f1aaa9: 'messages_get_faved_stickers',
+    0x05a954c0: 'messages_received_messages',
+    0x0c964709: 'messages_send_multi_media',
+    0x0e306d3a: 'messages_read_history',
+    0x0ecf6736: 'messages_get_featured_emoji_stickers',
+    0x0f093465: 'messages_click_sponsored_message',
+    0x0f635e1b: 'messages_get_inline_game_high_scores',
+    0x10ea6184: 'messages_send_vote',
+    0x147ee23c: 'messages_search_results_calendar',
+    0x1508b6af: 'messages_get_emoji_keywords_difference',
+    0x15ad9f64: 'messages_set_inline_game_score',
+    0x1662af0b: 'messages_history_import',
+    0x16fcc2cb: 'messages_get_attach_menu_bots',
+    0x18dea0ac: 'messages_get_available_reactions',
+    0x198fb446: 'messages_request_url_auth',
+    0x1a46500a: 'messages_request_simple_web_view',
+    0x1ad4a04a: 'messages_update_dialog_filter',
+    0x1af3dbb8: 'messages_report_sponsored_message',
+    0x1bbcf300: 'messages_get_search_counters',
+    0x1bf89d74: 'messages_send_multi_media',
+    0x1cc6e91f: 'input_single_media',
+    0x1dd840f5: 'messages_get_emoji_sticker_groups',
+    0x21a548f3: 'messages_get_emoji_profile_photo_groups',
+    0x22b6c214: 'messages_get_web_view_result',
+    0x22ddd30c: 'messages_get_replies',
+    0x22e24e22: 'messages_get_dialog_unread_marks',
+    0x269dc2c1: 'messages_request_web_view',
+    0x269e9a49: 'messages_transcribe_audio',
+    0x26b5dde6: 'messages_message_edit_data',
+    0x26cf8950: 'messages_get_dh_config',
+    0x29b1c66a: 'messages_search_stickers',
+    0x29ee847a: 'messages_search',
+    0x2a862092: 'messages_upload_imported_media',
+    0x2ad93719: 'messages_dialog_filters',
+    0x2c11c0d7: 'messages_search_custom_emoji',
+    0x2ecd56cd: 'messages_get_emoji_status_groups',
+    0x31bd492d: 'messages_message_reactions_list',
+    0x31c1c44f: 'messages_get_message_read_participants',
+    0x3223495b: 'messages_get_unread_reactions',
+    0x327a30cb: 'messages_save_gif',
+    0x32d439a4: 'messages_send_encrypted_service',
+    0x33153ad4: 'messages_send_quick_reply_messages',
+    0x3371c354: 'messages_peer_dialogs',
+    0x338e2464: 'messages_get_document_by_hash',
+    0x33963bf9: 'messages_forward_message',
+    0x33db32f8: 'messages_translate_result',
+    0x34090c3b: 'messages_init_history_import',
+    0x34fdc5c3: 'messages_get_bot_app',
+    0x35705b8a: 'messages_search_sticker_sets',
+    0x35a0e062: 'messages_get_emoji_keywords',
+    0x35ddd674: 'messages_edit_chat_photo',
+    0x3637e05b: 'messages_get_saved_reaction_tags',
+    0x36585ea4: 'messages_bot_callback_answer',
+    0x367617d3: 'messages_forum_topics',
+    0x36a73f77: 'messages_read_message_contents',
+    0x36e5bf4d: 'messages_read_mentions',
+    0x37b74355: 'messages_send_multi_media_layer199',
+    0x3920e6ef: 'messages_get_admins_with_invites',
+    0x392718f8: 'messages_save_recent_sticker',
+    0x39461db2: 'messages_get_recent_reactions',
+    0x3b1adf37: 'messages_reorder_pinned_dialogs',
+    0x3cc04740: 'messages_delete_quick_reply_shortcut',
+    0x3d9a414d: 'messages_get_saved_history',
+    0x3db8ec63: 'sponsored_web_page',
+    0x3dbc0415: 'messages_accept_encryption',
+    0x3eadb1bb: 'messages_check_chat_invite',
+    0x3ebee86a: 'messages_send_inline_bot_result_layer199',
+    0x3f4e0648: 'messages_message_empty',
+    0x413a3e73: 'messages_request_simple_web_view',
+    0x4222fa74: 'messages_get_messages',
+    0x435885b5: 'messages_toggle_paid_reaction_privacy',
+    0x43fe19f3: 'messages_check_history_import',
+    0x4423e6c5: 'messages_get_history',
+    0x446972fd: 'messages_get_discussion_message',
+    0x44fa7a15: 'messages_send_encrypted',
+    0x455b853d: 'message_views',
+    0x461b3f48: 'messages_get_message_reactions_list',
+    0x472455aa: 'messages_get_paid_reaction_privacy',
+    0x4899484e: 'messages_votes_list',
+    0x49e9528f: 'messages_get_chats',
+    0x4b0c8c0f: 'messages_report_encrypted_spam',
+    0x4bc6589a: 'messages_search_global',
+    0x4e9963b2: 'messages_get_emoji_keywords_languages',
+    0x4f47a016: 'messages_set_default_reaction',
+    0x4facb138: 'messages_hide_peer_settings_bar',
+    0x4fcba9c8: 'messages_archived_stickers',
+    0x5057c497: 'messages_upload_encrypted_file',
+    0x514e999d: 'messages_get_inline_bot_results',
+    0x519bc2b1: 'messages_upload_media',
+    0x53618bce: 'messages_request_app_web_view',
+    0x5381d21a: 'messages_get_saved_dialogs',
+    0x53b22baf: 'messages_search_results_positions',
+    0x54aa7f8e: 'messages_read_reactions',
+    0x5559481d: 'messages_send_encrypted_file',
+    0x55a5bb66: 'messages_received_queue',
+    0x56987bd5: 'messages_delete_revoked_exported_chat_invites',
+    0x5784d3e1: 'messages_get_messages_views',
+    0x57f17692: 'messages_get_archived_stickers',
+    0x58943ee2: 'messages_set_typing',
+    0x58bbcb50: 'messages_send_paid_reaction',
+    0x59ae2b16: 'messages_delete_scheduled_messages',
+    0x5b118126: 'messages_read_featured_stickers',
+    0x5bd0ee50: 'messages_delete_chat',
+    0x5c003cef: 'messages_edit_quick_reply_shortcut',
+    0x5cf09635: 'messages_get_saved_gifs',
+    0x5dc60f03: 'messages_check_history_import_peer',
+    0x5e0fb7b9: 'messages_history_import_parsed',
+    0x60297dec: 'messages_update_saved_reaction_tag',
+    0x60331907: 'messages_reorder_quick_replies',
+    0x61422a48: 'messages_report_reaction',
+    0x628c9224: 'missing_invitee',
+    0x63183030: 'messages_translate_text',
+    0x640f82b8: 'messages_get_mask_stickers',
+    0x64780b14: 'messages_get_featured_stickers',
+    0x658b7188: 'messages_get_default_history_ttl',
+    0x65a4c7d5: 'messages_sponsored_messages_layer147',
+    0x673ad8f1: 'messages_view_sponsored_message',
+    0x6880b94d: 'messages_peer_settings',
+    0x69f59d69: 'messages_toggle_bot_in_attach_menu',
+    0x6a3f8d65: 'messages_get_all_drafts',
+    0x6aa3f6bd: 'messages_get_search_results_calendar',
+    0x6c50051c: 'messages_import_chat_invite',
+    0x6c750de1: 'messages_send_quick_reply_messages',
+    0x6d74da08: 'messages_forward_messages_layer199',
+    0x6e2be050: 'messages_get_onlines',
+    0x6e98102b: 'messages_delete_saved_history',
+    0x702a40e0: 'messages_get_recent_locations',
+    0x73746f5c: 'messages_get_exported_chat_invite',
+    0x73783ffd: 'messages_edit_chat_title',
+    0x73a379eb: 'high_score',
+    0x73bb643b: 'messages_get_poll_results',
+    0x7488ce5b: 'messages_get_emoji_groups',
+    0x77216192: 'messages_get_attach_menu_bot',
+    0x78337739: 'messages_reorder_sticker_sets',
+    0x7852834e: 'messages_send_media_layer199',
+    0x791451ed: 'messages_set_encrypted_typing',
+    0x7bd66041: 'messages_send_media',
+    0x7e58ee9c: 'messages_clear_all_drafts',
+    0x7ed094a1: 'messages_get_old_featured_stickers',
+    0x7f1d072f: 'messages_rate_transcribed_audio',
+    0x7f4b690a: 'messages_read_encrypted_history',
+    0x7f5defa6: 'messages_invited_users',
+    0x7f648b67: 'search_result_position',
+    0x7fe7e815: 'messages_hide_chat_join_request',
+    0x7ff3b806: 'messages_save_draft',
+    0x812c2ae6: 'messages_get_stats_url',
+    0x81b6b00a: 'messages_chat_invite_importers',
+    0x849ad397: 'messages_toggle_paid_reaction_privacy',
+    0x84d19185: 'messages_affected_messages',
+    0x84f80814: 'messages_get_extended_media',
+    0x857ebdb8: 'messages_get_prepared_inline_message',
+    0x864b2581: 'messages_set_chat_available_reactions',
+    0x875f74be: 'messages_get_all_chats',
+    0x8953ab4e: 'messages_report',
+    0x8999602d: 'messages_clear_recent_stickers',
+    0x8b68b0cc: 'messages_get_web_page_preview',
+    0x8b716587: 'messages_reorder_pinned_saved_dialogs',
+    0x8bba90e6: 'messages_get_messages_reactions',
+    0x8c4bfe5d: 'messages_get_outbox_read_date',
+    0x8c5a3b3c: 'messages_request_app_web_view',
+    0x8c5adfd9: 'chat_invite_importer',
+    0x8d9692a3: 'messages_get_web_page',
+    0x8ef8ecc0: 'messages_set_game_score',
+    0x8ffacae1: 'messages_set_chat_wall_paper',
+    0x91b2d060: 'messages_send_bot_requested_peer',
+    0x92b4494c: 'messages_search_emoji_sticker_sets',
+    0x9342ca07: 'messages_get_bot_callback_answer',
+    0x94a495c3: 'messages_get_quick_reply_messages',
+    0x983f9745: 'messages_send_message_layer199',
+    0x9a3bfd99: 'messages_high_scores',
+    0x9bd2f439: 'messages_get_sponsored_messages',
+    0x9c7f2f10: 'messages_get_search_results_positions',
+    0x9da9403b: 'messages_get_recent_stickers',
+    0x9dd6a67b: 'messages_send_paid_reaction',
+    0x9dfeefb4: 'messages_clear_recent_reactions',
+    0x9eb51445: 'messages_set_default_history_ttl',
+    0xa02ce5d5: 'messages_export_chat_invite',
+    0xa0f4cb4f: 'messages_get_dialogs',
+    0xa1405817: 'messages_send_screenshot_notification',
+    0xa2185cab: 'messages_delete_chat_user',
+    0xa24de717: 'messages_checked_history_import_peer',
+    0xa2875319: 'messages_migrate_chat',
+    0xa29cd42c: 'messages_get_suggested_dialog_filters',
+    0xa2b5a3f6: 'messages_get_exported_chat_invites',
+    0xa455de90: 'messages_export_chat_invite',
+    0xa550cd78: 'messages_send_media',
+    0xa5866b41: 'messages_edit_chat_default_banned_rights',
+    0xa6341782: 'messages_discussion_message',
+    0xa731e257: 'messages_toggle_dialog_pin',
+    0xa85bd1c2: 'messages_edit_chat_admin',
+    0xa927fec5: 'messages_inactive_chats',
+    0xaadf159b: 'messages_web_view_result',
+    0xac81bbde: 'messages_toggle_saved_dialog_pin',
+    0xaeb00b34: 'messages_get_full_chat',
+    0xb08f922a: 'messages_delete_history',
+    0xb0d81a83: 'messages_prolong_web_view',
+    0xb11eafa2: 'messages_toggle_no_forwards',
+    0xb12c7125: 'messages_accept_url_auth',
+    0xb43df344: 'messages_start_history_import',
+    0xb45c69d1: 'messages_affected_history',
+    0xb5052fea: 'messages_toggle_sticker_sets',
+    0xb69b72d7: 'messages_chat_admins_with_invites',
+    0xb6c4f543: 'messages_message_views',
+    0xb80e5fe4: 'messages_set_history_ttl',
+    0xb86e380e: 'messages_get_poll_votes',
+    0xb8a0a1a8: 'messages_get_all_stickers',
+    0xb9ffc55b: 'messages_fave_sticker',
+    0xbb8125ba: 'messages_get_top_reactions',
+    0xbb9fa475: 'messages_forward_messages',
+    0xbd38850a: 'messages_send_scheduled_messages',
+    0xbdbb0464: 'messages_get_scheduled_messages',
+    0xbdc62dcc: 'messages_exported_chat_invites',
+    0xbdca2f75: 'messages_edit_exported_chat_invite',
+    0xbdf93428: 'messages_get_default_tag_reactions',
+    0xc0cf7646: 'messages_send_inline_bot_result',
+    0xc286d98f: 'messages_mark_dialog_unread',
+    0xc563c1e4: 'messages_update_dialog_filters_order',
+    0xc78fe460: 'messages_install_sticker_set',
+    0xc8a0ec74: 'messages_get_sticker_set',
+    0xc9b0539f: 'search_results_calendar_period',
+    0xc9e01e7b: 'messages_request_main_web_view',
+    0xcacacaca: 'messages_send_encrypted_multi_media',
+    0xcc5b67cc: 'messages_get_attached_stickers',
+    0xccfddf96: 'messages_save_default_send_as',
+    0xcf1592db: 'messages_report_spam',
+    0xcfb9d957: 'messages_transcribed_audio',
+    0xd0b5e1fc: 'messages_get_my_stickers',
+    0xd2aaf7ec: 'messages_update_pinned_message',
+    0xd30d78d4: 'messages_send_reaction',
+    0xd372c5ce: 'messages_save_draft',
+    0xd464a42b: 'messages_delete_exported_chat_invite',
+    0xd483f2a8: 'messages_get_quick_replies',
+    0xd5039208: 'messages_forward_messages',
+    0xd58f130a: 'messages_set_bot_callback_answer',
+    0xd5a5d3a1: 'messages_get_stickers',
+    0xd5b10c26: 'messages_get_emoji_url',
+    0xd63d94e0: 'messages_get_pinned_saved_dialogs',
+    0xd6b94df2: 'messages_get_pinned_dialogs',
+    0xd9ab0f54: 'messages_get_custom_emoji_documents',
+    0xdc0242c8: 'messages_send_web_view_data',
+    0xddcf50eb: 'messages_send_web_view_result_message',
+    0xdea20a39: 'messages_get_available_effects',
+    0xdef60797: 'messages_edit_chat_about',
+    0xdf04dd4e: 'messages_get_chat_invite_importers',
+    0xdfd14005: 'messages_edit_message',
+    0xdff8042c: 'messages_send_message',
+    0xe085f4ea: 'messages_hide_all_chat_join_requests',
+    0xe105e910: 'messages_delete_quick_reply_messages',
+    0xe40ca104: 'messages_get_common_chats',
+    0xe41cd11d: 'messages_set_web_view_result',
+    0xe470bcfd: 'messages_get_peer_dialogs',
+    0xe47cb579: 'messages_toggle_peer_translations',
+    0xe58e95d2: 'messages_delete_messages',
+    0xe5d7d19c: 'messages_chat_full',
+    0xe63be13f: 'messages_set_chat_theme',
+    0xe6df7378: 'messages_start_bot',
+    0xe822649d: 'messages_get_game_high_scores',
+    0xe844ebff: 'messages_search_counter',
+    0xeb50adf5: 'messages_bot_app',
+    0xed5383f7: 'sponsored_message',
+    0xef8d3e6c: 'messages_affected_found_messages',
+    0xefd48c89: 'messages_get_dialog_filters',
+    0xefd9a6a2: 'messages_get_peer_settings',
+    0xf025bc8b: 'messages_unpin_all_messages',
+    0xf107e790: 'messages_get_unread_mentions',
+    0xf141b5e1: 'input_encrypted_chat',
+    0xf1d0fbd3: 'messages_check_quick_reply_shortcut',
+    0xf24753e3: 'messages_add_chat_user',
+    0xf2ecef23: 'chat_admin_with_invites',
+    0xf393aea0: 'messages_discard_encryption',
+    0xf516760b: 'messages_get_scheduled_history',
+    0xf64daf43: 'messages_request_encryption',
+    0xf731a9f4: 'messages_read_discussion',
+    0xf96e55de: 'messages_uninstall_sticker_set',
+    0xf9cbe409: 'messages_delete_phone_call_history',
+    0xfaff629d: 'messages_my_stickers',
+    0xfbf2340a: 'messages_send_message',
+    0xfbfca18f: 'messages_get_emoji_stickers',
+    0xfc78af9b: 'messages_report',
+    0xfd2dda49: 'messages_toggle_dialog_filter_tags',
+    0xfd5e12bd: 'messages_web_page',
+    0xfda68d36: 'messages_get_message_edit_data',
+    0xfeb16771: 'messages_set_chat_available_reactions',
+    0xff57708d: 'messages_prepared_inline_message',
+    0xcdbbcebb: 'messages_all_stickers',
+    0xe86602c3: 'messages_all_stickers_not_modified',
+    0xd1ed9a5b: 'messages_available_effects_not_modified',
+    0xbddb616e: 'messages_available_effects',
+    0x93c3e27e: 'available_effect',
+    0x9f071957: 'messages_available_reactions_not_modified',
+    0x768e3aad: 'messages_available_reactions',
+    0xc077ec01: 'available_reaction',
+    0xccd3563d: 'messages_bot_results_layer71',
+    0x947ca848: 'messages_bot_results_layer153',
+    0xe021f2f6: 'messages_bot_results',
+    0x3c20629f: 'inline_bot_switch_pm',
+    0xb57295d5: 'inline_bot_web_view',
+    0x64ff9fd5: 'messages_chats',
+    0x9cd81144: 'messages_chats_slice',
+    0xc0e24635: 'messages_dh_config_not_modified',
+    0x2c221edd: 'messages_dh_config',
+    0x15ba6c40: 'messages_dialogs',
+    0x71e094f3: 'messages_dialogs_slice',
+    0xf0e3e596: 'messages_dialogs_not_modified',
+    0x6fb4ad87: 'messages_emoji_groups_not_modified',
+    0x881fb94b: 'messages_emoji_groups',
+    0x222600ef: 'messages_exported_chat_invite_replaced',
+    0x1871be50: 'messages_exported_chat_invite',
+    0x9e8fa6d3: 'messages_faved_stickers_not_modified',
+    0x2cb51097: 'messages_faved_stickers',
+    0xbe382906: 'messages_featured_stickers',
+    0xc6dc0c66: 'messages_featured_stickers_not_modified',
+    0xffc86587: 'input_messages_filter_gif',
+    0x3751b49e: 'input_messages_filter_music',
+    0x3a20ecb8: 'input_messages_filter_chat_photos',
+    0x9609a51c: 'input_messages_filter_photos',
+    0x7ef0dd87: 'input_messages_filter_url',
+    0x9eddf188: 'input_messages_filter_document',
+    0x56e9f0e4: 'input_messages_filter_photo_video',
+    0xd95e73bb: 'input_messages_filter_photo_video_documents',
+    0xe7026d0d: 'input_messages_filter_geo',
+    0x1bb00451: 'input_messages_filter_pinned',
+    0xc1f8e69a: 'input_messages_filter_my_mentions',
+    0x7a7c17a4: 'input_messages_filter_round_voice',
+    0xe062db83: 'input_messages_filter_contacts',
+    0x50f5c392: 'input_messages_filter_voice',
+    0x9fc00e65: 'input_messages_filter_video',
+    0x80c99768: 'input_messages_filter_phone_calls',
+    0x57e2f66c: 'input_messages_filter_empty',
+    0xb549da53: 'input_messages_filter_round_video',
+    0x0d54b65d: 'messages_found_sticker_sets_not_modified',
+    0x8af09dd2: 'messages_found_sticker_sets',
+    0x82c9e290: 'messages_found_stickers',
+    0x6010c534: 'messages_found_stickers_not_modified',
+    0x3a54685e: 'messages_messages_slice',
+    0x8c718e87: 'messages_messages',
+    0xc776ba4e: 'messages_channel_messages',
+    0x74535f21: 'messages_messages_not_modified',
+    0xc68d6695: 'messages_quick_replies',
+    0x5f91eb5b: 'messages_quick_replies_not_modified',
+    0x0697102b: 'quick_reply',
+    0xb06fdbdf: 'messages_reactions_not_modified',
+    0xeafdf716: 'messages_reactions',
+    0x88d37c56: 'messages_recent_stickers',
+    0x0b17f890: 'messages_recent_stickers_not_modified',
+    0xf83ae221: 'messages_saved_dialogs',
+    0x44ba9dd9: 'messages_saved_dialogs_slice',
+    0xc01f6fe8: 'messages_saved_dialogs_not_modified',
+    0xbd87cb6c: 'saved_dialog',
+    0xe8025ca2: 'messages_saved_gifs_not_modified',
+    0x84a02a0d: 'messages_saved_gifs',
+    0x889b59ef: 'messages_saved_reactions_tags_not_modified',
+    0x3259950a: 'messages_saved_reactions_tags',
+    0xcb6ff828: 'saved_reaction_tag',
+    0x560f8935: 'messages_sent_encrypted_message',
+    0x9493ff32: 'messages_sent_encrypted_file',
+    0x1839490f: 'messages_sponsored_messages_empty',
+    0xc9ee1d87: 'messages_sponsored_messages',
+    0x4d93a990: 'sponsored_message',
+    0x6e153f16: 'messages_sticker_set',
+    0xb60a24a6: 'messages_sticker_set_layer146',
+    0xd3f924eb: 'messages_sticker_set_not_modified',
+    0x38641628: 'messages_sticker_set_install_result_success',
+    0x35e410a8: 'messages_sticker_set_install_result_archive',
+    0xf1749a22: 'messages_stickers_not_modified',
+    0x30a6ec7e: 'messages_stickers',
+    0x8e1a1775: 'nearest_dc',
+    0x97e8bebe: 'notification_sound_default',
+    0x6f0c34df: 'notification_sound_none',
+    0xff6c8049: 'notification_sound_ringtone',
+    0x830b9ae4: 'notification_sound_local',
+    0x226e6308: 'notify_forum_topic',
+    0xd612e8ef: 'notify_broadcasts',
+    0xc007cec3: 'notify_chats',
+    0xb4c83b4c: 'notify_users',
+    0x9fd40bd8: 'notify_peer',
+    0x56730bcc: 'null',
+    0x3bb842ac: 'outbox_read_date',
+    0x8dee6c44: 'page_part_layer67',
+    0x8e3f9ebe: 'page_part_layer82',
+    0xd7a19d69: 'page_full_layer67',
+    0x556ec7aa: 'page_full_layer82',
+    0xae891bec: 'page_layer110',
+    0x98657f0d: 'page',
+    0x9a8ae1e1: 'page_block_ordered_list',
+    0xd9d71866: 'page_block_video_layer82',
+    0xf259a80b: 'page_block_embed_post',
+    0x467a0766: 'page_block_paragraph',
+    0x1e148390: 'page_block_kicker',
+    0x48870999: 'page_block_footer',
+    0xbfd064ec: 'page_block_header',
+    0xc070d93e: 'page_block_preformatted',
+    0x16115a96: 'page_block_related_articles',
+    0xf12bb6e1: 'page_block_subheader',
+    0x031f9590: 'page_block_slideshow',
+    0xce0d37b0: 'page_block_anchor',
+    0xa44f3ef6: 'page_block_map',
+    0xdb20b188: 'page_block_divider',
+    0x1759c560: 'page_block_photo',
+    0xe4e88011: 'page_block_list',
+    0x13567e8a: 'page_block_unsupported',
+    0x65a0fa4d: 'page_block_collage',
+    0x3d5b64f2: 'page_block_author_date_layer60',
+    0x3a58c7f4: 'page_block_list_layer82',
+    0xa8718dc5: 'page_block_embed',
+    0x130c8963: 'page_block_slideshow_layer82',
+    0x8ffa9a1f: 'page_block_subtitle',
+    0x263d7c26: 'page_block_blockquote',
+    0x76768bed: 'page_block_details',
+    0xef1751b5: 'page_block_channel',
+    0x7c8fe7b6: 'page_block_video',
+    0xd935d8fb: 'page_block_embed_layer60',
+    0x4f4456d3: 'page_block_pullquote',
+    0x804361ea: 'page_block_audio',
+    0xbf4dea82: 'page_block_table',
+    0xe9c69982: 'page_block_photo_layer82',
+    0x70abc3fd: 'page_block_title',
+    0x292c7be9: 'page_block_embed_post_layer82',
+    0x08b31c4f: 'page_block_collage_layer82',
+    0x31b81a7f: 'page_block_audio_layer82',
+    0x39f23300: 'page_block_cover',
+    0xcde200d1: 'page_block_embed_layer82',
+    0xbaafe5e0: 'page_block_author_date',
+    0x34566b6a: 'page_table_cell',
+    0x6f747657: 'page_caption',
+    0xb390dc08: 'page_related_article',
+    0xe0c0c5e5: 'page_table_row',
+    0x25e073fc: 'page_list_item_blocks',
+    0xb92fb6cd: 'page_list_item_text',
+    0x5e068047: 'page_list_ordered_item_text',
+    0x98dd8936: 'page_list_ordered_item_blocks',
+    0xd45ab096: 'password_kdf_algo_unknown',
+    0x3a912d4a: 'password_kdf_algo_sha256sha256pbkdf2hmacsha512iter100000sha256mod_pow',
+    0xa0058751: 'payments_payment_form',
+    0x7bf6b15c: 'payments_payment_form_stars',
+    0xb425cfe1: 'payments_payment_form_star_gift',
+    0x88f8f21b: 'payment_form_method',
+    0xcdc27a1f: 'payment_saved_credentials_card',
+    0x70c4fe03: 'payments_payment_receipt',
+    0xdabbf83a: 'payments_payment_receipt_stars',
+    0x1e8caaeb: 'post_address',
+    0x909c3f94: 'payment_requested_info',
+    0xb6213cdf: 'shipping_option',
+    0x0d6b48f7: 'payments_get_suggested_star_ref_bots',
+    0x0f91b065: 'payments_export_invoice',
+    0x13bbe8b3: 'payments_get_stars_revenue_withdrawal_url',
+    0x146e958d: 'payments_request_recurring_payment',
+    0x19a13f71: 'payments_connected_bot_star_ref',
+    0x1dab80b7: 'payments_stars_revenue_withdrawal_url',
+    0x227d824b: 'payments_get_saved_info',
+    0x2478d1cc: 'payments_get_payment_receipt',
+    0x2757ba54: 'payments_get_premium_gift_code_options',
+    0x284a1096: 'payments_checked_gift_code',
+    0x2d03522f: 'payments_send_payment_form',
+    0x2e79d779: 'payments_get_bank_card_data',
+    0x37148dbb: 'payments_get_payment_form',
+    0x394e7f21: 'payments_stars_revenue_ads_account_url',
+    0x3e24e573: 'payments_bank_card_data',
+    0x5869a553: 'payments_get_connected_star_ref_bots',
+    0x5ff58f20: 'payments_launch_prepaid_giveaway',
+    0x7ed5348a: 'payments_connect_star_ref_bot',
+    0x8e51b4c1: 'payments_check_gift_code',
+    0x98d5ea1d: 'payments_connected_star_ref_bots',
+    0x9fc19eb6: 'payments_can_purchase_premium',
+    0xaed0cbd9: 'payments_exported_invoice',
+    0xb4d5d859: 'payments_suggested_star_ref_bots',
+    0xb6c8f12b: 'payments_validate_requested_info',
+    0xb7d998f0: 'payments_get_connected_star_ref_bot',
+    0xc92bb73b: 'payments_stars_revenue_stats',
+    0xd1451883: 'payments_validated_requested_info',
+    0xd1d7efc5: 'payments_get_stars_revenue_ads_account_url',
+    0xd83d70c1: 'payments_clear_saved_info',
+    0xd91ffad6: 'payments_get_stars_revenue_stats',
+    0xdffd50d3: 'payments_assign_play_market_transaction',
+    0xe4fca4a3: 'payments_edit_connected_star_ref_bot',
+    0xf4239425: 'payments_get_giveaway_info',
+    0xf568028a: 'bank_card_open_url',
+    0xf6e26854: 'payments_apply_gift_code',
+    0xfb8fe43c: 'payments_saved_info',
+    0xe175e66f: 'payments_giveaway_info_results',
+    0x00cd5570: 'payments_giveaway_info_results_layer186',
+    0x4367daa0: 'payments_giveaway_info',
+    0xd8411139: 'payments_payment_verification_needed',
+    0x4e5f810d: 'payments_payment_result',
+    0xa2a5371e: 'peer_channel',
+    0xbddde532: 'peer_channel_layer131',
+    0x59511722: 'peer_user',
+    0x9db1bc6d: 'peer_user_layer131',
+    0x36c6019a: 'peer_chat',
+    0xbad0e5bb: 'peer_chat_layer131',
+    0xf8ec284b: 'peer_self_located',
+    0xca461b5d: 'peer_located',
+    0x99622c0c: 'peer_notify_settings',
+    0xa83b0426: 'peer_notify_settings_layer156',
+    0x9acda4c0: 'peer_notify_settings_layer77',
+    0xaf509d20: 'peer_notify_settings_layer139',
+    0x8d5e11ee: 'peer_notify_settings_layer47',
+    0x70a68512: 'peer_notify_settings_empty_layer77',
+    0xf47741f7: 'peer_settings',
+    0x0d8c39ec: 'peer_settings_layer199_3',
+    0xa8639d72: 'peer_settings_layer199_2',
+    0xacd66c5e: 'peer_settings_layer199',
+    0xa518110d: 'peer_settings_layer176',
+    0x733f2961: 'peer_settings_layer134',
+    0x041845db: 'phone_get_group_call',
+    0x17d54f61: 'phone_received_call',
+    0x1ab21940: 'phone_get_group_call_stream_channels',
+    0x1c50d144: 'phone_leave_group_call_presentation',
+    0x1ca6ac0a: 'phone_edit_group_call_title',
+    0x1e36fded: 'input_phone_call',
+    0x204bd158: 'phone_exported_group_call_invite',
+    0x219c34e6: 'phone_toggle_group_call_start_subscription',
+    0x277add7e: 'phone_save_call_debug',
+    0x2dbf3432: 'phone_group_call_stream_rtmp_url',
+    0x2efe1722: 'phone_confirm_call',
+    0x3660c311: 'phone_call_accepted_layer195',
+    0x3bd2b4a0: 'phone_accept_call',
+    0x41248786: 'phone_save_call_log',
+    0x42ff96ed: 'phone_request_call',
+    0x48cdc6d8: 'phone_create_group_call',
+    0x500377f9: 'phone_leave_group_call',
+    0x55451fa9: 'phone_get_call_config',
+    0x5680e342: 'phone_start_scheduled_group_call',
+    0x575e1f8c: 'phone_save_default_group_call_join_as',
+    0x59ead627: 'phone_set_call_rating',
+    0x74bbb43d: 'phone_toggle_group_call_settings',
+    0x7a777135: 'phone_discard_group_call',
+    0x7b393160: 'phone_invite_to_group_call',
+    0x80eb48af: 'phone_group_call_stream_channel',
+    0x9e727aad: 'phone_group_call',
+    0xa5273abf: 'phone_edit_group_call_participant',
+    0xa6c4600c: 'phone_request_call',
+    0xafe5623f: 'phone_join_as_peers',
+    0xb132ff7b: 'phone_join_group_call',
+    0xb2cbc1c0: 'phone_discard_call',
+    0xb59cf977: 'phone_check_group_call',
+    0xc558d8ab: 'phone_get_group_participants',
+    0xcbea6bc4: 'phone_join_group_call_presentation',
+    0xd0e482b2: 'phone_group_call_stream_channels',
+    0xd61e1df3: 'phone_join_group_call',
+    0xd8aa840f: 'input_group_call',
+    0xdeb3abbf: 'phone_get_group_call_stream_rtmp_url',
+    0xdfc909ab: 'phone_create_conference_call',
+    0xe6aa647f: 'phone_export_group_call_invite',
+    0xec82e140: 'phone_phone_call',
+    0xef7c213a: 'phone_get_group_call_join_as',
+    0xf128c708: 'phone_toggle_group_call_record',
+    0xf47751b6: 'phone_group_participants',
+    0xff7a9383: 'phone_send_signaling_data',
+    0x45361c63: 'phone_call_requested',
+    0x14b0ed0c: 'phone_call_requested_layer195',
+    0x3ba5940c: 'phone_call',
+    0x30535af5: 'phone_call_layer195',
+    0x967f7c67: 'phone_call_layer176',
+    0x5366c915: 'phone_call_empty',
+    0x22fd7181: 'phone_call_accepted',
+    0xeed42858: 'phone_call_waiting',
+    0xc5226f17: 'phone_call_waiting_layer195',
+    0x50ca4de1: 'phone_call_discarded_layer195',
+    0xf9d25503: 'phone_call_discarded',
+    0x57adc690: 'phone_call_discard_reason_hangup',
+    0xfaf7e8c9: 'phone_call_discard_reason_busy',
+    0x85e42301: 'phone_call_discard_reason_missed',
+    0xe095c1a0: 'phone_call_discard_reason_disconnect',
+    0xafe2b839: 'phone_call_discard_reason_allow_group_call',
+    0xfc878fc8: 'phone_call_protocol',
+    0xa2bb35cb: 'phone_call_protocol_layer110',
+    0x9cc123c7: 'phone_connection',
+    0x635fe375: 'phone_connection_webrtc',
+    0x9c477dd8: 'photo_layer97',
+    0xcded42fe: 'photo_layer55',
+    0xc3838076: 'photo_old2',
+    0x2331b22d: 'photo_empty',
+    0x22b56751: 'photo_old',
+    0xd07504a5: 'photo_layer115',
+    0xfb197a65: 'photo',
+    0x9288dd29: 'photo_layer82',
+    0xd8214d41: 'photo_path_size',
+    0x77bfb61b: 'photo_size_layer127',
+    0x0e17e23c: 'photo_size_empty',
+    0x5aa86a51: 'photo_size_progressive_layer127',
+    0xe0b0bc2e: 'photo_stripped_size',
+    0xe9a734fa: 'photo_cached_size_layer127',
+    0x75c78e60: 'photo_size',
+    0x021e1ad6: 'photo_cached_size',
+    0xfa3efb95: 'photo_size_progressive',
+    0x0388a3b5: 'photos_upload_profile_photo',
+    0x09e82039: 'photos_update_profile_photo',
+    0x20212ca8: 'photos_photo',
+    0x87cf7f2f: 'photos_delete_photos',
+    0x91cd32a8: 'photos_get_user_photos',
+    0xe14c4a71: 'photos_upload_contact_profile_photo',
+    0x8dca6aa5: 'photos_photos',
+    0x15051f54: 'photos_photos_slice',
+    0x58747131: 'poll',
+    0x86e18161: 'poll_layer178',
+    0xaf746786: 'poll_to_delete',
+    0xd5529d06: 'poll_layer111',
+    0xff16e2ca: 'poll_answer',
+    0x6ca9c2e9: 'poll_answer_layer178',
+    0x5755785a: 'poll_results_layer108',
+    0xc87024a2: 'poll_results_layer111',
+    0xbadcc1a3: 'poll_results_layer131',
+    0xdcb82ea3: 'poll_results_layer158',
+    0x7adf2420: 'poll_results',
+    0x3b6ddad2: 'poll_answer_voters',
+    0x79c059f7: 'premium_gift_option',
+    0x74c34319: 'premium_gift_option_layer199',
+    0x5f2d1df2: 'premium_subscription_option',
+    0xb6f11ebe: 'premium_subscription_option_layer151',
+    0xbc2eab30: 'privacy_key_status_timestamp',
+    0x39491cc8: 'privacy_key_phonep2p',
+    0x500e6dfa: 'privacy_key_chat_invite',
+    0x42ffd42b: 'privacy_key_added_by_phone',
+    0x0697f414: 'privacy_key_voice_messages',
+    0xa486b761: 'privacy_key_about',
+    0x3d662b7b: 'privacy_key_phone_call',
+    0x69ec56a3: 'privacy_key_forwards',
+    0xd19ae46d: 'privacy_key_phone_number',
+    0x96151fed: 'privacy_key_profile_photo',
+    0x2000a518: 'privacy_key_birthday',
+    0x2ca4fdf8: 'privacy_key_star_gifts_auto_save',
+    0x17d348d2: 'privacy_key_no_paid_messages',
+    0xf888fa1a: 'privacy_value_disallow_contacts',
+    0xe4621141: 'privacy_value_disallow_users',
+    0x6b134e8e: 'privacy_value_allow_chat_participants',
+    0x41c87565: 'privacy_value_disallow_chat_participants',
+    0x65427b82: 'privacy_value_allow_all',
+    0x8b73e763: 'privacy_value_disallow_all',
+    0xb8905fb2: 'privacy_value_allow_users',
+    0xfffe1bac: 'privacy_value_allow_contacts',
+    0xf7e8d89b: 'privacy_value_allow_close_friends',
+    0xece9814b: 'privacy_value_allow_premium',
+    0x21461b5d: 'privacy_value_allow_bots',
+    0xf6a5f82f: 'privacy_value_disallow_bots',
+    0x8935fc73: 'reaction_custom_emoji',
+    0x79f5d419: 'reaction_empty',
+    0x1b2286b8: 'reaction_emoji',
+    0x523da4eb: 'reaction_paid',
+    0xa3d1cb80: 'reaction_count',
+    0x6fb250d1: 'reaction_count_old',
+    0x4a4ff172: 'read_participant_date',
+    0xa384b779: 'received_notify_message',
+    0xb2da71d2: 'recent_me_url_chat',
+    0xbc0a57dc: 'recent_me_url_sticker_set',
+    0x46e1d13d: 'recent_me_url_unknown',
+    0xeb49081d: 'recent_me_url_chat_invite',
+    0xb92c09e2: 'recent_me_url_user',
+    0x85dd99d1: 'reply_keyboard_markup',
+    0xa03e5b85: 'reply_keyboard_hide',
+    0x86b40b08: 'reply_keyboard_force_reply',
+    0x3502758c: 'reply_keyboard_markup_layer129',
+    0xf4108aa0: 'reply_keyboard_force_reply_layer129',
+    0x48a30254: 'reply_inline_markup',
+    0x77608b83: 'keyboard_button_row',
+    0x5a6d7395: 'report_messages_delivery',
+    0xdbd4feed: 'input_report_reason_geo_irrelevant',
+    0xc1e4a2b1: 'input_report_reason_other',
+    0xf5ddd6e7: 'input_report_reason_fake',
+    0x9b89f93a: 'input_report_reason_copyright',
+    0x58dbcab8: 'input_report_reason_spam',
+    0x1e22c78d: 'input_report_reason_violence',
+    0xadf44ee3: 'input_report_reason_child_abuse',
+    0x2e59d922: 'input_report_reason_pornography',
+    0xf0e4e0b6: 'report_result_choose_option',
+    0x6f09ac31: 'report_result_add_comment',
+    0x8db33c4b: 'report_result_reported',
+    0x7903e3d9: 'message_report_option',
+    0x5f3b8a00: 'request_peer_type_user',
+    0xc9f06e1b: 'request_peer_type_chat',
+    0x339bef6c: 'request_peer_type_broadcast',
+    0xd072acb4: 'restriction_reason',
+    0x1ccb966a: 'text_phone',
+    0xc7fb5e01: 'text_superscript',
+    0x081ccf4f: 'text_image',
+    0xc12622c4: 'text_underline',
+    0xed6a8504: 'text_subscript',
+    0x3c2884c1: 'text_url',
+    0x35553762: 'text_anchor',
+    0xdc3d824f: 'text_empty',
+    0xde5a0dd6: 'text_email',
+    0x744694e0: 'text_plain',
+    0x6724abc4: 'text_bold',
+    0x9bf8bb95: 'text_strike',
+    0x7e6260d7: 'text_concat',
+    0xd912a59c: 'text_italic',
+    0x034b8621: 'text_marked',
+    0x6c3f19b9: 'text_fixed',
+    0xe0277a62: 'secure_file_layer142',
+    0x64199744: 'secure_file_empty',
+    0x7d09c27e: 'secure_file',
+    0xbbf2dda0: 'secure_password_kdf_algo_pbkdf2hmacsha512iter100000',
+    0x86471d92: 'secure_password_kdf_algo_sha512',
+    0x004a8537: 'secure_password_kdf_algo_unknown',
+    0x21ec5a5f: 'secure_plain_email',
+    0x7d6099dd: 'secure_plain_phone',
+    0x829d99da: 'secure_required_type',
+    0x027477b4: 'secure_required_type_one_of',
+    0x7a700873: 'secure_value_error_file',
+    0x00be3dfa: 'secure_value_error_front_side',
+    0x666220e9: 'secure_value_error_files',
+    0x868a2aa5: 'secure_value_error_reverse_side',
+    0xa1144770: 'secure_value_error_translation_file',
+    0x869d758f: 'secure_value_error',
+    0xe8a40bd9: 'secure_value_error_data',
+    0x34636dd8: 'secure_value_error_translation_files',
+    0xe537ced6: 'secure_value_error_selfie',
+    0xcbe31e26: 'secure_value_type_address',
+    0x99e3806a: 'secure_value_type_passport_registration',
+    0xa0d0744b: 'secure_value_type_identity_card',
+    0xfc36954e: 'secure_value_type_utility_bill',
+    0x89137c0d: 'secure_value_type_bank_statement',
+    0x8e3ca7ee: 'secure_value_type_email',
+    0x9d2a81e3: 'secure_value_type_personal_details',
+    0xea02ec33: 'secure_value_type_temporary_registration',
+    0x3dac6a00: 'secure_value_type_passport',
+    0x8b883488: 'secure_value_type_rental_agreement',
+    0x06e425c4: 'secure_value_type_driver_license',
+    0xb320aadb: 'secure_value_type_phone',
+    0x99a48f23: 'secure_value_type_internal_passport',
+    0xdd6a8f48: 'send_message_game_play_action',
+    0xd52f73f7: 'send_message_record_audio_action',
+    0x92042ff7: 'send_message_upload_video_action_old',
+    0xe6ac8a6f: 'send_message_upload_audio_action_old',
+    0xf351d7ab: 'send_message_upload_audio_action',
+    0xd1d34a26: 'send_message_upload_photo_action',
+    0x8faee98e: 'send_message_upload_document_action_old',
+    0xe9763aec: 'send_message_upload_video_action',
+    0xfd5ec8f5: 'send_message_cancel_action',
+    0x176f8ba1: 'send_message_geo_location_action',
+    0x628cbc6f: 'send_message_choose_contact_action',
+    0xb05ac6b1: 'send_message_choose_sticker_action',
+    0x88f27fbc: 'send_message_record_round_action',
+    0x243e1c66: 'send_message_upload_round_action',
+    0x16bf744e: 'send_message_typing_action',
+    0xdbda9246: 'send_message_history_import_action',
+    0x990a3c1a: 'send_message_upload_photo_action_old',
+    0xaa0cd9e4: 'send_message_upload_document_action',
+    0xd92c2285: 'speaking_in_group_call_action',
+    0xa187d66f: 'send_message_record_video_action',
+    0x25972bcb: 'send_message_emoji_interaction',
+    0xb665902e: 'send_message_emoji_interaction_seen',
+    0x882f76bb: 'simple_web_view_result_url',
+    0x167bd90b: 'star_gift_upgrade_preview',
+    0x84aa3a9c: 'star_gift_withdrawal_url',
+    0x02cc73c8: 'star_gift',
+    0x5c62d151: 'star_gift_unique',
+    0xf2fe7e4a: 'star_gift_unique_layer198',
+    0x3482f322: 'star_gift_unique_layer197',
+    0x6a1407cd: 'star_gift_unique_layer196',
+    0xaea174ee: 'star_gift_layer190',
+    0x49c577cd: 'star_gift_layer195',
+    0x39d99013: 'star_gift_attribute_model',
+    0x13acff19: 'star_gift_attribute_pattern',
+    0x94271762: 'star_gift_attribute_backdrop',
+    0xe0bff26c: 'star_gift_attribute_original_details',
+    0xc02c4f4b: 'star_gift_attribute_original_details_layer197',
+    0x901689ea: 'star_gifts',
+    0xa388a368: 'star_gifts_not_modified',
+    0x032512c5: 'stars_get_stars_subscriptions',
+    0x0bd915c0: 'stars_topup_option',
+    0x104fcfa7: 'stars_payments_get_stars_status',
+    0x1513e7b0: 'stars_toggle_star_gifts_pinned_to_top',
+    0x23830de9: 'stars_get_saved_star_gifts',
+    0x2a2a697c: 'stars_save_star_gift',
+    0x54236209: 'stars_giveaway_winners_option',
+    0x5e0589f1: 'stars_gift_option',
+    0x60eaefa1: 'stars_toggle_chat_star_gift_notifications',
+    0x673ac2f9: 'stars_payments_get_stars_transactions',
+    0x74bf076b: 'stars_convert_star_gift',
+    0x7998c914: 'stars_payments_send_stars_form',
+    0x7f18176a: 'stars_transfer_star_gift',
+    0x94ce852a: 'stars_giveaway_option',
+    0x95f389b1: 'stars_payments_saved_star_gifts',
+    0x9c9abcb1: 'stars_get_star_gift_upgrade_preview',
+    0xa1974d72: 'stars_get_unique_star_gift',
+    0xaed6e4f5: 'stars_upgrade_star_gift',
+    0xb455a106: 'stars_get_saved_star_gift',
+    0xbd1efd3e: 'stars_payments_get_stars_giveaway_options',
+    0xc00ec7d3: 'stars_payments_get_stars_topup_options',
+    0xc4563590: 'stars_get_star_gifts',
+    0xc7770878: 'stars_change_stars_subscription',
+    0xcaa2f60b: 'stars_payments_unique_star_gift',
+    0xcc5bebb3: 'stars_fulfill_stars_subscription',
+    0xd06e93a8: 'stars_get_star_gift_withdrawal_url',
+    0xd3c96bc8: 'stars_payments_get_stars_gift_options',
+    0xfc84653f: 'stars_update_paid_messages_price',
+    0x69279795: 'stars_input_saved_star_gift_user',
+    0xf101aa7f: 'stars_input_saved_star_gift_chat',
+    0x206ad49e: 'stars_paid_reaction_privacy_default',
+    0x1f0c1ad9: 'stars_paid_reaction_privacy_anonymous',
+    0xdc6cfcf0: 'stars_paid_reaction_privacy_peer',
+    0xbbfa316c: 'stars_payments_stars_status_layer194',
+    0x6c9ce8ed: 'stars_payments_stars_status',
+    0x2e6eab1a: 'stars_subscription',
+    0x538ecf18: 'stars_subscription_layer193',
+    0xd073f1e6: 'stars_subscription_old',
+    0x05416d58: 'stars_subscription_pricing',
+    0xcc7079b2: 'stars_transaction_layer181',
+    0xaa00c898: 'stars_transaction_layer182',
+    0x2db5418f: 'stars_transaction_layer185',
+    0x433aeb2b: 'stars_transaction_layer186',
+    0xee7522d5: 'stars_transaction_layer188',
+    0x0a9ee4c2: 'stars_transaction_layer191',
+    0x35d4f276: 'stars_transaction_layer194',
+    0x64dfc926: 'stars_transaction_layer199',
+    0xecd50924: 'stars_transaction_layer199_2',
+    0xa39fd94a: 'stars_transaction',
+    0xd80da15d: 'stars_transaction_peer',
+    0xb457b375: 'stars_transaction_peer_app_store',
+    0x7b560a0b: 'stars_transaction_peer_play_market',
+    0xe92fd902: 'stars_transaction_peer_fragment',
+    0x250dbaf8: 'stars_transaction_peer_premium_bot',
+    0x95f2bfe4: 'stars_transaction_peer_unsupported',
+    0x60682812: 'stars_transaction_peer_ads',
+    0xf9677aad: 'stars_transaction_peer_api',
+    0x396ca5fc: 'stats_broadcast_stats',
+    0x47a971e0: 'stats_url',
+    0x535f779d: 'stats_group_top_inviter',
+    0x5407e297: 'stats_broadcast_revenue_stats',
+    0x5f150144: 'stats_get_message_public_forwards',
+    0x621d5fa0: 'stats_load_async_graph',
+    0x70990b6d: 'stats_get_broadcast_revenue_transactions',
+    0x7fe91c14: 'stats_message_stats',
+    0x87158466: 'stats_broadcast_revenue_transactions',
+    0x93037e20: 'stats_public_forwards',
+    0x9d04af9b: 'stats_group_top_poster',
+    0x9df4faad: 'stats_get_broadcast_revenue_withdrawal_url',
+    0xa6437ef6: 'stats_get_story_public_forwards',
+    0xab42441a: 'stats_get_broadcast_stats',
+    0xb637edaf: 'stats_date_range_days',
+    0xb6e0a3f5: 'stats_get_message_stats',
+    0xcb43acde: 'stats_abs_value_and_prev',
+    0xcbce2fe0: 'stats_percent_value',
+    0xd7584c87: 'stats_group_top_admin',
+    0xdcdf8607: 'stats_get_megagroup_stats',
+    0xec659737: 'stats_broadcast_revenue_withdrawal_url',
+    0xef7ff916: 'stats_megagroup_stats',
+    0xf788ee19: 'stats_get_broadcast_revenue_stats',
+    0x557e2cc4: 'stats_broadcast_revenue_transaction_proceeds',
+    0x5a590978: 'stats_broadcast_revenue_transaction_withdrawal',
+    0x42d30d2e: 'stats_broadcast_revenue_transaction_refund',
+    0x8ea464b6: 'stats_graph',
+    0x4a27eb2d: 'stats_graph_async',
+    0xbedc9822: 'stats_graph_error',
+    0x8a480e27: 'stats_post_interaction_counters_story',
+    0xe7058e7f: 'stats_post_interaction_counters_message',
+    0x01f2bf4a: 'stats_public_forward_message',
+    0xedf3add0: 'stories_public_forward_story',
+    0xa7a43b17: 'sticker_set_old',
+    0x5585a139: 'sticker_set_layer96',
+    0x6a90bcb7: 'sticker_set_layer97',
+    0xeeb46f27: 'sticker_set_layer121',
+    0x40e237a8: 'sticker_set_layer126',
+    0xcd303b41: 'sticker_set_layer75',
+    0xd7df217a: 'sticker_set_layer143',
+    0x2dd14edc: 'sticker_set',
+    0x3407e51b: 'sticker_set_multi_covered',
+    0x1aed5ee5: 'sticker_set_full_covered_layer146',
+    0x40d13c0e: 'sticker_set_full_covered',
+    0x77b15d1c: 'sticker_set_no_covered',
+    0x6410a5d2: 'sticker_set_covered',
+    0x12b299d4: 'sticker_pack',
+    0xfcfeb29c: 'sticker_keyword',
+    0x124b1c00: 'stickers_rename_sticker_set',
+    0x284b3639: 'stickers_check_short_name',
+    0x4696459a: 'stickers_replace_sticker',
+    0x4dafc503: 'stickers_suggest_short_name',
+    0x85fea03f: 'stickers_suggested_short_name',
+    0x8653febe: 'stickers_add_sticker_to_set',
+    0x87704394: 'stickers_delete_sticker_set',
+    0x9021ab67: 'stickers_create_sticker_set',
+    0xa76a5392: 'stickers_set_sticker_set_thumb',
+    0xf5537ebc: 'stickers_change_sticker',
+    0xf7760f51: 'stickers_remove_sticker_from_set',
+    0xffa0a496: 'input_sticker_set_item',
+    0xffb6d4ca: 'stickers_change_sticker_position',
+    0xaa963b05: 'storage_file_unknown',
+    0xb3cea0e4: 'storage_file_mp4',
+    0x1081464c: 'storage_file_webp',
+    0x0a4f63c0: 'storage_file_png',
+    0xcae1aadf: 'storage_file_gif',
+    0xae1e508d: 'storage_file_pdf',
+    0x528a0677: 'storage_file_mp3',
+    0x007efe0e: 'storage_file_jpeg',
+    0x4b09ebbc: 'storage_file_mov',
+    0x40bc6f52: 'storage_file_partial',
+    0x042f1f61: 'stories_premium_get_boosts_status',
+    0x0b297e9b: 'stories_toggle_pinned_to_top',
+    0x0be77b4a: 'stories_premium_get_my_boosts',
+    0x1923fa8c: 'stories_report',
+    0x19d8eb45: 'stories_report',
+    0x28e16cc8: 'stories_get_stories_views',
+    0x2c4ada50: 'stories_get_peer_stories',
+    0x374fef40: 'stories_stats_get_story_stats',
+    0x3fc9053b: 'stories_exported_story_link',
+    0x4959427a: 'stories_premium_boosts_status',
+    0x50cd067c: 'stories_stats_story_stats',
+    0x535983c3: 'stories_get_peer_max_ids',
+    0x5774ca74: 'stories_get_stories_by_id',
+    0x57bbd166: 'stories_activate_stealth_mode',
+    0x5821a5dc: 'stories_get_pinned_stories',
+    0x5dd8c3c8: 'stories_stories',
+    0x60f67660: 'stories_premium_get_boosts_list',
+    0x63c3dd0a: 'stories_stories',
+    0x6b7da746: 'stories_premium_apply_boost',
+    0x7b8def20: 'stories_export_story_link',
+    0x7ed23c57: 'stories_get_story_views_list',
+    0x7fd736b2: 'stories_send_reaction',
+    0x86f8613c: 'stories_premium_boosts_list',
+    0x9a75a1ef: 'stories_toggle_pinned',
+    0x9ae228e2: 'stories_premium_my_boosts',
+    0x9b5ae7f9: 'stories_get_all_read_peer_stories',
+    0xa556dac8: 'stories_read_stories',
+    0xa56a8b60: 'stories_get_chats_to_send',
+    0xae59db5f: 'stories_delete_stories',
+    0xb2028afb: 'stories_increment_story_views',
+    0xb4352016: 'stories_get_stories_archive',
+    0xb583ba46: 'stories_edit_story',
+    0xb9b2881f: 'stories_get_story_reactions_list',
+    0xbd0415c4: 'stories_toggle_peer_stories_hidden',
+    0xc448415c: 'stories_my_boost',
+    0xc7dfdfdd: 'stories_can_send_story',
+    0xcae68768: 'stories_peer_stories',
+    0xd1810907: 'stories_search_posts',
+    0xde9eed1d: 'stories_story_views',
+    0xe2de7737: 'stories_found_stories',
+    0xe4e6694b: 'stories_send_story',
+    0xe87acbc0: 'stories_found_story',
+    0xeeb0d625: 'stories_get_all_stories',
+    0x1158fe3e: 'stories_all_stories_not_modified',
+    0x6efc5e81: 'stories_all_stories',
+    0x712e27fd: 'stories_stealth_mode',
+    0x4b3e14d6: 'stories_boost',
+    0x2a1c8c71: 'stories_boost_layer186',
+    0x37381085: 'stories_media_area_url',
+    0x5787686d: 'stories_media_area_star_gift',
+    0xbe82db9c: 'stories_media_area_venue',
+    0xcad5452d: 'stories_media_area_geo_point',
+    0xdf8b3b22: 'stories_media_area_geo_point_layer181',
+    0x14455871: 'stories_media_area_suggested_reaction',
+    0x770416af: 'stories_media_area_channel_post',
+    0xb282217f: 'stories_input_media_area_venue',
+    0x2271f2bf: 'stories_input_media_area_channel_post',
+    0x49a6549c: 'stories_media_area_weather',
+    0x4386f849: 'stories_media_area_weather_old',
+    0x855f223e: 'stories_media_area_weather2',
+    0xde4c5d93: 'stories_geo_point_address',
+    0xcfc9e002: 'stories_media_area_coordinates',
+    0x03d1ea4e: 'stories_media_area_coordinates_layer181',
+    0x9a35e999: 'stories_peer_stories',
+    0x8611a200: 'stories_peer_stories_layer162',
+    0xb2539d54: 'stories_prepaid_giveaway',
+    0x9a9d77e0: 'stories_prepaid_stars_giveaway',
+    0xaa5f789c: 'story_reactions_list',
+    0xb826e150: 'story_fwd_header',
+    0x79b26a24: 'story_item',
+    0xaf6365a1: 'story_item_layer174',
+    0x44c457ce: 'story_item_layer166',
+    0x562aa637: 'story_item_layer160',
+    0x51e6ee4f: 'story_item_deleted',
+    0xffadc913: 'story_item_skipped',
+    0x6090d6d5: 'story_reaction',
+    0xbbab2643: 'story_reaction_public_forward',
+    0xcfcd0f13: 'story_reaction_public_repost',
+    0xb0bdeac5: 'story_view',
+    0x9083670b: 'story_view_public_forward',
+    0xbd74cf49: 'story_view_public_repost',
+    0xd36760cf: 'story_views_layer160',
+    0xc64c0b97: 'story_views_layer161',
+    0x8d595cd6: 'story_views',
+    0x59d78fc5: 'story_views_list',
+    0x46e9b9ec: 'story_views_list_layer167',
+    0x028f1114: 'theme_layer131',
+    0xf7d90ce0: 'theme_layer106',
+    0x483d270c: 'theme_document_not_modified_layer106',
+    0xa00e67d6: 'theme',
+    0xe802b8dc: 'theme_layer133',
+    0xfa58b6d4: 'theme_settings',
+    0x8db4e76c: 'theme_settings_layer132',
+    0x9c14984a: 'theme_settings_layer131',
+    0x161d9628: 'top_peer_category_channels',
+    0x1e76a78c: 'top_peer_category_phone_calls',
+    0xbd17a14a: 'top_peer_category_groups',
+    0x148677e2: 'top_peer_category_bots_inline',
+    0xa8406ca9: 'top_peer_category_forward_users',
+    0xfbeec0f0: 'top_peer_category_forward_chats',
+    0xab661b5b: 'top_peer_category_bots_pm',
+    0x0637b7ed: 'top_peer_category_correspondents',
+    0xfd9e7bec: 'top_peer_category_bots_app',
+    0x24f40e77: 'update_message_poll_vote',
+    0xd5a41724: 'update_message_extended_media',
+    0xaca1657b: 'update_message_poll',
+    0xbb9bb9a5: 'update_peer_history_ttl',
+    0xf89a6a4e: 'update_chat',
+    0xa20db0e5: 'update_delete_messages',
+    0x5bb98608: 'update_pinned_channel_messages',
+    0xf2ebdb4e: 'update_group_call_participants',
+    0x571d2742: 'update_read_featured_stickers',
+    0x1710f156: 'update_encrypted_chat_typing',
+    0xd6b19546: 'update_read_channel_discussion_inbox',
+    0x2f2f21bf: 'update_read_history_outbox',
+    0x62ba04d9: 'update_new_channel_message',
+    0x1592b79d: 'update_web_view_result_sent',
+    0x6e6fe51c: 'update_dialog_pinned',
+    0x6a7e7366: 'update_peer_settings',
+    0x05492a13: 'update_user_phone',
+    0x4e90bfd6: 'update_message_id',
+    0xb75f99a9: 'update_read_channel_outbox',
+    0x8c88c923: 'update_channel_user_typing',
+    0x1bf335b9: 'update_story_id',
+    0x31c24808: 'update_sticker_sets',
+    0x19360dc0: 'update_folder_peers',
+    0x1f2b0afd: 'update_new_message',
+    0x39a51dfb: 'update_new_scheduled_message',
+    0x12bcbd9a: 'update_new_encrypted_message',
+    0x86fccf85: 'update_move_sticker_set_to_top',
+    0xe5bdf8de: 'update_user_status',
+    0x28373599: 'update_user_emoji_status',
+    0xf226ac08: 'update_channel_message_views',
+    0x0b783982: 'update_group_call_connection',
+    0x4d712f2e: 'update_bot_commands',
+    0x871fb939: 'update_geo_live_viewed',
+    0xbec268ef: 'update_notify_settings',
+    0x985d3abb: 'update_channel_participant',
+    0x695c9e7c: 'update_read_channel_discussion_outbox',
+    0xe32f3d77: 'update_chat_participant_delete',
+    0xfb4c496c: 'update_read_featured_emoji_stickers',
+    0xe40370a3: 'update_edit_message',
+    0x6f7863f4: 'update_recent_reactions',
+    0x39c67432: 'update_saved_reaction_tags',
+    0x7f891213: 'update_web_page',
+    0xe511996d: 'update_faved_stickers',
+    0x3dda5451: 'update_chat_participant_add',
+    0x83487af0: 'update_chat_user_typing',
+    0x564fe691: 'update_login_token',
+    0xb4a2e88d: 'update_encryption',
+    0x97d64341: 'update_group_call',
+    0x108d941f: 'update_channel_too_long',
+    0xc01e857f: 'update_user_typing',
+    0xf74e932b: 'stories_update_read_stories',
+    0xebe46819: 'update_service_notification',
+    0x56022f4d: 'update_lang_pack',
+    0xb23fc698: 'update_channel_available_messages',
+    0xd7ca61a2: 'update_chat_participant_admin',
+    0xea29055d: 'update_channel_read_messages_contents',
+    0xee3b272a: 'update_privacy',
+    0xa229dd06: 'update_config',
+    0xe16459c3: 'update_dialog_unread_mark',
+    0x1b49ec6d: 'update_draft_message',
+    0x8951abef: 'update_new_authorization',
+    0xa7848924: 'update_user_name',
+    0x5e1b3cb8: 'update_message_reactions',
+    0xab0f6b1e: 'update_phone_call',
+    0x26ffde7d: 'update_dialog_filter',
+    0xebe07752: 'update_peer_blocked',
+    0xed85eab5: 'update_pinned_messages',
+    0x2661bf09: 'update_phone_call_signaling_data',
+    0x88617090: 'update_transcribe_audio',
+    0xfa0f3ca2: 'update_pinned_dialogs',
+    0x74d8be99: 'update_saved_ringtones',
+    0x2c084dc1: 'stories_update_stories_stealth_mode',
+    0x0084cd5a: 'update_transcribed_audio',
+    0xb4afcfb0: 'update_peer_located',
+    0x9a422c20: 'update_recent_stickers',
+    0x9c974fdf: 'update_read_history_inbox',
+    0xa5d72105: 'update_dialog_filter_order',
+    0x9375341e: 'update_saved_gifs',
+    0x7084a7be: 'update_contacts_reset',
+    0x635b4c09: 'update_channel',
+    0x2f2ba99f: 'update_channel_web_page',
+    0xf2a71983: 'update_delete_scheduled_messages',
+    0xd29a27f4: 'update_channel_message_forwards',
+    0xc32d5b12: 'update_delete_channel_messages',
+    0x7d627683: 'update_sent_story_reaction',
+    0xf227868c: 'update_user_photo',
+    0x20529438: 'update_user',
+    0x17b7a20b: 'update_attach_menu_bots',
+    0x3504914f: 'update_dialog_filters',
+    0x30f443db: 'update_recent_emoji_statuses',
+    0x75b3b798: 'stories_update_story',
+    0x7063c3db: 'update_pending_join_requests',
+    0x8e5e9873: 'update_dc_options',
+    0x1b3f4df7: 'update_edit_channel_message',
+    0x688a30aa: 'update_new_sticker_set',
+    0x8216fba3: 'update_theme',
+    0x46560264: 'update_lang_pack_too_long',
+    0x38fe25b7: 'update_encrypted_messages_read',
+    0x0bb2d201: 'update_sticker_sets_order',
+    0x922e6e10: 'update_read_channel_inbox',
+    0xf8227181: 'update_read_messages_contents',
+    0x07761198: 'update_chat_participants',
+    0x54c01850: 'update_chat_default_banned_rights',
+    0x14b85813: 'bots_update_bot_menu_button',
+    0xfe198602: 'update_channel_pinned_topics',
+    0x192efbe3: 'update_channel_pinned_topic',
+    0x07b68920: 'update_channel_view_forum_as_messages',
+    0xae3f101d: 'update_peer_wallpaper',
+    0xaeaf9e74: 'update_saved_dialog_pinned',
+    0x686c85a6: 'update_pinned_saved_dialogs',
+    0xf9470ab2: 'update_quick_replies',
+    0xf53da717: 'update_new_quick_reply',
+    0x53e6f1ec: 'update_delete_quick_reply',
+    0x3e050d0f: 'update_quick_reply_message',
+    0x566fe7cd: 'update_delete_quick_reply_messages',
+    0x1824e40b: 'update_new_story_reaction',
+    0xdfd961f5: 'update_broadcast_revenue_transactions',
+    0x4e80a379: 'update_stars_balance',
+    0xa584b019: 'update_stars_revenue_status',
+    0x283bd312: 'update_bot_purchased_paid_media',
+    0x8b725fce: 'update_paid_reaction_privacy',
+    0xa8ae3eb1: 'update_bot_subscription_expire',
+    0x0fb85198: 'update_stars_balance_layer194',
+    0x14b24500: 'update_group_call',
+    0x18b7a10d: 'dc_option',
+    0x5a73a98c: 'update_message_extended_media',
+    0x6056dba5: 'stars_saved_star_gift',
+    0x767cde44: 'update_star_gift_upgraded',
+    0x90866cee: 'update_delete_scheduled_messages',
+    0xbbb6b4a3: 'stars_amount',
+    0xccf08ad6: 'update_group_invite_privacy_forbidden',
+    0xe9baa668: 'folder_peer',
+    0xf385c1f6: 'lang_pack_difference',
+    0xfebe5491: 'stars_revenue_status',
+    0x74ae4240: 'updates',
+    0x313bc7f8: 'update_short_message',
+    0x9015e101: 'update_short_sent_message',
+    0x78d4dec1: 'update_short',
+    0x4d6deea5: 'update_short_chat_message',
+    0x725b04c3: 'updates_combined',
+    0xe317af7e: 'updates_too_long',
+    0x03173d78: 'updates_get_channel_difference',
+    0x25939651: 'updates_get_difference',
+    0xedd4882a: 'updates_get_state',
+    0x3e11affb: 'updates_channel_difference_empty',
+    0x2064674e: 'updates_channel_difference',
+    0xa4bcc6fe: 'updates_channel_difference_too_long',
+    0x00f49ca0: 'updates_difference',
+    0xa8fb1981: 'updates_difference_slice',
+    0x4afe8f6d: 'updates_difference_too_long',
+    0x5d75a138: 'updates_difference_empty',
+    0xa56c2a3e: 'updates_state',
+    0x21e753bc: 'upload_web_file',
+    0x24e6818d: 'upload_get_web_file',
+    0x395f69da: 'upload_get_cdn_file',
+    0x91dc3f31: 'upload_get_cdn_file_hashes',
+    0x9b2754a8: 'upload_reupload_cdn_file',
+    0xb304a621: 'upload_save_file_part',
+    0xbe5335be: 'upload_get_file',
+    0xc7025931: 'upload_get_file_hashes',
+    0xde7b673d: 'upload_save_big_file_part',
+    0xa99fca4f: 'upload_cdn_file',
+    0xeea8e46e: 'upload_cdn_file_reupload_needed',
+    0x096a18d5: 'upload_file',
+    0xf18cda44: 'upload_file_cdn_redirect',
+    0xf39b035c: 'file_hash',
+    0xa9d6db1f: 'url_auth_result_default',
+    0x92d33a0e: 'url_auth_result_request',
+    0x8f8c0e4e: 'url_auth_result_accepted',
+    0x020b1422: 'user',
+    0x4b46c37e: 'user_layer199',
+    0x59476956: 'user_layer196_2',
+    0x685f5e21: 'user_layer196_1',
+    0x83314fca: 'user_layer195',
+    0x4fe9cce0: 'user_layer185',
+    0x215c4438: 'user_layer184',
+    0xeb602f25: 'user_layer166',
+    0xcab35e18: 'user_contact_old2',
+    0xf2fb8319: 'user_contact_old',
+    0xd3bc4b7a: 'user_empty',
+    0xabb5f120: 'user_layer165',
+    0x8f97c628: 'user_layer159',
+    0x5d99adee: 'user_layer147',
+    0x3ff6ecb0: 'user_layer144',
+    0x938458c1: 'user_layer131',
+    0x2e13f4c3: 'user_layer104',
+    0x720535ec: 'user_self_old',
+    0x1c60e608: 'user_self_old3',
+    0xd6016d7a: 'user_deleted_old2',
+    0x200250ba: 'user_empty_layer131',
+    0x22e8ceb0: 'user_request_old',
+    0x5214c89d: 'user_foreign_old',
+    0x075cf7a8: 'user_foreign_old2',
+    0xd9ccc4ef: 'user_request_old2',
+    0xb29ad7cc: 'user_deleted_old',
+    0xd10d979a: 'user_layer65',
+    0x22e49072: 'user_old',
+    0x7007b451: 'user_self_old2',
+    0xb4073647: 'username',
+    0xb54b5acf: 'peer_color',
+    0xd2234ea0: 'user_full',
+    0x8555f3c2: 'user_full_layer199_2',
+    0x4d975bbc: 'user_full_layer199',
+    0x979d2376: 'user_full_layer195',
+    0x1f58e369: 'user_full_layer194',
+    0xcc997720: 'user_full_layer188',
+    0xecdadceb: 'user_full_layer176_3',
+    0x670bbc9c: 'user_full_layer176_2',
+    0x22ff3e85: 'user_full_layer176',
+    0xb9b12c6c: 'user_full_layer175',
+    0x4fe1cc86: 'user_full_layer162',
+    0x93eadb53: 'user_full_layer159',
+    0xf8d32aed: 'user_full_layer156',
+    0xec6d41e3: 'user_full_layer150_rev2',
+    0xc4b1fc3f: 'user_full_layer150',
+    0x8c72ea81: 'user_full_layer143',
+    0xcf366521: 'user_full_layer139',
+    0xd697ff05: 'user_full_layer134',
+    0x139a9a77: 'user_full_layer131',
+    0x745559cc: 'user_full_layer101',
+    0x8ea4a881: 'user_full_layer98',
+    0xedf17c12: 'user_full_layer123',
+    0x120b1ab9: 'account_business_weekly_open',
+    0x21108ff7: 'account_business_recipients',
+    0x3ace484c: 'contacts_link_layer101',
+    0x5a0a066d: 'account_business_intro',
+    0x8c92b098: 'account_business_work_hours',
+    0xac5c1af7: 'business_location',
+    0xdd0c66f2: 'payments_star_ref_program',
+    0xe519abab: 'account_business_greeting_message',
+    0xef156a5c: 'account_business_away_message',
+    0xf93cd45c: 'bot_verification',
+    0x69d3ab26: 'user_profile_photo_layer126',
+    0xecd75d8c: 'user_profile_photo_layer115',
+    0x4f11bae1: 'user_profile_photo_empty',
+    0xd559d8c8: 'user_profile_photo_layer97',
+    0x990d1493: 'user_profile_photo_old',
+    0xcc656077: 'user_profile_photo_layer127',
+    0x82d1f706: 'user_profile_photo',
+    0x008c703f: 'user_status_offline',
+    0x541a1d1a: 'user_status_last_week',
+    0x07bf09fc: 'user_status_last_week_layer171',
+    0x09d05049: 'user_status_empty',
+    0x65899777: 'user_status_last_month',
+    0x77ebc742: 'user_status_last_month_layer171',
+    0xedb93949: 'user_status_online',
+    0x7b197dc8: 'user_status_recently',
+    0xe26f42f1: 'user_status_recently_layer171',
+    0xcf7d64b1: 'user_status_hidden',
+    0x62d706b8: 'users',
+    0x315a4974: 'users_slice',
+    0x0d91a548: 'users_get_users',
+    0x3b6d152e: 'users_user_full',
+    0xa622aa10: 'users_get_is_premium_required_to_contact',
+    0xb60f5918: 'users_get_full_user',
+    0xee9f4a4d: 'video_old3',
+    0xf72887d3: 'video_layer45',
+    0x55555553: 'video_encrypted',
+    0x5a04a49f: 'video_old',
+    0x388fa391: 'video_old2',
+    0xc10658a8: 'video_empty_layer45',
+    0x435bb987: 'video_size_layer115',
+    0xe831c556: 'video_size_layer127',
+    0xde33b094: 'video_size',
+    0x0da082fe: 'video_size_sticker_markup',
+    0xf85c413c: 'video_size_emoji_markup',
+    0xa437c3ed: 'wall_paper',
+    0xf04f91ec: 'wall_paper_layer94',
+    0x8af40b25: 'wall_paper_no_file_layer128',
+    0xe0804116: 'wall_paper_no_file',
+    0xa12f40b8: 'wall_paper_settings_layer106',
+    0x05086cf8: 'wall_paper_settings_layer128',
+    0x1dc1bca4: 'wall_paper_settings_layer167',
+    0x372efcd0: 'wall_paper_settings',
+    0x0c14557c: 'web_view_result_url',
+    0x0c94511c: 'web_view_message_sent',
+    0x4d22ff98: 'web_view_result_url',
+    0x890c3d89: 'input_bot_inline_message_id',
+    0xf9c8bcc6: 'web_document_no_proxy',
+    0xc61acbd8: 'web_document_layer81',
+    0x1c570ed1: 'web_document',
+    0xe89c45b2: 'web_page',
+    0xfa64e172: 'web_page_layer107',
+    0x5f07b4bc: 'web_page_layer104',
+    0xa31ea0b5: 'web_page_old',
+    0x211a1788: 'web_page_empty',
+    0xeb1477e8: 'web_page_empty_layer165',
+    0xd41a5167: 'web_page_url_pending',
+    0x7311ca11: 'web_page_not_modified',
+    0xb0d13e47: 'web_page_pending',
+    0xc586da1c: 'web_page_pending_layer165',
+    0x85849473: 'web_page_not_modified_layer110',
+    0xca820ed7: 'web_page_layer58',
+    0x54b56617: 'web_page_attribute_theme',
+    0x939a4671: 'web_page_attribute_story_layer162',
+    0x2e94c3e7: 'web_page_attribute_story',
+    0x50cc03d3: 'web_page_attribute_sticker_set',
+    0xcf6f6db8: 'web_page_attribute_unique_star_gift',
+}
+
+GROUPS = {
+    'struct_0x0194cb3b': 'account',
+    'struct_0x032da4cf': 'account',
+    'struct_0x06dd654c': 'account',
+    'struct_0x07967d36': 'account',
+    'struct_0x08fc711d': 'account',
+    'struct_0x09c469cd': 'account',
+    'struct_0x0f578105': 'account',
+    'struct_0x114ff30d': 'account',
+    'struct_0x11679fa7': 'account',
+    'struct_0x12b3ad31': 'account',
+    'struct_0x1527bcac': 'account',
+    'struct_0x17d7f87b': 'account',
+    'struct_0x18201aae': 'account',
+    'struct_0x182e6d6f': 'account',
+    'struct_0x187fa0ca': 'account',
+    'struct_0x1b3faa88': 'account',
+    'struct_0x1c3db333': 'account',
+    'struct_0x1d998733': 'account',
+    'struct_0x1e109708': 'account',
+    'struct_0x1edaaac2': 'account',
+    'struct_0x2442485e': 'account',
+    'struct_0x2714d86c': 'account',
+    'struct_0x2d01b9ef': 'account',
+    'struct_0x316ce548': 'account',
+    'struct_0x33f0ea47': 'account',
+    'struct_0x35a9e0d5': 'account',
+    'struct_0x38df3532': 'account',
+    'struct_0x3dea5b03': 'account',
+    'struct_0x3e0bdd7c': 'account',
+    'struct_0x40f48462': 'account',
+    'struct_0x418d4e0b': 'account',
+    'struct_0x43d8521d': 'account',
+    'struct_0x449e0b51': 'account',
+    'struct_0x4b00e066': 'account',
+    'struct_0x4bff8ea0': 'account',
+    'struct_0x4c9409f6': 'account',
+    'struct_0x4dd3a7f6': 'account',
+    'struct_0x4ea4c80f': 'account',
+    'struct_0x50a04e45': 'account',
+    'struct_0x53577479': 'account',
+    'struct_0x548a30f5': 'account',
+    'struct_0x5492e5ee': 'account',
+    'struct_0x56da0b3f': 'account',
+    'struct_0x56e34970': 'account',
+    'struct_0x570d6f6f': 'account',
+    'struct_0x57e28221': 'account',
+    'struct_0x58d6b376': 'account',
+    'struct_0x5cb367d5': 'account',
+    'struct_0x5e437ed9': 'account',
+    'struct_0x5f2178c3': 'account',
+    'struct_0x60073674': 'account',
+    'struct_0x63cacf26': 'account',
+    'struct_0x646e1097': 'account',
+    'struct_0x65ad71dc': 'account',
+    'struct_0x6628562c': 'account',
+    'struct_0x66cdafc4': 'account',
+    'struct_0x682d2594': 'account',
+    'struct_0x6a0d3206': 'account',
+    'struct_0x6c5a5b37': 'account',
+    'struct_0x6c8e1e06': 'account',
+    'struct_0x6f688aa7': 'account',
+    'struct_0x6f70dde1': 'account',
+    'struct_0x6f8b32aa': 'account',
+    'struct_0x70c32edb': 'account',
+    'struct_0x7206e458': 'account',
+    'struct_0x73665bc2': 'account',
+    'struct_0x76f36233': 'account',
+    'struct_0x7727a7d5': 'account',
+    'struct_0x78515775': 'account',
+    'struct_0x7a7f2a15': 'account',
+    'struct_0x7ae43737': 'account',
+    'struct_0x7cefa15d': 'account',
+    'struct_0x811f854f': 'account',
+    'struct_0x82574ae5': 'account',
+    'struct_0x831a83a2': 'account',
+    'struct_0x832175e0': 'account',
+    'struct_0x8432c21f': 'account',
+    'struct_0x84be5b93': 'account',
+    'struct_0x8851e68e': 'account',
+    'struct_0x899fe31d': 'account',
+    'struct_0x8aeabec3': 'account',
+    'struct_0x8b9b4dae': 'account',
+    'struct_0x8c3410af': 'account',
+    'struct_0x8d9d742b': 'account',
+    'struct_0x8fde504f': 'account',
+    'struct_0x8fdf1920': 'account',
+    'struct_0x915860ae': 'account',
+    'struct_0x9308ce1b': 'account',
+    'struct_0x98e037bb': 'account',
+    'struct_0x9a23af21': 'account',
+    'struct_0x9a5c33e5': 'account',
+    'struct_0x9c2d527d': 'account',
+    'struct_0x9cd4eaf9': 'account',
+    'struct_0x9e6b131a': 'account',
+    'struct_0x9f07c728': 'account',
+    'struct_0xa26a7fa5': 'account',
+    'struct_0xa59b102f': 'account',
+    'struct_0xa5a356f9': 'account',
+    'struct_0xa60ab9ce': 'account',
+    'struct_0xa614d034': 'account',
+    'struct_0xa6f8f452': 'account',
+    'struct_0xa929597a': 'account',
+    'struct_0xad01d61d': 'account',
+    'struct_0xad253d78': 'account',
+    'struct_0xad2e1cd8': 'account',
+    'struct_0xb288bc7d': 'account',
+    'struct_0xb4ae666f': 'account',
+    'struct_0xb53e8b21': 'account',
+    'struct_0xb574b16b': 'account',
+    'struct_0xb880bc4b': 'account',
+    'struct_0xb88cf373': 'account',
+    'struct_0xb8d0afdf': 'account',
+    'struct_0xb9d9a38d': 'account',
+    'struct_0xbaa57628': 'account',
+    'struct_0xbb3b9804': 'account',
+    'struct_0xbd068601': 'account',
+    'struct_0xbf899aa0': 'account',
+    'struct_0xc1cbd5b6': 'account',
+    'struct_0xc4e5921e': 'account',
+    'struct_0xc5ba3d86': 'account',
+    'struct_0xc9d8df1c': 'account',
+    'struct_0xc9f81ce8': 'account',
+    'struct_0xcacb6ae2': 'account',
+    'struct_0xcc6e0c11': 'account',
+    'struct_0xcff43f61': 'account',
+    'struct_0xd638de89': 'account',
+    'struct_0xd6753386': 'account',
+    'struct_0xd89a83a3': 'account',
+    'struct_0xd94305e0': 'account',
+    'struct_0xdadbc950': 'account',
+    'struct_0xdaeda864': 'account',
+    'struct_0xdb21d0a7': 'account',
+    'struct_0xdb64fd34': 'account',
+    'struct_0xdb7e1747': 'account',
+    'struct_0xdd853661': 'account',
+    'struct_0xdf77f3bc': 'account',
+    'struct_0xe1902288': 'account',
+    'struct_0xe2750328': 'account',
+    'struct_0xe320c158': 'account',
+    'struct_0xeb2b4cf6': 'account',
+    'struct_0xec43a2d1': 'account',
+    'struct_0xec86017a': 'account',
+    'struct_0xed1ecdb0': 'account',
+    'struct_0xed56c9fc': 'account',
+    'struct_0xef500eab': 'account',
+    'struct_0xf1266f38': 'account',
+    'struct_0xf257106c': 'account',
+    'struct_0xf3ed4c73': 'account',
+    'struct_0xfa8cc6f5': 'account',
+    'struct_0xfbd3de6b': 'account',
+    'struct_0xfc8ddbea': 'account',
+    'struct_0xfeed5769': 'account',
+    'struct_0xc9b9e2b9': 'account_business_away_message_schedule',
+    'struct_0xc3f2f501': 'account_business_away_message_schedule',
+    'struct_0xcc4d9ecc': 'account_business_away_message_schedule',
+    'account_business_away_message_schedule_structures': 'account_business_away_message_schedule',
+    'struct_0x2b96cd1b': 'account_email_verified',
+    'struct_0xe1bb0d61': 'account_email_verified',
+    'account_email_verified_structures': 'account_email_verified',
+    'struct_0xd08ce645': 'account_emoji_statuses',
+    'struct_0x90c467d1': 'account_emoji_statuses',
+    'account_emoji_statuses_structures': 'account_emoji_statuses',
+    'struct_0x957b50fb': 'account_password',
+    'struct_0x185b184f': 'account_password',
+    'account_password_structures': 'account_password',
+    'struct_0xbac3a61a': 'account_reaction_notifications_from',
+    'struct_0x4b9e22a0': 'account_reaction_notifications_from',
+    'account_reaction_notifications_from_structures': 'account_reaction_notifications_from',
+    'struct_0x050a9839': 'account_requirement_to_contact',
+    'struct_0xe581e4e9': 'account_requirement_to_contact',
+    'struct_0xb4f67e93': 'account_requirement_to_contact',
+    'account_requirement_to_contact_structures': 'account_requirement_to_contact',
+    'struct_0xe3779861': 'account_reset_password_result',
+    'struct_0xe9effc7d': 'account_reset_password_result',
+    'struct_0xe926d63e': 'account_reset_password_result',
+    'account_reset_password_result_structures': 'account_reset_password_result',
+    'struct_0x1f307eb7': 'account_saved_ringtone',
+    'struct_0xb7263f6d': 'account_saved_ringtone',
+    'account_saved_ringtone_structures': 'account_saved_ringtone',
+    'struct_0xfbf6e8b1': 'account_saved_ringtones',
+    'struct_0xc1e92cc5': 'account_saved_ringtones',
+    'account_saved_ringtones_structures': 'account_saved_ringtones',
+    'struct_0x9a3d8c6d': 'account_themes',
+    'struct_0xf41eb622': 'account_themes',
+    'account_themes_structures': 'account_themes',
+    'struct_0x1c199183': 'account_wall_papers',
+    'struct_0xcdc3858c': 'account_wall_papers',
+    'account_wall_papers_structures': 'account_wall_papers',
+    'struct_0x3c1b4f0d': 'app',
+    'struct_0x93bf667f': 'attach',
+    'struct_0xd90d8dfe': 'attach_menu_bot',
+    'struct_0xc8aa2cd2': 'attach_menu_bot',
+    'struct_0xe93cb772': 'attach_menu_bot',
+    'attach_menu_bot_structures': 'attach_menu_bot',
+    'struct_0x4576f3f0': 'attach_menu_bot',
+    'struct_0xb2a7386b': 'attach_menu_bot',
+    'struct_0xf1d88a5c': 'attach_menu_bots',
+    'struct_0x3c4301c0': 'attach_menu_bots',
+    'attach_menu_bots_structures': 'attach_menu_bots',
+    'struct_0xc32bfa1a': 'attach_menu_peer_type',
+    'struct_0xf146d31f': 'attach_menu_peer_type',
+    'struct_0x7bfbdefc': 'attach_menu_peer_type',
+    'struct_0x0509113f': 'attach_menu_peer_type',
+    'struct_0x7d6be90e': 'attach_menu_peer_type',
+    'attach_menu_peer_type_structures': 'attach_menu_peer_type',
+    'struct_0x586988d8': 'audio',
+    'struct_0xf9e35055': 'audio',
+    'struct_0x427425e7': 'audio',
+    'struct_0x555555f6': 'audio',
+    'struct_0xc7ac6496': 'audio',
+    'audio_structures': 'audio',
+    'struct_0x0d36bf79': 'auth',
+    'struct_0x137948a5': 'auth',
+    'struct_0x1f040578': 'auth',
+    'struct_0x37096c70': 'auth',
+    'struct_0x3e72ba19': 'auth',
+    'struct_0x3ef1a9bf': 'auth',
+    'struct_0x7e960193': 'auth',
+    'struct_0x80eee427': 'auth',
+    'struct_0x89464b50': 'auth',
+    'struct_0x8d52a951': 'auth',
+    'struct_0x8e39261e': 'auth',
+    'struct_0x95ac5ce4': 'auth',
+    'struct_0x9fab0d1a': 'auth',
+    'struct_0xa57a7dad': 'auth',
+    'struct_0xa677244f': 'auth',
+    'struct_0xb434e2b8': 'auth',
+    'struct_0xb7e085fe': 'auth',
+    'struct_0xbcd51581': 'auth',
+    'struct_0xc23727c9': 'auth',
+    'struct_0xc3a2835f': 'auth',
+    'struct_0xcae47523': 'auth',
+    'struct_0xcb9deff6': 'auth',
+    'struct_0xd18b4d16': 'auth',
+    'struct_0xd897bc66': 'auth',
+    'struct_0xe5bfffcd': 'auth',
+    'struct_0xe894ad4d': 'auth',
+    'struct_0x44747e9a': 'auth_authorization',
+    'struct_0x33fb7bb8': 'auth_authorization',
+    'struct_0x2ea2c0d4': 'auth_authorization',
+    'auth_authorization_structures': 'auth_authorization',
+    'struct_0x72a3158c': 'auth_code_type',
+    'struct_0x741cd3e3': 'auth_code_type',
+    'struct_0x226ccefb': 'auth_code_type',
+    'struct_0xd61ad6ee': 'auth_code_type',
+    'struct_0x06ed998c': 'auth_code_type',
+    'auth_code_type_structures': 'auth_code_type',
+    'struct_0x629f1980': 'auth_login_token',
+    'struct_0x068e9916': 'auth_login_token',
+    'struct_0x390d5c5e': 'auth_login_token',
+    'auth_login_token_structures': 'auth_login_token',
+    'struct_0x2390fe44': 'auth_sent_code',
+    'struct_0x5e002502': 'auth_sent_code',
+    'auth_sent_code_structures': 'auth_sent_code',
+    'struct_0x3dbb5986': 'auth_sent_code_type',
+    'struct_0x5353e5a7': 'auth_sent_code_type',
+    'struct_0xf450f59b': 'auth_sent_code_type',
+    'struct_0xa5491dea': 'auth_sent_code_type',
+    'struct_0xab03c6d9': 'auth_sent_code_type',
+    'struct_0x82006484': 'auth_sent_code_type',
+    'struct_0xc000bba2': 'auth_sent_code_type',
+    'struct_0xd9565c39': 'auth_sent_code_type',
+    'struct_0x009fd736': 'auth_sent_code_type',
+    'struct_0xa416ac81': 'auth_sent_code_type',
+    'struct_0xb37794af': 'auth_sent_code_type',
+    'auth_sent_code_type_structures': 'auth_sent_code_type',
+    'struct_0x5b11125a': 'base_theme',
+    'struct_0xb7b31ea8': 'base_theme',
+    'struct_0xc3a12462': 'base_theme',
+    'struct_0x6d5f77ee': 'base_theme',
+    'struct_0xfbd81688': 'base_theme',
+    'base_theme_structures': 'base_theme',
+    'struct_0x997275b5': 'bool',
+    'struct_0xbc799737': 'bool',
+    'bool_structures': 'bool',
+    'struct_0x5da674b7': 'bot_app',
+    'struct_0x95fcd1d6': 'bot_app',
+    'bot_app_structures': 'bot_app',
+    'struct_0xe4169b5d': 'bot_info',
+    'struct_0xbb2e37ce': 'bot_info',
+    'struct_0x98e81d3a': 'bot_info',
+    'struct_0x09cf585d': 'bot_info',
+    'struct_0x1b74b335': 'bot_info',
+    'struct_0x8f300b57': 'bot_info',
+    'struct_0x82437e74': 'bot_info',
+    'struct_0x36607333': 'bot_info',
+    'struct_0x4d8a0299': 'bot_info',
+    'bot_info_structures': 'bot_info',
+    'struct_0xb0cd6617': 'bot_info',
+    'struct_0xc27ac8c7': 'bot_info',
+    'struct_0xc99b1950': 'bot_info',
+    'struct_0x4366232e': 'bot_inline_message',
+    'struct_0x8a86659c': 'bot_inline_message',
+    'struct_0x3a8fd8b8': 'bot_inline_message',
+    'struct_0x764cf810': 'bot_inline_message',
+    'struct_0x0a74b15b': 'bot_inline_message',
+    'struct_0x35edb4d4': 'bot_inline_message',
+    'struct_0x18d1cdc2': 'bot_inline_message',
+    'struct_0x8c7f65e2': 'bot_inline_message',
+    'struct_0xb722de65': 'bot_inline_message',
+    'struct_0x051846fd': 'bot_inline_message',
+    'struct_0x354a9b09': 'bot_inline_message',
+    'struct_0x809ad9a6': 'bot_inline_message',
+    'bot_inline_message_structures': 'bot_inline_message',
+    'struct_0x11965f3a': 'bot_inline_result',
+    'struct_0x17db940b': 'bot_inline_result',
+    'bot_inline_result_structures': 'bot_inline_result',
+    'struct_0xc7b57ce6': 'bot_menu_button',
+    'struct_0x7533a588': 'bot_menu_button',
+    'struct_0x4258c205': 'bot_menu_button',
+    'bot_menu_button_structures': 'bot_menu_button',
+    'struct_0x053ca973': 'bots',
+    'struct_0x06de6392': 'bots',
+    'struct_0x087fc5e7': 'bots',
+    'struct_0x0ca71d64': 'bots',
+    'struct_0x10cf3123': 'bots',
+    'struct_0x1359f4e6': 'bots',
+    'struct_0x17aeb75a': 'bots',
+    'struct_0x1991b13b': 'bots',
+    'struct_0x23e91ba3': 'bots',
+    'struct_0x2d0135b3': 'bots',
+    'struct_0x423ab3ad': 'bots',
+    'struct_0x4504d54f': 'bots',
+    'struct_0x50077589': 'bots',
+    'struct_0x778b5ab3': 'bots',
+    'struct_0x7d748d04': 'bots',
+    'struct_0x8525606f': 'bots',
+    'struct_0x8b89dfbd': 'bots',
+    'struct_0x9709b1c2': 'bots',
+    'struct_0x9c60eb28': 'bots',
+    'struct_0xa1b70815': 'bots',
+    'struct_0xa2a5594d': 'bots',
+    'struct_0xb0711d83': 'bots',
+    'struct_0xb627f3aa': 'bots',
+    'struct_0xc2510192': 'bots',
+    'struct_0xdcd914fd': 'bots',
+    'struct_0xf132e3ef': 'bots',
+    'struct_0xc3ff71e7': 'broadcast_revenue_balances',
+    'struct_0x8438f1c6': 'broadcast_revenue_balances',
+    'broadcast_revenue_balances_structures': 'broadcast_revenue_balances',
+    'struct_0x278f2868': 'channel',
+    'struct_0xdb9f9140': 'channel_admin_log_event_action',
+    'struct_0xb1c3caa7': 'channel_admin_log_event_action',
+    'struct_0x46d840ab': 'channel_admin_log_event_action',
+    'struct_0xf92424d2': 'channel_admin_log_event_action',
+    'struct_0x2df5fc0a': 'channel_admin_log_event_action',
+    'struct_0xfe69018d': 'channel_admin_log_event_action',
+    'struct_0xf89777f2': 'channel_admin_log_event_action',
+    'struct_0x709b2405': 'channel_admin_log_event_action',
+    'struct_0xe90ebb59': 'channel_admin_log_event_action',
+    'struct_0x6a4afc38': 'channel_admin_log_event_action',
+    'struct_0x0e6b76ae': 'channel_admin_log_event_action',
+    'struct_0x434bd2af': 'channel_admin_log_event_action',
+    'struct_0xd5676710': 'channel_admin_log_event_action',
+    'struct_0x53909779': 'channel_admin_log_event_action',
+    'struct_0xfe9fc158': 'channel_admin_log_event_action',
+    'struct_0x410a134e': 'channel_admin_log_event_action',
+    'struct_0x8f079643': 'channel_admin_log_event_action',
+    'struct_0x5a50fca4': 'channel_admin_log_event_action',
+    'struct_0x26ae0971': 'channel_admin_log_event_action',
+    'struct_0x3e7f6847': 'channel_admin_log_event_action',
+    'struct_0x02cc6383': 'channel_admin_log_event_action',
+    'struct_0xf06fe208': 'channel_admin_log_event_action',
+    'struct_0x5d8d353b': 'channel_admin_log_event_action',
+    'struct_0xe6d83d7e': 'channel_admin_log_event_action',
+    'struct_0x183040d3': 'channel_admin_log_event_action',
+    'struct_0x5f5c95f1': 'channel_admin_log_event_action',
+    'struct_0xafb6144a': 'channel_admin_log_event_action',
+    'struct_0xe9e82c18': 'channel_admin_log_event_action',
+    'struct_0x56d6a247': 'channel_admin_log_event_action',
+    'struct_0xe31c34d8': 'channel_admin_log_event_action',
+    'struct_0x55188a2e': 'channel_admin_log_event_action',
+    'struct_0x23209745': 'channel_admin_log_event_action',
+    'struct_0xbe4e0ef8': 'channel_admin_log_event_action',
+    'struct_0x050c7ac8': 'channel_admin_log_event_action',
+    'struct_0x1b7907ae': 'channel_admin_log_event_action',
+    'struct_0xe64429c0': 'channel_admin_log_event_action',
+    'struct_0x42e047bb': 'channel_admin_log_event_action',
+    'struct_0xe6dfb825': 'channel_admin_log_event_action',
+    'struct_0x6e941a38': 'channel_admin_log_event_action',
+    'struct_0xcb2ac766': 'channel_admin_log_event_action',
+    'struct_0xf04fb3a9': 'channel_admin_log_event_action',
+    'struct_0x58707d28': 'channel_admin_log_event_action',
+    'struct_0xae168909': 'channel_admin_log_event_action',
+    'struct_0x64f36dfc': 'channel_admin_log_event_action',
+    'struct_0x3c2b247b': 'channel_admin_log_event_action',
+    'struct_0x445fc434': 'channel_admin_log_event_action',
+    'struct_0x5796e780': 'channel_admin_log_event_action',
+    'struct_0x5e477b25': 'channel_admin_log_event_action',
+    'struct_0x31bb5d52': 'channel_admin_log_event_action',
+    'struct_0x3ea9feb1': 'channel_admin_log_event_action',
+    'struct_0x60a79c79': 'channel_admin_log_event_action',
+    'struct_0x64642db3': 'channel_admin_log_event_action',
+    'channel_admin_log_event_action_structures': 'channel_admin_log_event_action',
+    'struct_0x67753ac8': 'channel_admin_log_event_action',
+    'struct_0xdcb118b7': 'channel_admin_log_event_action',
+    'struct_0xeba636fe': 'channel_admin_log_event_action',
+    'struct_0xbfb5ad8b': 'channel_location',
+    'struct_0x209b82db': 'channel_location',
+    'channel_location_structures': 'channel_location',
+    'struct_0x94d42ee7': 'channel_messages_filter',
+    'struct_0xcd77d957': 'channel_messages_filter',
+    'channel_messages_filter_structures': 'channel_messages_filter',
+    'struct_0x0ae30253': 'channel_messages_filter',
+    'struct_0x222c1886': 'channel_participant',
+    'struct_0x15ebac1d': 'channel_participant',
+    'struct_0x808d15a4': 'channel_participant',
+    'struct_0x447dca4b': 'channel_participant',
+    'struct_0xe3e2e1f9': 'channel_participant',
+    'struct_0xa3289a6d': 'channel_participant',
+    'struct_0x6df8014e': 'channel_participant',
+    'struct_0x34c3bb53': 'channel_participant',
+    'struct_0xcb397619': 'channel_participant',
+    'struct_0xc00c07c0': 'channel_participant',
+    'struct_0x2fe601d3': 'channel_participant',
+    'struct_0xccbebbaf': 'channel_participant',
+    'struct_0xa82fa898': 'channel_participant',
+    'struct_0x4f607bef': 'channel_participant',
+    'struct_0x35a8bfa7': 'channel_participant',
+    'struct_0x28a8bc67': 'channel_participant',
+    'struct_0x50a1dfd6': 'channel_participant',
+    'struct_0x98192d61': 'channel_participant',
+    'struct_0x1b03f006': 'channel_participant',
+    'struct_0x1c0facaf': 'channel_participant',
+    'struct_0x5daa6e23': 'channel_participant',
+    'struct_0xc3c6796b': 'channel_participant',
+    'struct_0x91057fef': 'channel_participant',
+    'struct_0x8cc5e69a': 'channel_participant',
+    'channel_participant_structures': 'channel_participant',
+    'struct_0xe04b5ceb': 'channel_participants_filter',
+    'struct_0xbb6ae88d': 'channel_participants_filter',
+    'struct_0xb4608969': 'channel_participants_filter',
+    'struct_0xa3b54985': 'channel_participants_filter',
+    'struct_0x0656ac4b': 'channel_participants_filter',
+    'struct_0xb0d1865b': 'channel_participants_filter',
+    'struct_0x1427a5e1': 'channel_participants_filter',
+    'struct_0xde3f3c79': 'channel_participants_filter',
+    'channel_participants_filter_structures': 'channel_participants_filter',
+    'struct_0x08736a09': 'channels',
+    'struct_0x0a245dd3': 'channels',
+    'struct_0x0a7f6bbb': 'channels',
+    'struct_0x0b290c69': 'channels',
+    'struct_0x0dc770ee': 'channels',
+    'struct_0x0de560d1': 'channels',
+    'struct_0x10e6bd2c': 'channels',
+    'struct_0x11e831ee': 'channels',
+    'struct_0x18afbc93': 'channels',
+    'struct_0x199f3a6c': 'channels',
+    'struct_0x1f69b606': 'channels',
+    'struct_0x1fad68cd': 'channels',
+    'struct_0x24b524c5': 'channels',
+    'struct_0x25a71742': 'channels',
+    'struct_0x2950a18f': 'channels',
+    'struct_0x33ddf480': 'channels',
+    'struct_0x34435f2d': 'channels',
+    'struct_0x3514b3de': 'channels',
+    'struct_0x367544db': 'channels',
+    'struct_0x3cd930b7': 'channels',
+    'struct_0x40582bb2': 'channels',
+    'struct_0x418d549c': 'channels',
+    'struct_0x43a0a7e2': 'channels',
+    'struct_0x4c2985b6': 'channels',
+    'struct_0x50f24105': 'channels',
+    'struct_0x566decd0': 'channels',
+    'struct_0x58e63f6d': 'channels',
+    'struct_0x68f3e4eb': 'channels',
+    'struct_0x6a6e7854': 'channels',
+    'struct_0x6c2d9026': 'channels',
+    'struct_0x77ced9d0': 'channels',
+    'struct_0x83b70d97': 'channels',
+    'struct_0x84c1fd4e': 'channels',
+    'struct_0x8f38cd1f': 'channels',
+    'struct_0x91006707': 'channels',
+    'struct_0x93d7b347': 'channels',
+    'struct_0x96e6cd81': 'channels',
+    'struct_0x9738bb15': 'channels',
+    'struct_0x9ae91519': 'channels',
+    'struct_0x9baa9647': 'channels',
+    'struct_0xa0ab6cc6': 'channels',
+    'struct_0xa4298b29': 'channels',
+    'struct_0xa850a693': 'channels',
+    'struct_0xad399cee': 'channels',
+    'struct_0xb0831eb9': 'channels',
+    'struct_0xb45ced1d': 'channels',
+    'struct_0xb81c7034': 'channels',
+    'struct_0xbeaedb94': 'channels',
+    'struct_0xc0111fe3': 'channels',
+    'struct_0xcc104937': 'channels',
+    'struct_0xd19f987b': 'channels',
+    'struct_0xd33c8902': 'channels',
+    'struct_0xd8aa3671': 'channels',
+    'struct_0xdfb80317': 'channels',
+    'struct_0xe4cb9580': 'channels',
+    'struct_0xe63fadeb': 'channels',
+    'struct_0xea107ae4': 'channels',
+    'struct_0xea8ca4f9': 'channels',
+    'struct_0xeab5dc38': 'channels',
+    'struct_0xeabbb94c': 'channels',
+    'struct_0xec210fbf': 'channels',
+    'struct_0xed8af74d': 'channels',
+    'struct_0xedd49ef0': 'channels',
+    'struct_0xf0d3e6a8': 'channels',
+    'struct_0xf12e57c9': 'channels',
+    'struct_0xf40c0224': 'channels',
+    'struct_0xf44a8315': 'channels',
+    'struct_0xf496b0c6': 'channels',
+    'struct_0xf4dfa185': 'channels',
+    'struct_0xf5dad378': 'channels',
+    'struct_0xf836aa95': 'channels',
+    'struct_0xf8b036af': 'channels',
+    'struct_0x9ab0feaf': 'channels_channel_participants',
+    'struct_0xf0173fe9': 'channels_channel_participants',
+    'channels_channel_participants_structures': 'channels_channel_participants',
+    'struct_0x846f9e42': 'channels_sponsored_message_report_result',
+    'struct_0x3e3bcf2f': 'channels_sponsored_message_report_result',
+    'struct_0xad798849': 'channels_sponsored_message_report_result',
+    'channels_sponsored_message_report_result_structures': 'channels_sponsored_message_report_result',
+    'struct_0x430d3150': 'channels_sponsored_message_report_result',
+    'struct_0x2d85832c': 'chat',
+    'struct_0x9ba2d800': 'chat',
+    'struct_0x07328bdb': 'chat',
+    'struct_0x4df30834': 'chat',
+    'struct_0x7482147e': 'chat',
+    'struct_0xe00998b7': 'chat',
+    'struct_0x46aeac06': 'chat',
+    'struct_0xfe4478bd': 'chat',
+    'struct_0x0aadfc8f': 'chat',
+    'struct_0x0db12acb': 'chat',
+    'struct_0xa636a3e2': 'chat',
+    'struct_0x8e87ccd8': 'chat',
+    'struct_0x1981ea7e': 'chat',
+    'struct_0x94f592db': 'chat',
+    'struct_0x450b7115': 'chat',
+    'struct_0x29562865': 'chat',
+    'struct_0x41cbf256': 'chat',
+    'struct_0xd31a961e': 'chat',
+    'struct_0x4b1b7506': 'chat',
+    'struct_0x678e9587': 'chat',
+    'struct_0x0cb44b1c': 'chat',
+    'struct_0x8537784f': 'chat',
+    'struct_0xd91cdd54': 'chat',
+    'struct_0xc88974ac': 'chat',
+    'struct_0x17d493d5': 'chat',
+    'struct_0x3bda1bde': 'chat',
+    'struct_0x289da732': 'chat',
+    'struct_0x7312bc48': 'chat',
+    'struct_0xa14dca52': 'chat',
+    'struct_0x83259464': 'chat',
+    'struct_0x8261ac61': 'chat',
+    'struct_0xfb0ccc41': 'chat',
+    'struct_0x6e9c9bc7': 'chat',
+    'struct_0x6592a1a7': 'chat',
+    'chat_structures': 'chat',
+    'struct_0x58cf4249': 'chat',
+    'struct_0x5d7ceba5': 'chat',
+    'struct_0x5fb224d5': 'chat',
+    'struct_0x9f120418': 'chat',
+    'struct_0xf041e250': 'chat',
+    'struct_0x2633421b': 'chat_full',
+    'struct_0x52d6806b': 'chat_full',
+    'struct_0x9ff3b858': 'chat_full',
+    'struct_0xbbab348d': 'chat_full',
+    'struct_0xc9d31138': 'chat_full',
+    'struct_0x44c054a7': 'chat_full',
+    'struct_0x680b773c': 'chat_full',
+    'struct_0x723027bd': 'chat_full',
+    'struct_0x0f2bcb6f': 'chat_full',
+    'struct_0xf2355507': 'chat_full',
+    'struct_0xd18ee226': 'chat_full',
+    'struct_0xea68a619': 'chat_full',
+    'struct_0xe13c3d20': 'chat_full',
+    'struct_0x56662e2e': 'chat_full',
+    'struct_0x59cff963': 'chat_full',
+    'struct_0x1c87a71a': 'chat_full',
+    'struct_0x03648977': 'chat_full',
+    'struct_0x2e02a614': 'chat_full',
+    'struct_0xef3a6acd': 'chat_full',
+    'struct_0xf0e6672a': 'chat_full',
+    'struct_0x2d895c74': 'chat_full',
+    'struct_0x10916653': 'chat_full',
+    'struct_0x9882e516': 'chat_full',
+    'struct_0x17f45fcf': 'chat_full',
+    'struct_0x76af5481': 'chat_full',
+    'struct_0x97bee562': 'chat_full',
+    'struct_0xc3d5512f': 'chat_full',
+    'struct_0x9e341ddf': 'chat_full',
+    'struct_0x0dc8c181': 'chat_full',
+    'struct_0xf3474af6': 'chat_full',
+    'struct_0x7a7de4f7': 'chat_full',
+    'struct_0xf06c4018': 'chat_full',
+    'struct_0x2548c037': 'chat_full',
+    'struct_0x8a1e2983': 'chat_full',
+    'struct_0x548c3f93': 'chat_full',
+    'struct_0x49a0a5d9': 'chat_full',
+    'struct_0x2f532f3c': 'chat_full',
+    'struct_0x4dbdc099': 'chat_full',
+    'struct_0xe9b27a17': 'chat_full',
+    'struct_0x1b7c9db3': 'chat_full',
+    'struct_0x22a235da': 'chat_full',
+    'struct_0xedd2a791': 'chat_full',
+    'struct_0x46a6ffb4': 'chat_full',
+    'struct_0xfab31aa3': 'chat_full',
+    'struct_0x95cb5f57': 'chat_full',
+    'struct_0xcbb62890': 'chat_full',
+    'chat_full_structures': 'chat_full',
+    'struct_0x5c9d3702': 'chat_invite',
+    'struct_0xfe65389d': 'chat_invite',
+    'struct_0xcde0ec40': 'chat_invite',
+    'struct_0x300c44c1': 'chat_invite',
+    'struct_0x61695cb0': 'chat_invite',
+    'struct_0x5a686d7c': 'chat_invite',
+    'chat_invite_structures': 'chat_invite',
+    'struct_0xe2d6e436': 'chat_participant',
+    'struct_0xa0933f5b': 'chat_participant',
+    'struct_0xc8d7493e': 'chat_participant',
+    'struct_0xda13538a': 'chat_participant',
+    'struct_0xc02d4007': 'chat_participant',
+    'struct_0xe46bcee4': 'chat_participant',
+    'chat_participant_structures': 'chat_participant',
+    'struct_0xfc900c2b': 'chat_participants',
+    'struct_0x3f460fed': 'chat_participants',
+    'struct_0x8763d3e1': 'chat_participants',
+    'struct_0x3cbc93f8': 'chat_participants',
+    'struct_0x7841b415': 'chat_participants',
+    'struct_0x0fd2bb8a': 'chat_participants',
+    'chat_participants_structures': 'chat_participants',
+    'struct_0x1c6e1c11': 'chat_photo',
+    'struct_0x475cdbd5': 'chat_photo',
+    'struct_0x37c1011c': 'chat_photo',
+    'struct_0x6153276a': 'chat_photo',
+    'struct_0xd20b9f3c': 'chat_photo',
+    'struct_0x4790ee05': 'chat_photo',
+    'chat_photo_structures': 'chat_photo',
+    'struct_0x661d4037': 'chat_reactions',
+    'struct_0xeafc32bc': 'chat_reactions',
+    'struct_0x52928bca': 'chat_reactions',
+    'chat_reactions_structures': 'chat_reactions',
+    'struct_0xfa87f659': 'chatlist_chatlist_invite',
+    'struct_0x1dcd839d': 'chatlist_chatlist_invite',
+    'chatlist_chatlist_invite_structures': 'chatlist_chatlist_invite',
+    'struct_0x0c5181ac': 'chatlists',
+    'struct_0x10ab6dc7': 'chatlists',
+    'struct_0x10e6e3a6': 'chatlists',
+    'struct_0x41c10fff': 'chatlists',
+    'struct_0x653db63d': 'chatlists',
+    'struct_0x66e486fb': 'chatlists',
+    'struct_0x719c5c5e': 'chatlists',
+    'struct_0x74fae13a': 'chatlists',
+    'struct_0x8472478e': 'chatlists',
+    'struct_0x89419521': 'chatlists',
+    'struct_0x93bd878d': 'chatlists',
+    'struct_0xa6b1e39a': 'chatlists',
+    'struct_0xce03da83': 'chatlists',
+    'struct_0xe089f8f5': 'chatlists',
+    'struct_0xf3e0da33': 'chatlists',
+    'struct_0xfdbcd714': 'chatlists',
+    'struct_0xcc1a241e': 'config',
+    'struct_0xe7e999e7': 'connected',
+    'struct_0x16d9703b': 'contact',
+    'struct_0xfeedd3ad': 'contact_link_layer101',
+    'struct_0xd502c2d0': 'contact_link_layer101',
+    'struct_0x5f4f9247': 'contact_link_layer101',
+    'contact_link_layer101_structures': 'contact_link_layer101',
+    'struct_0x096a0e00': 'contacts',
+    'struct_0x1013fd9e': 'contacts',
+    'struct_0x11f812d8': 'contacts',
+    'struct_0x13005788': 'contacts',
+    'struct_0x1ae373ac': 'contacts',
+    'struct_0x29a8962c': 'contacts',
+    'struct_0x2c800be5': 'contacts',
+    'struct_0x2e2e8734': 'contacts',
+    'struct_0x4fe196fe': 'contacts',
+    'struct_0x5ce14175': 'contacts',
+    'struct_0x5dd69e12': 'contacts',
+    'struct_0x725afbbc': 'contacts',
+    'struct_0x77d01c3b': 'contacts',
+    'struct_0x7f077ad9': 'contacts',
+    'struct_0x84e53737': 'contacts',
+    'struct_0x8514bdda': 'contacts',
+    'struct_0x879537f1': 'contacts',
+    'struct_0x8af94344': 'contacts',
+    'struct_0x94c65c76': 'contacts',
+    'struct_0x973478b6': 'contacts',
+    'struct_0x9a868f80': 'contacts',
+    'struct_0xb3134d9d': 'contacts',
+    'struct_0xb550d328': 'contacts',
+    'struct_0xc13e3c50': 'contacts',
+    'struct_0xc4a353ee': 'contacts',
+    'struct_0xd348bc44': 'contacts',
+    'struct_0xe8f463d0': 'contacts',
+    'struct_0xf392b7f4': 'contacts',
+    'struct_0xf831a20f': 'contacts',
+    'struct_0xf8654027': 'contacts',
+    'struct_0xf93ccba3': 'contacts',
+    'struct_0x0ade1591': 'contacts_blocked',
+    'struct_0xe1664194': 'contacts_blocked',
+    'contacts_blocked_structures': 'contacts_blocked',
+    'struct_0xe8fd8014': 'contacts_blocked',
+    'struct_0xb74ba9d2': 'contacts_contacts',
+    'struct_0xeae87e42': 'contacts_contacts',
+    'contacts_contacts_structures': 'contacts_contacts',
+    'struct_0x145ade0b': 'contacts_contacts',
+    'struct_0x70b772a8': 'contacts_top_peers',
+    'struct_0xb52c939d': 'contacts_top_peers',
+    'struct_0xde266ef5': 'contacts_top_peers',
+    'contacts_top_peers_structures': 'contacts_top_peers',
+    'struct_0xedcdc05b': 'contacts_top_peers',
+    'struct_0xfb834291': 'contacts_top_peers',
+    'struct_0x1be31789': 'decrypted',
+    'struct_0x204d3878': 'decrypted_message',
+    'struct_0x73164160': 'decrypted_message',
+    'struct_0xaa48327d': 'decrypted_message',
+    'struct_0x1f814f1f': 'decrypted_message',
+    'struct_0x91cc4674': 'decrypted_message',
+    'struct_0x36b091de': 'decrypted_message',
+    'decrypted_message_structures': 'decrypted_message',
+    'struct_0xa1733aec': 'decrypted_message_action',
+    'struct_0xf3048883': 'decrypted_message_action',
+    'struct_0x65614304': 'decrypted_message_action',
+    'struct_0xec2e0b9b': 'decrypted_message_action',
+    'struct_0xdd05ec6b': 'decrypted_message_action',
+    'struct_0x6719e45c': 'decrypted_message_action',
+    'struct_0xccb27641': 'decrypted_message_action',
+    'struct_0x6fe1735b': 'decrypted_message_action',
+    'struct_0x0c4f40be': 'decrypted_message_action',
+    'struct_0x511110b0': 'decrypted_message_action',
+    'struct_0xf3c9611b': 'decrypted_message_action',
+    'struct_0x8ac1f475': 'decrypted_message_action',
+    'struct_0xa82fdd63': 'decrypted_message_action',
+    'decrypted_message_action_structures': 'decrypted_message_action',
+    'struct_0x57e0a9cb': 'decrypted_message_media',
+    'struct_0x35480a59': 'decrypted_message_media',
+    'struct_0x588a0a97': 'decrypted_message_media',
+    'struct_0x089f5c4a': 'decrypted_message_media',
+    'struct_0x6abd9782': 'decrypted_message_media',
+    'struct_0x7afe8ae2': 'decrypted_message_media',
+    'struct_0xe50511d8': 'decrypted_message_media',
+    'struct_0xf1fa8d78': 'decrypted_message_media',
+    'struct_0x970c8c0e': 'decrypted_message_media',
+    'struct_0xb095434b': 'decrypted_message_media',
+    'struct_0x4cee6ef3': 'decrypted_message_media',
+    'struct_0x8a0df56f': 'decrypted_message_media',
+    'struct_0xfa95b0dd': 'decrypted_message_media',
+    'struct_0x524a415d': 'decrypted_message_media',
+    'struct_0x6080758f': 'decrypted_message_media',
+    'struct_0x32798a8c': 'decrypted_message_media',
+    'decrypted_message_media_structures': 'decrypted_message_media',
+    'struct_0x43b46b20': 'default',
+    'struct_0xd1da940c': 'delete',
+    'struct_0xd58a08c6': 'dialog',
+    'struct_0xa8edd0f5': 'dialog',
+    'struct_0x71bd134c': 'dialog',
+    'dialog_structures': 'dialog',
+    'struct_0x77744d4a': 'dialog',
+    'struct_0xff544e65': 'dialog',
+    'struct_0x363293ae': 'dialog_filter',
+    'struct_0xaa472651': 'dialog_filter',
+    'struct_0x5fb5523b': 'dialog_filter',
+    'struct_0x7438f7e8': 'dialog_filter',
+    'struct_0x96537bd7': 'dialog_filter',
+    'struct_0x9fe28ea4': 'dialog_filter',
+    'struct_0xd64a04a8': 'dialog_filter',
+    'dialog_filter_structures': 'dialog_filter',
+    'struct_0xe56dbf05': 'dialog_peer',
+    'struct_0x514519e2': 'dialog_peer',
+    'dialog_peer_structures': 'dialog_peer',
+    'struct_0x9ba29cc1': 'document',
+    'struct_0x59534e4c': 'document',
+    'struct_0x87232bc7': 'document',
+    'struct_0x55555556': 'document',
+    'struct_0x8fd4c4d8': 'document',
+    'struct_0x1e87342b': 'document',
+    'struct_0x9efc6326': 'document',
+    'struct_0x36f8c871': 'document',
+    'struct_0x55555558': 'document',
+    'struct_0xf9a39f4f': 'document',
+    'document_structures': 'document',
+    'struct_0x3a556302': 'document_attribute',
+    'struct_0x0ef02ce6': 'document_attribute',
+    'struct_0x051448e5': 'document_attribute',
+    'struct_0x6319d612': 'document_attribute',
+    'struct_0x11b58939': 'document_attribute',
+    'struct_0x15590068': 'document_attribute',
+    'struct_0x43c57c48': 'document_attribute',
+    'struct_0x17399fad': 'document_attribute',
+    'struct_0xd38ff1c2': 'document_attribute',
+    'struct_0x5910cccb': 'document_attribute',
+    'struct_0xded218e0': 'document_attribute',
+    'struct_0xfb0a5727': 'document_attribute',
+    'struct_0x9801d2f7': 'document_attribute',
+    'struct_0x994c9882': 'document_attribute',
+    'struct_0x6c37c15c': 'document_attribute',
+    'struct_0x9852f9c6': 'document_attribute',
+    'struct_0xfd149899': 'document_attribute',
+    'document_attribute_structures': 'document_attribute',
+    'struct_0xaed6dbb2': 'document_attribute',
+    'struct_0x1b0c841a': 'draft_message',
+    'struct_0xba4baec5': 'draft_message',
+    'struct_0xfd8e711f': 'draft_message',
+    'struct_0x3fccf7ef': 'draft_message',
+    'struct_0x2d65321f': 'draft_message',
+    'draft_message_structures': 'draft_message',
+    'struct_0x0589ee75': 'edit',
+    'struct_0x751f3146': 'edit',
+    'struct_0xba6705f0': 'edit',
+    'struct_0x922e55a9': 'email_verification',
+    'struct_0xdb909ec2': 'email_verification',
+    'struct_0x96d074fd': 'email_verification',
+    'email_verification_structures': 'email_verification',
+    'struct_0x4345be73': 'email_verify_purpose',
+    'struct_0x527d22eb': 'email_verify_purpose',
+    'struct_0xbbf51685': 'email_verify_purpose',
+    'email_verify_purpose_structures': 'email_verify_purpose',
+    'struct_0x5cc761bd': 'emoji',
+    'struct_0xa575739d': 'emoji',
+    'struct_0xb3fb5361': 'emoji',
+    'struct_0x7a9abda9': 'emoji_group',
+    'struct_0x80d26cc7': 'emoji_group',
+    'struct_0x093bcf34': 'emoji_group',
+    'emoji_group_structures': 'emoji_group',
+    'struct_0x236df622': 'emoji_keyword',
+    'struct_0xd5b3b9f9': 'emoji_keyword',
+    'emoji_keyword_structures': 'emoji_keyword',
+    'struct_0x7a1e11d1': 'emoji_list',
+    'struct_0x481eadfa': 'emoji_list',
+    'emoji_list_structures': 'emoji_list',
+    'struct_0x2de11aae': 'emoji_status',
+    'struct_0xe7ff068a': 'emoji_status',
+    'struct_0x7184603b': 'emoji_status',
+    'struct_0x07141dbf': 'emoji_status',
+    'struct_0x929b619d': 'emoji_status',
+    'struct_0xfa30a8c7': 'emoji_status',
+    'emoji_status_structures': 'emoji_status',
+    'struct_0xfda9a7b7': 'encrypted_chat',
+    'struct_0xc878527e': 'encrypted_chat',
+    'struct_0xfa56ce36': 'encrypted_chat',
+    'struct_0x62718a82': 'encrypted_chat',
+    'struct_0x6601d14f': 'encrypted_chat',
+    'struct_0xab7ec0a0': 'encrypted_chat',
+    'struct_0x3bf703dc': 'encrypted_chat',
+    'struct_0x13d6dd27': 'encrypted_chat',
+    'struct_0x1e1c7c45': 'encrypted_chat',
+    'struct_0x66b25953': 'encrypted_chat',
+    'struct_0x48f1d94c': 'encrypted_chat',
+    'struct_0x61f0d4c7': 'encrypted_chat',
+    'encrypted_chat_structures': 'encrypted_chat',
+    'struct_0xa8008cd8': 'encrypted_file',
+    'struct_0x4a70994c': 'encrypted_file',
+    'struct_0xc21f497e': 'encrypted_file',
+    'encrypted_file_structures': 'encrypted_file',
+    'struct_0x23734b06': 'encrypted_message',
+    'struct_0xed18c118': 'encrypted_message',
+    'encrypted_message_structures': 'encrypted_message',
+    'struct_0xc4b9f9bb': 'error',
+    'struct_0x41bf109b': 'exported',
+    'struct_0x5dab1af4': 'exported',
+    'struct_0xa22cbd96': 'exported_chat_invite',
+    'struct_0x0ab4a819': 'exported_chat_invite',
+    'struct_0xb18105e8': 'exported_chat_invite',
+    'struct_0x69df3769': 'exported_chat_invite',
+    'struct_0x6e24fc9d': 'exported_chat_invite',
+    'struct_0xfc2e05bc': 'exported_chat_invite',
+    'struct_0xed107ab7': 'exported_chat_invite',
+    'exported_chat_invite_structures': 'exported_chat_invite',
+    'struct_0x7c596b46': 'file_location',
+    'struct_0x53d69076': 'file_location',
+    'struct_0x091d11eb': 'file_location',
+    'struct_0xbc7fc6cd': 'file_location',
+    'struct_0x55555554': 'file_location',
+    'file_location_structures': 'file_location',
+    'struct_0x1c295881': 'folders',
+    'struct_0x6847d0ab': 'folders',
+    'struct_0xfbd2c296': 'folders',
+    'struct_0x023f109b': 'forum_topic',
+    'struct_0x5920d6dc': 'forum_topic',
+    'struct_0x71701da9': 'forum_topic',
+    'forum_topic_structures': 'forum_topic',
+    'struct_0x0296f104': 'geo_point',
+    'struct_0x2049d70c': 'geo_point',
+    'struct_0x1117dd5f': 'geo_point',
+    'struct_0xb2a2f663': 'geo_point',
+    'geo_point_structures': 'geo_point',
+    'struct_0xb9cdc5ee': 'get',
+    'struct_0x734c4ccb': 'global',
+    'struct_0x7780bcb4': 'group_call',
+    'struct_0xcdf8d3e3': 'group_call',
+    'struct_0xd597650c': 'group_call',
+    'group_call_structures': 'group_call',
+    'struct_0x038a08d3': 'help',
+    'struct_0x0e0310d7': 'help',
+    'struct_0x17c6b5f6': 'help',
+    'struct_0x18cb9f78': 'help',
+    'struct_0x1d1b1245': 'help',
+    'struct_0x1e251c95': 'help',
+    'struct_0x1fb33026': 'help',
+    'struct_0x2ca51fd1': 'help',
+    'struct_0x3dc0f114': 'help',
+    'struct_0x3fedc75f': 'help',
+    'struct_0x49b30240': 'help',
+    'struct_0x4d392343': 'help',
+    'struct_0x522d5a7d': 'help',
+    'struct_0x61e3f854': 'help',
+    'struct_0x66b91b70': 'help',
+    'struct_0x6f02f748': 'help',
+    'struct_0x735787a8': 'help',
+    'struct_0x8c05f1c9': 'help',
+    'struct_0x9010ef6f': 'help',
+    'struct_0x9cdf08cd': 'help',
+    'struct_0xabcfa9fd': 'help',
+    'struct_0xb81b93d4': 'help',
+    'struct_0xc0977421': 'help',
+    'struct_0xc4f9186b': 'help',
+    'struct_0xc661ad08': 'help',
+    'struct_0xd360e72c': 'help',
+    'struct_0xda80f42f': 'help',
+    'struct_0xec22cfcd': 'help',
+    'struct_0xee72f79a': 'help',
+    'struct_0xf50dbaa1': 'help',
+    'struct_0xdd18782e': 'help_app_config',
+    'struct_0x7cde641d': 'help_app_config',
+    'help_app_config_structures': 'help_app_config',
+    'struct_0xccbbce30': 'help_app_update',
+    'struct_0xc45a6536': 'help_app_update',
+    'help_app_update_structures': 'help_app_update',
+    'struct_0x93cc1f32': 'help_countries_list',
+    'struct_0x87d0759e': 'help_countries_list',
+    'help_countries_list_structures': 'help_countries_list',
+    'struct_0x4203c5ef': 'help_countries_list',
+    'struct_0xc3878e23': 'help_countries_list',
+    'struct_0x66afa166': 'help_deep_link_info',
+    'struct_0x6a4ee832': 'help_deep_link_info',
+    'help_deep_link_info_structures': 'help_deep_link_info',
+    'struct_0xbfb9f457': 'help_passport_config',
+    'struct_0xa098d6af': 'help_passport_config',
+    'help_passport_config_structures': 'help_passport_config',
+    'struct_0x26219a58': 'help_peer_color_set',
+    'struct_0x767d61eb': 'help_peer_color_set',
+    'help_peer_color_set_structures': 'help_peer_color_set',
+    'struct_0x2ba1f5ce': 'help_peer_colors',
+    'struct_0x00f8ed08': 'help_peer_colors',
+    'help_peer_colors_structures': 'help_peer_colors',
+    'struct_0xadec6ebe': 'help_peer_colors',
+    'struct_0x5334759c': 'help_premium_promo',
+    'struct_0x8a4f3c29': 'help_premium_promo',
+    'struct_0xe0360f1b': 'help_premium_promo',
+    'help_premium_promo_structures': 'help_premium_promo',
+    'struct_0x8c39793f': 'help_promo_data',
+    'struct_0x98f6ac75': 'help_promo_data',
+    'help_promo_data_structures': 'help_promo_data',
+    'struct_0x28ecf961': 'help_terms_of_service_update',
+    'struct_0xe3309f7f': 'help_terms_of_service_update',
+    'help_terms_of_service_update_structures': 'help_terms_of_service_update',
+    'struct_0x780a0310': 'help_terms_of_service_update',
+    'struct_0x970708cc': 'help_timezones_list',
+    'struct_0x7b74ed71': 'help_timezones_list',
+    'help_timezones_list_structures': 'help_timezones_list',
+    'struct_0xff9289f5': 'help_timezones_list',
+    'struct_0xf3ae2eed': 'help_user_info',
+    'struct_0x01eb3758': 'help_user_info',
+    'help_user_info_structures': 'help_user_info',
+    'struct_0x6334ee9a': 'inline_query_peer_type',
+    'struct_0xd766c50a': 'inline_query_peer_type',
+    'struct_0x833c0fac': 'inline_query_peer_type',
+    'struct_0x0e3b2d0c': 'inline_query_peer_type',
+    'struct_0x5ec4be43': 'inline_query_peer_type',
+    'struct_0x3081ed9d': 'inline_query_peer_type',
+    'inline_query_peer_type_structures': 'inline_query_peer_type',
+    'struct_0x0a8eb2be': 'input',
+    'struct_0x1f9338fe': 'input',
+    'struct_0x405fef0d': 'input',
+    'struct_0x89fdd778': 'input',
+    'struct_0x9bed434d': 'input',
+    'struct_0x9ec7863d': 'input',
+    'struct_0xa920bd7a': 'input_bot_app',
+    'struct_0x908c0407': 'input_bot_app',
+    'input_bot_app_structures': 'input_bot_app',
+    'struct_0x2a286531': 'input_channel',
+    'struct_0xafeb712e': 'input_channel',
+    'struct_0xf35aec28': 'input_channel',
+    'struct_0xee8c1e86': 'input_channel',
+    'struct_0x5b934f9d': 'input_channel',
+    'input_channel_structures': 'input_channel',
+    'struct_0x8953ad37': 'input_chat_photo',
+    'struct_0x1ca48f57': 'input_chat_photo',
+    'struct_0xbdcdaec0': 'input_chat_photo',
+    'input_chat_photo_structures': 'input_chat_photo',
+    'struct_0x9880f658': 'input_check_password_srp',
+    'struct_0xd27ff082': 'input_check_password_srp',
+    'input_check_password_srp_structures': 'input_check_password_srp',
+    'struct_0xfcaafeb7': 'input_dialog_peer',
+    'struct_0x64600527': 'input_dialog_peer',
+    'input_dialog_peer_structures': 'input_dialog_peer',
+    'struct_0x72f0eaae': 'input_document',
+    'struct_0x1abfb575': 'input_document',
+    'input_document_structures': 'input_document',
+    'struct_0x5a17b5e5': 'input_encrypted_file',
+    'struct_0x2dc173c8': 'input_encrypted_file',
+    'struct_0x1837c364': 'input_encrypted_file',
+    'struct_0x64bd0306': 'input_encrypted_file',
+    'input_encrypted_file_structures': 'input_encrypted_file',
+    'struct_0xfa4f0bb5': 'input_file',
+    'struct_0xf52ff27f': 'input_file',
+    'struct_0x62dc8b48': 'input_file',
+    'input_file_structures': 'input_file',
+    'struct_0x40181ffe': 'input_file_location',
+    'struct_0xbad07584': 'input_file_location',
+    'struct_0x37257e99': 'input_file_location',
+    'struct_0xf5235d55': 'input_file_location',
+    'struct_0x9d84f3db': 'input_file_location',
+    'struct_0x0598a92a': 'input_file_location',
+    'struct_0xdfdaabe1': 'input_file_location',
+    'struct_0xcbc7ee28': 'input_file_location',
+    'input_file_location_structures': 'input_file_location',
+    'struct_0xc331e80a': 'input_game',
+    'struct_0x032c3e77': 'input_game',
+    'input_game_structures': 'input_game',
+    'struct_0x48222faf': 'input_geo_point',
+    'struct_0xe4c123d6': 'input_geo_point',
+    'input_geo_point_structures': 'input_geo_point',
+    'struct_0x98986c0d': 'input_invoice',
+    'struct_0xc5b56859': 'input_invoice',
+    'struct_0xc326caef': 'input_invoice',
+    'struct_0x65f00ce3': 'input_invoice',
+    'struct_0x34e793f1': 'input_invoice',
+    'struct_0xe8625e92': 'input_invoice',
+    'struct_0x4d818d5d': 'input_invoice',
+    'struct_0x4a5f5bd9': 'input_invoice',
+    'struct_0xdabab2ef': 'input_invoice',
+    'input_invoice_structures': 'input_invoice',
+    'struct_0x257e962b': 'input_invoice',
+    'struct_0xf8ab7dfb': 'input_media',
+    'struct_0xa8763ab5': 'input_media',
+    'struct_0xd33f43f3': 'input_media',
+    'struct_0xe66fbf7b': 'input_media',
+    'struct_0xf9c44144': 'input_media',
+    'struct_0x779600f9': 'input_media',
+    'struct_0x9664f57f': 'input_media',
+    'struct_0x0f94e5f1': 'input_media',
+    'struct_0x1e287d04': 'input_media',
+    'struct_0xc13d1c11': 'input_media',
+    'struct_0x971fa843': 'input_media',
+    'struct_0x037c9330': 'input_media',
+    'struct_0xe5bbfe1a': 'input_media',
+    'struct_0xb3ba0635': 'input_media',
+    'struct_0xc21b8849': 'input_media',
+    'struct_0xaa661fc3': 'input_media',
+    'struct_0xc4103386': 'input_media',
+    'input_media_structures': 'input_media',
+    'struct_0x4a95e84e': 'input_notify_peer',
+    'struct_0xb8bc5b0c': 'input_notify_peer',
+    'struct_0x193b4417': 'input_notify_peer',
+    'struct_0xb1db7c7e': 'input_notify_peer',
+    'struct_0x5c467992': 'input_notify_peer',
+    'input_notify_peer_structures': 'input_notify_peer',
+    'struct_0x3417d728': 'input_payment_credentials',
+    'struct_0x8ac32801': 'input_payment_credentials',
+    'struct_0xc10eb2cf': 'input_payment_credentials',
+    'input_payment_credentials_structures': 'input_payment_credentials',
+    'struct_0x7da07ec9': 'input_peer',
+    'struct_0xa87b0a1c': 'input_peer',
+    'struct_0xdde8a54c': 'input_peer',
+    'struct_0x179be863': 'input_peer',
+    'struct_0x27bcbbfc': 'input_peer',
+    'struct_0x7b8e7de6': 'input_peer',
+    'struct_0x7f3b18ea': 'input_peer',
+    'struct_0xbd2a0840': 'input_peer',
+    'struct_0x35a95cb9': 'input_peer',
+    'struct_0x20adaef8': 'input_peer',
+    'struct_0x9c95f7bb': 'input_peer',
+    'struct_0x17bae2e6': 'input_peer',
+    'input_peer_structures': 'input_peer',
+    'struct_0x1cd7bf0d': 'input_photo',
+    'struct_0x3bb3b94a': 'input_photo',
+    'input_photo_structures': 'input_photo',
+    'struct_0x4f96cb18': 'input_privacy_key',
+    'struct_0xbdfb0426': 'input_privacy_key',
+    'struct_0xfabadc5f': 'input_privacy_key',
+    'struct_0xa4dd4c08': 'input_privacy_key',
+    'struct_0x5719bacc': 'input_privacy_key',
+    'struct_0x0352dafa': 'input_privacy_key',
+    'struct_0xd1219bdd': 'input_privacy_key',
+    'struct_0xaee69d68': 'input_privacy_key',
+    'struct_0xdb9e70d2': 'input_privacy_key',
+    'struct_0x3823cc40': 'input_privacy_key',
+    'struct_0xd65a11cc': 'input_privacy_key',
+    'struct_0xe1732341': 'input_privacy_key',
+    'struct_0xbdc597b4': 'input_privacy_key',
+    'input_privacy_key_structures': 'input_privacy_key',
+    'struct_0xd66b66c9': 'input_privacy_rule',
+    'struct_0x90110467': 'input_privacy_rule',
+    'struct_0x0d09e07b': 'input_privacy_rule',
+    'struct_0x840649cf': 'input_privacy_rule',
+    'struct_0x0ba52007': 'input_privacy_rule',
+    'struct_0x184b35ce': 'input_privacy_rule',
+    'struct_0x131cc67f': 'input_privacy_rule',
+    'struct_0xe94f0f86': 'input_privacy_rule',
+    'struct_0x2f453e49': 'input_privacy_rule',
+    'struct_0x77cdc9f1': 'input_privacy_rule',
+    'struct_0x5a4fcce5': 'input_privacy_rule',
+    'struct_0xc4e57915': 'input_privacy_rule',
+    'input_privacy_rule_structures': 'input_privacy_rule',
+    'struct_0x24596d41': 'input_quick_reply_shortcut',
+    'struct_0x01190cf1': 'input_quick_reply_shortcut',
+    'input_quick_reply_shortcut_structures': 'input_quick_reply_shortcut',
+    'struct_0x22c0f6d5': 'input_reply_to',
+    'struct_0x073ec805': 'input_reply_to',
+    'struct_0x5881323a': 'input_reply_to',
+    'input_reply_to_structures': 'input_reply_to',
+    'struct_0x3334b0f0': 'input_secure_file',
+    'struct_0x5367e5be': 'input_secure_file',
+    'input_secure_file_structures': 'input_secure_file',
+    'struct_0xffb62b95': 'input_sticker_set',
+    'struct_0x9de7a269': 'input_sticker_set',
+    'struct_0x861cc8a0': 'input_sticker_set',
+    'struct_0x028703c8': 'input_sticker_set',
+    'struct_0xe67f520e': 'input_sticker_set',
+    'struct_0xc88b3b02': 'input_sticker_set',
+    'struct_0x29d0f5ee': 'input_sticker_set',
+    'struct_0x04c4d4ce': 'input_sticker_set',
+    'struct_0x44c1f8e9': 'input_sticker_set',
+    'struct_0x49748553': 'input_sticker_set',
+    'input_sticker_set_structures': 'input_sticker_set',
+    'struct_0x0438865b': 'input_stickered_media',
+    'struct_0x4a992157': 'input_stickered_media',
+    'input_stickered_media_structures': 'input_stickered_media',
+    'struct_0x616f7fe8': 'input_store_payment_purpose',
+    'struct_0xfb790393': 'input_store_payment_purpose',
+    'struct_0xa6751e66': 'input_store_payment_purpose',
+    'struct_0x160544ca': 'input_store_payment_purpose',
+    'struct_0x1d741ef7': 'input_store_payment_purpose',
+    'struct_0xdddd0f56': 'input_store_payment_purpose',
+    'struct_0x751f08fa': 'input_store_payment_purpose',
+    'input_store_payment_purpose_structures': 'input_store_payment_purpose',
+    'struct_0xf5890df1': 'input_theme',
+    'struct_0x3c5693e9': 'input_theme',
+    'input_theme_structures': 'input_theme',
+    'struct_0xf7c1b13f': 'input_user',
+    'struct_0xf21158c6': 'input_user',
+    'struct_0xb98886cf': 'input_user',
+    'struct_0x1da448e2': 'input_user',
+    'input_user_structures': 'input_user',
+    'struct_0xe630b979': 'input_wall_paper',
+    'struct_0x967a462e': 'input_wall_paper',
+    'struct_0x72091c80': 'input_wall_paper',
+    'input_wall_paper_structures': 'input_wall_paper',
+    'struct_0x9f2221c9': 'input_web_file_location',
+    'struct_0xc239d686': 'input_web_file_location',
+    'input_web_file_location_structures': 'input_web_file_location',
+    'struct_0x049ee584': 'invoice',
+    'struct_0x5db95a15': 'invoice',
+    'struct_0x3e85a91b': 'invoice',
+    'invoice_structures': 'invoice',
+    'struct_0xcb296bf8': 'invoice',
+    'struct_0xc7345e6a': 'json_value',
+    'struct_0x3f6d7b68': 'json_value',
+    'struct_0xb71e767a': 'json_value',
+    'struct_0xf7444763': 'json_value',
+    'struct_0x99c1d49d': 'json_value',
+    'struct_0x2be0dfa4': 'json_value',
+    'json_value_structures': 'json_value',
+    'struct_0xc0de1bd9': 'json_value',
+    'struct_0xa0c0505c': 'keyboard_button',
+    'struct_0xb16a6c29': 'keyboard_button',
+    'struct_0x50f41ccf': 'keyboard_button',
+    'struct_0x258aff05': 'keyboard_button',
+    'struct_0x0568a748': 'keyboard_button',
+    'struct_0xfc796b3f': 'keyboard_button',
+    'struct_0x10b78d29': 'keyboard_button',
+    'struct_0xd02e7fd4': 'keyboard_button',
+    'struct_0xbbc7515d': 'keyboard_button',
+    'struct_0xafd93fbb': 'keyboard_button',
+    'struct_0x683a5e46': 'keyboard_button',
+    'struct_0x93b9fbb5': 'keyboard_button',
+    'struct_0xa2fa4880': 'keyboard_button',
+    'struct_0x35bbdb6b': 'keyboard_button',
+    'struct_0xe988037b': 'keyboard_button',
+    'struct_0x308660c1': 'keyboard_button',
+    'struct_0x13767230': 'keyboard_button',
+    'struct_0x0d0b468c': 'keyboard_button',
+    'struct_0x53d7bfd8': 'keyboard_button',
+    'struct_0x75d2698e': 'keyboard_button',
+    'keyboard_button_structures': 'keyboard_button',
+    'struct_0xeeca5ce3': 'lang',
+    'struct_0x6c47ac9f': 'lang_pack_string',
+    'struct_0xcad181f6': 'lang_pack_string',
+    'struct_0x2979eeb2': 'lang_pack_string',
+    'lang_pack_string_structures': 'lang_pack_string',
+    'struct_0x2e1ee318': 'langpack',
+    'struct_0x6a596502': 'langpack',
+    'struct_0x800fd57d': 'langpack',
+    'struct_0x9ab5c58e': 'langpack',
+    'struct_0xcd984aa5': 'langpack',
+    'struct_0x1d86f70e': 'message',
+    'struct_0xa7ab1991': 'message',
+    'struct_0xc3060325': 'message',
+    'struct_0x555555fa': 'message',
+    'struct_0x555555f9': 'message',
+    'struct_0x90dddc11': 'message',
+    'struct_0xc09be45f': 'message',
+    'struct_0xc992e15c': 'message',
+    'struct_0x5ba66c13': 'message',
+    'struct_0xc06b9607': 'message',
+    'struct_0x83e5de54': 'message',
+    'struct_0x2bebfa86': 'message',
+    'struct_0x44f9b43d': 'message',
+    'struct_0x90a6ca84': 'message',
+    'struct_0x1c9b1027': 'message',
+    'struct_0xa367e716': 'message',
+    'struct_0x05f46804': 'message',
+    'struct_0x567699b3': 'message',
+    'struct_0x9f8d60bb': 'message',
+    'struct_0x22eb6aba': 'message',
+    'struct_0x555555f8': 'message',
+    'struct_0x9789dac4': 'message',
+    'struct_0x452c0e65': 'message',
+    'struct_0xf52e6b7f': 'message',
+    'struct_0x58ae39c9': 'message',
+    'struct_0xbce383d2': 'message',
+    'struct_0x85d6cbe2': 'message',
+    'struct_0xeabcdd4d': 'message',
+    'struct_0x96fdbbe9': 'message',
+    'struct_0x94345242': 'message',
+    'struct_0xbde09c2e': 'message',
+    'struct_0xa4e97f37': 'message',
+    'struct_0x2357bf25': 'message',
+    'struct_0xa66c7efc': 'message',
+    'struct_0x1e4c8a69': 'message',
+    'struct_0x38116ee0': 'message',
+    'struct_0x76bec211': 'message',
+    'struct_0x9e19a1f6': 'message',
+    'struct_0x286fa604': 'message',
+    'struct_0x2b085862': 'message',
+    'struct_0xd3d28540': 'message',
+    'struct_0xf07814c8': 'message',
+    'message_structures': 'message',
+    'struct_0xb89bfccf': 'message',
+    'struct_0x555555f5': 'message_action',
+    'struct_0x555555f7': 'message_action',
+    'struct_0xfae69f56': 'message_action',
+    'struct_0xa6638b9a': 'message_action',
+    'struct_0xbd47cbad': 'message_action',
+    'struct_0x502f92f7': 'message_action',
+    'struct_0x15cefd00': 'message_action',
+    'struct_0xa43f30cc': 'message_action',
+    'struct_0x51bdb021': 'message_action',
+    'struct_0xe1037f92': 'message_action',
+    'struct_0xa80f51e4': 'message_action',
+    'struct_0x332ba9ed': 'message_action',
+    'struct_0x87e2f155': 'message_action',
+    'struct_0x2a9fadc5': 'message_action',
+    'struct_0xea3948e9': 'message_action',
+    'struct_0x7a0d7f42': 'message_action',
+    'struct_0xaa786345': 'message_action',
+    'struct_0x4792929b': 'message_action',
+    'struct_0x01baa035': 'message_action',
+    'struct_0xebbca3cb': 'message_action',
+    'struct_0x9fbab604': 'message_action',
+    'struct_0x7fcb13a8': 'message_action',
+    'struct_0x031224c3': 'message_action',
+    'struct_0xb055eaee': 'message_action',
+    'struct_0x488a7337': 'message_action',
+    'struct_0xb2ae9b0c': 'message_action',
+    'struct_0x55555557': 'message_action',
+    'struct_0xbc44a927': 'message_action',
+    'struct_0x5060a3f4': 'message_action',
+    'struct_0x55555550': 'message_action',
+    'struct_0x56d03994': 'message_action',
+    'struct_0x678c2e09': 'message_action',
+    'struct_0xd2cfdb0e': 'message_action',
+    'struct_0xb18a431c': 'message_action',
+    'struct_0xc0944820': 'message_action',
+    'struct_0x55555551': 'message_action',
+    'struct_0x5e3cfc4b': 'message_action',
+    'struct_0x55555552': 'message_action',
+    'struct_0x3c134d7b': 'message_action',
+    'struct_0xaa1afbfd': 'message_action',
+    'struct_0xd95c6154': 'message_action',
+    'struct_0x47dd8079': 'message_action',
+    'struct_0xb4c38cb5': 'message_action',
+    'struct_0xf89cf5e8': 'message_action',
+    'struct_0xf3f25f76': 'message_action',
+    'struct_0x95d2ac92': 'message_action',
+    'struct_0x94bd38ed': 'message_action',
+    'struct_0x98e0d697': 'message_action',
+    'struct_0x57de635e': 'message_action',
+    'struct_0xe7e75f97': 'message_action',
+    'struct_0xc0787d6d': 'message_action',
+    'struct_0x95e3fbef': 'message_action',
+    'struct_0x76b9f11a': 'message_action',
+    'struct_0x80e11a7f': 'message_action',
+    'struct_0x0d999256': 'message_action',
+    'struct_0xb5a1ce5a': 'message_action',
+    'struct_0xabe9affe': 'message_action',
+    'struct_0xc516d679': 'message_action',
+    'struct_0xc624b16e': 'message_action',
+    'struct_0x96163f56': 'message_action',
+    'struct_0x40699cd0': 'message_action',
+    'struct_0xb6aef7b0': 'message_action',
+    'struct_0x92a72876': 'message_action',
+    'struct_0xb3a07661': 'message_action',
+    'struct_0xcc02aa6d': 'message_action',
+    'struct_0xffa00ccc': 'message_action',
+    'struct_0x8f31b327': 'message_action',
+    'struct_0x6c6274fa': 'message_action',
+    'struct_0xc83d6aec': 'message_action',
+    'struct_0xfe77345d': 'message_action',
+    'struct_0x31518e9b': 'message_action',
+    'struct_0x41b3e202': 'message_action',
+    'struct_0x45d5b021': 'message_action',
+    'struct_0xb00c47a2': 'message_action',
+    'struct_0x4717e8a4': 'message_action',
+    'struct_0xd8f4f0a7': 'message_action',
+    'struct_0x08557637': 'message_action',
+    'struct_0x9bb3ef44': 'message_action',
+    'struct_0x26077b99': 'message_action',
+    'struct_0xacdfcb81': 'message_action',
+    'struct_0x5cd2501f': 'message_action',
+    'message_action_structures': 'message_action',
+    'struct_0xea02c27e': 'message_action',
+    'struct_0x76a6d327': 'message_entity',
+    'struct_0x6cef8ac7': 'message_entity',
+    'struct_0x64e475c2': 'message_entity',
+    'struct_0x73924be0': 'message_entity',
+    'struct_0xbb92ba95': 'message_entity',
+    'struct_0x6ed02538': 'message_entity',
+    'struct_0x826f8b60': 'message_entity',
+    'struct_0xfa04579d': 'message_entity',
+    'struct_0x32ca960f': 'message_entity',
+    'struct_0x352dca58': 'message_entity',
+    'struct_0x208e68c9': 'message_entity',
+    'struct_0x4c4e743f': 'message_entity',
+    'struct_0xbd610bc9': 'message_entity',
+    'struct_0x6f635b0d': 'message_entity',
+    'struct_0x28a20571': 'message_entity',
+    'struct_0xbf0693d4': 'message_entity',
+    'struct_0xf1ccaaac': 'message_entity',
+    'struct_0x020df5d0': 'message_entity',
+    'struct_0x9c4e7e8b': 'message_entity',
+    'struct_0x761e6af4': 'message_entity',
+    'struct_0x9b69e34b': 'message_entity',
+    'struct_0xdc7b1140': 'message_entity',
+    'struct_0xc8cf05f8': 'message_entity',
+    'message_entity_structures': 'message_entity',
+    'struct_0xad628cc8': 'message_extended_media',
+    'struct_0xee479c64': 'message_extended_media',
+    'message_extended_media_structures': 'message_extended_media',
+    'struct_0xc786ddcb': 'message_fwd_header',
+    'struct_0x353a686b': 'message_fwd_header',
+    'struct_0xec338270': 'message_fwd_header',
+    'struct_0xfadff4ac': 'message_fwd_header',
+    'struct_0x4e4df4bb': 'message_fwd_header',
+    'struct_0x5f777dce': 'message_fwd_header',
+    'struct_0x559ebe6d': 'message_fwd_header',
+    'message_fwd_header_structures': 'message_fwd_header',
+    'struct_0x29632a36': 'message_media',
+    'struct_0xc6b68300': 'message_media',
+    'struct_0xc8c45a2a': 'message_media',
+    'struct_0x84551347': 'message_media',
+    'struct_0xf6a548d3': 'message_media',
+    'struct_0x9f84f49e': 'message_media',
+    'struct_0x3ded6320': 'message_media',
+    'struct_0x68cb6283': 'message_media',
+    'struct_0xcbb20d88': 'message_media',
+    'struct_0xc79aee1d': 'message_media',
+    'struct_0xc79aee1f': 'message_media',
+    'struct_0x7912b71f': 'message_media',
+    'struct_0xb940c666': 'message_media',
+    'struct_0x7c3c2609': 'message_media',
+    'struct_0x2ec0533f': 'message_media',
+    'struct_0xa2d24290': 'message_media',
+    'struct_0x2fda2204': 'message_media',
+    'struct_0xf3e02ea8': 'message_media',
+    'struct_0xfdb19008': 'message_media',
+    'struct_0x7c4414d3': 'message_media',
+    'struct_0x5e7d2f39': 'message_media',
+    'struct_0x695150d7': 'message_media',
+    'struct_0x4bd6e798': 'message_media',
+    'struct_0xceaa3ea1': 'message_media',
+    'struct_0xc6991068': 'message_media',
+    'struct_0xaa073beb': 'message_media',
+    'struct_0xdaad85b0': 'message_media',
+    'struct_0x58260664': 'message_media',
+    'struct_0xa8852491': 'message_media',
+    'struct_0xb5223b0f': 'message_media',
+    'struct_0x3d8ce53d': 'message_media',
+    'struct_0x5bcf1675': 'message_media',
+    'struct_0x3f7ee58b': 'message_media',
+    'struct_0x638fe46b': 'message_media',
+    'struct_0x56e0d474': 'message_media',
+    'struct_0xa32dd600': 'message_media',
+    'struct_0xddf10c3b': 'message_media',
+    'struct_0x52d8ccd9': 'message_media',
+    'struct_0xdbbdf614': 'message_media',
+    'struct_0xdd570bd5': 'message_media',
+    'struct_0x4cf4d72d': 'message_media',
+    'struct_0x9cb070d7': 'message_media',
+    'struct_0xcbf24940': 'message_media',
+    'struct_0x70322949': 'message_media',
+    'message_media_structures': 'message_media',
+    'struct_0xbdf9653b': 'message_media',
+    'struct_0x8c79b63c': 'message_peer_reaction',
+    'struct_0xb156fe9c': 'message_peer_reaction',
+    'struct_0x51b67eff': 'message_peer_reaction',
+    'struct_0x932844fa': 'message_peer_reaction',
+    'message_peer_reaction_structures': 'message_peer_reaction',
+    'struct_0x4628f6e6': 'message_peer_vote',
+    'struct_0xb6cc2d5c': 'message_peer_vote',
+    'struct_0x74cda504': 'message_peer_vote',
+    'message_peer_vote_structures': 'message_peer_vote',
+    'struct_0x087b6e36': 'message_reactions',
+    'struct_0x0a339f0b': 'message_reactions',
+    'struct_0x4f2b9479': 'message_reactions',
+    'struct_0xb87a24d1': 'message_reactions',
+    'message_reactions_structures': 'message_reactions',
+    'struct_0x4ba3a95a': 'message_reactor',
+    'struct_0xef00d448': 'message_reactor',
+    'message_reactor_structures': 'message_reactor',
+    'struct_0x4128faac': 'message_replies',
+    'struct_0x83d60fc2': 'message_replies',
+    'message_replies_structures': 'message_replies',
+    'struct_0x0e5af939': 'message_reply_header',
+    'struct_0x9c98bfc1': 'message_reply_header',
+    'struct_0xafbc09db': 'message_reply_header',
+    'struct_0x6eebcabd': 'message_reply_header',
+    'struct_0x3d5c1693': 'message_reply_header',
+    'struct_0xa6d57763': 'message_reply_header',
+    'message_reply_header_structures': 'message_reply_header',
+    'struct_0x0034a818': 'messages',
+    'struct_0x04f1aaa9': 'messages',
+    'struct_0x05a954c0': 'messages',
+    'struct_0x0c964709': 'messages',
+    'struct_0x0e306d3a': 'messages',
+    'struct_0x0ecf6736': 'messages',
+    'struct_0x0f093465': 'messages',
+    'struct_0x0f635e1b': 'messages',
+    'struct_0x10ea6184': 'messages',
+    'struct_0x147ee23c': 'messages',
+    'struct_0x1508b6af': 'messages',
+    'struct_0x15ad9f64': 'messages',
+    'struct_0x1662af0b': 'messages',
+    'struct_0x16fcc2cb': 'messages',
+    'struct_0x18dea0ac': 'messages',
+    'struct_0x198fb446': 'messages',
+    'struct_0x1a46500a': 'messages',
+    'struct_0x1ad4a04a': 'messages',
+    'struct_0x1af3dbb8': 'messages',
+    'struct_0x1bbcf300': 'messages',
+    'struct_0x1bf89d74': 'messages',
+    'struct_0x1cc6e91f': 'messages',
+    'struct_0x1dd840f5': 'messages',
+    'struct_0x21a548f3': 'messages',
+    'struct_0x22b6c214': 'messages',
+    'struct_0x22ddd30c': 'messages',
+    'struct_0x22e24e22': 'messages',
+    'struct_0x269dc2c1': 'messages',
+    'struct_0x269e9a49': 'messages',
+    'struct_0x26b5dde6': 'messages',
+    'struct_0x26cf8950': 'messages',
+    'struct_0x29b1c66a': 'messages',
+    'struct_0x29ee847a': 'messages',
+    'struct_0x2a862092': 'messages',
+    'struct_0x2ad93719': 'messages',
+    'struct_0x2c11c0d7': 'messages',
+    'struct_0x2ecd56cd': 'messages',
+    'struct_0x31bd492d': 'messages',
+    'struct_0x31c1c44f': 'messages',
+    'struct_0x3223495b': 'messages',
+    'struct_0x327a30cb': 'messages',
+    'struct_0x32d439a4': 'messages',
+    'struct_0x33153ad4': 'messages',
+    'struct_0x3371c354': 'messages',
+    'struct_0x338e2464': 'messages',
+    'struct_0x33963bf9': 'messages',
+    'struct_0x33db32f8': 'messages',
+    'struct_0x34090c3b': 'messages',
+    'struct_0x34fdc5c3': 'messages',
+    'struct_0x35705b8a': 'messages',
+    'struct_0x35a0e062': 'messages',
+    'struct_0x35ddd674': 'messages',
+    'struct_0x3637e05b': 'messages',
+    'struct_0x36585ea4': 'messages',
+    'struct_0x367617d3': 'messages',
+    'struct_0x36a73f77': 'messages',
+    'struct_0x36e5bf4d': 'messages',
+    'struct_0x37b74355': 'messages',
+    'struct_0x3920e6ef': 'messages',
+    'struct_0x392718f8': 'messages',
+    'struct_0x39461db2': 'messages',
+    'struct_0x3b1adf37': 'messages',
+    'struct_0x3cc04740': 'messages',
+    'struct_0x3d9a414d': 'messages',
+    'struct_0x3db8ec63': 'messages',
+    'struct_0x3dbc0415': 'messages',
+    'struct_0x3eadb1bb': 'messages',
+    'struct_0x3ebee86a': 'messages',
+    'struct_0x3f4e0648': 'messages',
+    'struct_0x413a3e73': 'messages',
+    'struct_0x4222fa74': 'messages',
+    'struct_0x435885b5': 'messages',
+    'struct_0x43fe19f3': 'messages',
+    'struct_0x4423e6c5': 'messages',
+    'struct_0x446972fd': 'messages',
+    'struct_0x44fa7a15': 'messages',
+    'struct_0x455b853d': 'messages',
+    'struct_0x461b3f48': 'messages',
+    'struct_0x472455aa': 'messages',
+    'struct_0x4899484e': 'messages',
+    'struct_0x49e9528f': 'messages',
+    'struct_0x4b0c8c0f': 'messages',
+    'struct_0x4bc6589a': 'messages',
+    'struct_0x4e9963b2': 'messages',
+    'struct_0x4f47a016': 'messages',
+    'struct_0x4facb138': 'messages',
+    'struct_0x4fcba9c8': 'messages',
+    'struct_0x5057c497': 'messages',
+    'struct_0x514e999d': 'messages',
+    'struct_0x519bc2b1': 'messages',
+    'struct_0x53618bce': 'messages',
+    'struct_0x5381d21a': 'messages',
+    'struct_0x53b22baf': 'messages',
+    'struct_0x54aa7f8e': 'messages',
+    'struct_0x5559481d': 'messages',
+    'struct_0x55a5bb66': 'messages',
+    'struct_0x56987bd5': 'messages',
+    'struct_0x5784d3e1': 'messages',
+    'struct_0x57f17692': 'messages',
+    'struct_0x58943ee2': 'messages',
+    'struct_0x58bbcb50': 'messages',
+    'struct_0x59ae2b16': 'messages',
+    'struct_0x5b118126': 'messages',
+    'struct_0x5bd0ee50': 'messages',
+    'struct_0x5c003cef': 'messages',
+    'struct_0x5cf09635': 'messages',
+    'struct_0x5dc60f03': 'messages',
+    'struct_0x5e0fb7b9': 'messages',
+    'struct_0x60297dec': 'messages',
+    'struct_0x60331907': 'messages',
+    'struct_0x61422a48': 'messages',
+    'struct_0x628c9224': 'messages',
+    'struct_0x63183030': 'messages',
+    'struct_0x640f82b8': 'messages',
+    'struct_0x64780b14': 'messages',
+    'struct_0x658b7188': 'messages',
+    'struct_0x65a4c7d5': 'messages',
+    'struct_0x673ad8f1': 'messages',
+    'struct_0x6880b94d': 'messages',
+    'struct_0x69f59d69': 'messages',
+    'struct_0x6a3f8d65': 'messages',
+    'struct_0x6aa3f6bd': 'messages',
+    'struct_0x6c50051c': 'messages',
+    'struct_0x6c750de1': 'messages',
+    'struct_0x6d74da08': 'messages',
+    'struct_0x6e2be050': 'messages',
+    'struct_0x6e98102b': 'messages',
+    'struct_0x702a40e0': 'messages',
+    'struct_0x73746f5c': 'messages',
+    'struct_0x73783ffd': 'messages',
+    'struct_0x73a379eb': 'messages',
+    'struct_0x73bb643b': 'messages',
+    'struct_0x7488ce5b': 'messages',
+    'struct_0x77216192': 'messages',
+    'struct_0x78337739': 'messages',
+    'struct_0x7852834e': 'messages',
+    'struct_0x791451ed': 'messages',
+    'struct_0x7bd66041': 'messages',
+    'struct_0x7e58ee9c': 'messages',
+    'struct_0x7ed094a1': 'messages',
+    'struct_0x7f1d072f': 'messages',
+    'struct_0x7f4b690a': 'messages',
+    'struct_0x7f5defa6': 'messages',
+    'struct_0x7f648b67': 'messages',
+    'struct_0x7fe7e815': 'messages',
+    'struct_0x7ff3b806': 'messages',
+    'struct_0x812c2ae6': 'messages',
+    'struct_0x81b6b00a': 'messages',
+    'struct_0x849ad397': 'messages',
+    'struct_0x84d19185': 'messages',
+    'struct_0x84f80814': 'messages',
+    'struct_0x857ebdb8': 'messages',
+    'struct_0x864b2581': 'messages',
+    'struct_0x875f74be': 'messages',
+    'struct_0x8953ab4e': 'messages',
+    'struct_0x8999602d': 'messages',
+    'struct_0x8b68b0cc': 'messages',
+    'struct_0x8b716587': 'messages',
+    'struct_0x8bba90e6': 'messages',
+    'struct_0x8c4bfe5d': 'messages',
+    'struct_0x8c5a3b3c': 'messages',
+    'struct_0x8c5adfd9': 'messages',
+    'struct_0x8d9692a3': 'messages',
+    'struct_0x8ef8ecc0': 'messages',
+    'struct_0x8ffacae1': 'messages',
+    'struct_0x91b2d060': 'messages',
+    'struct_0x92b4494c': 'messages',
+    'struct_0x9342ca07': 'messages',
+    'struct_0x94a495c3': 'messages',
+    'struct_0x983f9745': 'messages',
+    'struct_0x9a3bfd99': 'messages',
+    'struct_0x9bd2f439': 'messages',
+    'struct_0x9c7f2f10': 'messages',
+    'struct_0x9da9403b': 'messages',
+    'struct_0x9dd6a67b': 'messages',
+    'struct_0x9dfeefb4': 'messages',
+    'struct_0x9eb51445': 'messages',
+    'struct_0xa02ce5d5': 'messages',
+    'struct_0xa0f4cb4f': 'messages',
+    'struct_0xa1405817': 'messages',
+    'struct_0xa2185cab': 'messages',
+    'struct_0xa24de717': 'messages',
+    'struct_0xa2875319': 'messages',
+    'struct_0xa29cd42c': 'messages',
+    'struct_0xa2b5a3f6': 'messages',
+    'struct_0xa455de90': 'messages',
+    'struct_0xa550cd78': 'messages',
+    'struct_0xa5866b41': 'messages',
+    'struct_0xa6341782': 'messages',
+    'struct_0xa731e257': 'messages',
+    'struct_0xa85bd1c2': 'messages',
+    'struct_0xa927fec5': 'messages',
+    'struct_0xaadf159b': 'messages',
+    'struct_0xac81bbde': 'messages',
+    'struct_0xaeb00b34': 'messages',
+    'struct_0xb08f922a': 'messages',
+    'struct_0xb0d81a83': 'messages',
+    'struct_0xb11eafa2': 'messages',
+    'struct_0xb12c7125': 'messages',
+    'struct_0xb43df344': 'messages',
+    'struct_0xb45c69d1': 'messages',
+    'struct_0xb5052fea': 'messages',
+    'struct_0xb69b72d7': 'messages',
+    'struct_0xb6c4f543': 'messages',
+    'struct_0xb80e5fe4': 'messages',
+    'struct_0xb86e380e': 'messages',
+    'struct_0xb8a0a1a8': 'messages',
+    'struct_0xb9ffc55b': 'messages',
+    'struct_0xbb8125ba': 'messages',
+    'struct_0xbb9fa475': 'messages',
+    'struct_0xbd38850a': 'messages',
+    'struct_0xbdbb0464': 'messages',
+    'struct_0xbdc62dcc': 'messages',
+    'struct_0xbdca2f75': 'messages',
+    'struct_0xbdf93428': 'messages',
+    'struct_0xc0cf7646': 'messages',
+    'struct_0xc286d98f': 'messages',
+    'struct_0xc563c1e4': 'messages',
+    'struct_0xc78fe460': 'messages',
+    'struct_0xc8a0ec74': 'messages',
+    'struct_0xc9b0539f': 'messages',
+    'struct_0xc9e01e7b': 'messages',
+    'struct_0xcacacaca': 'messages',
+    'struct_0xcc5b67cc': 'messages',
+    'struct_0xccfddf96': 'messages',
+    'struct_0xcf1592db': 'messages',
+    'struct_0xcfb9d957': 'messages',
+    'struct_0xd0b5e1fc': 'messages',
+    'struct_0xd2aaf7ec': 'messages',
+    'struct_0xd30d78d4': 'messages',
+    'struct_0xd372c5ce': 'messages',
+    'struct_0xd464a42b': 'messages',
+    'struct_0xd483f2a8': 'messages',
+    'struct_0xd5039208': 'messages',
+    'struct_0xd58f130a': 'messages',
+    'struct_0xd5a5d3a1': 'messages',
+    'struct_0xd5b10c26': 'messages',
+    'struct_0xd63d94e0': 'messages',
+    'struct_0xd6b94df2': 'messages',
+    'struct_0xd9ab0f54': 'messages',
+    'struct_0xdc0242c8': 'messages',
+    'struct_0xddcf50eb': 'messages',
+    'struct_0xdea20a39': 'messages',
+    'struct_0xdef60797': 'messages',
+    'struct_0xdf04dd4e': 'messages',
+    'struct_0xdfd14005': 'messages',
+    'struct_0xdff8042c': 'messages',
+    'struct_0xe085f4ea': 'messages',
+    'struct_0xe105e910': 'messages',
+    'struct_0xe40ca104': 'messages',
+    'struct_0xe41cd11d': 'messages',
+    'struct_0xe470bcfd': 'messages',
+    'struct_0xe47cb579': 'messages',
+    'struct_0xe58e95d2': 'messages',
+    'struct_0xe5d7d19c': 'messages',
+    'struct_0xe63be13f': 'messages',
+    'struct_0xe6df7378': 'messages',
+    'struct_0xe822649d': 'messages',
+    'struct_0xe844ebff': 'messages',
+    'struct_0xeb50adf5': 'messages',
+    'struct_0xed5383f7': 'messages',
+    'struct_0xef8d3e6c': 'messages',
+    'struct_0xefd48c89': 'messages',
+    'struct_0xefd9a6a2': 'messages',
+    'struct_0xf025bc8b': 'messages',
+    'struct_0xf107e790': 'messages',
+    'struct_0xf141b5e1': 'messages',
+    'struct_0xf1d0fbd3': 'messages',
+    'struct_0xf24753e3': 'messages',
+    'struct_0xf2ecef23': 'messages',
+    'struct_0xf393aea0': 'messages',
+    'struct_0xf516760b': 'messages',
+    'struct_0xf64daf43': 'messages',
+    'struct_0xf731a9f4': 'messages',
+    'struct_0xf96e55de': 'messages',
+    'struct_0xf9cbe409': 'messages',
+    'struct_0xfaff629d': 'messages',
+    'struct_0xfbf2340a': 'messages',
+    'struct_0xfbfca18f': 'messages',
+    'struct_0xfc78af9b': 'messages',
+    'struct_0xfd2dda49': 'messages',
+    'struct_0xfd5e12bd': 'messages',
+    'struct_0xfda68d36': 'messages',
+    'struct_0xfeb16771': 'messages',
+    'struct_0xff57708d': 'messages',
+    'struct_0xcdbbcebb': 'messages_all_stickers',
+    'struct_0xe86602c3': 'messages_all_stickers',
+    'messages_all_stickers_structures': 'messages_all_stickers',
+    'struct_0xd1ed9a5b': 'messages_available_effects',
+    'struct_0xbddb616e': 'messages_available_effects',
+    'messages_available_effects_structures': 'messages_available_effects',
+    'struct_0x93c3e27e': 'messages_available_effects',
+    'struct_0x9f071957': 'messages_available_reactions',
+    'struct_0x768e3aad': 'messages_available_reactions',
+    'messages_available_reactions_structures': 'messages_available_reactions',
+    'struct_0xc077ec01': 'messages_available_reactions',
+    'struct_0xccd3563d': 'messages_bot_results',
+    'struct_0x947ca848': 'messages_bot_results',
+    'struct_0xe021f2f6': 'messages_bot_results',
+    'messages_bot_results_structures': 'messages_bot_results',
+    'struct_0x3c20629f': 'messages_bot_results',
+    'struct_0xb57295d5': 'messages_bot_results',
+    'struct_0x64ff9fd5': 'messages_chats',
+    'struct_0x9cd81144': 'messages_chats',
+    'messages_chats_structures': 'messages_chats',
+    'struct_0xc0e24635': 'messages_dh_config',
+    'struct_0x2c221edd': 'messages_dh_config',
+    'messages_dh_config_structures': 'messages_dh_config',
+    'struct_0x15ba6c40': 'messages_dialogs',
+    'struct_0x71e094f3': 'messages_dialogs',
+    'struct_0xf0e3e596': 'messages_dialogs',
+    'messages_dialogs_structures': 'messages_dialogs',
+    'struct_0x6fb4ad87': 'messages_emoji_groups',
+    'struct_0x881fb94b': 'messages_emoji_groups',
+    'messages_emoji_groups_structures': 'messages_emoji_groups',
+    'struct_0x222600ef': 'messages_exported_chat_invite',
+    'struct_0x1871be50': 'messages_exported_chat_invite',
+    'messages_exported_chat_invite_structures': 'messages_exported_chat_invite',
+    'struct_0x9e8fa6d3': 'messages_faved_stickers',
+    'struct_0x2cb51097': 'messages_faved_stickers',
+    'messages_faved_stickers_structures': 'messages_faved_stickers',
+    'struct_0xbe382906': 'messages_featured_stickers',
+    'struct_0xc6dc0c66': 'messages_featured_stickers',
+    'messages_featured_stickers_structures': 'messages_featured_stickers',
+    'struct_0xffc86587': 'messages_filter',
+    'struct_0x3751b49e': 'messages_filter',
+    'struct_0x3a20ecb8': 'messages_filter',
+    'struct_0x9609a51c': 'messages_filter',
+    'struct_0x7ef0dd87': 'messages_filter',
+    'struct_0x9eddf188': 'messages_filter',
+    'struct_0x56e9f0e4': 'messages_filter',
+    'struct_0xd95e73bb': 'messages_filter',
+    'struct_0xe7026d0d': 'messages_filter',
+    'struct_0x1bb00451': 'messages_filter',
+    'struct_0xc1f8e69a': 'messages_filter',
+    'struct_0x7a7c17a4': 'messages_filter',
+    'struct_0xe062db83': 'messages_filter',
+    'struct_0x50f5c392': 'messages_filter',
+    'struct_0x9fc00e65': 'messages_filter',
+    'struct_0x80c99768': 'messages_filter',
+    'struct_0x57e2f66c': 'messages_filter',
+    'struct_0xb549da53': 'messages_filter',
+    'messages_filter_structures': 'messages_filter',
+    'struct_0x0d54b65d': 'messages_found_sticker_sets',
+    'struct_0x8af09dd2': 'messages_found_sticker_sets',
+    'messages_found_sticker_sets_structures': 'messages_found_sticker_sets',
+    'struct_0x82c9e290': 'messages_found_stickers',
+    'struct_0x6010c534': 'messages_found_stickers',
+    'messages_found_stickers_structures': 'messages_found_stickers',
+    'struct_0x3a54685e': 'messages_messages',
+    'struct_0x8c718e87': 'messages_messages',
+    'struct_0xc776ba4e': 'messages_messages',
+    'struct_0x74535f21': 'messages_messages',
+    'messages_messages_structures': 'messages_messages',
+    'struct_0xc68d6695': 'messages_quick_replies',
+    'struct_0x5f91eb5b': 'messages_quick_replies',
+    'messages_quick_replies_structures': 'messages_quick_replies',
+    'struct_0x0697102b': 'messages_quick_replies',
+    'struct_0xb06fdbdf': 'messages_reactions',
+    'struct_0xeafdf716': 'messages_reactions',
+    'messages_reactions_structures': 'messages_reactions',
+    'struct_0x88d37c56': 'messages_recent_stickers',
+    'struct_0x0b17f890': 'messages_recent_stickers',
+    'messages_recent_stickers_structures': 'messages_recent_stickers',
+    'struct_0xf83ae221': 'messages_saved_dialogs',
+    'struct_0x44ba9dd9': 'messages_saved_dialogs',
+    'struct_0xc01f6fe8': 'messages_saved_dialogs',
+    'messages_saved_dialogs_structures': 'messages_saved_dialogs',
+    'struct_0xbd87cb6c': 'messages_saved_dialogs',
+    'struct_0xe8025ca2': 'messages_saved_gifs',
+    'struct_0x84a02a0d': 'messages_saved_gifs',
+    'messages_saved_gifs_structures': 'messages_saved_gifs',
+    'struct_0x889b59ef': 'messages_saved_reaction_tags',
+    'struct_0x3259950a': 'messages_saved_reaction_tags',
+    'messages_saved_reaction_tags_structures': 'messages_saved_reaction_tags',
+    'struct_0xcb6ff828': 'messages_saved_reaction_tags',
+    'struct_0x560f8935': 'messages_sent_encrypted_message',
+    'struct_0x9493ff32': 'messages_sent_encrypted_message',
+    'messages_sent_encrypted_message_structures': 'messages_sent_encrypted_message',
+    'struct_0x1839490f': 'messages_sponsored_messages',
+    'struct_0xc9ee1d87': 'messages_sponsored_messages',
+    'messages_sponsored_messages_structures': 'messages_sponsored_messages',
+    'struct_0x4d93a990': 'messages_sponsored_messages',
+    'struct_0x6e153f16': 'messages_sticker_set',
+    'struct_0xb60a24a6': 'messages_sticker_set',
+    'struct_0xd3f924eb': 'messages_sticker_set',
+    'messages_sticker_set_structures': 'messages_sticker_set',
+    'struct_0x38641628': 'messages_sticker_set_install_result',
+    'struct_0x35e410a8': 'messages_sticker_set_install_result',
+    'messages_sticker_set_install_result_structures': 'messages_sticker_set_install_result',
+    'struct_0xf1749a22': 'messages_stickers',
+    'struct_0x30a6ec7e': 'messages_stickers',
+    'messages_stickers_structures': 'messages_stickers',
+    'struct_0x8e1a1775': 'nearest',
+    'struct_0x97e8bebe': 'notification_sound',
+    'struct_0x6f0c34df': 'notification_sound',
+    'struct_0xff6c8049': 'notification_sound',
+    'struct_0x830b9ae4': 'notification_sound',
+    'notification_sound_structures': 'notification_sound',
+    'struct_0x226e6308': 'notify_peer',
+    'struct_0xd612e8ef': 'notify_peer',
+    'struct_0xc007cec3': 'notify_peer',
+    'struct_0xb4c83b4c': 'notify_peer',
+    'struct_0x9fd40bd8': 'notify_peer',
+    'notify_peer_structures': 'notify_peer',
+    'struct_0x56730bcc': 'null',
+    'struct_0x3bb842ac': 'outbox',
+    'struct_0x8dee6c44': 'page',
+    'struct_0x8e3f9ebe': 'page',
+    'struct_0xd7a19d69': 'page',
+    'struct_0x556ec7aa': 'page',
+    'struct_0xae891bec': 'page',
+    'struct_0x98657f0d': 'page',
+    'page_structures': 'page',
+    'struct_0x9a8ae1e1': 'page_block',
+    'struct_0xd9d71866': 'page_block',
+    'struct_0xf259a80b': 'page_block',
+    'struct_0x467a0766': 'page_block',
+    'struct_0x1e148390': 'page_block',
+    'struct_0x48870999': 'page_block',
+    'struct_0xbfd064ec': 'page_block',
+    'struct_0xc070d93e': 'page_block',
+    'struct_0x16115a96': 'page_block',
+    'struct_0xf12bb6e1': 'page_block',
+    'struct_0x031f9590': 'page_block',
+    'struct_0xce0d37b0': 'page_block',
+    'struct_0xa44f3ef6': 'page_block',
+    'struct_0xdb20b188': 'page_block',
+    'struct_0x1759c560': 'page_block',
+    'struct_0xe4e88011': 'page_block',
+    'struct_0x13567e8a': 'page_block',
+    'struct_0x65a0fa4d': 'page_block',
+    'struct_0x3d5b64f2': 'page_block',
+    'struct_0x3a58c7f4': 'page_block',
+    'struct_0xa8718dc5': 'page_block',
+    'struct_0x130c8963': 'page_block',
+    'struct_0x8ffa9a1f': 'page_block',
+    'struct_0x263d7c26': 'page_block',
+    'struct_0x76768bed': 'page_block',
+    'struct_0xef1751b5': 'page_block',
+    'struct_0x7c8fe7b6': 'page_block',
+    'struct_0xd935d8fb': 'page_block',
+    'struct_0x4f4456d3': 'page_block',
+    'struct_0x804361ea': 'page_block',
+    'struct_0xbf4dea82': 'page_block',
+    'struct_0xe9c69982': 'page_block',
+    'struct_0x70abc3fd': 'page_block',
+    'struct_0x292c7be9': 'page_block',
+    'struct_0x08b31c4f': 'page_block',
+    'struct_0x31b81a7f': 'page_block',
+    'struct_0x39f23300': 'page_block',
+    'struct_0xcde200d1': 'page_block',
+    'struct_0xbaafe5e0': 'page_block',
+    'page_block_structures': 'page_block',
+    'struct_0x34566b6a': 'page_block',
+    'struct_0x6f747657': 'page_block',
+    'struct_0xb390dc08': 'page_block',
+    'struct_0xe0c0c5e5': 'page_block',
+    'struct_0x25e073fc': 'page_list_item',
+    'struct_0xb92fb6cd': 'page_list_item',
+    'page_list_item_structures': 'page_list_item',
+    'struct_0x5e068047': 'page_list_ordered_item',
+    'struct_0x98dd8936': 'page_list_ordered_item',
+    'page_list_ordered_item_structures': 'page_list_ordered_item',
+    'struct_0xd45ab096': 'password_kdf_algo',
+    'struct_0x3a912d4a': 'password_kdf_algo',
+    'password_kdf_algo_structures': 'password_kdf_algo',
+    'struct_0xa0058751': 'payment_form',
+    'struct_0x7bf6b15c': 'payment_form',
+    'struct_0xb425cfe1': 'payment_form',
+    'payment_form_structures': 'payment_form',
+    'struct_0x88f8f21b': 'payment_form',
+    'struct_0xcdc27a1f': 'payment_form',
+    'struct_0x70c4fe03': 'payment_receipt',
+    'struct_0xdabbf83a': 'payment_receipt',
+    'payment_receipt_structures': 'payment_receipt',
+    'struct_0x1e8caaeb': 'payment_receipt',
+    'struct_0x909c3f94': 'payment_receipt',
+    'struct_0xb6213cdf': 'payment_receipt',
+    'struct_0x0d6b48f7': 'payments',
+    'struct_0x0f91b065': 'payments',
+    'struct_0x13bbe8b3': 'payments',
+    'struct_0x146e958d': 'payments',
+    'struct_0x19a13f71': 'payments',
+    'struct_0x1dab80b7': 'payments',
+    'struct_0x227d824b': 'payments',
+    'struct_0x2478d1cc': 'payments',
+    'struct_0x2757ba54': 'payments',
+    'struct_0x284a1096': 'payments',
+    'struct_0x2d03522f': 'payments',
+    'struct_0x2e79d779': 'payments',
+    'struct_0x37148dbb': 'payments',
+    'struct_0x394e7f21': 'payments',
+    'struct_0x3e24e573': 'payments',
+    'struct_0x5869a553': 'payments',
+    'struct_0x5ff58f20': 'payments',
+    'struct_0x7ed5348a': 'payments',
+    'struct_0x8e51b4c1': 'payments',
+    'struct_0x98d5ea1d': 'payments',
+    'struct_0x9fc19eb6': 'payments',
+    'struct_0xaed0cbd9': 'payments',
+    'struct_0xb4d5d859': 'payments',
+    'struct_0xb6c8f12b': 'payments',
+    'struct_0xb7d998f0': 'payments',
+    'struct_0xc92bb73b': 'payments',
+    'struct_0xd1451883': 'payments',
+    'struct_0xd1d7efc5': 'payments',
+    'struct_0xd83d70c1': 'payments',
+    'struct_0xd91ffad6': 'payments',
+    'struct_0xdffd50d3': 'payments',
+    'struct_0xe4fca4a3': 'payments',
+    'struct_0xf4239425': 'payments',
+    'struct_0xf568028a': 'payments',
+    'struct_0xf6e26854': 'payments',
+    'struct_0xfb8fe43c': 'payments',
+    'struct_0xe175e66f': 'payments_giveaway_info',
+    'struct_0x00cd5570': 'payments_giveaway_info',
+    'struct_0x4367daa0': 'payments_giveaway_info',
+    'payments_giveaway_info_structures': 'payments_giveaway_info',
+    'struct_0xd8411139': 'payments_payment_result',
+    'struct_0x4e5f810d': 'payments_payment_result',
+    'payments_payment_result_structures': 'payments_payment_result',
+    'struct_0xa2a5371e': 'peer',
+    'struct_0xbddde532': 'peer',
+    'struct_0x59511722': 'peer',
+    'struct_0x9db1bc6d': 'peer',
+    'struct_0x36c6019a': 'peer',
+    'struct_0xbad0e5bb': 'peer',
+    'peer_structures': 'peer',
+    'struct_0xf8ec284b': 'peer_located',
+    'struct_0xca461b5d': 'peer_located',
+    'peer_located_structures': 'peer_located',
+    'struct_0x99622c0c': 'peer_notify_settings',
+    'struct_0xa83b0426': 'peer_notify_settings',
+    'struct_0x9acda4c0': 'peer_notify_settings',
+    'struct_0xaf509d20': 'peer_notify_settings',
+    'struct_0x8d5e11ee': 'peer_notify_settings',
+    'struct_0x70a68512': 'peer_notify_settings',
+    'peer_notify_settings_structures': 'peer_notify_settings',
+    'struct_0xf47741f7': 'peer_settings',
+    'struct_0x0d8c39ec': 'peer_settings',
+    'struct_0xa8639d72': 'peer_settings',
+    'struct_0xacd66c5e': 'peer_settings',
+    'struct_0xa518110d': 'peer_settings',
+    'struct_0x733f2961': 'peer_settings',
+    'peer_settings_structures': 'peer_settings',
+    'struct_0x041845db': 'phone',
+    'struct_0x17d54f61': 'phone',
+    'struct_0x1ab21940': 'phone',
+    'struct_0x1c50d144': 'phone',
+    'struct_0x1ca6ac0a': 'phone',
+    'struct_0x1e36fded': 'phone',
+    'struct_0x204bd158': 'phone',
+    'struct_0x219c34e6': 'phone',
+    'struct_0x277add7e': 'phone',
+    'struct_0x2dbf3432': 'phone',
+    'struct_0x2efe1722': 'phone',
+    'struct_0x3660c311': 'phone',
+    'struct_0x3bd2b4a0': 'phone',
+    'struct_0x41248786': 'phone',
+    'struct_0x42ff96ed': 'phone',
+    'struct_0x48cdc6d8': 'phone',
+    'struct_0x500377f9': 'phone',
+    'struct_0x55451fa9': 'phone',
+    'struct_0x5680e342': 'phone',
+    'struct_0x575e1f8c': 'phone',
+    'struct_0x59ead627': 'phone',
+    'struct_0x74bbb43d': 'phone',
+    'struct_0x7a777135': 'phone',
+    'struct_0x7b393160': 'phone',
+    'struct_0x80eb48af': 'phone',
+    'struct_0x9e727aad': 'phone',
+    'struct_0xa5273abf': 'phone',
+    'struct_0xa6c4600c': 'phone',
+    'struct_0xafe5623f': 'phone',
+    'struct_0xb132ff7b': 'phone',
+    'struct_0xb2cbc1c0': 'phone',
+    'struct_0xb59cf977': 'phone',
+    'struct_0xc558d8ab': 'phone',
+    'struct_0xcbea6bc4': 'phone',
+    'struct_0xd0e482b2': 'phone',
+    'struct_0xd61e1df3': 'phone',
+    'struct_0xd8aa840f': 'phone',
+    'struct_0xdeb3abbf': 'phone',
+    'struct_0xdfc909ab': 'phone',
+    'struct_0xe6aa647f': 'phone',
+    'struct_0xec82e140': 'phone',
+    'struct_0xef7c213a': 'phone',
+    'struct_0xf128c708': 'phone',
+    'struct_0xf47751b6': 'phone',
+    'struct_0xff7a9383': 'phone',
+    'struct_0x45361c63': 'phone_call',
+    'struct_0x14b0ed0c': 'phone_call',
+    'struct_0x3ba5940c': 'phone_call',
+    'struct_0x30535af5': 'phone_call',
+    'struct_0x967f7c67': 'phone_call',
+    'struct_0x5366c915': 'phone_call',
+    'struct_0x22fd7181': 'phone_call',
+    'struct_0xeed42858': 'phone_call',
+    'struct_0xc5226f17': 'phone_call',
+    'struct_0x50ca4de1': 'phone_call',
+    'struct_0xf9d25503': 'phone_call',
+    'phone_call_structures': 'phone_call',
+    'struct_0x57adc690': 'phone_call_discard_reason',
+    'struct_0xfaf7e8c9': 'phone_call_discard_reason',
+    'struct_0x85e42301': 'phone_call_discard_reason',
+    'struct_0xe095c1a0': 'phone_call_discard_reason',
+    'struct_0xafe2b839': 'phone_call_discard_reason',
+    'phone_call_discard_reason_structures': 'phone_call_discard_reason',
+    'struct_0xfc878fc8': 'phone_call_protocol',
+    'struct_0xa2bb35cb': 'phone_call_protocol',
+    'phone_call_protocol_structures': 'phone_call_protocol',
+    'struct_0x9cc123c7': 'phone_connection',
+    'struct_0x635fe375': 'phone_connection',
+    'phone_connection_structures': 'phone_connection',
+    'struct_0x9c477dd8': 'photo',
+    'struct_0xcded42fe': 'photo',
+    'struct_0xc3838076': 'photo',
+    'struct_0x2331b22d': 'photo',
+    'struct_0x22b56751': 'photo',
+    'struct_0xd07504a5': 'photo',
+    'struct_0xfb197a65': 'photo',
+    'struct_0x9288dd29': 'photo',
+    'photo_structures': 'photo',
+    'struct_0xd8214d41': 'photo_size',
+    'struct_0x77bfb61b': 'photo_size',
+    'struct_0x0e17e23c': 'photo_size',
+    'struct_0x5aa86a51': 'photo_size',
+    'struct_0xe0b0bc2e': 'photo_size',
+    'struct_0xe9a734fa': 'photo_size',
+    'struct_0x75c78e60': 'photo_size',
+    'struct_0x021e1ad6': 'photo_size',
+    'struct_0xfa3efb95': 'photo_size',
+    'photo_size_structures': 'photo_size',
+    'struct_0x0388a3b5': 'photos',
+    'struct_0x09e82039': 'photos',
+    'struct_0x20212ca8': 'photos',
+    'struct_0x87cf7f2f': 'photos',
+    'struct_0x91cd32a8': 'photos',
+    'struct_0xe14c4a71': 'photos',
+    'struct_0x8dca6aa5': 'photos_photos',
+    'struct_0x15051f54': 'photos_photos',
+    'photos_photos_structures': 'photos_photos',
+    'struct_0x58747131': 'poll',
+    'struct_0x86e18161': 'poll',
+    'struct_0xaf746786': 'poll',
+    'struct_0xd5529d06': 'poll',
+    'poll_structures': 'poll',
+    'struct_0xff16e2ca': 'poll_answer',
+    'struct_0x6ca9c2e9': 'poll_answer',
+    'poll_answer_structures': 'poll_answer',
+    'struct_0x5755785a': 'poll_results',
+    'struct_0xc87024a2': 'poll_results',
+    'struct_0xbadcc1a3': 'poll_results',
+    'struct_0xdcb82ea3': 'poll_results',
+    'struct_0x7adf2420': 'poll_results',
+    'poll_results_structures': 'poll_results',
+    'struct_0x3b6ddad2': 'poll_results',
+    'struct_0x79c059f7': 'premium_gift_option',
+    'struct_0x74c34319': 'premium_gift_option',
+    'premium_gift_option_structures': 'premium_gift_option',
+    'struct_0x5f2d1df2': 'premium_subscription_option',
+    'struct_0xb6f11ebe': 'premium_subscription_option',
+    'premium_subscription_option_structures': 'premium_subscription_option',
+    'struct_0xbc2eab30': 'privacy_key',
+    'struct_0x39491cc8': 'privacy_key',
+    'struct_0x500e6dfa': 'privacy_key',
+    'struct_0x42ffd42b': 'privacy_key',
+    'struct_0x0697f414': 'privacy_key',
+    'struct_0xa486b761': 'privacy_key',
+    'struct_0x3d662b7b': 'privacy_key',
+    'struct_0x69ec56a3': 'privacy_key',
+    'struct_0xd19ae46d': 'privacy_key',
+    'struct_0x96151fed': 'privacy_key',
+    'struct_0x2000a518': 'privacy_key',
+    'struct_0x2ca4fdf8': 'privacy_key',
+    'struct_0x17d348d2': 'privacy_key',
+    'privacy_key_structures': 'privacy_key',
+    'struct_0xf888fa1a': 'privacy_rule',
+    'struct_0xe4621141': 'privacy_rule',
+    'struct_0x6b134e8e': 'privacy_rule',
+    'struct_0x41c87565': 'privacy_rule',
+    'struct_0x65427b82': 'privacy_rule',
+    'struct_0x8b73e763': 'privacy_rule',
+    'struct_0xb8905fb2': 'privacy_rule',
+    'struct_0xfffe1bac': 'privacy_rule',
+    'struct_0xf7e8d89b': 'privacy_rule',
+    'struct_0xece9814b': 'privacy_rule',
+    'struct_0x21461b5d': 'privacy_rule',
+    'struct_0xf6a5f82f': 'privacy_rule',
+    'privacy_rule_structures': 'privacy_rule',
+    'struct_0x8935fc73': 'reaction',
+    'struct_0x79f5d419': 'reaction',
+    'struct_0x1b2286b8': 'reaction',
+    'struct_0x523da4eb': 'reaction',
+    'reaction_structures': 'reaction',
+    'struct_0xa3d1cb80': 'reaction_count',
+    'struct_0x6fb250d1': 'reaction_count',
+    'reaction_count_structures': 'reaction_count',
+    'struct_0x4a4ff172': 'read',
+    'struct_0xa384b779': 'received',
+    'struct_0xb2da71d2': 'recent_me_url',
+    'struct_0xbc0a57dc': 'recent_me_url',
+    'struct_0x46e1d13d': 'recent_me_url',
+    'struct_0xeb49081d': 'recent_me_url',
+    'struct_0xb92c09e2': 'recent_me_url',
+    'recent_me_url_structures': 'recent_me_url',
+    'struct_0x85dd99d1': 'reply_markup',
+    'struct_0xa03e5b85': 'reply_markup',
+    'struct_0x86b40b08': 'reply_markup',
+    'struct_0x3502758c': 'reply_markup',
+    'struct_0xf4108aa0': 'reply_markup',
+    'struct_0x48a30254': 'reply_markup',
+    'reply_markup_structures': 'reply_markup',
+    'struct_0x77608b83': 'reply_markup',
+    'struct_0x5a6d7395': 'report',
+    'struct_0xdbd4feed': 'report_reason',
+    'struct_0xc1e4a2b1': 'report_reason',
+    'struct_0xf5ddd6e7': 'report_reason',
+    'struct_0x9b89f93a': 'report_reason',
+    'struct_0x58dbcab8': 'report_reason',
+    'struct_0x1e22c78d': 'report_reason',
+    'struct_0xadf44ee3': 'report_reason',
+    'struct_0x2e59d922': 'report_reason',
+    'report_reason_structures': 'report_reason',
+    'struct_0xf0e4e0b6': 'report_result',
+    'struct_0x6f09ac31': 'report_result',
+    'struct_0x8db33c4b': 'report_result',
+    'report_result_structures': 'report_result',
+    'struct_0x7903e3d9': 'report_result',
+    'struct_0x5f3b8a00': 'request_peer_type',
+    'struct_0xc9f06e1b': 'request_peer_type',
+    'struct_0x339bef6c': 'request_peer_type',
+    'request_peer_type_structures': 'request_peer_type',
+    'struct_0xd072acb4': 'restriction_reason',
+    'restriction_reason_structures': 'restriction_reason',
+    'struct_0x1ccb966a': 'rich_text',
+    'struct_0xc7fb5e01': 'rich_text',
+    'struct_0x081ccf4f': 'rich_text',
+    'struct_0xc12622c4': 'rich_text',
+    'struct_0xed6a8504': 'rich_text',
+    'struct_0x3c2884c1': 'rich_text',
+    'struct_0x35553762': 'rich_text',
+    'struct_0xdc3d824f': 'rich_text',
+    'struct_0xde5a0dd6': 'rich_text',
+    'struct_0x744694e0': 'rich_text',
+    'struct_0x6724abc4': 'rich_text',
+    'struct_0x9bf8bb95': 'rich_text',
+    'struct_0x7e6260d7': 'rich_text',
+    'struct_0xd912a59c': 'rich_text',
+    'struct_0x034b8621': 'rich_text',
+    'struct_0x6c3f19b9': 'rich_text',
+    'rich_text_structures': 'rich_text',
+    'struct_0xe0277a62': 'secure',
+    'struct_0x64199744': 'secure_file',
+    'struct_0x7d09c27e': 'secure_file',
+    'secure_file_structures': 'secure_file',
+    'struct_0xbbf2dda0': 'secure_password_kdf_algo',
+    'struct_0x86471d92': 'secure_password_kdf_algo',
+    'struct_0x004a8537': 'secure_password_kdf_algo',
+    'secure_password_kdf_algo_structures': 'secure_password_kdf_algo',
+    'struct_0x21ec5a5f': 'secure_plain_data',
+    'struct_0x7d6099dd': 'secure_plain_data',
+    'secure_plain_data_structures': 'secure_plain_data',
+    'struct_0x829d99da': 'secure_required_type',
+    'struct_0x027477b4': 'secure_required_type',
+    'secure_required_type_structures': 'secure_required_type',
+    'struct_0x7a700873': 'secure_value_error',
+    'struct_0x00be3dfa': 'secure_value_error',
+    'struct_0x666220e9': 'secure_value_error',
+    'struct_0x868a2aa5': 'secure_value_error',
+    'struct_0xa1144770': 'secure_value_error',
+    'struct_0x869d758f': 'secure_value_error',
+    'struct_0xe8a40bd9': 'secure_value_error',
+    'struct_0x34636dd8': 'secure_value_error',
+    'struct_0xe537ced6': 'secure_value_error',
+    'secure_value_error_structures': 'secure_value_error',
+    'struct_0xcbe31e26': 'secure_value_type',
+    'struct_0x99e3806a': 'secure_value_type',
+    'struct_0xa0d0744b': 'secure_value_type',
+    'struct_0xfc36954e': 'secure_value_type',
+    'struct_0x89137c0d': 'secure_value_type',
+    'struct_0x8e3ca7ee': 'secure_value_type',
+    'struct_0x9d2a81e3': 'secure_value_type',
+    'struct_0xea02ec33': 'secure_value_type',
+    'struct_0x3dac6a00': 'secure_value_type',
+    'struct_0x8b883488': 'secure_value_type',
+    'struct_0x06e425c4': 'secure_value_type',
+    'struct_0xb320aadb': 'secure_value_type',
+    'struct_0x99a48f23': 'secure_value_type',
+    'secure_value_type_structures': 'secure_value_type',
+    'struct_0xdd6a8f48': 'send_message_action',
+    'struct_0xd52f73f7': 'send_message_action',
+    'struct_0x92042ff7': 'send_message_action',
+    'struct_0xe6ac8a6f': 'send_message_action',
+    'struct_0xf351d7ab': 'send_message_action',
+    'struct_0xd1d34a26': 'send_message_action',
+    'struct_0x8faee98e': 'send_message_action',
+    'struct_0xe9763aec': 'send_message_action',
+    'struct_0xfd5ec8f5': 'send_message_action',
+    'struct_0x176f8ba1': 'send_message_action',
+    'struct_0x628cbc6f': 'send_message_action',
+    'struct_0xb05ac6b1': 'send_message_action',
+    'struct_0x88f27fbc': 'send_message_action',
+    'struct_0x243e1c66': 'send_message_action',
+    'struct_0x16bf744e': 'send_message_action',
+    'struct_0xdbda9246': 'send_message_action',
+    'struct_0x990a3c1a': 'send_message_action',
+    'struct_0xaa0cd9e4': 'send_message_action',
+    'struct_0xd92c2285': 'send_message_action',
+    'struct_0xa187d66f': 'send_message_action',
+    'struct_0x25972bcb': 'send_message_action',
+    'struct_0xb665902e': 'send_message_action',
+    'send_message_action_structures': 'send_message_action',
+    'struct_0x882f76bb': 'simple',
+    'struct_0x167bd90b': 'star',
+    'struct_0x84aa3a9c': 'star',
+    'struct_0x02cc73c8': 'star_gift',
+    'struct_0x5c62d151': 'star_gift',
+    'struct_0xf2fe7e4a': 'star_gift',
+    'struct_0x3482f322': 'star_gift',
+    'struct_0x6a1407cd': 'star_gift',
+    'struct_0xaea174ee': 'star_gift',
+    'struct_0x49c577cd': 'star_gift',
+    'star_gift_structures': 'star_gift',
+    'struct_0x39d99013': 'star_gift_attribute',
+    'struct_0x13acff19': 'star_gift_attribute',
+    'struct_0x94271762': 'star_gift_attribute',
+    'struct_0xe0bff26c': 'star_gift_attribute',
+    'struct_0xc02c4f4b': 'star_gift_attribute',
+    'star_gift_attribute_structures': 'star_gift_attribute',
+    'struct_0x901689ea': 'star_gifts',
+    'struct_0xa388a368': 'star_gifts',
+    'star_gifts_structures': 'star_gifts',
+    'struct_0x032512c5': 'stars',
+    'struct_0x0bd915c0': 'stars',
+    'struct_0x104fcfa7': 'stars',
+    'struct_0x1513e7b0': 'stars',
+    'struct_0x23830de9': 'stars',
+    'struct_0x2a2a697c': 'stars',
+    'struct_0x54236209': 'stars',
+    'struct_0x5e0589f1': 'stars',
+    'struct_0x60eaefa1': 'stars',
+    'struct_0x673ac2f9': 'stars',
+    'struct_0x74bf076b': 'stars',
+    'struct_0x7998c914': 'stars',
+    'struct_0x7f18176a': 'stars',
+    'struct_0x94ce852a': 'stars',
+    'struct_0x95f389b1': 'stars',
+    'struct_0x9c9abcb1': 'stars',
+    'struct_0xa1974d72': 'stars',
+    'struct_0xaed6e4f5': 'stars',
+    'struct_0xb455a106': 'stars',
+    'struct_0xbd1efd3e': 'stars',
+    'struct_0xc00ec7d3': 'stars',
+    'struct_0xc4563590': 'stars',
+    'struct_0xc7770878': 'stars',
+    'struct_0xcaa2f60b': 'stars',
+    'struct_0xcc5bebb3': 'stars',
+    'struct_0xd06e93a8': 'stars',
+    'struct_0xd3c96bc8': 'stars',
+    'struct_0xfc84653f': 'stars',
+    'struct_0x69279795': 'stars_input_saved_star_gift',
+    'struct_0xf101aa7f': 'stars_input_saved_star_gift',
+    'stars_input_saved_star_gift_structures': 'stars_input_saved_star_gift',
+    'struct_0x206ad49e': 'stars_paid_reaction_privacy',
+    'struct_0x1f0c1ad9': 'stars_paid_reaction_privacy',
+    'struct_0xdc6cfcf0': 'stars_paid_reaction_privacy',
+    'stars_paid_reaction_privacy_structures': 'stars_paid_reaction_privacy',
+    'struct_0xbbfa316c': 'stars_status',
+    'struct_0x6c9ce8ed': 'stars_status',
+    'stars_status_structures': 'stars_status',
+    'struct_0x2e6eab1a': 'stars_subscription',
+    'struct_0x538ecf18': 'stars_subscription',
+    'struct_0xd073f1e6': 'stars_subscription',
+    'stars_subscription_structures': 'stars_subscription',
+    'struct_0x05416d58': 'stars_subscription',
+    'struct_0xcc7079b2': 'stars_transaction',
+    'struct_0xaa00c898': 'stars_transaction',
+    'struct_0x2db5418f': 'stars_transaction',
+    'struct_0x433aeb2b': 'stars_transaction',
+    'struct_0xee7522d5': 'stars_transaction',
+    'struct_0x0a9ee4c2': 'stars_transaction',
+    'struct_0x35d4f276': 'stars_transaction',
+    'struct_0x64dfc926': 'stars_transaction',
+    'struct_0xecd50924': 'stars_transaction',
+    'struct_0xa39fd94a': 'stars_transaction',
+    'stars_transaction_structures': 'stars_transaction',
+    'struct_0xd80da15d': 'stars_transaction_peer',
+    'struct_0xb457b375': 'stars_transaction_peer',
+    'struct_0x7b560a0b': 'stars_transaction_peer',
+    'struct_0xe92fd902': 'stars_transaction_peer',
+    'struct_0x250dbaf8': 'stars_transaction_peer',
+    'struct_0x95f2bfe4': 'stars_transaction_peer',
+    'struct_0x60682812': 'stars_transaction_peer',
+    'struct_0xf9677aad': 'stars_transaction_peer',
+    'stars_transaction_peer_structures': 'stars_transaction_peer',
+    'struct_0x396ca5fc': 'stats',
+    'struct_0x47a971e0': 'stats',
+    'struct_0x535f779d': 'stats',
+    'struct_0x5407e297': 'stats',
+    'struct_0x5f150144': 'stats',
+    'struct_0x621d5fa0': 'stats',
+    'struct_0x70990b6d': 'stats',
+    'struct_0x7fe91c14': 'stats',
+    'struct_0x87158466': 'stats',
+    'struct_0x93037e20': 'stats',
+    'struct_0x9d04af9b': 'stats',
+    'struct_0x9df4faad': 'stats',
+    'struct_0xa6437ef6': 'stats',
+    'struct_0xab42441a': 'stats',
+    'struct_0xb637edaf': 'stats',
+    'struct_0xb6e0a3f5': 'stats',
+    'struct_0xcb43acde': 'stats',
+    'struct_0xcbce2fe0': 'stats',
+    'struct_0xd7584c87': 'stats',
+    'struct_0xdcdf8607': 'stats',
+    'struct_0xec659737': 'stats',
+    'struct_0xef7ff916': 'stats',
+    'struct_0xf788ee19': 'stats',
+    'struct_0x557e2cc4': 'stats_broadcast_revenue_transaction',
+    'struct_0x5a590978': 'stats_broadcast_revenue_transaction',
+    'struct_0x42d30d2e': 'stats_broadcast_revenue_transaction',
+    'stats_broadcast_revenue_transaction_structures': 'stats_broadcast_revenue_transaction',
+    'struct_0x8ea464b6': 'stats_graph',
+    'struct_0x4a27eb2d': 'stats_graph',
+    'struct_0xbedc9822': 'stats_graph',
+    'stats_graph_structures': 'stats_graph',
+    'struct_0x8a480e27': 'stats_post_interaction_counters',
+    'struct_0xe7058e7f': 'stats_post_interaction_counters',
+    'stats_post_interaction_counters_structures': 'stats_post_interaction_counters',
+    'struct_0x01f2bf4a': 'stats_public_forward',
+    'struct_0xedf3add0': 'stats_public_forward',
+    'stats_public_forward_structures': 'stats_public_forward',
+    'struct_0xa7a43b17': 'sticker_set',
+    'struct_0x5585a139': 'sticker_set',
+    'struct_0x6a90bcb7': 'sticker_set',
+    'struct_0xeeb46f27': 'sticker_set',
+    'struct_0x40e237a8': 'sticker_set',
+    'struct_0xcd303b41': 'sticker_set',
+    'struct_0xd7df217a': 'sticker_set',
+    'struct_0x2dd14edc': 'sticker_set',
+    'sticker_set_structures': 'sticker_set',
+    'struct_0x3407e51b': 'sticker_set_covered',
+    'struct_0x1aed5ee5': 'sticker_set_covered',
+    'struct_0x40d13c0e': 'sticker_set_covered',
+    'struct_0x77b15d1c': 'sticker_set_covered',
+    'struct_0x6410a5d2': 'sticker_set_covered',
+    'sticker_set_covered_structures': 'sticker_set_covered',
+    'struct_0x12b299d4': 'sticker_set_covered',
+    'struct_0xfcfeb29c': 'sticker_set_covered',
+    'struct_0x124b1c00': 'stickers',
+    'struct_0x284b3639': 'stickers',
+    'struct_0x4696459a': 'stickers',
+    'struct_0x4dafc503': 'stickers',
+    'struct_0x85fea03f': 'stickers',
+    'struct_0x8653febe': 'stickers',
+    'struct_0x87704394': 'stickers',
+    'struct_0x9021ab67': 'stickers',
+    'struct_0xa76a5392': 'stickers',
+    'struct_0xf5537ebc': 'stickers',
+    'struct_0xf7760f51': 'stickers',
+    'struct_0xffa0a496': 'stickers',
+    'struct_0xffb6d4ca': 'stickers',
+    'struct_0xaa963b05': 'storage_file_type',
+    'struct_0xb3cea0e4': 'storage_file_type',
+    'struct_0x1081464c': 'storage_file_type',
+    'struct_0x0a4f63c0': 'storage_file_type',
+    'struct_0xcae1aadf': 'storage_file_type',
+    'struct_0xae1e508d': 'storage_file_type',
+    'struct_0x528a0677': 'storage_file_type',
+    'struct_0x007efe0e': 'storage_file_type',
+    'struct_0x4b09ebbc': 'storage_file_type',
+    'struct_0x40bc6f52': 'storage_file_type',
+    'storage_file_type_structures': 'storage_file_type',
+    'struct_0x042f1f61': 'stories',
+    'struct_0x0b297e9b': 'stories',
+    'struct_0x0be77b4a': 'stories',
+    'struct_0x1923fa8c': 'stories',
+    'struct_0x19d8eb45': 'stories',
+    'struct_0x28e16cc8': 'stories',
+    'struct_0x2c4ada50': 'stories',
+    'struct_0x374fef40': 'stories',
+    'struct_0x3fc9053b': 'stories',
+    'struct_0x4959427a': 'stories',
+    'struct_0x50cd067c': 'stories',
+    'struct_0x535983c3': 'stories',
+    'struct_0x5774ca74': 'stories',
+    'struct_0x57bbd166': 'stories',
+    'struct_0x5821a5dc': 'stories',
+    'struct_0x5dd8c3c8': 'stories',
+    'struct_0x60f67660': 'stories',
+    'struct_0x63c3dd0a': 'stories',
+    'struct_0x6b7da746': 'stories',
+    'struct_0x7b8def20': 'stories',
+    'struct_0x7ed23c57': 'stories',
+    'struct_0x7fd736b2': 'stories',
+    'struct_0x86f8613c': 'stories',
+    'struct_0x9a75a1ef': 'stories',
+    'struct_0x9ae228e2': 'stories',
+    'struct_0x9b5ae7f9': 'stories',
+    'struct_0xa556dac8': 'stories',
+    'struct_0xa56a8b60': 'stories',
+    'struct_0xae59db5f': 'stories',
+    'struct_0xb2028afb': 'stories',
+    'struct_0xb4352016': 'stories',
+    'struct_0xb583ba46': 'stories',
+    'struct_0xb9b2881f': 'stories',
+    'struct_0xbd0415c4': 'stories',
+    'struct_0xc448415c': 'stories',
+    'struct_0xc7dfdfdd': 'stories',
+    'struct_0xcae68768': 'stories',
+    'struct_0xd1810907': 'stories',
+    'struct_0xde9eed1d': 'stories',
+    'struct_0xe2de7737': 'stories',
+    'struct_0xe4e6694b': 'stories',
+    'struct_0xe87acbc0': 'stories',
+    'struct_0xeeb0d625': 'stories',
+    'struct_0x1158fe3e': 'stories_all_stories',
+    'struct_0x6efc5e81': 'stories_all_stories',
+    'stories_all_stories_structures': 'stories_all_stories',
+    'struct_0x712e27fd': 'stories_all_stories',
+    'struct_0x4b3e14d6': 'stories_boost',
+    'struct_0x2a1c8c71': 'stories_boost',
+    'stories_boost_structures': 'stories_boost',
+    'struct_0x37381085': 'stories_media_area',
+    'struct_0x5787686d': 'stories_media_area',
+    'struct_0xbe82db9c': 'stories_media_area',
+    'struct_0xcad5452d': 'stories_media_area',
+    'struct_0xdf8b3b22': 'stories_media_area',
+    'struct_0x14455871': 'stories_media_area',
+    'struct_0x770416af': 'stories_media_area',
+    'struct_0xb282217f': 'stories_media_area',
+    'struct_0x2271f2bf': 'stories_media_area',
+    'struct_0x49a6549c': 'stories_media_area',
+    'struct_0x4386f849': 'stories_media_area',
+    'struct_0x855f223e': 'stories_media_area',
+    'stories_media_area_structures': 'stories_media_area',
+    'struct_0xde4c5d93': 'stories_media_area',
+    'struct_0xcfc9e002': 'stories_media_area_coordinates',
+    'struct_0x03d1ea4e': 'stories_media_area_coordinates',
+    'stories_media_area_coordinates_structures': 'stories_media_area_coordinates',
+    'struct_0x9a35e999': 'stories_peer_stories',
+    'struct_0x8611a200': 'stories_peer_stories',
+    'stories_peer_stories_structures': 'stories_peer_stories',
+    'struct_0xb2539d54': 'stories_prepaid_giveaway',
+    'struct_0x9a9d77e0': 'stories_prepaid_giveaway',
+    'stories_prepaid_giveaway_structures': 'stories_prepaid_giveaway',
+    'struct_0xaa5f789c': 'story',
+    'struct_0xb826e150': 'story_fwd_header',
+    'story_fwd_header_structures': 'story_fwd_header',
+    'struct_0x79b26a24': 'story_item',
+    'struct_0xaf6365a1': 'story_item',
+    'struct_0x44c457ce': 'story_item',
+    'struct_0x562aa637': 'story_item',
+    'struct_0x51e6ee4f': 'story_item',
+    'struct_0xffadc913': 'story_item',
+    'story_item_structures': 'story_item',
+    'struct_0x6090d6d5': 'story_reaction',
+    'struct_0xbbab2643': 'story_reaction',
+    'struct_0xcfcd0f13': 'story_reaction',
+    'story_reaction_structures': 'story_reaction',
+    'struct_0xb0bdeac5': 'story_view',
+    'struct_0x9083670b': 'story_view',
+    'struct_0xbd74cf49': 'story_view',
+    'story_view_structures': 'story_view',
+    'struct_0xd36760cf': 'story_views',
+    'struct_0xc64c0b97': 'story_views',
+    'struct_0x8d595cd6': 'story_views',
+    'story_views_structures': 'story_views',
+    'struct_0x59d78fc5': 'story_views_list',
+    'struct_0x46e9b9ec': 'story_views_list',
+    'story_views_list_structures': 'story_views_list',
+    'struct_0x028f1114': 'theme',
+    'struct_0xf7d90ce0': 'theme',
+    'struct_0x483d270c': 'theme',
+    'struct_0xa00e67d6': 'theme',
+    'struct_0xe802b8dc': 'theme',
+    'theme_structures': 'theme',
+    'struct_0xfa58b6d4': 'theme_settings',
+    'struct_0x8db4e76c': 'theme_settings',
+    'struct_0x9c14984a': 'theme_settings',
+    'theme_settings_structures': 'theme_settings',
+    'struct_0x161d9628': 'top_peer_category',
+    'struct_0x1e76a78c': 'top_peer_category',
+    'struct_0xbd17a14a': 'top_peer_category',
+    'struct_0x148677e2': 'top_peer_category',
+    'struct_0xa8406ca9': 'top_peer_category',
+    'struct_0xfbeec0f0': 'top_peer_category',
+    'struct_0xab661b5b': 'top_peer_category',
+    'struct_0x0637b7ed': 'top_peer_category',
+    'struct_0xfd9e7bec': 'top_peer_category',
+    'top_peer_category_structures': 'top_peer_category',
+    'struct_0x24f40e77': 'update',
+    'struct_0xd5a41724': 'update',
+    'struct_0xaca1657b': 'update',
+    'struct_0xbb9bb9a5': 'update',
+    'struct_0xf89a6a4e': 'update',
+    'struct_0xa20db0e5': 'update',
+    'struct_0x5bb98608': 'update',
+    'struct_0xf2ebdb4e': 'update',
+    'struct_0x571d2742': 'update',
+    'struct_0x1710f156': 'update',
+    'struct_0xd6b19546': 'update',
+    'struct_0x2f2f21bf': 'update',
+    'struct_0x62ba04d9': 'update',
+    'struct_0x1592b79d': 'update',
+    'struct_0x6e6fe51c': 'update',
+    'struct_0x6a7e7366': 'update',
+    'struct_0x05492a13': 'update',
+    'struct_0x4e90bfd6': 'update',
+    'struct_0xb75f99a9': 'update',
+    'struct_0x8c88c923': 'update',
+    'struct_0x1bf335b9': 'update',
+    'struct_0x31c24808': 'update',
+    'struct_0x19360dc0': 'update',
+    'struct_0x1f2b0afd': 'update',
+    'struct_0x39a51dfb': 'update',
+    'struct_0x12bcbd9a': 'update',
+    'struct_0x86fccf85': 'update',
+    'struct_0xe5bdf8de': 'update',
+    'struct_0x28373599': 'update',
+    'struct_0xf226ac08': 'update',
+    'struct_0x0b783982': 'update',
+    'struct_0x4d712f2e': 'update',
+    'struct_0x871fb939': 'update',
+    'struct_0xbec268ef': 'update',
+    'struct_0x985d3abb': 'update',
+    'struct_0x695c9e7c': 'update',
+    'struct_0xe32f3d77': 'update',
+    'struct_0xfb4c496c': 'update',
+    'struct_0xe40370a3': 'update',
+    'struct_0x6f7863f4': 'update',
+    'struct_0x39c67432': 'update',
+    'struct_0x7f891213': 'update',
+    'struct_0xe511996d': 'update',
+    'struct_0x3dda5451': 'update',
+    'struct_0x83487af0': 'update',
+    'struct_0x564fe691': 'update',
+    'struct_0xb4a2e88d': 'update',
+    'struct_0x97d64341': 'update',
+    'struct_0x108d941f': 'update',
+    'struct_0xc01e857f': 'update',
+    'struct_0xf74e932b': 'update',
+    'struct_0xebe46819': 'update',
+    'struct_0x56022f4d': 'update',
+    'struct_0xb23fc698': 'update',
+    'struct_0xd7ca61a2': 'update',
+    'struct_0xea29055d': 'update',
+    'struct_0xee3b272a': 'update',
+    'struct_0xa229dd06': 'update',
+    'struct_0xe16459c3': 'update',
+    'struct_0x1b49ec6d': 'update',
+    'struct_0x8951abef': 'update',
+    'struct_0xa7848924': 'update',
+    'struct_0x5e1b3cb8': 'update',
+    'struct_0xab0f6b1e': 'update',
+    'struct_0x26ffde7d': 'update',
+    'struct_0xebe07752': 'update',
+    'struct_0xed85eab5': 'update',
+    'struct_0x2661bf09': 'update',
+    'struct_0x88617090': 'update',
+    'struct_0xfa0f3ca2': 'update',
+    'struct_0x74d8be99': 'update',
+    'struct_0x2c084dc1': 'update',
+    'struct_0x0084cd5a': 'update',
+    'struct_0xb4afcfb0': 'update',
+    'struct_0x9a422c20': 'update',
+    'struct_0x9c974fdf': 'update',
+    'struct_0xa5d72105': 'update',
+    'struct_0x9375341e': 'update',
+    'struct_0x7084a7be': 'update',
+    'struct_0x635b4c09': 'update',
+    'struct_0x2f2ba99f': 'update',
+    'struct_0xf2a71983': 'update',
+    'struct_0xd29a27f4': 'update',
+    'struct_0xc32d5b12': 'update',
+    'struct_0x7d627683': 'update',
+    'struct_0xf227868c': 'update',
+    'struct_0x20529438': 'update',
+    'struct_0x17b7a20b': 'update',
+    'struct_0x3504914f': 'update',
+    'struct_0x30f443db': 'update',
+    'struct_0x75b3b798': 'update',
+    'struct_0x7063c3db': 'update',
+    'struct_0x8e5e9873': 'update',
+    'struct_0x1b3f4df7': 'update',
+    'struct_0x688a30aa': 'update',
+    'struct_0x8216fba3': 'update',
+    'struct_0x46560264': 'update',
+    'struct_0x38fe25b7': 'update',
+    'struct_0x0bb2d201': 'update',
+    'struct_0x922e6e10': 'update',
+    'struct_0xf8227181': 'update',
+    'struct_0x07761198': 'update',
+    'struct_0x54c01850': 'update',
+    'struct_0x14b85813': 'update',
+    'struct_0xfe198602': 'update',
+    'struct_0x192efbe3': 'update',
+    'struct_0x07b68920': 'update',
+    'struct_0xae3f101d': 'update',
+    'struct_0xaeaf9e74': 'update',
+    'struct_0x686c85a6': 'update',
+    'struct_0xf9470ab2': 'update',
+    'struct_0xf53da717': 'update',
+    'struct_0x53e6f1ec': 'update',
+    'struct_0x3e050d0f': 'update',
+    'struct_0x566fe7cd': 'update',
+    'struct_0x1824e40b': 'update',
+    'struct_0xdfd961f5': 'update',
+    'struct_0x4e80a379': 'update',
+    'struct_0xa584b019': 'update',
+    'struct_0x283bd312': 'update',
+    'struct_0x8b725fce': 'update',
+    'struct_0xa8ae3eb1': 'update',
+    'update_structures': 'update',
+    'struct_0x0fb85198': 'update',
+    'struct_0x14b24500': 'update',
+    'struct_0x18b7a10d': 'update',
+    'struct_0x5a73a98c': 'update',
+    'struct_0x6056dba5': 'update',
+    'struct_0x767cde44': 'update',
+    'struct_0x90866cee': 'update',
+    'struct_0xbbb6b4a3': 'update',
+    'struct_0xccf08ad6': 'update',
+    'struct_0xe9baa668': 'update',
+    'struct_0xf385c1f6': 'update',
+    'struct_0xfebe5491': 'update',
+    'struct_0x74ae4240': 'updates',
+    'struct_0x313bc7f8': 'updates',
+    'struct_0x9015e101': 'updates',
+    'struct_0x78d4dec1': 'updates',
+    'struct_0x4d6deea5': 'updates',
+    'struct_0x725b04c3': 'updates',
+    'struct_0xe317af7e': 'updates',
+    'updates_structures': 'updates',
+    'struct_0x03173d78': 'updates',
+    'struct_0x25939651': 'updates',
+    'struct_0xedd4882a': 'updates',
+    'struct_0x3e11affb': 'updates_channel_difference',
+    'struct_0x2064674e': 'updates_channel_difference',
+    'struct_0xa4bcc6fe': 'updates_channel_difference',
+    'updates_channel_difference_structures': 'updates_channel_difference',
+    'struct_0x00f49ca0': 'updates_difference',
+    'struct_0xa8fb1981': 'updates_difference',
+    'struct_0x4afe8f6d': 'updates_difference',
+    'struct_0x5d75a138': 'updates_difference',
+    'updates_difference_structures': 'updates_difference',
+    'struct_0xa56c2a3e': 'updates_difference',
+    'struct_0x21e753bc': 'upload',
+    'struct_0x24e6818d': 'upload',
+    'struct_0x395f69da': 'upload',
+    'struct_0x91dc3f31': 'upload',
+    'struct_0x9b2754a8': 'upload',
+    'struct_0xb304a621': 'upload',
+    'struct_0xbe5335be': 'upload',
+    'struct_0xc7025931': 'upload',
+    'struct_0xde7b673d': 'upload',
+    'struct_0xa99fca4f': 'upload_cdn_file',
+    'struct_0xeea8e46e': 'upload_cdn_file',
+    'upload_cdn_file_structures': 'upload_cdn_file',
+    'struct_0x096a18d5': 'upload_file',
+    'struct_0xf18cda44': 'upload_file',
+    'upload_file_structures': 'upload_file',
+    'struct_0xf39b035c': 'upload_file',
+    'struct_0xa9d6db1f': 'url_auth_result',
+    'struct_0x92d33a0e': 'url_auth_result',
+    'struct_0x8f8c0e4e': 'url_auth_result',
+    'url_auth_result_structures': 'url_auth_result',
+    'struct_0x020b1422': 'user',
+    'struct_0x4b46c37e': 'user',
+    'struct_0x59476956': 'user',
+    'struct_0x685f5e21': 'user',
+    'struct_0x83314fca': 'user',
+    'struct_0x4fe9cce0': 'user',
+    'struct_0x215c4438': 'user',
+    'struct_0xeb602f25': 'user',
+    'struct_0xcab35e18': 'user',
+    'struct_0xf2fb8319': 'user',
+    'struct_0xd3bc4b7a': 'user',
+    'struct_0xabb5f120': 'user',
+    'struct_0x8f97c628': 'user',
+    'struct_0x5d99adee': 'user',
+    'struct_0x3ff6ecb0': 'user',
+    'struct_0x938458c1': 'user',
+    'struct_0x2e13f4c3': 'user',
+    'struct_0x720535ec': 'user',
+    'struct_0x1c60e608': 'user',
+    'struct_0xd6016d7a': 'user',
+    'struct_0x200250ba': 'user',
+    'struct_0x22e8ceb0': 'user',
+    'struct_0x5214c89d': 'user',
+    'struct_0x075cf7a8': 'user',
+    'struct_0xd9ccc4ef': 'user',
+    'struct_0xb29ad7cc': 'user',
+    'struct_0xd10d979a': 'user',
+    'struct_0x22e49072': 'user',
+    'struct_0x7007b451': 'user',
+    'user_structures': 'user',
+    'struct_0xb4073647': 'user',
+    'struct_0xb54b5acf': 'user',
+    'struct_0xd2234ea0': 'user_full',
+    'struct_0x8555f3c2': 'user_full',
+    'struct_0x4d975bbc': 'user_full',
+    'struct_0x979d2376': 'user_full',
+    'struct_0x1f58e369': 'user_full',
+    'struct_0xcc997720': 'user_full',
+    'struct_0xecdadceb': 'user_full',
+    'struct_0x670bbc9c': 'user_full',
+    'struct_0x22ff3e85': 'user_full',
+    'struct_0xb9b12c6c': 'user_full',
+    'struct_0x4fe1cc86': 'user_full',
+    'struct_0x93eadb53': 'user_full',
+    'struct_0xf8d32aed': 'user_full',
+    'struct_0xec6d41e3': 'user_full',
+    'struct_0xc4b1fc3f': 'user_full',
+    'struct_0x8c72ea81': 'user_full',
+    'struct_0xcf366521': 'user_full',
+    'struct_0xd697ff05': 'user_full',
+    'struct_0x139a9a77': 'user_full',
+    'struct_0x745559cc': 'user_full',
+    'struct_0x8ea4a881': 'user_full',
+    'struct_0xedf17c12': 'user_full',
+    'user_full_structures': 'user_full',
+    'struct_0x120b1ab9': 'user_full',
+    'struct_0x21108ff7': 'user_full',
+    'struct_0x3ace484c': 'user_full',
+    'struct_0x5a0a066d': 'user_full',
+    'struct_0x8c92b098': 'user_full',
+    'struct_0xac5c1af7': 'user_full',
+    'struct_0xdd0c66f2': 'user_full',
+    'struct_0xe519abab': 'user_full',
+    'struct_0xef156a5c': 'user_full',
+    'struct_0xf93cd45c': 'user_full',
+    'struct_0x69d3ab26': 'user_profile_photo',
+    'struct_0xecd75d8c': 'user_profile_photo',
+    'struct_0x4f11bae1': 'user_profile_photo',
+    'struct_0xd559d8c8': 'user_profile_photo',
+    'struct_0x990d1493': 'user_profile_photo',
+    'struct_0xcc656077': 'user_profile_photo',
+    'struct_0x82d1f706': 'user_profile_photo',
+    'user_profile_photo_structures': 'user_profile_photo',
+    'struct_0x008c703f': 'user_status',
+    'struct_0x541a1d1a': 'user_status',
+    'struct_0x07bf09fc': 'user_status',
+    'struct_0x09d05049': 'user_status',
+    'struct_0x65899777': 'user_status',
+    'struct_0x77ebc742': 'user_status',
+    'struct_0xedb93949': 'user_status',
+    'struct_0x7b197dc8': 'user_status',
+    'struct_0xe26f42f1': 'user_status',
+    'struct_0xcf7d64b1': 'user_status',
+    'user_status_structures': 'user_status',
+    'struct_0x62d706b8': 'users',
+    'struct_0x315a4974': 'users',
+    'users_structures': 'users',
+    'struct_0x0d91a548': 'users',
+    'struct_0x3b6d152e': 'users',
+    'struct_0xa622aa10': 'users',
+    'struct_0xb60f5918': 'users',
+    'struct_0xee9f4a4d': 'video',
+    'struct_0xf72887d3': 'video',
+    'struct_0x55555553': 'video',
+    'struct_0x5a04a49f': 'video',
+    'struct_0x388fa391': 'video',
+    'struct_0xc10658a8': 'video',
+    'video_structures': 'video',
+    'struct_0x435bb987': 'video_size',
+    'struct_0xe831c556': 'video_size',
+    'struct_0xde33b094': 'video_size',
+    'struct_0x0da082fe': 'video_size',
+    'struct_0xf85c413c': 'video_size',
+    'video_size_structures': 'video_size',
+    'struct_0xa437c3ed': 'wall_paper',
+    'struct_0xf04f91ec': 'wall_paper',
+    'struct_0x8af40b25': 'wall_paper',
+    'struct_0xe0804116': 'wall_paper',
+    'wall_paper_structures': 'wall_paper',
+    'struct_0xa12f40b8': 'wall_paper_settings',
+    'struct_0x05086cf8': 'wall_paper_settings',
+    'struct_0x1dc1bca4': 'wall_paper_settings',
+    'struct_0x372efcd0': 'wall_paper_settings',
+    'wall_paper_settings_structures': 'wall_paper_settings',
+    'struct_0x0c14557c': 'web',
+    'struct_0x0c94511c': 'web',
+    'struct_0x4d22ff98': 'web',
+    'struct_0x890c3d89': 'web',
+    'struct_0xf9c8bcc6': 'web_document',
+    'struct_0xc61acbd8': 'web_document',
+    'struct_0x1c570ed1': 'web_document',
+    'web_document_structures': 'web_document',
+    'struct_0xe89c45b2': 'web_page',
+    'struct_0xfa64e172': 'web_page',
+    'struct_0x5f07b4bc': 'web_page',
+    'struct_0xa31ea0b5': 'web_page',
+    'struct_0x211a1788': 'web_page',
+    'struct_0xeb1477e8': 'web_page',
+    'struct_0xd41a5167': 'web_page',
+    'struct_0x7311ca11': 'web_page',
+    'struct_0xb0d13e47': 'web_page',
+    'struct_0xc586da1c': 'web_page',
+    'struct_0x85849473': 'web_page',
+    'struct_0xca820ed7': 'web_page',
+    'web_page_structures': 'web_page',
+    'struct_0x54b56617': 'web_page_attribute',
+    'struct_0x939a4671': 'web_page_attribute',
+    'struct_0x2e94c3e7': 'web_page_attribute',
+    'struct_0x50cc03d3': 'web_page_attribute',
+    'struct_0xcf6f6db8': 'web_page_attribute',
+    'web_page_attribute_structures': 'web_page_attribute',
+}
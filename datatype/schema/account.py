@@ -0,0 +1,1128 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0194cb3b, 'account_input_business_greeting_message')
+    def struct_0x0194cb3b(self):
+        return (
+            'shortcut_id' / Int32ul,
+            'recipients' / self.struct_0x6f8b32aa(),
+            'no_activity_days' / Int32ul)
+
+    @constructor(0x032da4cf, 'account_verify_email')
+    def struct_0x032da4cf(self):
+        return (
+            'purpose' / self.email_verify_purpose_structures('purpose'),
+            'verification' / self.email_verification_structures('verification'))
+
+    @constructor(0x06dd654c, 'account_get_reactions_notify_settings')
+    def struct_0x06dd654c(self):
+        return []
+
+    @constructor(0x07967d36, 'account_get_wall_papers')
+    def struct_0x07967d36(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x08fc711d, 'account_get_account_ttl')
+    def struct_0x08fc711d(self):
+        return []
+
+    @constructor(0x09c469cd, 'account_input_business_intro')
+    def struct_0x09c469cd(self):
+        return Struct(
+            'sname' / Computed('account_input_business_intro'),
+            'signature' / Hex(Const(0x09c469cd, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_sticker=1),
+            'title' / TString,
+            'description' / TString,
+            'sticker' / If(this.flags.has_sticker, self.input_document_structures('sticker')))
+
+    @constructor(0x0f578105, 'account_get_recent_emoji_statuses')
+    def struct_0x0f578105(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x114ff30d, 'account_contact_birthdays')
+    def struct_0x114ff30d(self):
+        return (
+            'contacts' / self.vector(self.struct_0x1d998733(), 'contacts'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x11679fa7, 'account_input_business_chat_link')
+    def struct_0x11679fa7(self):
+        return Struct(
+            'sname' / Computed('account_input_business_chat_link'),
+            'signature' / Hex(Const(0x11679fa7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_entities=1,
+                                has_title=2),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'title' / If(this.flags.has_title, TString))
+
+    @constructor(0x12b3ad31, 'account_get_notify_settings')
+    def struct_0x12b3ad31(self):
+        return ['peer' / self.input_notify_peer_structures('peer')]
+
+    @constructor(0x1527bcac, 'secure_secret_settings')
+    def struct_0x1527bcac(self):
+        return (
+            'secure_algo' / self.secure_password_kdf_algo_structures('secure_algo'),
+            'secure_secret' / TBytes,
+            'secure_secret_id' / Int64ul)
+
+    @constructor(0x17d7f87b, 'account_connected_bots')
+    def struct_0x17d7f87b(self):
+        return (
+            'connected_bots' / self.vector(self.struct_0xbd068601(), 'connected_bots'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x18201aae, 'account_clear_recent_emoji_statuses')
+    def struct_0x18201aae(self):
+        return []
+
+    @constructor(0x182e6d6f, 'account_get_web_authorizations')
+    def struct_0x182e6d6f(self):
+        return []
+
+    @constructor(0x187fa0ca, 'secure_value')
+    def struct_0x187fa0ca(self):
+        return Struct(
+            'sname' / Computed('secure_value'),
+            'signature' / Hex(Const(0x187fa0ca, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_data=1,
+                                has_front_side=2,
+                                has_reverse_side=4,
+                                has_selfie=8,
+                                has_translation=64,
+                                has_files=16,
+                                has_plain_data=32),
+            'type' / self.secure_value_type_structures('type'),
+            'data' / If(this.flags.has_data, self.struct_0x8aeabec3()),
+            'front_side' / If(this.flags.has_front_side, self.secure_file_structures('front_side')),
+            'reverse_side' / If(this.flags.has_reverse_side, self.secure_file_structures('reverse_side')),
+            'selfie' / If(this.flags.has_selfie, self.secure_file_structures('selfie')),
+            'translation' / If(this.flags.has_translation, self.vector(self.secure_file_structures('translation'), 'translation')),
+            'files' / If(this.flags.has_files, self.vector(self.secure_file_structures('files'), 'files')),
+            'plain_data' / If(this.flags.has_plain_data, self.secure_plain_data_structures('plain_data')),
+            'hash' / TBytes)
+
+    @constructor(0x1b3faa88, 'account_send_confirm_phone_code')
+    def struct_0x1b3faa88(self):
+        return (
+            'hash' / TString,
+            'settings' / self.struct_0xad253d78())
+
+    @constructor(0x1c3db333, 'account_upload_theme')
+    def struct_0x1c3db333(self):
+        return Struct(
+            'sname' / Computed('account_upload_theme'),
+            'signature' / Hex(Const(0x1c3db333, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_thumb=1),
+            'file' / self.input_file_structures('file'),
+            'thumb' / If(this.flags.has_thumb, self.input_file_structures('thumb')),
+            'file_name' / TString,
+            'mime_type' / TString)
+
+    @constructor(0x1d998733, 'account_contact_birthday')
+    def struct_0x1d998733(self):
+        return (
+            'contact_id' / Int64ul,
+            'birthday' / self.struct_0x6c8e1e06())
+
+    @constructor(0x1e109708, 'account_paid_messages_revenue')
+    def struct_0x1e109708(self):
+        return ['stars_amount' / Int64ul]
+
+    @constructor(0x1edaaac2, 'account_set_global_privacy_settings')
+    def struct_0x1edaaac2(self):
+        return ['settings' / self.struct_0xc9d8df1c()]
+
+    @constructor(0x2442485e, 'account_set_account_ttl')
+    def struct_0x2442485e(self):
+        return ['ttl' / self.struct_0xb8d0afdf()]
+
+    @constructor(0x2714d86c, 'account_check_username')
+    def struct_0x2714d86c(self):
+        return ['username' / TString]
+
+    @constructor(0x2d01b9ef, 'account_reset_web_authorization')
+    def struct_0x2d01b9ef(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x316ce548, 'account_set_reactions_notify_settings')
+    def struct_0x316ce548(self):
+        return ['settings' / self.struct_0x56e34970()]
+
+    @constructor(0x33f0ea47, 'secure_credentials_encrypted')
+    def struct_0x33f0ea47(self):
+        return (
+            'data' / TBytes,
+            'hash' / TBytes,
+            'secret' / TBytes)
+
+    @constructor(0x35a9e0d5, 'account_get_channel_restricted_status_emojis')
+    def struct_0x35a9e0d5(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x38df3532, 'account_update_device_locked')
+    def struct_0x38df3532(self):
+        return ['period' / Int32ul]
+
+    @constructor(0x3dea5b03, 'account_save_ringtone')
+    def struct_0x3dea5b03(self):
+        return (
+            'id' / self.input_document_structures('id'),
+            'unsave' / TBool)
+
+    @constructor(0x3e0bdd7c, 'account_update_username')
+    def struct_0x3e0bdd7c(self):
+        return ['username' / TString]
+
+    @constructor(0x40f48462, 'account_change_authorization_settings')
+    def struct_0x40f48462(self):
+        return Struct(
+            'sname' / Computed('account_change_authorization_settings'),
+            'signature' / Hex(Const(0x40f48462, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_confirmed=8,
+                                has_encrypted_requests_disabled=1,
+                                has_call_requests_disabled=2),
+            'hash' / Int64ul,
+            'encrypted_requests_disabled' / If(this.flags.has_encrypted_requests_disabled, TBool),
+            'call_requests_disabled' / If(this.flags.has_call_requests_disabled, TBool))
+
+    @constructor(0x418d4e0b, 'account_delete_account')
+    def struct_0x418d4e0b(self):
+        return ['reason' / TString]
+
+    @constructor(0x43d8521d, 'account_update_connected_bot')
+    def struct_0x43d8521d(self):
+        return Struct(
+            'sname' / Computed('account_update_connected_bot'),
+            'signature' / Hex(Const(0x43d8521d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_reply=1,
+                                is_deleted=2),
+            'bot' / self.input_user_structures('bot'),
+            'recipients' / self.struct_0xc4e5921e())
+
+    @constructor(0x449e0b51, 'account_get_tmp_password')
+    def struct_0x449e0b51(self):
+        return (
+            'password' / self.input_check_password_srp_structures('password'),
+            'period' / Int32ul)
+
+    @constructor(0x4b00e066, 'account_update_business_work_hours')
+    def struct_0x4b00e066(self):
+        return Struct(
+            'sname' / Computed('account_update_business_work_hours'),
+            'signature' / Hex(Const(0x4b00e066, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_business_work_hours=1),
+            'business_work_hours' / If(this.flags.has_business_work_hours, self.struct_0x8c92b098()))
+
+    @constructor(0x4bff8ea0, 'account_authorizations')
+    def struct_0x4bff8ea0(self):
+        return (
+            'authorization_ttl_days' / Int32ul,
+            'authorizations' / self.vector(self.struct_0xad01d61d(), 'authorizations'))
+
+    @constructor(0x4c9409f6, 'account_decline_password_reset')
+    def struct_0x4c9409f6(self):
+        return []
+
+    @constructor(0x4dd3a7f6, 'account_verify_phone')
+    def struct_0x4dd3a7f6(self):
+        return (
+            'phone_number' / TString,
+            'phone_code_hash' / TString,
+            'phone_code' / TString)
+
+    @constructor(0x4ea4c80f, 'account_get_connected_bots')
+    def struct_0x4ea4c80f(self):
+        return []
+
+    @constructor(0x50a04e45, 'account_privacy_rules')
+    def struct_0x50a04e45(self):
+        return (
+            'rules' / self.vector(self.privacy_rule_structures('rules'), 'rules'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x53577479, 'account_get_notify_exceptions')
+    def struct_0x53577479(self):
+        return Struct(
+            'sname' / Computed('account_get_notify_exceptions'),
+            'signature' / Hex(Const(0x53577479, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_compare_sound=2,
+                                has_peer=1),
+            'peer' / If(this.flags.has_peer, self.input_notify_peer_structures('peer')))
+
+    @constructor(0x548a30f5, 'account_get_password')
+    def struct_0x548a30f5(self):
+        return []
+
+    @constructor(0x5492e5ee, 'account_resolve_business_chat_link')
+    def struct_0x5492e5ee(self):
+        return ['slug' / TString]
+
+    @constructor(0x56da0b3f, 'account_get_auto_download_settings')
+    def struct_0x56da0b3f(self):
+        return []
+
+    @constructor(0x56e34970, 'account_reactions_notify_settings')
+    def struct_0x56e34970(self):
+        return Struct(
+            'sname' / Computed('account_reactions_notify_settings'),
+            'signature' / Hex(Const(0x56e34970, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_messages_notify_from=1,
+                                has_stories_notify_from=2),
+            'messages_notify_from' / If(this.flags.has_messages_notify_from, self.account_reaction_notifications_from_structures('messages_notify_from')),
+            'stories_notify_from' / If(this.flags.has_stories_notify_from, self.account_reaction_notifications_from_structures('stories_notify_from')),
+            'sound' / self.notification_sound_structures('sound'),
+            'show_previews' / TBool)
+
+    @constructor(0x570d6f6f, 'account_get_web_page_preview')
+    def struct_0x570d6f6f(self):
+        return Struct(
+            'sname' / Computed('account_get_web_page_preview'),
+            'signature' / Hex(Const(0x570d6f6f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_entities=8),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')))
+
+    @constructor(0x57e28221, 'account_content_settings')
+    def struct_0x57e28221(self):
+        return Struct(
+            'sname' / Computed('account_content_settings'),
+            'signature' / Hex(Const(0x57e28221, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_sensitive_enabled=1,
+                                is_sensitive_can_change=2))
+
+    @constructor(0x58d6b376, 'account_toggle_username')
+    def struct_0x58d6b376(self):
+        return (
+            'username' / TString,
+            'active' / TBool)
+
+    @constructor(0x5cb367d5, 'account_update_theme')
+    def struct_0x5cb367d5(self):
+        return Struct(
+            'sname' / Computed('account_update_theme'),
+            'signature' / Hex(Const(0x5cb367d5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_slug=1,
+                                has_title=2,
+                                has_document=4,
+                                has_settings=8),
+            'format' / TString,
+            'theme' / self.input_theme_structures('theme'),
+            'slug' / If(this.flags.has_slug, TString),
+            'title' / If(this.flags.has_title, TString),
+            'document' / If(this.flags.has_document, self.input_document_structures('document')),
+            'settings' / If(this.flags.has_settings, self.struct_0x8fde504f()))
+
+    @constructor(0x5e437ed9, 'account_disable_peer_connected_bot')
+    def struct_0x5e437ed9(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x5f2178c3, 'account_confirm_phone')
+    def struct_0x5f2178c3(self):
+        return (
+            'phone_code_hash' / TString,
+            'phone_code' / TString)
+
+    @constructor(0x60073674, 'account_delete_business_chat_link')
+    def struct_0x60073674(self):
+        return ['slug' / TString]
+
+    @constructor(0x63cacf26, 'account_auto_download_settings')
+    def struct_0x63cacf26(self):
+        return (
+            'low' / self.struct_0xbaa57628(),
+            'medium' / self.struct_0xbaa57628(),
+            'high' / self.struct_0xbaa57628())
+
+    @constructor(0x646e1097, 'account_toggle_connected_bot_paused')
+    def struct_0x646e1097(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'paused' / TBool)
+
+    @constructor(0x65ad71dc, 'account_get_multi_wall_papers')
+    def struct_0x65ad71dc(self):
+        return ['wallpapers' / self.vector(self.input_wall_paper_structures('wallpapers'), 'wallpapers')]
+
+    @constructor(0x6628562c, 'account_update_status')
+    def struct_0x6628562c(self):
+        return ['offline' / TBool]
+
+    @constructor(0x66cdafc4, 'account_update_business_greeting_message')
+    def struct_0x66cdafc4(self):
+        return Struct(
+            'sname' / Computed('account_update_business_greeting_message'),
+            'signature' / Hex(Const(0x66cdafc4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_message=1),
+            'message' / If(this.flags.has_message, self.struct_0x0194cb3b()))
+
+    @constructor(0x682d2594, 'account_reset_web_authorizations')
+    def struct_0x682d2594(self):
+        return []
+
+    @constructor(0x6a0d3206, 'account_unregister_device')
+    def struct_0x6a0d3206(self):
+        return (
+            'token_type' / Int32ul,
+            'token' / TString,
+            'other_uids' / self.vector(Int64ul, 'other_uids'))
+
+    @constructor(0x6c5a5b37, 'account_save_wall_paper')
+    def struct_0x6c5a5b37(self):
+        return (
+            'wallpaper' / self.input_wall_paper_structures('wallpaper'),
+            'unsave' / TBool,
+            'settings' / self.wall_paper_settings_structures('settings'))
+
+    @constructor(0x6c8e1e06, 'account_birthday')
+    def struct_0x6c8e1e06(self):
+        return Struct(
+            'sname' / Computed('account_birthday'),
+            'signature' / Hex(Const(0x6c8e1e06, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_year=1),
+            'day' / Int32ul,
+            'month' / Int32ul,
+            'year' / If(this.flags.has_year, Int32ul))
+
+    @constructor(0x6f688aa7, 'account_add_no_paid_messages_exception')
+    def struct_0x6f688aa7(self):
+        return Struct(
+            'sname' / Computed('account_add_no_paid_messages_exception'),
+            'signature' / Hex(Const(0x6f688aa7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_refund_charged=1),
+            'user_id' / self.input_user_structures('user_id'))
+
+    @constructor(0x6f70dde1, 'account_get_business_chat_links')
+    def struct_0x6f70dde1(self):
+        return []
+
+    @constructor(0x6f8b32aa, 'account_input_business_recipients')
+    def struct_0x6f8b32aa(self):
+        return Struct(
+            'sname' / Computed('account_input_business_recipients'),
+            'signature' / Hex(Const(0x6f8b32aa, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_existing_chats=1,
+                                is_new_chats=2,
+                                is_contacts=4,
+                                is_non_contacts=8,
+                                is_exclude_selected=32,
+                                has_users=16),
+            'users' / If(this.flags.has_users, self.vector(self.input_user_structures('users'), 'users')))
+
+    @constructor(0x70c32edb, 'account_change_phone')
+    def struct_0x70c32edb(self):
+        return (
+            'phone_number' / TString,
+            'phone_code_hash' / TString,
+            'phone_code' / TString)
+
+    @constructor(0x7206e458, 'account_get_themes')
+    def struct_0x7206e458(self):
+        return (
+            'format' / TString,
+            'hash' / Int64ul)
+
+    @constructor(0x73665bc2, 'account_get_secure_value')
+    def struct_0x73665bc2(self):
+        return ['types' / self.vector(self.secure_value_type_structures('types'), 'types')]
+
+    @constructor(0x76f36233, 'account_save_auto_download_settings')
+    def struct_0x76f36233(self):
+        return Struct(
+            'sname' / Computed('account_save_auto_download_settings'),
+            'signature' / Hex(Const(0x76f36233, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_low=1,
+                                is_high=2),
+            'settings' / self.struct_0xbaa57628())
+
+    @constructor(0x7727a7d5, 'account_get_channel_default_emoji_statuses')
+    def struct_0x7727a7d5(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x78515775, 'account_update_profile')
+    def struct_0x78515775(self):
+        return Struct(
+            'sname' / Computed('account_update_profile'),
+            'signature' / Hex(Const(0x78515775, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_first_name=1,
+                                has_last_name=2,
+                                has_about=4),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'about' / If(this.flags.has_about, TString))
+
+    @constructor(0x7a7f2a15, 'account_resend_password_email')
+    def struct_0x7a7f2a15(self):
+        return []
+
+    @constructor(0x7ae43737, 'account_install_theme')
+    def struct_0x7ae43737(self):
+        return Struct(
+            'sname' / Computed('account_install_theme'),
+            'signature' / Hex(Const(0x7ae43737, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_dark=1,
+                                has_format=2),
+            'format' / If(this.flags.has_format, TString),
+            'theme' / If(this.flags.has_format, self.input_theme_structures('theme')))
+
+    @constructor(0x7cefa15d, 'account_update_color')
+    def struct_0x7cefa15d(self):
+        return Struct(
+            'sname' / Computed('account_update_color'),
+            'signature' / Hex(Const(0x7cefa15d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_for_profile=2,
+                                has_color=4,
+                                has_background_emoji_id=1),
+            'color' / If(this.flags.has_color, Int32ul),
+            'background_emoji_id' / If(this.flags.has_background_emoji_id, Int64ul))
+
+    @constructor(0x811f854f, 'account_sent_email_code')
+    def struct_0x811f854f(self):
+        return (
+            'email_pattern' / TString,
+            'length' / Int32ul)
+
+    @constructor(0x82574ae5, 'account_send_change_phone_code')
+    def struct_0x82574ae5(self):
+        return (
+            'phone_number' / TString,
+            'settings' / self.struct_0xad253d78())
+
+    @constructor(0x831a83a2, 'account_upload_ringtone')
+    def struct_0x831a83a2(self):
+        return (
+            'file' / self.input_file_structures('file'),
+            'file_name' / TString,
+            'mime_type' / TString)
+
+    @constructor(0x832175e0, 'account_input_business_away_message')
+    def struct_0x832175e0(self):
+        return Struct(
+            'sname' / Computed('account_input_business_away_message'),
+            'signature' / Hex(Const(0x832175e0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_offline_only=1),
+            'shortcut_id' / Int32ul,
+            'schedule' / self.account_business_away_message_schedule_structures('schedule'),
+            'recipients' / self.struct_0x6f8b32aa())
+
+    @constructor(0x8432c21f, 'account_create_theme')
+    def struct_0x8432c21f(self):
+        return Struct(
+            'sname' / Computed('account_create_theme'),
+            'signature' / Hex(Const(0x8432c21f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_document=4,
+                                has_settings=8),
+            'slug' / TString,
+            'title' / TString,
+            'document' / If(this.flags.has_document, self.input_document_structures('document')),
+            'settings' / If(this.flags.has_settings, self.struct_0x8fde504f()))
+
+    @constructor(0x84be5b93, 'account_update_notify_settings')
+    def struct_0x84be5b93(self):
+        return (
+            'peer' / self.input_notify_peer_structures('peer'),
+            'settings' / self.struct_0xcacb6ae2())
+
+    @constructor(0x8851e68e, 'account_create_business_chat_link')
+    def struct_0x8851e68e(self):
+        return ['link' / self.struct_0x11679fa7()]
+
+    @constructor(0x899fe31d, 'account_save_secure_value')
+    def struct_0x899fe31d(self):
+        return (
+            'value' / self.struct_0xdb21d0a7(),
+            'secure_secret_id' / Int64ul)
+
+    @constructor(0x8aeabec3, 'secure_data')
+    def struct_0x8aeabec3(self):
+        return (
+            'data' / TBytes,
+            'data_hash' / TBytes,
+            'secret' / TBytes)
+
+    @constructor(0x8b9b4dae, 'account_get_content_settings')
+    def struct_0x8b9b4dae(self):
+        return []
+
+    @constructor(0x8c3410af, 'account_edit_business_chat_link')
+    def struct_0x8c3410af(self):
+        return (
+            'slug' / TString,
+            'link' / self.struct_0x11679fa7())
+
+    @constructor(0x8d9d742b, 'account_get_theme')
+    def struct_0x8d9d742b(self):
+        return (
+            'format' / TString,
+            'theme' / self.input_theme_structures('theme'),
+            'document_id' / Int64ul)
+
+    @constructor(0x8fde504f, 'input_theme_settings')
+    def struct_0x8fde504f(self):
+        return Struct(
+            'sname' / Computed('input_theme_settings'),
+            'signature' / Hex(Const(0x8fde504f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_message_colors_animated=4,
+                                has_outbox_accent_color=8,
+                                has_message_colors=1,
+                                has_wallpaper=2),
+            'base_theme' / self.base_theme_structures('base_theme'),
+            'accent_color' / Int32ul,
+            'outbox_accent_color' / If(this.flags.has_outbox_accent_color, Int32ul),
+            'message_colors' / If(this.flags.has_message_colors, self.vector(Int32ul, 'message_colors')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.input_wall_paper_structures('wallpaper')),
+            'wallpaper_settings' / If(this.flags.has_wallpaper, self.wall_paper_settings_structures('wallpaper_settings')))
+
+    @constructor(0x8fdf1920, 'account_confirm_password_email')
+    def struct_0x8fdf1920(self):
+        return ['code' / TString]
+
+    @constructor(0x915860ae, 'account_get_default_group_photo_emojis')
+    def struct_0x915860ae(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x9308ce1b, 'account_reset_password')
+    def struct_0x9308ce1b(self):
+        return []
+
+    @constructor(0x98e037bb, 'account_send_verify_email_code')
+    def struct_0x98e037bb(self):
+        return (
+            'purpose' / self.email_verify_purpose_structures('purpose'),
+            'email' / TString)
+
+    @constructor(0x9a23af21, 'account_resolved_business_chat_links')
+    def struct_0x9a23af21(self):
+        return Struct(
+            'sname' / Computed('account_resolved_business_chat_links'),
+            'signature' / Hex(Const(0x9a23af21, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_entities=1),
+            'peer' / self.peer_structures('peer'),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x9a5c33e5, 'account_password_settings')
+    def struct_0x9a5c33e5(self):
+        return Struct(
+            'sname' / Computed('account_password_settings'),
+            'signature' / Hex(Const(0x9a5c33e5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_email=1,
+                                has_secure_settings=2),
+            'email' / If(this.flags.has_email, TString),
+            'secure_settings' / If(this.flags.has_secure_settings, self.struct_0x1527bcac()))
+
+    @constructor(0x9c2d527d, 'account_update_connected_bot')
+    def struct_0x9c2d527d(self):
+        return Struct(
+            'sname' / Computed('account_update_connected_bot'),
+            'signature' / Hex(Const(0x9c2d527d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_reply=1,
+                                is_deleted=2),
+            'bot' / self.input_user_structures('bot'),
+            'recipients' / self.struct_0x6f8b32aa())
+
+    @constructor(0x9cd4eaf9, 'account_get_password_settings')
+    def struct_0x9cd4eaf9(self):
+        return ['password' / self.input_check_password_srp_structures('password')]
+
+    @constructor(0x9e6b131a, 'account_update_business_location')
+    def struct_0x9e6b131a(self):
+        return Struct(
+            'sname' / Computed('account_update_business_location'),
+            'signature' / Hex(Const(0x9e6b131a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_geo_point=2,
+                                has_address=1),
+            'geo_point' / If(this.flags.has_geo_point, self.input_geo_point_structures('geo_point')),
+            'address' / If(this.flags.has_address, TString))
+
+    @constructor(0x9f07c728, 'account_get_contact_sign_up_notification')
+    def struct_0x9f07c728(self):
+        return []
+
+    @constructor(0xa26a7fa5, 'account_update_business_away_message')
+    def struct_0xa26a7fa5(self):
+        return Struct(
+            'sname' / Computed('account_update_business_away_message'),
+            'signature' / Hex(Const(0xa26a7fa5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_message=1),
+            'message' / If(this.flags.has_message, self.struct_0x832175e0()))
+
+    @constructor(0xa59b102f, 'account_update_password_settings')
+    def struct_0xa59b102f(self):
+        return (
+            'password' / self.input_check_password_srp_structures('password'),
+            'new_settings' / self.struct_0xc23727c9())
+
+    @constructor(0xa5a356f9, 'account_send_verify_phone_code')
+    def struct_0xa5a356f9(self):
+        return (
+            'phone_number' / TString,
+            'settings' / self.struct_0xad253d78())
+
+    @constructor(0xa60ab9ce, 'account_get_default_background_emojis')
+    def struct_0xa60ab9ce(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0xa614d034, 'account_update_business_intro')
+    def struct_0xa614d034(self):
+        return Struct(
+            'sname' / Computed('account_update_business_intro'),
+            'signature' / Hex(Const(0xa614d034, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_intro=1),
+            'intro' / If(this.flags.has_intro, self.struct_0x09c469cd()))
+
+    @constructor(0xa6f8f452, 'web_authorization')
+    def struct_0xa6f8f452(self):
+        return (
+            'hash' / Int64ul,
+            'bot_id' / Int64ul,
+            'domain' / TString,
+            'browser' / TString,
+            'platform' / TString,
+            'date_created' / Int32ul,
+            'date_active' / Int32ul,
+            'ip' / TString,
+            'region' / TString)
+
+    @constructor(0xa929597a, 'account_get_authorization_form')
+    def struct_0xa929597a(self):
+        return (
+            'bot_id' / Int64ul,
+            'scope' / TString,
+            'public_key' / TString)
+
+    @constructor(0xad01d61d, 'authorization')
+    def struct_0xad01d61d(self):
+        return Struct(
+            'sname' / Computed('authorization'),
+            'signature' / Hex(Const(0xad01d61d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_current=1,
+                                is_official_app=2,
+                                is_password_pending=4,
+                                is_encrypted_requests_disabled=8,
+                                is_call_requests_disabled=16,
+                                is_unconfirmed=32),
+            'hash' / Int64ul,
+            'device_model' / TString,
+            'platform' / TString,
+            'system_version' / TString,
+            'api_id' / Int32ul,
+            'app_name' / TString,
+            'app_version' / TString,
+            'date_created' / Int32ul,
+            'date_active' / Int32ul,
+            'ip' / TString,
+            'country' / TString,
+            'region' / TString)
+
+    @constructor(0xad253d78, 'code_settings')
+    def struct_0xad253d78(self):
+        return Struct(
+            'sname' / Computed('code_settings'),
+            'signature' / Hex(Const(0xad253d78, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_allow_flashcall=1,
+                                is_current_number=2,
+                                is_allow_app_hash=16,
+                                is_allow_missed_call=32,
+                                is_allow_firebase=128,
+                                is_app_sandbox=256,
+                                is_unknown_number=512,
+                                has_logout_tokens=64),
+            'logout_tokens' / If(this.flags.has_logout_tokens, self.vector(TBytes, 'logout_tokens')),
+            'token' / If(this.flags.is_app_sandbox, TString))
+
+    @constructor(0xad2e1cd8, 'account_authorization_form')
+    def struct_0xad2e1cd8(self):
+        return Struct(
+            'sname' / Computed('account_authorization_form'),
+            'signature' / Hex(Const(0xad2e1cd8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_privacy_policy_url=1),
+            'required_types' / self.vector(self.secure_required_type_structures('required_types'), 'required_types'),
+            'values' / self.vector(self.struct_0x187fa0ca(), 'values'),
+            'errors' / self.vector(self.secure_value_error_structures('errors'), 'errors'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'privacy_policy_url' / If(this.flags.has_privacy_policy_url, TString))
+
+    @constructor(0xb288bc7d, 'account_get_all_secure_values')
+    def struct_0xb288bc7d(self):
+        return []
+
+    @constructor(0xb4ae666f, 'account_business_chat_link')
+    def struct_0xb4ae666f(self):
+        return Struct(
+            'sname' / Computed('account_business_chat_link'),
+            'signature' / Hex(Const(0xb4ae666f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_entities=1,
+                                has_title=2),
+            'link' / TString,
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'title' / If(this.flags.has_title, TString),
+            'views' / Int32ul)
+
+    @constructor(0xb53e8b21, 'account_web_page_preview')
+    def struct_0xb53e8b21(self):
+        return (
+            'media' / self.message_media_structures('media'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xb574b16b, 'account_set_content_settings')
+    def struct_0xb574b16b(self):
+        return Struct(
+            'sname' / Computed('account_set_content_settings'),
+            'signature' / Hex(Const(0xb574b16b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_sensitive_enabled=1))
+
+    @constructor(0xb880bc4b, 'account_delete_secure_value')
+    def struct_0xb880bc4b(self):
+        return ['types' / self.vector(self.secure_value_type_structures('types'), 'types')]
+
+    @constructor(0xb88cf373, 'account_business_bot_recipients')
+    def struct_0xb88cf373(self):
+        return Struct(
+            'sname' / Computed('account_business_bot_recipients'),
+            'signature' / Hex(Const(0xb88cf373, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_existing_chats=1,
+                                is_new_chats=2,
+                                is_contacts=4,
+                                is_non_contacts=8,
+                                is_exclude_selected=32,
+                                has_users=16,
+                                has_exclude_users=64),
+            'users' / If(this.flags.has_users, self.vector(Int64ul, 'users')),
+            'exclude_users' / If(this.flags.has_exclude_users, self.vector(Int64ul, 'exclude_users')))
+
+    @constructor(0xb8d0afdf, 'account_days_ttl')
+    def struct_0xb8d0afdf(self):
+        return ['days' / Int32ul]
+
+    @constructor(0xb9d9a38d, 'account_toggle_sponsored_messages')
+    def struct_0xb9d9a38d(self):
+        return ['enabled' / TBool]
+
+    @constructor(0xbaa57628, 'auto_download_settings')
+    def struct_0xbaa57628(self):
+        return Struct(
+            'sname' / Computed('auto_download_settings'),
+            'signature' / Hex(Const(0xbaa57628, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_disabled=1,
+                                is_video_preload_large=2,
+                                is_audio_preload_next=4,
+                                is_phonecalls_less_data=8),
+            'photo_size_max' / Int32ul,
+            'video_size_max' / Int64ul,
+            'file_size_max' / Int64ul,
+            'video_upload_maxbitrate' / Int32ul,
+            'small_queue_active_operations_max' / Int32ul,
+            'large_queue_active_operations_max' / Int32ul)
+
+    @constructor(0xbb3b9804, 'account_reset_wall_papers')
+    def struct_0xbb3b9804(self):
+        return []
+
+    @constructor(0xbd068601, 'account_connected_bot')
+    def struct_0xbd068601(self):
+        return Struct(
+            'sname' / Computed('account_connected_bot'),
+            'signature' / Hex(Const(0xbd068601, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_reply=1),
+            'bot_id' / Int64ul,
+            'recipients' / self.struct_0xb88cf373())
+
+    @constructor(0xbf899aa0, 'account_set_authorization_ttl')
+    def struct_0xbf899aa0(self):
+        return ['authorization_ttl_days' / Int32ul]
+
+    @constructor(0xc1cbd5b6, 'account_cancel_password_email')
+    def struct_0xc1cbd5b6(self):
+        return []
+
+    @constructor(0xc4e5921e, 'account_input_business_bot_recipients')
+    def struct_0xc4e5921e(self):
+        return Struct(
+            'sname' / Computed('account_input_business_bot_recipients'),
+            'signature' / Hex(Const(0xc4e5921e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_existing_chats=1,
+                                is_new_chats=2,
+                                is_contacts=4,
+                                is_non_contacts=8,
+                                is_exclude_selected=32,
+                                has_users=16,
+                                has_exclude_users=64),
+            'users' / If(this.flags.has_users, self.vector(self.input_user_structures('users'), 'users')),
+            'exclude_users' / If(this.flags.has_exclude_users, self.vector(self.input_user_structures('exclude_users'), 'exclude_users')))
+
+    @constructor(0xc5ba3d86, 'account_report_peer')
+    def struct_0xc5ba3d86(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'reason' / self.report_reason_structures('reason'),
+            'message' / TString)
+
+    @constructor(0xc9d8df1c, 'global_privacy_settings')
+    def struct_0xc9d8df1c(self):
+        return Struct(
+            'sname' / Computed('global_privacy_settings'),
+            'signature' / Hex(Const(0xc9d8df1c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_archive_and_mute_new_noncontact_peers=1,
+                                is_keep_archived_unmuted=2,
+                                is_keep_archived_folders=4,
+                                is_hide_read_marks=8,
+                                is_new_noncontact_peers_require_premium=16,
+                                has_noncontact_peers_paid_stars=32),
+            'noncontact_peers_paid_stars' / If(this.flags.has_noncontact_peers_paid_stars, Int64ul))
+
+    @constructor(0xc9f81ce8, 'account_set_privacy')
+    def struct_0xc9f81ce8(self):
+        return (
+            'key' / self.input_privacy_key_structures('key'),
+            'rules' / self.vector(self.input_privacy_rule_structures('rules'), 'rules'))
+
+    @constructor(0xcacb6ae2, 'input_peer_notify_settings')
+    def struct_0xcacb6ae2(self):
+        return Struct(
+            'sname' / Computed('input_peer_notify_settings'),
+            'signature' / Hex(Const(0xcacb6ae2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_show_previews=1,
+                                has_silent=2,
+                                has_mute_until=4,
+                                has_sound=8,
+                                has_stories_muted=64,
+                                has_stories_hide_sender=128,
+                                has_stories_sound=256),
+            'show_previews' / If(this.flags.has_show_previews, TBool),
+            'silent' / If(this.flags.has_silent, TBool),
+            'mute_until' / If(this.flags.has_mute_until, Int32ul),
+            'sound' / If(this.flags.has_sound, self.notification_sound_structures('sound')),
+            'stories_muted' / If(this.flags.has_stories_muted, TBool),
+            'stories_hide_sender' / If(this.flags.has_stories_hide_sender, TBool),
+            'stories_sound' / If(this.flags.has_stories_sound, self.notification_sound_structures('stories_sound')))
+
+    @constructor(0xcc6e0c11, 'account_update_birthday')
+    def struct_0xcc6e0c11(self):
+        return Struct(
+            'sname' / Computed('account_update_birthday'),
+            'signature' / Hex(Const(0xcc6e0c11, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_birthday=1),
+            'birthday' / If(this.flags.has_birthday, self.struct_0x6c8e1e06()))
+
+    @constructor(0xcff43f61, 'account_set_contact_sign_up_notification')
+    def struct_0xcff43f61(self):
+        return ['silent' / TBool]
+
+    @constructor(0xd638de89, 'account_get_chat_themes')
+    def struct_0xd638de89(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0xd6753386, 'account_get_default_emoji_statuses')
+    def struct_0xd6753386(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0xd89a83a3, 'account_get_requirements_to_contact')
+    def struct_0xd89a83a3(self):
+        return ['id' / self.vector(self.input_user_structures('id'), 'id')]
+
+    @constructor(0xd94305e0, 'account_update_personal_channel')
+    def struct_0xd94305e0(self):
+        return ['channel' / self.input_channel_structures('channel')]
+
+    @constructor(0xdadbc950, 'account_get_privacy')
+    def struct_0xdadbc950(self):
+        return ['key' / self.input_privacy_key_structures('key')]
+
+    @constructor(0xdaeda864, 'account_get_birthdays')
+    def struct_0xdaeda864(self):
+        return []
+
+    @constructor(0xdb21d0a7, 'input_secure_value')
+    def struct_0xdb21d0a7(self):
+        return Struct(
+            'sname' / Computed('input_secure_value'),
+            'signature' / Hex(Const(0xdb21d0a7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_data=1,
+                                has_front_side=2,
+                                has_reverse_side=4,
+                                has_selfie=8,
+                                has_translation=64,
+                                has_files=16,
+                                has_plain_data=32),
+            'type' / self.secure_value_type_structures('type'),
+            'data' / If(this.flags.has_data, self.struct_0x8aeabec3()),
+            'front_side' / If(this.flags.has_front_side, self.input_secure_file_structures('front_side')),
+            'reverse_side' / If(this.flags.has_reverse_side, self.input_secure_file_structures('reverse_side')),
+            'selfie' / If(this.flags.has_selfie, self.input_secure_file_structures('selfie')),
+            'translation' / If(this.flags.has_translation, self.vector(self.input_secure_file_structures('translation'), 'translation')),
+            'files' / If(this.flags.has_files, self.vector(self.input_secure_file_structures('files'), 'files')),
+            'plain_data' / If(this.flags.has_plain_data, self.secure_plain_data_structures('plain_data')))
+
+    @constructor(0xdb64fd34, 'account_tmp_password')
+    def struct_0xdb64fd34(self):
+        return (
+            'tmp_password' / TBytes,
+            'valid_until' / Int32ul)
+
+    @constructor(0xdb7e1747, 'account_reset_notify_settings')
+    def struct_0xdb7e1747(self):
+        return []
+
+    @constructor(0xdd853661, 'account_upload_wall_paper')
+    def struct_0xdd853661(self):
+        return (
+            'file' / self.input_file_structures('file'),
+            'mime_type' / TString,
+            'settings' / self.wall_paper_settings_structures('settings'))
+
+    @constructor(0xdf77f3bc, 'account_reset_authorization')
+    def struct_0xdf77f3bc(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0xe1902288, 'account_get_saved_ringtones')
+    def struct_0xe1902288(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0xe2750328, 'account_get_default_profile_photo_emojis')
+    def struct_0xe2750328(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0xe320c158, 'account_get_authorizations')
+    def struct_0xe320c158(self):
+        return []
+
+    @constructor(0xeb2b4cf6, 'account_get_global_privacy_settings')
+    def struct_0xeb2b4cf6(self):
+        return []
+
+    @constructor(0xec43a2d1, 'account_business_chat_links')
+    def struct_0xec43a2d1(self):
+        return (
+            'links' / self.vector(self.struct_0xb4ae666f(), 'links'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xec86017a, 'account_register_device')
+    def struct_0xec86017a(self):
+        return Struct(
+            'sname' / Computed('account_register_device'),
+            'signature' / Hex(Const(0xec86017a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_no_muted=1),
+            'token_type' / Int32ul,
+            'token' / TString,
+            'app_sandbox' / TBool,
+            'secret' / TBytes,
+            'other_uids' / self.vector(Int64ul, 'other_uids'))
+
+    @constructor(0xed1ecdb0, 'secure_value_hash')
+    def struct_0xed1ecdb0(self):
+        return (
+            'type' / self.secure_value_type_structures('type'),
+            'hash' / TBytes)
+
+    @constructor(0xed56c9fc, 'account_web_authorizations')
+    def struct_0xed56c9fc(self):
+        return (
+            'authorizations' / self.vector(self.struct_0xa6f8f452(), 'authorizations'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xef500eab, 'account_reorder_usernames')
+    def struct_0xef500eab(self):
+        return ['order' / self.vector(TString, 'order')]
+
+    @constructor(0xf1266f38, 'account_get_paid_messages_revenue')
+    def struct_0xf1266f38(self):
+        return ['user_id' / self.input_user_structures('user_id')]
+
+    @constructor(0xf257106c, 'account_save_theme')
+    def struct_0xf257106c(self):
+        return (
+            'theme' / self.input_theme_structures('theme'),
+            'unsave' / TBool)
+
+    @constructor(0xf3ed4c73, 'account_accept_authorization')
+    def struct_0xf3ed4c73(self):
+        return (
+            'bot_id' / Int64ul,
+            'scope' / TString,
+            'public_key' / TString,
+            'value_hashes' / self.vector(self.struct_0xed1ecdb0(), 'value_hashes'),
+            'credentials' / self.struct_0x33f0ea47())
+
+    @constructor(0xfa8cc6f5, 'account_report_profile_photo')
+    def struct_0xfa8cc6f5(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'photo_id' / self.input_photo_structures('photo_id'),
+            'reason' / self.report_reason_structures('reason'),
+            'message' / TString)
+
+    @constructor(0xfbd3de6b, 'account_update_emoji_status')
+    def struct_0xfbd3de6b(self):
+        return ['emoji_status' / self.emoji_status_structures('emoji_status')]
+
+    @constructor(0xfc8ddbea, 'account_get_wall_paper')
+    def struct_0xfc8ddbea(self):
+        return ['wallpaper' / self.input_wall_paper_structures('wallpaper')]
+
+    @constructor(0xfeed5769, 'account_install_wall_paper')
+    def struct_0xfeed5769(self):
+        return (
+            'wallpaper' / self.input_wall_paper_structures('wallpaper'),
+            'settings' / self.wall_paper_settings_structures('settings'))
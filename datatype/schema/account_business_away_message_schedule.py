@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account_business_away_message_schedule of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xc9b9e2b9, 'account_business_away_message_schedule_always')
+    def struct_0xc9b9e2b9(self):
+        return []
+
+    @constructor(0xc3f2f501, 'account_business_away_message_schedule_outside_work_hours')
+    def struct_0xc3f2f501(self):
+        return []
+
+    @constructor(0xcc4d9ecc, 'account_business_away_message_schedule_custom')
+    def struct_0xcc4d9ecc(self):
+        return (
+            'start_date' / TTimestamp,
+            'end_date' / TTimestamp)
+
+    @structures
+    def account_business_away_message_schedule_structures(self, name):
+        tag_map = {
+            0xc9b9e2b9: LazyBound(self.struct_0xc9b9e2b9),
+            0xc3f2f501: LazyBound(self.struct_0xc3f2f501),
+            0xcc4d9ecc: LazyBound(self.struct_0xcc4d9ecc)
+        }
+        return TLUnion(name, tag_map)
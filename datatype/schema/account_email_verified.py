@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account_email_verified of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x2b96cd1b, 'account_email_verified')
+    def struct_0x2b96cd1b(self):
+        return ['email' / TString]
+
+    @constructor(0xe1bb0d61, 'account_email_verified_login')
+    def struct_0xe1bb0d61(self):
+        return (
+            'email' / TString,
+            'sent_code' / self.auth_sent_code_structures('sent_code'))
+
+    @structures
+    def account_email_verified_structures(self, name):
+        tag_map = {
+            0x2b96cd1b: LazyBound(self.struct_0x2b96cd1b),
+            0xe1bb0d61: LazyBound(self.struct_0xe1bb0d61)
+        }
+        return TLUnion(name, tag_map)
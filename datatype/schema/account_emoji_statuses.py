@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account_emoji_statuses of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd08ce645, 'account_emoji_statuses_not_modified')
+    def struct_0xd08ce645(self):
+        return []
+
+    @constructor(0x90c467d1, 'account_emoji_statuses')
+    def struct_0x90c467d1(self):
+        return (
+            'hash' / Int64ul,
+            'statuses' / self.vector(self.emoji_status_structures('statuses'), 'statuses'))
+
+    @structures
+    def account_emoji_statuses_structures(self, name):
+        tag_map = {
+            0xd08ce645: LazyBound(self.struct_0xd08ce645),
+            0x90c467d1: LazyBound(self.struct_0x90c467d1)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account_password of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x957b50fb, 'account_password')
+    def struct_0x957b50fb(self):
+        return Struct(
+            'sname' / Computed('account_password'),
+            'signature' / Hex(Const(0x957b50fb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_recovery=1,
+                                has_secure_values=2,
+                                has_password=4,
+                                has_hint=8,
+                                has_email_unconfirmed_pattern=16,
+                                has_pending_reset_date=32,
+                                has_login_email_pattern=64),
+            'current_algo' / If(this.flags.has_password, self.password_kdf_algo_structures('current_algo')),
+            'srp_b' / If(this.flags.has_password, TBytes),
+            'srp_id' / If(this.flags.has_password, Int64ul),
+            'hint' / If(this.flags.has_hint, TString),
+            'email_unconfirmed_pattern' / If(this.flags.has_email_unconfirmed_pattern, TString),
+            'new_algo' / self.password_kdf_algo_structures('new_algo'),
+            'new_secure_algo' / self.secure_password_kdf_algo_structures('new_secure_algo'),
+            'secure_random' / TBytes,
+            'pending_reset_date' / If(this.flags.has_pending_reset_date, TTimestamp),
+            'login_email_pattern' / If(this.flags.has_login_email_pattern, TString))
+
+    @constructor(0x185b184f, 'account_password_layer144')
+    def struct_0x185b184f(self):
+        return Struct(
+            'sname' / Computed('account_password_layer144'),
+            'signature' / Hex(Const(0x185b184f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_recovery=1,
+                                has_secure_values=2,
+                                has_password=4,
+                                has_hint=8,
+                                has_email_unconfirmed_pattern=16,
+                                has_pending_reset_date=32),
+            'current_algo' / If(this.flags.has_password, self.password_kdf_algo_structures('current_algo')),
+            'srp_b' / If(this.flags.has_password, TBytes),
+            'srp_id' / If(this.flags.has_password, Int64ul),
+            'hint' / If(this.flags.has_hint, TString),
+            'email_unconfirmed_pattern' / If(this.flags.has_email_unconfirmed_pattern, TString),
+            'new_algo' / self.password_kdf_algo_structures('new_algo'),
+            'new_secure_algo' / self.secure_password_kdf_algo_structures('new_secure_algo'),
+            'secure_random' / TBytes,
+            'pending_reset_date' / If(this.flags.has_pending_reset_date, TTimestamp))
+
+    @structures
+    def account_password_structures(self, name):
+        tag_map = {
+            0x957b50fb: LazyBound(self.struct_0x957b50fb),
+            0x185b184f: LazyBound(self.struct_0x185b184f)
+        }
+        return TLUnion(name, tag_map)
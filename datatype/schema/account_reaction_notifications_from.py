@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account_reaction_notifications_from of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xbac3a61a, 'account_reaction_notifications_from_contacts')
+    def struct_0xbac3a61a(self):
+        return []
+
+    @constructor(0x4b9e22a0, 'account_reaction_notifications_from_all')
+    def struct_0x4b9e22a0(self):
+        return []
+
+    @structures
+    def account_reaction_notifications_from_structures(self, name):
+        tag_map = {
+            0xbac3a61a: LazyBound(self.struct_0xbac3a61a),
+            0x4b9e22a0: LazyBound(self.struct_0x4b9e22a0)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account_requirement_to_contact of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x050a9839, 'account_requirement_to_contact_empty')
+    def struct_0x050a9839(self):
+        return []
+
+    @constructor(0xe581e4e9, 'account_requirement_to_contact_premium')
+    def struct_0xe581e4e9(self):
+        return []
+
+    @constructor(0xb4f67e93, 'account_requirement_to_contact_paid_messages')
+    def struct_0xb4f67e93(self):
+        return ['stars_amount' / Int64ul]
+
+    @structures
+    def account_requirement_to_contact_structures(self, name):
+        tag_map = {
+            0x050a9839: LazyBound(self.struct_0x050a9839),
+            0xe581e4e9: LazyBound(self.struct_0xe581e4e9),
+            0xb4f67e93: LazyBound(self.struct_0xb4f67e93)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account_reset_password_result of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xe3779861, 'account_reset_password_failed_wait')
+    def struct_0xe3779861(self):
+        return ['retry_date' / TTimestamp]
+
+    @constructor(0xe9effc7d, 'account_reset_password_requested_wait')
+    def struct_0xe9effc7d(self):
+        return ['until_date' / TTimestamp]
+
+    @constructor(0xe926d63e, 'account_reset_password_ok')
+    def struct_0xe926d63e(self):
+        return []
+
+    @structures
+    def account_reset_password_result_structures(self, name):
+        tag_map = {
+            0xe3779861: LazyBound(self.struct_0xe3779861),
+            0xe9effc7d: LazyBound(self.struct_0xe9effc7d),
+            0xe926d63e: LazyBound(self.struct_0xe926d63e)
+        }
+        return TLUnion(name, tag_map)
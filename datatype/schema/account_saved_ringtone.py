@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account_saved_ringtone of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x1f307eb7, 'account_saved_ringtone_converted')
+    def struct_0x1f307eb7(self):
+        return ['document' / self.document_structures('document')]
+
+    @constructor(0xb7263f6d, 'account_saved_ringtone')
+    def struct_0xb7263f6d(self):
+        return []
+
+    @structures
+    def account_saved_ringtone_structures(self, name):
+        tag_map = {
+            0x1f307eb7: LazyBound(self.struct_0x1f307eb7),
+            0xb7263f6d: LazyBound(self.struct_0xb7263f6d)
+        }
+        return TLUnion(name, tag_map)
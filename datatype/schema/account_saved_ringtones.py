@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account_saved_ringtones of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xfbf6e8b1, 'account_saved_ringtones_not_modified')
+    def struct_0xfbf6e8b1(self):
+        return []
+
+    @constructor(0xc1e92cc5, 'account_saved_ringtones')
+    def struct_0xc1e92cc5(self):
+        return (
+            'hash' / Int64ul,
+            'ringtones' / self.vector(self.document_structures('ringtones'), 'ringtones'))
+
+    @structures
+    def account_saved_ringtones_structures(self, name):
+        tag_map = {
+            0xfbf6e8b1: LazyBound(self.struct_0xfbf6e8b1),
+            0xc1e92cc5: LazyBound(self.struct_0xc1e92cc5)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account_themes of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x9a3d8c6d, 'account_themes')
+    def struct_0x9a3d8c6d(self):
+        return (
+            'hash' / Int64ul,
+            'themes' / self.vector(self.theme_structures('themes'), 'themes'))
+
+    @constructor(0xf41eb622, 'account_themes_not_modified')
+    def struct_0xf41eb622(self):
+        return []
+
+    @structures
+    def account_themes_structures(self, name):
+        tag_map = {
+            0x9a3d8c6d: LazyBound(self.struct_0x9a3d8c6d),
+            0xf41eb622: LazyBound(self.struct_0xf41eb622)
+        }
+        return TLUnion(name, tag_map)
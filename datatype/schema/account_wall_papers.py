@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group account_wall_papers of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x1c199183, 'account_wall_papers_not_modified')
+    def struct_0x1c199183(self):
+        return []
+
+    @constructor(0xcdc3858c, 'account_wall_papers')
+    def struct_0xcdc3858c(self):
+        return (
+            'hash' / Int64ul,
+            'wallpapers' / self.vector(self.wall_paper_structures('wallpapers'), 'wallpapers'))
+
+    @structures
+    def account_wall_papers_structures(self, name):
+        tag_map = {
+            0x1c199183: LazyBound(self.struct_0x1c199183),
+            0xcdc3858c: LazyBound(self.struct_0xcdc3858c)
+        }
+        return TLUnion(name, tag_map)
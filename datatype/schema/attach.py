@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group attach of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x93bf667f, 'attach_menu_bots_bot')
+    def struct_0x93bf667f(self):
+        return (
+            'bot' / self.attach_menu_bot_structures('bot'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
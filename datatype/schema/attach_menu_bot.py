@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group attach_menu_bot of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd90d8dfe, 'attach_menu_bot')
+    def struct_0xd90d8dfe(self):
+        return Struct(
+            'sname' / Computed('attach_menu_bot'),
+            'signature' / Hex(Const(0xd90d8dfe, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_inactive=1,
+                                has_settings=2,
+                                is_request_write_access=4,
+                                is_show_in_attach_menu=8,
+                                is_show_in_side_menu=16,
+                                is_side_menu_disclaimer_needed=32),
+            'bot_id' / Int64ul,
+            'short_name' / TString,
+            'peer_types' / self.vector(self.attach_menu_peer_type_structures('peer_types'), 'peer_types'),
+            'icons' / self.vector(self.struct_0xb2a7386b(), 'icons'))
+
+    @constructor(0xc8aa2cd2, 'attach_menu_bot_layer162')
+    def struct_0xc8aa2cd2(self):
+        return Struct(
+            'sname' / Computed('attach_menu_bot_layer162'),
+            'signature' / Hex(Const(0xc8aa2cd2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_inactive=1,
+                                has_settings=2,
+                                is_request_write_access=4),
+            'bot_id' / Int64ul,
+            'short_name' / TString,
+            'peer_types' / self.vector(self.attach_menu_peer_type_structures('peer_types'), 'peer_types'),
+            'icons' / self.vector(self.struct_0xb2a7386b(), 'icons'))
+
+    @constructor(0xe93cb772, 'attach_menu_bot_layer140')
+    def struct_0xe93cb772(self):
+        return Struct(
+            'sname' / Computed('attach_menu_bot_layer140'),
+            'signature' / Hex(Const(0xe93cb772, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_inactive=1),
+            'bot_id' / Int64ul,
+            'short_name' / TString,
+            'icons' / self.vector(self.struct_0xb2a7386b(), 'icons'))
+
+    @structures
+    def attach_menu_bot_structures(self, name):
+        tag_map = {
+            0xd90d8dfe: LazyBound(self.struct_0xd90d8dfe),
+            0xc8aa2cd2: LazyBound(self.struct_0xc8aa2cd2),
+            0xe93cb772: LazyBound(self.struct_0xe93cb772)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x4576f3f0, 'attach_menu_bot_icon_color')
+    def struct_0x4576f3f0(self):
+        return (
+            'name' / TString,
+            'color' / Int32ul)
+
+    @constructor(0xb2a7386b, 'attach_menu_bot_icon')
+    def struct_0xb2a7386b(self):
+        return Struct(
+            'sname' / Computed('attach_menu_bot_icon'),
+            'signature' / Hex(Const(0xb2a7386b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_colors=1),
+            'name' / TString,
+            'icon' / self.document_structures('icon'),
+            'colors' / If(this.flags.has_colors, self.vector(self.struct_0x4576f3f0(), 'colors')))
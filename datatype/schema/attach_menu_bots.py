@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group attach_menu_bots of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf1d88a5c, 'attach_menu_bots_not_modified')
+    def struct_0xf1d88a5c(self):
+        return []
+
+    @constructor(0x3c4301c0, 'attach_menu_bots')
+    def struct_0x3c4301c0(self):
+        return (
+            'hash' / Int64ul,
+            'bots' / self.vector(self.attach_menu_bot_structures('bots'), 'bots'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def attach_menu_bots_structures(self, name):
+        tag_map = {
+            0xf1d88a5c: LazyBound(self.struct_0xf1d88a5c),
+            0x3c4301c0: LazyBound(self.struct_0x3c4301c0)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group attach_menu_peer_type of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xc32bfa1a, 'attach_menu_peer_type_bot_pm')
+    def struct_0xc32bfa1a(self):
+        return []
+
+    @constructor(0xf146d31f, 'attach_menu_peer_type_pm')
+    def struct_0xf146d31f(self):
+        return []
+
+    @constructor(0x7bfbdefc, 'attach_menu_peer_type_broadcast')
+    def struct_0x7bfbdefc(self):
+        return []
+
+    @constructor(0x0509113f, 'attach_menu_peer_type_chat')
+    def struct_0x0509113f(self):
+        return []
+
+    @constructor(0x7d6be90e, 'attach_menu_peer_type_same_bot_pm')
+    def struct_0x7d6be90e(self):
+        return []
+
+    @structures
+    def attach_menu_peer_type_structures(self, name):
+        tag_map = {
+            0xc32bfa1a: LazyBound(self.struct_0xc32bfa1a),
+            0xf146d31f: LazyBound(self.struct_0xf146d31f),
+            0x7bfbdefc: LazyBound(self.struct_0x7bfbdefc),
+            0x0509113f: LazyBound(self.struct_0x0509113f),
+            0x7d6be90e: LazyBound(self.struct_0x7d6be90e)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group audio of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x586988d8, 'audio_empty_layer45')
+    def struct_0x586988d8(self):
+        return ['id' / Int64ul]
+
+    @constructor(0xf9e35055, 'audio_layer45')
+    def struct_0xf9e35055(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'duration' / Int32ul,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'dc_id' / Int32ul)
+
+    @constructor(0x427425e7, 'audio_old')
+    def struct_0x427425e7(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'user_id' / Int32ul,
+            'date' / TTimestamp,
+            'duration' / Int32ul,
+            'size' / Int32ul,
+            'dc_id' / Int32ul)
+
+    @constructor(0x555555f6, 'audio_encrypted')
+    def struct_0x555555f6(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'user_id' / Int32ul,
+            'date' / TTimestamp,
+            'duration' / Int32ul,
+            'size' / Int32ul,
+            'dc_id' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes)
+
+    @constructor(0xc7ac6496, 'audio_old2')
+    def struct_0xc7ac6496(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'user_id' / Int32ul,
+            'date' / TTimestamp,
+            'duration' / Int32ul,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'dc_id' / Int32ul)
+
+    @structures
+    def audio_structures(self, name):
+        tag_map = {
+            0x586988d8: LazyBound(self.struct_0x586988d8),
+            0xf9e35055: LazyBound(self.struct_0xf9e35055),
+            0x427425e7: LazyBound(self.struct_0x427425e7),
+            0x555555f6: LazyBound(self.struct_0x555555f6),
+            0xc7ac6496: LazyBound(self.struct_0xc7ac6496)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group auth of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0d36bf79, 'auth_check_recovery_password')
+    def struct_0x0d36bf79(self):
+        return ['code' / TString]
+
+    @constructor(0x137948a5, 'auth_password_recovery')
+    def struct_0x137948a5(self):
+        return ['email_pattern' / TString]
+
+    @constructor(0x1f040578, 'auth_cancel_code')
+    def struct_0x1f040578(self):
+        return (
+            'phone_number' / TString,
+            'phone_code_hash' / TString)
+
+    @constructor(0x37096c70, 'auth_recover_password')
+    def struct_0x37096c70(self):
+        return Struct(
+            'sname' / Computed('auth_recover_password'),
+            'signature' / Hex(Const(0x37096c70, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_new_settings=1),
+            'code' / TString,
+            'new_settings' / If(this.flags.has_new_settings, self.struct_0xc23727c9()))
+
+    @constructor(0x3e72ba19, 'auth_log_out')
+    def struct_0x3e72ba19(self):
+        return []
+
+    @constructor(0x3ef1a9bf, 'auth_resend_code')
+    def struct_0x3ef1a9bf(self):
+        return (
+            'phone_number' / TString,
+            'phone_code_hash' / TString)
+
+    @constructor(0x7e960193, 'auth_reset_login_email')
+    def struct_0x7e960193(self):
+        return (
+            'phone_number' / TString,
+            'phone_code_hash' / TString)
+
+    @constructor(0x80eee427, 'auth_sign_up')
+    def struct_0x80eee427(self):
+        return (
+            'phone_number' / TString,
+            'phone_code_hash' / TString,
+            'first_name' / TString,
+            'last_name' / TString)
+
+    @constructor(0x89464b50, 'auth_request_firebase_sms')
+    def struct_0x89464b50(self):
+        return Struct(
+            'sname' / Computed('auth_request_firebase_sms'),
+            'signature' / Hex(Const(0x89464b50, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_safety_net_token=1,
+                                has_ios_push_secret=2),
+            'phone_number' / TString,
+            'phone_code_hash' / TString,
+            'safety_net_token' / If(this.flags.has_safety_net_token, TString),
+            'ios_push_secret' / If(this.flags.has_ios_push_secret, TString))
+
+    @constructor(0x8d52a951, 'auth_sign_in')
+    def struct_0x8d52a951(self):
+        return Struct(
+            'sname' / Computed('auth_sign_in'),
+            'signature' / Hex(Const(0x8d52a951, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_phone_code=1,
+                                has_email_verification=2),
+            'phone_number' / TString,
+            'phone_code_hash' / TString,
+            'phone_code' / If(this.flags.has_phone_code, TString),
+            'email_verification' / If(this.flags.has_email_verification, self.email_verification_structures('email_verification')))
+
+    @constructor(0x8e39261e, 'auth_request_firebase_sms')
+    def struct_0x8e39261e(self):
+        return Struct(
+            'sname' / Computed('auth_request_firebase_sms'),
+            'signature' / Hex(Const(0x8e39261e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_safety_net_token=1,
+                                has_play_integrity_token=4,
+                                has_ios_push_secret=2),
+            'phone_number' / TString,
+            'phone_code_hash' / TString,
+            'safety_net_token' / If(this.flags.has_safety_net_token, TString),
+            'play_integrity_token' / If(this.flags.has_play_integrity_token, TString),
+            'ios_push_secret' / If(this.flags.has_ios_push_secret, TString))
+
+    @constructor(0x95ac5ce4, 'auth_import_login_token')
+    def struct_0x95ac5ce4(self):
+        return ['token' / TBytes]
+
+    @constructor(0x9fab0d1a, 'auth_reset_authorizations')
+    def struct_0x9fab0d1a(self):
+        return []
+
+    @constructor(0xa57a7dad, 'auth_import_authorization')
+    def struct_0xa57a7dad(self):
+        return (
+            'id' / Int64ul,
+            'bytes' / TBytes)
+
+    @constructor(0xa677244f, 'auth_send_code')
+    def struct_0xa677244f(self):
+        return (
+            'phone_number' / TString,
+            'api_id' / Int32ul,
+            'api_hash' / TString,
+            'settings' / self.struct_0xad253d78())
+
+    @constructor(0xb434e2b8, 'auth_exported_authorization')
+    def struct_0xb434e2b8(self):
+        return (
+            'id' / Int64ul,
+            'bytes' / TBytes)
+
+    @constructor(0xb7e085fe, 'auth_export_login_token')
+    def struct_0xb7e085fe(self):
+        return (
+            'api_id' / Int32ul,
+            'api_hash' / TString,
+            'except_ids' / self.vector(Int64ul, 'except_ids'))
+
+    @constructor(0xbcd51581, 'auth_sign_in_old')
+    def struct_0xbcd51581(self):
+        return (
+            'phone_number' / TString,
+            'phone_code_hash' / TString,
+            'phone_code' / TString)
+
+    @constructor(0xc23727c9, 'account_password_input_settings')
+    def struct_0xc23727c9(self):
+        return Struct(
+            'sname' / Computed('account_password_input_settings'),
+            'signature' / Hex(Const(0xc23727c9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_new_algo=1,
+                                has_email=2,
+                                has_new_secure_settings=4),
+            'new_algo' / If(this.flags.has_new_algo, self.password_kdf_algo_structures('new_algo')),
+            'new_password_hash' / If(this.flags.has_new_algo, TBytes),
+            'hint' / If(this.flags.has_new_algo, TString),
+            'email' / If(this.flags.has_email, TString),
+            'new_secure_settings' / If(this.flags.has_new_secure_settings, self.struct_0x1527bcac()))
+
+    @constructor(0xc3a2835f, 'auth_logged_out')
+    def struct_0xc3a2835f(self):
+        return Struct(
+            'sname' / Computed('auth_logged_out'),
+            'signature' / Hex(Const(0xc3a2835f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_future_auth_token=1),
+            'future_auth_token' / If(this.flags.has_future_auth_token, TBytes))
+
+    @constructor(0xcae47523, 'auth_resend_code')
+    def struct_0xcae47523(self):
+        return Struct(
+            'sname' / Computed('auth_resend_code'),
+            'signature' / Hex(Const(0xcae47523, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_reason=1),
+            'phone_number' / TString,
+            'phone_code_hash' / TString,
+            'reason' / If(this.flags.has_reason, TString))
+
+    @constructor(0xcb9deff6, 'auth_report_missing_code')
+    def struct_0xcb9deff6(self):
+        return (
+            'phone_number' / TString,
+            'phone_code_hash' / TString,
+            'mnc' / TString)
+
+    @constructor(0xd18b4d16, 'auth_check_password')
+    def struct_0xd18b4d16(self):
+        return ['password' / self.input_check_password_srp_structures('password')]
+
+    @constructor(0xd897bc66, 'auth_request_password_recovery')
+    def struct_0xd897bc66(self):
+        return []
+
+    @constructor(0xe5bfffcd, 'auth_export_authorization')
+    def struct_0xe5bfffcd(self):
+        return ['dc_id' / Int32ul]
+
+    @constructor(0xe894ad4d, 'auth_accept_login_token')
+    def struct_0xe894ad4d(self):
+        return ['token' / TBytes]
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group auth_authorization of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x44747e9a, 'auth_authorization_sign_up_required')
+    def struct_0x44747e9a(self):
+        return Struct(
+            'sname' / Computed('auth_authorization_sign_up_required'),
+            'signature' / Hex(Const(0x44747e9a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_terms_of_service=1),
+            'terms_of_service' / If(this.flags.has_terms_of_service, self.struct_0x780a0310()))
+
+    @constructor(0x33fb7bb8, 'auth_authorization_old')
+    def struct_0x33fb7bb8(self):
+        return Struct(
+            'sname' / Computed('auth_authorization_old'),
+            'signature' / Hex(Const(0x33fb7bb8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_setup_password_required=2,
+                                has_tmp_sessions=1,
+                                has_future_auth_token=4),
+            'otherwise_relogin_days' / If(this.flags.is_setup_password_required, Int32ul),
+            'tmp_sessions' / If(this.flags.has_tmp_sessions, Int32ul),
+            'future_auth_token' / If(this.flags.has_future_auth_token, TBytes),
+            'user' / self.user_structures('user'))
+
+    @constructor(0x2ea2c0d4, 'auth_authorization')
+    def struct_0x2ea2c0d4(self):
+        return Struct(
+            'sname' / Computed('auth_authorization'),
+            'signature' / Hex(Const(0x2ea2c0d4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_setup_password_required=2,
+                                has_tmp_sessions=1,
+                                has_future_auth_token=4),
+            'otherwise_relogin_days' / If(this.flags.is_setup_password_required, Int32ul),
+            'tmp_sessions' / If(this.flags.has_tmp_sessions, Int32ul),
+            'future_auth_token' / If(this.flags.has_future_auth_token, TBytes),
+            'user' / self.user_structures('user'))
+
+    @structures
+    def auth_authorization_structures(self, name):
+        tag_map = {
+            0x44747e9a: LazyBound(self.struct_0x44747e9a),
+            0x33fb7bb8: LazyBound(self.struct_0x33fb7bb8),
+            0x2ea2c0d4: LazyBound(self.struct_0x2ea2c0d4)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group auth_code_type of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x72a3158c, 'auth_code_type_sms')
+    def struct_0x72a3158c(self):
+        return []
+
+    @constructor(0x741cd3e3, 'auth_code_type_call')
+    def struct_0x741cd3e3(self):
+        return []
+
+    @constructor(0x226ccefb, 'auth_code_type_flash_call')
+    def struct_0x226ccefb(self):
+        return []
+
+    @constructor(0xd61ad6ee, 'auth_code_type_missed_call')
+    def struct_0xd61ad6ee(self):
+        return []
+
+    @constructor(0x06ed998c, 'auth_code_type_fragment_sms')
+    def struct_0x06ed998c(self):
+        return []
+
+    @structures
+    def auth_code_type_structures(self, name):
+        tag_map = {
+            0x72a3158c: LazyBound(self.struct_0x72a3158c),
+            0x741cd3e3: LazyBound(self.struct_0x741cd3e3),
+            0x226ccefb: LazyBound(self.struct_0x226ccefb),
+            0xd61ad6ee: LazyBound(self.struct_0xd61ad6ee),
+            0x06ed998c: LazyBound(self.struct_0x06ed998c)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group auth_login_token of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x629f1980, 'auth_login_token')
+    def struct_0x629f1980(self):
+        return (
+            'expires' / Int32ul,
+            'token' / TBytes)
+
+    @constructor(0x068e9916, 'auth_login_token_migrate_to')
+    def struct_0x068e9916(self):
+        return (
+            'dc_id' / Int32ul,
+            'token' / TBytes)
+
+    @constructor(0x390d5c5e, 'auth_login_token_success')
+    def struct_0x390d5c5e(self):
+        return ['authorization' / self.auth_authorization_structures('authorization')]
+
+    @structures
+    def auth_login_token_structures(self, name):
+        tag_map = {
+            0x629f1980: LazyBound(self.struct_0x629f1980),
+            0x068e9916: LazyBound(self.struct_0x068e9916),
+            0x390d5c5e: LazyBound(self.struct_0x390d5c5e)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group auth_sent_code of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x2390fe44, 'auth_sent_code_success')
+    def struct_0x2390fe44(self):
+        return ['authorization' / self.auth_authorization_structures('authorization')]
+
+    @constructor(0x5e002502, 'auth_sent_code')
+    def struct_0x5e002502(self):
+        return Struct(
+            'sname' / Computed('auth_sent_code'),
+            'signature' / Hex(Const(0x5e002502, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_type=2,
+                                has_timeout=4),
+            'type' / self.auth_sent_code_type_structures('type'),
+            'phone_code_hash' / TString,
+            'next_type' / If(this.flags.has_next_type, self.auth_code_type_structures('next_type')),
+            'timeout' / If(this.flags.has_timeout, Int32ul))
+
+    @structures
+    def auth_sent_code_structures(self, name):
+        tag_map = {
+            0x2390fe44: LazyBound(self.struct_0x2390fe44),
+            0x5e002502: LazyBound(self.struct_0x5e002502)
+        }
+        return TLUnion(name, tag_map)
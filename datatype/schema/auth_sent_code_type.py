@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group auth_sent_code_type of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x3dbb5986, 'auth_sent_code_type_app')
+    def struct_0x3dbb5986(self):
+        return ['length' / Int32ul]
+
+    @constructor(0x5353e5a7, 'auth_sent_code_type_call')
+    def struct_0x5353e5a7(self):
+        return ['length' / Int32ul]
+
+    @constructor(0xf450f59b, 'auth_sent_code_type_email_code')
+    def struct_0xf450f59b(self):
+        return Struct(
+            'sname' / Computed('auth_sent_code_type_email_code'),
+            'signature' / Hex(Const(0xf450f59b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_apple_signin_allowed=1,
+                                is_google_signin_allowed=2,
+                                has_reset_available_period=8,
+                                has_reset_pending_date=16),
+            'email_pattern' / TString,
+            'length' / Int32ul,
+            'reset_available_period' / If(this.flags.has_reset_available_period, Int32ul),
+            'reset_pending_date' / If(this.flags.has_reset_pending_date, TTimestamp))
+
+    @constructor(0xa5491dea, 'auth_sent_code_type_set_up_email_required')
+    def struct_0xa5491dea(self):
+        return Struct(
+            'sname' / Computed('auth_sent_code_type_set_up_email_required'),
+            'signature' / Hex(Const(0xa5491dea, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_apple_signin_allowed=1,
+                                is_google_signin_allowed=2))
+
+    @constructor(0xab03c6d9, 'auth_sent_code_type_flash_call')
+    def struct_0xab03c6d9(self):
+        return ['pattern' / TString]
+
+    @constructor(0x82006484, 'auth_sent_code_type_missed_call')
+    def struct_0x82006484(self):
+        return (
+            'prefix' / TString,
+            'length' / Int32ul)
+
+    @constructor(0xc000bba2, 'auth_sent_code_type_sms')
+    def struct_0xc000bba2(self):
+        return ['length' / Int32ul]
+
+    @constructor(0xd9565c39, 'auth_sent_code_type_fragment_sms')
+    def struct_0xd9565c39(self):
+        return (
+            'url' / TString,
+            'length' / Int32ul)
+
+    @constructor(0x009fd736, 'auth_sent_code_type_firebase_sms')
+    def struct_0x009fd736(self):
+        return Struct(
+            'sname' / Computed('auth_sent_code_type_firebase_sms'),
+            'signature' / Hex(Const(0x009fd736, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_nonce=1,
+                                has_play_integrity_nonce=4,
+                                has_receipt=2),
+            'nonce' / If(this.flags.has_nonce, TBytes),
+            'play_integrity_nonce' / If(this.flags.has_play_integrity_nonce, TBytes),
+            'receipt' / If(this.flags.has_receipt, TString),
+            'push_timeout' / If(this.flags.has_receipt, Int32ul),
+            'length' / Int32ul)
+
+    @constructor(0xa416ac81, 'auth_sent_code_type_sms_word')
+    def struct_0xa416ac81(self):
+        return Struct(
+            'sname' / Computed('auth_sent_code_type_sms_word'),
+            'signature' / Hex(Const(0xa416ac81, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_beginning=1),
+            'beginning' / If(this.flags.has_beginning, TString))
+
+    @constructor(0xb37794af, 'auth_sent_code_type_sms_phrase')
+    def struct_0xb37794af(self):
+        return Struct(
+            'sname' / Computed('auth_sent_code_type_sms_phrase'),
+            'signature' / Hex(Const(0xb37794af, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_beginning=1),
+            'beginning' / If(this.flags.has_beginning, TString))
+
+    @structures
+    def auth_sent_code_type_structures(self, name):
+        tag_map = {
+            0x3dbb5986: LazyBound(self.struct_0x3dbb5986),
+            0x5353e5a7: LazyBound(self.struct_0x5353e5a7),
+            0xf450f59b: LazyBound(self.struct_0xf450f59b),
+            0xa5491dea: LazyBound(self.struct_0xa5491dea),
+            0xab03c6d9: LazyBound(self.struct_0xab03c6d9),
+            0x82006484: LazyBound(self.struct_0x82006484),
+            0xc000bba2: LazyBound(self.struct_0xc000bba2),
+            0xd9565c39: LazyBound(self.struct_0xd9565c39),
+            0x009fd736: LazyBound(self.struct_0x009fd736),
+            0xa416ac81: LazyBound(self.struct_0xa416ac81),
+            0xb37794af: LazyBound(self.struct_0xb37794af)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group base_theme of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x5b11125a, 'base_theme_arctic')
+    def struct_0x5b11125a(self):
+        return []
+
+    @constructor(0xb7b31ea8, 'base_theme_night')
+    def struct_0xb7b31ea8(self):
+        return []
+
+    @constructor(0xc3a12462, 'base_theme_classic')
+    def struct_0xc3a12462(self):
+        return []
+
+    @constructor(0x6d5f77ee, 'base_theme_tinted')
+    def struct_0x6d5f77ee(self):
+        return []
+
+    @constructor(0xfbd81688, 'base_theme_day')
+    def struct_0xfbd81688(self):
+        return []
+
+    @structures
+    def base_theme_structures(self, name):
+        tag_map = {
+            0x5b11125a: LazyBound(self.struct_0x5b11125a),
+            0xb7b31ea8: LazyBound(self.struct_0xb7b31ea8),
+            0xc3a12462: LazyBound(self.struct_0xc3a12462),
+            0x6d5f77ee: LazyBound(self.struct_0x6d5f77ee),
+            0xfbd81688: LazyBound(self.struct_0xfbd81688)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group bool of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x997275b5, 'bool_true')
+    def struct_0x997275b5(self):
+        return []
+
+    @constructor(0xbc799737, 'bool_false')
+    def struct_0xbc799737(self):
+        return []
+
+    @structures
+    def bool_structures(self, name):
+        tag_map = {
+            0x997275b5: LazyBound(self.struct_0x997275b5),
+            0xbc799737: LazyBound(self.struct_0xbc799737)
+        }
+        return TLUnion(name, tag_map)
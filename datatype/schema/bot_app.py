@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group bot_app of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x5da674b7, 'bot_app_not_modified')
+    def struct_0x5da674b7(self):
+        return []
+
+    @constructor(0x95fcd1d6, 'bot_app')
+    def struct_0x95fcd1d6(self):
+        return Struct(
+            'sname' / Computed('bot_app'),
+            'signature' / Hex(Const(0x95fcd1d6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_document=1),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'short_name' / TString,
+            'title' / TString,
+            'description' / TString,
+            'photo' / self.photo_structures('photo'),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'hash' / Int64ul)
+
+    @structures
+    def bot_app_structures(self, name):
+        tag_map = {
+            0x5da674b7: LazyBound(self.struct_0x5da674b7),
+            0x95fcd1d6: LazyBound(self.struct_0x95fcd1d6)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group bot_info of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xe4169b5d, 'bot_info_layer140')
+    def struct_0xe4169b5d(self):
+        return (
+            'user_id' / Int64ul,
+            'description' / TString,
+            'commands' / self.vector(self.struct_0xc27ac8c7(), 'commands'),
+            'menu_button' / self.bot_menu_button_structures('menu_button'))
+
+    @constructor(0xbb2e37ce, 'bot_info_empty_layer48')
+    def struct_0xbb2e37ce(self):
+        return []
+
+    @constructor(0x98e81d3a, 'bot_info_layer131')
+    def struct_0x98e81d3a(self):
+        return (
+            'user_id' / Int32ul,
+            'description' / TString,
+            'commands' / self.vector(self.struct_0xc27ac8c7(), 'commands'))
+
+    @constructor(0x09cf585d, 'bot_info_layer48')
+    def struct_0x09cf585d(self):
+        return (
+            'user_id' / Int32ul,
+            'version' / Int32ul,
+            'restriction_reason' / TString,
+            'description' / TString,
+            'commands' / self.vector(self.struct_0xc27ac8c7(), 'commands'))
+
+    @constructor(0x1b74b335, 'bot_info_layer139')
+    def struct_0x1b74b335(self):
+        return (
+            'user_id' / Int64ul,
+            'description' / TString,
+            'commands' / self.vector(self.struct_0xc27ac8c7(), 'commands'))
+
+    @constructor(0x8f300b57, 'bot_info_layer185')
+    def struct_0x8f300b57(self):
+        return Struct(
+            'sname' / Computed('bot_info_layer185'),
+            'signature' / Hex(Const(0x8f300b57, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_preview_medias=64,
+                                has_user_id=1,
+                                has_description=2,
+                                has_description_photo=16,
+                                has_description_document=32,
+                                has_commands=4,
+                                has_menu_button=8),
+            'user_id' / If(this.flags.has_user_id, Int64ul),
+            'description' / If(this.flags.has_description, TString),
+            'description_photo' / If(this.flags.has_description_photo, self.photo_structures('description_photo')),
+            'description_document' / If(this.flags.has_description_document, self.document_structures('description_document')),
+            'commands' / If(this.flags.has_commands, self.vector(self.struct_0xc27ac8c7(), 'commands')),
+            'menu_button' / If(this.flags.has_menu_button, self.bot_menu_button_structures('menu_button')))
+
+    @constructor(0x82437e74, 'bot_info_layer192')
+    def struct_0x82437e74(self):
+        return Struct(
+            'sname' / Computed('bot_info_layer192'),
+            'signature' / Hex(Const(0x82437e74, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_preview_medias=64,
+                                has_user_id=1,
+                                has_description=2,
+                                has_description_photo=16,
+                                has_description_document=32,
+                                has_commands=4,
+                                has_menu_button=8,
+                                has_privacy_policy_url=128),
+            'user_id' / If(this.flags.has_user_id, Int64ul),
+            'description' / If(this.flags.has_description, TString),
+            'description_photo' / If(this.flags.has_description_photo, self.photo_structures('description_photo')),
+            'description_document' / If(this.flags.has_description_document, self.document_structures('description_document')),
+            'commands' / If(this.flags.has_commands, self.vector(self.struct_0xc27ac8c7(), 'commands')),
+            'menu_button' / If(this.flags.has_menu_button, self.bot_menu_button_structures('menu_button')),
+            'privacy_policy_url' / If(this.flags.has_privacy_policy_url, TString))
+
+    @constructor(0x36607333, 'bot_info_layer195')
+    def struct_0x36607333(self):
+        return Struct(
+            'sname' / Computed('bot_info_layer195'),
+            'signature' / Hex(Const(0x36607333, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_preview_medias=64,
+                                has_user_id=1,
+                                has_description=2,
+                                has_description_photo=16,
+                                has_description_document=32,
+                                has_commands=4,
+                                has_menu_button=8,
+                                has_privacy_policy_url=128,
+                                has_app_settings=256),
+            'user_id' / If(this.flags.has_user_id, Int64ul),
+            'description' / If(this.flags.has_description, TString),
+            'description_photo' / If(this.flags.has_description_photo, self.photo_structures('description_photo')),
+            'description_document' / If(this.flags.has_description_document, self.document_structures('description_document')),
+            'commands' / If(this.flags.has_commands, self.vector(self.struct_0xc27ac8c7(), 'commands')),
+            'menu_button' / If(this.flags.has_menu_button, self.bot_menu_button_structures('menu_button')),
+            'privacy_policy_url' / If(this.flags.has_privacy_policy_url, TString),
+            'app_settings' / If(this.flags.has_app_settings, self.struct_0xc99b1950()))
+
+    @constructor(0x4d8a0299, 'bot_info')
+    def struct_0x4d8a0299(self):
+        return Struct(
+            'sname' / Computed('bot_info'),
+            'signature' / Hex(Const(0x4d8a0299, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_preview_medias=64,
+                                has_user_id=1,
+                                has_description=2,
+                                has_description_photo=16,
+                                has_description_document=32,
+                                has_commands=4,
+                                has_menu_button=8,
+                                has_privacy_policy_url=128,
+                                has_app_settings=256,
+                                has_verifier_settings=512),
+            'user_id' / If(this.flags.has_user_id, Int64ul),
+            'description' / If(this.flags.has_description, TString),
+            'description_photo' / If(this.flags.has_description_photo, self.photo_structures('description_photo')),
+            'description_document' / If(this.flags.has_description_document, self.document_structures('description_document')),
+            'commands' / If(this.flags.has_commands, self.vector(self.struct_0xc27ac8c7(), 'commands')),
+            'menu_button' / If(this.flags.has_menu_button, self.bot_menu_button_structures('menu_button')),
+            'privacy_policy_url' / If(this.flags.has_privacy_policy_url, TString),
+            'app_settings' / If(this.flags.has_app_settings, self.struct_0xc99b1950()),
+            'verifier_settings' / If(this.flags.has_verifier_settings, self.struct_0xb0cd6617()))
+
+    @structures
+    def bot_info_structures(self, name):
+        tag_map = {
+            0xe4169b5d: LazyBound(self.struct_0xe4169b5d),
+            0xbb2e37ce: LazyBound(self.struct_0xbb2e37ce),
+            0x98e81d3a: LazyBound(self.struct_0x98e81d3a),
+            0x09cf585d: LazyBound(self.struct_0x09cf585d),
+            0x1b74b335: LazyBound(self.struct_0x1b74b335),
+            0x8f300b57: LazyBound(self.struct_0x8f300b57),
+            0x82437e74: LazyBound(self.struct_0x82437e74),
+            0x36607333: LazyBound(self.struct_0x36607333),
+            0x4d8a0299: LazyBound(self.struct_0x4d8a0299)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xb0cd6617, 'bot_verifier_settings')
+    def struct_0xb0cd6617(self):
+        return Struct(
+            'sname' / Computed('bot_verifier_settings'),
+            'signature' / Hex(Const(0xb0cd6617, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_modify_custom_description=2,
+                                has_custom_description=1),
+            'company' / TString,
+            'custom_description' / If(this.flags.has_custom_description, TString))
+
+    @constructor(0xc27ac8c7, 'bot_command')
+    def struct_0xc27ac8c7(self):
+        return (
+            'command' / TString,
+            'description' / TString)
+
+    @constructor(0xc99b1950, 'bot_app_settings')
+    def struct_0xc99b1950(self):
+        return Struct(
+            'sname' / Computed('bot_app_settings'),
+            'signature' / Hex(Const(0xc99b1950, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_placeholder_path=1,
+                                has_background_color=2,
+                                has_background_dark_color=4,
+                                has_header_color=8,
+                                has_header_dark_color=16),
+            'placeholder_path' / If(this.flags.has_placeholder_path, TBytes),
+            'background_color' / If(this.flags.has_background_color, Int32ul),
+            'background_dark_color' / If(this.flags.has_background_dark_color, Int32ul),
+            'header_color' / If(this.flags.has_header_color, Int32ul),
+            'header_dark_color' / If(this.flags.has_header_dark_color, Int32ul))
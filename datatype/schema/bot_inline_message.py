@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group bot_inline_message of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x4366232e, 'bot_inline_message_media_venue_layer77')
+    def struct_0x4366232e(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_media_venue_layer77'),
+            'signature' / Hex(Const(0x4366232e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_reply_markup=4),
+            'geo' / self.geo_point_structures('geo'),
+            'title' / TString,
+            'address' / TString,
+            'provider' / TString,
+            'venue_id' / TString,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @constructor(0x8a86659c, 'bot_inline_message_media_venue')
+    def struct_0x8a86659c(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_media_venue'),
+            'signature' / Hex(Const(0x8a86659c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_reply_markup=4),
+            'geo' / self.geo_point_structures('geo'),
+            'title' / TString,
+            'address' / TString,
+            'provider' / TString,
+            'venue_id' / TString,
+            'venue_type' / TString,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @constructor(0x3a8fd8b8, 'bot_inline_message_media_geo_layer71')
+    def struct_0x3a8fd8b8(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_media_geo_layer71'),
+            'signature' / Hex(Const(0x3a8fd8b8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_reply_markup=4),
+            'geo' / self.geo_point_structures('geo'),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @constructor(0x764cf810, 'bot_inline_message_media_auto')
+    def struct_0x764cf810(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_media_auto'),
+            'signature' / Hex(Const(0x764cf810, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_entities=2,
+                                has_reply_markup=4),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @constructor(0x0a74b15b, 'bot_inline_message_media_auto_layer74')
+    def struct_0x0a74b15b(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_media_auto_layer74'),
+            'signature' / Hex(Const(0x0a74b15b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_reply_markup=4),
+            'message' / TString,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @constructor(0x35edb4d4, 'bot_inline_message_media_contact_layer81')
+    def struct_0x35edb4d4(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_media_contact_layer81'),
+            'signature' / Hex(Const(0x35edb4d4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_reply_markup=4),
+            'phone_number' / TString,
+            'first_name' / TString,
+            'last_name' / TString,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @constructor(0x18d1cdc2, 'bot_inline_message_media_contact')
+    def struct_0x18d1cdc2(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_media_contact'),
+            'signature' / Hex(Const(0x18d1cdc2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_reply_markup=4),
+            'phone_number' / TString,
+            'first_name' / TString,
+            'last_name' / TString,
+            'vcard' / TString,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @constructor(0x8c7f65e2, 'bot_inline_message_text')
+    def struct_0x8c7f65e2(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_text'),
+            'signature' / Hex(Const(0x8c7f65e2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_no_webpage=1,
+                                has_entities=2,
+                                has_reply_markup=4),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @constructor(0xb722de65, 'bot_inline_message_media_geo_layer119')
+    def struct_0xb722de65(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_media_geo_layer119'),
+            'signature' / Hex(Const(0xb722de65, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_reply_markup=4),
+            'geo' / self.geo_point_structures('geo'),
+            'period' / Int32ul,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @constructor(0x051846fd, 'bot_inline_message_media_geo')
+    def struct_0x051846fd(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_media_geo'),
+            'signature' / Hex(Const(0x051846fd, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_heading=1,
+                                has_period=2,
+                                has_proximity_notification_radius=8,
+                                has_reply_markup=4),
+            'geo' / self.geo_point_structures('geo'),
+            'heading' / If(this.flags.has_heading, Int32ul),
+            'period' / If(this.flags.has_period, Int32ul),
+            'proximity_notification_radius' / If(this.flags.has_proximity_notification_radius, Int32ul),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @constructor(0x354a9b09, 'bot_inline_message_media_invoice')
+    def struct_0x354a9b09(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_media_invoice'),
+            'signature' / Hex(Const(0x354a9b09, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_shipping_address_requested=2,
+                                is_test=8,
+                                has_photo=1,
+                                has_reply_markup=4),
+            'title' / TString,
+            'description' / TString,
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'currency' / TString,
+            'total_amount' / Int64ul,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @constructor(0x809ad9a6, 'bot_inline_message_media_web_page')
+    def struct_0x809ad9a6(self):
+        return Struct(
+            'sname' / Computed('bot_inline_message_media_web_page'),
+            'signature' / Hex(Const(0x809ad9a6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_invert_media=8,
+                                is_force_large_media=16,
+                                is_force_small_media=32,
+                                is_manual=128,
+                                is_safe=256,
+                                has_entities=2,
+                                has_reply_markup=4),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'url' / TString,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')))
+
+    @structures
+    def bot_inline_message_structures(self, name):
+        tag_map = {
+            0x4366232e: LazyBound(self.struct_0x4366232e),
+            0x8a86659c: LazyBound(self.struct_0x8a86659c),
+            0x3a8fd8b8: LazyBound(self.struct_0x3a8fd8b8),
+            0x764cf810: LazyBound(self.struct_0x764cf810),
+            0x0a74b15b: LazyBound(self.struct_0x0a74b15b),
+            0x35edb4d4: LazyBound(self.struct_0x35edb4d4),
+            0x18d1cdc2: LazyBound(self.struct_0x18d1cdc2),
+            0x8c7f65e2: LazyBound(self.struct_0x8c7f65e2),
+            0xb722de65: LazyBound(self.struct_0xb722de65),
+            0x051846fd: LazyBound(self.struct_0x051846fd),
+            0x354a9b09: LazyBound(self.struct_0x354a9b09),
+            0x809ad9a6: LazyBound(self.struct_0x809ad9a6)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group bot_inline_result of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x11965f3a, 'bot_inline_result')
+    def struct_0x11965f3a(self):
+        return Struct(
+            'sname' / Computed('bot_inline_result'),
+            'signature' / Hex(Const(0x11965f3a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_title=2,
+                                has_description=4,
+                                has_url=8,
+                                has_thumb=16,
+                                has_content=32),
+            'id' / TString,
+            'type' / TString,
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'url' / If(this.flags.has_url, TString),
+            'thumb' / If(this.flags.has_thumb, self.web_document_structures('thumb')),
+            'content' / If(this.flags.has_content, self.web_document_structures('content')),
+            'send_message' / self.bot_inline_message_structures('send_message'))
+
+    @constructor(0x17db940b, 'bot_inline_media_result')
+    def struct_0x17db940b(self):
+        return Struct(
+            'sname' / Computed('bot_inline_media_result'),
+            'signature' / Hex(Const(0x17db940b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_photo=1,
+                                has_document=2,
+                                has_title=4,
+                                has_description=8),
+            'id' / TString,
+            'type' / TString,
+            'photo' / If(this.flags.has_photo, self.photo_structures('photo')),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'send_message' / self.bot_inline_message_structures('send_message'))
+
+    @structures
+    def bot_inline_result_structures(self, name):
+        tag_map = {
+            0x11965f3a: LazyBound(self.struct_0x11965f3a),
+            0x17db940b: LazyBound(self.struct_0x17db940b)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group bot_menu_button of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xc7b57ce6, 'bot_menu_button')
+    def struct_0xc7b57ce6(self):
+        return (
+            'text' / TString,
+            'url' / TString)
+
+    @constructor(0x7533a588, 'bot_menu_button_default')
+    def struct_0x7533a588(self):
+        return []
+
+    @constructor(0x4258c205, 'bot_menu_button_commands')
+    def struct_0x4258c205(self):
+        return []
+
+    @structures
+    def bot_menu_button_structures(self, name):
+        tag_map = {
+            0xc7b57ce6: LazyBound(self.struct_0xc7b57ce6),
+            0x7533a588: LazyBound(self.struct_0x7533a588),
+            0x4258c205: LazyBound(self.struct_0x4258c205)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group bots of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x053ca973, 'bots_toggle_username')
+    def struct_0x053ca973(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'username' / TString,
+            'active' / TBool)
+
+    @constructor(0x06de6392, 'bots_toggle_user_emoji_status_permission')
+    def struct_0x06de6392(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'enabled' / TBool)
+
+    @constructor(0x087fc5e7, 'bots_invoke_web_view_custom_method')
+    def struct_0x087fc5e7(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'custom_method' / TString,
+            'params' / self.struct_0x7d748d04())
+
+    @constructor(0x0ca71d64, 'bots_preview_info')
+    def struct_0x0ca71d64(self):
+        return (
+            'media' / self.vector(self.struct_0x23e91ba3(), 'media'),
+            'lang_codes' / self.vector(TString, 'lang_codes'))
+
+    @constructor(0x10cf3123, 'bots_set_bot_info')
+    def struct_0x10cf3123(self):
+        return Struct(
+            'sname' / Computed('bots_set_bot_info'),
+            'signature' / Hex(Const(0x10cf3123, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_bot=4,
+                                has_name=8,
+                                has_about=1,
+                                has_description=2),
+            'bot' / If(this.flags.has_bot, self.input_user_structures('bot')),
+            'lang_code' / TString,
+            'name' / If(this.flags.has_name, TString),
+            'about' / If(this.flags.has_about, TString),
+            'description' / If(this.flags.has_description, TString))
+
+    @constructor(0x1359f4e6, 'bots_can_send_message')
+    def struct_0x1359f4e6(self):
+        return ['bot' / self.input_user_structures('bot')]
+
+    @constructor(0x17aeb75a, 'bots_add_preview_media')
+    def struct_0x17aeb75a(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'lang_code' / TString,
+            'media' / self.input_media_structures('media'))
+
+    @constructor(0x1991b13b, 'bots_popular_app_bots')
+    def struct_0x1991b13b(self):
+        return Struct(
+            'sname' / Computed('bots_popular_app_bots'),
+            'signature' / Hex(Const(0x1991b13b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'next_offset' / If(this.flags.has_next_offset, TString),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x23e91ba3, 'bot_preview_media')
+    def struct_0x23e91ba3(self):
+        return (
+            'date' / TTimestamp,
+            'media' / self.message_media_structures('media'))
+
+    @constructor(0x2d0135b3, 'bots_delete_preview_media')
+    def struct_0x2d0135b3(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'lang_code' / TString,
+            'media' / self.vector(self.input_media_structures('media'), 'media'))
+
+    @constructor(0x423ab3ad, 'bots_get_preview_info')
+    def struct_0x423ab3ad(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'lang_code' / TString)
+
+    @constructor(0x4504d54f, 'bots_set_bot_menu_button')
+    def struct_0x4504d54f(self):
+        return (
+            'user_id' / self.input_user_structures('user_id'),
+            'button' / self.bot_menu_button_structures('button'))
+
+    @constructor(0x50077589, 'bots_check_download_file_params')
+    def struct_0x50077589(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'file_name' / TString,
+            'url' / TString)
+
+    @constructor(0x778b5ab3, 'bots_update_star_ref_program')
+    def struct_0x778b5ab3(self):
+        return Struct(
+            'sname' / Computed('bots_update_star_ref_program'),
+            'signature' / Hex(Const(0x778b5ab3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_duration_months=1),
+            'bot' / self.input_user_structures('bot'),
+            'commission_permille' / Int32ul,
+            'duration_months' / If(this.flags.has_duration_months, Int32ul))
+
+    @constructor(0x7d748d04, 'data_json')
+    def struct_0x7d748d04(self):
+        return ['data' / TString]
+
+    @constructor(0x8525606f, 'bots_edit_preview_media')
+    def struct_0x8525606f(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'lang_code' / TString,
+            'media' / self.input_media_structures('media'),
+            'new_media' / self.input_media_structures('new_media'))
+
+    @constructor(0x8b89dfbd, 'bots_set_custom_verification')
+    def struct_0x8b89dfbd(self):
+        return Struct(
+            'sname' / Computed('bots_set_custom_verification'),
+            'signature' / Hex(Const(0x8b89dfbd, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_enabled=2,
+                                has_bot=1,
+                                has_custom_description=4),
+            'bot' / If(this.flags.has_bot, self.input_user_structures('bot')),
+            'peer' / self.input_peer_structures('peer'),
+            'custom_description' / If(this.flags.has_custom_description, TString))
+
+    @constructor(0x9709b1c2, 'bots_reorder_usernames')
+    def struct_0x9709b1c2(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'order' / self.vector(TString, 'order'))
+
+    @constructor(0x9c60eb28, 'bots_get_bot_menu_button')
+    def struct_0x9c60eb28(self):
+        return ['user_id' / self.input_user_structures('user_id')]
+
+    @constructor(0xa1b70815, 'bots_get_bot_recommendations')
+    def struct_0xa1b70815(self):
+        return ['bot' / self.input_user_structures('bot')]
+
+    @constructor(0xa2a5594d, 'bots_get_preview_medias')
+    def struct_0xa2a5594d(self):
+        return ['bot' / self.input_user_structures('bot')]
+
+    @constructor(0xb0711d83, 'bots_get_admined_bots')
+    def struct_0xb0711d83(self):
+        return []
+
+    @constructor(0xb627f3aa, 'bots_reorder_preview_medias')
+    def struct_0xb627f3aa(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'lang_code' / TString,
+            'order' / self.vector(self.input_media_structures('order'), 'order'))
+
+    @constructor(0xc2510192, 'bots_get_popular_app_bots')
+    def struct_0xc2510192(self):
+        return (
+            'offset' / TString,
+            'limit' / Int32ul)
+
+    @constructor(0xdcd914fd, 'bots_get_bot_info')
+    def struct_0xdcd914fd(self):
+        return Struct(
+            'sname' / Computed('bots_get_bot_info'),
+            'signature' / Hex(Const(0xdcd914fd, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_bot=1),
+            'bot' / If(this.flags.has_bot, self.input_user_structures('bot')),
+            'lang_code' / TString)
+
+    @constructor(0xf132e3ef, 'bots_allow_send_message')
+    def struct_0xf132e3ef(self):
+        return ['bot' / self.input_user_structures('bot')]
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group broadcast_revenue_balances of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xc3ff71e7, 'broadcast_revenue_balances')
+    def struct_0xc3ff71e7(self):
+        return Struct(
+            'sname' / Computed('broadcast_revenue_balances'),
+            'signature' / Hex(Const(0xc3ff71e7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_withdrawal_enabled=1),
+            'current_balance' / Int64ul,
+            'available_balance' / Int64ul,
+            'overall_revenue' / Int64ul)
+
+    @constructor(0x8438f1c6, 'broadcast_revenue_balances_layer186')
+    def struct_0x8438f1c6(self):
+        return (
+            'current_balance' / Int64ul,
+            'available_balance' / Int64ul,
+            'overall_revenue' / Int64ul)
+
+    @structures
+    def broadcast_revenue_balances_structures(self, name):
+        tag_map = {
+            0xc3ff71e7: LazyBound(self.struct_0xc3ff71e7),
+            0x8438f1c6: LazyBound(self.struct_0x8438f1c6)
+        }
+        return TLUnion(name, tag_map)
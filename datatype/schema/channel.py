@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group channel of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x278f2868, 'channel_admin_log_event_action_send_message')
+    def struct_0x278f2868(self):
+        return ['message' / self.message_structures('message')]
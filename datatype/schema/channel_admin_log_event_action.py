@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group channel_admin_log_event_action of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xdb9f9140, 'channel_admin_log_event_action_discard_group_call')
+    def struct_0xdb9f9140(self):
+        return ['call' / self.struct_0xd8aa840f()]
+
+    @constructor(0xb1c3caa7, 'channel_admin_log_event_action_change_sticker_set')
+    def struct_0xb1c3caa7(self):
+        return (
+            'prev_stickerset' / self.input_sticker_set_structures('prev_stickerset'),
+            'new_stickerset' / self.input_sticker_set_structures('new_stickerset'))
+
+    @constructor(0x46d840ab, 'channel_admin_log_event_action_change_emoji_sticker_set')
+    def struct_0x46d840ab(self):
+        return (
+            'prev_stickerset' / self.input_sticker_set_structures('prev_stickerset'),
+            'new_stickerset' / self.input_sticker_set_structures('new_stickerset'))
+
+    @constructor(0xf92424d2, 'channel_admin_log_event_action_participant_mute')
+    def struct_0xf92424d2(self):
+        return ['participant' / self.struct_0xeba636fe()]
+
+    @constructor(0x2df5fc0a, 'channel_admin_log_event_action_default_banned_rights')
+    def struct_0x2df5fc0a(self):
+        return (
+            'prev_banned_rights' / self.struct_0x9f120418(),
+            'new_banned_rights' / self.struct_0x9f120418())
+
+    @constructor(0xfe69018d, 'channel_admin_log_event_action_change_theme')
+    def struct_0xfe69018d(self):
+        return (
+            'prev_value' / TString,
+            'new_value' / TString)
+
+    @constructor(0xf89777f2, 'channel_admin_log_event_action_participant_leave')
+    def struct_0xf89777f2(self):
+        return []
+
+    @constructor(0x709b2405, 'channel_admin_log_event_action_edit_message')
+    def struct_0x709b2405(self):
+        return (
+            'prev_message' / self.message_structures('prev_message'),
+            'new_message' / self.message_structures('new_message'))
+
+    @constructor(0xe90ebb59, 'channel_admin_log_event_action_exported_invite_edit')
+    def struct_0xe90ebb59(self):
+        return (
+            'prev_invite' / self.exported_chat_invite_structures('prev_invite'),
+            'new_invite' / self.exported_chat_invite_structures('new_invite'))
+
+    @constructor(0x6a4afc38, 'channel_admin_log_event_action_change_username')
+    def struct_0x6a4afc38(self):
+        return (
+            'prev_value' / TString,
+            'new_value' / TString)
+
+    @constructor(0x0e6b76ae, 'channel_admin_log_event_action_change_location')
+    def struct_0x0e6b76ae(self):
+        return (
+            'prev_value' / self.channel_location_structures('prev_value'),
+            'new_value' / self.channel_location_structures('new_value'))
+
+    @constructor(0x434bd2af, 'channel_admin_log_event_action_change_photo')
+    def struct_0x434bd2af(self):
+        return (
+            'prev_photo' / self.photo_structures('prev_photo'),
+            'new_photo' / self.photo_structures('new_photo'))
+
+    @constructor(0xd5676710, 'channel_admin_log_event_action_participant_toggle_admin')
+    def struct_0xd5676710(self):
+        return (
+            'prev_participant' / self.channel_participant_structures('prev_participant'),
+            'new_participant' / self.channel_participant_structures('new_participant'))
+
+    @constructor(0x53909779, 'channel_admin_log_event_action_toggle_slow_mode')
+    def struct_0x53909779(self):
+        return (
+            'prev_value' / Int32ul,
+            'new_value' / Int32ul)
+
+    @constructor(0xfe9fc158, 'channel_admin_log_event_action_participant_join_by_invite')
+    def struct_0xfe9fc158(self):
+        return Struct(
+            'sname' / Computed('channel_admin_log_event_action_participant_join_by_invite'),
+            'signature' / Hex(Const(0xfe9fc158, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_via_chatlist=1),
+            'invite' / self.exported_chat_invite_structures('invite'))
+
+    @constructor(0x410a134e, 'channel_admin_log_event_action_exported_invite_revoke')
+    def struct_0x410a134e(self):
+        return ['invite' / self.exported_chat_invite_structures('invite')]
+
+    @constructor(0x8f079643, 'channel_admin_log_event_action_stop_poll')
+    def struct_0x8f079643(self):
+        return ['message' / self.message_structures('message')]
+
+    @constructor(0x5a50fca4, 'channel_admin_log_event_action_exported_invite_delete')
+    def struct_0x5a50fca4(self):
+        return ['invite' / self.exported_chat_invite_structures('invite')]
+
+    @constructor(0x26ae0971, 'channel_admin_log_event_action_toggle_signatures')
+    def struct_0x26ae0971(self):
+        return ['new_value' / TBool]
+
+    @constructor(0x3e7f6847, 'channel_admin_log_event_action_participant_volume')
+    def struct_0x3e7f6847(self):
+        return ['participant' / self.struct_0xeba636fe()]
+
+    @constructor(0x02cc6383, 'channel_admin_log_event_action_toggle_forum')
+    def struct_0x02cc6383(self):
+        return ['new_value' / TBool]
+
+    @constructor(0xf06fe208, 'channel_admin_log_event_action_edit_topic')
+    def struct_0xf06fe208(self):
+        return (
+            'prev_topic' / self.forum_topic_structures('prev_topic'),
+            'new_topic' / self.forum_topic_structures('new_topic'))
+
+    @constructor(0x5d8d353b, 'channel_admin_log_event_action_pin_topic')
+    def struct_0x5d8d353b(self):
+        return Struct(
+            'sname' / Computed('channel_admin_log_event_action_pin_topic'),
+            'signature' / Hex(Const(0x5d8d353b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_prev_topic=1,
+                                has_new_topic=2),
+            'prev_topic' / If(this.flags.has_prev_topic, self.forum_topic_structures('prev_topic')),
+            'new_topic' / If(this.flags.has_new_topic, self.forum_topic_structures('new_topic')))
+
+    @constructor(0xe6d83d7e, 'channel_admin_log_event_action_participant_toggle_ban')
+    def struct_0xe6d83d7e(self):
+        return (
+            'prev_participant' / self.channel_participant_structures('prev_participant'),
+            'new_participant' / self.channel_participant_structures('new_participant'))
+
+    @constructor(0x183040d3, 'channel_admin_log_event_action_participant_join')
+    def struct_0x183040d3(self):
+        return []
+
+    @constructor(0x5f5c95f1, 'channel_admin_log_event_action_toggle_pre_history_hidden')
+    def struct_0x5f5c95f1(self):
+        return ['new_value' / TBool]
+
+    @constructor(0xafb6144a, 'channel_admin_log_event_action_participant_join_by_request')
+    def struct_0xafb6144a(self):
+        return (
+            'invite' / self.exported_chat_invite_structures('invite'),
+            'approved_by' / Int64ul)
+
+    @constructor(0xe9e82c18, 'channel_admin_log_event_action_update_pinned')
+    def struct_0xe9e82c18(self):
+        return ['message' / self.message_structures('message')]
+
+    @constructor(0x56d6a247, 'channel_admin_log_event_action_toggle_group_call_setting')
+    def struct_0x56d6a247(self):
+        return ['join_muted' / TBool]
+
+    @constructor(0xe31c34d8, 'channel_admin_log_event_action_participant_invite')
+    def struct_0xe31c34d8(self):
+        return ['participant' / self.channel_participant_structures('participant')]
+
+    @constructor(0x55188a2e, 'channel_admin_log_event_action_change_about')
+    def struct_0x55188a2e(self):
+        return (
+            'prev_value' / TString,
+            'new_value' / TString)
+
+    @constructor(0x23209745, 'channel_admin_log_event_action_start_group_call')
+    def struct_0x23209745(self):
+        return ['call' / self.struct_0xd8aa840f()]
+
+    @constructor(0xbe4e0ef8, 'channel_admin_log_event_action_change_available_reactions')
+    def struct_0xbe4e0ef8(self):
+        return (
+            'prev_value' / self.chat_reactions_structures('prev_value'),
+            'new_value' / self.chat_reactions_structures('new_value'))
+
+    @constructor(0x050c7ac8, 'channel_admin_log_event_action_change_linked_chat')
+    def struct_0x050c7ac8(self):
+        return (
+            'prev_value' / Int64ul,
+            'new_value' / Int64ul)
+
+    @constructor(0x1b7907ae, 'channel_admin_log_event_action_toggle_invites')
+    def struct_0x1b7907ae(self):
+        return ['new_value' / TBool]
+
+    @constructor(0xe64429c0, 'channel_admin_log_event_action_participant_unmute')
+    def struct_0xe64429c0(self):
+        return ['participant' / self.struct_0xeba636fe()]
+
+    @constructor(0x42e047bb, 'channel_admin_log_event_action_delete_message')
+    def struct_0x42e047bb(self):
+        return ['message' / self.message_structures('message')]
+
+    @constructor(0xe6dfb825, 'channel_admin_log_event_action_change_title')
+    def struct_0xe6dfb825(self):
+        return (
+            'prev_value' / TString,
+            'new_value' / TString)
+
+    @constructor(0x6e941a38, 'channel_admin_log_event_action_change_history_ttl')
+    def struct_0x6e941a38(self):
+        return (
+            'prev_value' / Int32ul,
+            'new_value' / Int32ul)
+
+    @constructor(0xcb2ac766, 'channel_admin_log_event_action_toggle_no_forwards')
+    def struct_0xcb2ac766(self):
+        return ['new_value' / TBool]
+
+    @constructor(0xf04fb3a9, 'channel_admin_log_event_action_change_usernames')
+    def struct_0xf04fb3a9(self):
+        return (
+            'prev_value' / self.vector(TString, 'prev_value'),
+            'new_value' / self.vector(TString, 'new_value'))
+
+    @constructor(0x58707d28, 'channel_admin_log_event_action_create_topic')
+    def struct_0x58707d28(self):
+        return ['topic' / self.forum_topic_structures('topic')]
+
+    @constructor(0xae168909, 'channel_admin_log_event_action_delete_topic')
+    def struct_0xae168909(self):
+        return ['topic' / self.forum_topic_structures('topic')]
+
+    @constructor(0x64f36dfc, 'channel_admin_log_event_action_toggle_anti_spam')
+    def struct_0x64f36dfc(self):
+        return ['new_value' / TBool]
+
+    @constructor(0x3c2b247b, 'channel_admin_log_event_action_change_color')
+    def struct_0x3c2b247b(self):
+        return (
+            'prev_value' / Int32ul,
+            'new_value' / Int32ul)
+
+    @constructor(0x445fc434, 'channel_admin_log_event_action_change_background_emoji')
+    def struct_0x445fc434(self):
+        return (
+            'prev_value' / Int64ul,
+            'new_value' / Int64ul)
+
+    @constructor(0x5796e780, 'channel_admin_log_event_action_change_peer_color')
+    def struct_0x5796e780(self):
+        return (
+            'prev_value' / self.struct_0xb54b5acf(),
+            'new_value' / self.struct_0xb54b5acf())
+
+    @constructor(0x5e477b25, 'channel_admin_log_event_action_change_profile_peer_color')
+    def struct_0x5e477b25(self):
+        return (
+            'prev_value' / self.struct_0xb54b5acf(),
+            'new_value' / self.struct_0xb54b5acf())
+
+    @constructor(0x31bb5d52, 'channel_admin_log_event_action_change_wallpaper')
+    def struct_0x31bb5d52(self):
+        return (
+            'prev_value' / self.wall_paper_structures('prev_value'),
+            'new_value' / self.wall_paper_structures('new_value'))
+
+    @constructor(0x3ea9feb1, 'channel_admin_log_event_action_change_emoji_status')
+    def struct_0x3ea9feb1(self):
+        return (
+            'prev_value' / self.emoji_status_structures('prev_value'),
+            'new_value' / self.emoji_status_structures('new_value'))
+
+    @constructor(0x60a79c79, 'channel_admin_log_event_action_toggle_signature_profiles')
+    def struct_0x60a79c79(self):
+        return ['value' / TBool]
+
+    @constructor(0x64642db3, 'channel_admin_log_event_action_participant_sub_extend')
+    def struct_0x64642db3(self):
+        return (
+            'prev_participant' / self.channel_participant_structures('prev_participant'),
+            'new_participant' / self.channel_participant_structures('new_participant'))
+
+    @structures
+    def channel_admin_log_event_action_structures(self, name):
+        tag_map = {
+            0xdb9f9140: LazyBound(self.struct_0xdb9f9140),
+            0xb1c3caa7: LazyBound(self.struct_0xb1c3caa7),
+            0x46d840ab: LazyBound(self.struct_0x46d840ab),
+            0xf92424d2: LazyBound(self.struct_0xf92424d2),
+            0x2df5fc0a: LazyBound(self.struct_0x2df5fc0a),
+            0xfe69018d: LazyBound(self.struct_0xfe69018d),
+            0xf89777f2: LazyBound(self.struct_0xf89777f2),
+            0x709b2405: LazyBound(self.struct_0x709b2405),
+            0xe90ebb59: LazyBound(self.struct_0xe90ebb59),
+            0x6a4afc38: LazyBound(self.struct_0x6a4afc38),
+            0x0e6b76ae: LazyBound(self.struct_0x0e6b76ae),
+            0x434bd2af: LazyBound(self.struct_0x434bd2af),
+            0xd5676710: LazyBound(self.struct_0xd5676710),
+            0x53909779: LazyBound(self.struct_0x53909779),
+            0xfe9fc158: LazyBound(self.struct_0xfe9fc158),
+            0x410a134e: LazyBound(self.struct_0x410a134e),
+            0x8f079643: LazyBound(self.struct_0x8f079643),
+            0x5a50fca4: LazyBound(self.struct_0x5a50fca4),
+            0x26ae0971: LazyBound(self.struct_0x26ae0971),
+            0x3e7f6847: LazyBound(self.struct_0x3e7f6847),
+            0x02cc6383: LazyBound(self.struct_0x02cc6383),
+            0xf06fe208: LazyBound(self.struct_0xf06fe208),
+            0x5d8d353b: LazyBound(self.struct_0x5d8d353b),
+            0xe6d83d7e: LazyBound(self.struct_0xe6d83d7e),
+            0x183040d3: LazyBound(self.struct_0x183040d3),
+            0x5f5c95f1: LazyBound(self.struct_0x5f5c95f1),
+            0xafb6144a: LazyBound(self.struct_0xafb6144a),
+            0xe9e82c18: LazyBound(self.struct_0xe9e82c18),
+            0x56d6a247: LazyBound(self.struct_0x56d6a247),
+            0xe31c34d8: LazyBound(self.struct_0xe31c34d8),
+            0x55188a2e: LazyBound(self.struct_0x55188a2e),
+            0x23209745: LazyBound(self.struct_0x23209745),
+            0xbe4e0ef8: LazyBound(self.struct_0xbe4e0ef8),
+            0x050c7ac8: LazyBound(self.struct_0x050c7ac8),
+            0x1b7907ae: LazyBound(self.struct_0x1b7907ae),
+            0xe64429c0: LazyBound(self.struct_0xe64429c0),
+            0x42e047bb: LazyBound(self.struct_0x42e047bb),
+            0xe6dfb825: LazyBound(self.struct_0xe6dfb825),
+            0x6e941a38: LazyBound(self.struct_0x6e941a38),
+            0xcb2ac766: LazyBound(self.struct_0xcb2ac766),
+            0xf04fb3a9: LazyBound(self.struct_0xf04fb3a9),
+            0x58707d28: LazyBound(self.struct_0x58707d28),
+            0xae168909: LazyBound(self.struct_0xae168909),
+            0x64f36dfc: LazyBound(self.struct_0x64f36dfc),
+            0x3c2b247b: LazyBound(self.struct_0x3c2b247b),
+            0x445fc434: LazyBound(self.struct_0x445fc434),
+            0x5796e780: LazyBound(self.struct_0x5796e780),
+            0x5e477b25: LazyBound(self.struct_0x5e477b25),
+            0x31bb5d52: LazyBound(self.struct_0x31bb5d52),
+            0x3ea9feb1: LazyBound(self.struct_0x3ea9feb1),
+            0x60a79c79: LazyBound(self.struct_0x60a79c79),
+            0x64642db3: LazyBound(self.struct_0x64642db3)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x67753ac8, 'group_call_participant_video')
+    def struct_0x67753ac8(self):
+        return Struct(
+            'sname' / Computed('group_call_participant_video'),
+            'signature' / Hex(Const(0x67753ac8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_paused=1,
+                                has_audio_source=2),
+            'endpoint' / TString,
+            'source_groups' / self.vector(self.struct_0xdcb118b7(), 'source_groups'),
+            'audio_source' / If(this.flags.has_audio_source, Int32ul))
+
+    @constructor(0xdcb118b7, 'group_call_participant_video_source_group')
+    def struct_0xdcb118b7(self):
+        return (
+            'semantics' / TString,
+            'sources' / self.vector(Int32ul, 'sources'))
+
+    @constructor(0xeba636fe, 'group_call_participant')
+    def struct_0xeba636fe(self):
+        return Struct(
+            'sname' / Computed('group_call_participant'),
+            'signature' / Hex(Const(0xeba636fe, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_muted=1,
+                                is_left=2,
+                                is_can_self_unmute=4,
+                                is_just_joined=16,
+                                is_versioned=32,
+                                is_min=256,
+                                is_muted_by_you=512,
+                                is_volume_by_admin=1024,
+                                is_self=4096,
+                                is_video_joined=32768,
+                                has_active_date=8,
+                                has_volume=128,
+                                has_about=2048,
+                                has_raise_hand_rating=8192,
+                                has_video=64,
+                                has_presentation=16384),
+            'peer' / self.peer_structures('peer'),
+            'date' / TTimestamp,
+            'active_date' / If(this.flags.has_active_date, TTimestamp),
+            'source' / Int32ul,
+            'volume' / If(this.flags.has_volume, Int32ul),
+            'about' / If(this.flags.has_about, TString),
+            'raise_hand_rating' / If(this.flags.has_raise_hand_rating, Int64ul),
+            'video' / If(this.flags.has_video, self.struct_0x67753ac8()),
+            'presentation' / If(this.flags.has_presentation, self.struct_0x67753ac8()))
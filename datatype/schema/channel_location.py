@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group channel_location of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xbfb5ad8b, 'channel_location_empty')
+    def struct_0xbfb5ad8b(self):
+        return []
+
+    @constructor(0x209b82db, 'channel_location')
+    def struct_0x209b82db(self):
+        return (
+            'geo_point' / self.geo_point_structures('geo_point'),
+            'address' / TString)
+
+    @structures
+    def channel_location_structures(self, name):
+        tag_map = {
+            0xbfb5ad8b: LazyBound(self.struct_0xbfb5ad8b),
+            0x209b82db: LazyBound(self.struct_0x209b82db)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group channel_messages_filter of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x94d42ee7, 'channel_messages_filter_empty')
+    def struct_0x94d42ee7(self):
+        return []
+
+    @constructor(0xcd77d957, 'channel_messages_filter')
+    def struct_0xcd77d957(self):
+        return Struct(
+            'sname' / Computed('channel_messages_filter'),
+            'signature' / Hex(Const(0xcd77d957, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_exclude_new_messages=2),
+            'ranges' / self.vector(self.struct_0x0ae30253(), 'ranges'))
+
+    @structures
+    def channel_messages_filter_structures(self, name):
+        tag_map = {
+            0x94d42ee7: LazyBound(self.struct_0x94d42ee7),
+            0xcd77d957: LazyBound(self.struct_0xcd77d957)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x0ae30253, 'message_range')
+    def struct_0x0ae30253(self):
+        return (
+            'min_id' / Int32ul,
+            'max_id' / Int32ul)
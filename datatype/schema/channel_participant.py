@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group channel_participant of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x222c1886, 'channel_participant_banned_layer92')
+    def struct_0x222c1886(self):
+        return Struct(
+            'sname' / Computed('channel_participant_banned_layer92'),
+            'signature' / Hex(Const(0x222c1886, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_left=1),
+            'peer_user_id' / Int32ul,
+            'kicked_by' / Int32ul,
+            'date' / TTimestamp,
+            'banned_rights_layer92' / self.struct_0x58cf4249())
+
+    @constructor(0x15ebac1d, 'channel_participant_layer131')
+    def struct_0x15ebac1d(self):
+        return (
+            'peer_user_id' / Int32ul,
+            'date' / TTimestamp)
+
+    @constructor(0x808d15a4, 'channel_participant_creator_layer118')
+    def struct_0x808d15a4(self):
+        return Struct(
+            'sname' / Computed('channel_participant_creator_layer118'),
+            'signature' / Hex(Const(0x808d15a4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_rank=1),
+            'peer_user_id' / Int32ul,
+            'rank' / If(this.flags.has_rank, TString))
+
+    @constructor(0x447dca4b, 'channel_participant_creator_layer131')
+    def struct_0x447dca4b(self):
+        return Struct(
+            'sname' / Computed('channel_participant_creator_layer131'),
+            'signature' / Hex(Const(0x447dca4b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_rank=1),
+            'peer_user_id' / Int32ul,
+            'admin_rights' / self.struct_0x5fb224d5(),
+            'rank' / If(this.flags.has_rank, TString))
+
+    @constructor(0xe3e2e1f9, 'channel_participant_creator_layer103')
+    def struct_0xe3e2e1f9(self):
+        return ['peer_user_id' / Int32ul]
+
+    @constructor(0xa3289a6d, 'channel_participant_self_layer131')
+    def struct_0xa3289a6d(self):
+        return (
+            'peer_user_id' / Int32ul,
+            'inviter_id' / Int32ul,
+            'date' / TTimestamp)
+
+    @constructor(0x6df8014e, 'channel_participant_banned')
+    def struct_0x6df8014e(self):
+        return Struct(
+            'sname' / Computed('channel_participant_banned'),
+            'signature' / Hex(Const(0x6df8014e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_left=1),
+            'peer' / self.peer_structures('peer'),
+            'kicked_by' / Int64ul,
+            'date' / TTimestamp,
+            'banned_rights' / self.struct_0x9f120418())
+
+    @constructor(0x34c3bb53, 'channel_participant_admin')
+    def struct_0x34c3bb53(self):
+        return Struct(
+            'sname' / Computed('channel_participant_admin'),
+            'signature' / Hex(Const(0x34c3bb53, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_edit=1,
+                                is_self=2,
+                                has_rank=4),
+            'peer_user_id' / Int64ul,
+            'inviter_id' / If(this.flags.is_self, Int64ul),
+            'promoted_by' / Int64ul,
+            'date' / TTimestamp,
+            'admin_rights' / self.struct_0x5fb224d5(),
+            'rank' / If(this.flags.has_rank, TString))
+
+    @constructor(0xcb397619, 'channel_participant')
+    def struct_0xcb397619(self):
+        return Struct(
+            'sname' / Computed('channel_participant'),
+            'signature' / Hex(Const(0xcb397619, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_subscription_until_date=1),
+            'peer_user_id' / Int64ul,
+            'date' / TTimestamp,
+            'subscription_until_date' / If(this.flags.has_subscription_until_date, TTimestamp))
+
+    @constructor(0xc00c07c0, 'channel_participant_layer185')
+    def struct_0xc00c07c0(self):
+        return (
+            'peer_user_id' / Int64ul,
+            'date' / TTimestamp)
+
+    @constructor(0x2fe601d3, 'channel_participant_creator')
+    def struct_0x2fe601d3(self):
+        return Struct(
+            'sname' / Computed('channel_participant_creator'),
+            'signature' / Hex(Const(0x2fe601d3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_rank=1),
+            'peer_user_id' / Int64ul,
+            'admin_rights' / self.struct_0x5fb224d5(),
+            'rank' / If(this.flags.has_rank, TString))
+
+    @constructor(0xccbebbaf, 'channel_participant_admin_layer131')
+    def struct_0xccbebbaf(self):
+        return Struct(
+            'sname' / Computed('channel_participant_admin_layer131'),
+            'signature' / Hex(Const(0xccbebbaf, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_edit=1,
+                                is_self=2,
+                                has_rank=4),
+            'peer_user_id' / Int32ul,
+            'inviter_id' / If(this.flags.is_self, Int32ul),
+            'promoted_by' / Int32ul,
+            'date' / TTimestamp,
+            'admin_rights' / self.struct_0x5fb224d5(),
+            'rank' / If(this.flags.has_rank, TString))
+
+    @constructor(0xa82fa898, 'channel_participant_admin_layer92')
+    def struct_0xa82fa898(self):
+        return Struct(
+            'sname' / Computed('channel_participant_admin_layer92'),
+            'signature' / Hex(Const(0xa82fa898, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_edit=1),
+            'peer_user_id' / Int32ul,
+            'inviter_id' / Int32ul,
+            'promoted_by' / Int32ul,
+            'date' / TTimestamp,
+            'admin_rights_layer92' / self.struct_0x5d7ceba5())
+
+    @constructor(0x4f607bef, 'channel_participant_self')
+    def struct_0x4f607bef(self):
+        return Struct(
+            'sname' / Computed('channel_participant_self'),
+            'signature' / Hex(Const(0x4f607bef, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_via_invite=1,
+                                has_subscription_until_date=2),
+            'user_id' / Int64ul,
+            'inviter_id' / Int64ul,
+            'date' / TTimestamp,
+            'subscription_until_date' / If(this.flags.has_subscription_until_date, TTimestamp))
+
+    @constructor(0x35a8bfa7, 'channel_participant_self_layer185')
+    def struct_0x35a8bfa7(self):
+        return Struct(
+            'sname' / Computed('channel_participant_self_layer185'),
+            'signature' / Hex(Const(0x35a8bfa7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_via_invite=1),
+            'user_id' / Int64ul,
+            'inviter_id' / Int64ul,
+            'date' / TTimestamp)
+
+    @constructor(0x28a8bc67, 'channel_participant_self_layer133')
+    def struct_0x28a8bc67(self):
+        return (
+            'peer_user_id' / Int64ul,
+            'inviter_id' / Int64ul,
+            'date' / TTimestamp)
+
+    @constructor(0x50a1dfd6, 'channel_participant_banned_layer131')
+    def struct_0x50a1dfd6(self):
+        return Struct(
+            'sname' / Computed('channel_participant_banned_layer131'),
+            'signature' / Hex(Const(0x50a1dfd6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_left=1),
+            'peer' / self.peer_structures('peer'),
+            'kicked_by' / Int32ul,
+            'date' / TTimestamp,
+            'banned_rights' / self.struct_0x9f120418())
+
+    @constructor(0x98192d61, 'channel_participant_editor_layer67')
+    def struct_0x98192d61(self):
+        return (
+            'peer_user_id' / Int32ul,
+            'inviter_id' / Int32ul,
+            'date' / TTimestamp)
+
+    @constructor(0x1b03f006, 'channel_participant_left')
+    def struct_0x1b03f006(self):
+        return ['peer' / self.peer_structures('peer')]
+
+    @constructor(0x1c0facaf, 'channel_participant_banned_layer125')
+    def struct_0x1c0facaf(self):
+        return Struct(
+            'sname' / Computed('channel_participant_banned_layer125'),
+            'signature' / Hex(Const(0x1c0facaf, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_left=1),
+            'peer_user_id' / Int32ul,
+            'kicked_by' / Int32ul,
+            'date' / TTimestamp,
+            'banned_rights' / self.struct_0x9f120418())
+
+    @constructor(0x5daa6e23, 'channel_participant_admin_layer103')
+    def struct_0x5daa6e23(self):
+        return Struct(
+            'sname' / Computed('channel_participant_admin_layer103'),
+            'signature' / Hex(Const(0x5daa6e23, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_edit=1,
+                                is_self=2),
+            'peer_user_id' / Int32ul,
+            'inviter_id' / If(this.flags.is_self, Int32ul),
+            'promoted_by' / Int32ul,
+            'date' / TTimestamp,
+            'admin_rights' / self.struct_0x5fb224d5())
+
+    @constructor(0xc3c6796b, 'channel_participant_left_layer125')
+    def struct_0xc3c6796b(self):
+        return ['peer_user_id' / Int32ul]
+
+    @constructor(0x91057fef, 'channel_participant_moderator_layer67')
+    def struct_0x91057fef(self):
+        return (
+            'peer_user_id' / Int32ul,
+            'inviter_id' / Int32ul,
+            'date' / TTimestamp)
+
+    @constructor(0x8cc5e69a, 'channel_participant_kicked_layer67')
+    def struct_0x8cc5e69a(self):
+        return (
+            'peer_user_id' / Int32ul,
+            'kicked_by' / Int32ul,
+            'date' / TTimestamp)
+
+    @structures
+    def channel_participant_structures(self, name):
+        tag_map = {
+            0x222c1886: LazyBound(self.struct_0x222c1886),
+            0x15ebac1d: LazyBound(self.struct_0x15ebac1d),
+            0x808d15a4: LazyBound(self.struct_0x808d15a4),
+            0x447dca4b: LazyBound(self.struct_0x447dca4b),
+            0xe3e2e1f9: LazyBound(self.struct_0xe3e2e1f9),
+            0xa3289a6d: LazyBound(self.struct_0xa3289a6d),
+            0x6df8014e: LazyBound(self.struct_0x6df8014e),
+            0x34c3bb53: LazyBound(self.struct_0x34c3bb53),
+            0xcb397619: LazyBound(self.struct_0xcb397619),
+            0xc00c07c0: LazyBound(self.struct_0xc00c07c0),
+            0x2fe601d3: LazyBound(self.struct_0x2fe601d3),
+            0xccbebbaf: LazyBound(self.struct_0xccbebbaf),
+            0xa82fa898: LazyBound(self.struct_0xa82fa898),
+            0x4f607bef: LazyBound(self.struct_0x4f607bef),
+            0x35a8bfa7: LazyBound(self.struct_0x35a8bfa7),
+            0x28a8bc67: LazyBound(self.struct_0x28a8bc67),
+            0x50a1dfd6: LazyBound(self.struct_0x50a1dfd6),
+            0x98192d61: LazyBound(self.struct_0x98192d61),
+            0x1b03f006: LazyBound(self.struct_0x1b03f006),
+            0x1c0facaf: LazyBound(self.struct_0x1c0facaf),
+            0x5daa6e23: LazyBound(self.struct_0x5daa6e23),
+            0xc3c6796b: LazyBound(self.struct_0xc3c6796b),
+            0x91057fef: LazyBound(self.struct_0x91057fef),
+            0x8cc5e69a: LazyBound(self.struct_0x8cc5e69a)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group channel_participants_filter of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xe04b5ceb, 'channel_participants_mentions')
+    def struct_0xe04b5ceb(self):
+        return Struct(
+            'sname' / Computed('channel_participants_mentions'),
+            'signature' / Hex(Const(0xe04b5ceb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_q=1,
+                                has_top_msg_id=2),
+            'q' / If(this.flags.has_q, TString),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul))
+
+    @constructor(0xbb6ae88d, 'channel_participants_contacts')
+    def struct_0xbb6ae88d(self):
+        return ['q' / TString]
+
+    @constructor(0xb4608969, 'channel_participants_admins')
+    def struct_0xb4608969(self):
+        return []
+
+    @constructor(0xa3b54985, 'channel_participants_kicked')
+    def struct_0xa3b54985(self):
+        return ['q' / TString]
+
+    @constructor(0x0656ac4b, 'channel_participants_search')
+    def struct_0x0656ac4b(self):
+        return ['q' / TString]
+
+    @constructor(0xb0d1865b, 'channel_participants_bots')
+    def struct_0xb0d1865b(self):
+        return []
+
+    @constructor(0x1427a5e1, 'channel_participants_banned')
+    def struct_0x1427a5e1(self):
+        return ['q' / TString]
+
+    @constructor(0xde3f3c79, 'channel_participants_recent')
+    def struct_0xde3f3c79(self):
+        return []
+
+    @structures
+    def channel_participants_filter_structures(self, name):
+        tag_map = {
+            0xe04b5ceb: LazyBound(self.struct_0xe04b5ceb),
+            0xbb6ae88d: LazyBound(self.struct_0xbb6ae88d),
+            0xb4608969: LazyBound(self.struct_0xb4608969),
+            0xa3b54985: LazyBound(self.struct_0xa3b54985),
+            0x0656ac4b: LazyBound(self.struct_0x0656ac4b),
+            0xb0d1865b: LazyBound(self.struct_0xb0d1865b),
+            0x1427a5e1: LazyBound(self.struct_0x1427a5e1),
+            0xde3f3c79: LazyBound(self.struct_0xde3f3c79)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,548 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group channels of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x08736a09, 'channels_get_full_channel')
+    def struct_0x08736a09(self):
+        return ['channel' / self.input_channel_structures('channel')]
+
+    @constructor(0x0a245dd3, 'channels_deactivate_all_usernames')
+    def struct_0x0a245dd3(self):
+        return ['channel' / self.input_channel_structures('channel')]
+
+    @constructor(0x0a7f6bbb, 'channels_get_channels')
+    def struct_0x0a7f6bbb(self):
+        return ['id' / self.vector(self.input_channel_structures('id'), 'id')]
+
+    @constructor(0x0b290c69, 'channels_convert_to_gigagroup')
+    def struct_0x0b290c69(self):
+        return ['channel' / self.input_channel_structures('channel')]
+
+    @constructor(0x0dc770ee, 'channels_get_send_as')
+    def struct_0x0dc770ee(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x0de560d1, 'channels_get_forum_topics')
+    def struct_0x0de560d1(self):
+        return Struct(
+            'sname' / Computed('channels_get_forum_topics'),
+            'signature' / Hex(Const(0x0de560d1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_q=1),
+            'channel' / self.input_channel_structures('channel'),
+            'q' / If(this.flags.has_q, TString),
+            'offset_date' / TTimestamp,
+            'offset_id' / Int32ul,
+            'offset_topic' / Int32ul,
+            'limit' / Int32ul)
+
+    @constructor(0x10e6bd2c, 'channels_check_username')
+    def struct_0x10e6bd2c(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'username' / TString)
+
+    @constructor(0x11e831ee, 'channels_get_inactive_channels')
+    def struct_0x11e831ee(self):
+        return []
+
+    @constructor(0x18afbc93, 'channels_click_sponsored_message')
+    def struct_0x18afbc93(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'random_id' / TBytes)
+
+    @constructor(0x199f3a6c, 'channels_invite_to_channel')
+    def struct_0x199f3a6c(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'users' / self.vector(self.input_user_structures('users'), 'users'))
+
+    @constructor(0x1f69b606, 'channels_toggle_signatures')
+    def struct_0x1f69b606(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'enabled' / TBool)
+
+    @constructor(0x1fad68cd, 'channel_admin_log_event')
+    def struct_0x1fad68cd(self):
+        return (
+            'id' / Int64ul,
+            'date' / TTimestamp,
+            'user_id' / Int64ul,
+            'action' / self.channel_admin_log_event_action_structures('action'))
+
+    @constructor(0x24b524c5, 'channels_join_channel')
+    def struct_0x24b524c5(self):
+        return ['channel' / self.input_channel_structures('channel')]
+
+    @constructor(0x25a71742, 'channels_get_channel_recommendations')
+    def struct_0x25a71742(self):
+        return Struct(
+            'sname' / Computed('channels_get_channel_recommendations'),
+            'signature' / Hex(Const(0x25a71742, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_channel=1),
+            'channel' / If(this.flags.has_channel, self.input_channel_structures('channel')))
+
+    @constructor(0x2950a18f, 'channels_reorder_pinned_forum_topics')
+    def struct_0x2950a18f(self):
+        return Struct(
+            'sname' / Computed('channels_reorder_pinned_forum_topics'),
+            'signature' / Hex(Const(0x2950a18f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_force=1),
+            'channel' / self.input_channel_structures('channel'),
+            'order' / self.vector(Int32ul, 'order'))
+
+    @constructor(0x33ddf480, 'channels_get_admin_log')
+    def struct_0x33ddf480(self):
+        return Struct(
+            'sname' / Computed('channels_get_admin_log'),
+            'signature' / Hex(Const(0x33ddf480, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_events_filter=1,
+                                has_admins=2),
+            'channel' / self.input_channel_structures('channel'),
+            'q' / TString,
+            'events_filter' / If(this.flags.has_events_filter, self.struct_0xea107ae4()),
+            'admins' / If(this.flags.has_admins, self.vector(self.input_user_structures('admins'), 'admins')),
+            'max_id' / Int64ul,
+            'min_id' / Int64ul,
+            'limit' / Int32ul)
+
+    @constructor(0x34435f2d, 'channels_delete_topic_history')
+    def struct_0x34435f2d(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'top_msg_id' / Int32ul)
+
+    @constructor(0x3514b3de, 'channels_update_username')
+    def struct_0x3514b3de(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'username' / TString)
+
+    @constructor(0x367544db, 'channels_delete_participant_history')
+    def struct_0x367544db(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'participant' / self.input_peer_structures('participant'))
+
+    @constructor(0x3cd930b7, 'channels_set_emoji_stickers')
+    def struct_0x3cd930b7(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'stickerset' / self.input_sticker_set_structures('stickerset'))
+
+    @constructor(0x40582bb2, 'channels_set_discussion_group')
+    def struct_0x40582bb2(self):
+        return (
+            'broadcast' / self.input_channel_structures('broadcast'),
+            'group' / self.input_channel_structures('group'))
+
+    @constructor(0x418d549c, 'channels_toggle_signatures')
+    def struct_0x418d549c(self):
+        return Struct(
+            'sname' / Computed('channels_toggle_signatures'),
+            'signature' / Hex(Const(0x418d549c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_signatures_enabled=1,
+                                is_profiles_enabled=2),
+            'channel' / self.input_channel_structures('channel'))
+
+    @constructor(0x43a0a7e2, 'channels_search_posts')
+    def struct_0x43a0a7e2(self):
+        return (
+            'q' / TString,
+            'offset_rate' / Int32ul,
+            'offset_peer' / self.input_peer_structures('offset_peer'),
+            'offset_id' / Int32ul,
+            'limit' / Int32ul)
+
+    @constructor(0x4c2985b6, 'channels_toggle_join_request')
+    def struct_0x4c2985b6(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'enabled' / TBool)
+
+    @constructor(0x50f24105, 'channels_toggle_username')
+    def struct_0x50f24105(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'username' / TString,
+            'active' / TBool)
+
+    @constructor(0x566decd0, 'channels_edit_title')
+    def struct_0x566decd0(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'title' / TString)
+
+    @constructor(0x58e63f6d, 'channels_edit_location')
+    def struct_0x58e63f6d(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'geo_point' / self.input_geo_point_structures('geo_point'),
+            'address' / TString)
+
+    @constructor(0x68f3e4eb, 'channels_toggle_anti_spam')
+    def struct_0x68f3e4eb(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'enabled' / TBool)
+
+    @constructor(0x6a6e7854, 'channels_toggle_participants_hidden')
+    def struct_0x6a6e7854(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'enabled' / TBool)
+
+    @constructor(0x6c2d9026, 'channels_update_pinned_forum_topic')
+    def struct_0x6c2d9026(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'topic_id' / Int32ul,
+            'pinned' / TBool)
+
+    @constructor(0x77ced9d0, 'channels_get_participants')
+    def struct_0x77ced9d0(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'filter' / self.channel_participants_filter_structures('filter'),
+            'offset' / Int32ul,
+            'limit' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0x83b70d97, 'channels_get_channel_recommendations')
+    def struct_0x83b70d97(self):
+        return ['channel' / self.input_channel_structures('channel')]
+
+    @constructor(0x84c1fd4e, 'channels_delete_messages')
+    def struct_0x84c1fd4e(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0x8f38cd1f, 'channels_edit_creator')
+    def struct_0x8f38cd1f(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'user_id' / self.input_user_structures('user_id'),
+            'password' / self.input_check_password_srp_structures('password'))
+
+    @constructor(0x91006707, 'channels_create_channel')
+    def struct_0x91006707(self):
+        return Struct(
+            'sname' / Computed('channels_create_channel'),
+            'signature' / Hex(Const(0x91006707, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_broadcast=1,
+                                is_megagroup=2,
+                                is_for_import=8,
+                                is_forum=32,
+                                has_geo_point=4,
+                                has_ttl_period=16),
+            'title' / TString,
+            'about' / TString,
+            'geo_point' / If(this.flags.has_geo_point, self.input_geo_point_structures('geo_point')),
+            'address' / If(this.flags.has_geo_point, TString),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0x93d7b347, 'channels_get_messages')
+    def struct_0x93d7b347(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0x96e6cd81, 'channels_edit_banned')
+    def struct_0x96e6cd81(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'participant' / self.input_peer_structures('participant'),
+            'banned_rights' / self.struct_0x9f120418())
+
+    @constructor(0x9738bb15, 'channels_toggle_view_forum_as_messages')
+    def struct_0x9738bb15(self):
+        return (
+            'channel_id' / self.input_channel_structures('channel_id'),
+            'enabled' / TBool)
+
+    @constructor(0x9ae91519, 'channels_restrict_sponsored_messages')
+    def struct_0x9ae91519(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'restricted' / TBool)
+
+    @constructor(0x9baa9647, 'channels_delete_history')
+    def struct_0x9baa9647(self):
+        return Struct(
+            'sname' / Computed('channels_delete_history'),
+            'signature' / Hex(Const(0x9baa9647, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_for_everyone=1),
+            'channel' / self.input_channel_structures('channel'),
+            'max_id' / Int32ul)
+
+    @constructor(0xa0ab6cc6, 'channels_get_participant')
+    def struct_0xa0ab6cc6(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'participant' / self.input_peer_structures('participant'))
+
+    @constructor(0xa4298b29, 'channels_toggle_forum')
+    def struct_0xa4298b29(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'enabled' / TBool)
+
+    @constructor(0xa850a693, 'channels_report_anti_spam_false_positive')
+    def struct_0xa850a693(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'msg_id' / Int32ul)
+
+    @constructor(0xad399cee, 'channels_set_boosts_to_unblock_restrictions')
+    def struct_0xad399cee(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'boosts' / Int32ul)
+
+    @constructor(0xb0831eb9, 'channels_get_forum_topics_by_id')
+    def struct_0xb0831eb9(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'topics' / self.vector(Int32ul, 'topics'))
+
+    @constructor(0xb45ced1d, 'channels_reorder_usernames')
+    def struct_0xb45ced1d(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'order' / self.vector(TString, 'order'))
+
+    @constructor(0xb81c7034, 'send_as_peer')
+    def struct_0xb81c7034(self):
+        return Struct(
+            'sname' / Computed('send_as_peer'),
+            'signature' / Hex(Const(0xb81c7034, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_premium_required=1),
+            'peer' / self.peer_structures('peer'))
+
+    @constructor(0xbeaedb94, 'channels_view_sponsored_message')
+    def struct_0xbeaedb94(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'random_id' / TBytes)
+
+    @constructor(0xc0111fe3, 'channels_delete_channel')
+    def struct_0xc0111fe3(self):
+        return ['channel' / self.input_channel_structures('channel')]
+
+    @constructor(0xcc104937, 'channels_read_history')
+    def struct_0xcc104937(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'max_id' / Int32ul)
+
+    @constructor(0xd19f987b, 'channels_search_posts')
+    def struct_0xd19f987b(self):
+        return (
+            'hashtag' / TString,
+            'offset_rate' / Int32ul,
+            'offset_peer' / self.input_peer_structures('offset_peer'),
+            'offset_id' / Int32ul,
+            'limit' / Int32ul)
+
+    @constructor(0xd33c8902, 'channels_edit_admin')
+    def struct_0xd33c8902(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'user_id' / self.input_user_structures('user_id'),
+            'admin_rights' / self.struct_0x5fb224d5(),
+            'rank' / TString)
+
+    @constructor(0xd8aa3671, 'channels_update_color')
+    def struct_0xd8aa3671(self):
+        return Struct(
+            'sname' / Computed('channels_update_color'),
+            'signature' / Hex(Const(0xd8aa3671, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_for_profile=2,
+                                has_color=4,
+                                has_background_emoji_id=1),
+            'channel' / self.input_channel_structures('channel'),
+            'color' / If(this.flags.has_color, Int32ul),
+            'background_emoji_id' / If(this.flags.has_background_emoji_id, Int64ul))
+
+    @constructor(0xdfb80317, 'channels_channel_participant')
+    def struct_0xdfb80317(self):
+        return (
+            'participant' / self.channel_participant_structures('participant'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xe4cb9580, 'channels_toggle_join_to_send')
+    def struct_0xe4cb9580(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'enabled' / TBool)
+
+    @constructor(0xe63fadeb, 'channels_export_message_link')
+    def struct_0xe63fadeb(self):
+        return Struct(
+            'sname' / Computed('channels_export_message_link'),
+            'signature' / Hex(Const(0xe63fadeb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_grouped=1,
+                                is_thread=2),
+            'channel' / self.input_channel_structures('channel'),
+            'id' / Int32ul)
+
+    @constructor(0xea107ae4, 'channel_admin_log_events_filter')
+    def struct_0xea107ae4(self):
+        return Struct(
+            'sname' / Computed('channel_admin_log_events_filter'),
+            'signature' / Hex(Const(0xea107ae4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_join=1,
+                                is_leave=2,
+                                is_invite=4,
+                                is_ban=8,
+                                is_unban=16,
+                                is_kick=32,
+                                is_unkick=64,
+                                is_promote=128,
+                                is_demote=256,
+                                is_info=512,
+                                is_settings=1024,
+                                is_pinned=2048,
+                                is_edit=4096,
+                                is_delete=8192,
+                                is_group_call=16384,
+                                is_invites=32768,
+                                is_send=65536,
+                                is_forums=131072,
+                                is_sub_extend=262144))
+
+    @constructor(0xea8ca4f9, 'channels_set_stickers')
+    def struct_0xea8ca4f9(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'stickerset' / self.input_sticker_set_structures('stickerset'))
+
+    @constructor(0xeab5dc38, 'channels_read_message_contents')
+    def struct_0xeab5dc38(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0xeabbb94c, 'channels_toggle_pre_history_hidden')
+    def struct_0xeabbb94c(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'enabled' / TBool)
+
+    @constructor(0xec210fbf, 'channels_get_sponsored_messages')
+    def struct_0xec210fbf(self):
+        return ['channel' / self.input_channel_structures('channel')]
+
+    @constructor(0xed8af74d, 'channels_admin_log_results')
+    def struct_0xed8af74d(self):
+        return (
+            'events' / self.vector(self.struct_0x1fad68cd(), 'events'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xedd49ef0, 'channels_toggle_slow_mode')
+    def struct_0xedd49ef0(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'seconds' / Int32ul)
+
+    @constructor(0xf0d3e6a8, 'channels_update_emoji_status')
+    def struct_0xf0d3e6a8(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'emoji_status' / self.emoji_status_structures('emoji_status'))
+
+    @constructor(0xf12e57c9, 'channels_edit_photo')
+    def struct_0xf12e57c9(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'photo' / self.input_chat_photo_structures('photo'))
+
+    @constructor(0xf40c0224, 'channels_create_forum_topic')
+    def struct_0xf40c0224(self):
+        return Struct(
+            'sname' / Computed('channels_create_forum_topic'),
+            'signature' / Hex(Const(0xf40c0224, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_icon_color=1,
+                                has_icon_emoji_id=8,
+                                has_send_as=4),
+            'channel' / self.input_channel_structures('channel'),
+            'title' / TString,
+            'icon_color' / If(this.flags.has_icon_color, Int32ul),
+            'icon_emoji_id' / If(this.flags.has_icon_emoji_id, Int64ul),
+            'random_id' / Int64ul,
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')))
+
+    @constructor(0xf44a8315, 'channels_report_spam')
+    def struct_0xf44a8315(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'participant' / self.input_peer_structures('participant'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0xf496b0c6, 'channels_send_as_peers')
+    def struct_0xf496b0c6(self):
+        return (
+            'peers' / self.vector(self.struct_0xb81c7034(), 'peers'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xf4dfa185, 'channels_edit_forum_topic')
+    def struct_0xf4dfa185(self):
+        return Struct(
+            'sname' / Computed('channels_edit_forum_topic'),
+            'signature' / Hex(Const(0xf4dfa185, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_title=1,
+                                has_icon_emoji_id=2,
+                                has_closed=4,
+                                has_hidden=8),
+            'channel' / self.input_channel_structures('channel'),
+            'topic_id' / Int32ul,
+            'title' / If(this.flags.has_title, TString),
+            'icon_emoji_id' / If(this.flags.has_icon_emoji_id, Int64ul),
+            'closed' / If(this.flags.has_closed, TBool),
+            'hidden' / If(this.flags.has_hidden, TBool))
+
+    @constructor(0xf5dad378, 'channels_get_groups_for_discussion')
+    def struct_0xf5dad378(self):
+        return []
+
+    @constructor(0xf836aa95, 'channels_leave_channel')
+    def struct_0xf836aa95(self):
+        return ['channel' / self.input_channel_structures('channel')]
+
+    @constructor(0xf8b036af, 'channels_get_admined_public_channels')
+    def struct_0xf8b036af(self):
+        return Struct(
+            'sname' / Computed('channels_get_admined_public_channels'),
+            'signature' / Hex(Const(0xf8b036af, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_by_location=1,
+                                is_check_limit=2,
+                                is_for_personal=4))
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group channels_channel_participants of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x9ab0feaf, 'channels_channel_participants')
+    def struct_0x9ab0feaf(self):
+        return (
+            'count' / Int32ul,
+            'participants' / self.vector(self.channel_participant_structures('participants'), 'participants'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xf0173fe9, 'channels_channel_participants_not_modified')
+    def struct_0xf0173fe9(self):
+        return []
+
+    @structures
+    def channels_channel_participants_structures(self, name):
+        tag_map = {
+            0x9ab0feaf: LazyBound(self.struct_0x9ab0feaf),
+            0xf0173fe9: LazyBound(self.struct_0xf0173fe9)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group channels_sponsored_message_report_result of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x846f9e42, 'channels_sponsored_message_report_result_choose_option')
+    def struct_0x846f9e42(self):
+        return (
+            'title' / TString,
+            'options' / self.vector(self.struct_0x430d3150(), 'options'))
+
+    @constructor(0x3e3bcf2f, 'channels_sponsored_message_report_result_ads_hidden')
+    def struct_0x3e3bcf2f(self):
+        return []
+
+    @constructor(0xad798849, 'channels_sponsored_message_report_result_reported')
+    def struct_0xad798849(self):
+        return []
+
+    @structures
+    def channels_sponsored_message_report_result_structures(self, name):
+        tag_map = {
+            0x846f9e42: LazyBound(self.struct_0x846f9e42),
+            0x3e3bcf2f: LazyBound(self.struct_0x3e3bcf2f),
+            0xad798849: LazyBound(self.struct_0xad798849)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x430d3150, 'sponsored_message_report_option')
+    def struct_0x430d3150(self):
+        return (
+            'text' / TString,
+            'option' / TBytes)
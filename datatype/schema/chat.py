@@ -0,0 +1,1245 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group chat of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x2d85832c, 'channel_forbidden_layer52')
+    def struct_0x2d85832c(self):
+        return (
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'title' / TString)
+
+    @constructor(0x9ba2d800, 'chat_empty_layer131')
+    def struct_0x9ba2d800(self):
+        return ['id' / Int32ul]
+
+    @constructor(0x07328bdb, 'chat_forbidden_layer131')
+    def struct_0x07328bdb(self):
+        return (
+            'id' / Int32ul,
+            'title' / TString)
+
+    @constructor(0x4df30834, 'channel_layer104')
+    def struct_0x4df30834(self):
+        return Struct(
+            'sname' / Computed('channel_layer104'),
+            'signature' / Hex(Const(0x4df30834, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'id' / Int32ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'version' / Int32ul,
+            'restriction_reason' / If(this.flags.is_restricted, TString),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul))
+
+    @constructor(0x7482147e, 'channel')
+    def struct_0x7482147e(self):
+        return Struct(
+            'sname' / Computed('channel'),
+            'signature' / Hex(Const(0x7482147e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_stories_hidden=2,
+                                 is_stories_hidden_min=4,
+                                 is_stories_unavailable=8,
+                                 is_signature_profiles=4096,
+                                 has_usernames=1,
+                                 has_stories_max_id=16,
+                                 has_color=128,
+                                 has_profile_color=256,
+                                 has_emoji_status=512,
+                                 has_level=1024,
+                                 has_subscription_until_date=2048,
+                                 has_bot_verification_icon=8192,
+                                 has_send_paid_messages_stars=16384),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'emoji_status' / If(this.flags2.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'level' / If(this.flags2.has_level, Int32ul),
+            'subscription_until_date' / If(this.flags2.has_subscription_until_date, TTimestamp),
+            'bot_verification_icon' / If(this.flags2.has_bot_verification_icon, Int64ul),
+            'send_paid_messages_stars' / If(this.flags2.has_send_paid_messages_stars, Int64ul))
+
+    @constructor(0xe00998b7, 'channel_layer199')
+    def struct_0xe00998b7(self):
+        return Struct(
+            'sname' / Computed('channel_layer199'),
+            'signature' / Hex(Const(0xe00998b7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_stories_hidden=2,
+                                 is_stories_hidden_min=4,
+                                 is_stories_unavailable=8,
+                                 is_signature_profiles=4096,
+                                 has_usernames=1,
+                                 has_stories_max_id=16,
+                                 has_color=128,
+                                 has_profile_color=256,
+                                 has_emoji_status=512,
+                                 has_level=1024,
+                                 has_subscription_until_date=2048,
+                                 has_bot_verification_icon=8192),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'emoji_status' / If(this.flags2.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'level' / If(this.flags2.has_level, Int32ul),
+            'subscription_until_date' / If(this.flags2.has_subscription_until_date, TTimestamp),
+            'bot_verification_icon' / If(this.flags2.has_bot_verification_icon, Int64ul))
+
+    @constructor(0x46aeac06, 'channel_layer196_1')
+    def struct_0x46aeac06(self):
+        return Struct(
+            'sname' / Computed('channel_layer196_1'),
+            'signature' / Hex(Const(0x46aeac06, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_stories_hidden=2,
+                                 is_stories_hidden_min=4,
+                                 is_stories_unavailable=8,
+                                 is_signature_profiles=4096,
+                                 has_usernames=1,
+                                 has_stories_max_id=16,
+                                 has_color=128,
+                                 has_profile_color=256,
+                                 has_emoji_status=512,
+                                 has_level=1024,
+                                 has_subscription_until_date=2048,
+                                 has_bot_verification_icon=8192),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'emoji_status' / If(this.flags2.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'level' / If(this.flags2.has_level, Int32ul),
+            'subscription_until_date' / If(this.flags2.has_subscription_until_date, TTimestamp),
+            'bot_verification_icon' / If(this.flags2.has_bot_verification_icon, Int64ul))
+
+    @constructor(0xfe4478bd, 'channel_layer195')
+    def struct_0xfe4478bd(self):
+        return Struct(
+            'sname' / Computed('channel_layer195'),
+            'signature' / Hex(Const(0xfe4478bd, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_stories_hidden=2,
+                                 is_stories_hidden_min=4,
+                                 is_stories_unavailable=8,
+                                 is_signature_profiles=4096,
+                                 has_usernames=1,
+                                 has_stories_max_id=16,
+                                 has_color=128,
+                                 has_profile_color=256,
+                                 has_emoji_status=512,
+                                 has_level=1024,
+                                 has_subscription_until_date=2048),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'emoji_status' / If(this.flags2.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'level' / If(this.flags2.has_level, Int32ul),
+            'subscription_until_date' / If(this.flags2.has_subscription_until_date, TTimestamp))
+
+    @constructor(0x0aadfc8f, 'channel_layer185')
+    def struct_0x0aadfc8f(self):
+        return Struct(
+            'sname' / Computed('channel_layer185'),
+            'signature' / Hex(Const(0x0aadfc8f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_stories_hidden=2,
+                                 is_stories_hidden_min=4,
+                                 is_stories_unavailable=8,
+                                 has_usernames=1,
+                                 has_stories_max_id=16,
+                                 has_color=128,
+                                 has_profile_color=256,
+                                 has_emoji_status=512,
+                                 has_level=1024),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'emoji_status' / If(this.flags2.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'level' / If(this.flags2.has_level, Int32ul))
+
+    @constructor(0x0db12acb, 'channel_layer167_3')
+    def struct_0x0db12acb(self):
+        return Struct(
+            'sname' / Computed('channel_layer167_3'),
+            'signature' / Hex(Const(0x0db12acb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_stories_hidden=2,
+                                 is_stories_hidden_min=4,
+                                 is_stories_unavailable=8,
+                                 has_usernames=1,
+                                 has_stories_max_id=16,
+                                 has_color=128,
+                                 has_profile_color=256,
+                                 has_emoji_status=512),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'emoji_status' / If(this.flags2.has_emoji_status, self.emoji_status_structures('emoji_status')))
+
+    @constructor(0xa636a3e2, 'channel_layer167_2')
+    def struct_0xa636a3e2(self):
+        return Struct(
+            'sname' / Computed('channel_layer167_2'),
+            'signature' / Hex(Const(0xa636a3e2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_stories_hidden=2,
+                                 is_stories_hidden_min=4,
+                                 is_stories_unavailable=8,
+                                 has_usernames=1,
+                                 has_stories_max_id=16,
+                                 has_color=128,
+                                 has_profile_color=256),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()))
+
+    @constructor(0x8e87ccd8, 'channel_layer167')
+    def struct_0x8e87ccd8(self):
+        return Struct(
+            'sname' / Computed('channel_layer167'),
+            'signature' / Hex(Const(0x8e87ccd8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_stories_hidden=2,
+                                 is_stories_hidden_min=4,
+                                 is_stories_unavailable=8,
+                                 has_usernames=1,
+                                 has_stories_max_id=16,
+                                 has_color=128),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()))
+
+    @constructor(0x1981ea7e, 'channel_layer166')
+    def struct_0x1981ea7e(self):
+        return Struct(
+            'sname' / Computed('channel_layer166'),
+            'signature' / Hex(Const(0x1981ea7e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_stories_hidden=2,
+                                 is_stories_hidden_min=4,
+                                 is_stories_unavailable=8,
+                                 has_usernames=1,
+                                 has_stories_max_id=16,
+                                 has_color=64,
+                                 has_background_emoji_id=32),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, Int32ul),
+            'background_emoji_id' / If(this.flags2.has_background_emoji_id, Int64ul))
+
+    @constructor(0x94f592db, 'channel_layer165')
+    def struct_0x94f592db(self):
+        return Struct(
+            'sname' / Computed('channel_layer165'),
+            'signature' / Hex(Const(0x94f592db, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_stories_hidden=2,
+                                 is_stories_hidden_min=4,
+                                 is_stories_unavailable=8,
+                                 has_usernames=1,
+                                 has_stories_max_id=16),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul))
+
+    @constructor(0x450b7115, 'channel_layer77')
+    def struct_0x450b7115(self):
+        return Struct(
+            'sname' / Computed('channel_layer77'),
+            'signature' / Hex(Const(0x450b7115, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights_layer92=16384,
+                                has_banned_rights_layer92=32768,
+                                has_participants_count=131072),
+            'id' / Int32ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'version' / Int32ul,
+            'restriction_reason' / If(this.flags.is_restricted, TString),
+            'admin_rights_layer92' / If(this.flags.has_admin_rights_layer92, self.struct_0x5d7ceba5()),
+            'banned_rights_layer92' / If(this.flags.has_banned_rights_layer92, self.struct_0x58cf4249()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul))
+
+    @constructor(0x29562865, 'chat_empty')
+    def struct_0x29562865(self):
+        return ['id' / Int64ul]
+
+    @constructor(0x41cbf256, 'chat')
+    def struct_0x41cbf256(self):
+        return Struct(
+            'sname' / Computed('chat'),
+            'signature' / Hex(Const(0x41cbf256, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_kicked=2,
+                                is_left=4,
+                                is_deactivated=32,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_noforwards=33554432,
+                                has_migrated_to=64,
+                                has_admin_rights=16384,
+                                has_default_banned_rights=262144),
+            'id' / Int64ul,
+            'title' / TString,
+            'photo' / self.chat_photo_structures('photo'),
+            'participants_count' / Int32ul,
+            'date' / TTimestamp,
+            'version' / Int32ul,
+            'migrated_to' / If(this.flags.has_migrated_to, self.input_channel_structures('migrated_to')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()))
+
+    @constructor(0xd31a961e, 'channel_layer131')
+    def struct_0xd31a961e(self):
+        return Struct(
+            'sname' / Computed('channel_layer131'),
+            'signature' / Hex(Const(0xd31a961e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'id' / Int32ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'version' / Int32ul,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul))
+
+    @constructor(0x4b1b7506, 'channel_layer48')
+    def struct_0x4b1b7506(self):
+        return Struct(
+            'sname' / Computed('channel_layer48'),
+            'signature' / Hex(Const(0x4b1b7506, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_kicked=2,
+                                is_left=4,
+                                is_moderator=16,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                has_username=64),
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'version' / Int32ul,
+            'restriction_reason' / If(this.flags.is_restricted, TString))
+
+    @constructor(0x678e9587, 'channel_old')
+    def struct_0x678e9587(self):
+        return Struct(
+            'sname' / Computed('channel_old'),
+            'signature' / Hex(Const(0x678e9587, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_kicked=2,
+                                is_left=4,
+                                is_moderator=16,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_explicit_content=512,
+                                has_username=64),
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'version' / Int32ul)
+
+    @constructor(0x0cb44b1c, 'channel_layer72')
+    def struct_0x0cb44b1c(self):
+        return Struct(
+            'sname' / Computed('channel_layer72'),
+            'signature' / Hex(Const(0x0cb44b1c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_kicked=2,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights_layer92=16384,
+                                has_banned_rights_layer92=32768),
+            'id' / Int32ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'version' / Int32ul,
+            'restriction_reason' / If(this.flags.is_restricted, TString),
+            'admin_rights_layer92' / If(this.flags.has_admin_rights_layer92, self.struct_0x5d7ceba5()),
+            'banned_rights_layer92' / If(this.flags.has_banned_rights_layer92, self.struct_0x58cf4249()))
+
+    @constructor(0x8537784f, 'channel_forbidden_layer67')
+    def struct_0x8537784f(self):
+        return Struct(
+            'sname' / Computed('channel_forbidden_layer67'),
+            'signature' / Hex(Const(0x8537784f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_broadcast=32,
+                                is_megagroup=256),
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'title' / TString)
+
+    @constructor(0xd91cdd54, 'chat_layer92')
+    def struct_0xd91cdd54(self):
+        return Struct(
+            'sname' / Computed('chat_layer92'),
+            'signature' / Hex(Const(0xd91cdd54, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_kicked=2,
+                                is_left=4,
+                                is_deactivated=32,
+                                has_migrated_to=64),
+            'id' / Int32ul,
+            'title' / TString,
+            'photo' / self.chat_photo_structures('photo'),
+            'participants_count' / Int32ul,
+            'date' / TTimestamp,
+            'version' / Int32ul,
+            'migrated_to' / If(this.flags.has_migrated_to, self.input_channel_structures('migrated_to')))
+
+    @constructor(0xc88974ac, 'channel_layer92')
+    def struct_0xc88974ac(self):
+        return Struct(
+            'sname' / Computed('channel_layer92'),
+            'signature' / Hex(Const(0xc88974ac, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights_layer92=16384,
+                                has_banned_rights_layer92=32768,
+                                has_participants_count=131072),
+            'id' / Int32ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'version' / Int32ul,
+            'restriction_reason' / If(this.flags.is_restricted, TString),
+            'admin_rights_layer92' / If(this.flags.has_admin_rights_layer92, self.struct_0x5d7ceba5()),
+            'banned_rights_layer92' / If(this.flags.has_banned_rights_layer92, self.struct_0x58cf4249()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul))
+
+    @constructor(0x17d493d5, 'channel_forbidden')
+    def struct_0x17d493d5(self):
+        return Struct(
+            'sname' / Computed('channel_forbidden'),
+            'signature' / Hex(Const(0x17d493d5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_broadcast=32,
+                                is_megagroup=256,
+                                has_until_date=65536),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'until_date' / If(this.flags.has_until_date, TTimestamp))
+
+    @constructor(0x3bda1bde, 'chat_layer131')
+    def struct_0x3bda1bde(self):
+        return Struct(
+            'sname' / Computed('chat_layer131'),
+            'signature' / Hex(Const(0x3bda1bde, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_kicked=2,
+                                is_left=4,
+                                is_deactivated=32,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                has_migrated_to=64,
+                                has_admin_rights=16384,
+                                has_default_banned_rights=262144),
+            'id' / Int32ul,
+            'title' / TString,
+            'photo' / self.chat_photo_structures('photo'),
+            'participants_count' / Int32ul,
+            'date' / TTimestamp,
+            'version' / Int32ul,
+            'migrated_to' / If(this.flags.has_migrated_to, self.input_channel_structures('migrated_to')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()))
+
+    @constructor(0x289da732, 'channel_forbidden_layer131')
+    def struct_0x289da732(self):
+        return Struct(
+            'sname' / Computed('channel_forbidden_layer131'),
+            'signature' / Hex(Const(0x289da732, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_broadcast=32,
+                                is_megagroup=256,
+                                has_until_date=65536),
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'until_date' / If(this.flags.has_until_date, TTimestamp))
+
+    @constructor(0x7312bc48, 'chat_old2')
+    def struct_0x7312bc48(self):
+        return Struct(
+            'sname' / Computed('chat_old2'),
+            'signature' / Hex(Const(0x7312bc48, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_kicked=2,
+                                is_left=4,
+                                is_deactivated=32),
+            'id' / Int32ul,
+            'title' / TString,
+            'photo' / self.chat_photo_structures('photo'),
+            'participants_count' / Int32ul,
+            'date' / TTimestamp,
+            'version' / Int32ul)
+
+    @constructor(0xa14dca52, 'channel_layer67')
+    def struct_0xa14dca52(self):
+        return Struct(
+            'sname' / Computed('channel_layer67'),
+            'signature' / Hex(Const(0xa14dca52, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_kicked=2,
+                                is_left=4,
+                                is_moderator=16,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                has_access_hash=8192,
+                                has_username=64),
+            'id' / Int32ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'version' / Int32ul,
+            'restriction_reason' / If(this.flags.is_restricted, TString))
+
+    @constructor(0x83259464, 'channel_layer161')
+    def struct_0x83259464(self):
+        return Struct(
+            'sname' / Computed('channel_layer161'),
+            'signature' / Hex(Const(0x83259464, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_stories_hidden=2,
+                                 is_stories_hidden_min=4,
+                                 has_usernames=1),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')))
+
+    @constructor(0x8261ac61, 'channel_layer147')
+    def struct_0x8261ac61(self):
+        return Struct(
+            'sname' / Computed('channel_layer147'),
+            'signature' / Hex(Const(0x8261ac61, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_left=4,
+                                is_broadcast=32,
+                                is_verified=128,
+                                is_megagroup=256,
+                                is_restricted=512,
+                                is_signatures=2048,
+                                is_min=4096,
+                                is_scam=524288,
+                                has_link=1048576,
+                                has_geo=2097152,
+                                is_slowmode_enabled=4194304,
+                                is_call_active=8388608,
+                                is_call_not_empty=16777216,
+                                is_fake=33554432,
+                                is_gigagroup=67108864,
+                                is_noforwards=134217728,
+                                is_join_to_send=268435456,
+                                is_join_request=536870912,
+                                is_forum=1073741824,
+                                has_access_hash=8192,
+                                has_username=64,
+                                has_admin_rights=16384,
+                                has_banned_rights=32768,
+                                has_default_banned_rights=262144,
+                                has_participants_count=131072),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'title' / TString,
+            'username' / If(this.flags.has_username, TString),
+            'photo' / self.chat_photo_structures('photo'),
+            'date' / TTimestamp,
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'admin_rights' / If(this.flags.has_admin_rights, self.struct_0x5fb224d5()),
+            'banned_rights' / If(this.flags.has_banned_rights, self.struct_0x9f120418()),
+            'default_banned_rights' / If(this.flags.has_default_banned_rights, self.struct_0x9f120418()),
+            'participants_count' / If(this.flags.has_participants_count, Int32ul))
+
+    @constructor(0xfb0ccc41, 'chat_forbidden_old')
+    def struct_0xfb0ccc41(self):
+        return (
+            'id' / Int32ul,
+            'title' / TString,
+            'date' / TTimestamp)
+
+    @constructor(0x6e9c9bc7, 'chat_old')
+    def struct_0x6e9c9bc7(self):
+        return (
+            'id' / Int32ul,
+            'title' / TString,
+            'photo' / self.chat_photo_structures('photo'),
+            'participants_count' / Int32ul,
+            'date' / TTimestamp,
+            'left' / TBool,
+            'version' / Int32ul)
+
+    @constructor(0x6592a1a7, 'chat_forbidden')
+    def struct_0x6592a1a7(self):
+        return (
+            'id' / Int64ul,
+            'title' / TString)
+
+    @structures
+    def chat_structures(self, name):
+        tag_map = {
+            0x2d85832c: LazyBound(self.struct_0x2d85832c),
+            0x9ba2d800: LazyBound(self.struct_0x9ba2d800),
+            0x07328bdb: LazyBound(self.struct_0x07328bdb),
+            0x4df30834: LazyBound(self.struct_0x4df30834),
+            0x7482147e: LazyBound(self.struct_0x7482147e),
+            0xe00998b7: LazyBound(self.struct_0xe00998b7),
+            0x46aeac06: LazyBound(self.struct_0x46aeac06),
+            0xfe4478bd: LazyBound(self.struct_0xfe4478bd),
+            0x0aadfc8f: LazyBound(self.struct_0x0aadfc8f),
+            0x0db12acb: LazyBound(self.struct_0x0db12acb),
+            0xa636a3e2: LazyBound(self.struct_0xa636a3e2),
+            0x8e87ccd8: LazyBound(self.struct_0x8e87ccd8),
+            0x1981ea7e: LazyBound(self.struct_0x1981ea7e),
+            0x94f592db: LazyBound(self.struct_0x94f592db),
+            0x450b7115: LazyBound(self.struct_0x450b7115),
+            0x29562865: LazyBound(self.struct_0x29562865),
+            0x41cbf256: LazyBound(self.struct_0x41cbf256),
+            0xd31a961e: LazyBound(self.struct_0xd31a961e),
+            0x4b1b7506: LazyBound(self.struct_0x4b1b7506),
+            0x678e9587: LazyBound(self.struct_0x678e9587),
+            0x0cb44b1c: LazyBound(self.struct_0x0cb44b1c),
+            0x8537784f: LazyBound(self.struct_0x8537784f),
+            0xd91cdd54: LazyBound(self.struct_0xd91cdd54),
+            0xc88974ac: LazyBound(self.struct_0xc88974ac),
+            0x17d493d5: LazyBound(self.struct_0x17d493d5),
+            0x3bda1bde: LazyBound(self.struct_0x3bda1bde),
+            0x289da732: LazyBound(self.struct_0x289da732),
+            0x7312bc48: LazyBound(self.struct_0x7312bc48),
+            0xa14dca52: LazyBound(self.struct_0xa14dca52),
+            0x83259464: LazyBound(self.struct_0x83259464),
+            0x8261ac61: LazyBound(self.struct_0x8261ac61),
+            0xfb0ccc41: LazyBound(self.struct_0xfb0ccc41),
+            0x6e9c9bc7: LazyBound(self.struct_0x6e9c9bc7),
+            0x6592a1a7: LazyBound(self.struct_0x6592a1a7)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x58cf4249, 'channel_banned_rights_layer92')
+    def struct_0x58cf4249(self):
+        return Struct(
+            'sname' / Computed('channel_banned_rights_layer92'),
+            'signature' / Hex(Const(0x58cf4249, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_view_messages=1,
+                                is_send_messages=2,
+                                is_send_media=4,
+                                is_send_stickers=8,
+                                is_send_gifs=16,
+                                is_send_games=32,
+                                is_send_inline=64,
+                                is_embed_links=128),
+            'until_date' / TTimestamp)
+
+    @constructor(0x5d7ceba5, 'channel_admin_rights_layer92')
+    def struct_0x5d7ceba5(self):
+        return Struct(
+            'sname' / Computed('channel_admin_rights_layer92'),
+            'signature' / Hex(Const(0x5d7ceba5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_change_info=1,
+                                is_post_messages=2,
+                                is_edit_messages=4,
+                                is_delete_messages=8,
+                                is_ban_users=16,
+                                is_invite_users=32,
+                                is_pin_messages=128,
+                                is_add_admins=512,
+                                is_manage_call=1024))
+
+    @constructor(0x5fb224d5, 'chat_admin_rights')
+    def struct_0x5fb224d5(self):
+        return Struct(
+            'sname' / Computed('chat_admin_rights'),
+            'signature' / Hex(Const(0x5fb224d5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_change_info=1,
+                                is_post_messages=2,
+                                is_edit_messages=4,
+                                is_delete_messages=8,
+                                is_ban_users=16,
+                                is_invite_users=32,
+                                is_pin_messages=128,
+                                is_add_admins=512,
+                                is_anonymous=1024,
+                                is_manage_call=2048,
+                                is_other=4096,
+                                is_manage_topics=8192,
+                                is_post_stories=16384,
+                                is_edit_stories=32768,
+                                is_delete_stories=65536))
+
+    @constructor(0x9f120418, 'chat_banned_rights')
+    def struct_0x9f120418(self):
+        return Struct(
+            'sname' / Computed('chat_banned_rights'),
+            'signature' / Hex(Const(0x9f120418, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_view_messages=1,
+                                is_send_messages=2,
+                                is_send_media=4,
+                                is_send_stickers=8,
+                                is_send_gifs=16,
+                                is_send_games=32,
+                                is_send_inline=64,
+                                is_embed_links=128,
+                                is_send_polls=256,
+                                is_change_info=1024,
+                                is_invite_users=32768,
+                                is_pin_messages=131072,
+                                is_manage_topics=262144,
+                                is_send_photos=524288,
+                                is_send_videos=1048576,
+                                is_send_roundvideos=2097152,
+                                is_send_audios=4194304,
+                                is_send_voices=8388608,
+                                is_send_docs=16777216,
+                                is_send_plain=33554432),
+            'until_date' / TTimestamp)
+
+    @constructor(0xf041e250, 'chat_onlines')
+    def struct_0xf041e250(self):
+        return ['onlines' / Int32ul]
@@ -0,0 +1,2352 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group chat_full of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x2633421b, 'chat_full')
+    def struct_0x2633421b(self):
+        return Struct(
+            'sname' / Computed('chat_full'),
+            'signature' / Hex(Const(0x2633421b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_scheduled=256,
+                                has_chat_photo=4,
+                                has_exported_invite=8192,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_call=4096,
+                                has_ttl_period=16384,
+                                has_groupcall_default_join_as=32768,
+                                has_theme_emoticon=65536,
+                                has_requests_pending=131072,
+                                has_available_reactions=262144,
+                                has_reactions_limit=1048576),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'available_reactions' / If(this.flags.has_available_reactions, self.chat_reactions_structures('available_reactions')),
+            'reactions_limit' / If(this.flags.has_reactions_limit, Int32ul))
+
+    @constructor(0x52d6806b, 'channel_full')
+    def struct_0x52d6806b(self):
+        return Struct(
+            'sname' / Computed('channel_full'),
+            'signature' / Hex(Const(0x52d6806b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456,
+                                has_default_send_as=536870912,
+                                has_available_reactions=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_can_delete_channel=1,
+                                 is_antispam=2,
+                                 is_participants_hidden=4,
+                                 is_translations_disabled=8,
+                                 is_stories_pinned_available=32,
+                                 is_view_forum_as_messages=64,
+                                 is_restricted_sponsored=2048,
+                                 is_can_view_revenue=4096,
+                                 is_paid_media_allowed=16384,
+                                 is_can_view_stars_revenue=32768,
+                                 is_paid_reactions_available=65536,
+                                 is_stargifts_available=524288,
+                                 is_paid_messages_available=1048576,
+                                 has_reactions_limit=8192,
+                                 has_stories=16,
+                                 has_wallpaper=128,
+                                 has_boosts_applied=256,
+                                 has_boosts_unrestrict=512,
+                                 has_emojiset=1024,
+                                 has_bot_verification=131072,
+                                 has_stargifts_count=262144),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'default_send_as' / If(this.flags.has_default_send_as, self.peer_structures('default_send_as')),
+            'available_reactions' / If(this.flags.has_available_reactions, self.chat_reactions_structures('available_reactions')),
+            'reactions_limit' / If(this.flags2.has_reactions_limit, Int32ul),
+            'stories' / If(this.flags2.has_stories, self.stories_peer_stories_structures('stories')),
+            'wallpaper' / If(this.flags2.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'boosts_applied' / If(this.flags2.has_boosts_applied, Int32ul),
+            'boosts_unrestrict' / If(this.flags2.has_boosts_unrestrict, Int32ul),
+            'emojiset' / If(this.flags2.has_emojiset, self.sticker_set_structures('emojiset')),
+            'bot_verification' / If(this.flags2.has_bot_verification, self.struct_0xf93cd45c()),
+            'stargifts_count' / If(this.flags2.has_stargifts_count, Int32ul))
+
+    @constructor(0x9ff3b858, 'channel_full_layer197')
+    def struct_0x9ff3b858(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer197'),
+            'signature' / Hex(Const(0x9ff3b858, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456,
+                                has_default_send_as=536870912,
+                                has_available_reactions=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_can_delete_channel=1,
+                                 is_antispam=2,
+                                 is_participants_hidden=4,
+                                 is_translations_disabled=8,
+                                 is_stories_pinned_available=32,
+                                 is_view_forum_as_messages=64,
+                                 is_restricted_sponsored=2048,
+                                 is_can_view_revenue=4096,
+                                 is_paid_media_allowed=16384,
+                                 is_can_view_stars_revenue=32768,
+                                 is_paid_reactions_available=65536,
+                                 has_reactions_limit=8192,
+                                 has_stories=16,
+                                 has_wallpaper=128,
+                                 has_boosts_applied=256,
+                                 has_boosts_unrestrict=512,
+                                 has_emojiset=1024,
+                                 has_bot_verification=131072),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'default_send_as' / If(this.flags.has_default_send_as, self.peer_structures('default_send_as')),
+            'available_reactions' / If(this.flags.has_available_reactions, self.chat_reactions_structures('available_reactions')),
+            'reactions_limit' / If(this.flags2.has_reactions_limit, Int32ul),
+            'stories' / If(this.flags2.has_stories, self.stories_peer_stories_structures('stories')),
+            'wallpaper' / If(this.flags2.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'boosts_applied' / If(this.flags2.has_boosts_applied, Int32ul),
+            'boosts_unrestrict' / If(this.flags2.has_boosts_unrestrict, Int32ul),
+            'emojiset' / If(this.flags2.has_emojiset, self.sticker_set_structures('emojiset')),
+            'bot_verification' / If(this.flags2.has_bot_verification, self.struct_0xf93cd45c()))
+
+    @constructor(0xbbab348d, 'channel_full_layer195')
+    def struct_0xbbab348d(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer195'),
+            'signature' / Hex(Const(0xbbab348d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456,
+                                has_default_send_as=536870912,
+                                has_available_reactions=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_can_delete_channel=1,
+                                 is_antispam=2,
+                                 is_participants_hidden=4,
+                                 is_translations_disabled=8,
+                                 is_stories_pinned_available=32,
+                                 is_view_forum_as_messages=64,
+                                 is_restricted_sponsored=2048,
+                                 is_can_view_revenue=4096,
+                                 is_paid_media_allowed=16384,
+                                 is_can_view_stars_revenue=32768,
+                                 is_paid_reactions_available=65536,
+                                 has_reactions_limit=8192,
+                                 has_stories=16,
+                                 has_wallpaper=128,
+                                 has_boosts_applied=256,
+                                 has_boosts_unrestrict=512,
+                                 has_emojiset=1024),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'default_send_as' / If(this.flags.has_default_send_as, self.peer_structures('default_send_as')),
+            'available_reactions' / If(this.flags.has_available_reactions, self.chat_reactions_structures('available_reactions')),
+            'reactions_limit' / If(this.flags2.has_reactions_limit, Int32ul),
+            'stories' / If(this.flags2.has_stories, self.stories_peer_stories_structures('stories')),
+            'wallpaper' / If(this.flags2.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'boosts_applied' / If(this.flags2.has_boosts_applied, Int32ul),
+            'boosts_unrestrict' / If(this.flags2.has_boosts_unrestrict, Int32ul),
+            'emojiset' / If(this.flags2.has_emojiset, self.sticker_set_structures('emojiset')))
+
+    @constructor(0xc9d31138, 'chat_full_layer177')
+    def struct_0xc9d31138(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer177'),
+            'signature' / Hex(Const(0xc9d31138, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_scheduled=256,
+                                has_chat_photo=4,
+                                has_exported_invite=8192,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_call=4096,
+                                has_ttl_period=16384,
+                                has_groupcall_default_join_as=32768,
+                                has_theme_emoticon=65536,
+                                has_requests_pending=131072,
+                                has_available_reactions=262144),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'available_reactions' / If(this.flags.has_available_reactions, self.chat_reactions_structures('available_reactions')))
+
+    @constructor(0x44c054a7, 'channel_full_layer177')
+    def struct_0x44c054a7(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer177'),
+            'signature' / Hex(Const(0x44c054a7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456,
+                                has_default_send_as=536870912,
+                                has_available_reactions=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_can_delete_channel=1,
+                                 is_antispam=2,
+                                 is_participants_hidden=4,
+                                 is_translations_disabled=8,
+                                 is_stories_pinned_available=32,
+                                 is_view_forum_as_messages=64,
+                                 is_restricted_sponsored=2048,
+                                 is_can_view_revenue=4096,
+                                 is_can_view_stars_revenue=32768,
+                                 has_stories=16,
+                                 has_wallpaper=128,
+                                 has_boosts_applied=256,
+                                 has_boosts_unrestrict=512,
+                                 has_emojiset=1024),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'default_send_as' / If(this.flags.has_default_send_as, self.peer_structures('default_send_as')),
+            'available_reactions' / If(this.flags.has_available_reactions, self.chat_reactions_structures('available_reactions')),
+            'stories' / If(this.flags2.has_stories, self.stories_peer_stories_structures('stories')),
+            'wallpaper' / If(this.flags2.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'boosts_applied' / If(this.flags2.has_boosts_applied, Int32ul),
+            'boosts_unrestrict' / If(this.flags2.has_boosts_unrestrict, Int32ul),
+            'emojiset' / If(this.flags2.has_emojiset, self.sticker_set_structures('emojiset')))
+
+    @constructor(0x680b773c, 'channel_full_layer176')
+    def struct_0x680b773c(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer176'),
+            'signature' / Hex(Const(0x680b773c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456,
+                                has_default_send_as=536870912,
+                                has_available_reactions=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_can_delete_channel=1,
+                                 is_antispam=2,
+                                 is_participants_hidden=4,
+                                 is_translations_disabled=8,
+                                 is_stories_pinned_available=32,
+                                 is_view_forum_as_messages=64,
+                                 has_stories=16,
+                                 has_wallpaper=128,
+                                 has_boosts_applied=256,
+                                 has_boosts_unrestrict=512,
+                                 has_emojiset=1024),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'default_send_as' / If(this.flags.has_default_send_as, self.peer_structures('default_send_as')),
+            'available_reactions' / If(this.flags.has_available_reactions, self.chat_reactions_structures('available_reactions')),
+            'stories' / If(this.flags2.has_stories, self.stories_peer_stories_structures('stories')),
+            'wallpaper' / If(this.flags2.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'boosts_applied' / If(this.flags2.has_boosts_applied, Int32ul),
+            'boosts_unrestrict' / If(this.flags2.has_boosts_unrestrict, Int32ul),
+            'emojiset' / If(this.flags2.has_emojiset, self.sticker_set_structures('emojiset')))
+
+    @constructor(0x723027bd, 'channel_full_layer167')
+    def struct_0x723027bd(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer167'),
+            'signature' / Hex(Const(0x723027bd, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456,
+                                has_default_send_as=536870912,
+                                has_available_reactions=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_can_delete_channel=1,
+                                 is_antispam=2,
+                                 is_participants_hidden=4,
+                                 is_translations_disabled=8,
+                                 is_stories_pinned_available=32,
+                                 is_view_forum_as_messages=64,
+                                 has_stories=16),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'default_send_as' / If(this.flags.has_default_send_as, self.peer_structures('default_send_as')),
+            'available_reactions' / If(this.flags.has_available_reactions, self.chat_reactions_structures('available_reactions')),
+            'stories' / If(this.flags2.has_stories, self.stories_peer_stories_structures('stories')))
+
+    @constructor(0x0f2bcb6f, 'channel_full_layer173')
+    def struct_0x0f2bcb6f(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer173'),
+            'signature' / Hex(Const(0x0f2bcb6f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456,
+                                has_default_send_as=536870912,
+                                has_available_reactions=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_can_delete_channel=1,
+                                 is_antispam=2,
+                                 is_participants_hidden=4,
+                                 is_translations_disabled=8,
+                                 is_stories_pinned_available=32,
+                                 is_view_forum_as_messages=64,
+                                 has_stories=16,
+                                 has_wallpaper=128),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'default_send_as' / If(this.flags.has_default_send_as, self.peer_structures('default_send_as')),
+            'available_reactions' / If(this.flags.has_available_reactions, self.chat_reactions_structures('available_reactions')),
+            'stories' / If(this.flags2.has_stories, self.stories_peer_stories_structures('stories')),
+            'wallpaper' / If(this.flags2.has_wallpaper, self.wall_paper_structures('wallpaper')))
+
+    @constructor(0xf2355507, 'channel_full_layer162')
+    def struct_0xf2355507(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer162'),
+            'signature' / Hex(Const(0xf2355507, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456,
+                                has_default_send_as=536870912,
+                                has_available_reactions=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_can_delete_channel=1,
+                                 is_antispam=2,
+                                 is_participants_hidden=4,
+                                 is_translations_disabled=8),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'default_send_as' / If(this.flags.has_default_send_as, self.peer_structures('default_send_as')),
+            'available_reactions' / If(this.flags.has_available_reactions, self.chat_reactions_structures('available_reactions')))
+
+    @constructor(0xd18ee226, 'chat_full_layer144')
+    def struct_0xd18ee226(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer144'),
+            'signature' / Hex(Const(0xd18ee226, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_scheduled=256,
+                                has_chat_photo=4,
+                                has_exported_invite=8192,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_call=4096,
+                                has_ttl_period=16384,
+                                has_groupcall_default_join_as=32768,
+                                has_theme_emoticon=65536,
+                                has_requests_pending=131072,
+                                has_available_reactions_legacy=262144),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'available_reactions_legacy' / If(this.flags.has_available_reactions_legacy, self.vector(TString, 'available_reactions_legacy')))
+
+    @constructor(0xea68a619, 'channel_full_layer144')
+    def struct_0xea68a619(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer144'),
+            'signature' / Hex(Const(0xea68a619, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456,
+                                has_default_send_as=536870912,
+                                has_available_reactions_legacy=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_can_delete_channel=1),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'default_send_as' / If(this.flags.has_default_send_as, self.peer_structures('default_send_as')),
+            'available_reactions_legacy' / If(this.flags.has_available_reactions_legacy, self.vector(TString, 'available_reactions_legacy')))
+
+    @constructor(0xe13c3d20, 'channel_full_layer139')
+    def struct_0xe13c3d20(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer139'),
+            'signature' / Hex(Const(0xe13c3d20, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456,
+                                has_default_send_as=536870912,
+                                has_available_reactions_legacy=1073741824),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'default_send_as' / If(this.flags.has_default_send_as, self.peer_structures('default_send_as')),
+            'available_reactions_legacy' / If(this.flags.has_available_reactions_legacy, self.vector(TString, 'available_reactions_legacy')))
+
+    @constructor(0x56662e2e, 'channel_full_layer135')
+    def struct_0x56662e2e(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer135'),
+            'signature' / Hex(Const(0x56662e2e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456,
+                                has_default_send_as=536870912),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')),
+            'default_send_as' / If(this.flags.has_default_send_as, self.peer_structures('default_send_as')))
+
+    @constructor(0x59cff963, 'channel_full_layer134')
+    def struct_0x59cff963(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer134'),
+            'signature' / Hex(Const(0x59cff963, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728,
+                                has_requests_pending=268435456),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')))
+
+    @constructor(0x1c87a71a, 'channel_full_layer98')
+    def struct_0x1c87a71a(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer98'),
+            'signature' / Hex(Const(0x1c87a71a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_view_stats=4096,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul))
+
+    @constructor(0x03648977, 'channel_full_layer99')
+    def struct_0x03648977(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer99'),
+            'signature' / Hex(Const(0x03648977, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_view_stats=4096,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'pts' / Int32ul)
+
+    @constructor(0x2e02a614, 'chat_full_layer87')
+    def struct_0x2e02a614(self):
+        return (
+            'id' / Int32ul,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'))
+
+    @constructor(0xef3a6acd, 'channel_full_layer122')
+    def struct_0xef3a6acd(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer122'),
+            'signature' / Hex(Const(0xef3a6acd, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int32ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()))
+
+    @constructor(0xf0e6672a, 'channel_full_layer121')
+    def struct_0xf0e6672a(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer121'),
+            'signature' / Hex(Const(0xf0e6672a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int32ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul)
+
+    @constructor(0x2d895c74, 'channel_full_layer110')
+    def struct_0x2d895c74(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer110'),
+            'signature' / Hex(Const(0x2d895c74, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_view_stats=4096,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int32ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'pts' / Int32ul)
+
+    @constructor(0x10916653, 'channel_full_layer103')
+    def struct_0x10916653(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer103'),
+            'signature' / Hex(Const(0x10916653, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_view_stats=4096,
+                                is_can_set_location=65536,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int32ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'pts' / Int32ul)
+
+    @constructor(0x9882e516, 'channel_full_layer101')
+    def struct_0x9882e516(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer101'),
+            'signature' / Hex(Const(0x9882e516, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_view_stats=4096,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_online_count, Int32ul),
+            'pts' / Int32ul)
+
+    @constructor(0x17f45fcf, 'channel_full_layer71')
+    def struct_0x17f45fcf(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer71'),
+            'signature' / Hex(Const(0x17f45fcf, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')))
+
+    @constructor(0x76af5481, 'channel_full_layer72')
+    def struct_0x76af5481(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer72'),
+            'signature' / Hex(Const(0x76af5481, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul))
+
+    @constructor(0x97bee562, 'channel_full_layer52')
+    def struct_0x97bee562(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer52'),
+            'signature' / Hex(Const(0x97bee562, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'unread_important_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul))
+
+    @constructor(0xc3d5512f, 'channel_full_layer67')
+    def struct_0xc3d5512f(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer67'),
+            'signature' / Hex(Const(0xc3d5512f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul))
+
+    @constructor(0x9e341ddf, 'channel_full_layer48')
+    def struct_0x9e341ddf(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer48'),
+            'signature' / Hex(Const(0x9e341ddf, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_migrated_from_chat_id=16),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'unread_important_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul))
+
+    @constructor(0x0dc8c181, 'chat_full_layer122')
+    def struct_0x0dc8c181(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer122'),
+            'signature' / Hex(Const(0x0dc8c181, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_scheduled=256,
+                                has_chat_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_call=4096),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()))
+
+    @constructor(0xf3474af6, 'chat_full_layer123')
+    def struct_0xf3474af6(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer123'),
+            'signature' / Hex(Const(0xf3474af6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_scheduled=256,
+                                has_chat_photo=4,
+                                has_exported_invite=8192,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_call=4096),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()))
+
+    @constructor(0x7a7de4f7, 'channel_full_layer123')
+    def struct_0x7a7de4f7(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer123'),
+            'signature' / Hex(Const(0x7a7de4f7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int32ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()))
+
+    @constructor(0xf06c4018, 'chat_full_layer124')
+    def struct_0xf06c4018(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer124'),
+            'signature' / Hex(Const(0xf06c4018, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_scheduled=256,
+                                has_chat_photo=4,
+                                has_exported_invite=8192,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_call=4096,
+                                has_ttl_period=16384),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0x2548c037, 'channel_full_layer124')
+    def struct_0x2548c037(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer124'),
+            'signature' / Hex(Const(0x2548c037, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int32ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')))
+
+    @constructor(0x8a1e2983, 'chat_full_layer131')
+    def struct_0x8a1e2983(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer131'),
+            'signature' / Hex(Const(0x8a1e2983, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_scheduled=256,
+                                has_chat_photo=4,
+                                has_exported_invite=8192,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_call=4096,
+                                has_ttl_period=16384,
+                                has_groupcall_default_join_as=32768),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')))
+
+    @constructor(0x548c3f93, 'channel_full_layer131')
+    def struct_0x548c3f93(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer131'),
+            'signature' / Hex(Const(0x548c3f93, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')))
+
+    @constructor(0x49a0a5d9, 'chat_full_layer132')
+    def struct_0x49a0a5d9(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer132'),
+            'signature' / Hex(Const(0x49a0a5d9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_scheduled=256,
+                                has_chat_photo=4,
+                                has_exported_invite=8192,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_call=4096,
+                                has_ttl_period=16384,
+                                has_groupcall_default_join_as=32768,
+                                has_theme_emoticon=65536),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString))
+
+    @constructor(0x2f532f3c, 'channel_full_layer132')
+    def struct_0x2f532f3c(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer132'),
+            'signature' / Hex(Const(0x2f532f3c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int32ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString))
+
+    @constructor(0x4dbdc099, 'chat_full_layer133')
+    def struct_0x4dbdc099(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer133'),
+            'signature' / Hex(Const(0x4dbdc099, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_scheduled=256,
+                                has_chat_photo=4,
+                                has_exported_invite=8192,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_call=4096,
+                                has_ttl_period=16384,
+                                has_groupcall_default_join_as=32768,
+                                has_theme_emoticon=65536),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString))
+
+    @constructor(0xe9b27a17, 'channel_full_layer133')
+    def struct_0xe9b27a17(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer133'),
+            'signature' / Hex(Const(0xe9b27a17, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                is_can_set_location=65536,
+                                has_scheduled=524288,
+                                is_can_view_stats=1048576,
+                                is_blocked=4194304,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_online_count=8192,
+                                has_exported_invite=8388608,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_folder_id=2048,
+                                has_linked_chat_id=16384,
+                                has_location=32768,
+                                has_slowmode_seconds=131072,
+                                has_slowmode_next_send_date=262144,
+                                has_stats_dc=4096,
+                                has_call=2097152,
+                                has_ttl_period=16777216,
+                                has_pending_suggestions=33554432,
+                                has_groupcall_default_join_as=67108864,
+                                has_theme_emoticon=134217728),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'online_count' / If(this.flags.has_online_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int64ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'linked_chat_id' / If(this.flags.has_linked_chat_id, Int64ul),
+            'location' / If(this.flags.has_location, self.channel_location_structures('location')),
+            'slowmode_seconds' / If(this.flags.has_slowmode_seconds, Int32ul),
+            'slowmode_next_send_date' / If(this.flags.has_slowmode_next_send_date, TTimestamp),
+            'stats_dc' / If(this.flags.has_stats_dc, Int32ul),
+            'pts' / Int32ul,
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'pending_suggestions' / If(this.flags.has_pending_suggestions, self.vector(TString, 'pending_suggestions')),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString))
+
+    @constructor(0x1b7c9db3, 'chat_full_layer121')
+    def struct_0x1b7c9db3(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer121'),
+            'signature' / Hex(Const(0x1b7c9db3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_scheduled=256,
+                                has_chat_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul))
+
+    @constructor(0x22a235da, 'chat_full_layer98')
+    def struct_0x22a235da(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer98'),
+            'signature' / Hex(Const(0x22a235da, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_chat_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul))
+
+    @constructor(0xedd2a791, 'chat_full_layer92')
+    def struct_0xedd2a791(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer92'),
+            'signature' / Hex(Const(0xedd2a791, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_chat_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64),
+            'id' / Int32ul,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul))
+
+    @constructor(0x46a6ffb4, 'chat_full_layer135')
+    def struct_0x46a6ffb4(self):
+        return Struct(
+            'sname' / Computed('chat_full_layer135'),
+            'signature' / Hex(Const(0x46a6ffb4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_set_username=128,
+                                has_scheduled=256,
+                                has_chat_photo=4,
+                                has_exported_invite=8192,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_call=4096,
+                                has_ttl_period=16384,
+                                has_groupcall_default_join_as=32768,
+                                has_theme_emoticon=65536,
+                                has_requests_pending=131072),
+            'id' / Int64ul,
+            'about' / TString,
+            'participants' / self.chat_participants_structures('participants'),
+            'chat_photo' / If(this.flags.has_chat_photo, self.photo_structures('chat_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / If(this.flags.has_exported_invite, self.exported_chat_invite_structures('exported_invite')),
+            'bot_info' / If(this.flags.has_bot_info, self.vector(self.bot_info_structures('bot_info'), 'bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'call' / If(this.flags.has_call, self.struct_0xd8aa840f()),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'groupcall_default_join_as' / If(this.flags.has_groupcall_default_join_as, self.peer_structures('groupcall_default_join_as')),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'requests_pending' / If(this.flags.has_requests_pending, Int32ul),
+            'recent_requesters' / If(this.flags.has_requests_pending, self.vector(Int64ul, 'recent_requesters')))
+
+    @constructor(0xfab31aa3, 'channel_full_old')
+    def struct_0xfab31aa3(self):
+        return Struct(
+            'sname' / Computed('channel_full_old'),
+            'signature' / Hex(Const(0xfab31aa3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'unread_important_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'))
+
+    @constructor(0x95cb5f57, 'channel_full_layer70')
+    def struct_0x95cb5f57(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer70'),
+            'signature' / Hex(Const(0x95cb5f57, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul))
+
+    @constructor(0xcbb62890, 'channel_full_layer89')
+    def struct_0xcbb62890(self):
+        return Struct(
+            'sname' / Computed('channel_full_layer89'),
+            'signature' / Hex(Const(0xcbb62890, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_view_participants=8,
+                                is_can_set_username=64,
+                                is_can_set_stickers=128,
+                                is_hidden_prehistory=1024,
+                                has_participants_count=1,
+                                has_admins_count=2,
+                                has_kicked_count=4,
+                                has_migrated_from_chat_id=16,
+                                has_pinned_msg_id=32,
+                                has_stickerset=256,
+                                has_available_min_id=512,
+                                has_call_msg_id=2048),
+            'id' / Int32ul,
+            'about' / TString,
+            'participants_count' / If(this.flags.has_participants_count, Int32ul),
+            'admins_count' / If(this.flags.has_admins_count, Int32ul),
+            'kicked_count' / If(this.flags.has_kicked_count, Int32ul),
+            'banned_count' / If(this.flags.has_kicked_count, Int32ul),
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'chat_photo' / self.photo_structures('chat_photo'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'exported_invite' / self.exported_chat_invite_structures('exported_invite'),
+            'bot_info' / self.vector(self.bot_info_structures('bot_info'), 'bot_info'),
+            'migrated_from_chat_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'migrated_from_max_id' / If(this.flags.has_migrated_from_chat_id, Int32ul),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'stickerset' / If(this.flags.has_stickerset, self.sticker_set_structures('stickerset')),
+            'available_min_id' / If(this.flags.has_available_min_id, Int32ul),
+            'call_msg_id' / If(this.flags.has_call_msg_id, Int32ul))
+
+    @structures
+    def chat_full_structures(self, name):
+        tag_map = {
+            0x2633421b: LazyBound(self.struct_0x2633421b),
+            0x52d6806b: LazyBound(self.struct_0x52d6806b),
+            0x9ff3b858: LazyBound(self.struct_0x9ff3b858),
+            0xbbab348d: LazyBound(self.struct_0xbbab348d),
+            0xc9d31138: LazyBound(self.struct_0xc9d31138),
+            0x44c054a7: LazyBound(self.struct_0x44c054a7),
+            0x680b773c: LazyBound(self.struct_0x680b773c),
+            0x723027bd: LazyBound(self.struct_0x723027bd),
+            0x0f2bcb6f: LazyBound(self.struct_0x0f2bcb6f),
+            0xf2355507: LazyBound(self.struct_0xf2355507),
+            0xd18ee226: LazyBound(self.struct_0xd18ee226),
+            0xea68a619: LazyBound(self.struct_0xea68a619),
+            0xe13c3d20: LazyBound(self.struct_0xe13c3d20),
+            0x56662e2e: LazyBound(self.struct_0x56662e2e),
+            0x59cff963: LazyBound(self.struct_0x59cff963),
+            0x1c87a71a: LazyBound(self.struct_0x1c87a71a),
+            0x03648977: LazyBound(self.struct_0x03648977),
+            0x2e02a614: LazyBound(self.struct_0x2e02a614),
+            0xef3a6acd: LazyBound(self.struct_0xef3a6acd),
+            0xf0e6672a: LazyBound(self.struct_0xf0e6672a),
+            0x2d895c74: LazyBound(self.struct_0x2d895c74),
+            0x10916653: LazyBound(self.struct_0x10916653),
+            0x9882e516: LazyBound(self.struct_0x9882e516),
+            0x17f45fcf: LazyBound(self.struct_0x17f45fcf),
+            0x76af5481: LazyBound(self.struct_0x76af5481),
+            0x97bee562: LazyBound(self.struct_0x97bee562),
+            0xc3d5512f: LazyBound(self.struct_0xc3d5512f),
+            0x9e341ddf: LazyBound(self.struct_0x9e341ddf),
+            0x0dc8c181: LazyBound(self.struct_0x0dc8c181),
+            0xf3474af6: LazyBound(self.struct_0xf3474af6),
+            0x7a7de4f7: LazyBound(self.struct_0x7a7de4f7),
+            0xf06c4018: LazyBound(self.struct_0xf06c4018),
+            0x2548c037: LazyBound(self.struct_0x2548c037),
+            0x8a1e2983: LazyBound(self.struct_0x8a1e2983),
+            0x548c3f93: LazyBound(self.struct_0x548c3f93),
+            0x49a0a5d9: LazyBound(self.struct_0x49a0a5d9),
+            0x2f532f3c: LazyBound(self.struct_0x2f532f3c),
+            0x4dbdc099: LazyBound(self.struct_0x4dbdc099),
+            0xe9b27a17: LazyBound(self.struct_0xe9b27a17),
+            0x1b7c9db3: LazyBound(self.struct_0x1b7c9db3),
+            0x22a235da: LazyBound(self.struct_0x22a235da),
+            0xedd2a791: LazyBound(self.struct_0xedd2a791),
+            0x46a6ffb4: LazyBound(self.struct_0x46a6ffb4),
+            0xfab31aa3: LazyBound(self.struct_0xfab31aa3),
+            0x95cb5f57: LazyBound(self.struct_0x95cb5f57),
+            0xcbb62890: LazyBound(self.struct_0xcbb62890)
+        }
+        return TLUnion(name, tag_map)
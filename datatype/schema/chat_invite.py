@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group chat_invite of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x5c9d3702, 'chat_invite')
+    def struct_0x5c9d3702(self):
+        return Struct(
+            'sname' / Computed('chat_invite'),
+            'signature' / Hex(Const(0x5c9d3702, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_channel=1,
+                                is_broadcast=2,
+                                is_public=4,
+                                is_megagroup=8,
+                                has_about=32,
+                                is_request_needed=64,
+                                is_verified=128,
+                                is_scam=256,
+                                is_fake=512,
+                                is_can_refulfill_subscription=2048,
+                                has_participants=16,
+                                has_subscription_pricing=1024,
+                                has_subscription_form_id=4096,
+                                has_bot_verification=8192),
+            'title' / TString,
+            'about' / If(this.flags.has_about, TString),
+            'photo' / self.photo_structures('photo'),
+            'participants_count' / Int32ul,
+            'participants' / If(this.flags.has_participants, self.vector(self.user_structures('participants'), 'participants')),
+            'color' / Int32ul,
+            'subscription_pricing' / If(this.flags.has_subscription_pricing, self.struct_0x05416d58()),
+            'subscription_form_id' / If(this.flags.has_subscription_form_id, Int64ul),
+            'bot_verification' / If(this.flags.has_bot_verification, self.struct_0xf93cd45c()))
+
+    @constructor(0xfe65389d, 'chat_invite_layer195')
+    def struct_0xfe65389d(self):
+        return Struct(
+            'sname' / Computed('chat_invite_layer195'),
+            'signature' / Hex(Const(0xfe65389d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_channel=1,
+                                is_broadcast=2,
+                                is_public=4,
+                                is_megagroup=8,
+                                has_about=32,
+                                is_request_needed=64,
+                                is_verified=128,
+                                is_scam=256,
+                                is_fake=512,
+                                is_can_refulfill_subscription=2048,
+                                has_participants=16,
+                                has_subscription_pricing=1024,
+                                has_subscription_form_id=4096),
+            'title' / TString,
+            'about' / If(this.flags.has_about, TString),
+            'photo' / self.photo_structures('photo'),
+            'participants_count' / Int32ul,
+            'participants' / If(this.flags.has_participants, self.vector(self.user_structures('participants'), 'participants')),
+            'color' / Int32ul,
+            'subscription_pricing' / If(this.flags.has_subscription_pricing, self.struct_0x05416d58()),
+            'subscription_form_id' / If(this.flags.has_subscription_form_id, Int64ul))
+
+    @constructor(0xcde0ec40, 'chat_invite_layer185')
+    def struct_0xcde0ec40(self):
+        return Struct(
+            'sname' / Computed('chat_invite_layer185'),
+            'signature' / Hex(Const(0xcde0ec40, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_channel=1,
+                                is_broadcast=2,
+                                is_public=4,
+                                is_megagroup=8,
+                                has_about=32,
+                                is_request_needed=64,
+                                is_verified=128,
+                                is_scam=256,
+                                is_fake=512,
+                                has_participants=16),
+            'title' / TString,
+            'about' / If(this.flags.has_about, TString),
+            'photo' / self.photo_structures('photo'),
+            'participants_count' / Int32ul,
+            'participants' / If(this.flags.has_participants, self.vector(self.user_structures('participants'), 'participants')),
+            'color' / Int32ul)
+
+    @constructor(0x300c44c1, 'chat_invite_layer165')
+    def struct_0x300c44c1(self):
+        return Struct(
+            'sname' / Computed('chat_invite_layer165'),
+            'signature' / Hex(Const(0x300c44c1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_channel=1,
+                                is_broadcast=2,
+                                is_public=4,
+                                is_megagroup=8,
+                                has_about=32,
+                                is_request_needed=64,
+                                is_verified=128,
+                                is_scam=256,
+                                is_fake=512,
+                                has_participants=16,
+                                has_color=1024),
+            'title' / TString,
+            'about' / If(this.flags.has_about, TString),
+            'photo' / self.photo_structures('photo'),
+            'participants_count' / Int32ul,
+            'participants' / If(this.flags.has_participants, self.vector(self.user_structures('participants'), 'participants')),
+            'color' / If(this.flags.has_color, Int32ul))
+
+    @constructor(0x61695cb0, 'chat_invite_peek')
+    def struct_0x61695cb0(self):
+        return (
+            'chat' / self.chat_structures('chat'),
+            'expires' / Int32ul)
+
+    @constructor(0x5a686d7c, 'chat_invite_already')
+    def struct_0x5a686d7c(self):
+        return ['chat' / self.chat_structures('chat')]
+
+    @structures
+    def chat_invite_structures(self, name):
+        tag_map = {
+            0x5c9d3702: LazyBound(self.struct_0x5c9d3702),
+            0xfe65389d: LazyBound(self.struct_0xfe65389d),
+            0xcde0ec40: LazyBound(self.struct_0xcde0ec40),
+            0x300c44c1: LazyBound(self.struct_0x300c44c1),
+            0x61695cb0: LazyBound(self.struct_0x61695cb0),
+            0x5a686d7c: LazyBound(self.struct_0x5a686d7c)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group chat_participant of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xe2d6e436, 'chat_participant_admin_layer131')
+    def struct_0xe2d6e436(self):
+        return (
+            'user_id' / Int32ul,
+            'inviter_id' / Int32ul,
+            'date' / TTimestamp)
+
+    @constructor(0xa0933f5b, 'chat_participant_admin')
+    def struct_0xa0933f5b(self):
+        return (
+            'user_id' / Int64ul,
+            'inviter_id' / Int64ul,
+            'date' / TTimestamp)
+
+    @constructor(0xc8d7493e, 'chat_participant_layer131')
+    def struct_0xc8d7493e(self):
+        return (
+            'user_id' / Int32ul,
+            'inviter_id' / Int32ul,
+            'date' / TTimestamp)
+
+    @constructor(0xda13538a, 'chat_participant_creator_layer131')
+    def struct_0xda13538a(self):
+        return ['user_id' / Int32ul]
+
+    @constructor(0xc02d4007, 'chat_participant')
+    def struct_0xc02d4007(self):
+        return (
+            'user_id' / Int64ul,
+            'inviter_id' / Int64ul,
+            'date' / TTimestamp)
+
+    @constructor(0xe46bcee4, 'chat_participant_creator')
+    def struct_0xe46bcee4(self):
+        return ['user_id' / Int64ul]
+
+    @structures
+    def chat_participant_structures(self, name):
+        tag_map = {
+            0xe2d6e436: LazyBound(self.struct_0xe2d6e436),
+            0xa0933f5b: LazyBound(self.struct_0xa0933f5b),
+            0xc8d7493e: LazyBound(self.struct_0xc8d7493e),
+            0xda13538a: LazyBound(self.struct_0xda13538a),
+            0xc02d4007: LazyBound(self.struct_0xc02d4007),
+            0xe46bcee4: LazyBound(self.struct_0xe46bcee4)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group chat_participants of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xfc900c2b, 'chat_participants_forbidden_layer131')
+    def struct_0xfc900c2b(self):
+        return Struct(
+            'sname' / Computed('chat_participants_forbidden_layer131'),
+            'signature' / Hex(Const(0xfc900c2b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_self_participant=1),
+            'chat_id' / Int32ul,
+            'self_participant' / If(this.flags.has_self_participant, self.chat_participant_structures('self_participant')))
+
+    @constructor(0x3f460fed, 'chat_participants_layer131')
+    def struct_0x3f460fed(self):
+        return (
+            'chat_id' / Int32ul,
+            'participants' / self.vector(self.chat_participant_structures('participants'), 'participants'),
+            'version' / Int32ul)
+
+    @constructor(0x8763d3e1, 'chat_participants_forbidden')
+    def struct_0x8763d3e1(self):
+        return Struct(
+            'sname' / Computed('chat_participants_forbidden'),
+            'signature' / Hex(Const(0x8763d3e1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_self_participant=1),
+            'chat_id' / Int64ul,
+            'self_participant' / If(this.flags.has_self_participant, self.chat_participant_structures('self_participant')))
+
+    @constructor(0x3cbc93f8, 'chat_participants')
+    def struct_0x3cbc93f8(self):
+        return (
+            'chat_id' / Int64ul,
+            'participants' / self.vector(self.chat_participant_structures('participants'), 'participants'),
+            'version' / Int32ul)
+
+    @constructor(0x7841b415, 'chat_participants_old')
+    def struct_0x7841b415(self):
+        return (
+            'chat_id' / Int32ul,
+            'admin_id' / Int32ul,
+            'participants' / self.vector(self.chat_participant_structures('participants'), 'participants'),
+            'version' / Int32ul)
+
+    @constructor(0x0fd2bb8a, 'chat_participants_forbidden_old')
+    def struct_0x0fd2bb8a(self):
+        return ['chat_id' / Int32ul]
+
+    @structures
+    def chat_participants_structures(self, name):
+        tag_map = {
+            0xfc900c2b: LazyBound(self.struct_0xfc900c2b),
+            0x3f460fed: LazyBound(self.struct_0x3f460fed),
+            0x8763d3e1: LazyBound(self.struct_0x8763d3e1),
+            0x3cbc93f8: LazyBound(self.struct_0x3cbc93f8),
+            0x7841b415: LazyBound(self.struct_0x7841b415),
+            0x0fd2bb8a: LazyBound(self.struct_0x0fd2bb8a)
+        }
+        return TLUnion(name, tag_map)
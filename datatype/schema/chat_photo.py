@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group chat_photo of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x1c6e1c11, 'chat_photo')
+    def struct_0x1c6e1c11(self):
+        return Struct(
+            'sname' / Computed('chat_photo'),
+            'signature' / Hex(Const(0x1c6e1c11, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_video=1,
+                                has_stripped_thumb=2),
+            'photo_id' / Int64ul,
+            'stripped_thumb' / If(this.flags.has_stripped_thumb, TBytes),
+            'dc_id' / Int32ul)
+
+    @constructor(0x475cdbd5, 'chat_photo_layer115')
+    def struct_0x475cdbd5(self):
+        return (
+            'photo_small' / self.file_location_structures('photo_small'),
+            'photo_big' / self.file_location_structures('photo_big'),
+            'dc_id' / Int32ul)
+
+    @constructor(0x37c1011c, 'chat_photo_empty')
+    def struct_0x37c1011c(self):
+        return []
+
+    @constructor(0x6153276a, 'chat_photo_layer97')
+    def struct_0x6153276a(self):
+        return (
+            'photo_small' / self.file_location_structures('photo_small'),
+            'photo_big' / self.file_location_structures('photo_big'))
+
+    @constructor(0xd20b9f3c, 'chat_photo_layer126')
+    def struct_0xd20b9f3c(self):
+        return Struct(
+            'sname' / Computed('chat_photo_layer126'),
+            'signature' / Hex(Const(0xd20b9f3c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_video=1),
+            'photo_small' / self.file_location_structures('photo_small'),
+            'photo_big' / self.file_location_structures('photo_big'),
+            'dc_id' / Int32ul)
+
+    @constructor(0x4790ee05, 'chat_photo_layer127')
+    def struct_0x4790ee05(self):
+        return Struct(
+            'sname' / Computed('chat_photo_layer127'),
+            'signature' / Hex(Const(0x4790ee05, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_video=1,
+                                has_stripped_thumb=2),
+            'photo_small' / self.file_location_structures('photo_small'),
+            'photo_big' / self.file_location_structures('photo_big'),
+            'stripped_thumb' / If(this.flags.has_stripped_thumb, TBytes),
+            'dc_id' / Int32ul)
+
+    @structures
+    def chat_photo_structures(self, name):
+        tag_map = {
+            0x1c6e1c11: LazyBound(self.struct_0x1c6e1c11),
+            0x475cdbd5: LazyBound(self.struct_0x475cdbd5),
+            0x37c1011c: LazyBound(self.struct_0x37c1011c),
+            0x6153276a: LazyBound(self.struct_0x6153276a),
+            0xd20b9f3c: LazyBound(self.struct_0xd20b9f3c),
+            0x4790ee05: LazyBound(self.struct_0x4790ee05)
+        }
+        return TLUnion(name, tag_map)
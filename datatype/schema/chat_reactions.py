@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group chat_reactions of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x661d4037, 'chat_reactions_some')
+    def struct_0x661d4037(self):
+        return ['reactions' / self.vector(self.reaction_structures('reactions'), 'reactions')]
+
+    @constructor(0xeafc32bc, 'chat_reactions_none')
+    def struct_0xeafc32bc(self):
+        return []
+
+    @constructor(0x52928bca, 'chat_reactions_all')
+    def struct_0x52928bca(self):
+        return Struct(
+            'sname' / Computed('chat_reactions_all'),
+            'signature' / Hex(Const(0x52928bca, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_allow_custom=1))
+
+    @structures
+    def chat_reactions_structures(self, name):
+        tag_map = {
+            0x661d4037: LazyBound(self.struct_0x661d4037),
+            0xeafc32bc: LazyBound(self.struct_0xeafc32bc),
+            0x52928bca: LazyBound(self.struct_0x52928bca)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group chatlist_chatlist_invite of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xfa87f659, 'chatlists_chatlist_invite_already')
+    def struct_0xfa87f659(self):
+        return (
+            'filter_id' / Int32ul,
+            'missing_peers' / self.vector(self.peer_structures('missing_peers'), 'missing_peers'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x1dcd839d, 'chatlists_chatlist_invite')
+    def struct_0x1dcd839d(self):
+        return Struct(
+            'sname' / Computed('chatlists_chatlist_invite'),
+            'signature' / Hex(Const(0x1dcd839d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_emoticon=1),
+            'title' / TString,
+            'emoticon' / If(this.flags.has_emoticon, TString),
+            'peers' / self.vector(self.peer_structures('peers'), 'peers'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def chatlist_chatlist_invite_structures(self, name):
+        tag_map = {
+            0xfa87f659: LazyBound(self.struct_0xfa87f659),
+            0x1dcd839d: LazyBound(self.struct_0x1dcd839d)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group chatlists of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0c5181ac, 'exported_chatlist_invite')
+    def struct_0x0c5181ac(self):
+        return Struct(
+            'sname' / Computed('exported_chatlist_invite'),
+            'signature' / Hex(Const(0x0c5181ac, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoked=1),
+            'title' / TString,
+            'url' / TString,
+            'peers' / self.vector(self.peer_structures('peers'), 'peers'))
+
+    @constructor(0x10ab6dc7, 'chatlists_exported_invites')
+    def struct_0x10ab6dc7(self):
+        return (
+            'invites' / self.vector(self.struct_0x0c5181ac(), 'invites'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x10e6e3a6, 'chatlists_exported_chatlist_invite')
+    def struct_0x10e6e3a6(self):
+        return (
+            'filter' / self.dialog_filter_structures('filter'),
+            'invite' / self.struct_0x0c5181ac())
+
+    @constructor(0x41c10fff, 'chatlists_check_chatlist_invite')
+    def struct_0x41c10fff(self):
+        return ['slug' / TString]
+
+    @constructor(0x653db63d, 'chatlists_edit_exported_invite')
+    def struct_0x653db63d(self):
+        return Struct(
+            'sname' / Computed('chatlists_edit_exported_invite'),
+            'signature' / Hex(Const(0x653db63d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoked=1,
+                                has_title=2,
+                                has_peers=4),
+            'chatlist' / self.struct_0xf3e0da33(),
+            'slug' / TString,
+            'title' / If(this.flags.has_title, TString),
+            'peers' / If(this.flags.has_peers, self.vector(self.input_peer_structures('peers'), 'peers')))
+
+    @constructor(0x66e486fb, 'chatlists_hide_chatlist_updates')
+    def struct_0x66e486fb(self):
+        return ['chatlist' / self.struct_0xf3e0da33()]
+
+    @constructor(0x719c5c5e, 'chatlists_delete_exported_invite')
+    def struct_0x719c5c5e(self):
+        return (
+            'chatlist' / self.struct_0xf3e0da33(),
+            'slug' / TString)
+
+    @constructor(0x74fae13a, 'chatlists_leave_chatlist')
+    def struct_0x74fae13a(self):
+        return (
+            'chatlist' / self.struct_0xf3e0da33(),
+            'peers' / self.vector(self.input_peer_structures('peers'), 'peers'))
+
+    @constructor(0x8472478e, 'chatlists_export_chatlist_invite')
+    def struct_0x8472478e(self):
+        return (
+            'chatlist' / self.struct_0xf3e0da33(),
+            'title' / TString,
+            'peers' / self.vector(self.input_peer_structures('peers'), 'peers'))
+
+    @constructor(0x89419521, 'chatlists_get_chatlist_updates')
+    def struct_0x89419521(self):
+        return ['chatlist' / self.struct_0xf3e0da33()]
+
+    @constructor(0x93bd878d, 'chatlists_chatlist_updates')
+    def struct_0x93bd878d(self):
+        return (
+            'missing_peers' / self.vector(self.peer_structures('missing_peers'), 'missing_peers'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xa6b1e39a, 'chatlists_join_chatlist_invite')
+    def struct_0xa6b1e39a(self):
+        return (
+            'slug' / TString,
+            'peers' / self.vector(self.input_peer_structures('peers'), 'peers'))
+
+    @constructor(0xce03da83, 'chatlists_get_exported_invites')
+    def struct_0xce03da83(self):
+        return ['chatlist' / self.struct_0xf3e0da33()]
+
+    @constructor(0xe089f8f5, 'chatlists_join_chatlist_updates')
+    def struct_0xe089f8f5(self):
+        return (
+            'chatlist' / self.struct_0xf3e0da33(),
+            'peers' / self.vector(self.input_peer_structures('peers'), 'peers'))
+
+    @constructor(0xf3e0da33, 'input_chatlist_dialog_filter')
+    def struct_0xf3e0da33(self):
+        return ['filter_id' / Int32ul]
+
+    @constructor(0xfdbcd714, 'chatlists_get_leave_chatlist_suggestions')
+    def struct_0xfdbcd714(self):
+        return ['chatlist' / self.struct_0xf3e0da33()]
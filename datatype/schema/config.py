@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group config of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xcc1a241e, 'config')
+    def struct_0xcc1a241e(self):
+        return Struct(
+            'sname' / Computed('config'),
+            'signature' / Hex(Const(0xcc1a241e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_default_p2p_contacts=8,
+                                is_preload_featured_stickers=16,
+                                is_revoke_pm_inbox=64,
+                                is_blocked_mode=256,
+                                is_force_try_ipv6=16384,
+                                has_tmp_sessions=1,
+                                has_autoupdate_url_prefix=128,
+                                has_gif_search_username=512,
+                                has_venue_search_username=1024,
+                                has_img_search_username=2048,
+                                has_static_maps_provider=4096,
+                                has_suggested_lang_code=4,
+                                has_reactions_default=32768,
+                                has_autologin_token=65536),
+            'date' / TTimestamp,
+            'expires' / Int32ul,
+            'test_mode' / TBool,
+            'this_dc' / Int32ul,
+            'dc_options' / self.vector(self.struct_0x18b7a10d(), 'dc_options'),
+            'dc_txt_domain_name' / TString,
+            'chat_size_max' / Int32ul,
+            'megagroup_size_max' / Int32ul,
+            'forwarded_count_max' / Int32ul,
+            'online_update_period_ms' / Int32ul,
+            'offline_blur_timeout_ms' / Int32ul,
+            'offline_idle_timeout_ms' / Int32ul,
+            'online_cloud_timeout_ms' / Int32ul,
+            'notify_cloud_delay_ms' / Int32ul,
+            'notify_default_delay_ms' / Int32ul,
+            'push_chat_period_ms' / Int32ul,
+            'push_chat_limit' / Int32ul,
+            'edit_time_limit' / Int32ul,
+            'revoke_time_limit' / Int32ul,
+            'revoke_pm_time_limit' / Int32ul,
+            'rating_e_decay' / Int32ul,
+            'stickers_recent_limit' / Int32ul,
+            'channels_read_media_period' / Int32ul,
+            'tmp_sessions' / If(this.flags.has_tmp_sessions, Int32ul),
+            'call_receive_timeout_ms' / Int32ul,
+            'call_ring_timeout_ms' / Int32ul,
+            'call_connect_timeout_ms' / Int32ul,
+            'call_packet_timeout_ms' / Int32ul,
+            'me_url_prefix' / TString,
+            'autoupdate_url_prefix' / If(this.flags.has_autoupdate_url_prefix, TString),
+            'gif_search_username' / If(this.flags.has_gif_search_username, TString),
+            'venue_search_username' / If(this.flags.has_venue_search_username, TString),
+            'img_search_username' / If(this.flags.has_img_search_username, TString),
+            'static_maps_provider' / If(this.flags.has_static_maps_provider, TString),
+            'caption_length_max' / Int32ul,
+            'message_length_max' / Int32ul,
+            'webfile_dc_id' / Int32ul,
+            'suggested_lang_code' / If(this.flags.has_suggested_lang_code, TString),
+            'lang_pack_version' / If(this.flags.has_suggested_lang_code, Int32ul),
+            'base_lang_pack_version' / If(this.flags.has_suggested_lang_code, Int32ul),
+            'reactions_default' / If(this.flags.has_reactions_default, self.reaction_structures('reactions_default')),
+            'autologin_token' / If(this.flags.has_autologin_token, TString))
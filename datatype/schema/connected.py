@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group connected of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xe7e999e7, 'connected_bot')
+    def struct_0xe7e999e7(self):
+        return Struct(
+            'sname' / Computed('connected_bot'),
+            'signature' / Hex(Const(0xe7e999e7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_reply=1),
+            'bot_id' / Int64ul,
+            'recipients' / self.struct_0x21108ff7())
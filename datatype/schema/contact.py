@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group contact of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x16d9703b, 'contact_status')
+    def struct_0x16d9703b(self):
+        return (
+            'user_id' / Int64ul,
+            'status' / self.user_status_structures('status'))
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group contact_link_layer101 of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xfeedd3ad, 'contact_link_none')
+    def struct_0xfeedd3ad(self):
+        return []
+
+    @constructor(0xd502c2d0, 'contact_link_contact')
+    def struct_0xd502c2d0(self):
+        return []
+
+    @constructor(0x5f4f9247, 'contact_link_unknown')
+    def struct_0x5f4f9247(self):
+        return []
+
+    @structures
+    def contact_link_layer101_structures(self, name):
+        tag_map = {
+            0xfeedd3ad: LazyBound(self.struct_0xfeedd3ad),
+            0xd502c2d0: LazyBound(self.struct_0xd502c2d0),
+            0x5f4f9247: LazyBound(self.struct_0x5f4f9247)
+        }
+        return TLUnion(name, tag_map)
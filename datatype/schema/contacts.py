@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group contacts of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x096a0e00, 'contacts_delete_contacts')
+    def struct_0x096a0e00(self):
+        return ['id' / self.vector(self.input_user_structures('id'), 'id')]
+
+    @constructor(0x1013fd9e, 'contacts_delete_by_phones')
+    def struct_0x1013fd9e(self):
+        return ['phones' / self.vector(TString, 'phones')]
+
+    @constructor(0x11f812d8, 'contacts_search')
+    def struct_0x11f812d8(self):
+        return (
+            'q' / TString,
+            'limit' / Int32ul)
+
+    @constructor(0x13005788, 'contacts_import_contact_token')
+    def struct_0x13005788(self):
+        return ['token' / TString]
+
+    @constructor(0x1ae373ac, 'contacts_reset_top_peer_rating')
+    def struct_0x1ae373ac(self):
+        return (
+            'category' / self.top_peer_category_structures('category'),
+            'peer' / self.input_peer_structures('peer'))
+
+    @constructor(0x29a8962c, 'contacts_block_from_replies')
+    def struct_0x29a8962c(self):
+        return Struct(
+            'sname' / Computed('contacts_block_from_replies'),
+            'signature' / Hex(Const(0x29a8962c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_delete_message=1,
+                                is_delete_history=2,
+                                is_report_spam=4),
+            'msg_id' / Int32ul)
+
+    @constructor(0x2c800be5, 'contacts_import_contacts')
+    def struct_0x2c800be5(self):
+        return ['contacts' / self.vector(self.struct_0xf392b7f4(), 'contacts')]
+
+    @constructor(0x2e2e8734, 'contacts_block')
+    def struct_0x2e2e8734(self):
+        return Struct(
+            'sname' / Computed('contacts_block'),
+            'signature' / Hex(Const(0x2e2e8734, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_my_stories_from=1),
+            'id' / self.input_peer_structures('id'))
+
+    @constructor(0x4fe196fe, 'contacts_import_card')
+    def struct_0x4fe196fe(self):
+        return ['export_card' / self.vector(Int32ul, 'export_card')]
+
+    @constructor(0x5ce14175, 'popular_contact')
+    def struct_0x5ce14175(self):
+        return (
+            'client_id' / Int64ul,
+            'importers' / Int32ul)
+
+    @constructor(0x5dd69e12, 'contacts_get_contacts')
+    def struct_0x5dd69e12(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x725afbbc, 'contacts_resolve_username')
+    def struct_0x725afbbc(self):
+        return Struct(
+            'sname' / Computed('contacts_resolve_username'),
+            'signature' / Hex(Const(0x725afbbc, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_referer=1),
+            'username' / TString,
+            'referer' / If(this.flags.has_referer, TString))
+
+    @constructor(0x77d01c3b, 'contacts_imported_contacts')
+    def struct_0x77d01c3b(self):
+        return (
+            'imported' / self.vector(self.struct_0xc13e3c50(), 'imported'),
+            'popular_invites' / self.vector(self.struct_0x5ce14175(), 'popular_invites'),
+            'retry_contacts' / self.vector(Int64ul, 'retry_contacts'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x7f077ad9, 'contacts_resolved_peer')
+    def struct_0x7f077ad9(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x84e53737, 'contacts_export_card')
+    def struct_0x84e53737(self):
+        return []
+
+    @constructor(0x8514bdda, 'contacts_toggle_top_peers')
+    def struct_0x8514bdda(self):
+        return ['enabled' / TBool]
+
+    @constructor(0x879537f1, 'contacts_reset_saved')
+    def struct_0x879537f1(self):
+        return []
+
+    @constructor(0x8af94344, 'contacts_resolve_phone')
+    def struct_0x8af94344(self):
+        return ['phone' / TString]
+
+    @constructor(0x94c65c76, 'contacts_set_blocked')
+    def struct_0x94c65c76(self):
+        return Struct(
+            'sname' / Computed('contacts_set_blocked'),
+            'signature' / Hex(Const(0x94c65c76, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_my_stories_from=1),
+            'id' / self.vector(self.input_peer_structures('id'), 'id'),
+            'limit' / Int32ul)
+
+    @constructor(0x973478b6, 'contacts_get_top_peers')
+    def struct_0x973478b6(self):
+        return Struct(
+            'sname' / Computed('contacts_get_top_peers'),
+            'signature' / Hex(Const(0x973478b6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_correspondents=1,
+                                is_bots_pm=2,
+                                is_bots_inline=4,
+                                is_phone_calls=8,
+                                is_forward_users=16,
+                                is_forward_chats=32,
+                                is_groups=1024,
+                                is_channels=32768,
+                                is_bots_app=65536),
+            'offset' / Int32ul,
+            'limit' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0x9a868f80, 'contacts_get_blocked')
+    def struct_0x9a868f80(self):
+        return Struct(
+            'sname' / Computed('contacts_get_blocked'),
+            'signature' / Hex(Const(0x9a868f80, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_my_stories_from=1),
+            'offset' / Int32ul,
+            'limit' / Int32ul)
+
+    @constructor(0xb3134d9d, 'contacts_found')
+    def struct_0xb3134d9d(self):
+        return (
+            'my_results' / self.vector(self.peer_structures('my_results'), 'my_results'),
+            'results' / self.vector(self.peer_structures('results'), 'results'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xb550d328, 'contacts_unblock')
+    def struct_0xb550d328(self):
+        return Struct(
+            'sname' / Computed('contacts_unblock'),
+            'signature' / Hex(Const(0xb550d328, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_my_stories_from=1),
+            'id' / self.input_peer_structures('id'))
+
+    @constructor(0xc13e3c50, 'imported_contact')
+    def struct_0xc13e3c50(self):
+        return (
+            'user_id' / Int64ul,
+            'client_id' / Int64ul)
+
+    @constructor(0xc4a353ee, 'contacts_get_statuses')
+    def struct_0xc4a353ee(self):
+        return []
+
+    @constructor(0xd348bc44, 'contacts_get_located')
+    def struct_0xd348bc44(self):
+        return Struct(
+            'sname' / Computed('contacts_get_located'),
+            'signature' / Hex(Const(0xd348bc44, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_background=2,
+                                has_self_expires=1),
+            'geo_point' / self.input_geo_point_structures('geo_point'),
+            'self_expires' / If(this.flags.has_self_expires, Int32ul))
+
+    @constructor(0xe8f463d0, 'contacts_add_contact')
+    def struct_0xe8f463d0(self):
+        return Struct(
+            'sname' / Computed('contacts_add_contact'),
+            'signature' / Hex(Const(0xe8f463d0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_add_phone_privacy_exception=1),
+            'id' / self.input_user_structures('id'),
+            'first_name' / TString,
+            'last_name' / TString,
+            'phone' / TString)
+
+    @constructor(0xf392b7f4, 'input_phone_contact')
+    def struct_0xf392b7f4(self):
+        return (
+            'client_id' / Int64ul,
+            'phone' / TString,
+            'first_name' / TString,
+            'last_name' / TString)
+
+    @constructor(0xf831a20f, 'contacts_accept_contact')
+    def struct_0xf831a20f(self):
+        return ['id' / self.input_user_structures('id')]
+
+    @constructor(0xf8654027, 'contacts_export_contact_token')
+    def struct_0xf8654027(self):
+        return []
+
+    @constructor(0xf93ccba3, 'contacts_resolve_username')
+    def struct_0xf93ccba3(self):
+        return ['username' / TString]
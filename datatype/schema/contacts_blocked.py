@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group contacts_blocked of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0ade1591, 'contacts_blocked')
+    def struct_0x0ade1591(self):
+        return (
+            'blocked' / self.vector(self.struct_0xe8fd8014(), 'blocked'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xe1664194, 'contacts_blocked_slice')
+    def struct_0xe1664194(self):
+        return (
+            'count' / Int32ul,
+            'blocked' / self.vector(self.struct_0xe8fd8014(), 'blocked'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def contacts_blocked_structures(self, name):
+        tag_map = {
+            0x0ade1591: LazyBound(self.struct_0x0ade1591),
+            0xe1664194: LazyBound(self.struct_0xe1664194)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xe8fd8014, 'peer_blocked')
+    def struct_0xe8fd8014(self):
+        return (
+            'peer_id' / self.peer_structures('peer_id'),
+            'date' / TTimestamp)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group contacts_contacts of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xb74ba9d2, 'contacts_contacts_not_modified')
+    def struct_0xb74ba9d2(self):
+        return []
+
+    @constructor(0xeae87e42, 'contacts_contacts')
+    def struct_0xeae87e42(self):
+        return (
+            'contacts' / self.vector(self.struct_0x145ade0b(), 'contacts'),
+            'saved_count' / Int32ul,
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def contacts_contacts_structures(self, name):
+        tag_map = {
+            0xb74ba9d2: LazyBound(self.struct_0xb74ba9d2),
+            0xeae87e42: LazyBound(self.struct_0xeae87e42)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x145ade0b, 'contact')
+    def struct_0x145ade0b(self):
+        return (
+            'user_id' / Int64ul,
+            'mutual' / TBool)
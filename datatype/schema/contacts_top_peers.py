@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group contacts_top_peers of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x70b772a8, 'contacts_top_peers')
+    def struct_0x70b772a8(self):
+        return (
+            'categories' / self.vector(self.struct_0xfb834291(), 'categories'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xb52c939d, 'contacts_top_peers_disabled')
+    def struct_0xb52c939d(self):
+        return []
+
+    @constructor(0xde266ef5, 'contacts_top_peers_not_modified')
+    def struct_0xde266ef5(self):
+        return []
+
+    @structures
+    def contacts_top_peers_structures(self, name):
+        tag_map = {
+            0x70b772a8: LazyBound(self.struct_0x70b772a8),
+            0xb52c939d: LazyBound(self.struct_0xb52c939d),
+            0xde266ef5: LazyBound(self.struct_0xde266ef5)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xedcdc05b, 'top_peer')
+    def struct_0xedcdc05b(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'rating' / Double)
+
+    @constructor(0xfb834291, 'top_peer_category_peers')
+    def struct_0xfb834291(self):
+        return (
+            'category' / self.top_peer_category_structures('category'),
+            'count' / Int32ul,
+            'peers' / self.vector(self.struct_0xedcdc05b(), 'peers'))
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group decrypted of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x1be31789, 'decrypted_message_layer')
+    def struct_0x1be31789(self):
+        return (
+            'random_bytes' / TBytes,
+            'layer' / Int32ul,
+            'in_seq_no' / Int32ul,
+            'out_seq_no' / Int32ul,
+            'message' / self.decrypted_message_structures('message'))
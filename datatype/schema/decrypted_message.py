@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group decrypted_message of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x204d3878, 'decrypted_message_layer17')
+    def struct_0x204d3878(self):
+        return (
+            'random_id' / Int64ul,
+            'ttl' / Int32ul,
+            'message' / TString,
+            'media' / self.decrypted_message_media_structures('media'))
+
+    @constructor(0x73164160, 'decrypted_message_service')
+    def struct_0x73164160(self):
+        return (
+            'random_id' / Int64ul,
+            'action' / self.decrypted_message_action_structures('action'))
+
+    @constructor(0xaa48327d, 'decrypted_message_service_layer8')
+    def struct_0xaa48327d(self):
+        return (
+            'random_id' / Int64ul,
+            'random_bytes' / TBytes,
+            'action' / self.decrypted_message_action_structures('action'))
+
+    @constructor(0x1f814f1f, 'decrypted_message_layer8')
+    def struct_0x1f814f1f(self):
+        return (
+            'random_id' / Int64ul,
+            'random_bytes' / TBytes,
+            'message' / TString,
+            'media' / self.decrypted_message_media_structures('media'))
+
+    @constructor(0x91cc4674, 'decrypted_message')
+    def struct_0x91cc4674(self):
+        return Struct(
+            'sname' / Computed('decrypted_message'),
+            'signature' / Hex(Const(0x91cc4674, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                has_media=512,
+                                has_entities=128,
+                                has_via_bot_name=2048,
+                                has_reply_to_random_id=8,
+                                has_grouped_id=131072),
+            'random_id' / Int64ul,
+            'ttl' / Int32ul,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.decrypted_message_media_structures('media')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'via_bot_name' / If(this.flags.has_via_bot_name, TString),
+            'reply_to_random_id' / If(this.flags.has_reply_to_random_id, Int64ul),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul))
+
+    @constructor(0x36b091de, 'decrypted_message_layer45')
+    def struct_0x36b091de(self):
+        return Struct(
+            'sname' / Computed('decrypted_message_layer45'),
+            'signature' / Hex(Const(0x36b091de, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_media=512,
+                                has_entities=128,
+                                has_via_bot_name=2048,
+                                has_reply_to_random_id=8),
+            'random_id' / Int64ul,
+            'ttl' / Int32ul,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.decrypted_message_media_structures('media')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'via_bot_name' / If(this.flags.has_via_bot_name, TString),
+            'reply_to_random_id' / If(this.flags.has_reply_to_random_id, Int64ul))
+
+    @structures
+    def decrypted_message_structures(self, name):
+        tag_map = {
+            0x204d3878: LazyBound(self.struct_0x204d3878),
+            0x73164160: LazyBound(self.struct_0x73164160),
+            0xaa48327d: LazyBound(self.struct_0xaa48327d),
+            0x1f814f1f: LazyBound(self.struct_0x1f814f1f),
+            0x91cc4674: LazyBound(self.struct_0x91cc4674),
+            0x36b091de: LazyBound(self.struct_0x36b091de)
+        }
+        return TLUnion(name, tag_map)
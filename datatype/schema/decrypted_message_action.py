@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group decrypted_message_action of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa1733aec, 'decrypted_message_action_set_message_ttl')
+    def struct_0xa1733aec(self):
+        return ['ttl_seconds' / Int32ul]
+
+    @constructor(0xf3048883, 'decrypted_message_action_notify_layer')
+    def struct_0xf3048883(self):
+        return ['layer' / Int32ul]
+
+    @constructor(0x65614304, 'decrypted_message_action_delete_messages')
+    def struct_0x65614304(self):
+        return ['random_ids' / self.vector(Int64ul, 'random_ids')]
+
+    @constructor(0xec2e0b9b, 'decrypted_message_action_commit_key')
+    def struct_0xec2e0b9b(self):
+        return (
+            'exchange_id' / Int64ul,
+            'key_fingerprint' / Int64ul)
+
+    @constructor(0xdd05ec6b, 'decrypted_message_action_abort_key')
+    def struct_0xdd05ec6b(self):
+        return ['exchange_id' / Int64ul]
+
+    @constructor(0x6719e45c, 'decrypted_message_action_flush_history')
+    def struct_0x6719e45c(self):
+        return []
+
+    @constructor(0xccb27641, 'decrypted_message_action_typing')
+    def struct_0xccb27641(self):
+        return ['action' / self.send_message_action_structures('action')]
+
+    @constructor(0x6fe1735b, 'decrypted_message_action_accept_key')
+    def struct_0x6fe1735b(self):
+        return (
+            'exchange_id' / Int64ul,
+            'g_b' / TBytes,
+            'key_fingerprint' / Int64ul)
+
+    @constructor(0x0c4f40be, 'decrypted_message_action_read_messages')
+    def struct_0x0c4f40be(self):
+        return ['random_ids' / self.vector(Int64ul, 'random_ids')]
+
+    @constructor(0x511110b0, 'decrypted_message_action_resend')
+    def struct_0x511110b0(self):
+        return (
+            'start_seq_no' / Int32ul,
+            'end_seq_no' / Int32ul)
+
+    @constructor(0xf3c9611b, 'decrypted_message_action_request_key')
+    def struct_0xf3c9611b(self):
+        return (
+            'exchange_id' / Int64ul,
+            'g_a' / TBytes)
+
+    @constructor(0x8ac1f475, 'decrypted_message_action_screenshot_messages')
+    def struct_0x8ac1f475(self):
+        return ['random_ids' / self.vector(Int64ul, 'random_ids')]
+
+    @constructor(0xa82fdd63, 'decrypted_message_action_noop')
+    def struct_0xa82fdd63(self):
+        return []
+
+    @structures
+    def decrypted_message_action_structures(self, name):
+        tag_map = {
+            0xa1733aec: LazyBound(self.struct_0xa1733aec),
+            0xf3048883: LazyBound(self.struct_0xf3048883),
+            0x65614304: LazyBound(self.struct_0x65614304),
+            0xec2e0b9b: LazyBound(self.struct_0xec2e0b9b),
+            0xdd05ec6b: LazyBound(self.struct_0xdd05ec6b),
+            0x6719e45c: LazyBound(self.struct_0x6719e45c),
+            0xccb27641: LazyBound(self.struct_0xccb27641),
+            0x6fe1735b: LazyBound(self.struct_0x6fe1735b),
+            0x0c4f40be: LazyBound(self.struct_0x0c4f40be),
+            0x511110b0: LazyBound(self.struct_0x511110b0),
+            0xf3c9611b: LazyBound(self.struct_0xf3c9611b),
+            0x8ac1f475: LazyBound(self.struct_0x8ac1f475),
+            0xa82fdd63: LazyBound(self.struct_0xa82fdd63)
+        }
+        return TLUnion(name, tag_map)
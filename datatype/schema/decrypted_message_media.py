@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group decrypted_message_media of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x57e0a9cb, 'decrypted_message_media_audio')
+    def struct_0x57e0a9cb(self):
+        return (
+            'duration' / Int32ul,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes)
+
+    @constructor(0x35480a59, 'decrypted_message_media_geo_point')
+    def struct_0x35480a59(self):
+        return (
+            'lat' / Double,
+            'long' / Double)
+
+    @constructor(0x588a0a97, 'decrypted_message_media_contact')
+    def struct_0x588a0a97(self):
+        return (
+            'phone_number' / TString,
+            'first_name' / TString,
+            'last_name' / TString,
+            'user_id' / Int32ul)
+
+    @constructor(0x089f5c4a, 'decrypted_message_media_empty')
+    def struct_0x089f5c4a(self):
+        return []
+
+    @constructor(0x6abd9782, 'decrypted_message_media_document')
+    def struct_0x6abd9782(self):
+        return (
+            'thumb' / TBytes,
+            'thumb_w' / Int32ul,
+            'thumb_h' / Int32ul,
+            'mime_type' / TString,
+            'size' / Int64ul,
+            'key' / TBytes,
+            'iv' / TBytes,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'),
+            'caption' / TString)
+
+    @constructor(0x7afe8ae2, 'decrypted_message_media_document_layer101')
+    def struct_0x7afe8ae2(self):
+        return (
+            'thumb' / TBytes,
+            'thumb_w' / Int32ul,
+            'thumb_h' / Int32ul,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'),
+            'caption' / TString)
+
+    @constructor(0xe50511d8, 'decrypted_message_media_web_page')
+    def struct_0xe50511d8(self):
+        return ['url' / TString]
+
+    @constructor(0xf1fa8d78, 'decrypted_message_media_photo')
+    def struct_0xf1fa8d78(self):
+        return (
+            'thumb' / TBytes,
+            'thumb_w' / Int32ul,
+            'thumb_h' / Int32ul,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'size' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes,
+            'caption' / TString)
+
+    @constructor(0x970c8c0e, 'decrypted_message_media_video')
+    def struct_0x970c8c0e(self):
+        return (
+            'thumb' / TBytes,
+            'thumb_w' / Int32ul,
+            'thumb_h' / Int32ul,
+            'duration' / Int32ul,
+            'mime_type' / TString,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'size' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes,
+            'caption' / TString)
+
+    @constructor(0xb095434b, 'decrypted_message_media_document_layer8')
+    def struct_0xb095434b(self):
+        return (
+            'thumb' / TBytes,
+            'thumb_w' / Int32ul,
+            'thumb_h' / Int32ul,
+            'file_name' / TString,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes)
+
+    @constructor(0x4cee6ef3, 'decrypted_message_media_video_layer8')
+    def struct_0x4cee6ef3(self):
+        return (
+            'thumb' / TBytes,
+            'thumb_w' / Int32ul,
+            'thumb_h' / Int32ul,
+            'duration' / Int32ul,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'size' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes)
+
+    @constructor(0x8a0df56f, 'decrypted_message_media_venue')
+    def struct_0x8a0df56f(self):
+        return (
+            'lat' / Double,
+            'long' / Double,
+            'title' / TString,
+            'address' / TString,
+            'provider' / TString,
+            'venue_id' / TString)
+
+    @constructor(0xfa95b0dd, 'decrypted_message_media_external_document')
+    def struct_0xfa95b0dd(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'))
+
+    @constructor(0x524a415d, 'decrypted_message_media_video_layer17')
+    def struct_0x524a415d(self):
+        return (
+            'thumb' / TBytes,
+            'thumb_w' / Int32ul,
+            'thumb_h' / Int32ul,
+            'duration' / Int32ul,
+            'mime_type' / TString,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'size' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes)
+
+    @constructor(0x6080758f, 'decrypted_message_media_audio_layer8')
+    def struct_0x6080758f(self):
+        return (
+            'duration' / Int32ul,
+            'size' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes)
+
+    @constructor(0x32798a8c, 'decrypted_message_media_photo_layer8')
+    def struct_0x32798a8c(self):
+        return (
+            'thumb' / TBytes,
+            'thumb_w' / Int32ul,
+            'thumb_h' / Int32ul,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'size' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes)
+
+    @structures
+    def decrypted_message_media_structures(self, name):
+        tag_map = {
+            0x57e0a9cb: LazyBound(self.struct_0x57e0a9cb),
+            0x35480a59: LazyBound(self.struct_0x35480a59),
+            0x588a0a97: LazyBound(self.struct_0x588a0a97),
+            0x089f5c4a: LazyBound(self.struct_0x089f5c4a),
+            0x6abd9782: LazyBound(self.struct_0x6abd9782),
+            0x7afe8ae2: LazyBound(self.struct_0x7afe8ae2),
+            0xe50511d8: LazyBound(self.struct_0xe50511d8),
+            0xf1fa8d78: LazyBound(self.struct_0xf1fa8d78),
+            0x970c8c0e: LazyBound(self.struct_0x970c8c0e),
+            0xb095434b: LazyBound(self.struct_0xb095434b),
+            0x4cee6ef3: LazyBound(self.struct_0x4cee6ef3),
+            0x8a0df56f: LazyBound(self.struct_0x8a0df56f),
+            0xfa95b0dd: LazyBound(self.struct_0xfa95b0dd),
+            0x524a415d: LazyBound(self.struct_0x524a415d),
+            0x6080758f: LazyBound(self.struct_0x6080758f),
+            0x32798a8c: LazyBound(self.struct_0x32798a8c)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group dialog of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd58a08c6, 'dialog')
+    def struct_0xd58a08c6(self):
+        return Struct(
+            'sname' / Computed('dialog'),
+            'signature' / Hex(Const(0xd58a08c6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=4,
+                                is_unread_mark=8,
+                                is_view_forum_as_messages=64,
+                                has_pts=1,
+                                has_draft=2,
+                                has_folder_id=16,
+                                has_ttl_period=32),
+            'peer' / self.peer_structures('peer'),
+            'top_message' / Int32ul,
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'unread_mentions_count' / Int32ul,
+            'unread_reactions_count' / Int32ul,
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'pts' / If(this.flags.has_pts, Int32ul),
+            'draft' / If(this.flags.has_draft, self.draft_message_structures('draft')),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0xa8edd0f5, 'dialog_layer149')
+    def struct_0xa8edd0f5(self):
+        return Struct(
+            'sname' / Computed('dialog_layer149'),
+            'signature' / Hex(Const(0xa8edd0f5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=4,
+                                is_unread_mark=8,
+                                has_pts=1,
+                                has_draft=2,
+                                has_folder_id=16,
+                                has_ttl_period=32),
+            'peer' / self.peer_structures('peer'),
+            'top_message' / Int32ul,
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'unread_mentions_count' / Int32ul,
+            'unread_reactions_count' / Int32ul,
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'pts' / If(this.flags.has_pts, Int32ul),
+            'draft' / If(this.flags.has_draft, self.draft_message_structures('draft')),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0x71bd134c, 'dialog_folder')
+    def struct_0x71bd134c(self):
+        return Struct(
+            'sname' / Computed('dialog_folder'),
+            'signature' / Hex(Const(0x71bd134c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=4),
+            'folder' / self.struct_0xff544e65(),
+            'peer' / self.peer_structures('peer'),
+            'top_message' / Int32ul,
+            'unread_muted_peers_count' / Int32ul,
+            'unread_unmuted_peers_count' / Int32ul,
+            'unread_muted_messages_count' / Int32ul,
+            'unread_unmuted_messages_count' / Int32ul)
+
+    @structures
+    def dialog_structures(self, name):
+        tag_map = {
+            0xd58a08c6: LazyBound(self.struct_0xd58a08c6),
+            0xa8edd0f5: LazyBound(self.struct_0xa8edd0f5),
+            0x71bd134c: LazyBound(self.struct_0x71bd134c)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x77744d4a, 'dialog_filter_suggested')
+    def struct_0x77744d4a(self):
+        return (
+            'filter' / self.dialog_filter_structures('filter'),
+            'description' / TString)
+
+    @constructor(0xff544e65, 'folder')
+    def struct_0xff544e65(self):
+        return Struct(
+            'sname' / Computed('folder'),
+            'signature' / Hex(Const(0xff544e65, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_autofill_new_broadcasts=1,
+                                is_autofill_public_groups=2,
+                                is_autofill_new_correspondents=4,
+                                has_photo=8),
+            'id' / Int32ul,
+            'title' / TString,
+            'photo' / If(this.flags.has_photo, self.chat_photo_structures('photo')))
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group dialog_filter of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x363293ae, 'dialog_filter_default')
+    def struct_0x363293ae(self):
+        return []
+
+    @constructor(0xaa472651, 'dialog_filter')
+    def struct_0xaa472651(self):
+        return Struct(
+            'sname' / Computed('dialog_filter'),
+            'signature' / Hex(Const(0xaa472651, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_contacts=1,
+                                is_non_contacts=2,
+                                is_groups=4,
+                                is_broadcasts=8,
+                                is_bots=16,
+                                is_exclude_muted=2048,
+                                is_exclude_read=4096,
+                                is_exclude_archived=8192,
+                                is_title_noanimate=268435456,
+                                has_emoticon=33554432,
+                                has_color=134217728),
+            'id' / Int32ul,
+            'title' / self.struct_0x751f3146(),
+            'emoticon' / If(this.flags.has_emoticon, TString),
+            'color' / If(this.flags.has_color, Int32ul),
+            'pinned_peers' / self.vector(self.input_peer_structures('pinned_peers'), 'pinned_peers'),
+            'include_peers' / self.vector(self.input_peer_structures('include_peers'), 'include_peers'),
+            'exclude_peers' / self.vector(self.input_peer_structures('exclude_peers'), 'exclude_peers'))
+
+    @constructor(0x5fb5523b, 'dialog_filter_layer195')
+    def struct_0x5fb5523b(self):
+        return Struct(
+            'sname' / Computed('dialog_filter_layer195'),
+            'signature' / Hex(Const(0x5fb5523b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_contacts=1,
+                                is_non_contacts=2,
+                                is_groups=4,
+                                is_broadcasts=8,
+                                is_bots=16,
+                                is_exclude_muted=2048,
+                                is_exclude_read=4096,
+                                is_exclude_archived=8192,
+                                has_emoticon=33554432,
+                                has_color=134217728),
+            'id' / Int32ul,
+            'title_text' / TString,
+            'emoticon' / If(this.flags.has_emoticon, TString),
+            'color' / If(this.flags.has_color, Int32ul),
+            'pinned_peers' / self.vector(self.input_peer_structures('pinned_peers'), 'pinned_peers'),
+            'include_peers' / self.vector(self.input_peer_structures('include_peers'), 'include_peers'),
+            'exclude_peers' / self.vector(self.input_peer_structures('exclude_peers'), 'exclude_peers'))
+
+    @constructor(0x7438f7e8, 'dialog_filter_layer175')
+    def struct_0x7438f7e8(self):
+        return Struct(
+            'sname' / Computed('dialog_filter_layer175'),
+            'signature' / Hex(Const(0x7438f7e8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_contacts=1,
+                                is_non_contacts=2,
+                                is_groups=4,
+                                is_broadcasts=8,
+                                is_bots=16,
+                                is_exclude_muted=2048,
+                                is_exclude_read=4096,
+                                is_exclude_archived=8192,
+                                has_emoticon=33554432),
+            'id' / Int32ul,
+            'title_text' / TString,
+            'emoticon' / If(this.flags.has_emoticon, TString),
+            'pinned_peers' / self.vector(self.input_peer_structures('pinned_peers'), 'pinned_peers'),
+            'include_peers' / self.vector(self.input_peer_structures('include_peers'), 'include_peers'),
+            'exclude_peers' / self.vector(self.input_peer_structures('exclude_peers'), 'exclude_peers'))
+
+    @constructor(0x96537bd7, 'dialog_filter_chatlist')
+    def struct_0x96537bd7(self):
+        return Struct(
+            'sname' / Computed('dialog_filter_chatlist'),
+            'signature' / Hex(Const(0x96537bd7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_my_invites=67108864,
+                                has_emoticon=33554432,
+                                has_color=134217728),
+            'id' / Int32ul,
+            'title' / self.struct_0x751f3146(),
+            'emoticon' / If(this.flags.has_emoticon, TString),
+            'color' / If(this.flags.has_color, Int32ul),
+            'pinned_peers' / self.vector(self.input_peer_structures('pinned_peers'), 'pinned_peers'),
+            'include_peers' / self.vector(self.input_peer_structures('include_peers'), 'include_peers'))
+
+    @constructor(0x9fe28ea4, 'dialog_filter_chatlist_layer195')
+    def struct_0x9fe28ea4(self):
+        return Struct(
+            'sname' / Computed('dialog_filter_chatlist_layer195'),
+            'signature' / Hex(Const(0x9fe28ea4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_my_invites=67108864,
+                                has_emoticon=33554432,
+                                has_color=134217728),
+            'id' / Int32ul,
+            'title_text' / TString,
+            'emoticon' / If(this.flags.has_emoticon, TString),
+            'color' / If(this.flags.has_color, Int32ul),
+            'pinned_peers' / self.vector(self.input_peer_structures('pinned_peers'), 'pinned_peers'),
+            'include_peers' / self.vector(self.input_peer_structures('include_peers'), 'include_peers'))
+
+    @constructor(0xd64a04a8, 'dialog_filter_chatlist_layer175')
+    def struct_0xd64a04a8(self):
+        return Struct(
+            'sname' / Computed('dialog_filter_chatlist_layer175'),
+            'signature' / Hex(Const(0xd64a04a8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_my_invites=67108864,
+                                has_emoticon=33554432),
+            'id' / Int32ul,
+            'title_text' / TString,
+            'emoticon' / If(this.flags.has_emoticon, TString),
+            'pinned_peers' / self.vector(self.input_peer_structures('pinned_peers'), 'pinned_peers'),
+            'include_peers' / self.vector(self.input_peer_structures('include_peers'), 'include_peers'))
+
+    @structures
+    def dialog_filter_structures(self, name):
+        tag_map = {
+            0x363293ae: LazyBound(self.struct_0x363293ae),
+            0xaa472651: LazyBound(self.struct_0xaa472651),
+            0x5fb5523b: LazyBound(self.struct_0x5fb5523b),
+            0x7438f7e8: LazyBound(self.struct_0x7438f7e8),
+            0x96537bd7: LazyBound(self.struct_0x96537bd7),
+            0x9fe28ea4: LazyBound(self.struct_0x9fe28ea4),
+            0xd64a04a8: LazyBound(self.struct_0xd64a04a8)
+        }
+        return TLUnion(name, tag_map)
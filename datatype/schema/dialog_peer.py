@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group dialog_peer of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xe56dbf05, 'dialog_peer')
+    def struct_0xe56dbf05(self):
+        return ['peer' / self.peer_structures('peer')]
+
+    @constructor(0x514519e2, 'dialog_peer_folder')
+    def struct_0x514519e2(self):
+        return ['folder_id' / Int32ul]
+
+    @structures
+    def dialog_peer_structures(self, name):
+        tag_map = {
+            0xe56dbf05: LazyBound(self.struct_0xe56dbf05),
+            0x514519e2: LazyBound(self.struct_0x514519e2)
+        }
+        return TLUnion(name, tag_map)
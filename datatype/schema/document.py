@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group document of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x9ba29cc1, 'document_layer113')
+    def struct_0x9ba29cc1(self):
+        return Struct(
+            'sname' / Computed('document_layer113'),
+            'signature' / Hex(Const(0x9ba29cc1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_thumbs=1),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'file_reference' / TBytes,
+            'date' / TTimestamp,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'thumbs' / If(this.flags.has_thumbs, self.vector(self.photo_size_structures('thumbs'), 'thumbs')),
+            'dc_id' / Int32ul,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'))
+
+    @constructor(0x59534e4c, 'document_layer92')
+    def struct_0x59534e4c(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'file_reference' / TBytes,
+            'date' / TTimestamp,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'))
+
+    @constructor(0x87232bc7, 'document_layer82')
+    def struct_0x87232bc7(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul,
+            '_reserve' / Int32ul,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'))
+
+    @constructor(0x55555556, 'document_encrypted_old')
+    def struct_0x55555556(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'user_id' / Int32ul,
+            'date' / TTimestamp,
+            'file_name' / TString,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes)
+
+    @constructor(0x8fd4c4d8, 'document')
+    def struct_0x8fd4c4d8(self):
+        return Struct(
+            'sname' / Computed('document'),
+            'signature' / Hex(Const(0x8fd4c4d8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_thumbs=1,
+                                has_video_thumbs=2),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'file_reference' / TBytes,
+            'date' / TTimestamp,
+            'mime_type' / TString,
+            'size' / Int64ul,
+            'thumbs' / If(this.flags.has_thumbs, self.vector(self.photo_size_structures('thumbs'), 'thumbs')),
+            'video_thumbs' / If(this.flags.has_video_thumbs, self.vector(self.video_size_structures('video_thumbs'), 'video_thumbs')),
+            'dc_id' / Int32ul,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'))
+
+    @constructor(0x1e87342b, 'document_layer142')
+    def struct_0x1e87342b(self):
+        return Struct(
+            'sname' / Computed('document_layer142'),
+            'signature' / Hex(Const(0x1e87342b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_thumbs=1,
+                                has_video_thumbs=2),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'file_reference' / TBytes,
+            'date' / TTimestamp,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'thumbs' / If(this.flags.has_thumbs, self.vector(self.photo_size_structures('thumbs'), 'thumbs')),
+            'video_thumbs' / If(this.flags.has_video_thumbs, self.vector(self.video_size_structures('video_thumbs'), 'video_thumbs')),
+            'dc_id' / Int32ul,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'))
+
+    @constructor(0x9efc6326, 'document_old')
+    def struct_0x9efc6326(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'user_id' / Int32ul,
+            'date' / TTimestamp,
+            'file_name' / TString,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul)
+
+    @constructor(0x36f8c871, 'document_empty')
+    def struct_0x36f8c871(self):
+        return ['id' / Int64ul]
+
+    @constructor(0x55555558, 'document_encrypted')
+    def struct_0x55555558(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'),
+            'key' / TBytes,
+            'iv' / TBytes)
+
+    @constructor(0xf9a39f4f, 'document_layer53')
+    def struct_0xf9a39f4f(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'))
+
+    @structures
+    def document_structures(self, name):
+        tag_map = {
+            0x9ba29cc1: LazyBound(self.struct_0x9ba29cc1),
+            0x59534e4c: LazyBound(self.struct_0x59534e4c),
+            0x87232bc7: LazyBound(self.struct_0x87232bc7),
+            0x55555556: LazyBound(self.struct_0x55555556),
+            0x8fd4c4d8: LazyBound(self.struct_0x8fd4c4d8),
+            0x1e87342b: LazyBound(self.struct_0x1e87342b),
+            0x9efc6326: LazyBound(self.struct_0x9efc6326),
+            0x36f8c871: LazyBound(self.struct_0x36f8c871),
+            0x55555558: LazyBound(self.struct_0x55555558),
+            0xf9a39f4f: LazyBound(self.struct_0xf9a39f4f)
+        }
+        return TLUnion(name, tag_map)
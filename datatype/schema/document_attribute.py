@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group document_attribute of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x3a556302, 'document_attribute_sticker_layer55')
+    def struct_0x3a556302(self):
+        return (
+            'alt' / TString,
+            'stickerset' / self.input_sticker_set_structures('stickerset'))
+
+    @constructor(0x0ef02ce6, 'document_attribute_video_layer159')
+    def struct_0x0ef02ce6(self):
+        return Struct(
+            'sname' / Computed('document_attribute_video_layer159'),
+            'signature' / Hex(Const(0x0ef02ce6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_round_message=1,
+                                is_supports_streaming=2),
+            'duration' / Int32ul,
+            'w' / Int32ul,
+            'h' / Int32ul)
+
+    @constructor(0x051448e5, 'document_attribute_audio_old')
+    def struct_0x051448e5(self):
+        return ['duration' / Int32ul]
+
+    @constructor(0x6319d612, 'document_attribute_sticker')
+    def struct_0x6319d612(self):
+        return Struct(
+            'sname' / Computed('document_attribute_sticker'),
+            'signature' / Hex(Const(0x6319d612, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_mask=2,
+                                has_mask_coords=1),
+            'alt' / TString,
+            'stickerset' / self.input_sticker_set_structures('stickerset'),
+            'mask_coords' / If(this.flags.has_mask_coords, self.struct_0xaed6dbb2()))
+
+    @constructor(0x11b58939, 'document_attribute_animated')
+    def struct_0x11b58939(self):
+        return []
+
+    @constructor(0x15590068, 'document_attribute_filename')
+    def struct_0x15590068(self):
+        return ['file_name' / TString]
+
+    @constructor(0x43c57c48, 'document_attribute_video')
+    def struct_0x43c57c48(self):
+        return Struct(
+            'sname' / Computed('document_attribute_video'),
+            'signature' / Hex(Const(0x43c57c48, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_round_message=1,
+                                is_supports_streaming=2,
+                                is_nosound=8,
+                                has_preload_prefix_size=4,
+                                has_video_start_ts=16,
+                                has_video_codec=32),
+            'duration' / Double,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'preload_prefix_size' / If(this.flags.has_preload_prefix_size, Int32ul),
+            'video_start_ts' / If(this.flags.has_video_start_ts, Double),
+            'video_codec' / If(this.flags.has_video_codec, TString))
+
+    @constructor(0x17399fad, 'document_attribute_video_layer187')
+    def struct_0x17399fad(self):
+        return Struct(
+            'sname' / Computed('document_attribute_video_layer187'),
+            'signature' / Hex(Const(0x17399fad, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_round_message=1,
+                                is_supports_streaming=2,
+                                is_nosound=8,
+                                has_preload_prefix_size=4,
+                                has_video_start_ts=16),
+            'duration' / Double,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'preload_prefix_size' / If(this.flags.has_preload_prefix_size, Int32ul),
+            'video_start_ts' / If(this.flags.has_video_start_ts, Double))
+
+    @constructor(0xd38ff1c2, 'document_attribute_video_layer184')
+    def struct_0xd38ff1c2(self):
+        return Struct(
+            'sname' / Computed('document_attribute_video_layer184'),
+            'signature' / Hex(Const(0xd38ff1c2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_round_message=1,
+                                is_supports_streaming=2,
+                                is_nosound=8,
+                                has_preload_prefix_size=4),
+            'duration' / Double,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'preload_prefix_size' / If(this.flags.has_preload_prefix_size, Int32ul))
+
+    @constructor(0x5910cccb, 'document_attribute_video_layer65')
+    def struct_0x5910cccb(self):
+        return (
+            'duration' / Int32ul,
+            'w' / Int32ul,
+            'h' / Int32ul)
+
+    @constructor(0xded218e0, 'document_attribute_audio_layer45')
+    def struct_0xded218e0(self):
+        return (
+            'duration' / Int32ul,
+            'title' / TString,
+            'performer' / TString)
+
+    @constructor(0xfb0a5727, 'document_attribute_sticker_old')
+    def struct_0xfb0a5727(self):
+        return []
+
+    @constructor(0x9801d2f7, 'document_attribute_has_stickers')
+    def struct_0x9801d2f7(self):
+        return []
+
+    @constructor(0x994c9882, 'document_attribute_sticker_old2')
+    def struct_0x994c9882(self):
+        return ['alt' / TString]
+
+    @constructor(0x6c37c15c, 'document_attribute_image_size')
+    def struct_0x6c37c15c(self):
+        return (
+            'w' / Int32ul,
+            'h' / Int32ul)
+
+    @constructor(0x9852f9c6, 'document_attribute_audio')
+    def struct_0x9852f9c6(self):
+        return Struct(
+            'sname' / Computed('document_attribute_audio'),
+            'signature' / Hex(Const(0x9852f9c6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_voice=1024,
+                                has_title=1,
+                                has_performer=2,
+                                has_waveform=4),
+            'duration' / Int32ul,
+            'title' / If(this.flags.has_title, TString),
+            'performer' / If(this.flags.has_performer, TString),
+            'waveform' / If(this.flags.has_waveform, TBytes))
+
+    @constructor(0xfd149899, 'document_attribute_custom_emoji')
+    def struct_0xfd149899(self):
+        return Struct(
+            'sname' / Computed('document_attribute_custom_emoji'),
+            'signature' / Hex(Const(0xfd149899, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_free=1,
+                                is_text_color=2),
+            'alt' / TString,
+            'stickerset' / self.input_sticker_set_structures('stickerset'))
+
+    @structures
+    def document_attribute_structures(self, name):
+        tag_map = {
+            0x3a556302: LazyBound(self.struct_0x3a556302),
+            0x0ef02ce6: LazyBound(self.struct_0x0ef02ce6),
+            0x051448e5: LazyBound(self.struct_0x051448e5),
+            0x6319d612: LazyBound(self.struct_0x6319d612),
+            0x11b58939: LazyBound(self.struct_0x11b58939),
+            0x15590068: LazyBound(self.struct_0x15590068),
+            0x43c57c48: LazyBound(self.struct_0x43c57c48),
+            0x17399fad: LazyBound(self.struct_0x17399fad),
+            0xd38ff1c2: LazyBound(self.struct_0xd38ff1c2),
+            0x5910cccb: LazyBound(self.struct_0x5910cccb),
+            0xded218e0: LazyBound(self.struct_0xded218e0),
+            0xfb0a5727: LazyBound(self.struct_0xfb0a5727),
+            0x9801d2f7: LazyBound(self.struct_0x9801d2f7),
+            0x994c9882: LazyBound(self.struct_0x994c9882),
+            0x6c37c15c: LazyBound(self.struct_0x6c37c15c),
+            0x9852f9c6: LazyBound(self.struct_0x9852f9c6),
+            0xfd149899: LazyBound(self.struct_0xfd149899)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xaed6dbb2, 'mask_coords')
+    def struct_0xaed6dbb2(self):
+        return (
+            'n' / Int32ul,
+            'x' / Double,
+            'y' / Double,
+            'zoom' / Double)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group draft_message of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x1b0c841a, 'draft_message_empty')
+    def struct_0x1b0c841a(self):
+        return Struct(
+            'sname' / Computed('draft_message_empty'),
+            'signature' / Hex(Const(0x1b0c841a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_date=1),
+            'date' / If(this.flags.has_date, TTimestamp))
+
+    @constructor(0xba4baec5, 'draft_message_empty_layer81')
+    def struct_0xba4baec5(self):
+        return []
+
+    @constructor(0xfd8e711f, 'draft_message_layer165')
+    def struct_0xfd8e711f(self):
+        return Struct(
+            'sname' / Computed('draft_message_layer165'),
+            'signature' / Hex(Const(0xfd8e711f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_no_webpage=2,
+                                has_reply_to=1,
+                                has_entities=8),
+            'reply_to' / If(this.flags.has_reply_to, Int32ul),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'date' / TTimestamp)
+
+    @constructor(0x3fccf7ef, 'draft_message_layer181')
+    def struct_0x3fccf7ef(self):
+        return Struct(
+            'sname' / Computed('draft_message_layer181'),
+            'signature' / Hex(Const(0x3fccf7ef, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_no_webpage=2,
+                                is_invert_media=64,
+                                has_reply_to=16,
+                                has_entities=8,
+                                has_media=32),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'media' / If(this.flags.has_media, self.input_media_structures('media')),
+            'date' / TTimestamp)
+
+    @constructor(0x2d65321f, 'draft_message')
+    def struct_0x2d65321f(self):
+        return Struct(
+            'sname' / Computed('draft_message'),
+            'signature' / Hex(Const(0x2d65321f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_no_webpage=2,
+                                is_invert_media=64,
+                                has_reply_to=16,
+                                has_entities=8,
+                                has_media=32,
+                                has_effect=128),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'media' / If(this.flags.has_media, self.input_media_structures('media')),
+            'date' / TTimestamp,
+            'effect' / If(this.flags.has_effect, Int64ul))
+
+    @structures
+    def draft_message_structures(self, name):
+        tag_map = {
+            0x1b0c841a: LazyBound(self.struct_0x1b0c841a),
+            0xba4baec5: LazyBound(self.struct_0xba4baec5),
+            0xfd8e711f: LazyBound(self.struct_0xfd8e711f),
+            0x3fccf7ef: LazyBound(self.struct_0x3fccf7ef),
+            0x2d65321f: LazyBound(self.struct_0x2d65321f)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group edit of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0589ee75, 'edit_fact_check')
+    def struct_0x0589ee75(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'text' / self.struct_0x751f3146())
+
+    @constructor(0x751f3146, 'text_with_entities')
+    def struct_0x751f3146(self):
+        return (
+            'text' / TString,
+            'entities' / self.vector(self.message_entity_structures('entities'), 'entities'))
+
+    @constructor(0xba6705f0, 'edit_close_friends')
+    def struct_0xba6705f0(self):
+        return ['id' / self.vector(Int64ul, 'id')]
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group email_verification of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x922e55a9, 'email_verification_code')
+    def struct_0x922e55a9(self):
+        return ['code' / TString]
+
+    @constructor(0xdb909ec2, 'email_verification_google')
+    def struct_0xdb909ec2(self):
+        return ['token' / TString]
+
+    @constructor(0x96d074fd, 'email_verification_apple')
+    def struct_0x96d074fd(self):
+        return ['token' / TString]
+
+    @structures
+    def email_verification_structures(self, name):
+        tag_map = {
+            0x922e55a9: LazyBound(self.struct_0x922e55a9),
+            0xdb909ec2: LazyBound(self.struct_0xdb909ec2),
+            0x96d074fd: LazyBound(self.struct_0x96d074fd)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group email_verify_purpose of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x4345be73, 'email_verify_purpose_login_setup')
+    def struct_0x4345be73(self):
+        return (
+            'phone_number' / TString,
+            'phone_code_hash' / TString)
+
+    @constructor(0x527d22eb, 'email_verify_purpose_login_change')
+    def struct_0x527d22eb(self):
+        return []
+
+    @constructor(0xbbf51685, 'email_verify_purpose_passport')
+    def struct_0xbbf51685(self):
+        return []
+
+    @structures
+    def email_verify_purpose_structures(self, name):
+        tag_map = {
+            0x4345be73: LazyBound(self.struct_0x4345be73),
+            0x527d22eb: LazyBound(self.struct_0x527d22eb),
+            0xbbf51685: LazyBound(self.struct_0xbbf51685)
+        }
+        return TLUnion(name, tag_map)
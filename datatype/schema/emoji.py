@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group emoji of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x5cc761bd, 'emoji_keywords_difference')
+    def struct_0x5cc761bd(self):
+        return (
+            'lang_code' / TString,
+            'from_version' / Int32ul,
+            'version' / Int32ul,
+            'keywords' / self.vector(self.emoji_keyword_structures('keywords'), 'keywords'))
+
+    @constructor(0xa575739d, 'emoji_url')
+    def struct_0xa575739d(self):
+        return ['url' / TString]
+
+    @constructor(0xb3fb5361, 'emoji_language')
+    def struct_0xb3fb5361(self):
+        return ['lang_code' / TString]
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group emoji_group of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x7a9abda9, 'emoji_group')
+    def struct_0x7a9abda9(self):
+        return (
+            'title' / TString,
+            'icon_emoji_id' / Int64ul,
+            'emoticons' / self.vector(TString, 'emoticons'))
+
+    @constructor(0x80d26cc7, 'emoji_group_greeting')
+    def struct_0x80d26cc7(self):
+        return (
+            'title' / TString,
+            'icon_emoji_id' / Int64ul,
+            'emoticons' / self.vector(TString, 'emoticons'))
+
+    @constructor(0x093bcf34, 'emoji_group_premium')
+    def struct_0x093bcf34(self):
+        return (
+            'title' / TString,
+            'icon_emoji_id' / Int64ul)
+
+    @structures
+    def emoji_group_structures(self, name):
+        tag_map = {
+            0x7a9abda9: LazyBound(self.struct_0x7a9abda9),
+            0x80d26cc7: LazyBound(self.struct_0x80d26cc7),
+            0x093bcf34: LazyBound(self.struct_0x093bcf34)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group emoji_keyword of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x236df622, 'emoji_keyword_deleted')
+    def struct_0x236df622(self):
+        return (
+            'keyword' / TString,
+            'emoticons' / self.vector(TString, 'emoticons'))
+
+    @constructor(0xd5b3b9f9, 'emoji_keyword')
+    def struct_0xd5b3b9f9(self):
+        return (
+            'keyword' / TString,
+            'emoticons' / self.vector(TString, 'emoticons'))
+
+    @structures
+    def emoji_keyword_structures(self, name):
+        tag_map = {
+            0x236df622: LazyBound(self.struct_0x236df622),
+            0xd5b3b9f9: LazyBound(self.struct_0xd5b3b9f9)
+        }
+        return TLUnion(name, tag_map)
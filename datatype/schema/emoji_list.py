@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group emoji_list of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x7a1e11d1, 'emoji_list')
+    def struct_0x7a1e11d1(self):
+        return (
+            'hash' / Int64ul,
+            'document_id' / self.vector(Int64ul, 'document_id'))
+
+    @constructor(0x481eadfa, 'emoji_list_not_modified')
+    def struct_0x481eadfa(self):
+        return []
+
+    @structures
+    def emoji_list_structures(self, name):
+        tag_map = {
+            0x7a1e11d1: LazyBound(self.struct_0x7a1e11d1),
+            0x481eadfa: LazyBound(self.struct_0x481eadfa)
+        }
+        return TLUnion(name, tag_map)
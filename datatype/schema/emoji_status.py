@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group emoji_status of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x2de11aae, 'emoji_status_empty')
+    def struct_0x2de11aae(self):
+        return []
+
+    @constructor(0xe7ff068a, 'emoji_status')
+    def struct_0xe7ff068a(self):
+        return Struct(
+            'sname' / Computed('emoji_status'),
+            'signature' / Hex(Const(0xe7ff068a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_until=1),
+            'document_id' / Int64ul,
+            'until' / If(this.flags.has_until, Int32ul))
+
+    @constructor(0x7184603b, 'emoji_status_collectible')
+    def struct_0x7184603b(self):
+        return Struct(
+            'sname' / Computed('emoji_status_collectible'),
+            'signature' / Hex(Const(0x7184603b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_until=1),
+            'collectible_id' / Int64ul,
+            'document_id' / Int64ul,
+            'title' / TString,
+            'slug' / TString,
+            'pattern_document_id' / Int64ul,
+            'center_color' / Int32ul,
+            'edge_color' / Int32ul,
+            'pattern_color' / Int32ul,
+            'text_color' / Int32ul,
+            'until' / If(this.flags.has_until, Int32ul))
+
+    @constructor(0x07141dbf, 'input_emoji_status_collectible')
+    def struct_0x07141dbf(self):
+        return Struct(
+            'sname' / Computed('input_emoji_status_collectible'),
+            'signature' / Hex(Const(0x07141dbf, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_until=1),
+            'collectible_id' / Int64ul,
+            'until' / If(this.flags.has_until, Int32ul))
+
+    @constructor(0x929b619d, 'emoji_status_layer197')
+    def struct_0x929b619d(self):
+        return ['document_id' / Int64ul]
+
+    @constructor(0xfa30a8c7, 'emoji_status_until_layer197')
+    def struct_0xfa30a8c7(self):
+        return (
+            'document_id' / Int64ul,
+            'until' / Int32ul)
+
+    @structures
+    def emoji_status_structures(self, name):
+        tag_map = {
+            0x2de11aae: LazyBound(self.struct_0x2de11aae),
+            0xe7ff068a: LazyBound(self.struct_0xe7ff068a),
+            0x7184603b: LazyBound(self.struct_0x7184603b),
+            0x07141dbf: LazyBound(self.struct_0x07141dbf),
+            0x929b619d: LazyBound(self.struct_0x929b619d),
+            0xfa30a8c7: LazyBound(self.struct_0xfa30a8c7)
+        }
+        return TLUnion(name, tag_map)
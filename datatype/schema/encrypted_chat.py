@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group encrypted_chat of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xfda9a7b7, 'encrypted_chat_requested_old')
+    def struct_0xfda9a7b7(self):
+        return (
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int32ul,
+            'participant_id' / Int32ul,
+            'g_a' / TBytes,
+            'nonce' / TBytes)
+
+    @constructor(0xc878527e, 'encrypted_chat_requested_layer115')
+    def struct_0xc878527e(self):
+        return (
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int32ul,
+            'participant_id' / Int32ul,
+            'g_a' / TBytes)
+
+    @constructor(0xfa56ce36, 'encrypted_chat_layer131')
+    def struct_0xfa56ce36(self):
+        return (
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int32ul,
+            'participant_id' / Int32ul,
+            'g_a_or_b' / TBytes,
+            'key_fingerprint' / Int64ul)
+
+    @constructor(0x62718a82, 'encrypted_chat_requested_layer131')
+    def struct_0x62718a82(self):
+        return Struct(
+            'sname' / Computed('encrypted_chat_requested_layer131'),
+            'signature' / Hex(Const(0x62718a82, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_folder_id=1),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int32ul,
+            'participant_id' / Int32ul,
+            'g_a' / TBytes)
+
+    @constructor(0x6601d14f, 'encrypted_chat_old')
+    def struct_0x6601d14f(self):
+        return (
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int32ul,
+            'participant_id' / Int32ul,
+            'g_a_or_b' / TBytes,
+            'nonce' / TBytes,
+            'key_fingerprint' / Int64ul)
+
+    @constructor(0xab7ec0a0, 'encrypted_chat_empty')
+    def struct_0xab7ec0a0(self):
+        return ['id' / Int32ul]
+
+    @constructor(0x3bf703dc, 'encrypted_chat_waiting_layer131')
+    def struct_0x3bf703dc(self):
+        return (
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int32ul,
+            'participant_id' / Int32ul)
+
+    @constructor(0x13d6dd27, 'encrypted_chat_discarded_layer122')
+    def struct_0x13d6dd27(self):
+        return ['id' / Int32ul]
+
+    @constructor(0x1e1c7c45, 'encrypted_chat_discarded')
+    def struct_0x1e1c7c45(self):
+        return Struct(
+            'sname' / Computed('encrypted_chat_discarded'),
+            'signature' / Hex(Const(0x1e1c7c45, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_history_deleted=1),
+            'id' / Int32ul)
+
+    @constructor(0x66b25953, 'encrypted_chat_waiting')
+    def struct_0x66b25953(self):
+        return (
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul)
+
+    @constructor(0x48f1d94c, 'encrypted_chat_requested')
+    def struct_0x48f1d94c(self):
+        return Struct(
+            'sname' / Computed('encrypted_chat_requested'),
+            'signature' / Hex(Const(0x48f1d94c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_folder_id=1),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul,
+            'g_a' / TBytes)
+
+    @constructor(0x61f0d4c7, 'encrypted_chat')
+    def struct_0x61f0d4c7(self):
+        return (
+            'id' / Int32ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul,
+            'g_a_or_b' / TBytes,
+            'key_fingerprint' / Int64ul)
+
+    @structures
+    def encrypted_chat_structures(self, name):
+        tag_map = {
+            0xfda9a7b7: LazyBound(self.struct_0xfda9a7b7),
+            0xc878527e: LazyBound(self.struct_0xc878527e),
+            0xfa56ce36: LazyBound(self.struct_0xfa56ce36),
+            0x62718a82: LazyBound(self.struct_0x62718a82),
+            0x6601d14f: LazyBound(self.struct_0x6601d14f),
+            0xab7ec0a0: LazyBound(self.struct_0xab7ec0a0),
+            0x3bf703dc: LazyBound(self.struct_0x3bf703dc),
+            0x13d6dd27: LazyBound(self.struct_0x13d6dd27),
+            0x1e1c7c45: LazyBound(self.struct_0x1e1c7c45),
+            0x66b25953: LazyBound(self.struct_0x66b25953),
+            0x48f1d94c: LazyBound(self.struct_0x48f1d94c),
+            0x61f0d4c7: LazyBound(self.struct_0x61f0d4c7)
+        }
+        return TLUnion(name, tag_map)
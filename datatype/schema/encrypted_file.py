@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group encrypted_file of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa8008cd8, 'encrypted_file')
+    def struct_0xa8008cd8(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'size' / Int64ul,
+            'dc_id' / Int32ul,
+            'key_fingerprint' / Int32ul)
+
+    @constructor(0x4a70994c, 'encrypted_file_layer142')
+    def struct_0x4a70994c(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'size' / Int32ul,
+            'dc_id' / Int32ul,
+            'key_fingerprint' / Int32ul)
+
+    @constructor(0xc21f497e, 'encrypted_file_empty')
+    def struct_0xc21f497e(self):
+        return []
+
+    @structures
+    def encrypted_file_structures(self, name):
+        tag_map = {
+            0xa8008cd8: LazyBound(self.struct_0xa8008cd8),
+            0x4a70994c: LazyBound(self.struct_0x4a70994c),
+            0xc21f497e: LazyBound(self.struct_0xc21f497e)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group encrypted_message of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x23734b06, 'encrypted_message_service')
+    def struct_0x23734b06(self):
+        return (
+            'random_id' / Int64ul,
+            'chat_id' / Int32ul,
+            'date' / TTimestamp,
+            'bytes' / TBytes)
+
+    @constructor(0xed18c118, 'encrypted_message')
+    def struct_0xed18c118(self):
+        return (
+            'random_id' / Int64ul,
+            'chat_id' / Int32ul,
+            'date' / TTimestamp,
+            'bytes' / TBytes,
+            'file' / self.encrypted_file_structures('file'))
+
+    @structures
+    def encrypted_message_structures(self, name):
+        tag_map = {
+            0x23734b06: LazyBound(self.struct_0x23734b06),
+            0xed18c118: LazyBound(self.struct_0xed18c118)
+        }
+        return TLUnion(name, tag_map)
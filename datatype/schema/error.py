@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group error of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xc4b9f9bb, 'error')
+    def struct_0xc4b9f9bb(self):
+        return (
+            'code' / Int32ul,
+            'text' / TString)
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group exported of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x41bf109b, 'exported_contact_token')
+    def struct_0x41bf109b(self):
+        return (
+            'url' / TString,
+            'expires' / Int32ul)
+
+    @constructor(0x5dab1af4, 'exported_message_link')
+    def struct_0x5dab1af4(self):
+        return (
+            'link' / TString,
+            'html' / TString)
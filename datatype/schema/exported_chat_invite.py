@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group exported_chat_invite of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa22cbd96, 'chat_invite_exported')
+    def struct_0xa22cbd96(self):
+        return Struct(
+            'sname' / Computed('chat_invite_exported'),
+            'signature' / Hex(Const(0xa22cbd96, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoked=1,
+                                is_permanent=32,
+                                is_request_needed=64,
+                                has_start_date=16,
+                                has_expire_date=2,
+                                has_usage_limit=4,
+                                has_usage=8,
+                                has_requested=128,
+                                has_subscription_expired=1024,
+                                has_title=256,
+                                has_subscription_pricing=512),
+            'link' / TString,
+            'admin_id' / Int64ul,
+            'date' / TTimestamp,
+            'start_date' / If(this.flags.has_start_date, TTimestamp),
+            'expire_date' / If(this.flags.has_expire_date, TTimestamp),
+            'usage_limit' / If(this.flags.has_usage_limit, Int32ul),
+            'usage' / If(this.flags.has_usage, Int32ul),
+            'requested' / If(this.flags.has_requested, Int32ul),
+            'subscription_expired' / If(this.flags.has_subscription_expired, Int32ul),
+            'title' / If(this.flags.has_title, TString),
+            'subscription_pricing' / If(this.flags.has_subscription_pricing, self.struct_0x05416d58()))
+
+    @constructor(0x0ab4a819, 'chat_invite_exported_layer185')
+    def struct_0x0ab4a819(self):
+        return Struct(
+            'sname' / Computed('chat_invite_exported_layer185'),
+            'signature' / Hex(Const(0x0ab4a819, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoked=1,
+                                is_permanent=32,
+                                is_request_needed=64,
+                                has_start_date=16,
+                                has_expire_date=2,
+                                has_usage_limit=4,
+                                has_usage=8,
+                                has_requested=128,
+                                has_title=256),
+            'link' / TString,
+            'admin_id' / Int64ul,
+            'date' / TTimestamp,
+            'start_date' / If(this.flags.has_start_date, TTimestamp),
+            'expire_date' / If(this.flags.has_expire_date, TTimestamp),
+            'usage_limit' / If(this.flags.has_usage_limit, Int32ul),
+            'usage' / If(this.flags.has_usage, Int32ul),
+            'requested' / If(this.flags.has_requested, Int32ul),
+            'title' / If(this.flags.has_title, TString))
+
+    @constructor(0xb18105e8, 'chat_invite_exported_layer133')
+    def struct_0xb18105e8(self):
+        return Struct(
+            'sname' / Computed('chat_invite_exported_layer133'),
+            'signature' / Hex(Const(0xb18105e8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoked=1,
+                                is_permanent=32,
+                                has_start_date=16,
+                                has_expire_date=2,
+                                has_usage_limit=4,
+                                has_usage=8),
+            'link' / TString,
+            'admin_id' / Int64ul,
+            'date' / TTimestamp,
+            'start_date' / If(this.flags.has_start_date, TTimestamp),
+            'expire_date' / If(this.flags.has_expire_date, TTimestamp),
+            'usage_limit' / If(this.flags.has_usage_limit, Int32ul),
+            'usage' / If(this.flags.has_usage, Int32ul))
+
+    @constructor(0x69df3769, 'chat_invite_empty_layer122')
+    def struct_0x69df3769(self):
+        return []
+
+    @constructor(0x6e24fc9d, 'chat_invite_exported_layer131')
+    def struct_0x6e24fc9d(self):
+        return Struct(
+            'sname' / Computed('chat_invite_exported_layer131'),
+            'signature' / Hex(Const(0x6e24fc9d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoked=1,
+                                is_permanent=32,
+                                has_start_date=16,
+                                has_expire_date=2,
+                                has_usage_limit=4,
+                                has_usage=8),
+            'link' / TString,
+            'admin_id' / Int32ul,
+            'date' / TTimestamp,
+            'start_date' / If(this.flags.has_start_date, TTimestamp),
+            'expire_date' / If(this.flags.has_expire_date, TTimestamp),
+            'usage_limit' / If(this.flags.has_usage_limit, Int32ul),
+            'usage' / If(this.flags.has_usage, Int32ul))
+
+    @constructor(0xfc2e05bc, 'chat_invite_exported_layer122')
+    def struct_0xfc2e05bc(self):
+        return ['link' / TString]
+
+    @constructor(0xed107ab7, 'chat_invite_public_join_requests')
+    def struct_0xed107ab7(self):
+        return []
+
+    @structures
+    def exported_chat_invite_structures(self, name):
+        tag_map = {
+            0xa22cbd96: LazyBound(self.struct_0xa22cbd96),
+            0x0ab4a819: LazyBound(self.struct_0x0ab4a819),
+            0xb18105e8: LazyBound(self.struct_0xb18105e8),
+            0x69df3769: LazyBound(self.struct_0x69df3769),
+            0x6e24fc9d: LazyBound(self.struct_0x6e24fc9d),
+            0xfc2e05bc: LazyBound(self.struct_0xfc2e05bc),
+            0xed107ab7: LazyBound(self.struct_0xed107ab7)
+        }
+        return TLUnion(name, tag_map)
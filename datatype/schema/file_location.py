@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group file_location of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x7c596b46, 'file_location_unavailable')
+    def struct_0x7c596b46(self):
+        return (
+            'volume_id' / Int64ul,
+            'local_id' / Int32ul,
+            'secret' / Int64ul)
+
+    @constructor(0x53d69076, 'file_location_layer82')
+    def struct_0x53d69076(self):
+        return (
+            'dc_id' / Int32ul,
+            'volume_id' / Int64ul,
+            'local_id' / Int32ul,
+            'secret' / Int64ul)
+
+    @constructor(0x091d11eb, 'file_location_layer97')
+    def struct_0x091d11eb(self):
+        return (
+            'dc_id' / Int32ul,
+            'volume_id' / Int64ul,
+            'local_id' / Int32ul,
+            'secret' / Int64ul,
+            'file_reference' / TBytes)
+
+    @constructor(0xbc7fc6cd, 'file_location_to_be_deprecated')
+    def struct_0xbc7fc6cd(self):
+        return (
+            'volume_id' / Int64ul,
+            'local_id' / Int32ul)
+
+    @constructor(0x55555554, 'file_encrypted_location')
+    def struct_0x55555554(self):
+        return (
+            'dc_id' / Int32ul,
+            'volume_id' / Int64ul,
+            'local_id' / Int32ul,
+            'secret' / Int64ul,
+            'key' / TBytes,
+            'iv' / TBytes)
+
+    @structures
+    def file_location_structures(self, name):
+        tag_map = {
+            0x7c596b46: LazyBound(self.struct_0x7c596b46),
+            0x53d69076: LazyBound(self.struct_0x53d69076),
+            0x091d11eb: LazyBound(self.struct_0x091d11eb),
+            0xbc7fc6cd: LazyBound(self.struct_0xbc7fc6cd),
+            0x55555554: LazyBound(self.struct_0x55555554)
+        }
+        return TLUnion(name, tag_map)
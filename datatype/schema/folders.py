@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group folders of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x1c295881, 'folders_delete_folder')
+    def struct_0x1c295881(self):
+        return ['folder_id' / Int32ul]
+
+    @constructor(0x6847d0ab, 'folders_edit_peer_folders')
+    def struct_0x6847d0ab(self):
+        return ['folder_peers' / self.vector(self.struct_0xfbd2c296(), 'folder_peers')]
+
+    @constructor(0xfbd2c296, 'input_folder_peer')
+    def struct_0xfbd2c296(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'folder_id' / Int32ul)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group forum_topic of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x023f109b, 'forum_topic_deleted')
+    def struct_0x023f109b(self):
+        return ['id' / Int32ul]
+
+    @constructor(0x5920d6dc, 'forum_topic_layer147')
+    def struct_0x5920d6dc(self):
+        return Struct(
+            'sname' / Computed('forum_topic_layer147'),
+            'signature' / Hex(Const(0x5920d6dc, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_my=2,
+                                is_closed=4,
+                                is_pinned=8,
+                                has_icon_emoji_id=1),
+            'id' / Int32ul,
+            'date' / TTimestamp,
+            'title' / TString,
+            'icon_color' / Int32ul,
+            'icon_emoji_id' / If(this.flags.has_icon_emoji_id, Int64ul),
+            'top_message' / Int32ul,
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'unread_mentions_count' / Int32ul,
+            'unread_reactions_count' / Int32ul,
+            'from_id' / self.peer_structures('from_id'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'))
+
+    @constructor(0x71701da9, 'forum_topic')
+    def struct_0x71701da9(self):
+        return Struct(
+            'sname' / Computed('forum_topic'),
+            'signature' / Hex(Const(0x71701da9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_my=2,
+                                is_closed=4,
+                                is_pinned=8,
+                                is_short=32,
+                                is_hidden=64,
+                                has_icon_emoji_id=1,
+                                has_draft=16),
+            'id' / Int32ul,
+            'date' / TTimestamp,
+            'title' / TString,
+            'icon_color' / Int32ul,
+            'icon_emoji_id' / If(this.flags.has_icon_emoji_id, Int64ul),
+            'top_message' / Int32ul,
+            'read_inbox_max_id' / Int32ul,
+            'read_outbox_max_id' / Int32ul,
+            'unread_count' / Int32ul,
+            'unread_mentions_count' / Int32ul,
+            'unread_reactions_count' / Int32ul,
+            'from_id' / self.peer_structures('from_id'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'draft' / If(this.flags.has_draft, self.draft_message_structures('draft')))
+
+    @structures
+    def forum_topic_structures(self, name):
+        tag_map = {
+            0x023f109b: LazyBound(self.struct_0x023f109b),
+            0x5920d6dc: LazyBound(self.struct_0x5920d6dc),
+            0x71701da9: LazyBound(self.struct_0x71701da9)
+        }
+        return TLUnion(name, tag_map)
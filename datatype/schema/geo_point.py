@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group geo_point of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0296f104, 'geo_point_layer119')
+    def struct_0x0296f104(self):
+        return (
+            'long' / Double,
+            'lat' / Double,
+            'access_hash' / Int64ul)
+
+    @constructor(0x2049d70c, 'geo_point_layer81')
+    def struct_0x2049d70c(self):
+        return (
+            'long' / Double,
+            'lat' / Double)
+
+    @constructor(0x1117dd5f, 'geo_point_empty')
+    def struct_0x1117dd5f(self):
+        return []
+
+    @constructor(0xb2a2f663, 'geo_point')
+    def struct_0xb2a2f663(self):
+        return Struct(
+            'sname' / Computed('geo_point'),
+            'signature' / Hex(Const(0xb2a2f663, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_accuracy_radius=1),
+            'long' / Double,
+            'lat' / Double,
+            'access_hash' / Int64ul,
+            'accuracy_radius' / If(this.flags.has_accuracy_radius, Int32ul))
+
+    @structures
+    def geo_point_structures(self, name):
+        tag_map = {
+            0x0296f104: LazyBound(self.struct_0x0296f104),
+            0x2049d70c: LazyBound(self.struct_0x2049d70c),
+            0x1117dd5f: LazyBound(self.struct_0x1117dd5f),
+            0xb2a2f663: LazyBound(self.struct_0xb2a2f663)
+        }
+        return TLUnion(name, tag_map)
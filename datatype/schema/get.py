@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group get of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xb9cdc5ee, 'get_fact_check')
+    def struct_0xb9cdc5ee(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / self.vector(Int32ul, 'msg_id'))
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group global of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x734c4ccb, 'global_privacy_settings')
+    def struct_0x734c4ccb(self):
+        return Struct(
+            'sname' / Computed('global_privacy_settings'),
+            'signature' / Hex(Const(0x734c4ccb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_archive_and_mute_new_noncontact_peers=1,
+                                is_keep_archived_unmuted=2,
+                                is_keep_archived_folders=4,
+                                is_hide_read_marks=8,
+                                is_new_noncontact_peers_require_premium=16))
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group group_call of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x7780bcb4, 'group_call_discarded')
+    def struct_0x7780bcb4(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'duration' / Int32ul)
+
+    @constructor(0xcdf8d3e3, 'group_call')
+    def struct_0xcdf8d3e3(self):
+        return Struct(
+            'sname' / Computed('group_call'),
+            'signature' / Hex(Const(0xcdf8d3e3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_join_muted=2,
+                                is_can_change_join_muted=4,
+                                is_join_date_asc=64,
+                                is_schedule_start_subscribed=256,
+                                is_can_start_video=512,
+                                is_record_video_active=2048,
+                                is_rtmp_stream=4096,
+                                is_listeners_hidden=8192,
+                                has_title=8,
+                                has_stream_dc_id=16,
+                                has_record_start_date=32,
+                                has_schedule_date=128,
+                                has_unmuted_video_count=1024,
+                                has_conference_from_call=16384),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'participants_count' / Int32ul,
+            'title' / If(this.flags.has_title, TString),
+            'stream_dc_id' / If(this.flags.has_stream_dc_id, Int32ul),
+            'record_start_date' / If(this.flags.has_record_start_date, TTimestamp),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'unmuted_video_count' / If(this.flags.has_unmuted_video_count, Int32ul),
+            'unmuted_video_limit' / Int32ul,
+            'version' / Int32ul,
+            'conference_from_call' / If(this.flags.has_conference_from_call, Int64ul))
+
+    @constructor(0xd597650c, 'group_call_layer195')
+    def struct_0xd597650c(self):
+        return Struct(
+            'sname' / Computed('group_call_layer195'),
+            'signature' / Hex(Const(0xd597650c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_join_muted=2,
+                                is_can_change_join_muted=4,
+                                is_join_date_asc=64,
+                                is_schedule_start_subscribed=256,
+                                is_can_start_video=512,
+                                is_record_video_active=2048,
+                                is_rtmp_stream=4096,
+                                is_listeners_hidden=8192,
+                                has_title=8,
+                                has_stream_dc_id=16,
+                                has_record_start_date=32,
+                                has_schedule_date=128,
+                                has_unmuted_video_count=1024),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'participants_count' / Int32ul,
+            'title' / If(this.flags.has_title, TString),
+            'stream_dc_id' / If(this.flags.has_stream_dc_id, Int32ul),
+            'record_start_date' / If(this.flags.has_record_start_date, TTimestamp),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'unmuted_video_count' / If(this.flags.has_unmuted_video_count, Int32ul),
+            'unmuted_video_limit' / Int32ul,
+            'version' / Int32ul)
+
+    @structures
+    def group_call_structures(self, name):
+        tag_map = {
+            0x7780bcb4: LazyBound(self.struct_0x7780bcb4),
+            0xcdf8d3e3: LazyBound(self.struct_0xcdf8d3e3),
+            0xd597650c: LazyBound(self.struct_0xd597650c)
+        }
+        return TLUnion(name, tag_map)
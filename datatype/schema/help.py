@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x038a08d3, 'help_get_user_info')
+    def struct_0x038a08d3(self):
+        return ['user_id' / self.input_user_structures('user_id')]
+
+    @constructor(0x0e0310d7, 'help_recent_me_urls')
+    def struct_0x0e0310d7(self):
+        return (
+            'urls' / self.vector(self.recent_me_url_structures('urls'), 'urls'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x17c6b5f6, 'help_support')
+    def struct_0x17c6b5f6(self):
+        return (
+            'phone_number' / TString,
+            'user' / self.user_structures('user'))
+
+    @constructor(0x18cb9f78, 'help_invite_text')
+    def struct_0x18cb9f78(self):
+        return ['message' / TString]
+
+    @constructor(0x1d1b1245, 'input_app_event')
+    def struct_0x1d1b1245(self):
+        return (
+            'time' / Double,
+            'type' / TString,
+            'peer' / Int64ul,
+            'data' / self.json_value_structures('data'))
+
+    @constructor(0x1e251c95, 'help_hide_promo_data')
+    def struct_0x1e251c95(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x1fb33026, 'help_get_nearest_dc')
+    def struct_0x1fb33026(self):
+        return []
+
+    @constructor(0x2ca51fd1, 'help_get_terms_of_service_update')
+    def struct_0x2ca51fd1(self):
+        return []
+
+    @constructor(0x3dc0f114, 'help_get_recent_me_urls')
+    def struct_0x3dc0f114(self):
+        return ['referer' / TString]
+
+    @constructor(0x3fedc75f, 'help_get_deep_link_info')
+    def struct_0x3fedc75f(self):
+        return ['path' / TString]
+
+    @constructor(0x49b30240, 'help_get_timezones_list')
+    def struct_0x49b30240(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0x4d392343, 'help_get_invite_text')
+    def struct_0x4d392343(self):
+        return []
+
+    @constructor(0x522d5a7d, 'help_get_app_update')
+    def struct_0x522d5a7d(self):
+        return ['source' / TString]
+
+    @constructor(0x61e3f854, 'help_get_app_config')
+    def struct_0x61e3f854(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0x66b91b70, 'help_edit_user_info')
+    def struct_0x66b91b70(self):
+        return (
+            'user_id' / self.input_user_structures('user_id'),
+            'message' / TString,
+            'entities' / self.vector(self.message_entity_structures('entities'), 'entities'))
+
+    @constructor(0x6f02f748, 'help_save_app_log')
+    def struct_0x6f02f748(self):
+        return ['events' / self.vector(self.struct_0x1d1b1245(), 'events')]
+
+    @constructor(0x735787a8, 'help_get_countries_list')
+    def struct_0x735787a8(self):
+        return (
+            'lang_code' / TString,
+            'hash' / Int32ul)
+
+    @constructor(0x8c05f1c9, 'help_support_name')
+    def struct_0x8c05f1c9(self):
+        return ['name' / TString]
+
+    @constructor(0x9010ef6f, 'help_get_app_changelog')
+    def struct_0x9010ef6f(self):
+        return ['prev_app_version' / TString]
+
+    @constructor(0x9cdf08cd, 'help_get_support')
+    def struct_0x9cdf08cd(self):
+        return []
+
+    @constructor(0xabcfa9fd, 'help_get_peer_profile_colors')
+    def struct_0xabcfa9fd(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0xb81b93d4, 'help_get_premium_promo')
+    def struct_0xb81b93d4(self):
+        return []
+
+    @constructor(0xc0977421, 'help_get_promo_data')
+    def struct_0xc0977421(self):
+        return []
+
+    @constructor(0xc4f9186b, 'help_get_config')
+    def struct_0xc4f9186b(self):
+        return []
+
+    @constructor(0xc661ad08, 'help_get_passport_config')
+    def struct_0xc661ad08(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0xd360e72c, 'help_get_support_name')
+    def struct_0xd360e72c(self):
+        return []
+
+    @constructor(0xda80f42f, 'help_get_peer_colors')
+    def struct_0xda80f42f(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0xec22cfcd, 'help_set_bot_updates_status')
+    def struct_0xec22cfcd(self):
+        return (
+            'pending_updates_count' / Int32ul,
+            'message' / TString)
+
+    @constructor(0xee72f79a, 'help_accept_terms_of_service')
+    def struct_0xee72f79a(self):
+        return ['id' / self.struct_0x7d748d04()]
+
+    @constructor(0xf50dbaa1, 'help_dismiss_suggestion')
+    def struct_0xf50dbaa1(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'suggestion' / TString)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_app_config of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xdd18782e, 'help_app_config')
+    def struct_0xdd18782e(self):
+        return (
+            'hash' / Int32ul,
+            'config' / self.json_value_structures('config'))
+
+    @constructor(0x7cde641d, 'help_app_config_not_modified')
+    def struct_0x7cde641d(self):
+        return []
+
+    @structures
+    def help_app_config_structures(self, name):
+        tag_map = {
+            0xdd18782e: LazyBound(self.struct_0xdd18782e),
+            0x7cde641d: LazyBound(self.struct_0x7cde641d)
+        }
+        return TLUnion(name, tag_map)
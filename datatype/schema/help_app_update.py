@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_app_update of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xccbbce30, 'help_app_update')
+    def struct_0xccbbce30(self):
+        return Struct(
+            'sname' / Computed('help_app_update'),
+            'signature' / Hex(Const(0xccbbce30, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_not_skip=1,
+                                has_document=2,
+                                has_url=4,
+                                has_sticker=8),
+            'id' / Int32ul,
+            'version' / TString,
+            'text' / TString,
+            'entities' / self.vector(self.message_entity_structures('entities'), 'entities'),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'url' / If(this.flags.has_url, TString),
+            'sticker' / If(this.flags.has_sticker, self.document_structures('sticker')))
+
+    @constructor(0xc45a6536, 'help_no_app_update')
+    def struct_0xc45a6536(self):
+        return []
+
+    @structures
+    def help_app_update_structures(self, name):
+        tag_map = {
+            0xccbbce30: LazyBound(self.struct_0xccbbce30),
+            0xc45a6536: LazyBound(self.struct_0xc45a6536)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_countries_list of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x93cc1f32, 'help_countries_list_not_modified')
+    def struct_0x93cc1f32(self):
+        return []
+
+    @constructor(0x87d0759e, 'help_countries_list')
+    def struct_0x87d0759e(self):
+        return (
+            'countries' / self.vector(self.struct_0xc3878e23(), 'countries'),
+            'hash' / Int32ul)
+
+    @structures
+    def help_countries_list_structures(self, name):
+        tag_map = {
+            0x93cc1f32: LazyBound(self.struct_0x93cc1f32),
+            0x87d0759e: LazyBound(self.struct_0x87d0759e)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x4203c5ef, 'help_country_code')
+    def struct_0x4203c5ef(self):
+        return Struct(
+            'sname' / Computed('help_country_code'),
+            'signature' / Hex(Const(0x4203c5ef, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_prefixes=1,
+                                has_patterns=2),
+            'country_code' / TString,
+            'prefixes' / If(this.flags.has_prefixes, self.vector(TString, 'prefixes')),
+            'patterns' / If(this.flags.has_patterns, self.vector(TString, 'patterns')))
+
+    @constructor(0xc3878e23, 'help_country')
+    def struct_0xc3878e23(self):
+        return Struct(
+            'sname' / Computed('help_country'),
+            'signature' / Hex(Const(0xc3878e23, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_hidden=1,
+                                has_name=2),
+            'iso2' / TString,
+            'default_name' / TString,
+            'name' / If(this.flags.has_name, TString),
+            'country_codes' / self.vector(self.struct_0x4203c5ef(), 'country_codes'))
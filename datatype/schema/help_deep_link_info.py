@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_deep_link_info of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x66afa166, 'help_deep_link_info_empty')
+    def struct_0x66afa166(self):
+        return []
+
+    @constructor(0x6a4ee832, 'help_deep_link_info')
+    def struct_0x6a4ee832(self):
+        return Struct(
+            'sname' / Computed('help_deep_link_info'),
+            'signature' / Hex(Const(0x6a4ee832, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_update_app=1,
+                                has_entities=2),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')))
+
+    @structures
+    def help_deep_link_info_structures(self, name):
+        tag_map = {
+            0x66afa166: LazyBound(self.struct_0x66afa166),
+            0x6a4ee832: LazyBound(self.struct_0x6a4ee832)
+        }
+        return TLUnion(name, tag_map)
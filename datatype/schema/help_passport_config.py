@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_passport_config of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xbfb9f457, 'help_passport_config_not_modified')
+    def struct_0xbfb9f457(self):
+        return []
+
+    @constructor(0xa098d6af, 'help_passport_config')
+    def struct_0xa098d6af(self):
+        return (
+            'hash' / Int32ul,
+            'countries_langs' / self.struct_0x7d748d04())
+
+    @structures
+    def help_passport_config_structures(self, name):
+        tag_map = {
+            0xbfb9f457: LazyBound(self.struct_0xbfb9f457),
+            0xa098d6af: LazyBound(self.struct_0xa098d6af)
+        }
+        return TLUnion(name, tag_map)
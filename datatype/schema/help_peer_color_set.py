@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_peer_color_set of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x26219a58, 'help_peer_color_set')
+    def struct_0x26219a58(self):
+        return ['colors' / self.vector(Int32ul, 'colors')]
+
+    @constructor(0x767d61eb, 'help_peer_color_profile_set')
+    def struct_0x767d61eb(self):
+        return (
+            'palette_colors' / self.vector(Int32ul, 'palette_colors'),
+            'bg_colors' / self.vector(Int32ul, 'bg_colors'),
+            'story_colors' / self.vector(Int32ul, 'story_colors'))
+
+    @structures
+    def help_peer_color_set_structures(self, name):
+        tag_map = {
+            0x26219a58: LazyBound(self.struct_0x26219a58),
+            0x767d61eb: LazyBound(self.struct_0x767d61eb)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_peer_colors of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x2ba1f5ce, 'help_peer_colors_not_modified')
+    def struct_0x2ba1f5ce(self):
+        return []
+
+    @constructor(0x00f8ed08, 'help_peer_colors')
+    def struct_0x00f8ed08(self):
+        return (
+            'hash' / Int32ul,
+            'colors' / self.vector(self.struct_0xadec6ebe(), 'colors'))
+
+    @structures
+    def help_peer_colors_structures(self, name):
+        tag_map = {
+            0x2ba1f5ce: LazyBound(self.struct_0x2ba1f5ce),
+            0x00f8ed08: LazyBound(self.struct_0x00f8ed08)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xadec6ebe, 'help_peer_color_option')
+    def struct_0xadec6ebe(self):
+        return Struct(
+            'sname' / Computed('help_peer_color_option'),
+            'signature' / Hex(Const(0xadec6ebe, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_hidden=1,
+                                has_colors=2,
+                                has_dark_colors=4,
+                                has_channel_min_level=8,
+                                has_group_min_level=16),
+            'color_id' / Int32ul,
+            'colors' / If(this.flags.has_colors, self.help_peer_color_set_structures('colors')),
+            'dark_colors' / If(this.flags.has_dark_colors, self.help_peer_color_set_structures('dark_colors')),
+            'channel_min_level' / If(this.flags.has_channel_min_level, Int32ul),
+            'group_min_level' / If(this.flags.has_group_min_level, Int32ul))
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_premium_promo of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x5334759c, 'help_premium_promo')
+    def struct_0x5334759c(self):
+        return (
+            'status_text' / TString,
+            'status_entities' / self.vector(self.message_entity_structures('status_entities'), 'status_entities'),
+            'video_sections' / self.vector(TString, 'video_sections'),
+            'videos' / self.vector(self.document_structures('videos'), 'videos'),
+            'period_options' / self.vector(self.premium_subscription_option_structures('period_options'), 'period_options'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x8a4f3c29, 'help_premium_promo_layer144')
+    def struct_0x8a4f3c29(self):
+        return (
+            'status_text' / TString,
+            'status_entities' / self.vector(self.message_entity_structures('status_entities'), 'status_entities'),
+            'video_sections' / self.vector(TString, 'video_sections'),
+            'videos' / self.vector(self.document_structures('videos'), 'videos'),
+            'currency' / TString,
+            'monthly_amount' / Int64ul,
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xe0360f1b, 'help_premium_promo_layer140')
+    def struct_0xe0360f1b(self):
+        return (
+            'status_text' / TString,
+            'status_entities' / self.vector(self.message_entity_structures('status_entities'), 'status_entities'),
+            'video_sections' / self.vector(TString, 'video_sections'),
+            'videos' / self.vector(self.document_structures('videos'), 'videos'),
+            'currency' / TString,
+            'monthly_amount' / Int64ul)
+
+    @structures
+    def help_premium_promo_structures(self, name):
+        tag_map = {
+            0x5334759c: LazyBound(self.struct_0x5334759c),
+            0x8a4f3c29: LazyBound(self.struct_0x8a4f3c29),
+            0xe0360f1b: LazyBound(self.struct_0xe0360f1b)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_promo_data of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x8c39793f, 'help_promo_data')
+    def struct_0x8c39793f(self):
+        return Struct(
+            'sname' / Computed('help_promo_data'),
+            'signature' / Hex(Const(0x8c39793f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_proxy=1,
+                                has_psa_type=2,
+                                has_psa_message=4),
+            'expires' / Int32ul,
+            'peer' / self.peer_structures('peer'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'psa_type' / If(this.flags.has_psa_type, TString),
+            'psa_message' / If(this.flags.has_psa_message, TString))
+
+    @constructor(0x98f6ac75, 'help_promo_data_empty')
+    def struct_0x98f6ac75(self):
+        return ['expires' / Int32ul]
+
+    @structures
+    def help_promo_data_structures(self, name):
+        tag_map = {
+            0x8c39793f: LazyBound(self.struct_0x8c39793f),
+            0x98f6ac75: LazyBound(self.struct_0x98f6ac75)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_terms_of_service_update of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x28ecf961, 'help_terms_of_service_update')
+    def struct_0x28ecf961(self):
+        return (
+            'expires' / Int32ul,
+            'terms_of_service' / self.struct_0x780a0310())
+
+    @constructor(0xe3309f7f, 'help_terms_of_service_update_empty')
+    def struct_0xe3309f7f(self):
+        return ['expires' / Int32ul]
+
+    @structures
+    def help_terms_of_service_update_structures(self, name):
+        tag_map = {
+            0x28ecf961: LazyBound(self.struct_0x28ecf961),
+            0xe3309f7f: LazyBound(self.struct_0xe3309f7f)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x780a0310, 'help_terms_of_service')
+    def struct_0x780a0310(self):
+        return Struct(
+            'sname' / Computed('help_terms_of_service'),
+            'signature' / Hex(Const(0x780a0310, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_popup=1,
+                                has_min_age_confirm=2),
+            'id' / self.struct_0x7d748d04(),
+            'text' / TString,
+            'entities' / self.vector(self.message_entity_structures('entities'), 'entities'),
+            'min_age_confirm' / If(this.flags.has_min_age_confirm, Int32ul))
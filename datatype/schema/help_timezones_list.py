@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_timezones_list of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x970708cc, 'help_timezones_list_not_modified')
+    def struct_0x970708cc(self):
+        return []
+
+    @constructor(0x7b74ed71, 'help_timezones_list')
+    def struct_0x7b74ed71(self):
+        return (
+            'timezones' / self.vector(self.struct_0xff9289f5(), 'timezones'),
+            'hash' / Int32ul)
+
+    @structures
+    def help_timezones_list_structures(self, name):
+        tag_map = {
+            0x970708cc: LazyBound(self.struct_0x970708cc),
+            0x7b74ed71: LazyBound(self.struct_0x7b74ed71)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xff9289f5, 'timezone')
+    def struct_0xff9289f5(self):
+        return (
+            'id' / TString,
+            'name' / TString,
+            'utc_offset' / Int32ul)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group help_user_info of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf3ae2eed, 'help_user_info_empty')
+    def struct_0xf3ae2eed(self):
+        return []
+
+    @constructor(0x01eb3758, 'help_user_info')
+    def struct_0x01eb3758(self):
+        return (
+            'message' / TString,
+            'entities' / self.vector(self.message_entity_structures('entities'), 'entities'),
+            'author' / TString,
+            'date' / TTimestamp)
+
+    @structures
+    def help_user_info_structures(self, name):
+        tag_map = {
+            0xf3ae2eed: LazyBound(self.struct_0xf3ae2eed),
+            0x01eb3758: LazyBound(self.struct_0x01eb3758)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group inline_query_peer_type of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x6334ee9a, 'inline_query_peer_type_broadcast')
+    def struct_0x6334ee9a(self):
+        return []
+
+    @constructor(0xd766c50a, 'inline_query_peer_type_chat')
+    def struct_0xd766c50a(self):
+        return []
+
+    @constructor(0x833c0fac, 'inline_query_peer_type_pm')
+    def struct_0x833c0fac(self):
+        return []
+
+    @constructor(0x0e3b2d0c, 'inline_query_peer_type_bot_pm')
+    def struct_0x0e3b2d0c(self):
+        return []
+
+    @constructor(0x5ec4be43, 'inline_query_peer_type_megagroup')
+    def struct_0x5ec4be43(self):
+        return []
+
+    @constructor(0x3081ed9d, 'inline_query_peer_type_same_bot_pm')
+    def struct_0x3081ed9d(self):
+        return []
+
+    @structures
+    def inline_query_peer_type_structures(self, name):
+        tag_map = {
+            0x6334ee9a: LazyBound(self.struct_0x6334ee9a),
+            0xd766c50a: LazyBound(self.struct_0xd766c50a),
+            0x833c0fac: LazyBound(self.struct_0x833c0fac),
+            0x0e3b2d0c: LazyBound(self.struct_0x0e3b2d0c),
+            0x5ec4be43: LazyBound(self.struct_0x5ec4be43),
+            0x3081ed9d: LazyBound(self.struct_0x3081ed9d)
+        }
+        return TLUnion(name, tag_map)
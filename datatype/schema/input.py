@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0a8eb2be, 'input_report_reason_illegal_drugs')
+    def struct_0x0a8eb2be(self):
+        return []
+
+    @constructor(0x1f9338fe, 'input_media_invoice')
+    def struct_0x1f9338fe(self):
+        return Struct(
+            'sname' / Computed('input_media_invoice'),
+            'signature' / Hex(Const(0x1f9338fe, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_photo=1,
+                                has_start_param=2,
+                                has_extend_media=4),
+            'title' / TString,
+            'description' / TString,
+            'photo' / If(this.flags.has_photo, self.struct_0x9bed434d()),
+            'invoice' / self.struct_0x5db95a15(),
+            'payload' / TBytes,
+            'provider' / TString,
+            'provider_data' / self.struct_0x7d748d04(),
+            'start_param' / If(this.flags.has_start_param, TString),
+            'extend_media' / If(this.flags.has_extend_media, self.input_media_structures('extend_media')))
+
+    @constructor(0x405fef0d, 'input_media_invoice')
+    def struct_0x405fef0d(self):
+        return Struct(
+            'sname' / Computed('input_media_invoice'),
+            'signature' / Hex(Const(0x405fef0d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_photo=1,
+                                has_start_param=2,
+                                has_extend_media=4),
+            'title' / TString,
+            'description' / TString,
+            'photo' / If(this.flags.has_photo, self.struct_0x9bed434d()),
+            'invoice' / self.invoice_structures('invoice'),
+            'payload' / TBytes,
+            'provider' / TString,
+            'provider_data' / self.struct_0x7d748d04(),
+            'start_param' / If(this.flags.has_start_param, TString),
+            'extend_media' / If(this.flags.has_extend_media, self.input_media_structures('extend_media')))
+
+    @constructor(0x89fdd778, 'input_media_story')
+    def struct_0x89fdd778(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul)
+
+    @constructor(0x9bed434d, 'input_web_document')
+    def struct_0x9bed434d(self):
+        return (
+            'url' / TString,
+            'size' / Int32ul,
+            'mime_type' / TString,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'))
+
+    @constructor(0x9ec7863d, 'input_report_reason_personal_details')
+    def struct_0x9ec7863d(self):
+        return []
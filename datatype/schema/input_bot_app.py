@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_bot_app of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa920bd7a, 'input_bot_app_id')
+    def struct_0xa920bd7a(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0x908c0407, 'input_bot_app_short_name')
+    def struct_0x908c0407(self):
+        return (
+            'bot_id' / self.input_user_structures('bot_id'),
+            'short_name' / TString)
+
+    @structures
+    def input_bot_app_structures(self, name):
+        tag_map = {
+            0xa920bd7a: LazyBound(self.struct_0xa920bd7a),
+            0x908c0407: LazyBound(self.struct_0x908c0407)
+        }
+        return TLUnion(name, tag_map)
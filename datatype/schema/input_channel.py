@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_channel of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x2a286531, 'input_channel_from_message_layer131')
+    def struct_0x2a286531(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'channel_id' / Int32ul)
+
+    @constructor(0xafeb712e, 'input_channel_layer131')
+    def struct_0xafeb712e(self):
+        return (
+            'channel_id' / Int32ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0xf35aec28, 'input_channel')
+    def struct_0xf35aec28(self):
+        return (
+            'channel_id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0xee8c1e86, 'input_channel_empty')
+    def struct_0xee8c1e86(self):
+        return []
+
+    @constructor(0x5b934f9d, 'input_channel_from_message')
+    def struct_0x5b934f9d(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'channel_id' / Int64ul)
+
+    @structures
+    def input_channel_structures(self, name):
+        tag_map = {
+            0x2a286531: LazyBound(self.struct_0x2a286531),
+            0xafeb712e: LazyBound(self.struct_0xafeb712e),
+            0xf35aec28: LazyBound(self.struct_0xf35aec28),
+            0xee8c1e86: LazyBound(self.struct_0xee8c1e86),
+            0x5b934f9d: LazyBound(self.struct_0x5b934f9d)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_chat_photo of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x8953ad37, 'input_chat_photo')
+    def struct_0x8953ad37(self):
+        return ['id' / self.input_photo_structures('id')]
+
+    @constructor(0x1ca48f57, 'input_chat_photo_empty')
+    def struct_0x1ca48f57(self):
+        return []
+
+    @constructor(0xbdcdaec0, 'input_chat_uploaded_photo')
+    def struct_0xbdcdaec0(self):
+        return Struct(
+            'sname' / Computed('input_chat_uploaded_photo'),
+            'signature' / Hex(Const(0xbdcdaec0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_file=1,
+                                has_video=2,
+                                has_video_start_ts=4,
+                                has_video_emoji_markup=8),
+            'file' / If(this.flags.has_file, self.input_file_structures('file')),
+            'video' / If(this.flags.has_video, self.input_file_structures('video')),
+            'video_start_ts' / If(this.flags.has_video_start_ts, Double),
+            'video_emoji_markup' / If(this.flags.has_video_emoji_markup, self.video_size_structures('video_emoji_markup')))
+
+    @structures
+    def input_chat_photo_structures(self, name):
+        tag_map = {
+            0x8953ad37: LazyBound(self.struct_0x8953ad37),
+            0x1ca48f57: LazyBound(self.struct_0x1ca48f57),
+            0xbdcdaec0: LazyBound(self.struct_0xbdcdaec0)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_check_password_srp of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x9880f658, 'input_check_password_empty')
+    def struct_0x9880f658(self):
+        return []
+
+    @constructor(0xd27ff082, 'input_check_password_srp')
+    def struct_0xd27ff082(self):
+        return (
+            'srp_id' / Int64ul,
+            'a' / TBytes,
+            'm1' / TBytes)
+
+    @structures
+    def input_check_password_srp_structures(self, name):
+        tag_map = {
+            0x9880f658: LazyBound(self.struct_0x9880f658),
+            0xd27ff082: LazyBound(self.struct_0xd27ff082)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_dialog_peer of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xfcaafeb7, 'input_dialog_peer')
+    def struct_0xfcaafeb7(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x64600527, 'input_dialog_peer_folder')
+    def struct_0x64600527(self):
+        return ['folder_id' / Int32ul]
+
+    @structures
+    def input_dialog_peer_structures(self, name):
+        tag_map = {
+            0xfcaafeb7: LazyBound(self.struct_0xfcaafeb7),
+            0x64600527: LazyBound(self.struct_0x64600527)
+        }
+        return TLUnion(name, tag_map)
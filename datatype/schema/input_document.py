@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_document of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x72f0eaae, 'input_document_empty')
+    def struct_0x72f0eaae(self):
+        return []
+
+    @constructor(0x1abfb575, 'input_document')
+    def struct_0x1abfb575(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'file_reference' / TBytes)
+
+    @structures
+    def input_document_structures(self, name):
+        tag_map = {
+            0x72f0eaae: LazyBound(self.struct_0x72f0eaae),
+            0x1abfb575: LazyBound(self.struct_0x1abfb575)
+        }
+        return TLUnion(name, tag_map)
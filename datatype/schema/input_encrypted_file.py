@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_encrypted_file of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x5a17b5e5, 'input_encrypted_file')
+    def struct_0x5a17b5e5(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0x2dc173c8, 'input_encrypted_file_big_uploaded')
+    def struct_0x2dc173c8(self):
+        return (
+            'id' / Int64ul,
+            'parts' / Int32ul,
+            'key_fingerprint' / Int32ul)
+
+    @constructor(0x1837c364, 'input_encrypted_file_empty')
+    def struct_0x1837c364(self):
+        return []
+
+    @constructor(0x64bd0306, 'input_encrypted_file_uploaded')
+    def struct_0x64bd0306(self):
+        return (
+            'id' / Int64ul,
+            'parts' / Int32ul,
+            'md5_checksum' / TString,
+            'key_fingerprint' / Int32ul)
+
+    @structures
+    def input_encrypted_file_structures(self, name):
+        tag_map = {
+            0x5a17b5e5: LazyBound(self.struct_0x5a17b5e5),
+            0x2dc173c8: LazyBound(self.struct_0x2dc173c8),
+            0x1837c364: LazyBound(self.struct_0x1837c364),
+            0x64bd0306: LazyBound(self.struct_0x64bd0306)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_file of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xfa4f0bb5, 'input_file_big')
+    def struct_0xfa4f0bb5(self):
+        return (
+            'id' / Int64ul,
+            'parts' / Int32ul,
+            'name' / TString)
+
+    @constructor(0xf52ff27f, 'input_file')
+    def struct_0xf52ff27f(self):
+        return (
+            'id' / Int64ul,
+            'parts' / Int32ul,
+            'name' / TString,
+            'md5_checksum' / TString)
+
+    @constructor(0x62dc8b48, 'input_file_story_document')
+    def struct_0x62dc8b48(self):
+        return ['doc' / self.input_document_structures('doc')]
+
+    @structures
+    def input_file_structures(self, name):
+        tag_map = {
+            0xfa4f0bb5: LazyBound(self.struct_0xfa4f0bb5),
+            0xf52ff27f: LazyBound(self.struct_0xf52ff27f),
+            0x62dc8b48: LazyBound(self.struct_0x62dc8b48)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_file_location of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x40181ffe, 'input_photo_file_location')
+    def struct_0x40181ffe(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'file_reference' / TBytes,
+            'thumb_size' / TString)
+
+    @constructor(0xbad07584, 'input_document_file_location')
+    def struct_0xbad07584(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'file_reference' / TBytes,
+            'thumb_size' / TString)
+
+    @constructor(0x37257e99, 'input_peer_photo_file_location')
+    def struct_0x37257e99(self):
+        return Struct(
+            'sname' / Computed('input_peer_photo_file_location'),
+            'signature' / Hex(Const(0x37257e99, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_big=1),
+            'peer' / self.input_peer_structures('peer'),
+            'photo_id' / Int64ul)
+
+    @constructor(0xf5235d55, 'input_encrypted_file_location')
+    def struct_0xf5235d55(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0x9d84f3db, 'input_sticker_set_thumb')
+    def struct_0x9d84f3db(self):
+        return (
+            'stickerset' / self.input_sticker_set_structures('stickerset'),
+            'thumb_version' / Int32ul)
+
+    @constructor(0x0598a92a, 'input_group_call_stream')
+    def struct_0x0598a92a(self):
+        return Struct(
+            'sname' / Computed('input_group_call_stream'),
+            'signature' / Hex(Const(0x0598a92a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_video_channel=1),
+            'call' / self.struct_0xd8aa840f(),
+            'time_ms' / Int64ul,
+            'scale' / Int32ul,
+            'video_channel' / If(this.flags.has_video_channel, Int32ul),
+            'video_quality' / If(this.flags.has_video_channel, Int32ul))
+
+    @constructor(0xdfdaabe1, 'input_file_location')
+    def struct_0xdfdaabe1(self):
+        return (
+            'volume_id' / Int64ul,
+            'local_id' / Int32ul,
+            'secret' / Int64ul,
+            'file_reference' / TBytes)
+
+    @constructor(0xcbc7ee28, 'input_secure_file_location')
+    def struct_0xcbc7ee28(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @structures
+    def input_file_location_structures(self, name):
+        tag_map = {
+            0x40181ffe: LazyBound(self.struct_0x40181ffe),
+            0xbad07584: LazyBound(self.struct_0xbad07584),
+            0x37257e99: LazyBound(self.struct_0x37257e99),
+            0xf5235d55: LazyBound(self.struct_0xf5235d55),
+            0x9d84f3db: LazyBound(self.struct_0x9d84f3db),
+            0x0598a92a: LazyBound(self.struct_0x0598a92a),
+            0xdfdaabe1: LazyBound(self.struct_0xdfdaabe1),
+            0xcbc7ee28: LazyBound(self.struct_0xcbc7ee28)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_game of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xc331e80a, 'input_game_short_name')
+    def struct_0xc331e80a(self):
+        return (
+            'bot_id' / self.input_user_structures('bot_id'),
+            'short_name' / TString)
+
+    @constructor(0x032c3e77, 'input_game_id')
+    def struct_0x032c3e77(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @structures
+    def input_game_structures(self, name):
+        tag_map = {
+            0xc331e80a: LazyBound(self.struct_0xc331e80a),
+            0x032c3e77: LazyBound(self.struct_0x032c3e77)
+        }
+        return TLUnion(name, tag_map)
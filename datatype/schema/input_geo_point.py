@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_geo_point of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x48222faf, 'input_geo_point')
+    def struct_0x48222faf(self):
+        return Struct(
+            'sname' / Computed('input_geo_point'),
+            'signature' / Hex(Const(0x48222faf, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_accuracy_radius=1),
+            'lat' / Double,
+            'long' / Double,
+            'accuracy_radius' / If(this.flags.has_accuracy_radius, Int32ul))
+
+    @constructor(0xe4c123d6, 'input_geo_point_empty')
+    def struct_0xe4c123d6(self):
+        return []
+
+    @structures
+    def input_geo_point_structures(self, name):
+        tag_map = {
+            0x48222faf: LazyBound(self.struct_0x48222faf),
+            0xe4c123d6: LazyBound(self.struct_0xe4c123d6)
+        }
+        return TLUnion(name, tag_map)
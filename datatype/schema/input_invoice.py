@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_invoice of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x98986c0d, 'input_invoice_premium_gift_code')
+    def struct_0x98986c0d(self):
+        return (
+            'purpose' / self.input_store_payment_purpose_structures('purpose'),
+            'option' / self.struct_0x257e962b())
+
+    @constructor(0xc5b56859, 'input_invoice_message')
+    def struct_0xc5b56859(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul)
+
+    @constructor(0xc326caef, 'input_invoice_slug')
+    def struct_0xc326caef(self):
+        return ['slug' / TString]
+
+    @constructor(0x65f00ce3, 'input_invoice_stars')
+    def struct_0x65f00ce3(self):
+        return ['purpose' / self.input_store_payment_purpose_structures('purpose')]
+
+    @constructor(0x34e793f1, 'input_invoice_chat_invite_subscription')
+    def struct_0x34e793f1(self):
+        return ['hash' / TString]
+
+    @constructor(0xe8625e92, 'input_invoice_star_gift')
+    def struct_0xe8625e92(self):
+        return Struct(
+            'sname' / Computed('input_invoice_star_gift'),
+            'signature' / Hex(Const(0xe8625e92, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_hide_name=1,
+                                is_include_upgrade=4,
+                                has_message=2),
+            'peer' / self.input_peer_structures('peer'),
+            'gift_id' / Int64ul,
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()))
+
+    @constructor(0x4d818d5d, 'input_invoice_star_gift_upgrade')
+    def struct_0x4d818d5d(self):
+        return Struct(
+            'sname' / Computed('input_invoice_star_gift_upgrade'),
+            'signature' / Hex(Const(0x4d818d5d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_keep_original_details=1),
+            'stargift' / self.stars_input_saved_star_gift_structures('stargift'))
+
+    @constructor(0x4a5f5bd9, 'input_invoice_star_gift_transfer')
+    def struct_0x4a5f5bd9(self):
+        return (
+            'stargift' / self.stars_input_saved_star_gift_structures('stargift'),
+            'to_id' / self.input_peer_structures('to_id'))
+
+    @constructor(0xdabab2ef, 'input_invoice_premium_gift_stars')
+    def struct_0xdabab2ef(self):
+        return Struct(
+            'sname' / Computed('input_invoice_premium_gift_stars'),
+            'signature' / Hex(Const(0xdabab2ef, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_message=1),
+            'user_id' / self.input_user_structures('user_id'),
+            'months' / Int32ul,
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()))
+
+    @structures
+    def input_invoice_structures(self, name):
+        tag_map = {
+            0x98986c0d: LazyBound(self.struct_0x98986c0d),
+            0xc5b56859: LazyBound(self.struct_0xc5b56859),
+            0xc326caef: LazyBound(self.struct_0xc326caef),
+            0x65f00ce3: LazyBound(self.struct_0x65f00ce3),
+            0x34e793f1: LazyBound(self.struct_0x34e793f1),
+            0xe8625e92: LazyBound(self.struct_0xe8625e92),
+            0x4d818d5d: LazyBound(self.struct_0x4d818d5d),
+            0x4a5f5bd9: LazyBound(self.struct_0x4a5f5bd9),
+            0xdabab2ef: LazyBound(self.struct_0xdabab2ef)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x257e962b, 'premium_gift_code_option')
+    def struct_0x257e962b(self):
+        return Struct(
+            'sname' / Computed('premium_gift_code_option'),
+            'signature' / Hex(Const(0x257e962b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_store_product=1,
+                                has_store_quantity=2),
+            'users' / Int32ul,
+            'months' / Int32ul,
+            'store_product' / If(this.flags.has_store_product, TString),
+            'store_quantity' / If(this.flags.has_store_quantity, Int32ul),
+            'currency' / TString,
+            'amount' / Int64ul)
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_media of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf8ab7dfb, 'input_media_contact')
+    def struct_0xf8ab7dfb(self):
+        return (
+            'phone_number' / TString,
+            'first_name' / TString,
+            'last_name' / TString,
+            'vcard' / TString)
+
+    @constructor(0xa8763ab5, 'input_media_document')
+    def struct_0xa8763ab5(self):
+        return Struct(
+            'sname' / Computed('input_media_document'),
+            'signature' / Hex(Const(0xa8763ab5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_spoiler=4,
+                                has_video_cover=8,
+                                has_video_timestamp=16,
+                                has_ttl_seconds=1,
+                                has_query=2),
+            'id' / self.input_document_structures('id'),
+            'video_cover' / If(this.flags.has_video_cover, self.input_photo_structures('video_cover')),
+            'video_timestamp' / If(this.flags.has_video_timestamp, Int32ul),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul),
+            'query' / If(this.flags.has_query, TString))
+
+    @constructor(0xd33f43f3, 'input_media_game')
+    def struct_0xd33f43f3(self):
+        return ['id' / self.input_game_structures('id')]
+
+    @constructor(0xe66fbf7b, 'input_media_dice')
+    def struct_0xe66fbf7b(self):
+        return ['emoticon' / TString]
+
+    @constructor(0xf9c44144, 'input_media_geo_point')
+    def struct_0xf9c44144(self):
+        return ['geo_point' / self.input_geo_point_structures('geo_point')]
+
+    @constructor(0x779600f9, 'input_media_document_external')
+    def struct_0x779600f9(self):
+        return Struct(
+            'sname' / Computed('input_media_document_external'),
+            'signature' / Hex(Const(0x779600f9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_spoiler=2,
+                                has_ttl_seconds=1,
+                                has_video_cover=4,
+                                has_video_timestamp=8),
+            'url' / TString,
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul),
+            'video_cover' / If(this.flags.has_video_cover, self.input_photo_structures('video_cover')),
+            'video_timestamp' / If(this.flags.has_video_timestamp, Int32ul))
+
+    @constructor(0x9664f57f, 'input_media_empty')
+    def struct_0x9664f57f(self):
+        return []
+
+    @constructor(0x0f94e5f1, 'input_media_poll')
+    def struct_0x0f94e5f1(self):
+        return Struct(
+            'sname' / Computed('input_media_poll'),
+            'signature' / Hex(Const(0x0f94e5f1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_correct_answers=1,
+                                has_solution=2),
+            'poll' / self.poll_structures('poll'),
+            'correct_answers' / If(this.flags.has_correct_answers, self.vector(TBytes, 'correct_answers')),
+            'solution' / If(this.flags.has_solution, TString),
+            'solution_entities' / If(this.flags.has_solution, self.vector(self.message_entity_structures('solution_entities'), 'solution_entities')))
+
+    @constructor(0x1e287d04, 'input_media_uploaded_photo')
+    def struct_0x1e287d04(self):
+        return Struct(
+            'sname' / Computed('input_media_uploaded_photo'),
+            'signature' / Hex(Const(0x1e287d04, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_spoiler=4,
+                                has_stickers=1,
+                                has_ttl_seconds=2),
+            'file' / self.input_file_structures('file'),
+            'stickers' / If(this.flags.has_stickers, self.vector(self.input_document_structures('stickers'), 'stickers')),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0xc13d1c11, 'input_media_venue')
+    def struct_0xc13d1c11(self):
+        return (
+            'geo_point' / self.input_geo_point_structures('geo_point'),
+            'title' / TString,
+            'address' / TString,
+            'provider' / TString,
+            'venue_id' / TString,
+            'venue_type' / TString)
+
+    @constructor(0x971fa843, 'input_media_geo_live')
+    def struct_0x971fa843(self):
+        return Struct(
+            'sname' / Computed('input_media_geo_live'),
+            'signature' / Hex(Const(0x971fa843, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_stopped=1,
+                                has_heading=4,
+                                has_period=2,
+                                has_proximity_notification_radius=8),
+            'geo_point' / self.input_geo_point_structures('geo_point'),
+            'heading' / If(this.flags.has_heading, Int32ul),
+            'period' / If(this.flags.has_period, Int32ul),
+            'proximity_notification_radius' / If(this.flags.has_proximity_notification_radius, Int32ul))
+
+    @constructor(0x037c9330, 'input_media_uploaded_document')
+    def struct_0x037c9330(self):
+        return Struct(
+            'sname' / Computed('input_media_uploaded_document'),
+            'signature' / Hex(Const(0x037c9330, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_nosound_video=8,
+                                is_force_file=16,
+                                is_spoiler=32,
+                                has_thumb=4,
+                                has_stickers=1,
+                                has_video_cover=64,
+                                has_video_timestamp=128,
+                                has_ttl_seconds=2),
+            'file' / self.input_file_structures('file'),
+            'thumb' / If(this.flags.has_thumb, self.input_file_structures('thumb')),
+            'mime_type' / TString,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'),
+            'stickers' / If(this.flags.has_stickers, self.vector(self.input_document_structures('stickers'), 'stickers')),
+            'video_cover' / If(this.flags.has_video_cover, self.input_photo_structures('video_cover')),
+            'video_timestamp' / If(this.flags.has_video_timestamp, Int32ul),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0xe5bbfe1a, 'input_media_photo_external')
+    def struct_0xe5bbfe1a(self):
+        return Struct(
+            'sname' / Computed('input_media_photo_external'),
+            'signature' / Hex(Const(0xe5bbfe1a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_spoiler=2,
+                                has_ttl_seconds=1),
+            'url' / TString,
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0xb3ba0635, 'input_media_photo')
+    def struct_0xb3ba0635(self):
+        return Struct(
+            'sname' / Computed('input_media_photo'),
+            'signature' / Hex(Const(0xb3ba0635, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_spoiler=2,
+                                has_ttl_seconds=1),
+            'id' / self.input_photo_structures('id'),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0xc21b8849, 'input_media_web_page')
+    def struct_0xc21b8849(self):
+        return Struct(
+            'sname' / Computed('input_media_web_page'),
+            'signature' / Hex(Const(0xc21b8849, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_force_large_media=1,
+                                is_force_small_media=2,
+                                is_optional=4),
+            'url' / TString)
+
+    @constructor(0xaa661fc3, 'input_media_paid_media_layer186')
+    def struct_0xaa661fc3(self):
+        return (
+            'stars_amount' / Int64ul,
+            'extended_media' / self.vector(self.input_media_structures('extended_media'), 'extended_media'))
+
+    @constructor(0xc4103386, 'input_media_paid_media')
+    def struct_0xc4103386(self):
+        return Struct(
+            'sname' / Computed('input_media_paid_media'),
+            'signature' / Hex(Const(0xc4103386, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_payload=1),
+            'stars_amount' / Int64ul,
+            'extended_media' / self.vector(self.input_media_structures('extended_media'), 'extended_media'),
+            'payload' / If(this.flags.has_payload, TString))
+
+    @structures
+    def input_media_structures(self, name):
+        tag_map = {
+            0xf8ab7dfb: LazyBound(self.struct_0xf8ab7dfb),
+            0xa8763ab5: LazyBound(self.struct_0xa8763ab5),
+            0xd33f43f3: LazyBound(self.struct_0xd33f43f3),
+            0xe66fbf7b: LazyBound(self.struct_0xe66fbf7b),
+            0xf9c44144: LazyBound(self.struct_0xf9c44144),
+            0x779600f9: LazyBound(self.struct_0x779600f9),
+            0x9664f57f: LazyBound(self.struct_0x9664f57f),
+            0x0f94e5f1: LazyBound(self.struct_0x0f94e5f1),
+            0x1e287d04: LazyBound(self.struct_0x1e287d04),
+            0xc13d1c11: LazyBound(self.struct_0xc13d1c11),
+            0x971fa843: LazyBound(self.struct_0x971fa843),
+            0x037c9330: LazyBound(self.struct_0x037c9330),
+            0xe5bbfe1a: LazyBound(self.struct_0xe5bbfe1a),
+            0xb3ba0635: LazyBound(self.struct_0xb3ba0635),
+            0xc21b8849: LazyBound(self.struct_0xc21b8849),
+            0xaa661fc3: LazyBound(self.struct_0xaa661fc3),
+            0xc4103386: LazyBound(self.struct_0xc4103386)
+        }
+        return TLUnion(name, tag_map)
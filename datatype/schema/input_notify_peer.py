@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_notify_peer of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x4a95e84e, 'input_notify_chats')
+    def struct_0x4a95e84e(self):
+        return []
+
+    @constructor(0xb8bc5b0c, 'input_notify_peer')
+    def struct_0xb8bc5b0c(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x193b4417, 'input_notify_users')
+    def struct_0x193b4417(self):
+        return []
+
+    @constructor(0xb1db7c7e, 'input_notify_broadcasts')
+    def struct_0xb1db7c7e(self):
+        return []
+
+    @constructor(0x5c467992, 'input_notify_forum_topic')
+    def struct_0x5c467992(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'top_msg_id' / Int32ul)
+
+    @structures
+    def input_notify_peer_structures(self, name):
+        tag_map = {
+            0x4a95e84e: LazyBound(self.struct_0x4a95e84e),
+            0xb8bc5b0c: LazyBound(self.struct_0xb8bc5b0c),
+            0x193b4417: LazyBound(self.struct_0x193b4417),
+            0xb1db7c7e: LazyBound(self.struct_0xb1db7c7e),
+            0x5c467992: LazyBound(self.struct_0x5c467992)
+        }
+        return TLUnion(name, tag_map)
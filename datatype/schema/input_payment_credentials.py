@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_payment_credentials of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x3417d728, 'input_payment_credentials')
+    def struct_0x3417d728(self):
+        return Struct(
+            'sname' / Computed('input_payment_credentials'),
+            'signature' / Hex(Const(0x3417d728, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_save=1),
+            'data' / self.struct_0x7d748d04())
+
+    @constructor(0x8ac32801, 'input_payment_credentials_google_pay')
+    def struct_0x8ac32801(self):
+        return ['payment_token' / self.struct_0x7d748d04()]
+
+    @constructor(0xc10eb2cf, 'input_payment_credentials_saved')
+    def struct_0xc10eb2cf(self):
+        return (
+            'id' / TString,
+            'tmp_password' / TBytes)
+
+    @structures
+    def input_payment_credentials_structures(self, name):
+        tag_map = {
+            0x3417d728: LazyBound(self.struct_0x3417d728),
+            0x8ac32801: LazyBound(self.struct_0x8ac32801),
+            0xc10eb2cf: LazyBound(self.struct_0xc10eb2cf)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_peer of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x7da07ec9, 'input_peer_self')
+    def struct_0x7da07ec9(self):
+        return []
+
+    @constructor(0xa87b0a1c, 'input_peer_user_from_message')
+    def struct_0xa87b0a1c(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'user_id' / Int64ul)
+
+    @constructor(0xdde8a54c, 'input_peer_user')
+    def struct_0xdde8a54c(self):
+        return (
+            'user_id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0x179be863, 'input_peer_chat_layer131')
+    def struct_0x179be863(self):
+        return ['chat_id' / Int32ul]
+
+    @constructor(0x27bcbbfc, 'input_peer_channel')
+    def struct_0x27bcbbfc(self):
+        return (
+            'channel_id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0x7b8e7de6, 'input_peer_user_layer131')
+    def struct_0x7b8e7de6(self):
+        return (
+            'user_id' / Int32ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0x7f3b18ea, 'input_peer_empty')
+    def struct_0x7f3b18ea(self):
+        return []
+
+    @constructor(0xbd2a0840, 'input_peer_channel_from_message')
+    def struct_0xbd2a0840(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'channel_id' / Int64ul)
+
+    @constructor(0x35a95cb9, 'input_peer_chat')
+    def struct_0x35a95cb9(self):
+        return ['chat_id' / Int64ul]
+
+    @constructor(0x20adaef8, 'input_peer_channel_layer131')
+    def struct_0x20adaef8(self):
+        return (
+            'channel_id' / Int32ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0x9c95f7bb, 'input_peer_channel_from_message_layer131')
+    def struct_0x9c95f7bb(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'channel_id' / Int32ul)
+
+    @constructor(0x17bae2e6, 'input_peer_user_from_message_layer131')
+    def struct_0x17bae2e6(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'user_id' / Int32ul)
+
+    @structures
+    def input_peer_structures(self, name):
+        tag_map = {
+            0x7da07ec9: LazyBound(self.struct_0x7da07ec9),
+            0xa87b0a1c: LazyBound(self.struct_0xa87b0a1c),
+            0xdde8a54c: LazyBound(self.struct_0xdde8a54c),
+            0x179be863: LazyBound(self.struct_0x179be863),
+            0x27bcbbfc: LazyBound(self.struct_0x27bcbbfc),
+            0x7b8e7de6: LazyBound(self.struct_0x7b8e7de6),
+            0x7f3b18ea: LazyBound(self.struct_0x7f3b18ea),
+            0xbd2a0840: LazyBound(self.struct_0xbd2a0840),
+            0x35a95cb9: LazyBound(self.struct_0x35a95cb9),
+            0x20adaef8: LazyBound(self.struct_0x20adaef8),
+            0x9c95f7bb: LazyBound(self.struct_0x9c95f7bb),
+            0x17bae2e6: LazyBound(self.struct_0x17bae2e6)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_photo of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x1cd7bf0d, 'input_photo_empty')
+    def struct_0x1cd7bf0d(self):
+        return []
+
+    @constructor(0x3bb3b94a, 'input_photo')
+    def struct_0x3bb3b94a(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'file_reference' / TBytes)
+
+    @structures
+    def input_photo_structures(self, name):
+        tag_map = {
+            0x1cd7bf0d: LazyBound(self.struct_0x1cd7bf0d),
+            0x3bb3b94a: LazyBound(self.struct_0x3bb3b94a)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_privacy_key of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x4f96cb18, 'input_privacy_key_status_timestamp')
+    def struct_0x4f96cb18(self):
+        return []
+
+    @constructor(0xbdfb0426, 'input_privacy_key_chat_invite')
+    def struct_0xbdfb0426(self):
+        return []
+
+    @constructor(0xfabadc5f, 'input_privacy_key_phone_call')
+    def struct_0xfabadc5f(self):
+        return []
+
+    @constructor(0xa4dd4c08, 'input_privacy_key_forwards')
+    def struct_0xa4dd4c08(self):
+        return []
+
+    @constructor(0x5719bacc, 'input_privacy_key_profile_photo')
+    def struct_0x5719bacc(self):
+        return []
+
+    @constructor(0x0352dafa, 'input_privacy_key_phone_number')
+    def struct_0x0352dafa(self):
+        return []
+
+    @constructor(0xd1219bdd, 'input_privacy_key_added_by_phone')
+    def struct_0xd1219bdd(self):
+        return []
+
+    @constructor(0xaee69d68, 'input_privacy_key_voice_messages')
+    def struct_0xaee69d68(self):
+        return []
+
+    @constructor(0xdb9e70d2, 'input_privacy_key_phonep2p')
+    def struct_0xdb9e70d2(self):
+        return []
+
+    @constructor(0x3823cc40, 'input_privacy_key_about')
+    def struct_0x3823cc40(self):
+        return []
+
+    @constructor(0xd65a11cc, 'input_privacy_key_birthday')
+    def struct_0xd65a11cc(self):
+        return []
+
+    @constructor(0xe1732341, 'input_privacy_key_star_gifts_auto_save')
+    def struct_0xe1732341(self):
+        return []
+
+    @constructor(0xbdc597b4, 'input_privacy_key_no_paid_messages')
+    def struct_0xbdc597b4(self):
+        return []
+
+    @structures
+    def input_privacy_key_structures(self, name):
+        tag_map = {
+            0x4f96cb18: LazyBound(self.struct_0x4f96cb18),
+            0xbdfb0426: LazyBound(self.struct_0xbdfb0426),
+            0xfabadc5f: LazyBound(self.struct_0xfabadc5f),
+            0xa4dd4c08: LazyBound(self.struct_0xa4dd4c08),
+            0x5719bacc: LazyBound(self.struct_0x5719bacc),
+            0x0352dafa: LazyBound(self.struct_0x0352dafa),
+            0xd1219bdd: LazyBound(self.struct_0xd1219bdd),
+            0xaee69d68: LazyBound(self.struct_0xaee69d68),
+            0xdb9e70d2: LazyBound(self.struct_0xdb9e70d2),
+            0x3823cc40: LazyBound(self.struct_0x3823cc40),
+            0xd65a11cc: LazyBound(self.struct_0xd65a11cc),
+            0xe1732341: LazyBound(self.struct_0xe1732341),
+            0xbdc597b4: LazyBound(self.struct_0xbdc597b4)
+        }
+        return TLUnion(name, tag_map)
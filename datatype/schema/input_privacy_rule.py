@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_privacy_rule of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd66b66c9, 'input_privacy_value_disallow_all')
+    def struct_0xd66b66c9(self):
+        return []
+
+    @constructor(0x90110467, 'input_privacy_value_disallow_users')
+    def struct_0x90110467(self):
+        return ['users' / self.vector(self.input_user_structures('users'), 'users')]
+
+    @constructor(0x0d09e07b, 'input_privacy_value_allow_contacts')
+    def struct_0x0d09e07b(self):
+        return []
+
+    @constructor(0x840649cf, 'input_privacy_value_allow_chat_participants')
+    def struct_0x840649cf(self):
+        return ['chats' / self.vector(Int64ul, 'chats')]
+
+    @constructor(0x0ba52007, 'input_privacy_value_disallow_contacts')
+    def struct_0x0ba52007(self):
+        return []
+
+    @constructor(0x184b35ce, 'input_privacy_value_allow_all')
+    def struct_0x184b35ce(self):
+        return []
+
+    @constructor(0x131cc67f, 'input_privacy_value_allow_users')
+    def struct_0x131cc67f(self):
+        return ['users' / self.vector(self.input_user_structures('users'), 'users')]
+
+    @constructor(0xe94f0f86, 'input_privacy_value_disallow_chat_participants')
+    def struct_0xe94f0f86(self):
+        return ['chats' / self.vector(Int64ul, 'chats')]
+
+    @constructor(0x2f453e49, 'input_privacy_value_allow_close_friends')
+    def struct_0x2f453e49(self):
+        return []
+
+    @constructor(0x77cdc9f1, 'input_privacy_value_allow_premium')
+    def struct_0x77cdc9f1(self):
+        return []
+
+    @constructor(0x5a4fcce5, 'input_privacy_value_allow_bots')
+    def struct_0x5a4fcce5(self):
+        return []
+
+    @constructor(0xc4e57915, 'input_privacy_value_disallow_bots')
+    def struct_0xc4e57915(self):
+        return []
+
+    @structures
+    def input_privacy_rule_structures(self, name):
+        tag_map = {
+            0xd66b66c9: LazyBound(self.struct_0xd66b66c9),
+            0x90110467: LazyBound(self.struct_0x90110467),
+            0x0d09e07b: LazyBound(self.struct_0x0d09e07b),
+            0x840649cf: LazyBound(self.struct_0x840649cf),
+            0x0ba52007: LazyBound(self.struct_0x0ba52007),
+            0x184b35ce: LazyBound(self.struct_0x184b35ce),
+            0x131cc67f: LazyBound(self.struct_0x131cc67f),
+            0xe94f0f86: LazyBound(self.struct_0xe94f0f86),
+            0x2f453e49: LazyBound(self.struct_0x2f453e49),
+            0x77cdc9f1: LazyBound(self.struct_0x77cdc9f1),
+            0x5a4fcce5: LazyBound(self.struct_0x5a4fcce5),
+            0xc4e57915: LazyBound(self.struct_0xc4e57915)
+        }
+        return TLUnion(name, tag_map)
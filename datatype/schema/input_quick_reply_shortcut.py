@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_quick_reply_shortcut of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x24596d41, 'input_quick_reply_shortcut')
+    def struct_0x24596d41(self):
+        return ['shortcut' / TString]
+
+    @constructor(0x01190cf1, 'input_quick_reply_shortcut_id')
+    def struct_0x01190cf1(self):
+        return ['shortcut_id' / Int32ul]
+
+    @structures
+    def input_quick_reply_shortcut_structures(self, name):
+        tag_map = {
+            0x24596d41: LazyBound(self.struct_0x24596d41),
+            0x01190cf1: LazyBound(self.struct_0x01190cf1)
+        }
+        return TLUnion(name, tag_map)
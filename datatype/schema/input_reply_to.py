@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_reply_to of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x22c0f6d5, 'input_reply_to_message')
+    def struct_0x22c0f6d5(self):
+        return Struct(
+            'sname' / Computed('input_reply_to_message'),
+            'signature' / Hex(Const(0x22c0f6d5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_top_msg_id=1,
+                                has_reply_to_peer_id=2,
+                                has_quote_text=4,
+                                has_quote_entities=8,
+                                has_quote_offset=16),
+            'reply_to_msg_id' / Int32ul,
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'reply_to_peer_id' / If(this.flags.has_reply_to_peer_id, self.input_peer_structures('reply_to_peer_id')),
+            'quote_text' / If(this.flags.has_quote_text, TString),
+            'quote_entities' / If(this.flags.has_quote_entities, self.vector(self.message_entity_structures('quote_entities'), 'quote_entities')),
+            'quote_offset' / If(this.flags.has_quote_offset, Int32ul))
+
+    @constructor(0x073ec805, 'input_reply_to_message_layer166')
+    def struct_0x073ec805(self):
+        return Struct(
+            'sname' / Computed('input_reply_to_message_layer166'),
+            'signature' / Hex(Const(0x073ec805, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_top_msg_id=1,
+                                has_reply_to_peer_id=2,
+                                has_quote_text=4,
+                                has_quote_entities=8),
+            'reply_to_msg_id' / Int32ul,
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'reply_to_peer_id' / If(this.flags.has_reply_to_peer_id, self.input_peer_structures('reply_to_peer_id')),
+            'quote_text' / If(this.flags.has_quote_text, TString),
+            'quote_entities' / If(this.flags.has_quote_entities, self.vector(self.message_entity_structures('quote_entities'), 'quote_entities')))
+
+    @constructor(0x5881323a, 'input_reply_to_story')
+    def struct_0x5881323a(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'story_id' / Int32ul)
+
+    @structures
+    def input_reply_to_structures(self, name):
+        tag_map = {
+            0x22c0f6d5: LazyBound(self.struct_0x22c0f6d5),
+            0x073ec805: LazyBound(self.struct_0x073ec805),
+            0x5881323a: LazyBound(self.struct_0x5881323a)
+        }
+        return TLUnion(name, tag_map)
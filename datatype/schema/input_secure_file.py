@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_secure_file of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x3334b0f0, 'input_secure_file_uploaded')
+    def struct_0x3334b0f0(self):
+        return (
+            'id' / Int64ul,
+            'parts' / Int32ul,
+            'md5_checksum' / TString,
+            'file_hash' / TBytes,
+            'secret' / TBytes)
+
+    @constructor(0x5367e5be, 'input_secure_file')
+    def struct_0x5367e5be(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @structures
+    def input_secure_file_structures(self, name):
+        tag_map = {
+            0x3334b0f0: LazyBound(self.struct_0x3334b0f0),
+            0x5367e5be: LazyBound(self.struct_0x5367e5be)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_sticker_set of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xffb62b95, 'input_sticker_set_empty')
+    def struct_0xffb62b95(self):
+        return []
+
+    @constructor(0x9de7a269, 'input_sticker_set_id')
+    def struct_0x9de7a269(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0x861cc8a0, 'input_sticker_set_short_name')
+    def struct_0x861cc8a0(self):
+        return ['short_name' / TString]
+
+    @constructor(0x028703c8, 'input_sticker_set_animated_emoji')
+    def struct_0x028703c8(self):
+        return []
+
+    @constructor(0xe67f520e, 'input_sticker_set_dice')
+    def struct_0xe67f520e(self):
+        return ['emoticon' / TString]
+
+    @constructor(0xc88b3b02, 'input_sticker_set_premium_gifts')
+    def struct_0xc88b3b02(self):
+        return []
+
+    @constructor(0x29d0f5ee, 'input_sticker_set_emoji_default_statuses')
+    def struct_0x29d0f5ee(self):
+        return []
+
+    @constructor(0x04c4d4ce, 'input_sticker_set_emoji_generic_animations')
+    def struct_0x04c4d4ce(self):
+        return []
+
+    @constructor(0x44c1f8e9, 'input_sticker_set_emoji_default_topic_icons')
+    def struct_0x44c1f8e9(self):
+        return []
+
+    @constructor(0x49748553, 'input_sticker_set_emoji_channel_default_statuses')
+    def struct_0x49748553(self):
+        return []
+
+    @structures
+    def input_sticker_set_structures(self, name):
+        tag_map = {
+            0xffb62b95: LazyBound(self.struct_0xffb62b95),
+            0x9de7a269: LazyBound(self.struct_0x9de7a269),
+            0x861cc8a0: LazyBound(self.struct_0x861cc8a0),
+            0x028703c8: LazyBound(self.struct_0x028703c8),
+            0xe67f520e: LazyBound(self.struct_0xe67f520e),
+            0xc88b3b02: LazyBound(self.struct_0xc88b3b02),
+            0x29d0f5ee: LazyBound(self.struct_0x29d0f5ee),
+            0x04c4d4ce: LazyBound(self.struct_0x04c4d4ce),
+            0x44c1f8e9: LazyBound(self.struct_0x44c1f8e9),
+            0x49748553: LazyBound(self.struct_0x49748553)
+        }
+        return TLUnion(name, tag_map)
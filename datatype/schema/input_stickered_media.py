@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_stickered_media of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0438865b, 'input_stickered_media_document')
+    def struct_0x0438865b(self):
+        return ['id' / self.input_document_structures('id')]
+
+    @constructor(0x4a992157, 'input_stickered_media_photo')
+    def struct_0x4a992157(self):
+        return ['id' / self.input_photo_structures('id')]
+
+    @structures
+    def input_stickered_media_structures(self, name):
+        tag_map = {
+            0x0438865b: LazyBound(self.struct_0x0438865b),
+            0x4a992157: LazyBound(self.struct_0x4a992157)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_store_payment_purpose of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x616f7fe8, 'input_store_payment_gift_premium')
+    def struct_0x616f7fe8(self):
+        return (
+            'user_id' / self.input_user_structures('user_id'),
+            'currency' / TString,
+            'amount' / Int64ul)
+
+    @constructor(0xfb790393, 'input_store_payment_premium_gift_code')
+    def struct_0xfb790393(self):
+        return Struct(
+            'sname' / Computed('input_store_payment_premium_gift_code'),
+            'signature' / Hex(Const(0xfb790393, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_boost_peer=1,
+                                has_message=2),
+            'users' / self.vector(self.input_user_structures('users'), 'users'),
+            'boost_peer' / If(this.flags.has_boost_peer, self.input_peer_structures('boost_peer')),
+            'currency' / TString,
+            'amount' / Int64ul,
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()))
+
+    @constructor(0xa6751e66, 'input_store_payment_premium_subscription')
+    def struct_0xa6751e66(self):
+        return Struct(
+            'sname' / Computed('input_store_payment_premium_subscription'),
+            'signature' / Hex(Const(0xa6751e66, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_restore=1,
+                                is_upgrade=2))
+
+    @constructor(0x160544ca, 'input_store_payment_premium_giveaway')
+    def struct_0x160544ca(self):
+        return Struct(
+            'sname' / Computed('input_store_payment_premium_giveaway'),
+            'signature' / Hex(Const(0x160544ca, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_only_new_subscribers=1,
+                                is_winners_are_visible=8,
+                                has_additional_peers=2,
+                                has_countries_iso2=4,
+                                has_prize_description=16),
+            'boost_peer' / self.input_peer_structures('boost_peer'),
+            'additional_peers' / If(this.flags.has_additional_peers, self.vector(self.input_peer_structures('additional_peers'), 'additional_peers')),
+            'countries_iso2' / If(this.flags.has_countries_iso2, self.vector(TString, 'countries_iso2')),
+            'prize_description' / If(this.flags.has_prize_description, TString),
+            'random_id' / Int64ul,
+            'until_date' / TTimestamp,
+            'currency' / TString,
+            'amount' / Int64ul)
+
+    @constructor(0x1d741ef7, 'input_store_payment_stars_gift')
+    def struct_0x1d741ef7(self):
+        return (
+            'user_id' / self.input_user_structures('user_id'),
+            'stars' / Int64ul,
+            'currency' / TString,
+            'amount' / Int64ul)
+
+    @constructor(0xdddd0f56, 'input_store_payment_stars_topup')
+    def struct_0xdddd0f56(self):
+        return (
+            'stars' / Int64ul,
+            'currency' / TString,
+            'amount' / Int64ul)
+
+    @constructor(0x751f08fa, 'input_store_payment_stars_giveaway')
+    def struct_0x751f08fa(self):
+        return Struct(
+            'sname' / Computed('input_store_payment_stars_giveaway'),
+            'signature' / Hex(Const(0x751f08fa, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_only_new_subscribers=1,
+                                is_winners_are_visible=8,
+                                has_additional_peers=2,
+                                has_countries_iso2=4,
+                                has_prize_description=16),
+            'stars' / Int64ul,
+            'boost_peer' / self.input_peer_structures('boost_peer'),
+            'additional_peers' / If(this.flags.has_additional_peers, self.vector(self.input_peer_structures('additional_peers'), 'additional_peers')),
+            'countries_iso2' / If(this.flags.has_countries_iso2, self.vector(TString, 'countries_iso2')),
+            'prize_description' / If(this.flags.has_prize_description, TString),
+            'random_id' / Int64ul,
+            'until_date' / TTimestamp,
+            'currency' / TString,
+            'amount' / Int64ul,
+            'users' / Int32ul)
+
+    @structures
+    def input_store_payment_purpose_structures(self, name):
+        tag_map = {
+            0x616f7fe8: LazyBound(self.struct_0x616f7fe8),
+            0xfb790393: LazyBound(self.struct_0xfb790393),
+            0xa6751e66: LazyBound(self.struct_0xa6751e66),
+            0x160544ca: LazyBound(self.struct_0x160544ca),
+            0x1d741ef7: LazyBound(self.struct_0x1d741ef7),
+            0xdddd0f56: LazyBound(self.struct_0xdddd0f56),
+            0x751f08fa: LazyBound(self.struct_0x751f08fa)
+        }
+        return TLUnion(name, tag_map)
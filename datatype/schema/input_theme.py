@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_theme of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf5890df1, 'input_theme_slug')
+    def struct_0xf5890df1(self):
+        return ['slug' / TString]
+
+    @constructor(0x3c5693e9, 'input_theme')
+    def struct_0x3c5693e9(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @structures
+    def input_theme_structures(self, name):
+        tag_map = {
+            0xf5890df1: LazyBound(self.struct_0xf5890df1),
+            0x3c5693e9: LazyBound(self.struct_0x3c5693e9)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_user of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf7c1b13f, 'input_user_self')
+    def struct_0xf7c1b13f(self):
+        return []
+
+    @constructor(0xf21158c6, 'input_user')
+    def struct_0xf21158c6(self):
+        return (
+            'user_id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0xb98886cf, 'input_user_empty')
+    def struct_0xb98886cf(self):
+        return []
+
+    @constructor(0x1da448e2, 'input_user_from_message')
+    def struct_0x1da448e2(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'user_id' / Int64ul)
+
+    @structures
+    def input_user_structures(self, name):
+        tag_map = {
+            0xf7c1b13f: LazyBound(self.struct_0xf7c1b13f),
+            0xf21158c6: LazyBound(self.struct_0xf21158c6),
+            0xb98886cf: LazyBound(self.struct_0xb98886cf),
+            0x1da448e2: LazyBound(self.struct_0x1da448e2)
+        }
+        return TLUnion(name, tag_map)
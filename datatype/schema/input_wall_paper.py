@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_wall_paper of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xe630b979, 'input_wall_paper')
+    def struct_0xe630b979(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0x967a462e, 'input_wall_paper_no_file')
+    def struct_0x967a462e(self):
+        return ['id' / Int64ul]
+
+    @constructor(0x72091c80, 'input_wall_paper_slug')
+    def struct_0x72091c80(self):
+        return ['slug' / TString]
+
+    @structures
+    def input_wall_paper_structures(self, name):
+        tag_map = {
+            0xe630b979: LazyBound(self.struct_0xe630b979),
+            0x967a462e: LazyBound(self.struct_0x967a462e),
+            0x72091c80: LazyBound(self.struct_0x72091c80)
+        }
+        return TLUnion(name, tag_map)
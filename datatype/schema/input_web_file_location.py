@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group input_web_file_location of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x9f2221c9, 'input_web_file_geo_point_location')
+    def struct_0x9f2221c9(self):
+        return (
+            'geo_point' / self.input_geo_point_structures('geo_point'),
+            'access_hash' / Int64ul,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'zoom' / Int32ul,
+            'scale' / Int32ul)
+
+    @constructor(0xc239d686, 'input_web_file_location')
+    def struct_0xc239d686(self):
+        return (
+            'url' / TString,
+            'access_hash' / Int64ul)
+
+    @structures
+    def input_web_file_location_structures(self, name):
+        tag_map = {
+            0x9f2221c9: LazyBound(self.struct_0x9f2221c9),
+            0xc239d686: LazyBound(self.struct_0xc239d686)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group invoice of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x049ee584, 'invoice')
+    def struct_0x049ee584(self):
+        return Struct(
+            'sname' / Computed('invoice'),
+            'signature' / Hex(Const(0x049ee584, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_test=1,
+                                is_name_requested=2,
+                                is_phone_requested=4,
+                                is_email_requested=8,
+                                is_shipping_address_requested=16,
+                                is_flexible=32,
+                                is_phone_to_provider=64,
+                                is_email_to_provider=128,
+                                is_recurring=512,
+                                has_max_tip_amount=256,
+                                has_terms_url=1024,
+                                has_subscription_period=2048),
+            'currency' / TString,
+            'prices' / self.vector(self.struct_0xcb296bf8(), 'prices'),
+            'max_tip_amount' / If(this.flags.has_max_tip_amount, Int64ul),
+            'suggested_tip_amounts' / If(this.flags.has_max_tip_amount, self.vector(Int64ul, 'suggested_tip_amounts')),
+            'terms_url' / If(this.flags.has_terms_url, TString),
+            'subscription_period' / If(this.flags.has_subscription_period, Int32ul))
+
+    @constructor(0x5db95a15, 'invoice_layer193')
+    def struct_0x5db95a15(self):
+        return Struct(
+            'sname' / Computed('invoice_layer193'),
+            'signature' / Hex(Const(0x5db95a15, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_test=1,
+                                is_name_requested=2,
+                                is_phone_requested=4,
+                                is_email_requested=8,
+                                is_shipping_address_requested=16,
+                                is_flexible=32,
+                                is_phone_to_provider=64,
+                                is_email_to_provider=128,
+                                is_recurring=512,
+                                has_max_tip_amount=256,
+                                has_terms_url=1024),
+            'currency' / TString,
+            'prices' / self.vector(self.struct_0xcb296bf8(), 'prices'),
+            'max_tip_amount' / If(this.flags.has_max_tip_amount, Int64ul),
+            'suggested_tip_amounts' / If(this.flags.has_max_tip_amount, self.vector(Int64ul, 'suggested_tip_amounts')),
+            'terms_url' / If(this.flags.has_terms_url, TString))
+
+    @constructor(0x3e85a91b, 'invoice_layer163')
+    def struct_0x3e85a91b(self):
+        return Struct(
+            'sname' / Computed('invoice_layer163'),
+            'signature' / Hex(Const(0x3e85a91b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_test=1,
+                                is_name_requested=2,
+                                is_phone_requested=4,
+                                is_email_requested=8,
+                                is_shipping_address_requested=16,
+                                is_flexible=32,
+                                is_phone_to_provider=64,
+                                is_email_to_provider=128,
+                                is_recurring=512,
+                                has_max_tip_amount=256),
+            'currency' / TString,
+            'prices' / self.vector(self.struct_0xcb296bf8(), 'prices'),
+            'max_tip_amount' / If(this.flags.has_max_tip_amount, Int64ul),
+            'suggested_tip_amounts' / If(this.flags.has_max_tip_amount, self.vector(Int64ul, 'suggested_tip_amounts')),
+            'terms_url' / If(this.flags.is_recurring, TString))
+
+    @structures
+    def invoice_structures(self, name):
+        tag_map = {
+            0x049ee584: LazyBound(self.struct_0x049ee584),
+            0x5db95a15: LazyBound(self.struct_0x5db95a15),
+            0x3e85a91b: LazyBound(self.struct_0x3e85a91b)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xcb296bf8, 'labeled_price')
+    def struct_0xcb296bf8(self):
+        return (
+            'label' / TString,
+            'amount' / Int64ul)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group json_value of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xc7345e6a, 'json_bool')
+    def struct_0xc7345e6a(self):
+        return ['value' / TBool]
+
+    @constructor(0x3f6d7b68, 'json_null')
+    def struct_0x3f6d7b68(self):
+        return []
+
+    @constructor(0xb71e767a, 'json_string')
+    def struct_0xb71e767a(self):
+        return ['value' / TString]
+
+    @constructor(0xf7444763, 'json_array')
+    def struct_0xf7444763(self):
+        return ['value' / self.vector(self.json_value_structures('value'), 'value')]
+
+    @constructor(0x99c1d49d, 'json_object')
+    def struct_0x99c1d49d(self):
+        return ['value' / self.vector(self.struct_0xc0de1bd9(), 'value')]
+
+    @constructor(0x2be0dfa4, 'json_number')
+    def struct_0x2be0dfa4(self):
+        return ['value' / Double]
+
+    @structures
+    def json_value_structures(self, name):
+        tag_map = {
+            0xc7345e6a: LazyBound(self.struct_0xc7345e6a),
+            0x3f6d7b68: LazyBound(self.struct_0x3f6d7b68),
+            0xb71e767a: LazyBound(self.struct_0xb71e767a),
+            0xf7444763: LazyBound(self.struct_0xf7444763),
+            0x99c1d49d: LazyBound(self.struct_0x99c1d49d),
+            0x2be0dfa4: LazyBound(self.struct_0x2be0dfa4)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xc0de1bd9, 'json_object_value')
+    def struct_0xc0de1bd9(self):
+        return (
+            'key' / TString,
+            'value' / self.json_value_structures('value'))
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group keyboard_button of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa0c0505c, 'keyboard_button_simple_web_view')
+    def struct_0xa0c0505c(self):
+        return (
+            'text' / TString,
+            'url' / TString)
+
+    @constructor(0xb16a6c29, 'keyboard_button_request_phone')
+    def struct_0xb16a6c29(self):
+        return ['text' / TString]
+
+    @constructor(0x50f41ccf, 'keyboard_button_game')
+    def struct_0x50f41ccf(self):
+        return ['text' / TString]
+
+    @constructor(0x258aff05, 'keyboard_button_url')
+    def struct_0x258aff05(self):
+        return (
+            'text' / TString,
+            'url' / TString)
+
+    @constructor(0x0568a748, 'keyboard_button_switch_inline_layer157')
+    def struct_0x0568a748(self):
+        return Struct(
+            'sname' / Computed('keyboard_button_switch_inline_layer157'),
+            'signature' / Hex(Const(0x0568a748, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_same_peer=1),
+            'text' / TString,
+            'query' / TString)
+
+    @constructor(0xfc796b3f, 'keyboard_button_request_geo_location')
+    def struct_0xfc796b3f(self):
+        return ['text' / TString]
+
+    @constructor(0x10b78d29, 'keyboard_button_url_auth')
+    def struct_0x10b78d29(self):
+        return Struct(
+            'sname' / Computed('keyboard_button_url_auth'),
+            'signature' / Hex(Const(0x10b78d29, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_fwd_text=1),
+            'text' / TString,
+            'fwd_text' / If(this.flags.has_fwd_text, TString),
+            'url' / TString,
+            'button_id' / Int32ul)
+
+    @constructor(0xd02e7fd4, 'input_keyboard_button_url_auth')
+    def struct_0xd02e7fd4(self):
+        return Struct(
+            'sname' / Computed('input_keyboard_button_url_auth'),
+            'signature' / Hex(Const(0xd02e7fd4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_request_write_access=1,
+                                has_fwd_text=2),
+            'text' / TString,
+            'fwd_text' / If(this.flags.has_fwd_text, TString),
+            'url' / TString,
+            'bot' / self.input_user_structures('bot'))
+
+    @constructor(0xbbc7515d, 'keyboard_button_request_poll')
+    def struct_0xbbc7515d(self):
+        return Struct(
+            'sname' / Computed('keyboard_button_request_poll'),
+            'signature' / Hex(Const(0xbbc7515d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_quiz=1),
+            'quiz' / If(this.flags.has_quiz, TBool),
+            'text' / TString)
+
+    @constructor(0xafd93fbb, 'keyboard_button_buy')
+    def struct_0xafd93fbb(self):
+        return ['text' / TString]
+
+    @constructor(0x683a5e46, 'keyboard_button_callback_layer117')
+    def struct_0x683a5e46(self):
+        return (
+            'text' / TString,
+            'data' / TBytes)
+
+    @constructor(0x93b9fbb5, 'keyboard_button_switch_inline')
+    def struct_0x93b9fbb5(self):
+        return Struct(
+            'sname' / Computed('keyboard_button_switch_inline'),
+            'signature' / Hex(Const(0x93b9fbb5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_same_peer=1,
+                                has_peer_types=2),
+            'text' / TString,
+            'query' / TString,
+            'peer_types' / If(this.flags.has_peer_types, self.vector(self.inline_query_peer_type_structures('peer_types'), 'peer_types')))
+
+    @constructor(0xa2fa4880, 'keyboard_button')
+    def struct_0xa2fa4880(self):
+        return ['text' / TString]
+
+    @constructor(0x35bbdb6b, 'keyboard_button_callback')
+    def struct_0x35bbdb6b(self):
+        return Struct(
+            'sname' / Computed('keyboard_button_callback'),
+            'signature' / Hex(Const(0x35bbdb6b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_requires_password=1),
+            'text' / TString,
+            'data' / TBytes)
+
+    @constructor(0xe988037b, 'input_keyboard_button_user_profile')
+    def struct_0xe988037b(self):
+        return (
+            'text' / TString,
+            'input_user' / self.input_user_structures('input_user'))
+
+    @constructor(0x308660c1, 'keyboard_button_user_profile')
+    def struct_0x308660c1(self):
+        return (
+            'text' / TString,
+            'user_id' / Int64ul)
+
+    @constructor(0x13767230, 'keyboard_button_web_view')
+    def struct_0x13767230(self):
+        return (
+            'text' / TString,
+            'url' / TString)
+
+    @constructor(0x0d0b468c, 'keyboard_button_request_peer_layer168')
+    def struct_0x0d0b468c(self):
+        return (
+            'text' / TString,
+            'button_id' / Int32ul,
+            'peer_type' / self.request_peer_type_structures('peer_type'))
+
+    @constructor(0x53d7bfd8, 'keyboard_button_request_peer')
+    def struct_0x53d7bfd8(self):
+        return (
+            'text' / TString,
+            'button_id' / Int32ul,
+            'peer_type' / self.request_peer_type_structures('peer_type'),
+            'max_quantity' / Int32ul)
+
+    @constructor(0x75d2698e, 'keyboard_button_copy')
+    def struct_0x75d2698e(self):
+        return (
+            'text' / TString,
+            'copy_text' / TString)
+
+    @structures
+    def keyboard_button_structures(self, name):
+        tag_map = {
+            0xa0c0505c: LazyBound(self.struct_0xa0c0505c),
+            0xb16a6c29: LazyBound(self.struct_0xb16a6c29),
+            0x50f41ccf: LazyBound(self.struct_0x50f41ccf),
+            0x258aff05: LazyBound(self.struct_0x258aff05),
+            0x0568a748: LazyBound(self.struct_0x0568a748),
+            0xfc796b3f: LazyBound(self.struct_0xfc796b3f),
+            0x10b78d29: LazyBound(self.struct_0x10b78d29),
+            0xd02e7fd4: LazyBound(self.struct_0xd02e7fd4),
+            0xbbc7515d: LazyBound(self.struct_0xbbc7515d),
+            0xafd93fbb: LazyBound(self.struct_0xafd93fbb),
+            0x683a5e46: LazyBound(self.struct_0x683a5e46),
+            0x93b9fbb5: LazyBound(self.struct_0x93b9fbb5),
+            0xa2fa4880: LazyBound(self.struct_0xa2fa4880),
+            0x35bbdb6b: LazyBound(self.struct_0x35bbdb6b),
+            0xe988037b: LazyBound(self.struct_0xe988037b),
+            0x308660c1: LazyBound(self.struct_0x308660c1),
+            0x13767230: LazyBound(self.struct_0x13767230),
+            0x0d0b468c: LazyBound(self.struct_0x0d0b468c),
+            0x53d7bfd8: LazyBound(self.struct_0x53d7bfd8),
+            0x75d2698e: LazyBound(self.struct_0x75d2698e)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group lang of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xeeca5ce3, 'lang_pack_language')
+    def struct_0xeeca5ce3(self):
+        return Struct(
+            'sname' / Computed('lang_pack_language'),
+            'signature' / Hex(Const(0xeeca5ce3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_official=1,
+                                is_rtl=4,
+                                has_base_lang_code=2),
+            'name' / TString,
+            'native_name' / TString,
+            'lang_code' / TString,
+            'base_lang_code' / If(this.flags.has_base_lang_code, TString),
+            'plural_code' / TString,
+            'strings_count' / Int32ul,
+            'translated_count' / Int32ul,
+            'translations_url' / TString)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group lang_pack_string of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x6c47ac9f, 'lang_pack_string_pluralized')
+    def struct_0x6c47ac9f(self):
+        return Struct(
+            'sname' / Computed('lang_pack_string_pluralized'),
+            'signature' / Hex(Const(0x6c47ac9f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_zero_value=1,
+                                has_one_value=2,
+                                has_two_value=4,
+                                has_few_value=8,
+                                has_many_value=16),
+            'key' / TString,
+            'zero_value' / If(this.flags.has_zero_value, TString),
+            'one_value' / If(this.flags.has_one_value, TString),
+            'two_value' / If(this.flags.has_two_value, TString),
+            'few_value' / If(this.flags.has_few_value, TString),
+            'many_value' / If(this.flags.has_many_value, TString),
+            'other_value' / TString)
+
+    @constructor(0xcad181f6, 'lang_pack_string')
+    def struct_0xcad181f6(self):
+        return (
+            'key' / TString,
+            'value' / TString)
+
+    @constructor(0x2979eeb2, 'lang_pack_string_deleted')
+    def struct_0x2979eeb2(self):
+        return ['key' / TString]
+
+    @structures
+    def lang_pack_string_structures(self, name):
+        tag_map = {
+            0x6c47ac9f: LazyBound(self.struct_0x6c47ac9f),
+            0xcad181f6: LazyBound(self.struct_0xcad181f6),
+            0x2979eeb2: LazyBound(self.struct_0x2979eeb2)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group langpack of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x2e1ee318, 'langpack_get_strings')
+    def struct_0x2e1ee318(self):
+        return (
+            'lang_code' / TString,
+            'keys' / self.vector(TString, 'keys'))
+
+    @constructor(0x6a596502, 'langpack_get_language')
+    def struct_0x6a596502(self):
+        return (
+            'lang_pack' / TString,
+            'lang_code' / TString)
+
+    @constructor(0x800fd57d, 'langpack_get_languages')
+    def struct_0x800fd57d(self):
+        return []
+
+    @constructor(0x9ab5c58e, 'langpack_get_lang_pack')
+    def struct_0x9ab5c58e(self):
+        return ['lang_code' / TString]
+
+    @constructor(0xcd984aa5, 'langpack_get_difference')
+    def struct_0xcd984aa5(self):
+        return (
+            'lang_pack' / TString,
+            'lang_code' / TString,
+            'from_version' / Int32ul)
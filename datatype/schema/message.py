@@ -0,0 +1,1608 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x1d86f70e, 'message_service_old2')
+    def struct_0x1d86f70e(self):
+        return Struct(
+            'sname' / Computed('message_service_old2'),
+            'signature' / Hex(Const(0x1d86f70e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32),
+            'id' / Int32ul,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'date' / TTimestamp,
+            'action' / self.message_action_structures('action'))
+
+    @constructor(0xa7ab1991, 'message_old3')
+    def struct_0xa7ab1991(self):
+        return Struct(
+            'sname' / Computed('message_old3'),
+            'signature' / Hex(Const(0xa7ab1991, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                has_fwd_from_user_id=4,
+                                has_reply_to_msg_id=8),
+            'id' / Int32ul,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from_user_id' / If(this.flags.has_fwd_from_user_id, Int32ul),
+            'fwd_from_date' / If(this.flags.has_fwd_from_user_id, TTimestamp),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / self.message_media_structures('media'),
+            'attach_path' / TString)
+
+    @constructor(0xc3060325, 'message_old4')
+    def struct_0xc3060325(self):
+        return Struct(
+            'sname' / Computed('message_old4'),
+            'signature' / Hex(Const(0xc3060325, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                has_fwd_from_user_id=4,
+                                has_reply_to_msg_id=8,
+                                has_reply_markup=64),
+            'id' / Int32ul,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from_user_id' / If(this.flags.has_fwd_from_user_id, Int32ul),
+            'fwd_from_date' / If(this.flags.has_fwd_from_user_id, TTimestamp),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / self.message_media_structures('media'),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'attach_path' / TString)
+
+    @constructor(0x555555fa, 'message_secret')
+    def struct_0x555555fa(self):
+        return Struct(
+            'sname' / Computed('message_secret'),
+            'signature' / Hex(Const(0x555555fa, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                has_via_bot_name=2048,
+                                has_reply_to_random_id=8,
+                                has_grouped_id=131072),
+            'id' / Int32ul,
+            'ttl' / Int32ul,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / self.message_media_structures('media'),
+            'entities' / self.vector(self.message_entity_structures('entities'), 'entities'),
+            'via_bot_name' / If(this.flags.has_via_bot_name, TString),
+            'reply_to_random_id' / If(this.flags.has_reply_to_random_id, Int64ul),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'attach_path' / TString)
+
+    @constructor(0x555555f9, 'message_secret_layer72')
+    def struct_0x555555f9(self):
+        return Struct(
+            'sname' / Computed('message_secret_layer72'),
+            'signature' / Hex(Const(0x555555f9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                has_via_bot_name=2048,
+                                has_reply_to_random_id=8),
+            'id' / Int32ul,
+            'ttl' / Int32ul,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / self.message_media_structures('media'),
+            'entities' / self.vector(self.message_entity_structures('entities'), 'entities'),
+            'via_bot_name' / If(this.flags.has_via_bot_name, TString),
+            'reply_to_random_id' / If(this.flags.has_reply_to_random_id, Int64ul),
+            'attach_path' / TString)
+
+    @constructor(0x90dddc11, 'message_layer72')
+    def struct_0x90dddc11(self):
+        return Struct(
+            'sname' / Computed('message_layer72'),
+            'signature' / Hex(Const(0x90dddc11, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                has_from_user_id=256,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to_msg_id=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_edit_date=32768,
+                                has_post_author=65536),
+            'id' / Int32ul,
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int32ul),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'attach_path' / TString)
+
+    @constructor(0xc09be45f, 'message_layer68')
+    def struct_0xc09be45f(self):
+        return Struct(
+            'sname' / Computed('message_layer68'),
+            'signature' / Hex(Const(0xc09be45f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_with_my_score=1073741824,
+                                has_from_user_id=256,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to_msg_id=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_edit_date=32768),
+            'id' / Int32ul,
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int32ul),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'attach_path' / TString)
+
+    @constructor(0xc992e15c, 'message_layer47')
+    def struct_0xc992e15c(self):
+        return Struct(
+            'sname' / Computed('message_layer47'),
+            'signature' / Hex(Const(0xc992e15c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                has_from_user_id=256,
+                                has_fwd_from_from_id=4,
+                                has_via_bot_id=2048,
+                                has_reply_to_msg_id=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024),
+            'id' / Int32ul,
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from_from_id' / If(this.flags.has_fwd_from_from_id, self.peer_structures('fwd_from_from_id')),
+            'fwd_from_date' / If(this.flags.has_fwd_from_from_id, TTimestamp),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int32ul),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'attach_path' / TString)
+
+    @constructor(0x5ba66c13, 'message_old7')
+    def struct_0x5ba66c13(self):
+        return Struct(
+            'sname' / Computed('message_old7'),
+            'signature' / Hex(Const(0x5ba66c13, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                has_from_user_id=256,
+                                has_fwd_from_from_id=4,
+                                has_reply_to_msg_id=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024),
+            'id' / Int32ul,
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from_from_id' / If(this.flags.has_fwd_from_from_id, self.peer_structures('fwd_from_from_id')),
+            'fwd_from_date' / If(this.flags.has_fwd_from_from_id, TTimestamp),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'attach_path' / TString)
+
+    @constructor(0xc06b9607, 'message_service_layer48')
+    def struct_0xc06b9607(self):
+        return Struct(
+            'sname' / Computed('message_service_layer48'),
+            'signature' / Hex(Const(0xc06b9607, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                has_from_user_id=256),
+            'id' / Int32ul,
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'date' / TTimestamp,
+            'action' / self.message_action_structures('action'))
+
+    @constructor(0x83e5de54, 'message_empty_layer122')
+    def struct_0x83e5de54(self):
+        return ['id' / Int32ul]
+
+    @constructor(0x2bebfa86, 'message_old6')
+    def struct_0x2bebfa86(self):
+        return Struct(
+            'sname' / Computed('message_old6'),
+            'signature' / Hex(Const(0x2bebfa86, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                has_fwd_from_user_id=4,
+                                has_reply_to_msg_id=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128),
+            'id' / Int32ul,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from_user_id' / If(this.flags.has_fwd_from_user_id, Int32ul),
+            'fwd_from_date' / If(this.flags.has_fwd_from_user_id, TTimestamp),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'attach_path' / TString)
+
+    @constructor(0x44f9b43d, 'message_layer104')
+    def struct_0x44f9b43d(self):
+        return Struct(
+            'sname' / Computed('message_layer104'),
+            'signature' / Hex(Const(0x44f9b43d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                has_from_user_id=256,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to_msg_id=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072),
+            'id' / Int32ul,
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int32ul),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'attach_path' / TString)
+
+    @constructor(0x90a6ca84, 'message_empty')
+    def struct_0x90a6ca84(self):
+        return Struct(
+            'sname' / Computed('message_empty'),
+            'signature' / Hex(Const(0x90a6ca84, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_peer_id=1),
+            'id' / Int32ul,
+            'peer_id' / If(this.flags.has_peer_id, self.peer_structures('peer_id')))
+
+    @constructor(0x1c9b1027, 'message_layer104_2')
+    def struct_0x1c9b1027(self):
+        return Struct(
+            'sname' / Computed('message_layer104_2'),
+            'signature' / Hex(Const(0x1c9b1027, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                has_from_user_id=256,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to_msg_id=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304),
+            'id' / Int32ul,
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int32ul),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, TString),
+            'attach_path' / TString)
+
+    @constructor(0xa367e716, 'message_forwarded_old2')
+    def struct_0xa367e716(self):
+        return Struct(
+            'sname' / Computed('message_forwarded_old2'),
+            'signature' / Hex(Const(0xa367e716, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32),
+            'id' / Int32ul,
+            'fwd_from_user_id' / Int32ul,
+            'fwd_from_date' / TTimestamp,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / self.message_media_structures('media'))
+
+    @constructor(0x05f46804, 'message_forwarded_old')
+    def struct_0x05f46804(self):
+        return (
+            'id' / Int32ul,
+            'fwd_from_user_id' / Int32ul,
+            'fwd_from_date' / TTimestamp,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'out' / TBool,
+            'unread' / TBool,
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / self.message_media_structures('media'),
+            'attach_path' / TString)
+
+    @constructor(0x567699b3, 'message_old2')
+    def struct_0x567699b3(self):
+        return Struct(
+            'sname' / Computed('message_old2'),
+            'signature' / Hex(Const(0x567699b3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32),
+            'id' / Int32ul,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / self.message_media_structures('media'),
+            'attach_path' / TString)
+
+    @constructor(0x9f8d60bb, 'message_service_old')
+    def struct_0x9f8d60bb(self):
+        return (
+            'id' / Int32ul,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'out' / TBool,
+            'unread' / TBool,
+            'date' / TTimestamp,
+            'action' / self.message_action_structures('action'))
+
+    @constructor(0x22eb6aba, 'message_old')
+    def struct_0x22eb6aba(self):
+        return (
+            'id' / Int32ul,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'out' / TBool,
+            'unread' / TBool,
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / self.message_media_structures('media'),
+            'attach_path' / TString)
+
+    @constructor(0x555555f8, 'message_secret_old')
+    def struct_0x555555f8(self):
+        return Struct(
+            'sname' / Computed('message_secret_old'),
+            'signature' / Hex(Const(0x555555f8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32),
+            'id' / Int32ul,
+            'ttl' / Int32ul,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / self.message_media_structures('media'),
+            'attach_path' / TString)
+
+    @constructor(0x9789dac4, 'message_layer104_3')
+    def struct_0x9789dac4(self):
+        return Struct(
+            'sname' / Computed('message_layer104_3'),
+            'signature' / Hex(Const(0x9789dac4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                has_from_user_id=256,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to_msg_id=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304),
+            'id' / Int32ul,
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int32ul),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'attach_path' / TString)
+
+    @constructor(0x452c0e65, 'message_layer117')
+    def struct_0x452c0e65(self):
+        return Struct(
+            'sname' / Computed('message_layer117'),
+            'signature' / Hex(Const(0x452c0e65, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                has_from_user_id=256,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to_msg_id=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_restriction_reason=4194304),
+            'id' / Int32ul,
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int32ul),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'attach_path' / TString)
+
+    @constructor(0xf52e6b7f, 'message_layer118')
+    def struct_0xf52e6b7f(self):
+        return Struct(
+            'sname' / Computed('message_layer118'),
+            'signature' / Hex(Const(0xf52e6b7f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                has_from_user_id=256,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to_msg_id=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_restriction_reason=4194304),
+            'id' / Int32ul,
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int32ul),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'attach_path' / TString)
+
+    @constructor(0x58ae39c9, 'message_layer123')
+    def struct_0x58ae39c9(self):
+        return Struct(
+            'sname' / Computed('message_layer123'),
+            'signature' / Hex(Const(0x58ae39c9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                has_from_id=256,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_restriction_reason=4194304),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int32ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'attach_path' / TString)
+
+    @constructor(0xbce383d2, 'message_layer131')
+    def struct_0xbce383d2(self):
+        return Struct(
+            'sname' / Computed('message_layer131'),
+            'signature' / Hex(Const(0xbce383d2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                has_from_id=256,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int32ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'attach_path' / TString)
+
+    @constructor(0x85d6cbe2, 'message_layer135')
+    def struct_0x85d6cbe2(self):
+        return Struct(
+            'sname' / Computed('message_layer135'),
+            'signature' / Hex(Const(0x85d6cbe2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                is_noforwards=67108864,
+                                has_from_id=256,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'attach_path' / TString)
+
+    @constructor(0xeabcdd4d, 'message')
+    def struct_0xeabcdd4d(self):
+        return Struct(
+            'sname' / Computed('message'),
+            'signature' / Hex(Const(0xeabcdd4d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                is_noforwards=67108864,
+                                is_invert_media=134217728,
+                                has_from_id=256,
+                                has_from_boosts_applied=536870912,
+                                has_saved_peer_id=268435456,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432,
+                                has_quick_reply_shortcut_id=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_offline=2,
+                                 is_video_processing_pending=16,
+                                 has_via_business_bot_id=1,
+                                 has_effect=4,
+                                 has_factcheck=8,
+                                 has_report_delivery_until_date=32,
+                                 has_paid_message_stars=64),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'from_boosts_applied' / If(this.flags.has_from_boosts_applied, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.peer_structures('saved_peer_id')),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'via_business_bot_id' / If(this.flags2.has_via_business_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'quick_reply_shortcut_id' / If(this.flags.has_quick_reply_shortcut_id, Int32ul),
+            'effect' / If(this.flags2.has_effect, Int64ul),
+            'factcheck' / If(this.flags2.has_factcheck, self.struct_0xb89bfccf()),
+            'report_delivery_until_date' / If(this.flags2.has_report_delivery_until_date, TTimestamp),
+            'paid_message_stars' / If(this.flags2.has_paid_message_stars, Int64ul),
+            'attach_path' / TString)
+
+    @constructor(0x96fdbbe9, 'message_layer199')
+    def struct_0x96fdbbe9(self):
+        return Struct(
+            'sname' / Computed('message_layer199'),
+            'signature' / Hex(Const(0x96fdbbe9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                is_noforwards=67108864,
+                                is_invert_media=134217728,
+                                has_from_id=256,
+                                has_from_boosts_applied=536870912,
+                                has_saved_peer_id=268435456,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432,
+                                has_quick_reply_shortcut_id=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_offline=2,
+                                 is_video_processing_pending=16,
+                                 has_via_business_bot_id=1,
+                                 has_effect=4,
+                                 has_factcheck=8,
+                                 has_report_delivery_until_date=32),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'from_boosts_applied' / If(this.flags.has_from_boosts_applied, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.peer_structures('saved_peer_id')),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'via_business_bot_id' / If(this.flags2.has_via_business_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'quick_reply_shortcut_id' / If(this.flags.has_quick_reply_shortcut_id, Int32ul),
+            'effect' / If(this.flags2.has_effect, Int64ul),
+            'factcheck' / If(this.flags2.has_factcheck, self.struct_0xb89bfccf()),
+            'report_delivery_until_date' / If(this.flags2.has_report_delivery_until_date, TTimestamp),
+            'attach_path' / TString)
+
+    @constructor(0x94345242, 'message_layer195')
+    def struct_0x94345242(self):
+        return Struct(
+            'sname' / Computed('message_layer195'),
+            'signature' / Hex(Const(0x94345242, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                is_noforwards=67108864,
+                                is_invert_media=134217728,
+                                has_from_id=256,
+                                has_from_boosts_applied=536870912,
+                                has_saved_peer_id=268435456,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432,
+                                has_quick_reply_shortcut_id=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_offline=2,
+                                 is_video_processing_pending=16,
+                                 has_via_business_bot_id=1,
+                                 has_effect=4,
+                                 has_factcheck=8),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'from_boosts_applied' / If(this.flags.has_from_boosts_applied, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.peer_structures('saved_peer_id')),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'via_business_bot_id' / If(this.flags2.has_via_business_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'quick_reply_shortcut_id' / If(this.flags.has_quick_reply_shortcut_id, Int32ul),
+            'effect' / If(this.flags2.has_effect, Int64ul),
+            'factcheck' / If(this.flags2.has_factcheck, self.struct_0xb89bfccf()),
+            'attach_path' / TString)
+
+    @constructor(0xbde09c2e, 'message_layer180')
+    def struct_0xbde09c2e(self):
+        return Struct(
+            'sname' / Computed('message_layer180'),
+            'signature' / Hex(Const(0xbde09c2e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                is_noforwards=67108864,
+                                is_invert_media=134217728,
+                                has_from_id=256,
+                                has_from_boosts_applied=536870912,
+                                has_saved_peer_id=268435456,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432,
+                                has_quick_reply_shortcut_id=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_offline=2,
+                                 has_via_business_bot_id=1,
+                                 has_effect=4),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'from_boosts_applied' / If(this.flags.has_from_boosts_applied, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.peer_structures('saved_peer_id')),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'via_business_bot_id' / If(this.flags2.has_via_business_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'quick_reply_shortcut_id' / If(this.flags.has_quick_reply_shortcut_id, Int32ul),
+            'effect' / If(this.flags2.has_effect, Int64ul),
+            'attach_path' / TString)
+
+    @constructor(0xa4e97f37, 'message_layer179_1')
+    def struct_0xa4e97f37(self):
+        return Struct(
+            'sname' / Computed('message_layer179_1'),
+            'signature' / Hex(Const(0xa4e97f37, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                is_noforwards=67108864,
+                                is_invert_media=134217728,
+                                has_from_id=256,
+                                has_from_boosts_applied=536870912,
+                                has_saved_peer_id=268435456,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432,
+                                has_quick_reply_shortcut_id=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_offline=2,
+                                 has_via_business_bot_id=1),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'from_boosts_applied' / If(this.flags.has_from_boosts_applied, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.peer_structures('saved_peer_id')),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'via_business_bot_id' / If(this.flags2.has_via_business_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'quick_reply_shortcut_id' / If(this.flags.has_quick_reply_shortcut_id, Int32ul),
+            'attach_path' / TString)
+
+    @constructor(0x2357bf25, 'message_layer179')
+    def struct_0x2357bf25(self):
+        return Struct(
+            'sname' / Computed('message_layer179'),
+            'signature' / Hex(Const(0x2357bf25, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                is_noforwards=67108864,
+                                is_invert_media=134217728,
+                                has_from_id=256,
+                                has_from_boosts_applied=536870912,
+                                has_saved_peer_id=268435456,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432,
+                                has_quick_reply_shortcut_id=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_offline=2,
+                                 has_via_business_bot_id=1),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'from_boosts_applied' / If(this.flags.has_from_boosts_applied, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.peer_structures('saved_peer_id')),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'via_business_bot_id' / If(this.flags2.has_via_business_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'quick_reply_shortcut_id' / If(this.flags.has_quick_reply_shortcut_id, Int32ul),
+            'attach_path' / TString)
+
+    @constructor(0xa66c7efc, 'message_layer176')
+    def struct_0xa66c7efc(self):
+        return Struct(
+            'sname' / Computed('message_layer176'),
+            'signature' / Hex(Const(0xa66c7efc, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                is_noforwards=67108864,
+                                is_invert_media=134217728,
+                                has_from_id=256,
+                                has_from_boosts_applied=536870912,
+                                has_saved_peer_id=268435456,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432,
+                                has_quick_reply_shortcut_id=1073741824),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'from_boosts_applied' / If(this.flags.has_from_boosts_applied, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.peer_structures('saved_peer_id')),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'quick_reply_shortcut_id' / If(this.flags.has_quick_reply_shortcut_id, Int32ul),
+            'attach_path' / TString)
+
+    @constructor(0x1e4c8a69, 'message_layer175')
+    def struct_0x1e4c8a69(self):
+        return Struct(
+            'sname' / Computed('message_layer175'),
+            'signature' / Hex(Const(0x1e4c8a69, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                is_noforwards=67108864,
+                                is_invert_media=134217728,
+                                has_from_id=256,
+                                has_from_boosts_applied=536870912,
+                                has_saved_peer_id=268435456,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'from_boosts_applied' / If(this.flags.has_from_boosts_applied, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.peer_structures('saved_peer_id')),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'attach_path' / TString)
+
+    @constructor(0x38116ee0, 'message_layer169')
+    def struct_0x38116ee0(self):
+        return Struct(
+            'sname' / Computed('message_layer169'),
+            'signature' / Hex(Const(0x38116ee0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                is_noforwards=67108864,
+                                is_invert_media=134217728,
+                                has_from_id=256,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'attach_path' / TString)
+
+    @constructor(0x76bec211, 'message_layer173')
+    def struct_0x76bec211(self):
+        return Struct(
+            'sname' / Computed('message_layer173'),
+            'signature' / Hex(Const(0x76bec211, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_from_scheduled=262144,
+                                is_legacy=524288,
+                                is_edit_hide=2097152,
+                                is_pinned=16777216,
+                                is_noforwards=67108864,
+                                is_invert_media=134217728,
+                                has_from_id=256,
+                                has_saved_peer_id=268435456,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_media=512,
+                                has_reply_markup=64,
+                                has_entities=128,
+                                has_views=1024,
+                                has_replies=8388608,
+                                has_edit_date=32768,
+                                has_post_author=65536,
+                                has_grouped_id=131072,
+                                has_reactions=1048576,
+                                has_restriction_reason=4194304,
+                                has_ttl_period=33554432),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'peer_id' / self.peer_structures('peer_id'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.peer_structures('saved_peer_id')),
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_views, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')),
+            'edit_date' / If(this.flags.has_edit_date, TTimestamp),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'grouped_id' / If(this.flags.has_grouped_id, Int64ul),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'restriction_reason' / If(this.flags.has_restriction_reason, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'attach_path' / TString)
+
+    @constructor(0x9e19a1f6, 'message_service_layer118')
+    def struct_0x9e19a1f6(self):
+        return Struct(
+            'sname' / Computed('message_service_layer118'),
+            'signature' / Hex(Const(0x9e19a1f6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_legacy=524288,
+                                has_from_user_id=256,
+                                has_reply_to_msg_id=8),
+            'id' / Int32ul,
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'peer_id' / self.peer_structures('peer_id'),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'action' / self.message_action_structures('action'),
+            'attach_path' / TString)
+
+    @constructor(0x286fa604, 'message_service_layer123')
+    def struct_0x286fa604(self):
+        return Struct(
+            'sname' / Computed('message_service_layer123'),
+            'signature' / Hex(Const(0x286fa604, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_legacy=524288,
+                                has_from_id=256,
+                                has_reply_to=8),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'peer_id' / self.peer_structures('peer_id'),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'action' / self.message_action_structures('action'),
+            'attach_path' / TString)
+
+    @constructor(0x2b085862, 'message_service_layer195')
+    def struct_0x2b085862(self):
+        return Struct(
+            'sname' / Computed('message_service_layer195'),
+            'signature' / Hex(Const(0x2b085862, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_legacy=524288,
+                                has_from_id=256,
+                                has_reply_to=8,
+                                has_ttl_period=33554432),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'peer_id' / self.peer_structures('peer_id'),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'action' / self.message_action_structures('action'),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0xd3d28540, 'message_service')
+    def struct_0xd3d28540(self):
+        return Struct(
+            'sname' / Computed('message_service'),
+            'signature' / Hex(Const(0xd3d28540, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                is_post=16384,
+                                is_legacy=524288,
+                                is_reactions_are_possible=512,
+                                has_from_id=256,
+                                has_reply_to=8,
+                                has_reactions=1048576,
+                                has_ttl_period=33554432),
+            'id' / Int32ul,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'peer_id' / self.peer_structures('peer_id'),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'date' / TTimestamp,
+            'action' / self.message_action_structures('action'),
+            'reactions' / If(this.flags.has_reactions, self.message_reactions_structures('reactions')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0xf07814c8, 'message_old5')
+    def struct_0xf07814c8(self):
+        return Struct(
+            'sname' / Computed('message_old5'),
+            'signature' / Hex(Const(0xf07814c8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                has_fwd_from_user_id=4,
+                                has_reply_to_msg_id=8,
+                                has_reply_markup=64,
+                                has_entities=128),
+            'id' / Int32ul,
+            'from_user_id' / Int32ul,
+            'peer_id' / self.peer_structures('peer_id'),
+            'fwd_from_user_id' / If(this.flags.has_fwd_from_user_id, Int32ul),
+            'fwd_from_date' / If(this.flags.has_fwd_from_user_id, TTimestamp),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'date' / TTimestamp,
+            'message' / TString,
+            'media' / self.message_media_structures('media'),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'attach_path' / TString)
+
+    @structures
+    def message_structures(self, name):
+        tag_map = {
+            0x1d86f70e: LazyBound(self.struct_0x1d86f70e),
+            0xa7ab1991: LazyBound(self.struct_0xa7ab1991),
+            0xc3060325: LazyBound(self.struct_0xc3060325),
+            0x555555fa: LazyBound(self.struct_0x555555fa),
+            0x555555f9: LazyBound(self.struct_0x555555f9),
+            0x90dddc11: LazyBound(self.struct_0x90dddc11),
+            0xc09be45f: LazyBound(self.struct_0xc09be45f),
+            0xc992e15c: LazyBound(self.struct_0xc992e15c),
+            0x5ba66c13: LazyBound(self.struct_0x5ba66c13),
+            0xc06b9607: LazyBound(self.struct_0xc06b9607),
+            0x83e5de54: LazyBound(self.struct_0x83e5de54),
+            0x2bebfa86: LazyBound(self.struct_0x2bebfa86),
+            0x44f9b43d: LazyBound(self.struct_0x44f9b43d),
+            0x90a6ca84: LazyBound(self.struct_0x90a6ca84),
+            0x1c9b1027: LazyBound(self.struct_0x1c9b1027),
+            0xa367e716: LazyBound(self.struct_0xa367e716),
+            0x05f46804: LazyBound(self.struct_0x05f46804),
+            0x567699b3: LazyBound(self.struct_0x567699b3),
+            0x9f8d60bb: LazyBound(self.struct_0x9f8d60bb),
+            0x22eb6aba: LazyBound(self.struct_0x22eb6aba),
+            0x555555f8: LazyBound(self.struct_0x555555f8),
+            0x9789dac4: LazyBound(self.struct_0x9789dac4),
+            0x452c0e65: LazyBound(self.struct_0x452c0e65),
+            0xf52e6b7f: LazyBound(self.struct_0xf52e6b7f),
+            0x58ae39c9: LazyBound(self.struct_0x58ae39c9),
+            0xbce383d2: LazyBound(self.struct_0xbce383d2),
+            0x85d6cbe2: LazyBound(self.struct_0x85d6cbe2),
+            0xeabcdd4d: LazyBound(self.struct_0xeabcdd4d),
+            0x96fdbbe9: LazyBound(self.struct_0x96fdbbe9),
+            0x94345242: LazyBound(self.struct_0x94345242),
+            0xbde09c2e: LazyBound(self.struct_0xbde09c2e),
+            0xa4e97f37: LazyBound(self.struct_0xa4e97f37),
+            0x2357bf25: LazyBound(self.struct_0x2357bf25),
+            0xa66c7efc: LazyBound(self.struct_0xa66c7efc),
+            0x1e4c8a69: LazyBound(self.struct_0x1e4c8a69),
+            0x38116ee0: LazyBound(self.struct_0x38116ee0),
+            0x76bec211: LazyBound(self.struct_0x76bec211),
+            0x9e19a1f6: LazyBound(self.struct_0x9e19a1f6),
+            0x286fa604: LazyBound(self.struct_0x286fa604),
+            0x2b085862: LazyBound(self.struct_0x2b085862),
+            0xd3d28540: LazyBound(self.struct_0xd3d28540),
+            0xf07814c8: LazyBound(self.struct_0xf07814c8)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xb89bfccf, 'fact_check')
+    def struct_0xb89bfccf(self):
+        return Struct(
+            'sname' / Computed('fact_check'),
+            'signature' / Hex(Const(0xb89bfccf, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_need_check=1,
+                                has_country=2),
+            'country' / If(this.flags.has_country, TString),
+            'text' / If(this.flags.has_country, self.struct_0x751f3146()),
+            'hash' / Int64ul)
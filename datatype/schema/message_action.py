@@ -0,0 +1,762 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message_action of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x555555f5, 'message_action_login_unknown_location')
+    def struct_0x555555f5(self):
+        return (
+            'title' / TString,
+            'address' / TString)
+
+    @constructor(0x555555f7, 'message_encrypted_action')
+    def struct_0x555555f7(self):
+        return ['encrypted_action' / self.decrypted_message_action_structures('encrypted_action')]
+
+    @constructor(0xfae69f56, 'message_action_custom_action')
+    def struct_0xfae69f56(self):
+        return ['message' / TString]
+
+    @constructor(0xa6638b9a, 'message_action_chat_create_layer131')
+    def struct_0xa6638b9a(self):
+        return (
+            'title' / TString,
+            'users' / self.vector(Int32ul, 'users'))
+
+    @constructor(0xbd47cbad, 'message_action_chat_create')
+    def struct_0xbd47cbad(self):
+        return (
+            'title' / TString,
+            'users' / self.vector(Int64ul, 'users'))
+
+    @constructor(0x502f92f7, 'message_action_invite_to_group_call')
+    def struct_0x502f92f7(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'users' / self.vector(Int64ul, 'users'))
+
+    @constructor(0x15cefd00, 'message_action_chat_add_user')
+    def struct_0x15cefd00(self):
+        return ['users' / self.vector(Int64ul, 'users')]
+
+    @constructor(0xa43f30cc, 'message_action_chat_delete_user')
+    def struct_0xa43f30cc(self):
+        return ['user_id' / Int64ul]
+
+    @constructor(0x51bdb021, 'message_action_chat_migrate_to_layer131')
+    def struct_0x51bdb021(self):
+        return ['channel_id' / Int32ul]
+
+    @constructor(0xe1037f92, 'message_action_chat_migrate_to')
+    def struct_0xe1037f92(self):
+        return ['channel_id' / Int64ul]
+
+    @constructor(0xa80f51e4, 'message_action_giveaway_launch')
+    def struct_0xa80f51e4(self):
+        return Struct(
+            'sname' / Computed('message_action_giveaway_launch'),
+            'signature' / Hex(Const(0xa80f51e4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_stars=1),
+            'stars' / If(this.flags.has_stars, Int64ul))
+
+    @constructor(0x332ba9ed, 'message_action_giveaway_launch_layer186')
+    def struct_0x332ba9ed(self):
+        return []
+
+    @constructor(0x87e2f155, 'message_action_giveaway_results')
+    def struct_0x87e2f155(self):
+        return Struct(
+            'sname' / Computed('message_action_giveaway_results'),
+            'signature' / Hex(Const(0x87e2f155, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_stars=1),
+            'winners_count' / Int32ul,
+            'unclaimed_count' / Int32ul)
+
+    @constructor(0x2a9fadc5, 'message_action_giveaway_results_layer186')
+    def struct_0x2a9fadc5(self):
+        return (
+            'winners_count' / Int32ul,
+            'unclaimed_count' / Int32ul)
+
+    @constructor(0xea3948e9, 'message_action_channel_migrate_from')
+    def struct_0xea3948e9(self):
+        return (
+            'title' / TString,
+            'chat_id' / Int64ul)
+
+    @constructor(0x7a0d7f42, 'message_action_group_call')
+    def struct_0x7a0d7f42(self):
+        return Struct(
+            'sname' / Computed('message_action_group_call'),
+            'signature' / Hex(Const(0x7a0d7f42, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_duration=1),
+            'call' / self.struct_0xd8aa840f(),
+            'duration' / If(this.flags.has_duration, Int32ul))
+
+    @constructor(0xaa786345, 'message_action_set_chat_theme')
+    def struct_0xaa786345(self):
+        return ['emoticon' / TString]
+
+    @constructor(0x4792929b, 'message_action_screenshot_taken')
+    def struct_0x4792929b(self):
+        return []
+
+    @constructor(0x01baa035, 'message_action_phone_number_request')
+    def struct_0x01baa035(self):
+        return []
+
+    @constructor(0xebbca3cb, 'message_action_chat_joined_by_request')
+    def struct_0xebbca3cb(self):
+        return []
+
+    @constructor(0x9fbab604, 'message_action_history_clear')
+    def struct_0x9fbab604(self):
+        return []
+
+    @constructor(0x7fcb13a8, 'message_action_chat_edit_photo')
+    def struct_0x7fcb13a8(self):
+        return ['photo' / self.photo_structures('photo')]
+
+    @constructor(0x031224c3, 'message_action_chat_joined_by_link')
+    def struct_0x031224c3(self):
+        return ['inviter_id' / Int64ul]
+
+    @constructor(0xb055eaee, 'message_action_channel_migrate_from_layer131')
+    def struct_0xb055eaee(self):
+        return (
+            'title' / TString,
+            'chat_id' / Int32ul)
+
+    @constructor(0x488a7337, 'message_action_chat_add_user_layer131')
+    def struct_0x488a7337(self):
+        return ['users' / self.vector(Int32ul, 'users')]
+
+    @constructor(0xb2ae9b0c, 'message_action_chat_delete_user_layer131')
+    def struct_0xb2ae9b0c(self):
+        return ['user_id' / Int32ul]
+
+    @constructor(0x55555557, 'message_action_created_broadcast_list')
+    def struct_0x55555557(self):
+        return []
+
+    @constructor(0xbc44a927, 'message_action_set_chat_wall_paper_layer166')
+    def struct_0xbc44a927(self):
+        return ['wallpaper' / self.wall_paper_structures('wallpaper')]
+
+    @constructor(0x5060a3f4, 'message_action_set_chat_wall_paper')
+    def struct_0x5060a3f4(self):
+        return Struct(
+            'sname' / Computed('message_action_set_chat_wall_paper'),
+            'signature' / Hex(Const(0x5060a3f4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_same=1,
+                                is_for_both=2),
+            'wallpaper' / self.wall_paper_structures('wallpaper'))
+
+    @constructor(0x55555550, 'message_action_user_joined')
+    def struct_0x55555550(self):
+        return []
+
+    @constructor(0x56d03994, 'message_action_gift_code')
+    def struct_0x56d03994(self):
+        return Struct(
+            'sname' / Computed('message_action_gift_code'),
+            'signature' / Hex(Const(0x56d03994, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_via_giveaway=1,
+                                is_unclaimed=32,
+                                has_boost_peer=2,
+                                has_currency=4,
+                                has_crypto_currency=8,
+                                has_message=16),
+            'boost_peer' / If(this.flags.has_boost_peer, self.peer_structures('boost_peer')),
+            'months' / Int32ul,
+            'slug' / TString,
+            'currency' / If(this.flags.has_currency, TString),
+            'amount' / If(this.flags.has_currency, Int64ul),
+            'crypto_currency' / If(this.flags.has_crypto_currency, TString),
+            'crypto_amount' / If(this.flags.has_crypto_currency, Int64ul),
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()))
+
+    @constructor(0x678c2e09, 'message_action_gift_code_layer189')
+    def struct_0x678c2e09(self):
+        return Struct(
+            'sname' / Computed('message_action_gift_code_layer189'),
+            'signature' / Hex(Const(0x678c2e09, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_via_giveaway=1,
+                                is_unclaimed=4,
+                                has_boost_peer=2,
+                                has_crypto_currency=8),
+            'boost_peer' / If(this.flags.has_boost_peer, self.peer_structures('boost_peer')),
+            'months' / Int32ul,
+            'slug' / TString,
+            'currency' / If(this.flags.is_unclaimed, TString),
+            'amount' / If(this.flags.is_unclaimed, Int64ul),
+            'crypto_currency' / If(this.flags.has_crypto_currency, TString),
+            'crypto_amount' / If(this.flags.has_crypto_currency, Int64ul))
+
+    @constructor(0xd2cfdb0e, 'message_action_gift_code_layer167')
+    def struct_0xd2cfdb0e(self):
+        return Struct(
+            'sname' / Computed('message_action_gift_code_layer167'),
+            'signature' / Hex(Const(0xd2cfdb0e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_via_giveaway=1,
+                                is_unclaimed=4,
+                                has_boost_peer=2),
+            'boost_peer' / If(this.flags.has_boost_peer, self.peer_structures('boost_peer')),
+            'months' / Int32ul,
+            'slug' / TString)
+
+    @constructor(0xb18a431c, 'message_action_topic_edit_layer149')
+    def struct_0xb18a431c(self):
+        return Struct(
+            'sname' / Computed('message_action_topic_edit_layer149'),
+            'signature' / Hex(Const(0xb18a431c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_title=1,
+                                has_icon_emoji_id=2,
+                                has_closed=4),
+            'title' / If(this.flags.has_title, TString),
+            'icon_emoji_id' / If(this.flags.has_icon_emoji_id, Int64ul),
+            'closed' / If(this.flags.has_closed, TBool))
+
+    @constructor(0xc0944820, 'message_action_topic_edit')
+    def struct_0xc0944820(self):
+        return Struct(
+            'sname' / Computed('message_action_topic_edit'),
+            'signature' / Hex(Const(0xc0944820, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_title=1,
+                                has_icon_emoji_id=2,
+                                has_closed=4,
+                                has_hidden=8),
+            'title' / If(this.flags.has_title, TString),
+            'icon_emoji_id' / If(this.flags.has_icon_emoji_id, Int64ul),
+            'closed' / If(this.flags.has_closed, TBool),
+            'hidden' / If(this.flags.has_hidden, TBool))
+
+    @constructor(0x55555551, 'message_action_user_updated_photo')
+    def struct_0x55555551(self):
+        return ['new_user_photo' / self.user_profile_photo_structures('new_user_photo')]
+
+    @constructor(0x5e3cfc4b, 'message_action_chat_add_user_old')
+    def struct_0x5e3cfc4b(self):
+        return ['user_id' / Int32ul]
+
+    @constructor(0x55555552, 'message_action_ttl_change')
+    def struct_0x55555552(self):
+        return ['ttl' / Int32ul]
+
+    @constructor(0x3c134d7b, 'message_action_set_messages_ttl')
+    def struct_0x3c134d7b(self):
+        return Struct(
+            'sname' / Computed('message_action_set_messages_ttl'),
+            'signature' / Hex(Const(0x3c134d7b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_auto_setting_from=1),
+            'period' / Int32ul,
+            'auto_setting_from' / If(this.flags.has_auto_setting_from, Int64ul))
+
+    @constructor(0xaa1afbfd, 'message_action_set_messages_ttl_layer149')
+    def struct_0xaa1afbfd(self):
+        return ['period' / Int32ul]
+
+    @constructor(0xd95c6154, 'message_action_secure_values_sent')
+    def struct_0xd95c6154(self):
+        return ['types' / self.vector(self.secure_value_type_structures('types'), 'types')]
+
+    @constructor(0x47dd8079, 'message_action_web_view_data_sent_me')
+    def struct_0x47dd8079(self):
+        return (
+            'text' / TString,
+            'data' / TString)
+
+    @constructor(0xb4c38cb5, 'message_action_web_view_data_sent')
+    def struct_0xb4c38cb5(self):
+        return ['text' / TString]
+
+    @constructor(0xf89cf5e8, 'message_action_chat_joined_by_link_layer131')
+    def struct_0xf89cf5e8(self):
+        return ['inviter_id' / Int32ul]
+
+    @constructor(0xf3f25f76, 'message_action_contact_sign_up')
+    def struct_0xf3f25f76(self):
+        return []
+
+    @constructor(0x95d2ac92, 'message_action_channel_create')
+    def struct_0x95d2ac92(self):
+        return ['title' / TString]
+
+    @constructor(0x94bd38ed, 'message_action_pin_message')
+    def struct_0x94bd38ed(self):
+        return []
+
+    @constructor(0x98e0d697, 'message_action_geo_proximity_reached')
+    def struct_0x98e0d697(self):
+        return (
+            'from_id' / self.peer_structures('from_id'),
+            'to_id' / self.peer_structures('to_id'),
+            'distance' / Int32ul)
+
+    @constructor(0x57de635e, 'message_action_suggest_profile_photo')
+    def struct_0x57de635e(self):
+        return ['photo' / self.photo_structures('photo')]
+
+    @constructor(0xe7e75f97, 'message_action_attach_menu_bot_allowed')
+    def struct_0xe7e75f97(self):
+        return []
+
+    @constructor(0xc0787d6d, 'message_action_set_same_chat_wall_paper')
+    def struct_0xc0787d6d(self):
+        return ['wallpaper' / self.wall_paper_structures('wallpaper')]
+
+    @constructor(0x95e3fbef, 'message_action_chat_delete_photo')
+    def struct_0x95e3fbef(self):
+        return []
+
+    @constructor(0x76b9f11a, 'message_action_invite_to_group_call_layer131')
+    def struct_0x76b9f11a(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'users' / self.vector(Int32ul, 'users'))
+
+    @constructor(0x80e11a7f, 'message_action_phone_call')
+    def struct_0x80e11a7f(self):
+        return Struct(
+            'sname' / Computed('message_action_phone_call'),
+            'signature' / Hex(Const(0x80e11a7f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_video=4,
+                                has_reason=1,
+                                has_duration=2),
+            'call_id' / Int64ul,
+            'reason' / If(this.flags.has_reason, self.phone_call_discard_reason_structures('reason')),
+            'duration' / If(this.flags.has_duration, Int32ul))
+
+    @constructor(0x0d999256, 'message_action_topic_create')
+    def struct_0x0d999256(self):
+        return Struct(
+            'sname' / Computed('message_action_topic_create'),
+            'signature' / Hex(Const(0x0d999256, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_icon_emoji_id=1),
+            'title' / TString,
+            'icon_color' / Int32ul,
+            'icon_emoji_id' / If(this.flags.has_icon_emoji_id, Int64ul))
+
+    @constructor(0xb5a1ce5a, 'message_action_chat_edit_title')
+    def struct_0xb5a1ce5a(self):
+        return ['title' / TString]
+
+    @constructor(0xabe9affe, 'message_action_bot_allowed_layer153')
+    def struct_0xabe9affe(self):
+        return ['domain' / TString]
+
+    @constructor(0xc516d679, 'message_action_bot_allowed')
+    def struct_0xc516d679(self):
+        return Struct(
+            'sname' / Computed('message_action_bot_allowed'),
+            'signature' / Hex(Const(0xc516d679, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_attach_menu=2,
+                                is_from_request=8,
+                                has_domain=1,
+                                has_app=4),
+            'domain' / If(this.flags.has_domain, TString),
+            'app' / If(this.flags.has_app, self.bot_app_structures('app')))
+
+    @constructor(0xc624b16e, 'message_action_payment_sent')
+    def struct_0xc624b16e(self):
+        return Struct(
+            'sname' / Computed('message_action_payment_sent'),
+            'signature' / Hex(Const(0xc624b16e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_recurring_init=4,
+                                is_recurring_used=8,
+                                has_invoice_slug=1,
+                                has_subscription_until_date=16),
+            'currency' / TString,
+            'total_amount' / Int64ul,
+            'invoice_slug' / If(this.flags.has_invoice_slug, TString),
+            'subscription_until_date' / If(this.flags.has_subscription_until_date, TTimestamp))
+
+    @constructor(0x96163f56, 'message_action_payment_sent_layer193')
+    def struct_0x96163f56(self):
+        return Struct(
+            'sname' / Computed('message_action_payment_sent_layer193'),
+            'signature' / Hex(Const(0x96163f56, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_recurring_init=4,
+                                is_recurring_used=8,
+                                has_invoice_slug=1),
+            'currency' / TString,
+            'total_amount' / Int64ul,
+            'invoice_slug' / If(this.flags.has_invoice_slug, TString))
+
+    @constructor(0x40699cd0, 'message_action_payment_sent_layer140')
+    def struct_0x40699cd0(self):
+        return (
+            'currency' / TString,
+            'total_amount' / Int64ul)
+
+    @constructor(0xb6aef7b0, 'message_action_empty')
+    def struct_0xb6aef7b0(self):
+        return []
+
+    @constructor(0x92a72876, 'message_action_game_score')
+    def struct_0x92a72876(self):
+        return (
+            'game_id' / Int64ul,
+            'score' / Int32ul)
+
+    @constructor(0xb3a07661, 'message_action_group_call_scheduled')
+    def struct_0xb3a07661(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'schedule_date' / TTimestamp)
+
+    @constructor(0xcc02aa6d, 'message_action_boost_apply')
+    def struct_0xcc02aa6d(self):
+        return ['boosts' / Int32ul]
+
+    @constructor(0xffa00ccc, 'message_action_payment_sent_me')
+    def struct_0xffa00ccc(self):
+        return Struct(
+            'sname' / Computed('message_action_payment_sent_me'),
+            'signature' / Hex(Const(0xffa00ccc, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_recurring_init=4,
+                                is_recurring_used=8,
+                                has_info=1,
+                                has_shipping_option_id=2,
+                                has_subscription_until_date=16),
+            'currency' / TString,
+            'total_amount' / Int64ul,
+            'payload' / TBytes,
+            'info' / If(this.flags.has_info, self.struct_0x909c3f94()),
+            'shipping_option_id' / If(this.flags.has_shipping_option_id, TString),
+            'charge' / self.struct_0xea02c27e(),
+            'subscription_until_date' / If(this.flags.has_subscription_until_date, TTimestamp))
+
+    @constructor(0x8f31b327, 'message_action_payment_sent_me_layer193')
+    def struct_0x8f31b327(self):
+        return Struct(
+            'sname' / Computed('message_action_payment_sent_me_layer193'),
+            'signature' / Hex(Const(0x8f31b327, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_recurring_init=4,
+                                is_recurring_used=8,
+                                has_info=1,
+                                has_shipping_option_id=2),
+            'currency' / TString,
+            'total_amount' / Int64ul,
+            'payload' / TBytes,
+            'info' / If(this.flags.has_info, self.struct_0x909c3f94()),
+            'shipping_option_id' / If(this.flags.has_shipping_option_id, TString),
+            'charge' / self.struct_0xea02c27e())
+
+    @constructor(0x6c6274fa, 'message_action_gift_premium')
+    def struct_0x6c6274fa(self):
+        return Struct(
+            'sname' / Computed('message_action_gift_premium'),
+            'signature' / Hex(Const(0x6c6274fa, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_crypto_currency=1,
+                                has_message=2),
+            'currency' / TString,
+            'amount' / Int64ul,
+            'months' / Int32ul,
+            'crypto_currency' / If(this.flags.has_crypto_currency, TString),
+            'crypto_amount' / If(this.flags.has_crypto_currency, Int64ul),
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()))
+
+    @constructor(0xc83d6aec, 'message_action_gift_premium_layer189')
+    def struct_0xc83d6aec(self):
+        return Struct(
+            'sname' / Computed('message_action_gift_premium_layer189'),
+            'signature' / Hex(Const(0xc83d6aec, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_crypto_currency=1),
+            'currency' / TString,
+            'amount' / Int64ul,
+            'months' / Int32ul,
+            'crypto_currency' / If(this.flags.has_crypto_currency, TString),
+            'crypto_amount' / If(this.flags.has_crypto_currency, Int64ul))
+
+    @constructor(0xfe77345d, 'message_action_requested_peer_layer168')
+    def struct_0xfe77345d(self):
+        return (
+            'button_id' / Int32ul,
+            'peer' / self.peer_structures('peer'))
+
+    @constructor(0x31518e9b, 'message_action_requested_peer')
+    def struct_0x31518e9b(self):
+        return (
+            'button_id' / Int32ul,
+            'peers' / self.vector(self.peer_structures('peers'), 'peers'))
+
+    @constructor(0x41b3e202, 'message_action_payment_refunded')
+    def struct_0x41b3e202(self):
+        return Struct(
+            'sname' / Computed('message_action_payment_refunded'),
+            'signature' / Hex(Const(0x41b3e202, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_payload=1),
+            'peer' / self.peer_structures('peer'),
+            'currency' / TString,
+            'total_amount' / Int64ul,
+            'payload' / If(this.flags.has_payload, TBytes),
+            'charge' / self.struct_0xea02c27e())
+
+    @constructor(0x45d5b021, 'message_action_gift_stars')
+    def struct_0x45d5b021(self):
+        return Struct(
+            'sname' / Computed('message_action_gift_stars'),
+            'signature' / Hex(Const(0x45d5b021, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_crypto_currency=1,
+                                has_transaction_id=2),
+            'currency' / TString,
+            'amount' / Int64ul,
+            'stars' / Int64ul,
+            'crypto_currency' / If(this.flags.has_crypto_currency, TString),
+            'crypto_amount' / If(this.flags.has_crypto_currency, Int64ul),
+            'transaction_id' / If(this.flags.has_transaction_id, TString))
+
+    @constructor(0xb00c47a2, 'message_action_prize_stars')
+    def struct_0xb00c47a2(self):
+        return Struct(
+            'sname' / Computed('message_action_prize_stars'),
+            'signature' / Hex(Const(0xb00c47a2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unclaimed=1),
+            'stars' / Int64ul,
+            'transaction_id' / TString,
+            'boost_peer' / self.peer_structures('boost_peer'),
+            'giveaway_msg_id' / Int32ul)
+
+    @constructor(0x4717e8a4, 'message_action_star_gift')
+    def struct_0x4717e8a4(self):
+        return Struct(
+            'sname' / Computed('message_action_star_gift'),
+            'signature' / Hex(Const(0x4717e8a4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_name_hidden=1,
+                                is_saved=4,
+                                is_converted=8,
+                                is_upgraded=32,
+                                is_transferred=64,
+                                is_can_upgrade=1024,
+                                is_refunded=512,
+                                has_message=2,
+                                has_convert_stars=16,
+                                has_upgrade_stars=256,
+                                has_from_id=2048,
+                                has_peer=4096),
+            'gift' / self.star_gift_structures('gift'),
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()),
+            'convert_stars' / If(this.flags.has_convert_stars, Int64ul),
+            'upgrade_msg_id' / If(this.flags.is_upgraded, Int32ul),
+            'upgrade_stars' / If(this.flags.has_upgrade_stars, Int64ul),
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'peer' / If(this.flags.has_peer, self.peer_structures('peer')),
+            'saved_id' / If(this.flags.has_peer, Int64ul))
+
+    @constructor(0xd8f4f0a7, 'message_action_star_gift_layer197')
+    def struct_0xd8f4f0a7(self):
+        return Struct(
+            'sname' / Computed('message_action_star_gift_layer197'),
+            'signature' / Hex(Const(0xd8f4f0a7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_name_hidden=1,
+                                is_saved=4,
+                                is_converted=8,
+                                is_upgraded=32,
+                                is_transferred=64,
+                                is_can_upgrade=1024,
+                                is_refunded=512,
+                                has_message=2,
+                                has_convert_stars=16,
+                                has_upgrade_stars=256),
+            'gift' / self.star_gift_structures('gift'),
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()),
+            'convert_stars' / If(this.flags.has_convert_stars, Int64ul),
+            'upgrade_msg_id' / If(this.flags.is_upgraded, Int32ul),
+            'upgrade_stars' / If(this.flags.has_upgrade_stars, Int64ul))
+
+    @constructor(0x08557637, 'message_action_star_gift_layer195')
+    def struct_0x08557637(self):
+        return Struct(
+            'sname' / Computed('message_action_star_gift_layer195'),
+            'signature' / Hex(Const(0x08557637, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_name_hidden=1,
+                                is_saved=4,
+                                is_converted=8,
+                                has_message=2,
+                                has_convert_stars=16),
+            'gift' / self.star_gift_structures('gift'),
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()),
+            'convert_stars' / If(this.flags.has_convert_stars, Int64ul))
+
+    @constructor(0x9bb3ef44, 'message_action_star_gift_layer192')
+    def struct_0x9bb3ef44(self):
+        return Struct(
+            'sname' / Computed('message_action_star_gift_layer192'),
+            'signature' / Hex(Const(0x9bb3ef44, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_name_hidden=1,
+                                is_saved=4,
+                                is_converted=8,
+                                has_message=2),
+            'gift' / self.star_gift_structures('gift'),
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()),
+            'convert_stars' / Int64ul)
+
+    @constructor(0x26077b99, 'message_action_star_gift_unique_layer197')
+    def struct_0x26077b99(self):
+        return Struct(
+            'sname' / Computed('message_action_star_gift_unique_layer197'),
+            'signature' / Hex(Const(0x26077b99, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_upgrade=1,
+                                is_transferred=2,
+                                is_saved=4,
+                                is_refunded=32,
+                                has_can_export_at=8,
+                                has_transfer_stars=16),
+            'gift' / self.star_gift_structures('gift'),
+            'can_export_at' / If(this.flags.has_can_export_at, Int32ul),
+            'transfer_stars' / If(this.flags.has_transfer_stars, Int64ul))
+
+    @constructor(0xacdfcb81, 'message_action_star_gift_unique')
+    def struct_0xacdfcb81(self):
+        return Struct(
+            'sname' / Computed('message_action_star_gift_unique'),
+            'signature' / Hex(Const(0xacdfcb81, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_upgrade=1,
+                                is_transferred=2,
+                                is_saved=4,
+                                is_refunded=32,
+                                has_can_export_at=8,
+                                has_transfer_stars=16,
+                                has_from_id=64,
+                                has_peer=128),
+            'gift' / self.star_gift_structures('gift'),
+            'can_export_at' / If(this.flags.has_can_export_at, Int32ul),
+            'transfer_stars' / If(this.flags.has_transfer_stars, Int64ul),
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'peer' / If(this.flags.has_peer, self.peer_structures('peer')),
+            'saved_id' / If(this.flags.has_peer, Int64ul))
+
+    @constructor(0x5cd2501f, 'message_action_paid_message')
+    def struct_0x5cd2501f(self):
+        return ['stars' / Int64ul]
+
+    @structures
+    def message_action_structures(self, name):
+        tag_map = {
+            0x555555f5: LazyBound(self.struct_0x555555f5),
+            0x555555f7: LazyBound(self.struct_0x555555f7),
+            0xfae69f56: LazyBound(self.struct_0xfae69f56),
+            0xa6638b9a: LazyBound(self.struct_0xa6638b9a),
+            0xbd47cbad: LazyBound(self.struct_0xbd47cbad),
+            0x502f92f7: LazyBound(self.struct_0x502f92f7),
+            0x15cefd00: LazyBound(self.struct_0x15cefd00),
+            0xa43f30cc: LazyBound(self.struct_0xa43f30cc),
+            0x51bdb021: LazyBound(self.struct_0x51bdb021),
+            0xe1037f92: LazyBound(self.struct_0xe1037f92),
+            0xa80f51e4: LazyBound(self.struct_0xa80f51e4),
+            0x332ba9ed: LazyBound(self.struct_0x332ba9ed),
+            0x87e2f155: LazyBound(self.struct_0x87e2f155),
+            0x2a9fadc5: LazyBound(self.struct_0x2a9fadc5),
+            0xea3948e9: LazyBound(self.struct_0xea3948e9),
+            0x7a0d7f42: LazyBound(self.struct_0x7a0d7f42),
+            0xaa786345: LazyBound(self.struct_0xaa786345),
+            0x4792929b: LazyBound(self.struct_0x4792929b),
+            0x01baa035: LazyBound(self.struct_0x01baa035),
+            0xebbca3cb: LazyBound(self.struct_0xebbca3cb),
+            0x9fbab604: LazyBound(self.struct_0x9fbab604),
+            0x7fcb13a8: LazyBound(self.struct_0x7fcb13a8),
+            0x031224c3: LazyBound(self.struct_0x031224c3),
+            0xb055eaee: LazyBound(self.struct_0xb055eaee),
+            0x488a7337: LazyBound(self.struct_0x488a7337),
+            0xb2ae9b0c: LazyBound(self.struct_0xb2ae9b0c),
+            0x55555557: LazyBound(self.struct_0x55555557),
+            0xbc44a927: LazyBound(self.struct_0xbc44a927),
+            0x5060a3f4: LazyBound(self.struct_0x5060a3f4),
+            0x55555550: LazyBound(self.struct_0x55555550),
+            0x56d03994: LazyBound(self.struct_0x56d03994),
+            0x678c2e09: LazyBound(self.struct_0x678c2e09),
+            0xd2cfdb0e: LazyBound(self.struct_0xd2cfdb0e),
+            0xb18a431c: LazyBound(self.struct_0xb18a431c),
+            0xc0944820: LazyBound(self.struct_0xc0944820),
+            0x55555551: LazyBound(self.struct_0x55555551),
+            0x5e3cfc4b: LazyBound(self.struct_0x5e3cfc4b),
+            0x55555552: LazyBound(self.struct_0x55555552),
+            0x3c134d7b: LazyBound(self.struct_0x3c134d7b),
+            0xaa1afbfd: LazyBound(self.struct_0xaa1afbfd),
+            0xd95c6154: LazyBound(self.struct_0xd95c6154),
+            0x47dd8079: LazyBound(self.struct_0x47dd8079),
+            0xb4c38cb5: LazyBound(self.struct_0xb4c38cb5),
+            0xf89cf5e8: LazyBound(self.struct_0xf89cf5e8),
+            0xf3f25f76: LazyBound(self.struct_0xf3f25f76),
+            0x95d2ac92: LazyBound(self.struct_0x95d2ac92),
+            0x94bd38ed: LazyBound(self.struct_0x94bd38ed),
+            0x98e0d697: LazyBound(self.struct_0x98e0d697),
+            0x57de635e: LazyBound(self.struct_0x57de635e),
+            0xe7e75f97: LazyBound(self.struct_0xe7e75f97),
+            0xc0787d6d: LazyBound(self.struct_0xc0787d6d),
+            0x95e3fbef: LazyBound(self.struct_0x95e3fbef),
+            0x76b9f11a: LazyBound(self.struct_0x76b9f11a),
+            0x80e11a7f: LazyBound(self.struct_0x80e11a7f),
+            0x0d999256: LazyBound(self.struct_0x0d999256),
+            0xb5a1ce5a: LazyBound(self.struct_0xb5a1ce5a),
+            0xabe9affe: LazyBound(self.struct_0xabe9affe),
+            0xc516d679: LazyBound(self.struct_0xc516d679),
+            0xc624b16e: LazyBound(self.struct_0xc624b16e),
+            0x96163f56: LazyBound(self.struct_0x96163f56),
+            0x40699cd0: LazyBound(self.struct_0x40699cd0),
+            0xb6aef7b0: LazyBound(self.struct_0xb6aef7b0),
+            0x92a72876: LazyBound(self.struct_0x92a72876),
+            0xb3a07661: LazyBound(self.struct_0xb3a07661),
+            0xcc02aa6d: LazyBound(self.struct_0xcc02aa6d),
+            0xffa00ccc: LazyBound(self.struct_0xffa00ccc),
+            0x8f31b327: LazyBound(self.struct_0x8f31b327),
+            0x6c6274fa: LazyBound(self.struct_0x6c6274fa),
+            0xc83d6aec: LazyBound(self.struct_0xc83d6aec),
+            0xfe77345d: LazyBound(self.struct_0xfe77345d),
+            0x31518e9b: LazyBound(self.struct_0x31518e9b),
+            0x41b3e202: LazyBound(self.struct_0x41b3e202),
+            0x45d5b021: LazyBound(self.struct_0x45d5b021),
+            0xb00c47a2: LazyBound(self.struct_0xb00c47a2),
+            0x4717e8a4: LazyBound(self.struct_0x4717e8a4),
+            0xd8f4f0a7: LazyBound(self.struct_0xd8f4f0a7),
+            0x08557637: LazyBound(self.struct_0x08557637),
+            0x9bb3ef44: LazyBound(self.struct_0x9bb3ef44),
+            0x26077b99: LazyBound(self.struct_0x26077b99),
+            0xacdfcb81: LazyBound(self.struct_0xacdfcb81),
+            0x5cd2501f: LazyBound(self.struct_0x5cd2501f)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xea02c27e, 'payment_charge')
+    def struct_0xea02c27e(self):
+        return (
+            'id' / TString,
+            'provider_charge_id' / TString)
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message_entity of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x76a6d327, 'message_entity_text_url')
+    def struct_0x76a6d327(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul,
+            'url' / TString)
+
+    @constructor(0x6cef8ac7, 'message_entity_bot_command')
+    def struct_0x6cef8ac7(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x64e475c2, 'message_entity_email')
+    def struct_0x64e475c2(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x73924be0, 'message_entity_pre')
+    def struct_0x73924be0(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul,
+            'language' / TString)
+
+    @constructor(0xbb92ba95, 'message_entity_unknown')
+    def struct_0xbb92ba95(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x6ed02538, 'message_entity_url')
+    def struct_0x6ed02538(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x826f8b60, 'message_entity_italic')
+    def struct_0x826f8b60(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0xfa04579d, 'message_entity_mention')
+    def struct_0xfa04579d(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x32ca960f, 'message_entity_spoiler')
+    def struct_0x32ca960f(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x352dca58, 'message_entity_mention_name_layer131')
+    def struct_0x352dca58(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul,
+            'user_id' / Int32ul)
+
+    @constructor(0x208e68c9, 'input_message_entity_mention_name')
+    def struct_0x208e68c9(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul,
+            'user_id' / self.input_user_structures('user_id'))
+
+    @constructor(0x4c4e743f, 'message_entity_cashtag')
+    def struct_0x4c4e743f(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0xbd610bc9, 'message_entity_bold')
+    def struct_0xbd610bc9(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x6f635b0d, 'message_entity_hashtag')
+    def struct_0x6f635b0d(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x28a20571, 'message_entity_code')
+    def struct_0x28a20571(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0xbf0693d4, 'message_entity_strike')
+    def struct_0xbf0693d4(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0xf1ccaaac, 'message_entity_blockquote')
+    def struct_0xf1ccaaac(self):
+        return Struct(
+            'sname' / Computed('message_entity_blockquote'),
+            'signature' / Hex(Const(0xf1ccaaac, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_collapsed=1),
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x020df5d0, 'message_entity_blockquote_layer180')
+    def struct_0x020df5d0(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x9c4e7e8b, 'message_entity_underline')
+    def struct_0x9c4e7e8b(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x761e6af4, 'message_entity_bank_card')
+    def struct_0x761e6af4(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0x9b69e34b, 'message_entity_phone')
+    def struct_0x9b69e34b(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul)
+
+    @constructor(0xdc7b1140, 'message_entity_mention_name')
+    def struct_0xdc7b1140(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul,
+            'user_id' / Int64ul)
+
+    @constructor(0xc8cf05f8, 'message_entity_custom_emoji')
+    def struct_0xc8cf05f8(self):
+        return (
+            'offset' / Int32ul,
+            'length' / Int32ul,
+            'document_id' / Int64ul)
+
+    @structures
+    def message_entity_structures(self, name):
+        tag_map = {
+            0x76a6d327: LazyBound(self.struct_0x76a6d327),
+            0x6cef8ac7: LazyBound(self.struct_0x6cef8ac7),
+            0x64e475c2: LazyBound(self.struct_0x64e475c2),
+            0x73924be0: LazyBound(self.struct_0x73924be0),
+            0xbb92ba95: LazyBound(self.struct_0xbb92ba95),
+            0x6ed02538: LazyBound(self.struct_0x6ed02538),
+            0x826f8b60: LazyBound(self.struct_0x826f8b60),
+            0xfa04579d: LazyBound(self.struct_0xfa04579d),
+            0x32ca960f: LazyBound(self.struct_0x32ca960f),
+            0x352dca58: LazyBound(self.struct_0x352dca58),
+            0x208e68c9: LazyBound(self.struct_0x208e68c9),
+            0x4c4e743f: LazyBound(self.struct_0x4c4e743f),
+            0xbd610bc9: LazyBound(self.struct_0xbd610bc9),
+            0x6f635b0d: LazyBound(self.struct_0x6f635b0d),
+            0x28a20571: LazyBound(self.struct_0x28a20571),
+            0xbf0693d4: LazyBound(self.struct_0xbf0693d4),
+            0xf1ccaaac: LazyBound(self.struct_0xf1ccaaac),
+            0x020df5d0: LazyBound(self.struct_0x020df5d0),
+            0x9c4e7e8b: LazyBound(self.struct_0x9c4e7e8b),
+            0x761e6af4: LazyBound(self.struct_0x761e6af4),
+            0x9b69e34b: LazyBound(self.struct_0x9b69e34b),
+            0xdc7b1140: LazyBound(self.struct_0xdc7b1140),
+            0xc8cf05f8: LazyBound(self.struct_0xc8cf05f8)
+        }
+        return TLUnion(name, tag_map)
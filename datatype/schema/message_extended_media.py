@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message_extended_media of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xad628cc8, 'message_extended_media_preview')
+    def struct_0xad628cc8(self):
+        return Struct(
+            'sname' / Computed('message_extended_media_preview'),
+            'signature' / Hex(Const(0xad628cc8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_w=1,
+                                has_thumb=2,
+                                has_video_duration=4),
+            'w' / If(this.flags.has_w, Int32ul),
+            'h' / If(this.flags.has_w, Int32ul),
+            'thumb' / If(this.flags.has_thumb, self.photo_size_structures('thumb')),
+            'video_duration' / If(this.flags.has_video_duration, Int32ul))
+
+    @constructor(0xee479c64, 'message_extended_media')
+    def struct_0xee479c64(self):
+        return ['media' / self.message_media_structures('media')]
+
+    @structures
+    def message_extended_media_structures(self, name):
+        tag_map = {
+            0xad628cc8: LazyBound(self.struct_0xad628cc8),
+            0xee479c64: LazyBound(self.struct_0xee479c64)
+        }
+        return TLUnion(name, tag_map)
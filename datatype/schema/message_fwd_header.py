@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message_fwd_header of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xc786ddcb, 'message_fwd_header_layer68')
+    def struct_0xc786ddcb(self):
+        return Struct(
+            'sname' / Computed('message_fwd_header_layer68'),
+            'signature' / Hex(Const(0xc786ddcb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_from_user_id=1,
+                                has_from_channel_id=2,
+                                has_channel_post=4),
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'date' / TTimestamp,
+            'from_channel_id' / If(this.flags.has_from_channel_id, Int32ul),
+            'channel_post' / If(this.flags.has_channel_post, Int32ul))
+
+    @constructor(0x353a686b, 'message_fwd_header_layer118')
+    def struct_0x353a686b(self):
+        return Struct(
+            'sname' / Computed('message_fwd_header_layer118'),
+            'signature' / Hex(Const(0x353a686b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_from_user_id=1,
+                                has_from_name=32,
+                                has_from_channel_id=2,
+                                has_channel_post=4,
+                                has_post_author=8,
+                                has_saved_from_peer=16,
+                                has_psa_type=64),
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'from_name' / If(this.flags.has_from_name, TString),
+            'date' / TTimestamp,
+            'from_channel_id' / If(this.flags.has_from_channel_id, Int32ul),
+            'channel_post' / If(this.flags.has_channel_post, Int32ul),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'saved_from_peer' / If(this.flags.has_saved_from_peer, self.peer_structures('saved_from_peer')),
+            'saved_from_msg_id' / If(this.flags.has_saved_from_peer, Int32ul),
+            'psa_type' / If(this.flags.has_psa_type, TString))
+
+    @constructor(0xec338270, 'message_fwd_header_layer112')
+    def struct_0xec338270(self):
+        return Struct(
+            'sname' / Computed('message_fwd_header_layer112'),
+            'signature' / Hex(Const(0xec338270, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_from_user_id=1,
+                                has_from_name=32,
+                                has_from_channel_id=2,
+                                has_channel_post=4,
+                                has_post_author=8,
+                                has_saved_from_peer=16),
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'from_name' / If(this.flags.has_from_name, TString),
+            'date' / TTimestamp,
+            'from_channel_id' / If(this.flags.has_from_channel_id, Int32ul),
+            'channel_post' / If(this.flags.has_channel_post, Int32ul),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'saved_from_peer' / If(this.flags.has_saved_from_peer, self.peer_structures('saved_from_peer')),
+            'saved_from_msg_id' / If(this.flags.has_saved_from_peer, Int32ul))
+
+    @constructor(0xfadff4ac, 'message_fwd_header_layer72')
+    def struct_0xfadff4ac(self):
+        return Struct(
+            'sname' / Computed('message_fwd_header_layer72'),
+            'signature' / Hex(Const(0xfadff4ac, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_from_user_id=1,
+                                has_from_channel_id=2,
+                                has_channel_post=4,
+                                has_post_author=8),
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'date' / TTimestamp,
+            'from_channel_id' / If(this.flags.has_from_channel_id, Int32ul),
+            'channel_post' / If(this.flags.has_channel_post, Int32ul),
+            'post_author' / If(this.flags.has_post_author, TString))
+
+    @constructor(0x4e4df4bb, 'message_fwd_header')
+    def struct_0x4e4df4bb(self):
+        return Struct(
+            'sname' / Computed('message_fwd_header'),
+            'signature' / Hex(Const(0x4e4df4bb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_imported=128,
+                                is_saved_out=2048,
+                                has_from_id=1,
+                                has_from_name=32,
+                                has_channel_post=4,
+                                has_post_author=8,
+                                has_saved_from_peer=16,
+                                has_saved_from_id=256,
+                                has_saved_from_name=512,
+                                has_saved_date=1024,
+                                has_psa_type=64),
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'from_name' / If(this.flags.has_from_name, TString),
+            'date' / TTimestamp,
+            'channel_post' / If(this.flags.has_channel_post, Int32ul),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'saved_from_peer' / If(this.flags.has_saved_from_peer, self.peer_structures('saved_from_peer')),
+            'saved_from_msg_id' / If(this.flags.has_saved_from_peer, Int32ul),
+            'saved_from_id' / If(this.flags.has_saved_from_id, self.peer_structures('saved_from_id')),
+            'saved_from_name' / If(this.flags.has_saved_from_name, TString),
+            'saved_date' / If(this.flags.has_saved_date, TTimestamp),
+            'psa_type' / If(this.flags.has_psa_type, TString))
+
+    @constructor(0x5f777dce, 'message_fwd_header_layer169')
+    def struct_0x5f777dce(self):
+        return Struct(
+            'sname' / Computed('message_fwd_header_layer169'),
+            'signature' / Hex(Const(0x5f777dce, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_imported=128,
+                                has_from_id=1,
+                                has_from_name=32,
+                                has_channel_post=4,
+                                has_post_author=8,
+                                has_saved_from_peer=16,
+                                has_psa_type=64),
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'from_name' / If(this.flags.has_from_name, TString),
+            'date' / TTimestamp,
+            'channel_post' / If(this.flags.has_channel_post, Int32ul),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'saved_from_peer' / If(this.flags.has_saved_from_peer, self.peer_structures('saved_from_peer')),
+            'saved_from_msg_id' / If(this.flags.has_saved_from_peer, Int32ul),
+            'psa_type' / If(this.flags.has_psa_type, TString))
+
+    @constructor(0x559ebe6d, 'message_fwd_header_layer96')
+    def struct_0x559ebe6d(self):
+        return Struct(
+            'sname' / Computed('message_fwd_header_layer96'),
+            'signature' / Hex(Const(0x559ebe6d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_from_user_id=1,
+                                has_from_channel_id=2,
+                                has_channel_post=4,
+                                has_post_author=8,
+                                has_saved_from_peer=16),
+            'from_user_id' / If(this.flags.has_from_user_id, Int32ul),
+            'date' / TTimestamp,
+            'from_channel_id' / If(this.flags.has_from_channel_id, Int32ul),
+            'channel_post' / If(this.flags.has_channel_post, Int32ul),
+            'post_author' / If(this.flags.has_post_author, TString),
+            'saved_from_peer' / If(this.flags.has_saved_from_peer, self.peer_structures('saved_from_peer')),
+            'saved_from_msg_id' / If(this.flags.has_saved_from_peer, Int32ul))
+
+    @structures
+    def message_fwd_header_structures(self, name):
+        tag_map = {
+            0xc786ddcb: LazyBound(self.struct_0xc786ddcb),
+            0x353a686b: LazyBound(self.struct_0x353a686b),
+            0xec338270: LazyBound(self.struct_0xec338270),
+            0xfadff4ac: LazyBound(self.struct_0xfadff4ac),
+            0x4e4df4bb: LazyBound(self.struct_0x4e4df4bb),
+            0x5f777dce: LazyBound(self.struct_0x5f777dce),
+            0x559ebe6d: LazyBound(self.struct_0x559ebe6d)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,536 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message_media of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x29632a36, 'message_media_unsupported_old')
+    def struct_0x29632a36(self):
+        return ['bytes' / TBytes]
+
+    @constructor(0xc6b68300, 'message_media_audio_layer45')
+    def struct_0xc6b68300(self):
+        return ['audio_unused' / self.audio_structures('audio_unused')]
+
+    @constructor(0xc8c45a2a, 'message_media_photo_old')
+    def struct_0xc8c45a2a(self):
+        return ['photo' / self.photo_structures('photo')]
+
+    @constructor(0x84551347, 'message_media_invoice_layer145')
+    def struct_0x84551347(self):
+        return Struct(
+            'sname' / Computed('message_media_invoice_layer145'),
+            'signature' / Hex(Const(0x84551347, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_shipping_address_requested=2,
+                                is_test=8,
+                                has_photo=1,
+                                has_receipt_msg_id=4),
+            'title' / TString,
+            'description' / TString,
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'receipt_msg_id' / If(this.flags.has_receipt_msg_id, Int32ul),
+            'currency' / TString,
+            'total_amount' / Int64ul,
+            'start_param' / TString)
+
+    @constructor(0xf6a548d3, 'message_media_invoice')
+    def struct_0xf6a548d3(self):
+        return Struct(
+            'sname' / Computed('message_media_invoice'),
+            'signature' / Hex(Const(0xf6a548d3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_shipping_address_requested=2,
+                                is_test=8,
+                                has_web_photo=1,
+                                has_receipt_msg_id=4,
+                                has_extended_media=16),
+            'title' / TString,
+            'description' / TString,
+            'web_photo' / If(this.flags.has_web_photo, self.web_document_structures('web_photo')),
+            'receipt_msg_id' / If(this.flags.has_receipt_msg_id, Int32ul),
+            'currency' / TString,
+            'total_amount' / Int64ul,
+            'start_param' / TString,
+            'extended_media' / If(this.flags.has_extended_media, self.message_extended_media_structures('extended_media')))
+
+    @constructor(0x9f84f49e, 'message_media_unsupported')
+    def struct_0x9f84f49e(self):
+        return []
+
+    @constructor(0x3ded6320, 'message_media_empty')
+    def struct_0x3ded6320(self):
+        return []
+
+    @constructor(0x68cb6283, 'message_media_story')
+    def struct_0x68cb6283(self):
+        return Struct(
+            'sname' / Computed('message_media_story'),
+            'signature' / Hex(Const(0x68cb6283, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_via_mention=2,
+                                has_story_item=1),
+            'peer' / self.peer_structures('peer'),
+            'id' / Int32ul,
+            'story_item' / If(this.flags.has_story_item, self.story_item_structures('story_item')))
+
+    @constructor(0xcbb20d88, 'message_media_story_layer162')
+    def struct_0xcbb20d88(self):
+        return Struct(
+            'sname' / Computed('message_media_story_layer162'),
+            'signature' / Hex(Const(0xcbb20d88, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_story_item=1,
+                                is_via_mention=2),
+            'peer_user_id' / Int64ul,
+            'id' / Int32ul,
+            'story_item' / If(this.flags.has_story_item, self.story_item_structures('story_item')))
+
+    @constructor(0xc79aee1d, 'message_media_story_full')
+    def struct_0xc79aee1d(self):
+        '''custom'''
+        return (
+            'user_id' / Int64ul,
+            'id' / Int32ul,
+            'story_item' / self.story_item_structures('story_item'),
+            'via_mention' / TBool)
+
+    @constructor(0xc79aee1f, 'message_media_story_full_old')
+    def struct_0xc79aee1f(self):
+        '''custom'''
+        return (
+            'user_id' / Int64ul,
+            'id' / Int32ul,
+            'story_item' / self.story_item_structures('story_item'))
+
+    @constructor(0x7912b71f, 'message_media_venue_layer71')
+    def struct_0x7912b71f(self):
+        return (
+            'geo' / self.geo_point_structures('geo'),
+            'title' / TString,
+            'address' / TString,
+            'provider' / TString,
+            'venue_id' / TString)
+
+    @constructor(0xb940c666, 'message_media_geo_live')
+    def struct_0xb940c666(self):
+        return Struct(
+            'sname' / Computed('message_media_geo_live'),
+            'signature' / Hex(Const(0xb940c666, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_heading=1,
+                                has_proximity_notification_radius=2),
+            'geo' / self.geo_point_structures('geo'),
+            'heading' / If(this.flags.has_heading, Int32ul),
+            'period' / Int32ul,
+            'proximity_notification_radius' / If(this.flags.has_proximity_notification_radius, Int32ul))
+
+    @constructor(0x7c3c2609, 'message_media_geo_live_layer119')
+    def struct_0x7c3c2609(self):
+        return (
+            'geo' / self.geo_point_structures('geo'),
+            'period' / Int32ul)
+
+    @constructor(0x2ec0533f, 'message_media_venue')
+    def struct_0x2ec0533f(self):
+        return (
+            'geo' / self.geo_point_structures('geo'),
+            'title' / TString,
+            'address' / TString,
+            'provider' / TString,
+            'venue_id' / TString,
+            'venue_type' / TString)
+
+    @constructor(0xa2d24290, 'message_media_video_old')
+    def struct_0xa2d24290(self):
+        return ['video_unused' / self.video_structures('video_unused')]
+
+    @constructor(0x2fda2204, 'message_media_document_old')
+    def struct_0x2fda2204(self):
+        return ['document' / self.document_structures('document')]
+
+    @constructor(0xf3e02ea8, 'message_media_document_layer68')
+    def struct_0xf3e02ea8(self):
+        return (
+            'document' / self.document_structures('document'),
+            'caption_legacy' / TString)
+
+    @constructor(0xfdb19008, 'message_media_game')
+    def struct_0xfdb19008(self):
+        return ['game' / self.struct_0xbdf9653b()]
+
+    @constructor(0x7c4414d3, 'message_media_document_layer74')
+    def struct_0x7c4414d3(self):
+        return Struct(
+            'sname' / Computed('message_media_document_layer74'),
+            'signature' / Hex(Const(0x7c4414d3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_document=1,
+                                has_caption_legacy=2,
+                                has_ttl_seconds=4),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'caption_legacy' / If(this.flags.has_caption_legacy, TString),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0x5e7d2f39, 'message_media_contact_layer81')
+    def struct_0x5e7d2f39(self):
+        return (
+            'phone_number' / TString,
+            'first_name' / TString,
+            'last_name' / TString,
+            'user_id' / Int32ul)
+
+    @constructor(0x695150d7, 'message_media_photo')
+    def struct_0x695150d7(self):
+        return Struct(
+            'sname' / Computed('message_media_photo'),
+            'signature' / Hex(Const(0x695150d7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_spoiler=8,
+                                has_photo=1,
+                                has_ttl_seconds=4),
+            'photo' / If(this.flags.has_photo, self.photo_structures('photo')),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0x4bd6e798, 'message_media_poll')
+    def struct_0x4bd6e798(self):
+        return (
+            'poll' / self.poll_structures('poll'),
+            'results' / self.poll_results_structures('results'))
+
+    @constructor(0xceaa3ea1, 'message_media_giveaway_results')
+    def struct_0xceaa3ea1(self):
+        return Struct(
+            'sname' / Computed('message_media_giveaway_results'),
+            'signature' / Hex(Const(0xceaa3ea1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_only_new_subscribers=1,
+                                is_refunded=4,
+                                has_additional_peers_count=8,
+                                has_months=16,
+                                has_stars=32,
+                                has_prize_description=2),
+            'channel_id' / Int64ul,
+            'additional_peers_count' / If(this.flags.has_additional_peers_count, Int32ul),
+            'launch_msg_id' / Int32ul,
+            'winners_count' / Int32ul,
+            'unclaimed_count' / Int32ul,
+            'winners' / self.vector(Int64ul, 'winners'),
+            'months' / If(this.flags.has_months, Int32ul),
+            'stars' / If(this.flags.has_stars, Int64ul),
+            'prize_description' / If(this.flags.has_prize_description, TString),
+            'until_date' / TTimestamp)
+
+    @constructor(0xc6991068, 'message_media_giveaway_results_layer186')
+    def struct_0xc6991068(self):
+        return Struct(
+            'sname' / Computed('message_media_giveaway_results_layer186'),
+            'signature' / Hex(Const(0xc6991068, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_only_new_subscribers=1,
+                                is_refunded=4,
+                                has_additional_peers_count=8,
+                                has_prize_description=2),
+            'channel_id' / Int64ul,
+            'additional_peers_count' / If(this.flags.has_additional_peers_count, Int32ul),
+            'launch_msg_id' / Int32ul,
+            'winners_count' / Int32ul,
+            'unclaimed_count' / Int32ul,
+            'winners' / self.vector(Int64ul, 'winners'),
+            'months' / Int32ul,
+            'prize_description' / If(this.flags.has_prize_description, TString),
+            'until_date' / TTimestamp)
+
+    @constructor(0xaa073beb, 'message_media_giveaway')
+    def struct_0xaa073beb(self):
+        return Struct(
+            'sname' / Computed('message_media_giveaway'),
+            'signature' / Hex(Const(0xaa073beb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_only_new_subscribers=1,
+                                is_winners_are_visible=4,
+                                has_countries_iso2=2,
+                                has_prize_description=8,
+                                has_months=16,
+                                has_stars=32),
+            'channels' / self.vector(Int64ul, 'channels'),
+            'countries_iso2' / If(this.flags.has_countries_iso2, self.vector(TString, 'countries_iso2')),
+            'prize_description' / If(this.flags.has_prize_description, TString),
+            'quantity' / Int32ul,
+            'months' / If(this.flags.has_months, Int32ul),
+            'stars' / If(this.flags.has_stars, Int64ul),
+            'until_date' / TTimestamp)
+
+    @constructor(0xdaad85b0, 'message_media_giveaway_layer186')
+    def struct_0xdaad85b0(self):
+        return Struct(
+            'sname' / Computed('message_media_giveaway_layer186'),
+            'signature' / Hex(Const(0xdaad85b0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_only_new_subscribers=1,
+                                is_winners_are_visible=4,
+                                has_countries_iso2=2,
+                                has_prize_description=8),
+            'channels' / self.vector(Int64ul, 'channels'),
+            'countries_iso2' / If(this.flags.has_countries_iso2, self.vector(TString, 'countries_iso2')),
+            'prize_description' / If(this.flags.has_prize_description, TString),
+            'quantity' / Int32ul,
+            'months' / Int32ul,
+            'until_date' / TTimestamp)
+
+    @constructor(0x58260664, 'message_media_giveaway_layer167')
+    def struct_0x58260664(self):
+        return Struct(
+            'sname' / Computed('message_media_giveaway_layer167'),
+            'signature' / Hex(Const(0x58260664, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_only_new_subscribers=1,
+                                has_countries_iso2=2),
+            'channels' / self.vector(Int64ul, 'channels'),
+            'countries_iso2' / If(this.flags.has_countries_iso2, self.vector(TString, 'countries_iso2')),
+            'quantity' / Int32ul,
+            'months' / Int32ul,
+            'until_date' / TTimestamp)
+
+    @constructor(0xa8852491, 'message_media_paid_media')
+    def struct_0xa8852491(self):
+        return (
+            'stars_amount' / Int64ul,
+            'extended_media' / self.vector(self.message_extended_media_structures('extended_media'), 'extended_media'))
+
+    @constructor(0xb5223b0f, 'message_media_photo_layer74')
+    def struct_0xb5223b0f(self):
+        return Struct(
+            'sname' / Computed('message_media_photo_layer74'),
+            'signature' / Hex(Const(0xb5223b0f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_photo=1,
+                                has_caption_legacy=2,
+                                has_ttl_seconds=4),
+            'photo' / If(this.flags.has_photo, self.photo_structures('photo')),
+            'caption_legacy' / If(this.flags.has_caption_legacy, TString),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0x3d8ce53d, 'message_media_photo_layer68')
+    def struct_0x3d8ce53d(self):
+        return (
+            'photo' / self.photo_structures('photo'),
+            'caption_legacy' / TString)
+
+    @constructor(0x5bcf1675, 'message_media_video_layer45')
+    def struct_0x5bcf1675(self):
+        return (
+            'video_unused' / self.video_structures('video_unused'),
+            'caption_legacy' / TString)
+
+    @constructor(0x3f7ee58b, 'message_media_dice')
+    def struct_0x3f7ee58b(self):
+        return (
+            'value' / Int32ul,
+            'emoticon' / TString)
+
+    @constructor(0x638fe46b, 'message_media_dice_layer111')
+    def struct_0x638fe46b(self):
+        return ['value' / Int32ul]
+
+    @constructor(0x56e0d474, 'message_media_geo')
+    def struct_0x56e0d474(self):
+        return ['geo' / self.geo_point_structures('geo')]
+
+    @constructor(0xa32dd600, 'message_media_web_page_layer165')
+    def struct_0xa32dd600(self):
+        return ['webpage' / self.web_page_structures('webpage')]
+
+    @constructor(0xddf10c3b, 'message_media_web_page')
+    def struct_0xddf10c3b(self):
+        return Struct(
+            'sname' / Computed('message_media_web_page'),
+            'signature' / Hex(Const(0xddf10c3b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_force_large_media=1,
+                                is_force_small_media=2,
+                                is_manual=8,
+                                is_safe=16),
+            'webpage' / self.web_page_structures('webpage'))
+
+    @constructor(0x52d8ccd9, 'message_media_document')
+    def struct_0x52d8ccd9(self):
+        return Struct(
+            'sname' / Computed('message_media_document'),
+            'signature' / Hex(Const(0x52d8ccd9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_nopremium=8,
+                                is_spoiler=16,
+                                is_video=64,
+                                is_round=128,
+                                is_voice=256,
+                                has_document=1,
+                                has_alt_documents=32,
+                                has_video_cover=512,
+                                has_video_timestamp=1024,
+                                has_ttl_seconds=4),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'alt_documents' / If(this.flags.has_alt_documents, self.vector(self.document_structures('alt_documents'), 'alt_documents')),
+            'video_cover' / If(this.flags.has_video_cover, self.photo_structures('video_cover')),
+            'video_timestamp' / If(this.flags.has_video_timestamp, Int32ul),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0xdbbdf614, 'message_media_document_layer197_2')
+    def struct_0xdbbdf614(self):
+        return Struct(
+            'sname' / Computed('message_media_document_layer197_2'),
+            'signature' / Hex(Const(0xdbbdf614, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_nopremium=8,
+                                is_spoiler=16,
+                                is_video=64,
+                                is_round=128,
+                                is_voice=256,
+                                has_document=1,
+                                has_alt_documents=32,
+                                has_video_cover=512,
+                                has_ttl_seconds=4),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'alt_documents' / If(this.flags.has_alt_documents, self.vector(self.document_structures('alt_documents'), 'alt_documents')),
+            'video_cover' / If(this.flags.has_video_cover, self.photo_structures('video_cover')),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0xdd570bd5, 'message_media_document_layer197')
+    def struct_0xdd570bd5(self):
+        return Struct(
+            'sname' / Computed('message_media_document_layer197'),
+            'signature' / Hex(Const(0xdd570bd5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_nopremium=8,
+                                is_spoiler=16,
+                                is_video=64,
+                                is_round=128,
+                                is_voice=256,
+                                has_document=1,
+                                has_alt_documents=32,
+                                has_ttl_seconds=4),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'alt_documents' / If(this.flags.has_alt_documents, self.vector(self.document_structures('alt_documents'), 'alt_documents')),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0x4cf4d72d, 'message_media_document_layer187')
+    def struct_0x4cf4d72d(self):
+        return Struct(
+            'sname' / Computed('message_media_document_layer187'),
+            'signature' / Hex(Const(0x4cf4d72d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_nopremium=8,
+                                is_spoiler=16,
+                                is_video=64,
+                                is_round=128,
+                                is_voice=256,
+                                has_document=1,
+                                has_alt_document=32,
+                                has_ttl_seconds=4),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'alt_document' / If(this.flags.has_alt_document, self.document_structures('alt_document')),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0x9cb070d7, 'message_media_document_layer159')
+    def struct_0x9cb070d7(self):
+        return Struct(
+            'sname' / Computed('message_media_document_layer159'),
+            'signature' / Hex(Const(0x9cb070d7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_nopremium=8,
+                                is_spoiler=16,
+                                has_document=1,
+                                has_ttl_seconds=4),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'ttl_seconds' / If(this.flags.has_ttl_seconds, Int32ul))
+
+    @constructor(0xcbf24940, 'message_media_contact_layer131')
+    def struct_0xcbf24940(self):
+        return (
+            'phone_number' / TString,
+            'first_name' / TString,
+            'last_name' / TString,
+            'vcard' / TString,
+            'user_id' / Int32ul)
+
+    @constructor(0x70322949, 'message_media_contact')
+    def struct_0x70322949(self):
+        return (
+            'phone_number' / TString,
+            'first_name' / TString,
+            'last_name' / TString,
+            'vcard' / TString,
+            'user_id' / Int64ul)
+
+    @structures
+    def message_media_structures(self, name):
+        tag_map = {
+            0x29632a36: LazyBound(self.struct_0x29632a36),
+            0xc6b68300: LazyBound(self.struct_0xc6b68300),
+            0xc8c45a2a: LazyBound(self.struct_0xc8c45a2a),
+            0x84551347: LazyBound(self.struct_0x84551347),
+            0xf6a548d3: LazyBound(self.struct_0xf6a548d3),
+            0x9f84f49e: LazyBound(self.struct_0x9f84f49e),
+            0x3ded6320: LazyBound(self.struct_0x3ded6320),
+            0x68cb6283: LazyBound(self.struct_0x68cb6283),
+            0xcbb20d88: LazyBound(self.struct_0xcbb20d88),
+            0xc79aee1d: LazyBound(self.struct_0xc79aee1d),
+            0xc79aee1f: LazyBound(self.struct_0xc79aee1f),
+            0x7912b71f: LazyBound(self.struct_0x7912b71f),
+            0xb940c666: LazyBound(self.struct_0xb940c666),
+            0x7c3c2609: LazyBound(self.struct_0x7c3c2609),
+            0x2ec0533f: LazyBound(self.struct_0x2ec0533f),
+            0xa2d24290: LazyBound(self.struct_0xa2d24290),
+            0x2fda2204: LazyBound(self.struct_0x2fda2204),
+            0xf3e02ea8: LazyBound(self.struct_0xf3e02ea8),
+            0xfdb19008: LazyBound(self.struct_0xfdb19008),
+            0x7c4414d3: LazyBound(self.struct_0x7c4414d3),
+            0x5e7d2f39: LazyBound(self.struct_0x5e7d2f39),
+            0x695150d7: LazyBound(self.struct_0x695150d7),
+            0x4bd6e798: LazyBound(self.struct_0x4bd6e798),
+            0xceaa3ea1: LazyBound(self.struct_0xceaa3ea1),
+            0xc6991068: LazyBound(self.struct_0xc6991068),
+            0xaa073beb: LazyBound(self.struct_0xaa073beb),
+            0xdaad85b0: LazyBound(self.struct_0xdaad85b0),
+            0x58260664: LazyBound(self.struct_0x58260664),
+            0xa8852491: LazyBound(self.struct_0xa8852491),
+            0xb5223b0f: LazyBound(self.struct_0xb5223b0f),
+            0x3d8ce53d: LazyBound(self.struct_0x3d8ce53d),
+            0x5bcf1675: LazyBound(self.struct_0x5bcf1675),
+            0x3f7ee58b: LazyBound(self.struct_0x3f7ee58b),
+            0x638fe46b: LazyBound(self.struct_0x638fe46b),
+            0x56e0d474: LazyBound(self.struct_0x56e0d474),
+            0xa32dd600: LazyBound(self.struct_0xa32dd600),
+            0xddf10c3b: LazyBound(self.struct_0xddf10c3b),
+            0x52d8ccd9: LazyBound(self.struct_0x52d8ccd9),
+            0xdbbdf614: LazyBound(self.struct_0xdbbdf614),
+            0xdd570bd5: LazyBound(self.struct_0xdd570bd5),
+            0x4cf4d72d: LazyBound(self.struct_0x4cf4d72d),
+            0x9cb070d7: LazyBound(self.struct_0x9cb070d7),
+            0xcbf24940: LazyBound(self.struct_0xcbf24940),
+            0x70322949: LazyBound(self.struct_0x70322949)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xbdf9653b, 'game')
+    def struct_0xbdf9653b(self):
+        return Struct(
+            'sname' / Computed('game'),
+            'signature' / Hex(Const(0xbdf9653b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_document=1),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'short_name' / TString,
+            'title' / TString,
+            'description' / TString,
+            'photo' / self.photo_structures('photo'),
+            'document' / If(this.flags.has_document, self.document_structures('document')))
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message_peer_reaction of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x8c79b63c, 'message_peer_reaction')
+    def struct_0x8c79b63c(self):
+        return Struct(
+            'sname' / Computed('message_peer_reaction'),
+            'signature' / Hex(Const(0x8c79b63c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_big=1,
+                                is_unread=2),
+            'peer_id' / self.peer_structures('peer_id'),
+            'date' / TTimestamp,
+            'reaction' / self.reaction_structures('reaction'))
+
+    @constructor(0xb156fe9c, 'message_peer_reaction_layer154')
+    def struct_0xb156fe9c(self):
+        return Struct(
+            'sname' / Computed('message_peer_reaction_layer154'),
+            'signature' / Hex(Const(0xb156fe9c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_big=1,
+                                is_unread=2),
+            'peer_id' / self.peer_structures('peer_id'),
+            'reaction' / self.reaction_structures('reaction'))
+
+    @constructor(0x51b67eff, 'message_peer_reaction_layer144')
+    def struct_0x51b67eff(self):
+        return Struct(
+            'sname' / Computed('message_peer_reaction_layer144'),
+            'signature' / Hex(Const(0x51b67eff, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_big=1,
+                                is_unread=2),
+            'peer_id' / self.peer_structures('peer_id'),
+            'reaction' / TString)
+
+    @constructor(0x932844fa, 'message_peer_reaction_layer137')
+    def struct_0x932844fa(self):
+        return (
+            'user_id' / Int64ul,
+            'reaction' / TString)
+
+    @structures
+    def message_peer_reaction_structures(self, name):
+        tag_map = {
+            0x8c79b63c: LazyBound(self.struct_0x8c79b63c),
+            0xb156fe9c: LazyBound(self.struct_0xb156fe9c),
+            0x51b67eff: LazyBound(self.struct_0x51b67eff),
+            0x932844fa: LazyBound(self.struct_0x932844fa)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message_peer_vote of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x4628f6e6, 'message_peer_vote_multiple')
+    def struct_0x4628f6e6(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'options' / self.vector(TBytes, 'options'),
+            'date' / TTimestamp)
+
+    @constructor(0xb6cc2d5c, 'message_peer_vote')
+    def struct_0xb6cc2d5c(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'option' / TBytes,
+            'date' / TTimestamp)
+
+    @constructor(0x74cda504, 'message_peer_vote_input_option')
+    def struct_0x74cda504(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'date' / TTimestamp)
+
+    @structures
+    def message_peer_vote_structures(self, name):
+        tag_map = {
+            0x4628f6e6: LazyBound(self.struct_0x4628f6e6),
+            0xb6cc2d5c: LazyBound(self.struct_0xb6cc2d5c),
+            0x74cda504: LazyBound(self.struct_0x74cda504)
+        }
+        return TLUnion(name, tag_map)
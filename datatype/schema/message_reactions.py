@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message_reactions of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x087b6e36, 'message_reactions_old')
+    def struct_0x087b6e36(self):
+        return Struct(
+            'sname' / Computed('message_reactions_old'),
+            'signature' / Hex(Const(0x087b6e36, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_min=1,
+                                is_can_see_list=4,
+                                has_recent_reactions=2),
+            'results' / self.vector(self.reaction_count_structures('results'), 'results'),
+            'recent_reactions' / If(this.flags.has_recent_reactions, self.vector(self.message_peer_reaction_structures('recent_reactions'), 'recent_reactions')))
+
+    @constructor(0x0a339f0b, 'message_reactions')
+    def struct_0x0a339f0b(self):
+        return Struct(
+            'sname' / Computed('message_reactions'),
+            'signature' / Hex(Const(0x0a339f0b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_min=1,
+                                is_can_see_list=4,
+                                is_reactions_as_tags=8,
+                                has_recent_reactions=2,
+                                has_top_reactors=16),
+            'results' / self.vector(self.reaction_count_structures('results'), 'results'),
+            'recent_reactions' / If(this.flags.has_recent_reactions, self.vector(self.message_peer_reaction_structures('recent_reactions'), 'recent_reactions')),
+            'top_reactors' / If(this.flags.has_top_reactors, self.vector(self.message_reactor_structures('top_reactors'), 'top_reactors')))
+
+    @constructor(0x4f2b9479, 'message_reactions_layer185')
+    def struct_0x4f2b9479(self):
+        return Struct(
+            'sname' / Computed('message_reactions_layer185'),
+            'signature' / Hex(Const(0x4f2b9479, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_min=1,
+                                is_can_see_list=4,
+                                is_reactions_as_tags=8,
+                                has_recent_reactions=2),
+            'results' / self.vector(self.reaction_count_structures('results'), 'results'),
+            'recent_reactions' / If(this.flags.has_recent_reactions, self.vector(self.message_peer_reaction_structures('recent_reactions'), 'recent_reactions')))
+
+    @constructor(0xb87a24d1, 'message_reactions_layer137')
+    def struct_0xb87a24d1(self):
+        return Struct(
+            'sname' / Computed('message_reactions_layer137'),
+            'signature' / Hex(Const(0xb87a24d1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_min=1),
+            'results' / self.vector(self.reaction_count_structures('results'), 'results'))
+
+    @structures
+    def message_reactions_structures(self, name):
+        tag_map = {
+            0x087b6e36: LazyBound(self.struct_0x087b6e36),
+            0x0a339f0b: LazyBound(self.struct_0x0a339f0b),
+            0x4f2b9479: LazyBound(self.struct_0x4f2b9479),
+            0xb87a24d1: LazyBound(self.struct_0xb87a24d1)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message_reactor of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x4ba3a95a, 'message_reactor')
+    def struct_0x4ba3a95a(self):
+        return Struct(
+            'sname' / Computed('message_reactor'),
+            'signature' / Hex(Const(0x4ba3a95a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_top=1,
+                                is_my=2,
+                                is_anonymous=4,
+                                has_peer_id=8),
+            'peer_id' / If(this.flags.has_peer_id, self.peer_structures('peer_id')),
+            'count' / Int32ul)
+
+    @constructor(0xef00d448, 'message_reactor_old')
+    def struct_0xef00d448(self):
+        return Struct(
+            'sname' / Computed('message_reactor_old'),
+            'signature' / Hex(Const(0xef00d448, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_top=1,
+                                is_my=2),
+            'peer_id' / self.peer_structures('peer_id'),
+            'count' / Int32ul)
+
+    @structures
+    def message_reactor_structures(self, name):
+        tag_map = {
+            0x4ba3a95a: LazyBound(self.struct_0x4ba3a95a),
+            0xef00d448: LazyBound(self.struct_0xef00d448)
+        }
+        return TLUnion(name, tag_map)
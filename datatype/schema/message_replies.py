@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message_replies of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x4128faac, 'message_replies_layer131')
+    def struct_0x4128faac(self):
+        return Struct(
+            'sname' / Computed('message_replies_layer131'),
+            'signature' / Hex(Const(0x4128faac, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_comments=1,
+                                has_recent_repliers=2,
+                                has_max_id=4,
+                                has_read_max_id=8),
+            'replies' / Int32ul,
+            'replies_pts' / Int32ul,
+            'recent_repliers' / If(this.flags.has_recent_repliers, self.vector(self.peer_structures('recent_repliers'), 'recent_repliers')),
+            'channel_id' / If(this.flags.is_comments, Int32ul),
+            'max_id' / If(this.flags.has_max_id, Int32ul),
+            'read_max_id' / If(this.flags.has_read_max_id, Int32ul))
+
+    @constructor(0x83d60fc2, 'message_replies')
+    def struct_0x83d60fc2(self):
+        return Struct(
+            'sname' / Computed('message_replies'),
+            'signature' / Hex(Const(0x83d60fc2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_comments=1,
+                                has_recent_repliers=2,
+                                has_max_id=4,
+                                has_read_max_id=8),
+            'replies' / Int32ul,
+            'replies_pts' / Int32ul,
+            'recent_repliers' / If(this.flags.has_recent_repliers, self.vector(self.peer_structures('recent_repliers'), 'recent_repliers')),
+            'channel_id' / If(this.flags.is_comments, Int64ul),
+            'max_id' / If(this.flags.has_max_id, Int32ul),
+            'read_max_id' / If(this.flags.has_read_max_id, Int32ul))
+
+    @structures
+    def message_replies_structures(self, name):
+        tag_map = {
+            0x4128faac: LazyBound(self.struct_0x4128faac),
+            0x83d60fc2: LazyBound(self.struct_0x83d60fc2)
+        }
+        return TLUnion(name, tag_map)
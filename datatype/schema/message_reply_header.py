@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group message_reply_header of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0e5af939, 'message_reply_story_header')
+    def struct_0x0e5af939(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'story_id' / Int32ul)
+
+    @constructor(0x9c98bfc1, 'message_reply_story_header_layer174')
+    def struct_0x9c98bfc1(self):
+        return (
+            'peer_user_id' / Int64ul,
+            'story_id' / Int32ul)
+
+    @constructor(0xafbc09db, 'message_reply_header')
+    def struct_0xafbc09db(self):
+        return Struct(
+            'sname' / Computed('message_reply_header'),
+            'signature' / Hex(Const(0xafbc09db, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_reply_to_scheduled=4,
+                                is_forum_topic=8,
+                                is_quote=512,
+                                has_reply_to_msg_id=16,
+                                has_reply_to_peer_id=1,
+                                has_reply_from=32,
+                                has_reply_media=256,
+                                has_reply_to_top_id=2,
+                                has_quote_text=64,
+                                has_quote_entities=128,
+                                has_quote_offset=1024),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'reply_to_peer_id' / If(this.flags.has_reply_to_peer_id, self.peer_structures('reply_to_peer_id')),
+            'reply_from' / If(this.flags.has_reply_from, self.message_fwd_header_structures('reply_from')),
+            'reply_media' / If(this.flags.has_reply_media, self.message_media_structures('reply_media')),
+            'reply_to_top_id' / If(this.flags.has_reply_to_top_id, Int32ul),
+            'quote_text' / If(this.flags.has_quote_text, TString),
+            'quote_entities' / If(this.flags.has_quote_entities, self.vector(self.message_entity_structures('quote_entities'), 'quote_entities')),
+            'quote_offset' / If(this.flags.has_quote_offset, Int32ul))
+
+    @constructor(0x6eebcabd, 'message_reply_header_layer166')
+    def struct_0x6eebcabd(self):
+        return Struct(
+            'sname' / Computed('message_reply_header_layer166'),
+            'signature' / Hex(Const(0x6eebcabd, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_reply_to_scheduled=4,
+                                is_forum_topic=8,
+                                is_quote=512,
+                                has_reply_to_msg_id=16,
+                                has_reply_to_peer_id=1,
+                                has_reply_from=32,
+                                has_reply_media=256,
+                                has_reply_to_top_id=2,
+                                has_quote_text=64,
+                                has_quote_entities=128),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'reply_to_peer_id' / If(this.flags.has_reply_to_peer_id, self.peer_structures('reply_to_peer_id')),
+            'reply_from' / If(this.flags.has_reply_from, self.message_fwd_header_structures('reply_from')),
+            'reply_media' / If(this.flags.has_reply_media, self.message_media_structures('reply_media')),
+            'reply_to_top_id' / If(this.flags.has_reply_to_top_id, Int32ul),
+            'quote_text' / If(this.flags.has_quote_text, TString),
+            'quote_entities' / If(this.flags.has_quote_entities, self.vector(self.message_entity_structures('quote_entities'), 'quote_entities')))
+
+    @constructor(0x3d5c1693, 'message_reply_header_layer165_2')
+    def struct_0x3d5c1693(self):
+        return Struct(
+            'sname' / Computed('message_reply_header_layer165_2'),
+            'signature' / Hex(Const(0x3d5c1693, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_reply_to_scheduled=4,
+                                is_forum_topic=8,
+                                has_reply_to_msg_id=16,
+                                has_reply_to_peer_id=1,
+                                has_reply_from=32,
+                                has_reply_to_top_id=2,
+                                has_quote_text=64,
+                                has_quote_entities=128),
+            'reply_to_msg_id' / If(this.flags.has_reply_to_msg_id, Int32ul),
+            'reply_to_peer_id' / If(this.flags.has_reply_to_peer_id, self.peer_structures('reply_to_peer_id')),
+            'reply_from' / If(this.flags.has_reply_from, self.message_fwd_header_structures('reply_from')),
+            'reply_to_top_id' / If(this.flags.has_reply_to_top_id, Int32ul),
+            'quote_text' / If(this.flags.has_quote_text, TString),
+            'quote_entities' / If(this.flags.has_quote_entities, self.vector(self.message_entity_structures('quote_entities'), 'quote_entities')))
+
+    @constructor(0xa6d57763, 'message_reply_header_layer165')
+    def struct_0xa6d57763(self):
+        return Struct(
+            'sname' / Computed('message_reply_header_layer165'),
+            'signature' / Hex(Const(0xa6d57763, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_reply_to_scheduled=4,
+                                is_forum_topic=8,
+                                has_reply_to_peer_id=1,
+                                has_reply_to_top_id=2),
+            'reply_to_msg_id' / Int32ul,
+            'reply_to_peer_id' / If(this.flags.has_reply_to_peer_id, self.peer_structures('reply_to_peer_id')),
+            'reply_to_top_id' / If(this.flags.has_reply_to_top_id, Int32ul))
+
+    @structures
+    def message_reply_header_structures(self, name):
+        tag_map = {
+            0x0e5af939: LazyBound(self.struct_0x0e5af939),
+            0x9c98bfc1: LazyBound(self.struct_0x9c98bfc1),
+            0xafbc09db: LazyBound(self.struct_0xafbc09db),
+            0x6eebcabd: LazyBound(self.struct_0x6eebcabd),
+            0x3d5c1693: LazyBound(self.struct_0x3d5c1693),
+            0xa6d57763: LazyBound(self.struct_0xa6d57763)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,2642 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0034a818, 'messages_create_chat')
+    def struct_0x0034a818(self):
+        return Struct(
+            'sname' / Computed('messages_create_chat'),
+            'signature' / Hex(Const(0x0034a818, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_ttl_period=1),
+            'users' / self.vector(self.input_user_structures('users'), 'users'),
+            'title' / TString,
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0x04f1aaa9, 'messages_get_faved_stickers')
+    def struct_0x04f1aaa9(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x05a954c0, 'messages_received_messages')
+    def struct_0x05a954c0(self):
+        return ['max_id' / Int32ul]
+
+    @constructor(0x0c964709, 'messages_send_multi_media')
+    def struct_0x0c964709(self):
+        return Struct(
+            'sname' / Computed('messages_send_multi_media'),
+            'signature' / Hex(Const(0x0c964709, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                is_background=64,
+                                is_clear_draft=128,
+                                is_noforwards=16384,
+                                is_update_stickersets_order=32768,
+                                is_invert_media=65536,
+                                has_reply_to=1,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072),
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'multi_media' / self.vector(self.struct_0x1cc6e91f(), 'multi_media'),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')))
+
+    @constructor(0x0e306d3a, 'messages_read_history')
+    def struct_0x0e306d3a(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'max_id' / Int32ul)
+
+    @constructor(0x0ecf6736, 'messages_get_featured_emoji_stickers')
+    def struct_0x0ecf6736(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x0f093465, 'messages_click_sponsored_message')
+    def struct_0x0f093465(self):
+        return Struct(
+            'sname' / Computed('messages_click_sponsored_message'),
+            'signature' / Hex(Const(0x0f093465, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_media=1,
+                                is_fullscreen=2),
+            'peer' / self.input_peer_structures('peer'),
+            'random_id' / TBytes)
+
+    @constructor(0x0f635e1b, 'messages_get_inline_game_high_scores')
+    def struct_0x0f635e1b(self):
+        return (
+            'id' / self.struct_0x890c3d89(),
+            'user_id' / self.input_user_structures('user_id'))
+
+    @constructor(0x10ea6184, 'messages_send_vote')
+    def struct_0x10ea6184(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'options' / self.vector(TBytes, 'options'))
+
+    @constructor(0x147ee23c, 'messages_search_results_calendar')
+    def struct_0x147ee23c(self):
+        return Struct(
+            'sname' / Computed('messages_search_results_calendar'),
+            'signature' / Hex(Const(0x147ee23c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_inexact=1,
+                                has_offset_id_offset=2),
+            'count' / Int32ul,
+            'min_date' / TTimestamp,
+            'min_msg_id' / Int32ul,
+            'offset_id_offset' / If(this.flags.has_offset_id_offset, Int32ul),
+            'periods' / self.vector(self.struct_0xc9b0539f(), 'periods'),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x1508b6af, 'messages_get_emoji_keywords_difference')
+    def struct_0x1508b6af(self):
+        return (
+            'lang_code' / TString,
+            'from_version' / Int32ul)
+
+    @constructor(0x15ad9f64, 'messages_set_inline_game_score')
+    def struct_0x15ad9f64(self):
+        return Struct(
+            'sname' / Computed('messages_set_inline_game_score'),
+            'signature' / Hex(Const(0x15ad9f64, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_edit_message=1,
+                                is_force=2),
+            'id' / self.struct_0x890c3d89(),
+            'user_id' / self.input_user_structures('user_id'),
+            'score' / Int32ul)
+
+    @constructor(0x1662af0b, 'messages_history_import')
+    def struct_0x1662af0b(self):
+        return ['id' / Int64ul]
+
+    @constructor(0x16fcc2cb, 'messages_get_attach_menu_bots')
+    def struct_0x16fcc2cb(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x18dea0ac, 'messages_get_available_reactions')
+    def struct_0x18dea0ac(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0x198fb446, 'messages_request_url_auth')
+    def struct_0x198fb446(self):
+        return Struct(
+            'sname' / Computed('messages_request_url_auth'),
+            'signature' / Hex(Const(0x198fb446, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_peer=2,
+                                has_url=4),
+            'peer' / If(this.flags.has_peer, self.input_peer_structures('peer')),
+            'msg_id' / If(this.flags.has_peer, Int32ul),
+            'button_id' / If(this.flags.has_peer, Int32ul),
+            'url' / If(this.flags.has_url, TString))
+
+    @constructor(0x1a46500a, 'messages_request_simple_web_view')
+    def struct_0x1a46500a(self):
+        return Struct(
+            'sname' / Computed('messages_request_simple_web_view'),
+            'signature' / Hex(Const(0x1a46500a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_from_switch_webview=2,
+                                is_from_side_menu=4,
+                                has_url=8,
+                                has_start_param=16,
+                                has_theme_params=1),
+            'bot' / self.input_user_structures('bot'),
+            'url' / If(this.flags.has_url, TString),
+            'start_param' / If(this.flags.has_start_param, TString),
+            'theme_params' / If(this.flags.has_theme_params, self.struct_0x7d748d04()),
+            'platform' / TString)
+
+    @constructor(0x1ad4a04a, 'messages_update_dialog_filter')
+    def struct_0x1ad4a04a(self):
+        return Struct(
+            'sname' / Computed('messages_update_dialog_filter'),
+            'signature' / Hex(Const(0x1ad4a04a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_filter=1),
+            'id' / Int32ul,
+            'filter' / If(this.flags.has_filter, self.dialog_filter_structures('filter')))
+
+    @constructor(0x1af3dbb8, 'messages_report_sponsored_message')
+    def struct_0x1af3dbb8(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'random_id' / TBytes,
+            'option' / TBytes)
+
+    @constructor(0x1bbcf300, 'messages_get_search_counters')
+    def struct_0x1bbcf300(self):
+        return Struct(
+            'sname' / Computed('messages_get_search_counters'),
+            'signature' / Hex(Const(0x1bbcf300, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_saved_peer_id=4,
+                                has_top_msg_id=1),
+            'peer' / self.input_peer_structures('peer'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.input_peer_structures('saved_peer_id')),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'filters' / self.vector(self.messages_filter_structures('filters'), 'filters'))
+
+    @constructor(0x1bf89d74, 'messages_send_multi_media')
+    def struct_0x1bf89d74(self):
+        return Struct(
+            'sname' / Computed('messages_send_multi_media'),
+            'signature' / Hex(Const(0x1bf89d74, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                is_background=64,
+                                is_clear_draft=128,
+                                is_noforwards=16384,
+                                is_update_stickersets_order=32768,
+                                is_invert_media=65536,
+                                has_reply_to=1,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072,
+                                has_effect=262144,
+                                has_allow_paid_stars=2097152),
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'multi_media' / self.vector(self.struct_0x1cc6e91f(), 'multi_media'),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')),
+            'effect' / If(this.flags.has_effect, Int64ul),
+            'allow_paid_stars' / If(this.flags.has_allow_paid_stars, Int64ul))
+
+    @constructor(0x1cc6e91f, 'input_single_media')
+    def struct_0x1cc6e91f(self):
+        return Struct(
+            'sname' / Computed('input_single_media'),
+            'signature' / Hex(Const(0x1cc6e91f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_entities=1),
+            'media' / self.input_media_structures('media'),
+            'random_id' / Int64ul,
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')))
+
+    @constructor(0x1dd840f5, 'messages_get_emoji_sticker_groups')
+    def struct_0x1dd840f5(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0x21a548f3, 'messages_get_emoji_profile_photo_groups')
+    def struct_0x21a548f3(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0x22b6c214, 'messages_get_web_view_result')
+    def struct_0x22b6c214(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'bot' / self.input_user_structures('bot'),
+            'query_id' / Int64ul)
+
+    @constructor(0x22ddd30c, 'messages_get_replies')
+    def struct_0x22ddd30c(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'offset_id' / Int32ul,
+            'offset_date' / TTimestamp,
+            'add_offset' / Int32ul,
+            'limit' / Int32ul,
+            'max_id' / Int32ul,
+            'min_id' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0x22e24e22, 'messages_get_dialog_unread_marks')
+    def struct_0x22e24e22(self):
+        return []
+
+    @constructor(0x269dc2c1, 'messages_request_web_view')
+    def struct_0x269dc2c1(self):
+        return Struct(
+            'sname' / Computed('messages_request_web_view'),
+            'signature' / Hex(Const(0x269dc2c1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_from_bot_menu=16,
+                                is_silent=32,
+                                is_compact=128,
+                                is_fullscreen=256,
+                                has_url=2,
+                                has_start_param=8,
+                                has_theme_params=4,
+                                has_reply_to=1,
+                                has_send_as=8192),
+            'peer' / self.input_peer_structures('peer'),
+            'bot' / self.input_user_structures('bot'),
+            'url' / If(this.flags.has_url, TString),
+            'start_param' / If(this.flags.has_start_param, TString),
+            'theme_params' / If(this.flags.has_theme_params, self.struct_0x7d748d04()),
+            'platform' / TString,
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')))
+
+    @constructor(0x269e9a49, 'messages_transcribe_audio')
+    def struct_0x269e9a49(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul)
+
+    @constructor(0x26b5dde6, 'messages_message_edit_data')
+    def struct_0x26b5dde6(self):
+        return Struct(
+            'sname' / Computed('messages_message_edit_data'),
+            'signature' / Hex(Const(0x26b5dde6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_caption=1))
+
+    @constructor(0x26cf8950, 'messages_get_dh_config')
+    def struct_0x26cf8950(self):
+        return (
+            'version' / Int32ul,
+            'random_length' / Int32ul)
+
+    @constructor(0x29b1c66a, 'messages_search_stickers')
+    def struct_0x29b1c66a(self):
+        return Struct(
+            'sname' / Computed('messages_search_stickers'),
+            'signature' / Hex(Const(0x29b1c66a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_emojis=1),
+            'q' / TString,
+            'emoticon' / TString,
+            'lang_code' / self.vector(TString, 'lang_code'),
+            'offset' / Int32ul,
+            'limit' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0x29ee847a, 'messages_search')
+    def struct_0x29ee847a(self):
+        return Struct(
+            'sname' / Computed('messages_search'),
+            'signature' / Hex(Const(0x29ee847a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_from_id=1,
+                                has_saved_peer_id=4,
+                                has_saved_reaction=8,
+                                has_top_msg_id=2),
+            'peer' / self.input_peer_structures('peer'),
+            'q' / TString,
+            'from_id' / If(this.flags.has_from_id, self.input_peer_structures('from_id')),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.input_peer_structures('saved_peer_id')),
+            'saved_reaction' / If(this.flags.has_saved_reaction, self.vector(self.reaction_structures('saved_reaction'), 'saved_reaction')),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'filter' / self.messages_filter_structures('filter'),
+            'min_date' / TTimestamp,
+            'max_date' / TTimestamp,
+            'offset_id' / Int32ul,
+            'add_offset' / Int32ul,
+            'limit' / Int32ul,
+            'max_id' / Int32ul,
+            'min_id' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0x2a862092, 'messages_upload_imported_media')
+    def struct_0x2a862092(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'import_id' / Int64ul,
+            'file_name' / TString,
+            'media' / self.input_media_structures('media'))
+
+    @constructor(0x2ad93719, 'messages_dialog_filters')
+    def struct_0x2ad93719(self):
+        return Struct(
+            'sname' / Computed('messages_dialog_filters'),
+            'signature' / Hex(Const(0x2ad93719, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_tags_enabled=1),
+            'filters' / self.vector(self.dialog_filter_structures('filters'), 'filters'))
+
+    @constructor(0x2c11c0d7, 'messages_search_custom_emoji')
+    def struct_0x2c11c0d7(self):
+        return (
+            'emoticon' / TString,
+            'hash' / Int64ul)
+
+    @constructor(0x2ecd56cd, 'messages_get_emoji_status_groups')
+    def struct_0x2ecd56cd(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0x31bd492d, 'messages_message_reactions_list')
+    def struct_0x31bd492d(self):
+        return Struct(
+            'sname' / Computed('messages_message_reactions_list'),
+            'signature' / Hex(Const(0x31bd492d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'count' / Int32ul,
+            'reactions' / self.vector(self.message_peer_reaction_structures('reactions'), 'reactions'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'next_offset' / If(this.flags.has_next_offset, TString))
+
+    @constructor(0x31c1c44f, 'messages_get_message_read_participants')
+    def struct_0x31c1c44f(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul)
+
+    @constructor(0x3223495b, 'messages_get_unread_reactions')
+    def struct_0x3223495b(self):
+        return Struct(
+            'sname' / Computed('messages_get_unread_reactions'),
+            'signature' / Hex(Const(0x3223495b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_top_msg_id=1),
+            'peer' / self.input_peer_structures('peer'),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'offset_id' / Int32ul,
+            'add_offset' / Int32ul,
+            'limit' / Int32ul,
+            'max_id' / Int32ul,
+            'min_id' / Int32ul)
+
+    @constructor(0x327a30cb, 'messages_save_gif')
+    def struct_0x327a30cb(self):
+        return (
+            'id' / self.input_document_structures('id'),
+            'unsave' / TBool)
+
+    @constructor(0x32d439a4, 'messages_send_encrypted_service')
+    def struct_0x32d439a4(self):
+        return (
+            'peer' / self.struct_0xf141b5e1(),
+            'random_id' / Int64ul,
+            'data' / TBytes)
+
+    @constructor(0x33153ad4, 'messages_send_quick_reply_messages')
+    def struct_0x33153ad4(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'shortcut_id' / Int32ul)
+
+    @constructor(0x3371c354, 'messages_peer_dialogs')
+    def struct_0x3371c354(self):
+        return (
+            'dialogs' / self.vector(self.dialog_structures('dialogs'), 'dialogs'),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'state' / self.struct_0xa56c2a3e())
+
+    @constructor(0x338e2464, 'messages_get_document_by_hash')
+    def struct_0x338e2464(self):
+        return (
+            'sha256' / TBytes,
+            'size' / Int32ul,
+            'mime_type' / TString)
+
+    @constructor(0x33963bf9, 'messages_forward_message')
+    def struct_0x33963bf9(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul,
+            'random_id' / Int64ul)
+
+    @constructor(0x33db32f8, 'messages_translate_result')
+    def struct_0x33db32f8(self):
+        return ['result' / self.vector(self.struct_0x751f3146(), 'result')]
+
+    @constructor(0x34090c3b, 'messages_init_history_import')
+    def struct_0x34090c3b(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'file' / self.input_file_structures('file'),
+            'media_count' / Int32ul)
+
+    @constructor(0x34fdc5c3, 'messages_get_bot_app')
+    def struct_0x34fdc5c3(self):
+        return (
+            'app' / self.input_bot_app_structures('app'),
+            'hash' / Int64ul)
+
+    @constructor(0x35705b8a, 'messages_search_sticker_sets')
+    def struct_0x35705b8a(self):
+        return Struct(
+            'sname' / Computed('messages_search_sticker_sets'),
+            'signature' / Hex(Const(0x35705b8a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_exclude_featured=1),
+            'q' / TString,
+            'hash' / Int64ul)
+
+    @constructor(0x35a0e062, 'messages_get_emoji_keywords')
+    def struct_0x35a0e062(self):
+        return ['lang_code' / TString]
+
+    @constructor(0x35ddd674, 'messages_edit_chat_photo')
+    def struct_0x35ddd674(self):
+        return (
+            'chat_id' / Int64ul,
+            'photo' / self.input_chat_photo_structures('photo'))
+
+    @constructor(0x3637e05b, 'messages_get_saved_reaction_tags')
+    def struct_0x3637e05b(self):
+        return Struct(
+            'sname' / Computed('messages_get_saved_reaction_tags'),
+            'signature' / Hex(Const(0x3637e05b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_peer=1),
+            'peer' / If(this.flags.has_peer, self.input_peer_structures('peer')),
+            'hash' / Int64ul)
+
+    @constructor(0x36585ea4, 'messages_bot_callback_answer')
+    def struct_0x36585ea4(self):
+        return Struct(
+            'sname' / Computed('messages_bot_callback_answer'),
+            'signature' / Hex(Const(0x36585ea4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_alert=2,
+                                has_url=8,
+                                is_native_ui=16,
+                                has_message=1,
+                                is_url=4),
+            'message' / If(this.flags.has_message, TString),
+            'url' / If(this.flags.is_url, TString),
+            'cache_time' / Int32ul)
+
+    @constructor(0x367617d3, 'messages_forum_topics')
+    def struct_0x367617d3(self):
+        return Struct(
+            'sname' / Computed('messages_forum_topics'),
+            'signature' / Hex(Const(0x367617d3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_order_by_create_date=1),
+            'count' / Int32ul,
+            'topics' / self.vector(self.forum_topic_structures('topics'), 'topics'),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'pts' / Int32ul)
+
+    @constructor(0x36a73f77, 'messages_read_message_contents')
+    def struct_0x36a73f77(self):
+        return ['id' / self.vector(Int32ul, 'id')]
+
+    @constructor(0x36e5bf4d, 'messages_read_mentions')
+    def struct_0x36e5bf4d(self):
+        return Struct(
+            'sname' / Computed('messages_read_mentions'),
+            'signature' / Hex(Const(0x36e5bf4d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_top_msg_id=1),
+            'peer' / self.input_peer_structures('peer'),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul))
+
+    @constructor(0x37b74355, 'messages_send_multi_media_layer199')
+    def struct_0x37b74355(self):
+        return Struct(
+            'sname' / Computed('messages_send_multi_media_layer199'),
+            'signature' / Hex(Const(0x37b74355, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                is_background=64,
+                                is_clear_draft=128,
+                                is_noforwards=16384,
+                                is_update_stickersets_order=32768,
+                                is_invert_media=65536,
+                                has_reply_to=1,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072,
+                                has_effect=262144),
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'multi_media' / self.vector(self.struct_0x1cc6e91f(), 'multi_media'),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')),
+            'effect' / If(this.flags.has_effect, Int64ul))
+
+    @constructor(0x3920e6ef, 'messages_get_admins_with_invites')
+    def struct_0x3920e6ef(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x392718f8, 'messages_save_recent_sticker')
+    def struct_0x392718f8(self):
+        return Struct(
+            'sname' / Computed('messages_save_recent_sticker'),
+            'signature' / Hex(Const(0x392718f8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_attached=1),
+            'id' / self.input_document_structures('id'),
+            'unsave' / TBool)
+
+    @constructor(0x39461db2, 'messages_get_recent_reactions')
+    def struct_0x39461db2(self):
+        return (
+            'limit' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0x3b1adf37, 'messages_reorder_pinned_dialogs')
+    def struct_0x3b1adf37(self):
+        return Struct(
+            'sname' / Computed('messages_reorder_pinned_dialogs'),
+            'signature' / Hex(Const(0x3b1adf37, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_force=1),
+            'folder_id' / Int32ul,
+            'order' / self.vector(self.input_dialog_peer_structures('order'), 'order'))
+
+    @constructor(0x3cc04740, 'messages_delete_quick_reply_shortcut')
+    def struct_0x3cc04740(self):
+        return ['shortcut_id' / Int32ul]
+
+    @constructor(0x3d9a414d, 'messages_get_saved_history')
+    def struct_0x3d9a414d(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'offset_id' / Int32ul,
+            'offset_date' / TTimestamp,
+            'add_offset' / Int32ul,
+            'limit' / Int32ul,
+            'max_id' / Int32ul,
+            'min_id' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0x3db8ec63, 'sponsored_web_page')
+    def struct_0x3db8ec63(self):
+        return Struct(
+            'sname' / Computed('sponsored_web_page'),
+            'signature' / Hex(Const(0x3db8ec63, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_photo=1),
+            'url' / TString,
+            'site_name' / TString,
+            'photo' / If(this.flags.has_photo, self.photo_structures('photo')))
+
+    @constructor(0x3dbc0415, 'messages_accept_encryption')
+    def struct_0x3dbc0415(self):
+        return (
+            'peer' / self.struct_0xf141b5e1(),
+            'g_b' / TBytes,
+            'key_fingerprint' / Int64ul)
+
+    @constructor(0x3eadb1bb, 'messages_check_chat_invite')
+    def struct_0x3eadb1bb(self):
+        return ['hash' / TString]
+
+    @constructor(0x3ebee86a, 'messages_send_inline_bot_result_layer199')
+    def struct_0x3ebee86a(self):
+        return Struct(
+            'sname' / Computed('messages_send_inline_bot_result_layer199'),
+            'signature' / Hex(Const(0x3ebee86a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                is_background=64,
+                                is_clear_draft=128,
+                                is_hide_via=2048,
+                                has_reply_to=1,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072),
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'random_id' / Int64ul,
+            'query_id' / Int64ul,
+            'id' / TString,
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')))
+
+    @constructor(0x3f4e0648, 'messages_message_empty')
+    def struct_0x3f4e0648(self):
+        return []
+
+    @constructor(0x413a3e73, 'messages_request_simple_web_view')
+    def struct_0x413a3e73(self):
+        return Struct(
+            'sname' / Computed('messages_request_simple_web_view'),
+            'signature' / Hex(Const(0x413a3e73, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_from_switch_webview=2,
+                                is_from_side_menu=4,
+                                is_compact=128,
+                                is_fullscreen=256,
+                                has_url=8,
+                                has_start_param=16,
+                                has_theme_params=1),
+            'bot' / self.input_user_structures('bot'),
+            'url' / If(this.flags.has_url, TString),
+            'start_param' / If(this.flags.has_start_param, TString),
+            'theme_params' / If(this.flags.has_theme_params, self.struct_0x7d748d04()),
+            'platform' / TString)
+
+    @constructor(0x4222fa74, 'messages_get_messages')
+    def struct_0x4222fa74(self):
+        return ['id' / self.vector(Int32ul, 'id')]
+
+    @constructor(0x435885b5, 'messages_toggle_paid_reaction_privacy')
+    def struct_0x435885b5(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'privacy' / self.stars_paid_reaction_privacy_structures('privacy'))
+
+    @constructor(0x43fe19f3, 'messages_check_history_import')
+    def struct_0x43fe19f3(self):
+        return ['import_head' / TString]
+
+    @constructor(0x4423e6c5, 'messages_get_history')
+    def struct_0x4423e6c5(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'offset_id' / Int32ul,
+            'offset_date' / TTimestamp,
+            'add_offset' / Int32ul,
+            'limit' / Int32ul,
+            'max_id' / Int32ul,
+            'min_id' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0x446972fd, 'messages_get_discussion_message')
+    def struct_0x446972fd(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul)
+
+    @constructor(0x44fa7a15, 'messages_send_encrypted')
+    def struct_0x44fa7a15(self):
+        return Struct(
+            'sname' / Computed('messages_send_encrypted'),
+            'signature' / Hex(Const(0x44fa7a15, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=1),
+            'peer' / self.struct_0xf141b5e1(),
+            'random_id' / Int64ul,
+            'data' / TBytes)
+
+    @constructor(0x455b853d, 'message_views')
+    def struct_0x455b853d(self):
+        return Struct(
+            'sname' / Computed('message_views'),
+            'signature' / Hex(Const(0x455b853d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_views=1,
+                                has_forwards=2,
+                                has_replies=4),
+            'views' / If(this.flags.has_views, Int32ul),
+            'forwards' / If(this.flags.has_forwards, Int32ul),
+            'replies' / If(this.flags.has_replies, self.message_replies_structures('replies')))
+
+    @constructor(0x461b3f48, 'messages_get_message_reactions_list')
+    def struct_0x461b3f48(self):
+        return Struct(
+            'sname' / Computed('messages_get_message_reactions_list'),
+            'signature' / Hex(Const(0x461b3f48, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_reaction=1,
+                                has_offset=2),
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul,
+            'reaction' / If(this.flags.has_reaction, self.reaction_structures('reaction')),
+            'offset' / If(this.flags.has_offset, TString),
+            'limit' / Int32ul)
+
+    @constructor(0x472455aa, 'messages_get_paid_reaction_privacy')
+    def struct_0x472455aa(self):
+        return []
+
+    @constructor(0x4899484e, 'messages_votes_list')
+    def struct_0x4899484e(self):
+        return Struct(
+            'sname' / Computed('messages_votes_list'),
+            'signature' / Hex(Const(0x4899484e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'count' / Int32ul,
+            'votes' / self.vector(self.message_peer_vote_structures('votes'), 'votes'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'next_offset' / If(this.flags.has_next_offset, TString))
+
+    @constructor(0x49e9528f, 'messages_get_chats')
+    def struct_0x49e9528f(self):
+        return ['id' / self.vector(Int64ul, 'id')]
+
+    @constructor(0x4b0c8c0f, 'messages_report_encrypted_spam')
+    def struct_0x4b0c8c0f(self):
+        return ['peer' / self.struct_0xf141b5e1()]
+
+    @constructor(0x4bc6589a, 'messages_search_global')
+    def struct_0x4bc6589a(self):
+        return Struct(
+            'sname' / Computed('messages_search_global'),
+            'signature' / Hex(Const(0x4bc6589a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_broadcasts_only=2,
+                                is_groups_only=4,
+                                is_users_only=8,
+                                has_folder_id=1),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'q' / TString,
+            'filter' / self.messages_filter_structures('filter'),
+            'min_date' / TTimestamp,
+            'max_date' / TTimestamp,
+            'offset_rate' / Int32ul,
+            'offset_peer' / self.input_peer_structures('offset_peer'),
+            'offset_id' / Int32ul,
+            'limit' / Int32ul)
+
+    @constructor(0x4e9963b2, 'messages_get_emoji_keywords_languages')
+    def struct_0x4e9963b2(self):
+        return ['lang_codes' / self.vector(TString, 'lang_codes')]
+
+    @constructor(0x4f47a016, 'messages_set_default_reaction')
+    def struct_0x4f47a016(self):
+        return ['reaction' / self.reaction_structures('reaction')]
+
+    @constructor(0x4facb138, 'messages_hide_peer_settings_bar')
+    def struct_0x4facb138(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x4fcba9c8, 'messages_archived_stickers')
+    def struct_0x4fcba9c8(self):
+        return (
+            'count' / Int32ul,
+            'sets' / self.vector(self.sticker_set_covered_structures('sets'), 'sets'))
+
+    @constructor(0x5057c497, 'messages_upload_encrypted_file')
+    def struct_0x5057c497(self):
+        return (
+            'peer' / self.struct_0xf141b5e1(),
+            'file' / self.input_encrypted_file_structures('file'))
+
+    @constructor(0x514e999d, 'messages_get_inline_bot_results')
+    def struct_0x514e999d(self):
+        return Struct(
+            'sname' / Computed('messages_get_inline_bot_results'),
+            'signature' / Hex(Const(0x514e999d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_geo_point=1),
+            'bot' / self.input_user_structures('bot'),
+            'peer' / self.input_peer_structures('peer'),
+            'geo_point' / If(this.flags.has_geo_point, self.input_geo_point_structures('geo_point')),
+            'query' / TString,
+            'offset' / TString)
+
+    @constructor(0x519bc2b1, 'messages_upload_media')
+    def struct_0x519bc2b1(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'media' / self.input_media_structures('media'))
+
+    @constructor(0x53618bce, 'messages_request_app_web_view')
+    def struct_0x53618bce(self):
+        return Struct(
+            'sname' / Computed('messages_request_app_web_view'),
+            'signature' / Hex(Const(0x53618bce, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_write_allowed=1,
+                                is_compact=128,
+                                is_fullscreen=256,
+                                has_start_param=2,
+                                has_theme_params=4),
+            'peer' / self.input_peer_structures('peer'),
+            'app' / self.input_bot_app_structures('app'),
+            'start_param' / If(this.flags.has_start_param, TString),
+            'theme_params' / If(this.flags.has_theme_params, self.struct_0x7d748d04()),
+            'platform' / TString)
+
+    @constructor(0x5381d21a, 'messages_get_saved_dialogs')
+    def struct_0x5381d21a(self):
+        return Struct(
+            'sname' / Computed('messages_get_saved_dialogs'),
+            'signature' / Hex(Const(0x5381d21a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_exclude_pinned=1),
+            'offset_date' / TTimestamp,
+            'offset_id' / Int32ul,
+            'offset_peer' / self.input_peer_structures('offset_peer'),
+            'limit' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0x53b22baf, 'messages_search_results_positions')
+    def struct_0x53b22baf(self):
+        return (
+            'count' / Int32ul,
+            'positions' / self.vector(self.struct_0x7f648b67(), 'positions'))
+
+    @constructor(0x54aa7f8e, 'messages_read_reactions')
+    def struct_0x54aa7f8e(self):
+        return Struct(
+            'sname' / Computed('messages_read_reactions'),
+            'signature' / Hex(Const(0x54aa7f8e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_top_msg_id=1),
+            'peer' / self.input_peer_structures('peer'),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul))
+
+    @constructor(0x5559481d, 'messages_send_encrypted_file')
+    def struct_0x5559481d(self):
+        return Struct(
+            'sname' / Computed('messages_send_encrypted_file'),
+            'signature' / Hex(Const(0x5559481d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=1),
+            'peer' / self.struct_0xf141b5e1(),
+            'random_id' / Int64ul,
+            'data' / TBytes,
+            'file' / self.input_encrypted_file_structures('file'))
+
+    @constructor(0x55a5bb66, 'messages_received_queue')
+    def struct_0x55a5bb66(self):
+        return ['max_qts' / Int32ul]
+
+    @constructor(0x56987bd5, 'messages_delete_revoked_exported_chat_invites')
+    def struct_0x56987bd5(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'admin_id' / self.input_user_structures('admin_id'))
+
+    @constructor(0x5784d3e1, 'messages_get_messages_views')
+    def struct_0x5784d3e1(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'),
+            'increment' / TBool)
+
+    @constructor(0x57f17692, 'messages_get_archived_stickers')
+    def struct_0x57f17692(self):
+        return Struct(
+            'sname' / Computed('messages_get_archived_stickers'),
+            'signature' / Hex(Const(0x57f17692, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_masks=1,
+                                is_emojis=2),
+            'offset_id' / Int64ul,
+            'limit' / Int32ul)
+
+    @constructor(0x58943ee2, 'messages_set_typing')
+    def struct_0x58943ee2(self):
+        return Struct(
+            'sname' / Computed('messages_set_typing'),
+            'signature' / Hex(Const(0x58943ee2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_top_msg_id=1),
+            'peer' / self.input_peer_structures('peer'),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'action' / self.send_message_action_structures('action'))
+
+    @constructor(0x58bbcb50, 'messages_send_paid_reaction')
+    def struct_0x58bbcb50(self):
+        return Struct(
+            'sname' / Computed('messages_send_paid_reaction'),
+            'signature' / Hex(Const(0x58bbcb50, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_privacy=1),
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'count' / Int32ul,
+            'random_id' / Int64ul,
+            'privacy' / If(this.flags.has_privacy, self.stars_paid_reaction_privacy_structures('privacy')))
+
+    @constructor(0x59ae2b16, 'messages_delete_scheduled_messages')
+    def struct_0x59ae2b16(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0x5b118126, 'messages_read_featured_stickers')
+    def struct_0x5b118126(self):
+        return ['id' / self.vector(Int64ul, 'id')]
+
+    @constructor(0x5bd0ee50, 'messages_delete_chat')
+    def struct_0x5bd0ee50(self):
+        return ['chat_id' / Int64ul]
+
+    @constructor(0x5c003cef, 'messages_edit_quick_reply_shortcut')
+    def struct_0x5c003cef(self):
+        return (
+            'shortcut_id' / Int32ul,
+            'shortcut' / TString)
+
+    @constructor(0x5cf09635, 'messages_get_saved_gifs')
+    def struct_0x5cf09635(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x5dc60f03, 'messages_check_history_import_peer')
+    def struct_0x5dc60f03(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x5e0fb7b9, 'messages_history_import_parsed')
+    def struct_0x5e0fb7b9(self):
+        return Struct(
+            'sname' / Computed('messages_history_import_parsed'),
+            'signature' / Hex(Const(0x5e0fb7b9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pm=1,
+                                is_group=2,
+                                has_title=4),
+            'title' / If(this.flags.has_title, TString))
+
+    @constructor(0x60297dec, 'messages_update_saved_reaction_tag')
+    def struct_0x60297dec(self):
+        return Struct(
+            'sname' / Computed('messages_update_saved_reaction_tag'),
+            'signature' / Hex(Const(0x60297dec, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_title=1),
+            'reaction' / self.reaction_structures('reaction'),
+            'title' / If(this.flags.has_title, TString))
+
+    @constructor(0x60331907, 'messages_reorder_quick_replies')
+    def struct_0x60331907(self):
+        return ['order' / self.vector(Int32ul, 'order')]
+
+    @constructor(0x61422a48, 'messages_report_reaction')
+    def struct_0x61422a48(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul,
+            'user_id' / self.input_user_structures('user_id'))
+
+    @constructor(0x628c9224, 'missing_invitee')
+    def struct_0x628c9224(self):
+        return Struct(
+            'sname' / Computed('missing_invitee'),
+            'signature' / Hex(Const(0x628c9224, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_premium_would_allow_invite=1,
+                                is_premium_required_for_pm=2),
+            'user_id' / Int64ul)
+
+    @constructor(0x63183030, 'messages_translate_text')
+    def struct_0x63183030(self):
+        return Struct(
+            'sname' / Computed('messages_translate_text'),
+            'signature' / Hex(Const(0x63183030, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_peer=1,
+                                has_text=2),
+            'peer' / If(this.flags.has_peer, self.input_peer_structures('peer')),
+            'id' / If(this.flags.has_peer, self.vector(Int32ul, 'id')),
+            'text' / If(this.flags.has_text, self.vector(self.struct_0x751f3146(), 'text')),
+            'to_lang' / TString)
+
+    @constructor(0x640f82b8, 'messages_get_mask_stickers')
+    def struct_0x640f82b8(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x64780b14, 'messages_get_featured_stickers')
+    def struct_0x64780b14(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0x658b7188, 'messages_get_default_history_ttl')
+    def struct_0x658b7188(self):
+        return []
+
+    @constructor(0x65a4c7d5, 'messages_sponsored_messages_layer147')
+    def struct_0x65a4c7d5(self):
+        return (
+            'messages' / self.vector(self.struct_0xed5383f7(), 'messages'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x673ad8f1, 'messages_view_sponsored_message')
+    def struct_0x673ad8f1(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'random_id' / TBytes)
+
+    @constructor(0x6880b94d, 'messages_peer_settings')
+    def struct_0x6880b94d(self):
+        return (
+            'settings' / self.peer_settings_structures('settings'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x69f59d69, 'messages_toggle_bot_in_attach_menu')
+    def struct_0x69f59d69(self):
+        return Struct(
+            'sname' / Computed('messages_toggle_bot_in_attach_menu'),
+            'signature' / Hex(Const(0x69f59d69, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_write_allowed=1),
+            'bot' / self.input_user_structures('bot'),
+            'enabled' / TBool)
+
+    @constructor(0x6a3f8d65, 'messages_get_all_drafts')
+    def struct_0x6a3f8d65(self):
+        return []
+
+    @constructor(0x6aa3f6bd, 'messages_get_search_results_calendar')
+    def struct_0x6aa3f6bd(self):
+        return Struct(
+            'sname' / Computed('messages_get_search_results_calendar'),
+            'signature' / Hex(Const(0x6aa3f6bd, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_saved_peer_id=4),
+            'peer' / self.input_peer_structures('peer'),
+            'filter' / self.messages_filter_structures('filter'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.input_peer_structures('saved_peer_id')),
+            'offset_id' / Int32ul,
+            'offset_date' / TTimestamp)
+
+    @constructor(0x6c50051c, 'messages_import_chat_invite')
+    def struct_0x6c50051c(self):
+        return ['hash' / TString]
+
+    @constructor(0x6c750de1, 'messages_send_quick_reply_messages')
+    def struct_0x6c750de1(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'shortcut_id' / Int32ul,
+            'id' / self.vector(Int32ul, 'id'),
+            'random_id' / self.vector(Int64ul, 'random_id'))
+
+    @constructor(0x6d74da08, 'messages_forward_messages_layer199')
+    def struct_0x6d74da08(self):
+        return Struct(
+            'sname' / Computed('messages_forward_messages_layer199'),
+            'signature' / Hex(Const(0x6d74da08, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                is_background=64,
+                                is_with_my_score=256,
+                                is_drop_author=2048,
+                                is_drop_media_captions=4096,
+                                is_noforwards=16384,
+                                has_top_msg_id=512,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072,
+                                has_video_timestamp=1048576),
+            'from_peer' / self.input_peer_structures('from_peer'),
+            'id' / self.vector(Int32ul, 'id'),
+            'random_id' / self.vector(Int64ul, 'random_id'),
+            'to_peer' / self.input_peer_structures('to_peer'),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')),
+            'video_timestamp' / If(this.flags.has_video_timestamp, Int32ul))
+
+    @constructor(0x6e2be050, 'messages_get_onlines')
+    def struct_0x6e2be050(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x6e98102b, 'messages_delete_saved_history')
+    def struct_0x6e98102b(self):
+        return Struct(
+            'sname' / Computed('messages_delete_saved_history'),
+            'signature' / Hex(Const(0x6e98102b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_min_date=4,
+                                has_max_date=8),
+            'peer' / self.input_peer_structures('peer'),
+            'max_id' / Int32ul,
+            'min_date' / If(this.flags.has_min_date, TTimestamp),
+            'max_date' / If(this.flags.has_max_date, TTimestamp))
+
+    @constructor(0x702a40e0, 'messages_get_recent_locations')
+    def struct_0x702a40e0(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'limit' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0x73746f5c, 'messages_get_exported_chat_invite')
+    def struct_0x73746f5c(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'link' / TString)
+
+    @constructor(0x73783ffd, 'messages_edit_chat_title')
+    def struct_0x73783ffd(self):
+        return (
+            'chat_id' / Int64ul,
+            'title' / TString)
+
+    @constructor(0x73a379eb, 'high_score')
+    def struct_0x73a379eb(self):
+        return (
+            'pos' / Int32ul,
+            'user_id' / Int64ul,
+            'score' / Int32ul)
+
+    @constructor(0x73bb643b, 'messages_get_poll_results')
+    def struct_0x73bb643b(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul)
+
+    @constructor(0x7488ce5b, 'messages_get_emoji_groups')
+    def struct_0x7488ce5b(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0x77216192, 'messages_get_attach_menu_bot')
+    def struct_0x77216192(self):
+        return ['bot' / self.input_user_structures('bot')]
+
+    @constructor(0x78337739, 'messages_reorder_sticker_sets')
+    def struct_0x78337739(self):
+        return Struct(
+            'sname' / Computed('messages_reorder_sticker_sets'),
+            'signature' / Hex(Const(0x78337739, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_masks=1,
+                                is_emojis=2),
+            'order' / self.vector(Int64ul, 'order'))
+
+    @constructor(0x7852834e, 'messages_send_media_layer199')
+    def struct_0x7852834e(self):
+        return Struct(
+            'sname' / Computed('messages_send_media_layer199'),
+            'signature' / Hex(Const(0x7852834e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                is_background=64,
+                                is_clear_draft=128,
+                                is_noforwards=16384,
+                                is_update_stickersets_order=32768,
+                                is_invert_media=65536,
+                                has_reply_to=1,
+                                has_reply_markup=4,
+                                has_entities=8,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072,
+                                has_effect=262144),
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'media' / self.input_media_structures('media'),
+            'message' / TString,
+            'random_id' / Int64ul,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')),
+            'effect' / If(this.flags.has_effect, Int64ul))
+
+    @constructor(0x791451ed, 'messages_set_encrypted_typing')
+    def struct_0x791451ed(self):
+        return (
+            'peer' / self.struct_0xf141b5e1(),
+            'typing' / TBool)
+
+    @constructor(0x7bd66041, 'messages_send_media')
+    def struct_0x7bd66041(self):
+        return Struct(
+            'sname' / Computed('messages_send_media'),
+            'signature' / Hex(Const(0x7bd66041, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                is_background=64,
+                                is_clear_draft=128,
+                                is_noforwards=16384,
+                                is_update_stickersets_order=32768,
+                                is_invert_media=65536,
+                                has_reply_to=1,
+                                has_reply_markup=4,
+                                has_entities=8,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072),
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'media' / self.input_media_structures('media'),
+            'message' / TString,
+            'random_id' / Int64ul,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')))
+
+    @constructor(0x7e58ee9c, 'messages_clear_all_drafts')
+    def struct_0x7e58ee9c(self):
+        return []
+
+    @constructor(0x7ed094a1, 'messages_get_old_featured_stickers')
+    def struct_0x7ed094a1(self):
+        return (
+            'offset' / Int32ul,
+            'limit' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0x7f1d072f, 'messages_rate_transcribed_audio')
+    def struct_0x7f1d072f(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'transcription_id' / Int64ul,
+            'good' / TBool)
+
+    @constructor(0x7f4b690a, 'messages_read_encrypted_history')
+    def struct_0x7f4b690a(self):
+        return (
+            'peer' / self.struct_0xf141b5e1(),
+            'max_date' / TTimestamp)
+
+    @constructor(0x7f5defa6, 'messages_invited_users')
+    def struct_0x7f5defa6(self):
+        return (
+            'updates' / self.updates_structures('updates'),
+            'missing_invitees' / self.vector(self.struct_0x628c9224(), 'missing_invitees'))
+
+    @constructor(0x7f648b67, 'search_result_position')
+    def struct_0x7f648b67(self):
+        return (
+            'msg_id' / Int32ul,
+            'date' / TTimestamp,
+            'offset' / Int32ul)
+
+    @constructor(0x7fe7e815, 'messages_hide_chat_join_request')
+    def struct_0x7fe7e815(self):
+        return Struct(
+            'sname' / Computed('messages_hide_chat_join_request'),
+            'signature' / Hex(Const(0x7fe7e815, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_approved=1),
+            'peer' / self.input_peer_structures('peer'),
+            'user_id' / self.input_user_structures('user_id'))
+
+    @constructor(0x7ff3b806, 'messages_save_draft')
+    def struct_0x7ff3b806(self):
+        return Struct(
+            'sname' / Computed('messages_save_draft'),
+            'signature' / Hex(Const(0x7ff3b806, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_no_webpage=2,
+                                is_invert_media=64,
+                                has_reply_to=16,
+                                has_entities=8,
+                                has_media=32),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'peer' / self.input_peer_structures('peer'),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'media' / If(this.flags.has_media, self.input_media_structures('media')))
+
+    @constructor(0x812c2ae6, 'messages_get_stats_url')
+    def struct_0x812c2ae6(self):
+        return Struct(
+            'sname' / Computed('messages_get_stats_url'),
+            'signature' / Hex(Const(0x812c2ae6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_dark=1),
+            'peer' / self.input_peer_structures('peer'),
+            'params' / TString)
+
+    @constructor(0x81b6b00a, 'messages_chat_invite_importers')
+    def struct_0x81b6b00a(self):
+        return (
+            'count' / Int32ul,
+            'importers' / self.vector(self.struct_0x8c5adfd9(), 'importers'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x849ad397, 'messages_toggle_paid_reaction_privacy')
+    def struct_0x849ad397(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'is_private' / TBool)
+
+    @constructor(0x84d19185, 'messages_affected_messages')
+    def struct_0x84d19185(self):
+        return (
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0x84f80814, 'messages_get_extended_media')
+    def struct_0x84f80814(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0x857ebdb8, 'messages_get_prepared_inline_message')
+    def struct_0x857ebdb8(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'id' / TString)
+
+    @constructor(0x864b2581, 'messages_set_chat_available_reactions')
+    def struct_0x864b2581(self):
+        return Struct(
+            'sname' / Computed('messages_set_chat_available_reactions'),
+            'signature' / Hex(Const(0x864b2581, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_reactions_limit=1,
+                                has_paid_enabled=2),
+            'peer' / self.input_peer_structures('peer'),
+            'available_reactions' / self.chat_reactions_structures('available_reactions'),
+            'reactions_limit' / If(this.flags.has_reactions_limit, Int32ul),
+            'paid_enabled' / If(this.flags.has_paid_enabled, TBool))
+
+    @constructor(0x875f74be, 'messages_get_all_chats')
+    def struct_0x875f74be(self):
+        return ['except_ids' / self.vector(Int64ul, 'except_ids')]
+
+    @constructor(0x8953ab4e, 'messages_report')
+    def struct_0x8953ab4e(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'),
+            'reason' / self.report_reason_structures('reason'),
+            'message' / TString)
+
+    @constructor(0x8999602d, 'messages_clear_recent_stickers')
+    def struct_0x8999602d(self):
+        return Struct(
+            'sname' / Computed('messages_clear_recent_stickers'),
+            'signature' / Hex(Const(0x8999602d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_attached=1))
+
+    @constructor(0x8b68b0cc, 'messages_get_web_page_preview')
+    def struct_0x8b68b0cc(self):
+        return Struct(
+            'sname' / Computed('messages_get_web_page_preview'),
+            'signature' / Hex(Const(0x8b68b0cc, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_entities=8),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')))
+
+    @constructor(0x8b716587, 'messages_reorder_pinned_saved_dialogs')
+    def struct_0x8b716587(self):
+        return Struct(
+            'sname' / Computed('messages_reorder_pinned_saved_dialogs'),
+            'signature' / Hex(Const(0x8b716587, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_force=1),
+            'order' / self.vector(self.input_dialog_peer_structures('order'), 'order'))
+
+    @constructor(0x8bba90e6, 'messages_get_messages_reactions')
+    def struct_0x8bba90e6(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0x8c4bfe5d, 'messages_get_outbox_read_date')
+    def struct_0x8c4bfe5d(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul)
+
+    @constructor(0x8c5a3b3c, 'messages_request_app_web_view')
+    def struct_0x8c5a3b3c(self):
+        return Struct(
+            'sname' / Computed('messages_request_app_web_view'),
+            'signature' / Hex(Const(0x8c5a3b3c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_write_allowed=1,
+                                has_start_param=2,
+                                has_theme_params=4),
+            'peer' / self.input_peer_structures('peer'),
+            'app' / self.input_bot_app_structures('app'),
+            'start_param' / If(this.flags.has_start_param, TString),
+            'theme_params' / If(this.flags.has_theme_params, self.struct_0x7d748d04()),
+            'platform' / TString)
+
+    @constructor(0x8c5adfd9, 'chat_invite_importer')
+    def struct_0x8c5adfd9(self):
+        return Struct(
+            'sname' / Computed('chat_invite_importer'),
+            'signature' / Hex(Const(0x8c5adfd9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_requested=1,
+                                is_via_chatlist=8,
+                                has_about=4,
+                                has_approved_by=2),
+            'user_id' / Int64ul,
+            'date' / TTimestamp,
+            'about' / If(this.flags.has_about, TString),
+            'approved_by' / If(this.flags.has_approved_by, Int64ul))
+
+    @constructor(0x8d9692a3, 'messages_get_web_page')
+    def struct_0x8d9692a3(self):
+        return (
+            'url' / TString,
+            'hash' / Int32ul)
+
+    @constructor(0x8ef8ecc0, 'messages_set_game_score')
+    def struct_0x8ef8ecc0(self):
+        return Struct(
+            'sname' / Computed('messages_set_game_score'),
+            'signature' / Hex(Const(0x8ef8ecc0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_edit_message=1,
+                                is_force=2),
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul,
+            'user_id' / self.input_user_structures('user_id'),
+            'score' / Int32ul)
+
+    @constructor(0x8ffacae1, 'messages_set_chat_wall_paper')
+    def struct_0x8ffacae1(self):
+        return Struct(
+            'sname' / Computed('messages_set_chat_wall_paper'),
+            'signature' / Hex(Const(0x8ffacae1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_for_both=8,
+                                is_revert=16,
+                                has_wallpaper=1,
+                                has_settings=4,
+                                has_id=2),
+            'peer' / self.input_peer_structures('peer'),
+            'wallpaper' / If(this.flags.has_wallpaper, self.input_wall_paper_structures('wallpaper')),
+            'settings' / If(this.flags.has_settings, self.wall_paper_settings_structures('settings')),
+            'id' / If(this.flags.has_id, Int32ul))
+
+    @constructor(0x91b2d060, 'messages_send_bot_requested_peer')
+    def struct_0x91b2d060(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'button_id' / Int32ul,
+            'requested_peers' / self.vector(self.input_peer_structures('requested_peers'), 'requested_peers'))
+
+    @constructor(0x92b4494c, 'messages_search_emoji_sticker_sets')
+    def struct_0x92b4494c(self):
+        return Struct(
+            'sname' / Computed('messages_search_emoji_sticker_sets'),
+            'signature' / Hex(Const(0x92b4494c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_exclude_featured=1),
+            'q' / TString,
+            'hash' / Int64ul)
+
+    @constructor(0x9342ca07, 'messages_get_bot_callback_answer')
+    def struct_0x9342ca07(self):
+        return Struct(
+            'sname' / Computed('messages_get_bot_callback_answer'),
+            'signature' / Hex(Const(0x9342ca07, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_game=2,
+                                has_data=1,
+                                has_password=4),
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'data' / If(this.flags.has_data, TBytes),
+            'password' / If(this.flags.has_password, self.input_check_password_srp_structures('password')))
+
+    @constructor(0x94a495c3, 'messages_get_quick_reply_messages')
+    def struct_0x94a495c3(self):
+        return Struct(
+            'sname' / Computed('messages_get_quick_reply_messages'),
+            'signature' / Hex(Const(0x94a495c3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_id=1),
+            'shortcut_id' / Int32ul,
+            'id' / If(this.flags.has_id, self.vector(Int32ul, 'id')),
+            'hash' / Int64ul)
+
+    @constructor(0x983f9745, 'messages_send_message_layer199')
+    def struct_0x983f9745(self):
+        return Struct(
+            'sname' / Computed('messages_send_message_layer199'),
+            'signature' / Hex(Const(0x983f9745, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_no_webpage=2,
+                                is_silent=32,
+                                is_background=64,
+                                is_clear_draft=128,
+                                is_noforwards=16384,
+                                is_update_stickersets_order=32768,
+                                is_invert_media=65536,
+                                has_reply_to=1,
+                                has_reply_markup=4,
+                                has_entities=8,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072,
+                                has_effect=262144),
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'message' / TString,
+            'random_id' / Int64ul,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')),
+            'effect' / If(this.flags.has_effect, Int64ul))
+
+    @constructor(0x9a3bfd99, 'messages_high_scores')
+    def struct_0x9a3bfd99(self):
+        return (
+            'scores' / self.vector(self.struct_0x73a379eb(), 'scores'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x9bd2f439, 'messages_get_sponsored_messages')
+    def struct_0x9bd2f439(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x9c7f2f10, 'messages_get_search_results_positions')
+    def struct_0x9c7f2f10(self):
+        return Struct(
+            'sname' / Computed('messages_get_search_results_positions'),
+            'signature' / Hex(Const(0x9c7f2f10, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_saved_peer_id=4),
+            'peer' / self.input_peer_structures('peer'),
+            'saved_peer_id' / If(this.flags.has_saved_peer_id, self.input_peer_structures('saved_peer_id')),
+            'filter' / self.messages_filter_structures('filter'),
+            'offset_id' / Int32ul,
+            'limit' / Int32ul)
+
+    @constructor(0x9da9403b, 'messages_get_recent_stickers')
+    def struct_0x9da9403b(self):
+        return Struct(
+            'sname' / Computed('messages_get_recent_stickers'),
+            'signature' / Hex(Const(0x9da9403b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_attached=1),
+            'hash' / Int64ul)
+
+    @constructor(0x9dd6a67b, 'messages_send_paid_reaction')
+    def struct_0x9dd6a67b(self):
+        return Struct(
+            'sname' / Computed('messages_send_paid_reaction'),
+            'signature' / Hex(Const(0x9dd6a67b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_private=1),
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'count' / Int32ul,
+            'random_id' / Int64ul,
+            'is_private' / If(this.flags.is_private, TBool))
+
+    @constructor(0x9dfeefb4, 'messages_clear_recent_reactions')
+    def struct_0x9dfeefb4(self):
+        return []
+
+    @constructor(0x9eb51445, 'messages_set_default_history_ttl')
+    def struct_0x9eb51445(self):
+        return ['period' / Int32ul]
+
+    @constructor(0xa02ce5d5, 'messages_export_chat_invite')
+    def struct_0xa02ce5d5(self):
+        return Struct(
+            'sname' / Computed('messages_export_chat_invite'),
+            'signature' / Hex(Const(0xa02ce5d5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_legacy_revoke_permanent=4,
+                                is_request_needed=8,
+                                has_expire_date=1,
+                                has_usage_limit=2,
+                                has_title=16),
+            'peer' / self.input_peer_structures('peer'),
+            'expire_date' / If(this.flags.has_expire_date, TTimestamp),
+            'usage_limit' / If(this.flags.has_usage_limit, Int32ul),
+            'title' / If(this.flags.has_title, TString))
+
+    @constructor(0xa0f4cb4f, 'messages_get_dialogs')
+    def struct_0xa0f4cb4f(self):
+        return Struct(
+            'sname' / Computed('messages_get_dialogs'),
+            'signature' / Hex(Const(0xa0f4cb4f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_exclude_pinned=1,
+                                has_folder_id=2),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'offset_date' / TTimestamp,
+            'offset_id' / Int32ul,
+            'offset_peer' / self.input_peer_structures('offset_peer'),
+            'limit' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0xa1405817, 'messages_send_screenshot_notification')
+    def struct_0xa1405817(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / self.input_reply_to_structures('reply_to'),
+            'random_id' / Int64ul)
+
+    @constructor(0xa2185cab, 'messages_delete_chat_user')
+    def struct_0xa2185cab(self):
+        return Struct(
+            'sname' / Computed('messages_delete_chat_user'),
+            'signature' / Hex(Const(0xa2185cab, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoke_history=1),
+            'chat_id' / Int64ul,
+            'user_id' / self.input_user_structures('user_id'))
+
+    @constructor(0xa24de717, 'messages_checked_history_import_peer')
+    def struct_0xa24de717(self):
+        return ['confirm_text' / TString]
+
+    @constructor(0xa2875319, 'messages_migrate_chat')
+    def struct_0xa2875319(self):
+        return ['chat_id' / Int64ul]
+
+    @constructor(0xa29cd42c, 'messages_get_suggested_dialog_filters')
+    def struct_0xa29cd42c(self):
+        return []
+
+    @constructor(0xa2b5a3f6, 'messages_get_exported_chat_invites')
+    def struct_0xa2b5a3f6(self):
+        return Struct(
+            'sname' / Computed('messages_get_exported_chat_invites'),
+            'signature' / Hex(Const(0xa2b5a3f6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoked=8,
+                                has_offset_date=4),
+            'peer' / self.input_peer_structures('peer'),
+            'admin_id' / self.input_user_structures('admin_id'),
+            'offset_date' / If(this.flags.has_offset_date, TTimestamp),
+            'offset_link' / If(this.flags.has_offset_date, TString),
+            'limit' / Int32ul)
+
+    @constructor(0xa455de90, 'messages_export_chat_invite')
+    def struct_0xa455de90(self):
+        return Struct(
+            'sname' / Computed('messages_export_chat_invite'),
+            'signature' / Hex(Const(0xa455de90, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_legacy_revoke_permanent=4,
+                                is_request_needed=8,
+                                has_expire_date=1,
+                                has_usage_limit=2,
+                                has_title=16,
+                                has_subscription_pricing=32),
+            'peer' / self.input_peer_structures('peer'),
+            'expire_date' / If(this.flags.has_expire_date, TTimestamp),
+            'usage_limit' / If(this.flags.has_usage_limit, Int32ul),
+            'title' / If(this.flags.has_title, TString),
+            'subscription_pricing' / If(this.flags.has_subscription_pricing, self.struct_0x05416d58()))
+
+    @constructor(0xa550cd78, 'messages_send_media')
+    def struct_0xa550cd78(self):
+        return Struct(
+            'sname' / Computed('messages_send_media'),
+            'signature' / Hex(Const(0xa550cd78, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                is_background=64,
+                                is_clear_draft=128,
+                                is_noforwards=16384,
+                                is_update_stickersets_order=32768,
+                                is_invert_media=65536,
+                                has_reply_to=1,
+                                has_reply_markup=4,
+                                has_entities=8,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072,
+                                has_effect=262144,
+                                has_allow_paid_stars=2097152),
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'media' / self.input_media_structures('media'),
+            'message' / TString,
+            'random_id' / Int64ul,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')),
+            'effect' / If(this.flags.has_effect, Int64ul),
+            'allow_paid_stars' / If(this.flags.has_allow_paid_stars, Int64ul))
+
+    @constructor(0xa5866b41, 'messages_edit_chat_default_banned_rights')
+    def struct_0xa5866b41(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'banned_rights' / self.struct_0x9f120418())
+
+    @constructor(0xa6341782, 'messages_discussion_message')
+    def struct_0xa6341782(self):
+        return Struct(
+            'sname' / Computed('messages_discussion_message'),
+            'signature' / Hex(Const(0xa6341782, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_max_id=1,
+                                has_read_inbox_max_id=2,
+                                has_read_outbox_max_id=4),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'max_id' / If(this.flags.has_max_id, Int32ul),
+            'read_inbox_max_id' / If(this.flags.has_read_inbox_max_id, Int32ul),
+            'read_outbox_max_id' / If(this.flags.has_read_outbox_max_id, Int32ul),
+            'unread_count' / Int32ul,
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xa731e257, 'messages_toggle_dialog_pin')
+    def struct_0xa731e257(self):
+        return Struct(
+            'sname' / Computed('messages_toggle_dialog_pin'),
+            'signature' / Hex(Const(0xa731e257, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=1),
+            'peer' / self.input_dialog_peer_structures('peer'))
+
+    @constructor(0xa85bd1c2, 'messages_edit_chat_admin')
+    def struct_0xa85bd1c2(self):
+        return (
+            'chat_id' / Int64ul,
+            'user_id' / self.input_user_structures('user_id'),
+            'is_admin' / TBool)
+
+    @constructor(0xa927fec5, 'messages_inactive_chats')
+    def struct_0xa927fec5(self):
+        return (
+            'dates' / self.vector(Int32ul, 'dates'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xaadf159b, 'messages_web_view_result')
+    def struct_0xaadf159b(self):
+        return (
+            'result' / self.bot_inline_result_structures('result'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xac81bbde, 'messages_toggle_saved_dialog_pin')
+    def struct_0xac81bbde(self):
+        return Struct(
+            'sname' / Computed('messages_toggle_saved_dialog_pin'),
+            'signature' / Hex(Const(0xac81bbde, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=1),
+            'peer' / self.input_dialog_peer_structures('peer'))
+
+    @constructor(0xaeb00b34, 'messages_get_full_chat')
+    def struct_0xaeb00b34(self):
+        return ['chat_id' / Int64ul]
+
+    @constructor(0xb08f922a, 'messages_delete_history')
+    def struct_0xb08f922a(self):
+        return Struct(
+            'sname' / Computed('messages_delete_history'),
+            'signature' / Hex(Const(0xb08f922a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_just_clear=1,
+                                is_revoke=2,
+                                has_min_date=4,
+                                has_max_date=8),
+            'peer' / self.input_peer_structures('peer'),
+            'max_id' / Int32ul,
+            'min_date' / If(this.flags.has_min_date, TTimestamp),
+            'max_date' / If(this.flags.has_max_date, TTimestamp))
+
+    @constructor(0xb0d81a83, 'messages_prolong_web_view')
+    def struct_0xb0d81a83(self):
+        return Struct(
+            'sname' / Computed('messages_prolong_web_view'),
+            'signature' / Hex(Const(0xb0d81a83, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                has_reply_to=1,
+                                has_send_as=8192),
+            'peer' / self.input_peer_structures('peer'),
+            'bot' / self.input_user_structures('bot'),
+            'query_id' / Int64ul,
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')))
+
+    @constructor(0xb11eafa2, 'messages_toggle_no_forwards')
+    def struct_0xb11eafa2(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'enabled' / TBool)
+
+    @constructor(0xb12c7125, 'messages_accept_url_auth')
+    def struct_0xb12c7125(self):
+        return Struct(
+            'sname' / Computed('messages_accept_url_auth'),
+            'signature' / Hex(Const(0xb12c7125, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_write_allowed=1,
+                                has_peer=2,
+                                has_url=4),
+            'peer' / If(this.flags.has_peer, self.input_peer_structures('peer')),
+            'msg_id' / If(this.flags.has_peer, Int32ul),
+            'button_id' / If(this.flags.has_peer, Int32ul),
+            'url' / If(this.flags.has_url, TString))
+
+    @constructor(0xb43df344, 'messages_start_history_import')
+    def struct_0xb43df344(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'import_id' / Int64ul)
+
+    @constructor(0xb45c69d1, 'messages_affected_history')
+    def struct_0xb45c69d1(self):
+        return (
+            'pts' / Int32ul,
+            'pts_count' / Int32ul,
+            'offset' / Int32ul)
+
+    @constructor(0xb5052fea, 'messages_toggle_sticker_sets')
+    def struct_0xb5052fea(self):
+        return Struct(
+            'sname' / Computed('messages_toggle_sticker_sets'),
+            'signature' / Hex(Const(0xb5052fea, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_uninstall=1,
+                                is_archive=2,
+                                is_unarchive=4),
+            'stickersets' / self.vector(self.input_sticker_set_structures('stickersets'), 'stickersets'))
+
+    @constructor(0xb69b72d7, 'messages_chat_admins_with_invites')
+    def struct_0xb69b72d7(self):
+        return (
+            'admins' / self.vector(self.struct_0xf2ecef23(), 'admins'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xb6c4f543, 'messages_message_views')
+    def struct_0xb6c4f543(self):
+        return (
+            'views' / self.vector(self.struct_0x455b853d(), 'views'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xb80e5fe4, 'messages_set_history_ttl')
+    def struct_0xb80e5fe4(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'period' / Int32ul)
+
+    @constructor(0xb86e380e, 'messages_get_poll_votes')
+    def struct_0xb86e380e(self):
+        return Struct(
+            'sname' / Computed('messages_get_poll_votes'),
+            'signature' / Hex(Const(0xb86e380e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_option=1,
+                                has_offset=2),
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul,
+            'option' / If(this.flags.has_option, TBytes),
+            'offset' / If(this.flags.has_offset, TString),
+            'limit' / Int32ul)
+
+    @constructor(0xb8a0a1a8, 'messages_get_all_stickers')
+    def struct_0xb8a0a1a8(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0xb9ffc55b, 'messages_fave_sticker')
+    def struct_0xb9ffc55b(self):
+        return (
+            'id' / self.input_document_structures('id'),
+            'unfave' / TBool)
+
+    @constructor(0xbb8125ba, 'messages_get_top_reactions')
+    def struct_0xbb8125ba(self):
+        return (
+            'limit' / Int32ul,
+            'hash' / Int64ul)
+
+    @constructor(0xbb9fa475, 'messages_forward_messages')
+    def struct_0xbb9fa475(self):
+        return Struct(
+            'sname' / Computed('messages_forward_messages'),
+            'signature' / Hex(Const(0xbb9fa475, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                is_background=64,
+                                is_with_my_score=256,
+                                is_drop_author=2048,
+                                is_drop_media_captions=4096,
+                                is_noforwards=16384,
+                                has_top_msg_id=512,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072,
+                                has_video_timestamp=1048576,
+                                has_allow_paid_stars=2097152),
+            'from_peer' / self.input_peer_structures('from_peer'),
+            'id' / self.vector(Int32ul, 'id'),
+            'random_id' / self.vector(Int64ul, 'random_id'),
+            'to_peer' / self.input_peer_structures('to_peer'),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')),
+            'video_timestamp' / If(this.flags.has_video_timestamp, Int32ul),
+            'allow_paid_stars' / If(this.flags.has_allow_paid_stars, Int64ul))
+
+    @constructor(0xbd38850a, 'messages_send_scheduled_messages')
+    def struct_0xbd38850a(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0xbdbb0464, 'messages_get_scheduled_messages')
+    def struct_0xbdbb0464(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0xbdc62dcc, 'messages_exported_chat_invites')
+    def struct_0xbdc62dcc(self):
+        return (
+            'count' / Int32ul,
+            'invites' / self.vector(self.exported_chat_invite_structures('invites'), 'invites'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xbdca2f75, 'messages_edit_exported_chat_invite')
+    def struct_0xbdca2f75(self):
+        return Struct(
+            'sname' / Computed('messages_edit_exported_chat_invite'),
+            'signature' / Hex(Const(0xbdca2f75, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoked=4,
+                                has_expire_date=1,
+                                has_usage_limit=2,
+                                has_request_needed=8,
+                                has_title=16),
+            'peer' / self.input_peer_structures('peer'),
+            'link' / TString,
+            'expire_date' / If(this.flags.has_expire_date, TTimestamp),
+            'usage_limit' / If(this.flags.has_usage_limit, Int32ul),
+            'request_needed' / If(this.flags.has_request_needed, TBool),
+            'title' / If(this.flags.has_title, TString))
+
+    @constructor(0xbdf93428, 'messages_get_default_tag_reactions')
+    def struct_0xbdf93428(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0xc0cf7646, 'messages_send_inline_bot_result')
+    def struct_0xc0cf7646(self):
+        return Struct(
+            'sname' / Computed('messages_send_inline_bot_result'),
+            'signature' / Hex(Const(0xc0cf7646, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                is_background=64,
+                                is_clear_draft=128,
+                                is_hide_via=2048,
+                                has_reply_to=1,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072,
+                                has_allow_paid_stars=2097152),
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'random_id' / Int64ul,
+            'query_id' / Int64ul,
+            'id' / TString,
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')),
+            'allow_paid_stars' / If(this.flags.has_allow_paid_stars, Int64ul))
+
+    @constructor(0xc286d98f, 'messages_mark_dialog_unread')
+    def struct_0xc286d98f(self):
+        return Struct(
+            'sname' / Computed('messages_mark_dialog_unread'),
+            'signature' / Hex(Const(0xc286d98f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1),
+            'peer' / self.input_dialog_peer_structures('peer'))
+
+    @constructor(0xc563c1e4, 'messages_update_dialog_filters_order')
+    def struct_0xc563c1e4(self):
+        return ['order' / self.vector(Int32ul, 'order')]
+
+    @constructor(0xc78fe460, 'messages_install_sticker_set')
+    def struct_0xc78fe460(self):
+        return (
+            'stickerset' / self.input_sticker_set_structures('stickerset'),
+            'archived' / TBool)
+
+    @constructor(0xc8a0ec74, 'messages_get_sticker_set')
+    def struct_0xc8a0ec74(self):
+        return (
+            'stickerset' / self.input_sticker_set_structures('stickerset'),
+            'hash' / Int32ul)
+
+    @constructor(0xc9b0539f, 'search_results_calendar_period')
+    def struct_0xc9b0539f(self):
+        return (
+            'date' / TTimestamp,
+            'min_msg_id' / Int32ul,
+            'max_msg_id' / Int32ul,
+            'count' / Int32ul)
+
+    @constructor(0xc9e01e7b, 'messages_request_main_web_view')
+    def struct_0xc9e01e7b(self):
+        return Struct(
+            'sname' / Computed('messages_request_main_web_view'),
+            'signature' / Hex(Const(0xc9e01e7b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_compact=128,
+                                is_fullscreen=256,
+                                has_start_param=2,
+                                has_theme_params=1),
+            'peer' / self.input_peer_structures('peer'),
+            'bot' / self.input_user_structures('bot'),
+            'start_param' / If(this.flags.has_start_param, TString),
+            'theme_params' / If(this.flags.has_theme_params, self.struct_0x7d748d04()),
+            'platform' / TString)
+
+    @constructor(0xcacacaca, 'messages_send_encrypted_multi_media')
+    def struct_0xcacacaca(self):
+        return []
+
+    @constructor(0xcc5b67cc, 'messages_get_attached_stickers')
+    def struct_0xcc5b67cc(self):
+        return ['media' / self.input_stickered_media_structures('media')]
+
+    @constructor(0xccfddf96, 'messages_save_default_send_as')
+    def struct_0xccfddf96(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'send_as' / self.input_peer_structures('send_as'))
+
+    @constructor(0xcf1592db, 'messages_report_spam')
+    def struct_0xcf1592db(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0xcfb9d957, 'messages_transcribed_audio')
+    def struct_0xcfb9d957(self):
+        return Struct(
+            'sname' / Computed('messages_transcribed_audio'),
+            'signature' / Hex(Const(0xcfb9d957, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pending=1,
+                                has_trial_remains_num=2),
+            'transcription_id' / Int64ul,
+            'text' / TString,
+            'trial_remains_num' / If(this.flags.has_trial_remains_num, Int32ul),
+            'trial_remains_until_date' / If(this.flags.has_trial_remains_num, TTimestamp))
+
+    @constructor(0xd0b5e1fc, 'messages_get_my_stickers')
+    def struct_0xd0b5e1fc(self):
+        return (
+            'offset_id' / Int64ul,
+            'limit' / Int32ul)
+
+    @constructor(0xd2aaf7ec, 'messages_update_pinned_message')
+    def struct_0xd2aaf7ec(self):
+        return Struct(
+            'sname' / Computed('messages_update_pinned_message'),
+            'signature' / Hex(Const(0xd2aaf7ec, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=1,
+                                is_unpin=2,
+                                is_pm_oneside=4),
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul)
+
+    @constructor(0xd30d78d4, 'messages_send_reaction')
+    def struct_0xd30d78d4(self):
+        return Struct(
+            'sname' / Computed('messages_send_reaction'),
+            'signature' / Hex(Const(0xd30d78d4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_big=2,
+                                is_add_to_recent=4,
+                                has_reaction=1),
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'reaction' / If(this.flags.has_reaction, self.vector(self.reaction_structures('reaction'), 'reaction')))
+
+    @constructor(0xd372c5ce, 'messages_save_draft')
+    def struct_0xd372c5ce(self):
+        return Struct(
+            'sname' / Computed('messages_save_draft'),
+            'signature' / Hex(Const(0xd372c5ce, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_no_webpage=2,
+                                is_invert_media=64,
+                                has_reply_to=16,
+                                has_entities=8,
+                                has_media=32,
+                                has_effect=128),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'peer' / self.input_peer_structures('peer'),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'media' / If(this.flags.has_media, self.input_media_structures('media')),
+            'effect' / If(this.flags.has_effect, Int64ul))
+
+    @constructor(0xd464a42b, 'messages_delete_exported_chat_invite')
+    def struct_0xd464a42b(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'link' / TString)
+
+    @constructor(0xd483f2a8, 'messages_get_quick_replies')
+    def struct_0xd483f2a8(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0xd5039208, 'messages_forward_messages')
+    def struct_0xd5039208(self):
+        return Struct(
+            'sname' / Computed('messages_forward_messages'),
+            'signature' / Hex(Const(0xd5039208, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_silent=32,
+                                is_background=64,
+                                is_with_my_score=256,
+                                is_drop_author=2048,
+                                is_drop_media_captions=4096,
+                                is_noforwards=16384,
+                                has_top_msg_id=512,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072),
+            'from_peer' / self.input_peer_structures('from_peer'),
+            'id' / self.vector(Int32ul, 'id'),
+            'random_id' / self.vector(Int64ul, 'random_id'),
+            'to_peer' / self.input_peer_structures('to_peer'),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')))
+
+    @constructor(0xd58f130a, 'messages_set_bot_callback_answer')
+    def struct_0xd58f130a(self):
+        return Struct(
+            'sname' / Computed('messages_set_bot_callback_answer'),
+            'signature' / Hex(Const(0xd58f130a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_alert=2,
+                                has_message=1,
+                                has_url=4),
+            'query_id' / Int64ul,
+            'message' / If(this.flags.has_message, TString),
+            'url' / If(this.flags.has_url, TString),
+            'cache_time' / Int32ul)
+
+    @constructor(0xd5a5d3a1, 'messages_get_stickers')
+    def struct_0xd5a5d3a1(self):
+        return (
+            'emoticon' / TString,
+            'hash' / Int64ul)
+
+    @constructor(0xd5b10c26, 'messages_get_emoji_url')
+    def struct_0xd5b10c26(self):
+        return ['lang_code' / TString]
+
+    @constructor(0xd63d94e0, 'messages_get_pinned_saved_dialogs')
+    def struct_0xd63d94e0(self):
+        return []
+
+    @constructor(0xd6b94df2, 'messages_get_pinned_dialogs')
+    def struct_0xd6b94df2(self):
+        return ['folder_id' / Int32ul]
+
+    @constructor(0xd9ab0f54, 'messages_get_custom_emoji_documents')
+    def struct_0xd9ab0f54(self):
+        return ['document_id' / self.vector(Int64ul, 'document_id')]
+
+    @constructor(0xdc0242c8, 'messages_send_web_view_data')
+    def struct_0xdc0242c8(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'random_id' / Int64ul,
+            'button_text' / TString,
+            'data' / TString)
+
+    @constructor(0xddcf50eb, 'messages_send_web_view_result_message')
+    def struct_0xddcf50eb(self):
+        return ['query_id' / Int64ul]
+
+    @constructor(0xdea20a39, 'messages_get_available_effects')
+    def struct_0xdea20a39(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0xdef60797, 'messages_edit_chat_about')
+    def struct_0xdef60797(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'about' / TString)
+
+    @constructor(0xdf04dd4e, 'messages_get_chat_invite_importers')
+    def struct_0xdf04dd4e(self):
+        return Struct(
+            'sname' / Computed('messages_get_chat_invite_importers'),
+            'signature' / Hex(Const(0xdf04dd4e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_requested=1,
+                                is_subscription_expired=8,
+                                has_link=2,
+                                has_q=4),
+            'peer' / self.input_peer_structures('peer'),
+            'link' / If(this.flags.has_link, TString),
+            'q' / If(this.flags.has_q, TString),
+            'offset_date' / TTimestamp,
+            'offset_user' / self.input_user_structures('offset_user'),
+            'limit' / Int32ul)
+
+    @constructor(0xdfd14005, 'messages_edit_message')
+    def struct_0xdfd14005(self):
+        return Struct(
+            'sname' / Computed('messages_edit_message'),
+            'signature' / Hex(Const(0xdfd14005, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_no_webpage=2,
+                                is_invert_media=65536,
+                                has_message=2048,
+                                has_media=16384,
+                                has_reply_markup=4,
+                                has_entities=8,
+                                has_schedule_date=32768,
+                                has_quick_reply_shortcut_id=131072),
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul,
+            'message' / If(this.flags.has_message, TString),
+            'media' / If(this.flags.has_media, self.input_media_structures('media')),
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'quick_reply_shortcut_id' / If(this.flags.has_quick_reply_shortcut_id, Int32ul))
+
+    @constructor(0xdff8042c, 'messages_send_message')
+    def struct_0xdff8042c(self):
+        return Struct(
+            'sname' / Computed('messages_send_message'),
+            'signature' / Hex(Const(0xdff8042c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_no_webpage=2,
+                                is_silent=32,
+                                is_background=64,
+                                is_clear_draft=128,
+                                is_noforwards=16384,
+                                is_update_stickersets_order=32768,
+                                is_invert_media=65536,
+                                has_reply_to=1,
+                                has_reply_markup=4,
+                                has_entities=8,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072),
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'message' / TString,
+            'random_id' / Int64ul,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')))
+
+    @constructor(0xe085f4ea, 'messages_hide_all_chat_join_requests')
+    def struct_0xe085f4ea(self):
+        return Struct(
+            'sname' / Computed('messages_hide_all_chat_join_requests'),
+            'signature' / Hex(Const(0xe085f4ea, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_approved=1,
+                                has_link=2),
+            'peer' / self.input_peer_structures('peer'),
+            'link' / If(this.flags.has_link, TString))
+
+    @constructor(0xe105e910, 'messages_delete_quick_reply_messages')
+    def struct_0xe105e910(self):
+        return (
+            'shortcut_id' / Int32ul,
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0xe40ca104, 'messages_get_common_chats')
+    def struct_0xe40ca104(self):
+        return (
+            'user_id' / self.input_user_structures('user_id'),
+            'max_id' / Int64ul,
+            'limit' / Int32ul)
+
+    @constructor(0xe41cd11d, 'messages_set_web_view_result')
+    def struct_0xe41cd11d(self):
+        return ['query_id' / Int64ul]
+
+    @constructor(0xe470bcfd, 'messages_get_peer_dialogs')
+    def struct_0xe470bcfd(self):
+        return ['peers' / self.vector(self.input_dialog_peer_structures('peers'), 'peers')]
+
+    @constructor(0xe47cb579, 'messages_toggle_peer_translations')
+    def struct_0xe47cb579(self):
+        return Struct(
+            'sname' / Computed('messages_toggle_peer_translations'),
+            'signature' / Hex(Const(0xe47cb579, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_disabled=1),
+            'peer' / self.input_peer_structures('peer'))
+
+    @constructor(0xe58e95d2, 'messages_delete_messages')
+    def struct_0xe58e95d2(self):
+        return Struct(
+            'sname' / Computed('messages_delete_messages'),
+            'signature' / Hex(Const(0xe58e95d2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoke=1),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0xe5d7d19c, 'messages_chat_full')
+    def struct_0xe5d7d19c(self):
+        return (
+            'full_chat' / self.chat_full_structures('full_chat'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xe63be13f, 'messages_set_chat_theme')
+    def struct_0xe63be13f(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'emoticon' / TString)
+
+    @constructor(0xe6df7378, 'messages_start_bot')
+    def struct_0xe6df7378(self):
+        return (
+            'bot' / self.input_user_structures('bot'),
+            'peer' / self.input_peer_structures('peer'),
+            'random_id' / Int64ul,
+            'start_param' / TString)
+
+    @constructor(0xe822649d, 'messages_get_game_high_scores')
+    def struct_0xe822649d(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul,
+            'user_id' / self.input_user_structures('user_id'))
+
+    @constructor(0xe844ebff, 'messages_search_counter')
+    def struct_0xe844ebff(self):
+        return Struct(
+            'sname' / Computed('messages_search_counter'),
+            'signature' / Hex(Const(0xe844ebff, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_inexact=2),
+            'filter' / self.messages_filter_structures('filter'),
+            'count' / Int32ul)
+
+    @constructor(0xeb50adf5, 'messages_bot_app')
+    def struct_0xeb50adf5(self):
+        return Struct(
+            'sname' / Computed('messages_bot_app'),
+            'signature' / Hex(Const(0xeb50adf5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_inactive=1,
+                                is_request_write_access=2),
+            'app' / self.bot_app_structures('app'))
+
+    @constructor(0xed5383f7, 'sponsored_message')
+    def struct_0xed5383f7(self):
+        return Struct(
+            'sname' / Computed('sponsored_message'),
+            'signature' / Hex(Const(0xed5383f7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_recommended=32,
+                                is_show_peer_photo=64,
+                                has_from_id=8,
+                                has_chat_invite=16,
+                                has_channel_post=4,
+                                has_start_param=1,
+                                has_webpage=512,
+                                has_app=1024,
+                                has_entities=2,
+                                has_button_text=2048,
+                                has_sponsor_info=128,
+                                has_additional_info=256),
+            'random_id' / TBytes,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'chat_invite' / If(this.flags.has_chat_invite, self.chat_invite_structures('chat_invite')),
+            'chat_invite_hash' / If(this.flags.has_chat_invite, TString),
+            'channel_post' / If(this.flags.has_channel_post, Int32ul),
+            'start_param' / If(this.flags.has_start_param, TString),
+            'webpage' / If(this.flags.has_webpage, self.struct_0x3db8ec63()),
+            'app' / If(this.flags.has_app, self.bot_app_structures('app')),
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'button_text' / If(this.flags.has_button_text, TString),
+            'sponsor_info' / If(this.flags.has_sponsor_info, TString),
+            'additional_info' / If(this.flags.has_additional_info, TString))
+
+    @constructor(0xef8d3e6c, 'messages_affected_found_messages')
+    def struct_0xef8d3e6c(self):
+        return (
+            'pts' / Int32ul,
+            'pts_count' / Int32ul,
+            'offset' / Int32ul,
+            'messages' / self.vector(Int32ul, 'messages'))
+
+    @constructor(0xefd48c89, 'messages_get_dialog_filters')
+    def struct_0xefd48c89(self):
+        return []
+
+    @constructor(0xefd9a6a2, 'messages_get_peer_settings')
+    def struct_0xefd9a6a2(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0xf025bc8b, 'messages_unpin_all_messages')
+    def struct_0xf025bc8b(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0xf107e790, 'messages_get_unread_mentions')
+    def struct_0xf107e790(self):
+        return Struct(
+            'sname' / Computed('messages_get_unread_mentions'),
+            'signature' / Hex(Const(0xf107e790, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_top_msg_id=1),
+            'peer' / self.input_peer_structures('peer'),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'offset_id' / Int32ul,
+            'add_offset' / Int32ul,
+            'limit' / Int32ul,
+            'max_id' / Int32ul,
+            'min_id' / Int32ul)
+
+    @constructor(0xf141b5e1, 'input_encrypted_chat')
+    def struct_0xf141b5e1(self):
+        return (
+            'chat_id' / Int32ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0xf1d0fbd3, 'messages_check_quick_reply_shortcut')
+    def struct_0xf1d0fbd3(self):
+        return ['shortcut' / TString]
+
+    @constructor(0xf24753e3, 'messages_add_chat_user')
+    def struct_0xf24753e3(self):
+        return (
+            'chat_id' / Int64ul,
+            'user_id' / self.input_user_structures('user_id'),
+            'fwd_limit' / Int32ul)
+
+    @constructor(0xf2ecef23, 'chat_admin_with_invites')
+    def struct_0xf2ecef23(self):
+        return (
+            'admin_id' / Int64ul,
+            'invites_count' / Int32ul,
+            'revoked_invites_count' / Int32ul)
+
+    @constructor(0xf393aea0, 'messages_discard_encryption')
+    def struct_0xf393aea0(self):
+        return Struct(
+            'sname' / Computed('messages_discard_encryption'),
+            'signature' / Hex(Const(0xf393aea0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_delete_history=1),
+            'chat_id' / Int32ul)
+
+    @constructor(0xf516760b, 'messages_get_scheduled_history')
+    def struct_0xf516760b(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'hash' / Int64ul)
+
+    @constructor(0xf64daf43, 'messages_request_encryption')
+    def struct_0xf64daf43(self):
+        return (
+            'user_id' / self.input_user_structures('user_id'),
+            'random_id' / Int32ul,
+            'g_a' / TBytes)
+
+    @constructor(0xf731a9f4, 'messages_read_discussion')
+    def struct_0xf731a9f4(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'read_max_id' / Int32ul)
+
+    @constructor(0xf96e55de, 'messages_uninstall_sticker_set')
+    def struct_0xf96e55de(self):
+        return ['stickerset' / self.input_sticker_set_structures('stickerset')]
+
+    @constructor(0xf9cbe409, 'messages_delete_phone_call_history')
+    def struct_0xf9cbe409(self):
+        return Struct(
+            'sname' / Computed('messages_delete_phone_call_history'),
+            'signature' / Hex(Const(0xf9cbe409, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoke=1))
+
+    @constructor(0xfaff629d, 'messages_my_stickers')
+    def struct_0xfaff629d(self):
+        return (
+            'count' / Int32ul,
+            'sets' / self.vector(self.sticker_set_covered_structures('sets'), 'sets'))
+
+    @constructor(0xfbf2340a, 'messages_send_message')
+    def struct_0xfbf2340a(self):
+        return Struct(
+            'sname' / Computed('messages_send_message'),
+            'signature' / Hex(Const(0xfbf2340a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_no_webpage=2,
+                                is_silent=32,
+                                is_background=64,
+                                is_clear_draft=128,
+                                is_noforwards=16384,
+                                is_update_stickersets_order=32768,
+                                is_invert_media=65536,
+                                has_reply_to=1,
+                                has_reply_markup=4,
+                                has_entities=8,
+                                has_schedule_date=1024,
+                                has_send_as=8192,
+                                has_quick_reply_shortcut=131072,
+                                has_effect=262144,
+                                has_allow_paid_stars=2097152),
+            'peer' / self.input_peer_structures('peer'),
+            'reply_to' / If(this.flags.has_reply_to, self.input_reply_to_structures('reply_to')),
+            'message' / TString,
+            'random_id' / Int64ul,
+            'reply_markup' / If(this.flags.has_reply_markup, self.reply_markup_structures('reply_markup')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp),
+            'send_as' / If(this.flags.has_send_as, self.input_peer_structures('send_as')),
+            'quick_reply_shortcut' / If(this.flags.has_quick_reply_shortcut, self.input_quick_reply_shortcut_structures('quick_reply_shortcut')),
+            'effect' / If(this.flags.has_effect, Int64ul),
+            'allow_paid_stars' / If(this.flags.has_allow_paid_stars, Int64ul))
+
+    @constructor(0xfbfca18f, 'messages_get_emoji_stickers')
+    def struct_0xfbfca18f(self):
+        return ['hash' / Int64ul]
+
+    @constructor(0xfc78af9b, 'messages_report')
+    def struct_0xfc78af9b(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'),
+            'option' / TBytes,
+            'message' / TString)
+
+    @constructor(0xfd2dda49, 'messages_toggle_dialog_filter_tags')
+    def struct_0xfd2dda49(self):
+        return ['enabled' / TBool]
+
+    @constructor(0xfd5e12bd, 'messages_web_page')
+    def struct_0xfd5e12bd(self):
+        return (
+            'webpage' / self.web_page_structures('webpage'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xfda68d36, 'messages_get_message_edit_data')
+    def struct_0xfda68d36(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul)
+
+    @constructor(0xfeb16771, 'messages_set_chat_available_reactions')
+    def struct_0xfeb16771(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'available_reactions' / self.chat_reactions_structures('available_reactions'))
+
+    @constructor(0xff57708d, 'messages_prepared_inline_message')
+    def struct_0xff57708d(self):
+        return (
+            'query_id' / Int64ul,
+            'result' / self.bot_inline_result_structures('result'),
+            'peer_types' / self.vector(self.inline_query_peer_type_structures('peer_types'), 'peer_types'),
+            'cache_time' / Int32ul,
+            'users' / self.vector(self.user_structures('users'), 'users'))
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_all_stickers of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xcdbbcebb, 'messages_all_stickers')
+    def struct_0xcdbbcebb(self):
+        return (
+            'hash2' / Int64ul,
+            'sets' / self.vector(self.sticker_set_structures('sets'), 'sets'))
+
+    @constructor(0xe86602c3, 'messages_all_stickers_not_modified')
+    def struct_0xe86602c3(self):
+        return []
+
+    @structures
+    def messages_all_stickers_structures(self, name):
+        tag_map = {
+            0xcdbbcebb: LazyBound(self.struct_0xcdbbcebb),
+            0xe86602c3: LazyBound(self.struct_0xe86602c3)
+        }
+        return TLUnion(name, tag_map)
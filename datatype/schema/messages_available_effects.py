@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_available_effects of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd1ed9a5b, 'messages_available_effects_not_modified')
+    def struct_0xd1ed9a5b(self):
+        return []
+
+    @constructor(0xbddb616e, 'messages_available_effects')
+    def struct_0xbddb616e(self):
+        return (
+            'hash' / Int32ul,
+            'effects' / self.vector(self.struct_0x93c3e27e(), 'effects'),
+            'documents' / self.vector(self.document_structures('documents'), 'documents'))
+
+    @structures
+    def messages_available_effects_structures(self, name):
+        tag_map = {
+            0xd1ed9a5b: LazyBound(self.struct_0xd1ed9a5b),
+            0xbddb616e: LazyBound(self.struct_0xbddb616e)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x93c3e27e, 'available_effect')
+    def struct_0x93c3e27e(self):
+        return Struct(
+            'sname' / Computed('available_effect'),
+            'signature' / Hex(Const(0x93c3e27e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_premium_required=4,
+                                has_static_icon_id=1,
+                                has_effect_animation_id=2),
+            'id' / Int64ul,
+            'emoticon' / TString,
+            'static_icon_id' / If(this.flags.has_static_icon_id, Int64ul),
+            'effect_sticker_id' / Int64ul,
+            'effect_animation_id' / If(this.flags.has_effect_animation_id, Int64ul))
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_available_reactions of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x9f071957, 'messages_available_reactions_not_modified')
+    def struct_0x9f071957(self):
+        return []
+
+    @constructor(0x768e3aad, 'messages_available_reactions')
+    def struct_0x768e3aad(self):
+        return (
+            'hash' / Int32ul,
+            'reactions' / self.vector(self.struct_0xc077ec01(), 'reactions'))
+
+    @structures
+    def messages_available_reactions_structures(self, name):
+        tag_map = {
+            0x9f071957: LazyBound(self.struct_0x9f071957),
+            0x768e3aad: LazyBound(self.struct_0x768e3aad)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xc077ec01, 'available_reaction')
+    def struct_0xc077ec01(self):
+        return Struct(
+            'sname' / Computed('available_reaction'),
+            'signature' / Hex(Const(0xc077ec01, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_inactive=1,
+                                is_premium=4,
+                                has_around_animation=2),
+            'reaction' / TString,
+            'title' / TString,
+            'static_icon' / self.document_structures('static_icon'),
+            'appear_animation' / self.document_structures('appear_animation'),
+            'select_animation' / self.document_structures('select_animation'),
+            'activate_animation' / self.document_structures('activate_animation'),
+            'effect_animation' / self.document_structures('effect_animation'),
+            'around_animation' / If(this.flags.has_around_animation, self.document_structures('around_animation')),
+            'center_icon' / If(this.flags.has_around_animation, self.document_structures('center_icon')))
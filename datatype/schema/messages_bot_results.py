@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_bot_results of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xccd3563d, 'messages_bot_results_layer71')
+    def struct_0xccd3563d(self):
+        return Struct(
+            'sname' / Computed('messages_bot_results_layer71'),
+            'signature' / Hex(Const(0xccd3563d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_gallery=1,
+                                has_next_offset=2,
+                                has_switch_pm=4),
+            'query_id' / Int64ul,
+            'next_offset' / If(this.flags.has_next_offset, TString),
+            'switch_pm' / If(this.flags.has_switch_pm, self.struct_0x3c20629f()),
+            'results' / self.vector(self.bot_inline_result_structures('results'), 'results'),
+            'cache_time' / Int32ul)
+
+    @constructor(0x947ca848, 'messages_bot_results_layer153')
+    def struct_0x947ca848(self):
+        return Struct(
+            'sname' / Computed('messages_bot_results_layer153'),
+            'signature' / Hex(Const(0x947ca848, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_gallery=1,
+                                has_next_offset=2,
+                                has_switch_pm=4),
+            'query_id' / Int64ul,
+            'next_offset' / If(this.flags.has_next_offset, TString),
+            'switch_pm' / If(this.flags.has_switch_pm, self.struct_0x3c20629f()),
+            'results' / self.vector(self.bot_inline_result_structures('results'), 'results'),
+            'cache_time' / Int32ul,
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xe021f2f6, 'messages_bot_results')
+    def struct_0xe021f2f6(self):
+        return Struct(
+            'sname' / Computed('messages_bot_results'),
+            'signature' / Hex(Const(0xe021f2f6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_gallery=1,
+                                has_next_offset=2,
+                                has_switch_pm=4,
+                                has_switch_webview=8),
+            'query_id' / Int64ul,
+            'next_offset' / If(this.flags.has_next_offset, TString),
+            'switch_pm' / If(this.flags.has_switch_pm, self.struct_0x3c20629f()),
+            'switch_webview' / If(this.flags.has_switch_webview, self.struct_0xb57295d5()),
+            'results' / self.vector(self.bot_inline_result_structures('results'), 'results'),
+            'cache_time' / Int32ul,
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def messages_bot_results_structures(self, name):
+        tag_map = {
+            0xccd3563d: LazyBound(self.struct_0xccd3563d),
+            0x947ca848: LazyBound(self.struct_0x947ca848),
+            0xe021f2f6: LazyBound(self.struct_0xe021f2f6)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x3c20629f, 'inline_bot_switch_pm')
+    def struct_0x3c20629f(self):
+        return (
+            'text' / TString,
+            'start_param' / TString)
+
+    @constructor(0xb57295d5, 'inline_bot_web_view')
+    def struct_0xb57295d5(self):
+        return (
+            'text' / TString,
+            'url' / TString)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_chats of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x64ff9fd5, 'messages_chats')
+    def struct_0x64ff9fd5(self):
+        return ['chats' / self.vector(self.chat_structures('chats'), 'chats')]
+
+    @constructor(0x9cd81144, 'messages_chats_slice')
+    def struct_0x9cd81144(self):
+        return (
+            'count' / Int32ul,
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'))
+
+    @structures
+    def messages_chats_structures(self, name):
+        tag_map = {
+            0x64ff9fd5: LazyBound(self.struct_0x64ff9fd5),
+            0x9cd81144: LazyBound(self.struct_0x9cd81144)
+        }
+        return TLUnion(name, tag_map)
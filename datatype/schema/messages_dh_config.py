@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_dh_config of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xc0e24635, 'messages_dh_config_not_modified')
+    def struct_0xc0e24635(self):
+        return ['random' / TBytes]
+
+    @constructor(0x2c221edd, 'messages_dh_config')
+    def struct_0x2c221edd(self):
+        return (
+            'g' / Int32ul,
+            'p' / TBytes,
+            'version' / Int32ul,
+            'random' / TBytes)
+
+    @structures
+    def messages_dh_config_structures(self, name):
+        tag_map = {
+            0xc0e24635: LazyBound(self.struct_0xc0e24635),
+            0x2c221edd: LazyBound(self.struct_0x2c221edd)
+        }
+        return TLUnion(name, tag_map)
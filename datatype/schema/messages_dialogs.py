@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_dialogs of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x15ba6c40, 'messages_dialogs')
+    def struct_0x15ba6c40(self):
+        return (
+            'dialogs' / self.vector(self.dialog_structures('dialogs'), 'dialogs'),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x71e094f3, 'messages_dialogs_slice')
+    def struct_0x71e094f3(self):
+        return (
+            'count' / Int32ul,
+            'dialogs' / self.vector(self.dialog_structures('dialogs'), 'dialogs'),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xf0e3e596, 'messages_dialogs_not_modified')
+    def struct_0xf0e3e596(self):
+        return ['count' / Int32ul]
+
+    @structures
+    def messages_dialogs_structures(self, name):
+        tag_map = {
+            0x15ba6c40: LazyBound(self.struct_0x15ba6c40),
+            0x71e094f3: LazyBound(self.struct_0x71e094f3),
+            0xf0e3e596: LazyBound(self.struct_0xf0e3e596)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_emoji_groups of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x6fb4ad87, 'messages_emoji_groups_not_modified')
+    def struct_0x6fb4ad87(self):
+        return []
+
+    @constructor(0x881fb94b, 'messages_emoji_groups')
+    def struct_0x881fb94b(self):
+        return (
+            'hash' / Int32ul,
+            'groups' / self.vector(self.emoji_group_structures('groups'), 'groups'))
+
+    @structures
+    def messages_emoji_groups_structures(self, name):
+        tag_map = {
+            0x6fb4ad87: LazyBound(self.struct_0x6fb4ad87),
+            0x881fb94b: LazyBound(self.struct_0x881fb94b)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_exported_chat_invite of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x222600ef, 'messages_exported_chat_invite_replaced')
+    def struct_0x222600ef(self):
+        return (
+            'invite' / self.exported_chat_invite_structures('invite'),
+            'new_invite' / self.exported_chat_invite_structures('new_invite'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x1871be50, 'messages_exported_chat_invite')
+    def struct_0x1871be50(self):
+        return (
+            'invite' / self.exported_chat_invite_structures('invite'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def messages_exported_chat_invite_structures(self, name):
+        tag_map = {
+            0x222600ef: LazyBound(self.struct_0x222600ef),
+            0x1871be50: LazyBound(self.struct_0x1871be50)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_faved_stickers of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x9e8fa6d3, 'messages_faved_stickers_not_modified')
+    def struct_0x9e8fa6d3(self):
+        return []
+
+    @constructor(0x2cb51097, 'messages_faved_stickers')
+    def struct_0x2cb51097(self):
+        return (
+            'hash' / Int64ul,
+            'packs' / self.vector(self.struct_0x12b299d4(), 'packs'),
+            'stickers' / self.vector(self.document_structures('stickers'), 'stickers'))
+
+    @structures
+    def messages_faved_stickers_structures(self, name):
+        tag_map = {
+            0x9e8fa6d3: LazyBound(self.struct_0x9e8fa6d3),
+            0x2cb51097: LazyBound(self.struct_0x2cb51097)
+        }
+        return TLUnion(name, tag_map)
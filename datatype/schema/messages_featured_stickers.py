@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_featured_stickers of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xbe382906, 'messages_featured_stickers')
+    def struct_0xbe382906(self):
+        return Struct(
+            'sname' / Computed('messages_featured_stickers'),
+            'signature' / Hex(Const(0xbe382906, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_premium=1),
+            'hash' / Int64ul,
+            'count' / Int32ul,
+            'sets' / self.vector(self.sticker_set_covered_structures('sets'), 'sets'),
+            'unread' / self.vector(Int64ul, 'unread'))
+
+    @constructor(0xc6dc0c66, 'messages_featured_stickers_not_modified')
+    def struct_0xc6dc0c66(self):
+        return ['count' / Int32ul]
+
+    @structures
+    def messages_featured_stickers_structures(self, name):
+        tag_map = {
+            0xbe382906: LazyBound(self.struct_0xbe382906),
+            0xc6dc0c66: LazyBound(self.struct_0xc6dc0c66)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_filter of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xffc86587, 'input_messages_filter_gif')
+    def struct_0xffc86587(self):
+        return []
+
+    @constructor(0x3751b49e, 'input_messages_filter_music')
+    def struct_0x3751b49e(self):
+        return []
+
+    @constructor(0x3a20ecb8, 'input_messages_filter_chat_photos')
+    def struct_0x3a20ecb8(self):
+        return []
+
+    @constructor(0x9609a51c, 'input_messages_filter_photos')
+    def struct_0x9609a51c(self):
+        return []
+
+    @constructor(0x7ef0dd87, 'input_messages_filter_url')
+    def struct_0x7ef0dd87(self):
+        return []
+
+    @constructor(0x9eddf188, 'input_messages_filter_document')
+    def struct_0x9eddf188(self):
+        return []
+
+    @constructor(0x56e9f0e4, 'input_messages_filter_photo_video')
+    def struct_0x56e9f0e4(self):
+        return []
+
+    @constructor(0xd95e73bb, 'input_messages_filter_photo_video_documents')
+    def struct_0xd95e73bb(self):
+        return []
+
+    @constructor(0xe7026d0d, 'input_messages_filter_geo')
+    def struct_0xe7026d0d(self):
+        return []
+
+    @constructor(0x1bb00451, 'input_messages_filter_pinned')
+    def struct_0x1bb00451(self):
+        return []
+
+    @constructor(0xc1f8e69a, 'input_messages_filter_my_mentions')
+    def struct_0xc1f8e69a(self):
+        return []
+
+    @constructor(0x7a7c17a4, 'input_messages_filter_round_voice')
+    def struct_0x7a7c17a4(self):
+        return []
+
+    @constructor(0xe062db83, 'input_messages_filter_contacts')
+    def struct_0xe062db83(self):
+        return []
+
+    @constructor(0x50f5c392, 'input_messages_filter_voice')
+    def struct_0x50f5c392(self):
+        return []
+
+    @constructor(0x9fc00e65, 'input_messages_filter_video')
+    def struct_0x9fc00e65(self):
+        return []
+
+    @constructor(0x80c99768, 'input_messages_filter_phone_calls')
+    def struct_0x80c99768(self):
+        return Struct(
+            'sname' / Computed('input_messages_filter_phone_calls'),
+            'signature' / Hex(Const(0x80c99768, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_missed=1))
+
+    @constructor(0x57e2f66c, 'input_messages_filter_empty')
+    def struct_0x57e2f66c(self):
+        return []
+
+    @constructor(0xb549da53, 'input_messages_filter_round_video')
+    def struct_0xb549da53(self):
+        return []
+
+    @structures
+    def messages_filter_structures(self, name):
+        tag_map = {
+            0xffc86587: LazyBound(self.struct_0xffc86587),
+            0x3751b49e: LazyBound(self.struct_0x3751b49e),
+            0x3a20ecb8: LazyBound(self.struct_0x3a20ecb8),
+            0x9609a51c: LazyBound(self.struct_0x9609a51c),
+            0x7ef0dd87: LazyBound(self.struct_0x7ef0dd87),
+            0x9eddf188: LazyBound(self.struct_0x9eddf188),
+            0x56e9f0e4: LazyBound(self.struct_0x56e9f0e4),
+            0xd95e73bb: LazyBound(self.struct_0xd95e73bb),
+            0xe7026d0d: LazyBound(self.struct_0xe7026d0d),
+            0x1bb00451: LazyBound(self.struct_0x1bb00451),
+            0xc1f8e69a: LazyBound(self.struct_0xc1f8e69a),
+            0x7a7c17a4: LazyBound(self.struct_0x7a7c17a4),
+            0xe062db83: LazyBound(self.struct_0xe062db83),
+            0x50f5c392: LazyBound(self.struct_0x50f5c392),
+            0x9fc00e65: LazyBound(self.struct_0x9fc00e65),
+            0x80c99768: LazyBound(self.struct_0x80c99768),
+            0x57e2f66c: LazyBound(self.struct_0x57e2f66c),
+            0xb549da53: LazyBound(self.struct_0xb549da53)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_found_sticker_sets of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0d54b65d, 'messages_found_sticker_sets_not_modified')
+    def struct_0x0d54b65d(self):
+        return []
+
+    @constructor(0x8af09dd2, 'messages_found_sticker_sets')
+    def struct_0x8af09dd2(self):
+        return (
+            'hash' / Int64ul,
+            'sets' / self.vector(self.sticker_set_covered_structures('sets'), 'sets'))
+
+    @structures
+    def messages_found_sticker_sets_structures(self, name):
+        tag_map = {
+            0x0d54b65d: LazyBound(self.struct_0x0d54b65d),
+            0x8af09dd2: LazyBound(self.struct_0x8af09dd2)
+        }
+        return TLUnion(name, tag_map)
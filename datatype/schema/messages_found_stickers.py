@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_found_stickers of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x82c9e290, 'messages_found_stickers')
+    def struct_0x82c9e290(self):
+        return Struct(
+            'sname' / Computed('messages_found_stickers'),
+            'signature' / Hex(Const(0x82c9e290, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'next_offset' / If(this.flags.has_next_offset, Int32ul),
+            'hash' / Int64ul,
+            'stickers' / self.vector(self.document_structures('stickers'), 'stickers'))
+
+    @constructor(0x6010c534, 'messages_found_stickers_not_modified')
+    def struct_0x6010c534(self):
+        return Struct(
+            'sname' / Computed('messages_found_stickers_not_modified'),
+            'signature' / Hex(Const(0x6010c534, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'next_offset' / If(this.flags.has_next_offset, Int32ul))
+
+    @structures
+    def messages_found_stickers_structures(self, name):
+        tag_map = {
+            0x82c9e290: LazyBound(self.struct_0x82c9e290),
+            0x6010c534: LazyBound(self.struct_0x6010c534)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_messages of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x3a54685e, 'messages_messages_slice')
+    def struct_0x3a54685e(self):
+        return Struct(
+            'sname' / Computed('messages_messages_slice'),
+            'signature' / Hex(Const(0x3a54685e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_inexact=2,
+                                has_next_rate=1,
+                                has_offset_id_offset=4),
+            'count' / Int32ul,
+            'next_rate' / If(this.flags.has_next_rate, Int32ul),
+            'offset_id_offset' / If(this.flags.has_offset_id_offset, Int32ul),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x8c718e87, 'messages_messages')
+    def struct_0x8c718e87(self):
+        return (
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xc776ba4e, 'messages_channel_messages')
+    def struct_0xc776ba4e(self):
+        return Struct(
+            'sname' / Computed('messages_channel_messages'),
+            'signature' / Hex(Const(0xc776ba4e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_inexact=2,
+                                has_offset_id_offset=4),
+            'pts' / Int32ul,
+            'count' / Int32ul,
+            'offset_id_offset' / If(this.flags.has_offset_id_offset, Int32ul),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'topics' / self.vector(self.forum_topic_structures('topics'), 'topics'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x74535f21, 'messages_messages_not_modified')
+    def struct_0x74535f21(self):
+        return ['count' / Int32ul]
+
+    @structures
+    def messages_messages_structures(self, name):
+        tag_map = {
+            0x3a54685e: LazyBound(self.struct_0x3a54685e),
+            0x8c718e87: LazyBound(self.struct_0x8c718e87),
+            0xc776ba4e: LazyBound(self.struct_0xc776ba4e),
+            0x74535f21: LazyBound(self.struct_0x74535f21)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_quick_replies of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xc68d6695, 'messages_quick_replies')
+    def struct_0xc68d6695(self):
+        return (
+            'quick_replies' / self.vector(self.struct_0x0697102b(), 'quick_replies'),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x5f91eb5b, 'messages_quick_replies_not_modified')
+    def struct_0x5f91eb5b(self):
+        return []
+
+    @structures
+    def messages_quick_replies_structures(self, name):
+        tag_map = {
+            0xc68d6695: LazyBound(self.struct_0xc68d6695),
+            0x5f91eb5b: LazyBound(self.struct_0x5f91eb5b)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x0697102b, 'quick_reply')
+    def struct_0x0697102b(self):
+        return (
+            'shortcut_id' / Int32ul,
+            'shortcut' / TString,
+            'top_message' / Int32ul,
+            'count' / Int32ul)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_reactions of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xb06fdbdf, 'messages_reactions_not_modified')
+    def struct_0xb06fdbdf(self):
+        return []
+
+    @constructor(0xeafdf716, 'messages_reactions')
+    def struct_0xeafdf716(self):
+        return (
+            'hash' / Int64ul,
+            'reactions' / self.vector(self.reaction_structures('reactions'), 'reactions'))
+
+    @structures
+    def messages_reactions_structures(self, name):
+        tag_map = {
+            0xb06fdbdf: LazyBound(self.struct_0xb06fdbdf),
+            0xeafdf716: LazyBound(self.struct_0xeafdf716)
+        }
+        return TLUnion(name, tag_map)
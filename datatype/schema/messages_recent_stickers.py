@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_recent_stickers of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x88d37c56, 'messages_recent_stickers')
+    def struct_0x88d37c56(self):
+        return (
+            'hash' / Int64ul,
+            'packs' / self.vector(self.struct_0x12b299d4(), 'packs'),
+            'stickers' / self.vector(self.document_structures('stickers'), 'stickers'),
+            'dates' / self.vector(Int32ul, 'dates'))
+
+    @constructor(0x0b17f890, 'messages_recent_stickers_not_modified')
+    def struct_0x0b17f890(self):
+        return []
+
+    @structures
+    def messages_recent_stickers_structures(self, name):
+        tag_map = {
+            0x88d37c56: LazyBound(self.struct_0x88d37c56),
+            0x0b17f890: LazyBound(self.struct_0x0b17f890)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_saved_dialogs of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf83ae221, 'messages_saved_dialogs')
+    def struct_0xf83ae221(self):
+        return (
+            'dialogs' / self.vector(self.struct_0xbd87cb6c(), 'dialogs'),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'))
+
+    @constructor(0x44ba9dd9, 'messages_saved_dialogs_slice')
+    def struct_0x44ba9dd9(self):
+        return (
+            'count' / Int32ul,
+            'dialogs' / self.vector(self.struct_0xbd87cb6c(), 'dialogs'),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'))
+
+    @constructor(0xc01f6fe8, 'messages_saved_dialogs_not_modified')
+    def struct_0xc01f6fe8(self):
+        return ['count' / Int32ul]
+
+    @structures
+    def messages_saved_dialogs_structures(self, name):
+        tag_map = {
+            0xf83ae221: LazyBound(self.struct_0xf83ae221),
+            0x44ba9dd9: LazyBound(self.struct_0x44ba9dd9),
+            0xc01f6fe8: LazyBound(self.struct_0xc01f6fe8)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xbd87cb6c, 'saved_dialog')
+    def struct_0xbd87cb6c(self):
+        return Struct(
+            'sname' / Computed('saved_dialog'),
+            'signature' / Hex(Const(0xbd87cb6c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=4),
+            'peer' / self.peer_structures('peer'),
+            'top_message' / Int32ul)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_saved_gifs of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xe8025ca2, 'messages_saved_gifs_not_modified')
+    def struct_0xe8025ca2(self):
+        return []
+
+    @constructor(0x84a02a0d, 'messages_saved_gifs')
+    def struct_0x84a02a0d(self):
+        return (
+            'hash' / Int64ul,
+            'gifs' / self.vector(self.document_structures('gifs'), 'gifs'))
+
+    @structures
+    def messages_saved_gifs_structures(self, name):
+        tag_map = {
+            0xe8025ca2: LazyBound(self.struct_0xe8025ca2),
+            0x84a02a0d: LazyBound(self.struct_0x84a02a0d)
+        }
+        return TLUnion(name, tag_map)
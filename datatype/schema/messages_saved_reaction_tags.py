@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_saved_reaction_tags of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x889b59ef, 'messages_saved_reactions_tags_not_modified')
+    def struct_0x889b59ef(self):
+        return []
+
+    @constructor(0x3259950a, 'messages_saved_reactions_tags')
+    def struct_0x3259950a(self):
+        return (
+            'tags' / self.vector(self.struct_0xcb6ff828(), 'tags'),
+            'hash' / Int64ul)
+
+    @structures
+    def messages_saved_reaction_tags_structures(self, name):
+        tag_map = {
+            0x889b59ef: LazyBound(self.struct_0x889b59ef),
+            0x3259950a: LazyBound(self.struct_0x3259950a)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xcb6ff828, 'saved_reaction_tag')
+    def struct_0xcb6ff828(self):
+        return Struct(
+            'sname' / Computed('saved_reaction_tag'),
+            'signature' / Hex(Const(0xcb6ff828, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_title=1),
+            'reaction' / self.reaction_structures('reaction'),
+            'title' / If(this.flags.has_title, TString),
+            'count' / Int32ul)
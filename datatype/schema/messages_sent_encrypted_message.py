@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_sent_encrypted_message of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x560f8935, 'messages_sent_encrypted_message')
+    def struct_0x560f8935(self):
+        return ['date' / TTimestamp]
+
+    @constructor(0x9493ff32, 'messages_sent_encrypted_file')
+    def struct_0x9493ff32(self):
+        return (
+            'date' / TTimestamp,
+            'file' / self.encrypted_file_structures('file'))
+
+    @structures
+    def messages_sent_encrypted_message_structures(self, name):
+        tag_map = {
+            0x560f8935: LazyBound(self.struct_0x560f8935),
+            0x9493ff32: LazyBound(self.struct_0x9493ff32)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_sponsored_messages of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x1839490f, 'messages_sponsored_messages_empty')
+    def struct_0x1839490f(self):
+        return []
+
+    @constructor(0xc9ee1d87, 'messages_sponsored_messages')
+    def struct_0xc9ee1d87(self):
+        return Struct(
+            'sname' / Computed('messages_sponsored_messages'),
+            'signature' / Hex(Const(0xc9ee1d87, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_posts_between=1),
+            'posts_between' / If(this.flags.has_posts_between, Int32ul),
+            'messages' / self.vector(self.struct_0x4d93a990(), 'messages'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def messages_sponsored_messages_structures(self, name):
+        tag_map = {
+            0x1839490f: LazyBound(self.struct_0x1839490f),
+            0xc9ee1d87: LazyBound(self.struct_0xc9ee1d87)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x4d93a990, 'sponsored_message')
+    def struct_0x4d93a990(self):
+        return Struct(
+            'sname' / Computed('sponsored_message'),
+            'signature' / Hex(Const(0x4d93a990, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_recommended=32,
+                                is_can_report=4096,
+                                has_entities=2,
+                                has_photo=64,
+                                has_media=16384,
+                                has_color=8192,
+                                has_sponsor_info=128,
+                                has_additional_info=256),
+            'random_id' / TBytes,
+            'url' / TString,
+            'title' / TString,
+            'message' / TString,
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'photo' / If(this.flags.has_photo, self.photo_structures('photo')),
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'color' / If(this.flags.has_color, self.struct_0xb54b5acf()),
+            'button_text' / TString,
+            'sponsor_info' / If(this.flags.has_sponsor_info, TString),
+            'additional_info' / If(this.flags.has_additional_info, TString))
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_sticker_set of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x6e153f16, 'messages_sticker_set')
+    def struct_0x6e153f16(self):
+        return (
+            'set' / self.sticker_set_structures('set'),
+            'packs' / self.vector(self.struct_0x12b299d4(), 'packs'),
+            'keywords' / self.vector(self.struct_0xfcfeb29c(), 'keywords'),
+            'documents' / self.vector(self.document_structures('documents'), 'documents'))
+
+    @constructor(0xb60a24a6, 'messages_sticker_set_layer146')
+    def struct_0xb60a24a6(self):
+        return (
+            'set' / self.sticker_set_structures('set'),
+            'packs' / self.vector(self.struct_0x12b299d4(), 'packs'),
+            'documents' / self.vector(self.document_structures('documents'), 'documents'))
+
+    @constructor(0xd3f924eb, 'messages_sticker_set_not_modified')
+    def struct_0xd3f924eb(self):
+        return []
+
+    @structures
+    def messages_sticker_set_structures(self, name):
+        tag_map = {
+            0x6e153f16: LazyBound(self.struct_0x6e153f16),
+            0xb60a24a6: LazyBound(self.struct_0xb60a24a6),
+            0xd3f924eb: LazyBound(self.struct_0xd3f924eb)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_sticker_set_install_result of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x38641628, 'messages_sticker_set_install_result_success')
+    def struct_0x38641628(self):
+        return []
+
+    @constructor(0x35e410a8, 'messages_sticker_set_install_result_archive')
+    def struct_0x35e410a8(self):
+        return ['sets' / self.vector(self.sticker_set_covered_structures('sets'), 'sets')]
+
+    @structures
+    def messages_sticker_set_install_result_structures(self, name):
+        tag_map = {
+            0x38641628: LazyBound(self.struct_0x38641628),
+            0x35e410a8: LazyBound(self.struct_0x35e410a8)
+        }
+        return TLUnion(name, tag_map)
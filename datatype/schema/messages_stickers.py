@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group messages_stickers of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf1749a22, 'messages_stickers_not_modified')
+    def struct_0xf1749a22(self):
+        return []
+
+    @constructor(0x30a6ec7e, 'messages_stickers')
+    def struct_0x30a6ec7e(self):
+        return (
+            'hash' / Int64ul,
+            'stickers' / self.vector(self.document_structures('stickers'), 'stickers'))
+
+    @structures
+    def messages_stickers_structures(self, name):
+        tag_map = {
+            0xf1749a22: LazyBound(self.struct_0xf1749a22),
+            0x30a6ec7e: LazyBound(self.struct_0x30a6ec7e)
+        }
+        return TLUnion(name, tag_map)
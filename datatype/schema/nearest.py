@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group nearest of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x8e1a1775, 'nearest_dc')
+    def struct_0x8e1a1775(self):
+        return (
+            'country' / TString,
+            'this_dc' / Int32ul,
+            'nearest_dc' / Int32ul)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group notification_sound of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x97e8bebe, 'notification_sound_default')
+    def struct_0x97e8bebe(self):
+        return []
+
+    @constructor(0x6f0c34df, 'notification_sound_none')
+    def struct_0x6f0c34df(self):
+        return []
+
+    @constructor(0xff6c8049, 'notification_sound_ringtone')
+    def struct_0xff6c8049(self):
+        return ['id' / Int64ul]
+
+    @constructor(0x830b9ae4, 'notification_sound_local')
+    def struct_0x830b9ae4(self):
+        return (
+            'title' / TString,
+            'data' / TString)
+
+    @structures
+    def notification_sound_structures(self, name):
+        tag_map = {
+            0x97e8bebe: LazyBound(self.struct_0x97e8bebe),
+            0x6f0c34df: LazyBound(self.struct_0x6f0c34df),
+            0xff6c8049: LazyBound(self.struct_0xff6c8049),
+            0x830b9ae4: LazyBound(self.struct_0x830b9ae4)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group notify_peer of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x226e6308, 'notify_forum_topic')
+    def struct_0x226e6308(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'top_msg_id' / Int32ul)
+
+    @constructor(0xd612e8ef, 'notify_broadcasts')
+    def struct_0xd612e8ef(self):
+        return []
+
+    @constructor(0xc007cec3, 'notify_chats')
+    def struct_0xc007cec3(self):
+        return []
+
+    @constructor(0xb4c83b4c, 'notify_users')
+    def struct_0xb4c83b4c(self):
+        return []
+
+    @constructor(0x9fd40bd8, 'notify_peer')
+    def struct_0x9fd40bd8(self):
+        return ['peer' / self.peer_structures('peer')]
+
+    @structures
+    def notify_peer_structures(self, name):
+        tag_map = {
+            0x226e6308: LazyBound(self.struct_0x226e6308),
+            0xd612e8ef: LazyBound(self.struct_0xd612e8ef),
+            0xc007cec3: LazyBound(self.struct_0xc007cec3),
+            0xb4c83b4c: LazyBound(self.struct_0xb4c83b4c),
+            0x9fd40bd8: LazyBound(self.struct_0x9fd40bd8)
+        }
+        return TLUnion(name, tag_map)
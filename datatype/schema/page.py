@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group page of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x8dee6c44, 'page_part_layer67')
+    def struct_0x8dee6c44(self):
+        return (
+            'blocks' / self.vector(self.page_block_structures('blocks'), 'blocks'),
+            'photos' / self.vector(self.photo_structures('photos'), 'photos'),
+            'documents' / self.vector(self.document_structures('documents'), 'documents'))
+
+    @constructor(0x8e3f9ebe, 'page_part_layer82')
+    def struct_0x8e3f9ebe(self):
+        return (
+            'blocks' / self.vector(self.page_block_structures('blocks'), 'blocks'),
+            'photos' / self.vector(self.photo_structures('photos'), 'photos'),
+            'documents' / self.vector(self.document_structures('documents'), 'documents'))
+
+    @constructor(0xd7a19d69, 'page_full_layer67')
+    def struct_0xd7a19d69(self):
+        return (
+            'blocks' / self.vector(self.page_block_structures('blocks'), 'blocks'),
+            'photos' / self.vector(self.photo_structures('photos'), 'photos'),
+            'documents' / self.vector(self.document_structures('documents'), 'documents'))
+
+    @constructor(0x556ec7aa, 'page_full_layer82')
+    def struct_0x556ec7aa(self):
+        return (
+            'blocks' / self.vector(self.page_block_structures('blocks'), 'blocks'),
+            'photos' / self.vector(self.photo_structures('photos'), 'photos'),
+            'documents' / self.vector(self.document_structures('documents'), 'documents'))
+
+    @constructor(0xae891bec, 'page_layer110')
+    def struct_0xae891bec(self):
+        return Struct(
+            'sname' / Computed('page_layer110'),
+            'signature' / Hex(Const(0xae891bec, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_part=1,
+                                is_rtl=2),
+            'url' / TString,
+            'blocks' / self.vector(self.page_block_structures('blocks'), 'blocks'),
+            'photos' / self.vector(self.photo_structures('photos'), 'photos'),
+            'documents' / self.vector(self.document_structures('documents'), 'documents'))
+
+    @constructor(0x98657f0d, 'page')
+    def struct_0x98657f0d(self):
+        return Struct(
+            'sname' / Computed('page'),
+            'signature' / Hex(Const(0x98657f0d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_part=1,
+                                is_rtl=2,
+                                is_v2=4,
+                                has_views=8),
+            'url' / TString,
+            'blocks' / self.vector(self.page_block_structures('blocks'), 'blocks'),
+            'photos' / self.vector(self.photo_structures('photos'), 'photos'),
+            'documents' / self.vector(self.document_structures('documents'), 'documents'),
+            'views' / If(this.flags.has_views, Int32ul))
+
+    @structures
+    def page_structures(self, name):
+        tag_map = {
+            0x8dee6c44: LazyBound(self.struct_0x8dee6c44),
+            0x8e3f9ebe: LazyBound(self.struct_0x8e3f9ebe),
+            0xd7a19d69: LazyBound(self.struct_0xd7a19d69),
+            0x556ec7aa: LazyBound(self.struct_0x556ec7aa),
+            0xae891bec: LazyBound(self.struct_0xae891bec),
+            0x98657f0d: LazyBound(self.struct_0x98657f0d)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group page_block of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x9a8ae1e1, 'page_block_ordered_list')
+    def struct_0x9a8ae1e1(self):
+        return ['items' / self.vector(self.page_list_ordered_item_structures('items'), 'items')]
+
+    @constructor(0xd9d71866, 'page_block_video_layer82')
+    def struct_0xd9d71866(self):
+        return Struct(
+            'sname' / Computed('page_block_video_layer82'),
+            'signature' / Hex(Const(0xd9d71866, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_autoplay=1,
+                                is_loop=2),
+            'video_id' / Int64ul,
+            'caption_text' / self.rich_text_structures('caption_text'))
+
+    @constructor(0xf259a80b, 'page_block_embed_post')
+    def struct_0xf259a80b(self):
+        return (
+            'url' / TString,
+            'webpage_id' / Int64ul,
+            'author_photo_id' / Int64ul,
+            'author' / TString,
+            'date' / TTimestamp,
+            'blocks' / self.vector(self.page_block_structures('blocks'), 'blocks'),
+            'caption' / self.struct_0x6f747657())
+
+    @constructor(0x467a0766, 'page_block_paragraph')
+    def struct_0x467a0766(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0x1e148390, 'page_block_kicker')
+    def struct_0x1e148390(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0x48870999, 'page_block_footer')
+    def struct_0x48870999(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0xbfd064ec, 'page_block_header')
+    def struct_0xbfd064ec(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0xc070d93e, 'page_block_preformatted')
+    def struct_0xc070d93e(self):
+        return (
+            'text' / self.rich_text_structures('text'),
+            'language' / TString)
+
+    @constructor(0x16115a96, 'page_block_related_articles')
+    def struct_0x16115a96(self):
+        return (
+            'title' / self.rich_text_structures('title'),
+            'articles' / self.vector(self.struct_0xb390dc08(), 'articles'))
+
+    @constructor(0xf12bb6e1, 'page_block_subheader')
+    def struct_0xf12bb6e1(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0x031f9590, 'page_block_slideshow')
+    def struct_0x031f9590(self):
+        return (
+            'items' / self.vector(self.page_block_structures('items'), 'items'),
+            'caption' / self.struct_0x6f747657())
+
+    @constructor(0xce0d37b0, 'page_block_anchor')
+    def struct_0xce0d37b0(self):
+        return ['name' / TString]
+
+    @constructor(0xa44f3ef6, 'page_block_map')
+    def struct_0xa44f3ef6(self):
+        return (
+            'geo' / self.geo_point_structures('geo'),
+            'zoom' / Int32ul,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'caption' / self.struct_0x6f747657())
+
+    @constructor(0xdb20b188, 'page_block_divider')
+    def struct_0xdb20b188(self):
+        return []
+
+    @constructor(0x1759c560, 'page_block_photo')
+    def struct_0x1759c560(self):
+        return Struct(
+            'sname' / Computed('page_block_photo'),
+            'signature' / Hex(Const(0x1759c560, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_url=1),
+            'photo_id' / Int64ul,
+            'caption' / self.struct_0x6f747657(),
+            'url' / If(this.flags.has_url, TString),
+            'webpage_id' / If(this.flags.has_url, Int64ul))
+
+    @constructor(0xe4e88011, 'page_block_list')
+    def struct_0xe4e88011(self):
+        return ['items' / self.vector(self.page_list_item_structures('items'), 'items')]
+
+    @constructor(0x13567e8a, 'page_block_unsupported')
+    def struct_0x13567e8a(self):
+        return []
+
+    @constructor(0x65a0fa4d, 'page_block_collage')
+    def struct_0x65a0fa4d(self):
+        return (
+            'items' / self.vector(self.page_block_structures('items'), 'items'),
+            'caption' / self.struct_0x6f747657())
+
+    @constructor(0x3d5b64f2, 'page_block_author_date_layer60')
+    def struct_0x3d5b64f2(self):
+        return (
+            'author' / TString,
+            'published_date' / TTimestamp)
+
+    @constructor(0x3a58c7f4, 'page_block_list_layer82')
+    def struct_0x3a58c7f4(self):
+        return (
+            'ordered' / TBool,
+            'items' / self.vector(self.page_list_item_structures('items'), 'items'))
+
+    @constructor(0xa8718dc5, 'page_block_embed')
+    def struct_0xa8718dc5(self):
+        return Struct(
+            'sname' / Computed('page_block_embed'),
+            'signature' / Hex(Const(0xa8718dc5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_full_width=1,
+                                is_allow_scrolling=8,
+                                has_url=2,
+                                has_html=4,
+                                has_poster_photo_id=16,
+                                has_w=32),
+            'url' / If(this.flags.has_url, TString),
+            'html' / If(this.flags.has_html, TString),
+            'poster_photo_id' / If(this.flags.has_poster_photo_id, Int64ul),
+            'w' / If(this.flags.has_w, Int32ul),
+            'h' / If(this.flags.has_w, Int32ul),
+            'caption' / self.struct_0x6f747657())
+
+    @constructor(0x130c8963, 'page_block_slideshow_layer82')
+    def struct_0x130c8963(self):
+        return (
+            'items' / self.vector(self.page_block_structures('items'), 'items'),
+            'caption_text' / self.rich_text_structures('caption_text'))
+
+    @constructor(0x8ffa9a1f, 'page_block_subtitle')
+    def struct_0x8ffa9a1f(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0x263d7c26, 'page_block_blockquote')
+    def struct_0x263d7c26(self):
+        return (
+            'text' / self.rich_text_structures('text'),
+            'caption' / self.rich_text_structures('caption'))
+
+    @constructor(0x76768bed, 'page_block_details')
+    def struct_0x76768bed(self):
+        return Struct(
+            'sname' / Computed('page_block_details'),
+            'signature' / Hex(Const(0x76768bed, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_open=1),
+            'blocks' / self.vector(self.page_block_structures('blocks'), 'blocks'),
+            'title' / self.rich_text_structures('title'))
+
+    @constructor(0xef1751b5, 'page_block_channel')
+    def struct_0xef1751b5(self):
+        return ['channel' / self.chat_structures('channel')]
+
+    @constructor(0x7c8fe7b6, 'page_block_video')
+    def struct_0x7c8fe7b6(self):
+        return Struct(
+            'sname' / Computed('page_block_video'),
+            'signature' / Hex(Const(0x7c8fe7b6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_autoplay=1,
+                                is_loop=2),
+            'video_id' / Int64ul,
+            'caption' / self.struct_0x6f747657())
+
+    @constructor(0xd935d8fb, 'page_block_embed_layer60')
+    def struct_0xd935d8fb(self):
+        return Struct(
+            'sname' / Computed('page_block_embed_layer60'),
+            'signature' / Hex(Const(0xd935d8fb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_full_width=1,
+                                is_allow_scrolling=8,
+                                has_url=2,
+                                has_html=4),
+            'url' / If(this.flags.has_url, TString),
+            'html' / If(this.flags.has_html, TString),
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'caption' / self.rich_text_structures('caption'))
+
+    @constructor(0x4f4456d3, 'page_block_pullquote')
+    def struct_0x4f4456d3(self):
+        return (
+            'text' / self.rich_text_structures('text'),
+            'caption' / self.rich_text_structures('caption'))
+
+    @constructor(0x804361ea, 'page_block_audio')
+    def struct_0x804361ea(self):
+        return (
+            'audio_id' / Int64ul,
+            'caption' / self.struct_0x6f747657())
+
+    @constructor(0xbf4dea82, 'page_block_table')
+    def struct_0xbf4dea82(self):
+        return Struct(
+            'sname' / Computed('page_block_table'),
+            'signature' / Hex(Const(0xbf4dea82, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_bordered=1,
+                                is_striped=2),
+            'title' / self.rich_text_structures('title'),
+            'rows' / self.vector(self.struct_0xe0c0c5e5(), 'rows'))
+
+    @constructor(0xe9c69982, 'page_block_photo_layer82')
+    def struct_0xe9c69982(self):
+        return (
+            'photo_id' / Int64ul,
+            'caption_text' / self.rich_text_structures('caption_text'))
+
+    @constructor(0x70abc3fd, 'page_block_title')
+    def struct_0x70abc3fd(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0x292c7be9, 'page_block_embed_post_layer82')
+    def struct_0x292c7be9(self):
+        return (
+            'url' / TString,
+            'webpage_id' / Int64ul,
+            'author_photo_id' / Int64ul,
+            'author' / TString,
+            'date' / TTimestamp,
+            'blocks' / self.vector(self.page_block_structures('blocks'), 'blocks'),
+            'caption_text' / self.rich_text_structures('caption_text'))
+
+    @constructor(0x08b31c4f, 'page_block_collage_layer82')
+    def struct_0x08b31c4f(self):
+        return (
+            'items' / self.vector(self.page_block_structures('items'), 'items'),
+            'caption_text' / self.rich_text_structures('caption_text'))
+
+    @constructor(0x31b81a7f, 'page_block_audio_layer82')
+    def struct_0x31b81a7f(self):
+        return (
+            'audio_id' / Int64ul,
+            'caption_text' / self.rich_text_structures('caption_text'))
+
+    @constructor(0x39f23300, 'page_block_cover')
+    def struct_0x39f23300(self):
+        return ['cover' / self.page_block_structures('cover')]
+
+    @constructor(0xcde200d1, 'page_block_embed_layer82')
+    def struct_0xcde200d1(self):
+        return Struct(
+            'sname' / Computed('page_block_embed_layer82'),
+            'signature' / Hex(Const(0xcde200d1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_full_width=1,
+                                is_allow_scrolling=8,
+                                has_url=2,
+                                has_html=4,
+                                has_poster_photo_id=16),
+            'url' / If(this.flags.has_url, TString),
+            'html' / If(this.flags.has_html, TString),
+            'poster_photo_id' / If(this.flags.has_poster_photo_id, Int64ul),
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'caption_text' / self.rich_text_structures('caption_text'))
+
+    @constructor(0xbaafe5e0, 'page_block_author_date')
+    def struct_0xbaafe5e0(self):
+        return (
+            'author' / self.rich_text_structures('author'),
+            'published_date' / TTimestamp)
+
+    @structures
+    def page_block_structures(self, name):
+        tag_map = {
+            0x9a8ae1e1: LazyBound(self.struct_0x9a8ae1e1),
+            0xd9d71866: LazyBound(self.struct_0xd9d71866),
+            0xf259a80b: LazyBound(self.struct_0xf259a80b),
+            0x467a0766: LazyBound(self.struct_0x467a0766),
+            0x1e148390: LazyBound(self.struct_0x1e148390),
+            0x48870999: LazyBound(self.struct_0x48870999),
+            0xbfd064ec: LazyBound(self.struct_0xbfd064ec),
+            0xc070d93e: LazyBound(self.struct_0xc070d93e),
+            0x16115a96: LazyBound(self.struct_0x16115a96),
+            0xf12bb6e1: LazyBound(self.struct_0xf12bb6e1),
+            0x031f9590: LazyBound(self.struct_0x031f9590),
+            0xce0d37b0: LazyBound(self.struct_0xce0d37b0),
+            0xa44f3ef6: LazyBound(self.struct_0xa44f3ef6),
+            0xdb20b188: LazyBound(self.struct_0xdb20b188),
+            0x1759c560: LazyBound(self.struct_0x1759c560),
+            0xe4e88011: LazyBound(self.struct_0xe4e88011),
+            0x13567e8a: LazyBound(self.struct_0x13567e8a),
+            0x65a0fa4d: LazyBound(self.struct_0x65a0fa4d),
+            0x3d5b64f2: LazyBound(self.struct_0x3d5b64f2),
+            0x3a58c7f4: LazyBound(self.struct_0x3a58c7f4),
+            0xa8718dc5: LazyBound(self.struct_0xa8718dc5),
+            0x130c8963: LazyBound(self.struct_0x130c8963),
+            0x8ffa9a1f: LazyBound(self.struct_0x8ffa9a1f),
+            0x263d7c26: LazyBound(self.struct_0x263d7c26),
+            0x76768bed: LazyBound(self.struct_0x76768bed),
+            0xef1751b5: LazyBound(self.struct_0xef1751b5),
+            0x7c8fe7b6: LazyBound(self.struct_0x7c8fe7b6),
+            0xd935d8fb: LazyBound(self.struct_0xd935d8fb),
+            0x4f4456d3: LazyBound(self.struct_0x4f4456d3),
+            0x804361ea: LazyBound(self.struct_0x804361ea),
+            0xbf4dea82: LazyBound(self.struct_0xbf4dea82),
+            0xe9c69982: LazyBound(self.struct_0xe9c69982),
+            0x70abc3fd: LazyBound(self.struct_0x70abc3fd),
+            0x292c7be9: LazyBound(self.struct_0x292c7be9),
+            0x08b31c4f: LazyBound(self.struct_0x08b31c4f),
+            0x31b81a7f: LazyBound(self.struct_0x31b81a7f),
+            0x39f23300: LazyBound(self.struct_0x39f23300),
+            0xcde200d1: LazyBound(self.struct_0xcde200d1),
+            0xbaafe5e0: LazyBound(self.struct_0xbaafe5e0)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x34566b6a, 'page_table_cell')
+    def struct_0x34566b6a(self):
+        return Struct(
+            'sname' / Computed('page_table_cell'),
+            'signature' / Hex(Const(0x34566b6a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_header=1,
+                                is_align_center=8,
+                                is_align_right=16,
+                                is_valign_middle=32,
+                                is_valign_bottom=64,
+                                has_text=128,
+                                has_colspan=2,
+                                has_rowspan=4),
+            'text' / If(this.flags.has_text, self.rich_text_structures('text')),
+            'colspan' / If(this.flags.has_colspan, Int32ul),
+            'rowspan' / If(this.flags.has_rowspan, Int32ul))
+
+    @constructor(0x6f747657, 'page_caption')
+    def struct_0x6f747657(self):
+        return (
+            'text' / self.rich_text_structures('text'),
+            'credit' / self.rich_text_structures('credit'))
+
+    @constructor(0xb390dc08, 'page_related_article')
+    def struct_0xb390dc08(self):
+        return Struct(
+            'sname' / Computed('page_related_article'),
+            'signature' / Hex(Const(0xb390dc08, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_title=1,
+                                has_description=2,
+                                has_photo_id=4,
+                                has_author=8,
+                                has_published_date=16),
+            'url' / TString,
+            'webpage_id' / Int64ul,
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo_id' / If(this.flags.has_photo_id, Int64ul),
+            'author' / If(this.flags.has_author, TString),
+            'published_date' / If(this.flags.has_published_date, TTimestamp))
+
+    @constructor(0xe0c0c5e5, 'page_table_row')
+    def struct_0xe0c0c5e5(self):
+        return ['cells' / self.vector(self.struct_0x34566b6a(), 'cells')]
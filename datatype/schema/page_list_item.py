@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group page_list_item of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x25e073fc, 'page_list_item_blocks')
+    def struct_0x25e073fc(self):
+        return ['blocks' / self.vector(self.page_block_structures('blocks'), 'blocks')]
+
+    @constructor(0xb92fb6cd, 'page_list_item_text')
+    def struct_0xb92fb6cd(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @structures
+    def page_list_item_structures(self, name):
+        tag_map = {
+            0x25e073fc: LazyBound(self.struct_0x25e073fc),
+            0xb92fb6cd: LazyBound(self.struct_0xb92fb6cd)
+        }
+        return TLUnion(name, tag_map)
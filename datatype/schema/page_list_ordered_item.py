@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group page_list_ordered_item of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x5e068047, 'page_list_ordered_item_text')
+    def struct_0x5e068047(self):
+        return (
+            'num' / TString,
+            'text' / self.rich_text_structures('text'))
+
+    @constructor(0x98dd8936, 'page_list_ordered_item_blocks')
+    def struct_0x98dd8936(self):
+        return (
+            'num' / TString,
+            'blocks' / self.vector(self.page_block_structures('blocks'), 'blocks'))
+
+    @structures
+    def page_list_ordered_item_structures(self, name):
+        tag_map = {
+            0x5e068047: LazyBound(self.struct_0x5e068047),
+            0x98dd8936: LazyBound(self.struct_0x98dd8936)
+        }
+        return TLUnion(name, tag_map)
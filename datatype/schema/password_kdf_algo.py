@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group password_kdf_algo of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd45ab096, 'password_kdf_algo_unknown')
+    def struct_0xd45ab096(self):
+        return []
+
+    @constructor(0x3a912d4a, 'password_kdf_algo_sha256sha256pbkdf2hmacsha512iter100000sha256mod_pow')
+    def struct_0x3a912d4a(self):
+        return (
+            'salt1' / TBytes,
+            'salt2' / TBytes,
+            'g' / Int32ul,
+            'p' / TBytes)
+
+    @structures
+    def password_kdf_algo_structures(self, name):
+        tag_map = {
+            0xd45ab096: LazyBound(self.struct_0xd45ab096),
+            0x3a912d4a: LazyBound(self.struct_0x3a912d4a)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group payment_form of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa0058751, 'payments_payment_form')
+    def struct_0xa0058751(self):
+        return Struct(
+            'sname' / Computed('payments_payment_form'),
+            'signature' / Hex(Const(0xa0058751, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_save_credentials=4,
+                                is_password_missing=8,
+                                has_photo=32,
+                                has_native_provider=16,
+                                has_additional_methods=64,
+                                has_saved_info=1,
+                                has_saved_credentials=2),
+            'form_id' / Int64ul,
+            'bot_id' / Int64ul,
+            'title' / TString,
+            'description' / TString,
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'invoice' / self.invoice_structures('invoice'),
+            'provider_id' / Int64ul,
+            'url' / TString,
+            'native_provider' / If(this.flags.has_native_provider, TString),
+            'native_params' / If(this.flags.has_native_provider, self.struct_0x7d748d04()),
+            'additional_methods' / If(this.flags.has_additional_methods, self.vector(self.struct_0x88f8f21b(), 'additional_methods')),
+            'saved_info' / If(this.flags.has_saved_info, self.struct_0x909c3f94()),
+            'saved_credentials' / If(this.flags.has_saved_credentials, self.vector(self.struct_0xcdc27a1f(), 'saved_credentials')),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x7bf6b15c, 'payments_payment_form_stars')
+    def struct_0x7bf6b15c(self):
+        return Struct(
+            'sname' / Computed('payments_payment_form_stars'),
+            'signature' / Hex(Const(0x7bf6b15c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_save_credentials=4,
+                                is_password_missing=8,
+                                has_photo=32),
+            'form_id' / Int64ul,
+            'bot_id' / Int64ul,
+            'title' / TString,
+            'description' / TString,
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'invoice' / self.invoice_structures('invoice'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xb425cfe1, 'payments_payment_form_star_gift')
+    def struct_0xb425cfe1(self):
+        return (
+            'form_id' / Int64ul,
+            'invoice' / self.invoice_structures('invoice'))
+
+    @structures
+    def payment_form_structures(self, name):
+        tag_map = {
+            0xa0058751: LazyBound(self.struct_0xa0058751),
+            0x7bf6b15c: LazyBound(self.struct_0x7bf6b15c),
+            0xb425cfe1: LazyBound(self.struct_0xb425cfe1)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x88f8f21b, 'payment_form_method')
+    def struct_0x88f8f21b(self):
+        return (
+            'url' / TString,
+            'title' / TString)
+
+    @constructor(0xcdc27a1f, 'payment_saved_credentials_card')
+    def struct_0xcdc27a1f(self):
+        return (
+            'id' / TString,
+            'title' / TString)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group payment_receipt of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x70c4fe03, 'payments_payment_receipt')
+    def struct_0x70c4fe03(self):
+        return Struct(
+            'sname' / Computed('payments_payment_receipt'),
+            'signature' / Hex(Const(0x70c4fe03, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_photo=4,
+                                has_info=1,
+                                has_shipping=2,
+                                has_tip_amount=8),
+            'date' / TTimestamp,
+            'bot_id' / Int64ul,
+            'provider_id' / Int64ul,
+            'title' / TString,
+            'description' / TString,
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'invoice' / self.invoice_structures('invoice'),
+            'info' / If(this.flags.has_info, self.struct_0x909c3f94()),
+            'shipping' / If(this.flags.has_shipping, self.struct_0xb6213cdf()),
+            'tip_amount' / If(this.flags.has_tip_amount, Int64ul),
+            'currency' / TString,
+            'total_amount' / Int64ul,
+            'credentials_title' / TString,
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xdabbf83a, 'payments_payment_receipt_stars')
+    def struct_0xdabbf83a(self):
+        return Struct(
+            'sname' / Computed('payments_payment_receipt_stars'),
+            'signature' / Hex(Const(0xdabbf83a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_photo=4),
+            'date' / TTimestamp,
+            'bot_id' / Int64ul,
+            'title' / TString,
+            'description' / TString,
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'invoice' / self.invoice_structures('invoice'),
+            'currency' / TString,
+            'total_amount' / Int64ul,
+            'transaction_id' / TString,
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def payment_receipt_structures(self, name):
+        tag_map = {
+            0x70c4fe03: LazyBound(self.struct_0x70c4fe03),
+            0xdabbf83a: LazyBound(self.struct_0xdabbf83a)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x1e8caaeb, 'post_address')
+    def struct_0x1e8caaeb(self):
+        return (
+            'street_line1' / TString,
+            'street_line2' / TString,
+            'city' / TString,
+            'state' / TString,
+            'country_iso2' / TString,
+            'post_code' / TString)
+
+    @constructor(0x909c3f94, 'payment_requested_info')
+    def struct_0x909c3f94(self):
+        return Struct(
+            'sname' / Computed('payment_requested_info'),
+            'signature' / Hex(Const(0x909c3f94, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_name=1,
+                                has_phone=2,
+                                has_email=4,
+                                has_shipping_address=8),
+            'name' / If(this.flags.has_name, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'email' / If(this.flags.has_email, TString),
+            'shipping_address' / If(this.flags.has_shipping_address, self.struct_0x1e8caaeb()))
+
+    @constructor(0xb6213cdf, 'shipping_option')
+    def struct_0xb6213cdf(self):
+        return (
+            'id' / TString,
+            'title' / TString,
+            'prices' / self.vector(self.struct_0xcb296bf8(), 'prices'))
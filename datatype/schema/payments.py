@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group payments of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0d6b48f7, 'payments_get_suggested_star_ref_bots')
+    def struct_0x0d6b48f7(self):
+        return Struct(
+            'sname' / Computed('payments_get_suggested_star_ref_bots'),
+            'signature' / Hex(Const(0x0d6b48f7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_order_by_revenue=1,
+                                is_order_by_date=2),
+            'peer' / self.input_peer_structures('peer'),
+            'offset' / TString,
+            'limit' / Int32ul)
+
+    @constructor(0x0f91b065, 'payments_export_invoice')
+    def struct_0x0f91b065(self):
+        return ['invoice_media' / self.input_media_structures('invoice_media')]
+
+    @constructor(0x13bbe8b3, 'payments_get_stars_revenue_withdrawal_url')
+    def struct_0x13bbe8b3(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'stars' / Int64ul,
+            'password' / self.input_check_password_srp_structures('password'))
+
+    @constructor(0x146e958d, 'payments_request_recurring_payment')
+    def struct_0x146e958d(self):
+        return (
+            'user_id' / self.input_user_structures('user_id'),
+            'recurring_init_charge' / TString,
+            'invoice_media' / self.input_media_structures('invoice_media'))
+
+    @constructor(0x19a13f71, 'payments_connected_bot_star_ref')
+    def struct_0x19a13f71(self):
+        return Struct(
+            'sname' / Computed('payments_connected_bot_star_ref'),
+            'signature' / Hex(Const(0x19a13f71, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoked=2,
+                                has_duration_months=1),
+            'url' / TString,
+            'date' / TTimestamp,
+            'bot_id' / Int64ul,
+            'commission_permille' / Int32ul,
+            'duration_months' / If(this.flags.has_duration_months, Int32ul),
+            'participants' / Int64ul,
+            'revenue' / Int64ul)
+
+    @constructor(0x1dab80b7, 'payments_stars_revenue_withdrawal_url')
+    def struct_0x1dab80b7(self):
+        return ['url' / TString]
+
+    @constructor(0x227d824b, 'payments_get_saved_info')
+    def struct_0x227d824b(self):
+        return []
+
+    @constructor(0x2478d1cc, 'payments_get_payment_receipt')
+    def struct_0x2478d1cc(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul)
+
+    @constructor(0x2757ba54, 'payments_get_premium_gift_code_options')
+    def struct_0x2757ba54(self):
+        return Struct(
+            'sname' / Computed('payments_get_premium_gift_code_options'),
+            'signature' / Hex(Const(0x2757ba54, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_boost_peer=1),
+            'boost_peer' / If(this.flags.has_boost_peer, self.input_peer_structures('boost_peer')))
+
+    @constructor(0x284a1096, 'payments_checked_gift_code')
+    def struct_0x284a1096(self):
+        return Struct(
+            'sname' / Computed('payments_checked_gift_code'),
+            'signature' / Hex(Const(0x284a1096, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_via_giveaway=4,
+                                has_from_id=16,
+                                has_giveaway_msg_id=8,
+                                has_to_id=1,
+                                has_used_date=2),
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'giveaway_msg_id' / If(this.flags.has_giveaway_msg_id, Int32ul),
+            'to_id' / If(this.flags.has_to_id, Int64ul),
+            'date' / TTimestamp,
+            'months' / Int32ul,
+            'used_date' / If(this.flags.has_used_date, TTimestamp),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x2d03522f, 'payments_send_payment_form')
+    def struct_0x2d03522f(self):
+        return Struct(
+            'sname' / Computed('payments_send_payment_form'),
+            'signature' / Hex(Const(0x2d03522f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_requested_info_id=1,
+                                has_shipping_option_id=2,
+                                has_tip_amount=4),
+            'form_id' / Int64ul,
+            'invoice' / self.input_invoice_structures('invoice'),
+            'requested_info_id' / If(this.flags.has_requested_info_id, TString),
+            'shipping_option_id' / If(this.flags.has_shipping_option_id, TString),
+            'credentials' / self.input_payment_credentials_structures('credentials'),
+            'tip_amount' / If(this.flags.has_tip_amount, Int64ul))
+
+    @constructor(0x2e79d779, 'payments_get_bank_card_data')
+    def struct_0x2e79d779(self):
+        return ['number' / TString]
+
+    @constructor(0x37148dbb, 'payments_get_payment_form')
+    def struct_0x37148dbb(self):
+        return Struct(
+            'sname' / Computed('payments_get_payment_form'),
+            'signature' / Hex(Const(0x37148dbb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_theme_params=1),
+            'invoice' / self.input_invoice_structures('invoice'),
+            'theme_params' / If(this.flags.has_theme_params, self.struct_0x7d748d04()))
+
+    @constructor(0x394e7f21, 'payments_stars_revenue_ads_account_url')
+    def struct_0x394e7f21(self):
+        return ['url' / TString]
+
+    @constructor(0x3e24e573, 'payments_bank_card_data')
+    def struct_0x3e24e573(self):
+        return (
+            'title' / TString,
+            'open_urls' / self.vector(self.struct_0xf568028a(), 'open_urls'))
+
+    @constructor(0x5869a553, 'payments_get_connected_star_ref_bots')
+    def struct_0x5869a553(self):
+        return Struct(
+            'sname' / Computed('payments_get_connected_star_ref_bots'),
+            'signature' / Hex(Const(0x5869a553, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_offset_date=4),
+            'peer' / self.input_peer_structures('peer'),
+            'offset_date' / If(this.flags.has_offset_date, TTimestamp),
+            'offset_link' / If(this.flags.has_offset_date, TString),
+            'limit' / Int32ul)
+
+    @constructor(0x5ff58f20, 'payments_launch_prepaid_giveaway')
+    def struct_0x5ff58f20(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'giveaway_id' / Int64ul,
+            'purpose' / self.input_store_payment_purpose_structures('purpose'))
+
+    @constructor(0x7ed5348a, 'payments_connect_star_ref_bot')
+    def struct_0x7ed5348a(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'bot' / self.input_user_structures('bot'))
+
+    @constructor(0x8e51b4c1, 'payments_check_gift_code')
+    def struct_0x8e51b4c1(self):
+        return ['slug' / TString]
+
+    @constructor(0x98d5ea1d, 'payments_connected_star_ref_bots')
+    def struct_0x98d5ea1d(self):
+        return (
+            'count' / Int32ul,
+            'connected_bots' / self.vector(self.struct_0x19a13f71(), 'connected_bots'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x9fc19eb6, 'payments_can_purchase_premium')
+    def struct_0x9fc19eb6(self):
+        return ['purpose' / self.input_store_payment_purpose_structures('purpose')]
+
+    @constructor(0xaed0cbd9, 'payments_exported_invoice')
+    def struct_0xaed0cbd9(self):
+        return ['url' / TString]
+
+    @constructor(0xb4d5d859, 'payments_suggested_star_ref_bots')
+    def struct_0xb4d5d859(self):
+        return Struct(
+            'sname' / Computed('payments_suggested_star_ref_bots'),
+            'signature' / Hex(Const(0xb4d5d859, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'count' / Int32ul,
+            'suggested_bots' / self.vector(self.struct_0xdd0c66f2(), 'suggested_bots'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'next_offset' / If(this.flags.has_next_offset, TString))
+
+    @constructor(0xb6c8f12b, 'payments_validate_requested_info')
+    def struct_0xb6c8f12b(self):
+        return Struct(
+            'sname' / Computed('payments_validate_requested_info'),
+            'signature' / Hex(Const(0xb6c8f12b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_save=1),
+            'invoice' / self.input_invoice_structures('invoice'),
+            'info' / self.struct_0x909c3f94())
+
+    @constructor(0xb7d998f0, 'payments_get_connected_star_ref_bot')
+    def struct_0xb7d998f0(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'bot' / self.input_user_structures('bot'))
+
+    @constructor(0xc92bb73b, 'payments_stars_revenue_stats')
+    def struct_0xc92bb73b(self):
+        return (
+            'revenue_graph' / self.stats_graph_structures('revenue_graph'),
+            'status' / self.struct_0xfebe5491(),
+            'usd_rate' / Double)
+
+    @constructor(0xd1451883, 'payments_validated_requested_info')
+    def struct_0xd1451883(self):
+        return Struct(
+            'sname' / Computed('payments_validated_requested_info'),
+            'signature' / Hex(Const(0xd1451883, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_id=1,
+                                has_shipping_options=2),
+            'id' / If(this.flags.has_id, TString),
+            'shipping_options' / If(this.flags.has_shipping_options, self.vector(self.struct_0xb6213cdf(), 'shipping_options')))
+
+    @constructor(0xd1d7efc5, 'payments_get_stars_revenue_ads_account_url')
+    def struct_0xd1d7efc5(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0xd83d70c1, 'payments_clear_saved_info')
+    def struct_0xd83d70c1(self):
+        return Struct(
+            'sname' / Computed('payments_clear_saved_info'),
+            'signature' / Hex(Const(0xd83d70c1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_credentials=1,
+                                is_info=2))
+
+    @constructor(0xd91ffad6, 'payments_get_stars_revenue_stats')
+    def struct_0xd91ffad6(self):
+        return Struct(
+            'sname' / Computed('payments_get_stars_revenue_stats'),
+            'signature' / Hex(Const(0xd91ffad6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_dark=1),
+            'peer' / self.input_peer_structures('peer'))
+
+    @constructor(0xdffd50d3, 'payments_assign_play_market_transaction')
+    def struct_0xdffd50d3(self):
+        return (
+            'receipt' / self.struct_0x7d748d04(),
+            'purpose' / self.input_store_payment_purpose_structures('purpose'))
+
+    @constructor(0xe4fca4a3, 'payments_edit_connected_star_ref_bot')
+    def struct_0xe4fca4a3(self):
+        return Struct(
+            'sname' / Computed('payments_edit_connected_star_ref_bot'),
+            'signature' / Hex(Const(0xe4fca4a3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_revoked=1),
+            'peer' / self.input_peer_structures('peer'),
+            'link' / TString)
+
+    @constructor(0xf4239425, 'payments_get_giveaway_info')
+    def struct_0xf4239425(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'msg_id' / Int32ul)
+
+    @constructor(0xf568028a, 'bank_card_open_url')
+    def struct_0xf568028a(self):
+        return (
+            'url' / TString,
+            'name' / TString)
+
+    @constructor(0xf6e26854, 'payments_apply_gift_code')
+    def struct_0xf6e26854(self):
+        return ['slug' / TString]
+
+    @constructor(0xfb8fe43c, 'payments_saved_info')
+    def struct_0xfb8fe43c(self):
+        return Struct(
+            'sname' / Computed('payments_saved_info'),
+            'signature' / Hex(Const(0xfb8fe43c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_saved_credentials=2,
+                                has_saved_info=1),
+            'saved_info' / If(this.flags.has_saved_info, self.struct_0x909c3f94()))
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group payments_giveaway_info of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xe175e66f, 'payments_giveaway_info_results')
+    def struct_0xe175e66f(self):
+        return Struct(
+            'sname' / Computed('payments_giveaway_info_results'),
+            'signature' / Hex(Const(0xe175e66f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_winner=1,
+                                is_refunded=2,
+                                has_activated_count=4),
+            'start_date' / TTimestamp,
+            'gift_code_slug' / If(this.flags.is_winner, TString),
+            'stars_prize' / If(this.flags.is_winner, Int64ul),
+            'finish_date' / TTimestamp,
+            'winners_count' / Int32ul,
+            'activated_count' / If(this.flags.has_activated_count, Int32ul))
+
+    @constructor(0x00cd5570, 'payments_giveaway_info_results_layer186')
+    def struct_0x00cd5570(self):
+        return Struct(
+            'sname' / Computed('payments_giveaway_info_results_layer186'),
+            'signature' / Hex(Const(0x00cd5570, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_winner=1,
+                                is_refunded=2),
+            'start_date' / TTimestamp,
+            'gift_code_slug' / If(this.flags.is_winner, TString),
+            'finish_date' / TTimestamp,
+            'winners_count' / Int32ul,
+            'activated_count' / Int32ul)
+
+    @constructor(0x4367daa0, 'payments_giveaway_info')
+    def struct_0x4367daa0(self):
+        return Struct(
+            'sname' / Computed('payments_giveaway_info'),
+            'signature' / Hex(Const(0x4367daa0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_participating=1,
+                                is_preparing_results=8,
+                                has_joined_too_early_date=2,
+                                has_admin_disallowed_chat_id=4,
+                                has_disallowed_country=16),
+            'start_date' / TTimestamp,
+            'joined_too_early_date' / If(this.flags.has_joined_too_early_date, TTimestamp),
+            'admin_disallowed_chat_id' / If(this.flags.has_admin_disallowed_chat_id, Int64ul),
+            'disallowed_country' / If(this.flags.has_disallowed_country, TString))
+
+    @structures
+    def payments_giveaway_info_structures(self, name):
+        tag_map = {
+            0xe175e66f: LazyBound(self.struct_0xe175e66f),
+            0x00cd5570: LazyBound(self.struct_0x00cd5570),
+            0x4367daa0: LazyBound(self.struct_0x4367daa0)
+        }
+        return TLUnion(name, tag_map)
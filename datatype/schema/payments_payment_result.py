@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group payments_payment_result of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd8411139, 'payments_payment_verification_needed')
+    def struct_0xd8411139(self):
+        return ['url' / TString]
+
+    @constructor(0x4e5f810d, 'payments_payment_result')
+    def struct_0x4e5f810d(self):
+        return ['updates' / self.updates_structures('updates')]
+
+    @structures
+    def payments_payment_result_structures(self, name):
+        tag_map = {
+            0xd8411139: LazyBound(self.struct_0xd8411139),
+            0x4e5f810d: LazyBound(self.struct_0x4e5f810d)
+        }
+        return TLUnion(name, tag_map)
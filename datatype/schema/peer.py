@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group peer of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa2a5371e, 'peer_channel')
+    def struct_0xa2a5371e(self):
+        return ['channel_id' / Int64ul]
+
+    @constructor(0xbddde532, 'peer_channel_layer131')
+    def struct_0xbddde532(self):
+        return ['channel_id' / Int32ul]
+
+    @constructor(0x59511722, 'peer_user')
+    def struct_0x59511722(self):
+        return ['user_id' / Int64ul]
+
+    @constructor(0x9db1bc6d, 'peer_user_layer131')
+    def struct_0x9db1bc6d(self):
+        return ['user_id' / Int32ul]
+
+    @constructor(0x36c6019a, 'peer_chat')
+    def struct_0x36c6019a(self):
+        return ['chat_id' / Int64ul]
+
+    @constructor(0xbad0e5bb, 'peer_chat_layer131')
+    def struct_0xbad0e5bb(self):
+        return ['chat_id' / Int32ul]
+
+    @structures
+    def peer_structures(self, name):
+        tag_map = {
+            0xa2a5371e: LazyBound(self.struct_0xa2a5371e),
+            0xbddde532: LazyBound(self.struct_0xbddde532),
+            0x59511722: LazyBound(self.struct_0x59511722),
+            0x9db1bc6d: LazyBound(self.struct_0x9db1bc6d),
+            0x36c6019a: LazyBound(self.struct_0x36c6019a),
+            0xbad0e5bb: LazyBound(self.struct_0xbad0e5bb)
+        }
+        return TLUnion(name, tag_map)
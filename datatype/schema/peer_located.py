@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group peer_located of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf8ec284b, 'peer_self_located')
+    def struct_0xf8ec284b(self):
+        return ['expires' / Int32ul]
+
+    @constructor(0xca461b5d, 'peer_located')
+    def struct_0xca461b5d(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'expires' / Int32ul,
+            'distance' / Int32ul)
+
+    @structures
+    def peer_located_structures(self, name):
+        tag_map = {
+            0xf8ec284b: LazyBound(self.struct_0xf8ec284b),
+            0xca461b5d: LazyBound(self.struct_0xca461b5d)
+        }
+        return TLUnion(name, tag_map)
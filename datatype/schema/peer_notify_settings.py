@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group peer_notify_settings of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x99622c0c, 'peer_notify_settings')
+    def struct_0x99622c0c(self):
+        return Struct(
+            'sname' / Computed('peer_notify_settings'),
+            'signature' / Hex(Const(0x99622c0c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_show_previews=1,
+                                has_silent=2,
+                                has_mute_until=4,
+                                has_ios_sound=8,
+                                has_android_sound=16,
+                                has_other_sound=32,
+                                has_stories_muted=64,
+                                has_stories_hide_sender=128,
+                                has_stories_ios_sound=256,
+                                has_stories_android_sound=512,
+                                has_stories_other_sound=1024),
+            'show_previews' / If(this.flags.has_show_previews, TBool),
+            'silent' / If(this.flags.has_silent, TBool),
+            'mute_until' / If(this.flags.has_mute_until, Int32ul),
+            'ios_sound' / If(this.flags.has_ios_sound, self.notification_sound_structures('ios_sound')),
+            'android_sound' / If(this.flags.has_android_sound, self.notification_sound_structures('android_sound')),
+            'other_sound' / If(this.flags.has_other_sound, self.notification_sound_structures('other_sound')),
+            'stories_muted' / If(this.flags.has_stories_muted, TBool),
+            'stories_hide_sender' / If(this.flags.has_stories_hide_sender, TBool),
+            'stories_ios_sound' / If(this.flags.has_stories_ios_sound, self.notification_sound_structures('stories_ios_sound')),
+            'stories_android_sound' / If(this.flags.has_stories_android_sound, self.notification_sound_structures('stories_android_sound')),
+            'stories_other_sound' / If(this.flags.has_stories_other_sound, self.notification_sound_structures('stories_other_sound')))
+
+    @constructor(0xa83b0426, 'peer_notify_settings_layer156')
+    def struct_0xa83b0426(self):
+        return Struct(
+            'sname' / Computed('peer_notify_settings_layer156'),
+            'signature' / Hex(Const(0xa83b0426, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_show_previews=1,
+                                has_silent=2,
+                                has_mute_until=4,
+                                has_ios_sound=8,
+                                has_android_sound=16,
+                                has_other_sound=32),
+            'show_previews' / If(this.flags.has_show_previews, TBool),
+            'silent' / If(this.flags.has_silent, TBool),
+            'mute_until' / If(this.flags.has_mute_until, Int32ul),
+            'ios_sound' / If(this.flags.has_ios_sound, self.notification_sound_structures('ios_sound')),
+            'android_sound' / If(this.flags.has_android_sound, self.notification_sound_structures('android_sound')),
+            'other_sound' / If(this.flags.has_other_sound, self.notification_sound_structures('other_sound')))
+
+    @constructor(0x9acda4c0, 'peer_notify_settings_layer77')
+    def struct_0x9acda4c0(self):
+        return Struct(
+            'sname' / Computed('peer_notify_settings_layer77'),
+            'signature' / Hex(Const(0x9acda4c0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_show_previews=1,
+                                is_silent=2),
+            'mute_until' / Int32ul,
+            'sound' / TString)
+
+    @constructor(0xaf509d20, 'peer_notify_settings_layer139')
+    def struct_0xaf509d20(self):
+        return Struct(
+            'sname' / Computed('peer_notify_settings_layer139'),
+            'signature' / Hex(Const(0xaf509d20, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_show_previews=1,
+                                has_silent=2,
+                                has_mute_until=4,
+                                has_sound=8),
+            'show_previews' / If(this.flags.has_show_previews, TBool),
+            'silent' / If(this.flags.has_silent, TBool),
+            'mute_until' / If(this.flags.has_mute_until, Int32ul),
+            'sound' / If(this.flags.has_sound, TString))
+
+    @constructor(0x8d5e11ee, 'peer_notify_settings_layer47')
+    def struct_0x8d5e11ee(self):
+        return (
+            'mute_until' / Int32ul,
+            'sound' / TString,
+            'show_previews' / TBool,
+            'events_mask' / Int32ul)
+
+    @constructor(0x70a68512, 'peer_notify_settings_empty_layer77')
+    def struct_0x70a68512(self):
+        return []
+
+    @structures
+    def peer_notify_settings_structures(self, name):
+        tag_map = {
+            0x99622c0c: LazyBound(self.struct_0x99622c0c),
+            0xa83b0426: LazyBound(self.struct_0xa83b0426),
+            0x9acda4c0: LazyBound(self.struct_0x9acda4c0),
+            0xaf509d20: LazyBound(self.struct_0xaf509d20),
+            0x8d5e11ee: LazyBound(self.struct_0x8d5e11ee),
+            0x70a68512: LazyBound(self.struct_0x70a68512)
+        }
+        return TLUnion(name, tag_map)
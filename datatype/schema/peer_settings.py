@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group peer_settings of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf47741f7, 'peer_settings')
+    def struct_0xf47741f7(self):
+        return Struct(
+            'sname' / Computed('peer_settings'),
+            'signature' / Hex(Const(0xf47741f7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_report_spam=1,
+                                is_add_contact=2,
+                                is_block_contact=4,
+                                is_share_contact=8,
+                                is_need_contacts_exception=16,
+                                is_report_geo=32,
+                                is_autoarchived=128,
+                                is_invite_members=256,
+                                is_request_chat_broadcast=1024,
+                                is_business_bot_paused=2048,
+                                is_business_bot_can_reply=4096,
+                                has_geo_distance=64,
+                                has_request_chat_title=512,
+                                has_business_bot_id=8192,
+                                has_charge_paid_message_stars=16384,
+                                has_registration_month=32768,
+                                has_phone_country=65536,
+                                has_name_change_date=131072,
+                                has_photo_change_date=262144),
+            'geo_distance' / If(this.flags.has_geo_distance, Int32ul),
+            'request_chat_title' / If(this.flags.has_request_chat_title, TString),
+            'request_chat_date' / If(this.flags.has_request_chat_title, TTimestamp),
+            'business_bot_id' / If(this.flags.has_business_bot_id, Int64ul),
+            'business_bot_manage_url' / If(this.flags.has_business_bot_id, TString),
+            'charge_paid_message_stars' / If(this.flags.has_charge_paid_message_stars, Int64ul),
+            'registration_month' / If(this.flags.has_registration_month, TString),
+            'phone_country' / If(this.flags.has_phone_country, TString),
+            'name_change_date' / If(this.flags.has_name_change_date, TTimestamp),
+            'photo_change_date' / If(this.flags.has_photo_change_date, TTimestamp))
+
+    @constructor(0x0d8c39ec, 'peer_settings_layer199_3')
+    def struct_0x0d8c39ec(self):
+        return Struct(
+            'sname' / Computed('peer_settings_layer199_3'),
+            'signature' / Hex(Const(0x0d8c39ec, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_report_spam=1,
+                                is_add_contact=2,
+                                is_block_contact=4,
+                                is_share_contact=8,
+                                is_need_contacts_exception=16,
+                                is_report_geo=32,
+                                is_autoarchived=128,
+                                is_invite_members=256,
+                                is_request_chat_broadcast=1024,
+                                is_business_bot_paused=2048,
+                                is_business_bot_can_reply=4096,
+                                has_geo_distance=64,
+                                has_request_chat_title=512,
+                                has_business_bot_id=8192,
+                                has_charge_paid_message_stars=16384,
+                                has_registration_month=32768,
+                                has_phone_country=65536,
+                                has_restriction_reason=131072),
+            'geo_distance' / If(this.flags.has_geo_distance, Int32ul),
+            'request_chat_title' / If(this.flags.has_request_chat_title, TString),
+            'request_chat_date' / If(this.flags.has_request_chat_title, TTimestamp),
+            'business_bot_id' / If(this.flags.has_business_bot_id, Int64ul),
+            'business_bot_manage_url' / If(this.flags.has_business_bot_id, TString),
+            'charge_paid_message_stars' / If(this.flags.has_charge_paid_message_stars, Int64ul),
+            'registration_month' / If(this.flags.has_registration_month, TString),
+            'phone_country' / If(this.flags.has_phone_country, TString),
+            'restriction_reason' / If(this.flags.has_restriction_reason, TString))
+
+    @constructor(0xa8639d72, 'peer_settings_layer199_2')
+    def struct_0xa8639d72(self):
+        return Struct(
+            'sname' / Computed('peer_settings_layer199_2'),
+            'signature' / Hex(Const(0xa8639d72, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_report_spam=1,
+                                is_add_contact=2,
+                                is_block_contact=4,
+                                is_share_contact=8,
+                                is_need_contacts_exception=16,
+                                is_report_geo=32,
+                                is_autoarchived=128,
+                                is_invite_members=256,
+                                is_request_chat_broadcast=1024,
+                                is_business_bot_paused=2048,
+                                is_business_bot_can_reply=4096,
+                                has_geo_distance=64,
+                                has_request_chat_title=512,
+                                has_business_bot_id=8192,
+                                has_charge_paid_message_stars=16384),
+            'geo_distance' / If(this.flags.has_geo_distance, Int32ul),
+            'request_chat_title' / If(this.flags.has_request_chat_title, TString),
+            'request_chat_date' / If(this.flags.has_request_chat_title, TTimestamp),
+            'business_bot_id' / If(this.flags.has_business_bot_id, Int64ul),
+            'business_bot_manage_url' / If(this.flags.has_business_bot_id, TString),
+            'charge_paid_message_stars' / If(this.flags.has_charge_paid_message_stars, Int64ul))
+
+    @constructor(0xacd66c5e, 'peer_settings_layer199')
+    def struct_0xacd66c5e(self):
+        return Struct(
+            'sname' / Computed('peer_settings_layer199'),
+            'signature' / Hex(Const(0xacd66c5e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_report_spam=1,
+                                is_add_contact=2,
+                                is_block_contact=4,
+                                is_share_contact=8,
+                                is_need_contacts_exception=16,
+                                is_report_geo=32,
+                                is_autoarchived=128,
+                                is_invite_members=256,
+                                is_request_chat_broadcast=1024,
+                                is_business_bot_paused=2048,
+                                is_business_bot_can_reply=4096,
+                                has_geo_distance=64,
+                                has_request_chat_title=512,
+                                has_business_bot_id=8192),
+            'geo_distance' / If(this.flags.has_geo_distance, Int32ul),
+            'request_chat_title' / If(this.flags.has_request_chat_title, TString),
+            'request_chat_date' / If(this.flags.has_request_chat_title, TTimestamp),
+            'business_bot_id' / If(this.flags.has_business_bot_id, Int64ul),
+            'business_bot_manage_url' / If(this.flags.has_business_bot_id, TString))
+
+    @constructor(0xa518110d, 'peer_settings_layer176')
+    def struct_0xa518110d(self):
+        return Struct(
+            'sname' / Computed('peer_settings_layer176'),
+            'signature' / Hex(Const(0xa518110d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_report_spam=1,
+                                is_add_contact=2,
+                                is_block_contact=4,
+                                is_share_contact=8,
+                                is_need_contacts_exception=16,
+                                is_report_geo=32,
+                                is_autoarchived=128,
+                                is_invite_members=256,
+                                is_request_chat_broadcast=1024,
+                                has_geo_distance=64,
+                                has_request_chat_title=512),
+            'geo_distance' / If(this.flags.has_geo_distance, Int32ul),
+            'request_chat_title' / If(this.flags.has_request_chat_title, TString),
+            'request_chat_date' / If(this.flags.has_request_chat_title, TTimestamp))
+
+    @constructor(0x733f2961, 'peer_settings_layer134')
+    def struct_0x733f2961(self):
+        return Struct(
+            'sname' / Computed('peer_settings_layer134'),
+            'signature' / Hex(Const(0x733f2961, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_report_spam=1,
+                                is_add_contact=2,
+                                is_block_contact=4,
+                                is_share_contact=8,
+                                is_need_contacts_exception=16,
+                                is_report_geo=32,
+                                is_autoarchived=128,
+                                is_invite_members=256,
+                                is_request_chat_broadcast=1024,
+                                has_geo_distance=64),
+            'geo_distance' / If(this.flags.has_geo_distance, Int32ul))
+
+    @structures
+    def peer_settings_structures(self, name):
+        tag_map = {
+            0xf47741f7: LazyBound(self.struct_0xf47741f7),
+            0x0d8c39ec: LazyBound(self.struct_0x0d8c39ec),
+            0xa8639d72: LazyBound(self.struct_0xa8639d72),
+            0xacd66c5e: LazyBound(self.struct_0xacd66c5e),
+            0xa518110d: LazyBound(self.struct_0xa518110d),
+            0x733f2961: LazyBound(self.struct_0x733f2961)
+        }
+        return TLUnion(name, tag_map)
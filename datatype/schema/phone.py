@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group phone of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x041845db, 'phone_get_group_call')
+    def struct_0x041845db(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'limit' / Int32ul)
+
+    @constructor(0x17d54f61, 'phone_received_call')
+    def struct_0x17d54f61(self):
+        return ['peer' / self.struct_0x1e36fded()]
+
+    @constructor(0x1ab21940, 'phone_get_group_call_stream_channels')
+    def struct_0x1ab21940(self):
+        return ['call' / self.struct_0xd8aa840f()]
+
+    @constructor(0x1c50d144, 'phone_leave_group_call_presentation')
+    def struct_0x1c50d144(self):
+        return ['call' / self.struct_0xd8aa840f()]
+
+    @constructor(0x1ca6ac0a, 'phone_edit_group_call_title')
+    def struct_0x1ca6ac0a(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'title' / TString)
+
+    @constructor(0x1e36fded, 'input_phone_call')
+    def struct_0x1e36fded(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0x204bd158, 'phone_exported_group_call_invite')
+    def struct_0x204bd158(self):
+        return ['link' / TString]
+
+    @constructor(0x219c34e6, 'phone_toggle_group_call_start_subscription')
+    def struct_0x219c34e6(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'subscribed' / TBool)
+
+    @constructor(0x277add7e, 'phone_save_call_debug')
+    def struct_0x277add7e(self):
+        return (
+            'peer' / self.struct_0x1e36fded(),
+            'debug' / self.struct_0x7d748d04())
+
+    @constructor(0x2dbf3432, 'phone_group_call_stream_rtmp_url')
+    def struct_0x2dbf3432(self):
+        return (
+            'url' / TString,
+            'key' / TString)
+
+    @constructor(0x2efe1722, 'phone_confirm_call')
+    def struct_0x2efe1722(self):
+        return (
+            'peer' / self.struct_0x1e36fded(),
+            'g_a' / TBytes,
+            'key_fingerprint' / Int64ul,
+            'protocol' / self.phone_call_protocol_structures('protocol'))
+
+    @constructor(0x3660c311, 'phone_call_accepted_layer195')
+    def struct_0x3660c311(self):
+        return Struct(
+            'sname' / Computed('phone_call_accepted_layer195'),
+            'signature' / Hex(Const(0x3660c311, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_video=64),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul,
+            'g_b' / TBytes,
+            'protocol' / self.phone_call_protocol_structures('protocol'))
+
+    @constructor(0x3bd2b4a0, 'phone_accept_call')
+    def struct_0x3bd2b4a0(self):
+        return (
+            'peer' / self.struct_0x1e36fded(),
+            'g_b' / TBytes,
+            'protocol' / self.phone_call_protocol_structures('protocol'))
+
+    @constructor(0x41248786, 'phone_save_call_log')
+    def struct_0x41248786(self):
+        return (
+            'peer' / self.struct_0x1e36fded(),
+            'file' / self.input_file_structures('file'))
+
+    @constructor(0x42ff96ed, 'phone_request_call')
+    def struct_0x42ff96ed(self):
+        return Struct(
+            'sname' / Computed('phone_request_call'),
+            'signature' / Hex(Const(0x42ff96ed, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_video=1),
+            'user_id' / self.input_user_structures('user_id'),
+            'random_id' / Int32ul,
+            'g_a_hash' / TBytes,
+            'protocol' / self.struct_0xfc878fc8())
+
+    @constructor(0x48cdc6d8, 'phone_create_group_call')
+    def struct_0x48cdc6d8(self):
+        return Struct(
+            'sname' / Computed('phone_create_group_call'),
+            'signature' / Hex(Const(0x48cdc6d8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_title=1,
+                                has_schedule_date=2),
+            'peer' / self.input_peer_structures('peer'),
+            'random_id' / Int32ul,
+            'title' / If(this.flags.has_title, TString),
+            'schedule_date' / If(this.flags.has_schedule_date, TTimestamp))
+
+    @constructor(0x500377f9, 'phone_leave_group_call')
+    def struct_0x500377f9(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'source' / Int32ul)
+
+    @constructor(0x55451fa9, 'phone_get_call_config')
+    def struct_0x55451fa9(self):
+        return []
+
+    @constructor(0x5680e342, 'phone_start_scheduled_group_call')
+    def struct_0x5680e342(self):
+        return ['call' / self.struct_0xd8aa840f()]
+
+    @constructor(0x575e1f8c, 'phone_save_default_group_call_join_as')
+    def struct_0x575e1f8c(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'join_as' / self.input_peer_structures('join_as'))
+
+    @constructor(0x59ead627, 'phone_set_call_rating')
+    def struct_0x59ead627(self):
+        return Struct(
+            'sname' / Computed('phone_set_call_rating'),
+            'signature' / Hex(Const(0x59ead627, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_user_initiative=1),
+            'peer' / self.struct_0x1e36fded(),
+            'rating' / Int32ul,
+            'comment' / TString)
+
+    @constructor(0x74bbb43d, 'phone_toggle_group_call_settings')
+    def struct_0x74bbb43d(self):
+        return Struct(
+            'sname' / Computed('phone_toggle_group_call_settings'),
+            'signature' / Hex(Const(0x74bbb43d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_reset_invite_hash=2,
+                                has_join_muted=1),
+            'call' / self.struct_0xd8aa840f(),
+            'join_muted' / If(this.flags.has_join_muted, TBool))
+
+    @constructor(0x7a777135, 'phone_discard_group_call')
+    def struct_0x7a777135(self):
+        return ['call' / self.struct_0xd8aa840f()]
+
+    @constructor(0x7b393160, 'phone_invite_to_group_call')
+    def struct_0x7b393160(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'users' / self.vector(self.input_user_structures('users'), 'users'))
+
+    @constructor(0x80eb48af, 'phone_group_call_stream_channel')
+    def struct_0x80eb48af(self):
+        return (
+            'channel' / Int32ul,
+            'scale' / Int32ul,
+            'last_timestamp_ms' / Int64ul)
+
+    @constructor(0x9e727aad, 'phone_group_call')
+    def struct_0x9e727aad(self):
+        return (
+            'call' / self.group_call_structures('call'),
+            'participants' / self.vector(self.struct_0xeba636fe(), 'participants'),
+            'participants_next_offset' / TString,
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xa5273abf, 'phone_edit_group_call_participant')
+    def struct_0xa5273abf(self):
+        return Struct(
+            'sname' / Computed('phone_edit_group_call_participant'),
+            'signature' / Hex(Const(0xa5273abf, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_muted=1,
+                                has_volume=2,
+                                has_raise_hand=4,
+                                has_video_stopped=8,
+                                has_video_paused=16,
+                                has_presentation_paused=32),
+            'call' / self.struct_0xd8aa840f(),
+            'participant' / self.input_peer_structures('participant'),
+            'muted' / If(this.flags.has_muted, TBool),
+            'volume' / If(this.flags.has_volume, Int32ul),
+            'raise_hand' / If(this.flags.has_raise_hand, TBool),
+            'video_stopped' / If(this.flags.has_video_stopped, TBool),
+            'video_paused' / If(this.flags.has_video_paused, TBool),
+            'presentation_paused' / If(this.flags.has_presentation_paused, TBool))
+
+    @constructor(0xa6c4600c, 'phone_request_call')
+    def struct_0xa6c4600c(self):
+        return Struct(
+            'sname' / Computed('phone_request_call'),
+            'signature' / Hex(Const(0xa6c4600c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_video=1,
+                                has_conference_call=2),
+            'user_id' / self.input_user_structures('user_id'),
+            'conference_call' / If(this.flags.has_conference_call, self.struct_0xd8aa840f()),
+            'random_id' / Int32ul,
+            'g_a_hash' / TBytes,
+            'protocol' / self.phone_call_protocol_structures('protocol'))
+
+    @constructor(0xafe5623f, 'phone_join_as_peers')
+    def struct_0xafe5623f(self):
+        return (
+            'peers' / self.vector(self.peer_structures('peers'), 'peers'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xb132ff7b, 'phone_join_group_call')
+    def struct_0xb132ff7b(self):
+        return Struct(
+            'sname' / Computed('phone_join_group_call'),
+            'signature' / Hex(Const(0xb132ff7b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_muted=1,
+                                is_video_stopped=4,
+                                has_invite_hash=2),
+            'call' / self.struct_0xd8aa840f(),
+            'join_as' / self.input_peer_structures('join_as'),
+            'invite_hash' / If(this.flags.has_invite_hash, TString),
+            'params' / self.struct_0x7d748d04())
+
+    @constructor(0xb2cbc1c0, 'phone_discard_call')
+    def struct_0xb2cbc1c0(self):
+        return Struct(
+            'sname' / Computed('phone_discard_call'),
+            'signature' / Hex(Const(0xb2cbc1c0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_video=1),
+            'peer' / self.struct_0x1e36fded(),
+            'duration' / Int32ul,
+            'reason' / self.phone_call_discard_reason_structures('reason'),
+            'connection_id' / Int64ul)
+
+    @constructor(0xb59cf977, 'phone_check_group_call')
+    def struct_0xb59cf977(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'sources' / self.vector(Int32ul, 'sources'))
+
+    @constructor(0xc558d8ab, 'phone_get_group_participants')
+    def struct_0xc558d8ab(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'ids' / self.vector(self.input_peer_structures('ids'), 'ids'),
+            'sources' / self.vector(Int32ul, 'sources'),
+            'offset' / TString,
+            'limit' / Int32ul)
+
+    @constructor(0xcbea6bc4, 'phone_join_group_call_presentation')
+    def struct_0xcbea6bc4(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'params' / self.struct_0x7d748d04())
+
+    @constructor(0xd0e482b2, 'phone_group_call_stream_channels')
+    def struct_0xd0e482b2(self):
+        return ['channels' / self.vector(self.struct_0x80eb48af(), 'channels')]
+
+    @constructor(0xd61e1df3, 'phone_join_group_call')
+    def struct_0xd61e1df3(self):
+        return Struct(
+            'sname' / Computed('phone_join_group_call'),
+            'signature' / Hex(Const(0xd61e1df3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_muted=1,
+                                is_video_stopped=4,
+                                has_invite_hash=2,
+                                has_key_fingerprint=8),
+            'call' / self.struct_0xd8aa840f(),
+            'join_as' / self.input_peer_structures('join_as'),
+            'invite_hash' / If(this.flags.has_invite_hash, TString),
+            'key_fingerprint' / If(this.flags.has_key_fingerprint, Int64ul),
+            'params' / self.struct_0x7d748d04())
+
+    @constructor(0xd8aa840f, 'input_group_call')
+    def struct_0xd8aa840f(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
+
+    @constructor(0xdeb3abbf, 'phone_get_group_call_stream_rtmp_url')
+    def struct_0xdeb3abbf(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'revoke' / TBool)
+
+    @constructor(0xdfc909ab, 'phone_create_conference_call')
+    def struct_0xdfc909ab(self):
+        return (
+            'peer' / self.struct_0x1e36fded(),
+            'key_fingerprint' / Int64ul)
+
+    @constructor(0xe6aa647f, 'phone_export_group_call_invite')
+    def struct_0xe6aa647f(self):
+        return Struct(
+            'sname' / Computed('phone_export_group_call_invite'),
+            'signature' / Hex(Const(0xe6aa647f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_can_self_unmute=1),
+            'call' / self.struct_0xd8aa840f())
+
+    @constructor(0xec82e140, 'phone_phone_call')
+    def struct_0xec82e140(self):
+        return (
+            'phone_call' / self.phone_call_structures('phone_call'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xef7c213a, 'phone_get_group_call_join_as')
+    def struct_0xef7c213a(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0xf128c708, 'phone_toggle_group_call_record')
+    def struct_0xf128c708(self):
+        return Struct(
+            'sname' / Computed('phone_toggle_group_call_record'),
+            'signature' / Hex(Const(0xf128c708, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_start=1,
+                                is_video=4,
+                                has_title=2),
+            'call' / self.struct_0xd8aa840f(),
+            'title' / If(this.flags.has_title, TString),
+            'video_portrait' / If(this.flags.is_video, TBool))
+
+    @constructor(0xf47751b6, 'phone_group_participants')
+    def struct_0xf47751b6(self):
+        return (
+            'count' / Int32ul,
+            'participants' / self.vector(self.struct_0xeba636fe(), 'participants'),
+            'next_offset' / TString,
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'version' / Int32ul)
+
+    @constructor(0xff7a9383, 'phone_send_signaling_data')
+    def struct_0xff7a9383(self):
+        return (
+            'peer' / self.struct_0x1e36fded(),
+            'data' / TBytes)
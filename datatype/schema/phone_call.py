@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group phone_call of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x45361c63, 'phone_call_requested')
+    def struct_0x45361c63(self):
+        return Struct(
+            'sname' / Computed('phone_call_requested'),
+            'signature' / Hex(Const(0x45361c63, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_video=64,
+                                has_conference_call=256),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul,
+            'g_a_hash' / TBytes,
+            'protocol' / self.phone_call_protocol_structures('protocol'),
+            'conference_call' / If(this.flags.has_conference_call, self.struct_0xd8aa840f()))
+
+    @constructor(0x14b0ed0c, 'phone_call_requested_layer195')
+    def struct_0x14b0ed0c(self):
+        return Struct(
+            'sname' / Computed('phone_call_requested_layer195'),
+            'signature' / Hex(Const(0x14b0ed0c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_video=64),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul,
+            'g_a_hash' / TBytes,
+            'protocol' / self.phone_call_protocol_structures('protocol'))
+
+    @constructor(0x3ba5940c, 'phone_call')
+    def struct_0x3ba5940c(self):
+        return Struct(
+            'sname' / Computed('phone_call'),
+            'signature' / Hex(Const(0x3ba5940c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_p2p_allowed=32,
+                                is_video=64,
+                                has_custom_parameters=128,
+                                has_conference_call=256),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul,
+            'g_a_or_b' / TBytes,
+            'key_fingerprint' / Int64ul,
+            'protocol' / self.phone_call_protocol_structures('protocol'),
+            'connections' / self.vector(self.phone_connection_structures('connections'), 'connections'),
+            'start_date' / TTimestamp,
+            'custom_parameters' / If(this.flags.has_custom_parameters, self.struct_0x7d748d04()),
+            'conference_call' / If(this.flags.has_conference_call, self.struct_0xd8aa840f()))
+
+    @constructor(0x30535af5, 'phone_call_layer195')
+    def struct_0x30535af5(self):
+        return Struct(
+            'sname' / Computed('phone_call_layer195'),
+            'signature' / Hex(Const(0x30535af5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_p2p_allowed=32,
+                                is_video=64,
+                                has_custom_parameters=128),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul,
+            'g_a_or_b' / TBytes,
+            'key_fingerprint' / Int64ul,
+            'protocol' / self.phone_call_protocol_structures('protocol'),
+            'connections' / self.vector(self.phone_connection_structures('connections'), 'connections'),
+            'start_date' / TTimestamp,
+            'custom_parameters' / If(this.flags.has_custom_parameters, self.struct_0x7d748d04()))
+
+    @constructor(0x967f7c67, 'phone_call_layer176')
+    def struct_0x967f7c67(self):
+        return Struct(
+            'sname' / Computed('phone_call_layer176'),
+            'signature' / Hex(Const(0x967f7c67, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_p2p_allowed=32,
+                                is_video=64),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul,
+            'g_a_or_b' / TBytes,
+            'key_fingerprint' / Int64ul,
+            'protocol' / self.phone_call_protocol_structures('protocol'),
+            'connections' / self.vector(self.phone_connection_structures('connections'), 'connections'),
+            'start_date' / TTimestamp)
+
+    @constructor(0x5366c915, 'phone_call_empty')
+    def struct_0x5366c915(self):
+        return ['id' / Int64ul]
+
+    @constructor(0x22fd7181, 'phone_call_accepted')
+    def struct_0x22fd7181(self):
+        return Struct(
+            'sname' / Computed('phone_call_accepted'),
+            'signature' / Hex(Const(0x22fd7181, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_video=64,
+                                has_conference_call=256),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul,
+            'g_b' / TBytes,
+            'protocol' / self.phone_call_protocol_structures('protocol'),
+            'conference_call' / If(this.flags.has_conference_call, self.struct_0xd8aa840f()))
+
+    @constructor(0xeed42858, 'phone_call_waiting')
+    def struct_0xeed42858(self):
+        return Struct(
+            'sname' / Computed('phone_call_waiting'),
+            'signature' / Hex(Const(0xeed42858, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_video=64,
+                                has_receive_date=1,
+                                has_conference_call=256),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul,
+            'protocol' / self.phone_call_protocol_structures('protocol'),
+            'receive_date' / If(this.flags.has_receive_date, TTimestamp),
+            'conference_call' / If(this.flags.has_conference_call, self.struct_0xd8aa840f()))
+
+    @constructor(0xc5226f17, 'phone_call_waiting_layer195')
+    def struct_0xc5226f17(self):
+        return Struct(
+            'sname' / Computed('phone_call_waiting_layer195'),
+            'signature' / Hex(Const(0xc5226f17, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_video=64,
+                                has_receive_date=1),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'admin_id' / Int64ul,
+            'participant_id' / Int64ul,
+            'protocol' / self.phone_call_protocol_structures('protocol'),
+            'receive_date' / If(this.flags.has_receive_date, TTimestamp))
+
+    @constructor(0x50ca4de1, 'phone_call_discarded_layer195')
+    def struct_0x50ca4de1(self):
+        return Struct(
+            'sname' / Computed('phone_call_discarded_layer195'),
+            'signature' / Hex(Const(0x50ca4de1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_need_rating=4,
+                                is_need_debug=8,
+                                is_video=64,
+                                has_reason=1,
+                                has_duration=2),
+            'id' / Int64ul,
+            'reason' / If(this.flags.has_reason, self.phone_call_discard_reason_structures('reason')),
+            'duration' / If(this.flags.has_duration, Int32ul))
+
+    @constructor(0xf9d25503, 'phone_call_discarded')
+    def struct_0xf9d25503(self):
+        return Struct(
+            'sname' / Computed('phone_call_discarded'),
+            'signature' / Hex(Const(0xf9d25503, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_need_rating=4,
+                                is_need_debug=8,
+                                is_video=64,
+                                has_reason=1,
+                                has_duration=2,
+                                has_conference_call=256),
+            'id' / Int64ul,
+            'reason' / If(this.flags.has_reason, self.phone_call_discard_reason_structures('reason')),
+            'duration' / If(this.flags.has_duration, Int32ul),
+            'conference_call' / If(this.flags.has_conference_call, self.struct_0xd8aa840f()))
+
+    @structures
+    def phone_call_structures(self, name):
+        tag_map = {
+            0x45361c63: LazyBound(self.struct_0x45361c63),
+            0x14b0ed0c: LazyBound(self.struct_0x14b0ed0c),
+            0x3ba5940c: LazyBound(self.struct_0x3ba5940c),
+            0x30535af5: LazyBound(self.struct_0x30535af5),
+            0x967f7c67: LazyBound(self.struct_0x967f7c67),
+            0x5366c915: LazyBound(self.struct_0x5366c915),
+            0x22fd7181: LazyBound(self.struct_0x22fd7181),
+            0xeed42858: LazyBound(self.struct_0xeed42858),
+            0xc5226f17: LazyBound(self.struct_0xc5226f17),
+            0x50ca4de1: LazyBound(self.struct_0x50ca4de1),
+            0xf9d25503: LazyBound(self.struct_0xf9d25503)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group phone_call_discard_reason of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x57adc690, 'phone_call_discard_reason_hangup')
+    def struct_0x57adc690(self):
+        return []
+
+    @constructor(0xfaf7e8c9, 'phone_call_discard_reason_busy')
+    def struct_0xfaf7e8c9(self):
+        return []
+
+    @constructor(0x85e42301, 'phone_call_discard_reason_missed')
+    def struct_0x85e42301(self):
+        return []
+
+    @constructor(0xe095c1a0, 'phone_call_discard_reason_disconnect')
+    def struct_0xe095c1a0(self):
+        return []
+
+    @constructor(0xafe2b839, 'phone_call_discard_reason_allow_group_call')
+    def struct_0xafe2b839(self):
+        return ['encrypted_key' / TBytes]
+
+    @structures
+    def phone_call_discard_reason_structures(self, name):
+        tag_map = {
+            0x57adc690: LazyBound(self.struct_0x57adc690),
+            0xfaf7e8c9: LazyBound(self.struct_0xfaf7e8c9),
+            0x85e42301: LazyBound(self.struct_0x85e42301),
+            0xe095c1a0: LazyBound(self.struct_0xe095c1a0),
+            0xafe2b839: LazyBound(self.struct_0xafe2b839)
+        }
+        return TLUnion(name, tag_map)
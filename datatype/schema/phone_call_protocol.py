@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group phone_call_protocol of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xfc878fc8, 'phone_call_protocol')
+    def struct_0xfc878fc8(self):
+        return Struct(
+            'sname' / Computed('phone_call_protocol'),
+            'signature' / Hex(Const(0xfc878fc8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_udp_p2p=1,
+                                is_udp_reflector=2),
+            'min_layer' / Int32ul,
+            'max_layer' / Int32ul,
+            'library_versions' / self.vector(TString, 'library_versions'))
+
+    @constructor(0xa2bb35cb, 'phone_call_protocol_layer110')
+    def struct_0xa2bb35cb(self):
+        return Struct(
+            'sname' / Computed('phone_call_protocol_layer110'),
+            'signature' / Hex(Const(0xa2bb35cb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_udp_p2p=1,
+                                is_udp_reflector=2),
+            'min_layer' / Int32ul,
+            'max_layer' / Int32ul)
+
+    @structures
+    def phone_call_protocol_structures(self, name):
+        tag_map = {
+            0xfc878fc8: LazyBound(self.struct_0xfc878fc8),
+            0xa2bb35cb: LazyBound(self.struct_0xa2bb35cb)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group phone_connection of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x9cc123c7, 'phone_connection')
+    def struct_0x9cc123c7(self):
+        return Struct(
+            'sname' / Computed('phone_connection'),
+            'signature' / Hex(Const(0x9cc123c7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_tcp=1),
+            'id' / Int64ul,
+            'ip' / TString,
+            'ipv6' / TString,
+            'port' / Int32ul,
+            'peer_tag' / TBytes)
+
+    @constructor(0x635fe375, 'phone_connection_webrtc')
+    def struct_0x635fe375(self):
+        return Struct(
+            'sname' / Computed('phone_connection_webrtc'),
+            'signature' / Hex(Const(0x635fe375, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_turn=1,
+                                is_stun=2),
+            'id' / Int64ul,
+            'ip' / TString,
+            'ipv6' / TString,
+            'port' / Int32ul,
+            'username' / TString,
+            'password' / TString)
+
+    @structures
+    def phone_connection_structures(self, name):
+        tag_map = {
+            0x9cc123c7: LazyBound(self.struct_0x9cc123c7),
+            0x635fe375: LazyBound(self.struct_0x635fe375)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group photo of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x9c477dd8, 'photo_layer97')
+    def struct_0x9c477dd8(self):
+        return Struct(
+            'sname' / Computed('photo_layer97'),
+            'signature' / Hex(Const(0x9c477dd8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_stickers=1),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'file_reference' / TBytes,
+            'date' / TTimestamp,
+            'sizes' / self.vector(self.photo_size_structures('sizes'), 'sizes'))
+
+    @constructor(0xcded42fe, 'photo_layer55')
+    def struct_0xcded42fe(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'sizes' / self.vector(self.photo_size_structures('sizes'), 'sizes'))
+
+    @constructor(0xc3838076, 'photo_old2')
+    def struct_0xc3838076(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'user_id' / Int32ul,
+            'date' / TTimestamp,
+            'geo' / self.geo_point_structures('geo'),
+            'sizes' / self.vector(self.photo_size_structures('sizes'), 'sizes'))
+
+    @constructor(0x2331b22d, 'photo_empty')
+    def struct_0x2331b22d(self):
+        return ['id' / Int64ul]
+
+    @constructor(0x22b56751, 'photo_old')
+    def struct_0x22b56751(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'user_id' / Int32ul,
+            'date' / TTimestamp,
+            'caption' / TString,
+            'geo' / self.geo_point_structures('geo'),
+            'sizes' / self.vector(self.photo_size_structures('sizes'), 'sizes'))
+
+    @constructor(0xd07504a5, 'photo_layer115')
+    def struct_0xd07504a5(self):
+        return Struct(
+            'sname' / Computed('photo_layer115'),
+            'signature' / Hex(Const(0xd07504a5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_stickers=1),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'file_reference' / TBytes,
+            'date' / TTimestamp,
+            'sizes' / self.vector(self.photo_size_structures('sizes'), 'sizes'),
+            'dc_id' / Int32ul)
+
+    @constructor(0xfb197a65, 'photo')
+    def struct_0xfb197a65(self):
+        return Struct(
+            'sname' / Computed('photo'),
+            'signature' / Hex(Const(0xfb197a65, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_stickers=1,
+                                has_video_sizes=2),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'file_reference' / TBytes,
+            'date' / TTimestamp,
+            'sizes' / self.vector(self.photo_size_structures('sizes'), 'sizes'),
+            'video_sizes' / If(this.flags.has_video_sizes, self.vector(self.video_size_structures('video_sizes'), 'video_sizes')),
+            'dc_id' / Int32ul)
+
+    @constructor(0x9288dd29, 'photo_layer82')
+    def struct_0x9288dd29(self):
+        return Struct(
+            'sname' / Computed('photo_layer82'),
+            'signature' / Hex(Const(0x9288dd29, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_stickers=1),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'sizes' / self.vector(self.photo_size_structures('sizes'), 'sizes'))
+
+    @structures
+    def photo_structures(self, name):
+        tag_map = {
+            0x9c477dd8: LazyBound(self.struct_0x9c477dd8),
+            0xcded42fe: LazyBound(self.struct_0xcded42fe),
+            0xc3838076: LazyBound(self.struct_0xc3838076),
+            0x2331b22d: LazyBound(self.struct_0x2331b22d),
+            0x22b56751: LazyBound(self.struct_0x22b56751),
+            0xd07504a5: LazyBound(self.struct_0xd07504a5),
+            0xfb197a65: LazyBound(self.struct_0xfb197a65),
+            0x9288dd29: LazyBound(self.struct_0x9288dd29)
+        }
+        return TLUnion(name, tag_map)
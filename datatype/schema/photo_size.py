@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group photo_size of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd8214d41, 'photo_path_size')
+    def struct_0xd8214d41(self):
+        return (
+            'type' / TString,
+            'bytes' / TBytes,
+            'h' / Computed(50),
+            'w' / Computed(50))
+
+    @constructor(0x77bfb61b, 'photo_size_layer127')
+    def struct_0x77bfb61b(self):
+        return (
+            'type' / TString,
+            'location' / self.file_location_structures('location'),
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'size' / Int32ul)
+
+    @constructor(0x0e17e23c, 'photo_size_empty')
+    def struct_0x0e17e23c(self):
+        return ['type' / TString]
+
+    @constructor(0x5aa86a51, 'photo_size_progressive_layer127')
+    def struct_0x5aa86a51(self):
+        return (
+            'type' / TString,
+            'location' / self.file_location_structures('location'),
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'sizes' / self.vector(Int32ul, 'sizes'))
+
+    @constructor(0xe0b0bc2e, 'photo_stripped_size')
+    def struct_0xe0b0bc2e(self):
+        return (
+            'type' / TString,
+            'bytes' / TBytes,
+            'h' / Computed(50),
+            'w' / Computed(50))
+
+    @constructor(0xe9a734fa, 'photo_cached_size_layer127')
+    def struct_0xe9a734fa(self):
+        return (
+            'type' / TString,
+            'location' / self.file_location_structures('location'),
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'bytes' / TBytes)
+
+    @constructor(0x75c78e60, 'photo_size')
+    def struct_0x75c78e60(self):
+        return (
+            'type' / TString,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'size' / Int32ul)
+
+    @constructor(0x021e1ad6, 'photo_cached_size')
+    def struct_0x021e1ad6(self):
+        return (
+            'type' / TString,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'bytes' / TBytes)
+
+    @constructor(0xfa3efb95, 'photo_size_progressive')
+    def struct_0xfa3efb95(self):
+        return (
+            'type' / TString,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'sizes' / self.vector(Int32ul, 'sizes'))
+
+    @structures
+    def photo_size_structures(self, name):
+        tag_map = {
+            0xd8214d41: LazyBound(self.struct_0xd8214d41),
+            0x77bfb61b: LazyBound(self.struct_0x77bfb61b),
+            0x0e17e23c: LazyBound(self.struct_0x0e17e23c),
+            0x5aa86a51: LazyBound(self.struct_0x5aa86a51),
+            0xe0b0bc2e: LazyBound(self.struct_0xe0b0bc2e),
+            0xe9a734fa: LazyBound(self.struct_0xe9a734fa),
+            0x75c78e60: LazyBound(self.struct_0x75c78e60),
+            0x021e1ad6: LazyBound(self.struct_0x021e1ad6),
+            0xfa3efb95: LazyBound(self.struct_0xfa3efb95)
+        }
+        return TLUnion(name, tag_map)
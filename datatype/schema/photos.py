@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group photos of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0388a3b5, 'photos_upload_profile_photo')
+    def struct_0x0388a3b5(self):
+        return Struct(
+            'sname' / Computed('photos_upload_profile_photo'),
+            'signature' / Hex(Const(0x0388a3b5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_fallback=8,
+                                has_bot=32,
+                                has_file=1,
+                                has_video=2,
+                                has_video_start_ts=4,
+                                has_video_emoji_markup=16),
+            'bot' / If(this.flags.has_bot, self.input_user_structures('bot')),
+            'file' / If(this.flags.has_file, self.input_file_structures('file')),
+            'video' / If(this.flags.has_video, self.input_file_structures('video')),
+            'video_start_ts' / If(this.flags.has_video_start_ts, Double),
+            'video_emoji_markup' / If(this.flags.has_video_emoji_markup, self.video_size_structures('video_emoji_markup')))
+
+    @constructor(0x09e82039, 'photos_update_profile_photo')
+    def struct_0x09e82039(self):
+        return Struct(
+            'sname' / Computed('photos_update_profile_photo'),
+            'signature' / Hex(Const(0x09e82039, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_fallback=1,
+                                has_bot=2),
+            'bot' / If(this.flags.has_bot, self.input_user_structures('bot')),
+            'id' / self.input_photo_structures('id'))
+
+    @constructor(0x20212ca8, 'photos_photo')
+    def struct_0x20212ca8(self):
+        return (
+            'photo' / self.photo_structures('photo'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x87cf7f2f, 'photos_delete_photos')
+    def struct_0x87cf7f2f(self):
+        return ['id' / self.vector(self.input_photo_structures('id'), 'id')]
+
+    @constructor(0x91cd32a8, 'photos_get_user_photos')
+    def struct_0x91cd32a8(self):
+        return (
+            'user_id' / self.input_user_structures('user_id'),
+            'offset' / Int32ul,
+            'max_id' / Int64ul,
+            'limit' / Int32ul)
+
+    @constructor(0xe14c4a71, 'photos_upload_contact_profile_photo')
+    def struct_0xe14c4a71(self):
+        return Struct(
+            'sname' / Computed('photos_upload_contact_profile_photo'),
+            'signature' / Hex(Const(0xe14c4a71, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_suggest=8,
+                                is_save=16,
+                                has_file=1,
+                                has_video=2,
+                                has_video_start_ts=4,
+                                has_video_emoji_markup=32),
+            'user_id' / self.input_user_structures('user_id'),
+            'file' / If(this.flags.has_file, self.input_file_structures('file')),
+            'video' / If(this.flags.has_video, self.input_file_structures('video')),
+            'video_start_ts' / If(this.flags.has_video_start_ts, Double),
+            'video_emoji_markup' / If(this.flags.has_video_emoji_markup, self.video_size_structures('video_emoji_markup')))
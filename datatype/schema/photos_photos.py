@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group photos_photos of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x8dca6aa5, 'photos_photos')
+    def struct_0x8dca6aa5(self):
+        return (
+            'photos' / self.vector(self.photo_structures('photos'), 'photos'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x15051f54, 'photos_photos_slice')
+    def struct_0x15051f54(self):
+        return (
+            'count' / Int32ul,
+            'photos' / self.vector(self.photo_structures('photos'), 'photos'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def photos_photos_structures(self, name):
+        tag_map = {
+            0x8dca6aa5: LazyBound(self.struct_0x8dca6aa5),
+            0x15051f54: LazyBound(self.struct_0x15051f54)
+        }
+        return TLUnion(name, tag_map)
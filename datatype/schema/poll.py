@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group poll of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x58747131, 'poll')
+    def struct_0x58747131(self):
+        return Struct(
+            'sname' / Computed('poll'),
+            'signature' / Hex(Const(0x58747131, Int32ul)),
+            'id' / Int64ul,
+            'flags' / FlagsEnum(Int32ul,
+                                is_closed=1,
+                                is_public_voters=2,
+                                is_multiple_choice=4,
+                                is_quiz=8,
+                                has_close_period=16,
+                                has_close_date=32),
+            'question' / self.struct_0x751f3146(),
+            'answers' / self.vector(self.poll_answer_structures('answers'), 'answers'),
+            'close_period' / If(this.flags.has_close_period, Int32ul),
+            'close_date' / If(this.flags.has_close_date, TTimestamp))
+
+    @constructor(0x86e18161, 'poll_layer178')
+    def struct_0x86e18161(self):
+        return Struct(
+            'sname' / Computed('poll_layer178'),
+            'signature' / Hex(Const(0x86e18161, Int32ul)),
+            'id' / Int64ul,
+            'flags' / FlagsEnum(Int32ul,
+                                is_closed=1,
+                                is_public_voters=2,
+                                is_multiple_choice=4,
+                                is_quiz=8,
+                                has_close_period=16,
+                                has_close_date=32),
+            'question_text' / TString,
+            'answers' / self.vector(self.poll_answer_structures('answers'), 'answers'),
+            'close_period' / If(this.flags.has_close_period, Int32ul),
+            'close_date' / If(this.flags.has_close_date, TTimestamp))
+
+    @constructor(0xaf746786, 'poll_to_delete')
+    def struct_0xaf746786(self):
+        return Struct(
+            'sname' / Computed('poll_to_delete'),
+            'signature' / Hex(Const(0xaf746786, Int32ul)),
+            'id' / Int64ul,
+            'flags' / FlagsEnum(Int32ul,
+                                is_closed=1,
+                                is_public_voters=2,
+                                is_multiple_choice=4,
+                                is_quiz=8,
+                                has_close_date=16),
+            'question_text' / TString,
+            'answers' / self.vector(self.poll_answer_structures('answers'), 'answers'),
+            'close_date' / If(this.flags.has_close_date, TTimestamp))
+
+    @constructor(0xd5529d06, 'poll_layer111')
+    def struct_0xd5529d06(self):
+        return Struct(
+            'sname' / Computed('poll_layer111'),
+            'signature' / Hex(Const(0xd5529d06, Int32ul)),
+            'id' / Int64ul,
+            'flags' / FlagsEnum(Int32ul,
+                                is_closed=1,
+                                is_public_voters=2,
+                                is_multiple_choice=4,
+                                is_quiz=8),
+            'question_text' / TString,
+            'answers' / self.vector(self.poll_answer_structures('answers'), 'answers'))
+
+    @structures
+    def poll_structures(self, name):
+        tag_map = {
+            0x58747131: LazyBound(self.struct_0x58747131),
+            0x86e18161: LazyBound(self.struct_0x86e18161),
+            0xaf746786: LazyBound(self.struct_0xaf746786),
+            0xd5529d06: LazyBound(self.struct_0xd5529d06)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group poll_answer of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xff16e2ca, 'poll_answer')
+    def struct_0xff16e2ca(self):
+        return (
+            'text' / self.struct_0x751f3146(),
+            'option' / TBytes)
+
+    @constructor(0x6ca9c2e9, 'poll_answer_layer178')
+    def struct_0x6ca9c2e9(self):
+        return (
+            'text' / TString,
+            'option' / TBytes)
+
+    @structures
+    def poll_answer_structures(self, name):
+        tag_map = {
+            0xff16e2ca: LazyBound(self.struct_0xff16e2ca),
+            0x6ca9c2e9: LazyBound(self.struct_0x6ca9c2e9)
+        }
+        return TLUnion(name, tag_map)
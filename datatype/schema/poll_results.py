@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group poll_results of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x5755785a, 'poll_results_layer108')
+    def struct_0x5755785a(self):
+        return Struct(
+            'sname' / Computed('poll_results_layer108'),
+            'signature' / Hex(Const(0x5755785a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_min=1,
+                                has_results=2,
+                                has_total_voters=4),
+            'results' / If(this.flags.has_results, self.vector(self.struct_0x3b6ddad2(), 'results')),
+            'total_voters' / If(this.flags.has_total_voters, Int32ul))
+
+    @constructor(0xc87024a2, 'poll_results_layer111')
+    def struct_0xc87024a2(self):
+        return Struct(
+            'sname' / Computed('poll_results_layer111'),
+            'signature' / Hex(Const(0xc87024a2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_min=1,
+                                has_results=2,
+                                has_total_voters=4,
+                                has_recent_voters=8),
+            'results' / If(this.flags.has_results, self.vector(self.struct_0x3b6ddad2(), 'results')),
+            'total_voters' / If(this.flags.has_total_voters, Int32ul),
+            'recent_voters' / If(this.flags.has_recent_voters, self.vector(Int32ul, 'recent_voters')))
+
+    @constructor(0xbadcc1a3, 'poll_results_layer131')
+    def struct_0xbadcc1a3(self):
+        return Struct(
+            'sname' / Computed('poll_results_layer131'),
+            'signature' / Hex(Const(0xbadcc1a3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_min=1,
+                                has_results=2,
+                                has_total_voters=4,
+                                has_recent_voters=8,
+                                has_solution=16),
+            'results' / If(this.flags.has_results, self.vector(self.struct_0x3b6ddad2(), 'results')),
+            'total_voters' / If(this.flags.has_total_voters, Int32ul),
+            'recent_voters' / If(this.flags.has_recent_voters, self.vector(Int32ul, 'recent_voters')),
+            'solution' / If(this.flags.has_solution, TString),
+            'solution_entities' / If(this.flags.has_solution, self.vector(self.message_entity_structures('solution_entities'), 'solution_entities')))
+
+    @constructor(0xdcb82ea3, 'poll_results_layer158')
+    def struct_0xdcb82ea3(self):
+        return Struct(
+            'sname' / Computed('poll_results_layer158'),
+            'signature' / Hex(Const(0xdcb82ea3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_min=1,
+                                has_results=2,
+                                has_total_voters=4,
+                                has_recent_voters=8,
+                                has_solution=16),
+            'results' / If(this.flags.has_results, self.vector(self.struct_0x3b6ddad2(), 'results')),
+            'total_voters' / If(this.flags.has_total_voters, Int32ul),
+            'recent_voters' / If(this.flags.has_recent_voters, self.vector(Int64ul, 'recent_voters')),
+            'solution' / If(this.flags.has_solution, TString),
+            'solution_entities' / If(this.flags.has_solution, self.vector(self.message_entity_structures('solution_entities'), 'solution_entities')))
+
+    @constructor(0x7adf2420, 'poll_results')
+    def struct_0x7adf2420(self):
+        return Struct(
+            'sname' / Computed('poll_results'),
+            'signature' / Hex(Const(0x7adf2420, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_min=1,
+                                has_results=2,
+                                has_total_voters=4,
+                                has_recent_voters=8,
+                                has_solution=16),
+            'results' / If(this.flags.has_results, self.vector(self.struct_0x3b6ddad2(), 'results')),
+            'total_voters' / If(this.flags.has_total_voters, Int32ul),
+            'recent_voters' / If(this.flags.has_recent_voters, self.vector(self.peer_structures('recent_voters'), 'recent_voters')),
+            'solution' / If(this.flags.has_solution, TString),
+            'solution_entities' / If(this.flags.has_solution, self.vector(self.message_entity_structures('solution_entities'), 'solution_entities')))
+
+    @structures
+    def poll_results_structures(self, name):
+        tag_map = {
+            0x5755785a: LazyBound(self.struct_0x5755785a),
+            0xc87024a2: LazyBound(self.struct_0xc87024a2),
+            0xbadcc1a3: LazyBound(self.struct_0xbadcc1a3),
+            0xdcb82ea3: LazyBound(self.struct_0xdcb82ea3),
+            0x7adf2420: LazyBound(self.struct_0x7adf2420)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x3b6ddad2, 'poll_answer_voters')
+    def struct_0x3b6ddad2(self):
+        return Struct(
+            'sname' / Computed('poll_answer_voters'),
+            'signature' / Hex(Const(0x3b6ddad2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_chosen=1,
+                                is_correct=2),
+            'option' / TBytes,
+            'voters' / Int32ul)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group premium_gift_option of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x79c059f7, 'premium_gift_option')
+    def struct_0x79c059f7(self):
+        return Struct(
+            'sname' / Computed('premium_gift_option'),
+            'signature' / Hex(Const(0x79c059f7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_bot_url=2,
+                                has_store_product=1),
+            'months' / Int32ul,
+            'currency' / TString,
+            'amount' / Int64ul,
+            'bot_url' / If(this.flags.has_bot_url, TString),
+            'store_product' / If(this.flags.has_store_product, TString))
+
+    @constructor(0x74c34319, 'premium_gift_option_layer199')
+    def struct_0x74c34319(self):
+        return Struct(
+            'sname' / Computed('premium_gift_option_layer199'),
+            'signature' / Hex(Const(0x74c34319, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_store_product=1),
+            'months' / Int32ul,
+            'currency' / TString,
+            'amount' / Int64ul,
+            'bot_url' / TString,
+            'store_product' / If(this.flags.has_store_product, TString))
+
+    @structures
+    def premium_gift_option_structures(self, name):
+        tag_map = {
+            0x79c059f7: LazyBound(self.struct_0x79c059f7),
+            0x74c34319: LazyBound(self.struct_0x74c34319)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group premium_subscription_option of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x5f2d1df2, 'premium_subscription_option')
+    def struct_0x5f2d1df2(self):
+        return Struct(
+            'sname' / Computed('premium_subscription_option'),
+            'signature' / Hex(Const(0x5f2d1df2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_current=2,
+                                is_can_purchase_upgrade=4,
+                                has_transaction=8,
+                                has_store_product=1),
+            'transaction' / If(this.flags.has_transaction, TString),
+            'months' / Int32ul,
+            'currency' / TString,
+            'amount' / Int64ul,
+            'bot_url' / TString,
+            'store_product' / If(this.flags.has_store_product, TString))
+
+    @constructor(0xb6f11ebe, 'premium_subscription_option_layer151')
+    def struct_0xb6f11ebe(self):
+        return Struct(
+            'sname' / Computed('premium_subscription_option_layer151'),
+            'signature' / Hex(Const(0xb6f11ebe, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_store_product=1),
+            'months' / Int32ul,
+            'currency' / TString,
+            'amount' / Int64ul,
+            'bot_url' / TString,
+            'store_product' / If(this.flags.has_store_product, TString))
+
+    @structures
+    def premium_subscription_option_structures(self, name):
+        tag_map = {
+            0x5f2d1df2: LazyBound(self.struct_0x5f2d1df2),
+            0xb6f11ebe: LazyBound(self.struct_0xb6f11ebe)
+        }
+        return TLUnion(name, tag_map)
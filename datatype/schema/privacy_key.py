@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group privacy_key of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xbc2eab30, 'privacy_key_status_timestamp')
+    def struct_0xbc2eab30(self):
+        return []
+
+    @constructor(0x39491cc8, 'privacy_key_phonep2p')
+    def struct_0x39491cc8(self):
+        return []
+
+    @constructor(0x500e6dfa, 'privacy_key_chat_invite')
+    def struct_0x500e6dfa(self):
+        return []
+
+    @constructor(0x42ffd42b, 'privacy_key_added_by_phone')
+    def struct_0x42ffd42b(self):
+        return []
+
+    @constructor(0x0697f414, 'privacy_key_voice_messages')
+    def struct_0x0697f414(self):
+        return []
+
+    @constructor(0xa486b761, 'privacy_key_about')
+    def struct_0xa486b761(self):
+        return []
+
+    @constructor(0x3d662b7b, 'privacy_key_phone_call')
+    def struct_0x3d662b7b(self):
+        return []
+
+    @constructor(0x69ec56a3, 'privacy_key_forwards')
+    def struct_0x69ec56a3(self):
+        return []
+
+    @constructor(0xd19ae46d, 'privacy_key_phone_number')
+    def struct_0xd19ae46d(self):
+        return []
+
+    @constructor(0x96151fed, 'privacy_key_profile_photo')
+    def struct_0x96151fed(self):
+        return []
+
+    @constructor(0x2000a518, 'privacy_key_birthday')
+    def struct_0x2000a518(self):
+        return []
+
+    @constructor(0x2ca4fdf8, 'privacy_key_star_gifts_auto_save')
+    def struct_0x2ca4fdf8(self):
+        return []
+
+    @constructor(0x17d348d2, 'privacy_key_no_paid_messages')
+    def struct_0x17d348d2(self):
+        return []
+
+    @structures
+    def privacy_key_structures(self, name):
+        tag_map = {
+            0xbc2eab30: LazyBound(self.struct_0xbc2eab30),
+            0x39491cc8: LazyBound(self.struct_0x39491cc8),
+            0x500e6dfa: LazyBound(self.struct_0x500e6dfa),
+            0x42ffd42b: LazyBound(self.struct_0x42ffd42b),
+            0x0697f414: LazyBound(self.struct_0x0697f414),
+            0xa486b761: LazyBound(self.struct_0xa486b761),
+            0x3d662b7b: LazyBound(self.struct_0x3d662b7b),
+            0x69ec56a3: LazyBound(self.struct_0x69ec56a3),
+            0xd19ae46d: LazyBound(self.struct_0xd19ae46d),
+            0x96151fed: LazyBound(self.struct_0x96151fed),
+            0x2000a518: LazyBound(self.struct_0x2000a518),
+            0x2ca4fdf8: LazyBound(self.struct_0x2ca4fdf8),
+            0x17d348d2: LazyBound(self.struct_0x17d348d2)
+        }
+        return TLUnion(name, tag_map)
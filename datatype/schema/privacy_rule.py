@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group privacy_rule of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf888fa1a, 'privacy_value_disallow_contacts')
+    def struct_0xf888fa1a(self):
+        return []
+
+    @constructor(0xe4621141, 'privacy_value_disallow_users')
+    def struct_0xe4621141(self):
+        return ['users' / self.vector(Int64ul, 'users')]
+
+    @constructor(0x6b134e8e, 'privacy_value_allow_chat_participants')
+    def struct_0x6b134e8e(self):
+        return ['chats' / self.vector(Int64ul, 'chats')]
+
+    @constructor(0x41c87565, 'privacy_value_disallow_chat_participants')
+    def struct_0x41c87565(self):
+        return ['chats' / self.vector(Int64ul, 'chats')]
+
+    @constructor(0x65427b82, 'privacy_value_allow_all')
+    def struct_0x65427b82(self):
+        return []
+
+    @constructor(0x8b73e763, 'privacy_value_disallow_all')
+    def struct_0x8b73e763(self):
+        return []
+
+    @constructor(0xb8905fb2, 'privacy_value_allow_users')
+    def struct_0xb8905fb2(self):
+        return ['users' / self.vector(Int64ul, 'users')]
+
+    @constructor(0xfffe1bac, 'privacy_value_allow_contacts')
+    def struct_0xfffe1bac(self):
+        return []
+
+    @constructor(0xf7e8d89b, 'privacy_value_allow_close_friends')
+    def struct_0xf7e8d89b(self):
+        return []
+
+    @constructor(0xece9814b, 'privacy_value_allow_premium')
+    def struct_0xece9814b(self):
+        return []
+
+    @constructor(0x21461b5d, 'privacy_value_allow_bots')
+    def struct_0x21461b5d(self):
+        return []
+
+    @constructor(0xf6a5f82f, 'privacy_value_disallow_bots')
+    def struct_0xf6a5f82f(self):
+        return []
+
+    @structures
+    def privacy_rule_structures(self, name):
+        tag_map = {
+            0xf888fa1a: LazyBound(self.struct_0xf888fa1a),
+            0xe4621141: LazyBound(self.struct_0xe4621141),
+            0x6b134e8e: LazyBound(self.struct_0x6b134e8e),
+            0x41c87565: LazyBound(self.struct_0x41c87565),
+            0x65427b82: LazyBound(self.struct_0x65427b82),
+            0x8b73e763: LazyBound(self.struct_0x8b73e763),
+            0xb8905fb2: LazyBound(self.struct_0xb8905fb2),
+            0xfffe1bac: LazyBound(self.struct_0xfffe1bac),
+            0xf7e8d89b: LazyBound(self.struct_0xf7e8d89b),
+            0xece9814b: LazyBound(self.struct_0xece9814b),
+            0x21461b5d: LazyBound(self.struct_0x21461b5d),
+            0xf6a5f82f: LazyBound(self.struct_0xf6a5f82f)
+        }
+        return TLUnion(name, tag_map)
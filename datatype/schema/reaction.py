@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group reaction of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x8935fc73, 'reaction_custom_emoji')
+    def struct_0x8935fc73(self):
+        return ['document_id' / Int64ul]
+
+    @constructor(0x79f5d419, 'reaction_empty')
+    def struct_0x79f5d419(self):
+        return []
+
+    @constructor(0x1b2286b8, 'reaction_emoji')
+    def struct_0x1b2286b8(self):
+        return ['emoticon' / TString]
+
+    @constructor(0x523da4eb, 'reaction_paid')
+    def struct_0x523da4eb(self):
+        return []
+
+    @structures
+    def reaction_structures(self, name):
+        tag_map = {
+            0x8935fc73: LazyBound(self.struct_0x8935fc73),
+            0x79f5d419: LazyBound(self.struct_0x79f5d419),
+            0x1b2286b8: LazyBound(self.struct_0x1b2286b8),
+            0x523da4eb: LazyBound(self.struct_0x523da4eb)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group reaction_count of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa3d1cb80, 'reaction_count')
+    def struct_0xa3d1cb80(self):
+        return Struct(
+            'sname' / Computed('reaction_count'),
+            'signature' / Hex(Const(0xa3d1cb80, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_chosen_order=1),
+            'chosen_order' / If(this.flags.has_chosen_order, Int32ul),
+            'reaction' / self.reaction_structures('reaction'),
+            'count' / Int32ul)
+
+    @constructor(0x6fb250d1, 'reaction_count_old')
+    def struct_0x6fb250d1(self):
+        return Struct(
+            'sname' / Computed('reaction_count_old'),
+            'signature' / Hex(Const(0x6fb250d1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_chosen=1),
+            'reaction' / TString,
+            'count' / Int32ul)
+
+    @structures
+    def reaction_count_structures(self, name):
+        tag_map = {
+            0xa3d1cb80: LazyBound(self.struct_0xa3d1cb80),
+            0x6fb250d1: LazyBound(self.struct_0x6fb250d1)
+        }
+        return TLUnion(name, tag_map)
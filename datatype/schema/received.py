@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group received of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa384b779, 'received_notify_message')
+    def struct_0xa384b779(self):
+        return (
+            'id' / Int32ul,
+            'flags' / Int32ul)
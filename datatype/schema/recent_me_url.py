@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group recent_me_url of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xb2da71d2, 'recent_me_url_chat')
+    def struct_0xb2da71d2(self):
+        return (
+            'url' / TString,
+            'chat_id' / Int64ul)
+
+    @constructor(0xbc0a57dc, 'recent_me_url_sticker_set')
+    def struct_0xbc0a57dc(self):
+        return (
+            'url' / TString,
+            'set' / self.sticker_set_covered_structures('set'))
+
+    @constructor(0x46e1d13d, 'recent_me_url_unknown')
+    def struct_0x46e1d13d(self):
+        return ['url' / TString]
+
+    @constructor(0xeb49081d, 'recent_me_url_chat_invite')
+    def struct_0xeb49081d(self):
+        return (
+            'url' / TString,
+            'chat_invite' / self.chat_invite_structures('chat_invite'))
+
+    @constructor(0xb92c09e2, 'recent_me_url_user')
+    def struct_0xb92c09e2(self):
+        return (
+            'url' / TString,
+            'user_id' / Int64ul)
+
+    @structures
+    def recent_me_url_structures(self, name):
+        tag_map = {
+            0xb2da71d2: LazyBound(self.struct_0xb2da71d2),
+            0xbc0a57dc: LazyBound(self.struct_0xbc0a57dc),
+            0x46e1d13d: LazyBound(self.struct_0x46e1d13d),
+            0xeb49081d: LazyBound(self.struct_0xeb49081d),
+            0xb92c09e2: LazyBound(self.struct_0xb92c09e2)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group reply_markup of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x85dd99d1, 'reply_keyboard_markup')
+    def struct_0x85dd99d1(self):
+        return Struct(
+            'sname' / Computed('reply_keyboard_markup'),
+            'signature' / Hex(Const(0x85dd99d1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_resize=1,
+                                is_single_use=2,
+                                is_selective=4,
+                                is_persistent=16,
+                                has_placeholder=8),
+            'rows' / self.vector(self.struct_0x77608b83(), 'rows'),
+            'placeholder' / If(this.flags.has_placeholder, TString))
+
+    @constructor(0xa03e5b85, 'reply_keyboard_hide')
+    def struct_0xa03e5b85(self):
+        return Struct(
+            'sname' / Computed('reply_keyboard_hide'),
+            'signature' / Hex(Const(0xa03e5b85, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_selective=4))
+
+    @constructor(0x86b40b08, 'reply_keyboard_force_reply')
+    def struct_0x86b40b08(self):
+        return Struct(
+            'sname' / Computed('reply_keyboard_force_reply'),
+            'signature' / Hex(Const(0x86b40b08, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_single_use=2,
+                                is_selective=4,
+                                has_placeholder=8),
+            'placeholder' / If(this.flags.has_placeholder, TString))
+
+    @constructor(0x3502758c, 'reply_keyboard_markup_layer129')
+    def struct_0x3502758c(self):
+        return Struct(
+            'sname' / Computed('reply_keyboard_markup_layer129'),
+            'signature' / Hex(Const(0x3502758c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_resize=1,
+                                is_single_use=2,
+                                is_selective=4),
+            'rows' / self.vector(self.struct_0x77608b83(), 'rows'))
+
+    @constructor(0xf4108aa0, 'reply_keyboard_force_reply_layer129')
+    def struct_0xf4108aa0(self):
+        return Struct(
+            'sname' / Computed('reply_keyboard_force_reply_layer129'),
+            'signature' / Hex(Const(0xf4108aa0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_single_use=2,
+                                is_selective=4))
+
+    @constructor(0x48a30254, 'reply_inline_markup')
+    def struct_0x48a30254(self):
+        return ['rows' / self.vector(self.struct_0x77608b83(), 'rows')]
+
+    @structures
+    def reply_markup_structures(self, name):
+        tag_map = {
+            0x85dd99d1: LazyBound(self.struct_0x85dd99d1),
+            0xa03e5b85: LazyBound(self.struct_0xa03e5b85),
+            0x86b40b08: LazyBound(self.struct_0x86b40b08),
+            0x3502758c: LazyBound(self.struct_0x3502758c),
+            0xf4108aa0: LazyBound(self.struct_0xf4108aa0),
+            0x48a30254: LazyBound(self.struct_0x48a30254)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x77608b83, 'keyboard_button_row')
+    def struct_0x77608b83(self):
+        return ['buttons' / self.vector(self.keyboard_button_structures('buttons'), 'buttons')]
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group report of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x5a6d7395, 'report_messages_delivery')
+    def struct_0x5a6d7395(self):
+        return Struct(
+            'sname' / Computed('report_messages_delivery'),
+            'signature' / Hex(Const(0x5a6d7395, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_push=1),
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group report_reason of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xdbd4feed, 'input_report_reason_geo_irrelevant')
+    def struct_0xdbd4feed(self):
+        return []
+
+    @constructor(0xc1e4a2b1, 'input_report_reason_other')
+    def struct_0xc1e4a2b1(self):
+        return []
+
+    @constructor(0xf5ddd6e7, 'input_report_reason_fake')
+    def struct_0xf5ddd6e7(self):
+        return []
+
+    @constructor(0x9b89f93a, 'input_report_reason_copyright')
+    def struct_0x9b89f93a(self):
+        return []
+
+    @constructor(0x58dbcab8, 'input_report_reason_spam')
+    def struct_0x58dbcab8(self):
+        return []
+
+    @constructor(0x1e22c78d, 'input_report_reason_violence')
+    def struct_0x1e22c78d(self):
+        return []
+
+    @constructor(0xadf44ee3, 'input_report_reason_child_abuse')
+    def struct_0xadf44ee3(self):
+        return []
+
+    @constructor(0x2e59d922, 'input_report_reason_pornography')
+    def struct_0x2e59d922(self):
+        return []
+
+    @structures
+    def report_reason_structures(self, name):
+        tag_map = {
+            0xdbd4feed: LazyBound(self.struct_0xdbd4feed),
+            0xc1e4a2b1: LazyBound(self.struct_0xc1e4a2b1),
+            0xf5ddd6e7: LazyBound(self.struct_0xf5ddd6e7),
+            0x9b89f93a: LazyBound(self.struct_0x9b89f93a),
+            0x58dbcab8: LazyBound(self.struct_0x58dbcab8),
+            0x1e22c78d: LazyBound(self.struct_0x1e22c78d),
+            0xadf44ee3: LazyBound(self.struct_0xadf44ee3),
+            0x2e59d922: LazyBound(self.struct_0x2e59d922)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group report_result of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf0e4e0b6, 'report_result_choose_option')
+    def struct_0xf0e4e0b6(self):
+        return (
+            'title' / TString,
+            'options' / self.vector(self.struct_0x7903e3d9(), 'options'))
+
+    @constructor(0x6f09ac31, 'report_result_add_comment')
+    def struct_0x6f09ac31(self):
+        return Struct(
+            'sname' / Computed('report_result_add_comment'),
+            'signature' / Hex(Const(0x6f09ac31, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_optional=1),
+            'option' / TBytes)
+
+    @constructor(0x8db33c4b, 'report_result_reported')
+    def struct_0x8db33c4b(self):
+        return []
+
+    @structures
+    def report_result_structures(self, name):
+        tag_map = {
+            0xf0e4e0b6: LazyBound(self.struct_0xf0e4e0b6),
+            0x6f09ac31: LazyBound(self.struct_0x6f09ac31),
+            0x8db33c4b: LazyBound(self.struct_0x8db33c4b)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x7903e3d9, 'message_report_option')
+    def struct_0x7903e3d9(self):
+        return (
+            'text' / TString,
+            'option' / TBytes)
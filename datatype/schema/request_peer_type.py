@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group request_peer_type of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x5f3b8a00, 'request_peer_type_user')
+    def struct_0x5f3b8a00(self):
+        return Struct(
+            'sname' / Computed('request_peer_type_user'),
+            'signature' / Hex(Const(0x5f3b8a00, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_bot=1,
+                                is_premium=2),
+            'bot' / If(this.flags.is_bot, TBool),
+            'premium' / If(this.flags.is_premium, TBool))
+
+    @constructor(0xc9f06e1b, 'request_peer_type_chat')
+    def struct_0xc9f06e1b(self):
+        return Struct(
+            'sname' / Computed('request_peer_type_chat'),
+            'signature' / Hex(Const(0xc9f06e1b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                has_user_admin_rights=2,
+                                has_bot_admin_rights=4,
+                                has_username=8,
+                                is_forum=16,
+                                is_bot_participant=32),
+            'has_username' / If(this.flags.has_username, TBool),
+            'forum' / If(this.flags.is_forum, TBool),
+            'user_admin_rights' / If(this.flags.has_user_admin_rights, self.struct_0x5fb224d5()),
+            'bot_admin_rights' / If(this.flags.has_bot_admin_rights, self.struct_0x5fb224d5()))
+
+    @constructor(0x339bef6c, 'request_peer_type_broadcast')
+    def struct_0x339bef6c(self):
+        return Struct(
+            'sname' / Computed('request_peer_type_broadcast'),
+            'signature' / Hex(Const(0x339bef6c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                has_user_admin_rights=2,
+                                has_bot_admin_rights=4,
+                                has_username=8),
+            'has_username' / If(this.flags.has_username, TBool),
+            'user_admin_rights' / If(this.flags.has_user_admin_rights, self.struct_0x5fb224d5()),
+            'bot_admin_rights' / If(this.flags.has_bot_admin_rights, self.struct_0x5fb224d5()))
+
+    @structures
+    def request_peer_type_structures(self, name):
+        tag_map = {
+            0x5f3b8a00: LazyBound(self.struct_0x5f3b8a00),
+            0xc9f06e1b: LazyBound(self.struct_0xc9f06e1b),
+            0x339bef6c: LazyBound(self.struct_0x339bef6c)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group restriction_reason of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd072acb4, 'restriction_reason')
+    def struct_0xd072acb4(self):
+        return (
+            'platform' / TString,
+            'reason' / TString,
+            'text' / TString)
+
+    @structures
+    def restriction_reason_structures(self, name):
+        tag_map = {
+            0xd072acb4: LazyBound(self.struct_0xd072acb4)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group rich_text of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x1ccb966a, 'text_phone')
+    def struct_0x1ccb966a(self):
+        return (
+            'text' / self.rich_text_structures('text'),
+            'phone' / TString)
+
+    @constructor(0xc7fb5e01, 'text_superscript')
+    def struct_0xc7fb5e01(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0x081ccf4f, 'text_image')
+    def struct_0x081ccf4f(self):
+        return (
+            'document_id' / Int64ul,
+            'w' / Int32ul,
+            'h' / Int32ul)
+
+    @constructor(0xc12622c4, 'text_underline')
+    def struct_0xc12622c4(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0xed6a8504, 'text_subscript')
+    def struct_0xed6a8504(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0x3c2884c1, 'text_url')
+    def struct_0x3c2884c1(self):
+        return (
+            'text' / self.rich_text_structures('text'),
+            'url' / TString,
+            'webpage_id' / Int64ul)
+
+    @constructor(0x35553762, 'text_anchor')
+    def struct_0x35553762(self):
+        return (
+            'text' / self.rich_text_structures('text'),
+            'name' / TString)
+
+    @constructor(0xdc3d824f, 'text_empty')
+    def struct_0xdc3d824f(self):
+        return []
+
+    @constructor(0xde5a0dd6, 'text_email')
+    def struct_0xde5a0dd6(self):
+        return (
+            'text' / self.rich_text_structures('text'),
+            'email' / TString)
+
+    @constructor(0x744694e0, 'text_plain')
+    def struct_0x744694e0(self):
+        return ['text' / TString]
+
+    @constructor(0x6724abc4, 'text_bold')
+    def struct_0x6724abc4(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0x9bf8bb95, 'text_strike')
+    def struct_0x9bf8bb95(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0x7e6260d7, 'text_concat')
+    def struct_0x7e6260d7(self):
+        return ['texts' / self.vector(self.rich_text_structures('texts'), 'texts')]
+
+    @constructor(0xd912a59c, 'text_italic')
+    def struct_0xd912a59c(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0x034b8621, 'text_marked')
+    def struct_0x034b8621(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @constructor(0x6c3f19b9, 'text_fixed')
+    def struct_0x6c3f19b9(self):
+        return ['text' / self.rich_text_structures('text')]
+
+    @structures
+    def rich_text_structures(self, name):
+        tag_map = {
+            0x1ccb966a: LazyBound(self.struct_0x1ccb966a),
+            0xc7fb5e01: LazyBound(self.struct_0xc7fb5e01),
+            0x081ccf4f: LazyBound(self.struct_0x081ccf4f),
+            0xc12622c4: LazyBound(self.struct_0xc12622c4),
+            0xed6a8504: LazyBound(self.struct_0xed6a8504),
+            0x3c2884c1: LazyBound(self.struct_0x3c2884c1),
+            0x35553762: LazyBound(self.struct_0x35553762),
+            0xdc3d824f: LazyBound(self.struct_0xdc3d824f),
+            0xde5a0dd6: LazyBound(self.struct_0xde5a0dd6),
+            0x744694e0: LazyBound(self.struct_0x744694e0),
+            0x6724abc4: LazyBound(self.struct_0x6724abc4),
+            0x9bf8bb95: LazyBound(self.struct_0x9bf8bb95),
+            0x7e6260d7: LazyBound(self.struct_0x7e6260d7),
+            0xd912a59c: LazyBound(self.struct_0xd912a59c),
+            0x034b8621: LazyBound(self.struct_0x034b8621),
+            0x6c3f19b9: LazyBound(self.struct_0x6c3f19b9)
+        }
+        return TLUnion(name, tag_map)
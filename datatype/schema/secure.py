@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group secure of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xe0277a62, 'secure_file_layer142')
+    def struct_0xe0277a62(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'size' / Int32ul,
+            'dc_id' / Int32ul,
+            'date' / TTimestamp,
+            'file_hash' / TBytes,
+            'secret' / TBytes)
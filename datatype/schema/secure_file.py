@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group secure_file of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x64199744, 'secure_file_empty')
+    def struct_0x64199744(self):
+        return []
+
+    @constructor(0x7d09c27e, 'secure_file')
+    def struct_0x7d09c27e(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'size' / Int64ul,
+            'dc_id' / Int32ul,
+            'date' / TTimestamp,
+            'file_hash' / TBytes,
+            'secret' / TBytes)
+
+    @structures
+    def secure_file_structures(self, name):
+        tag_map = {
+            0x64199744: LazyBound(self.struct_0x64199744),
+            0x7d09c27e: LazyBound(self.struct_0x7d09c27e)
+        }
+        return TLUnion(name, tag_map)
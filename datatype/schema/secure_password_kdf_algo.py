@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group secure_password_kdf_algo of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xbbf2dda0, 'secure_password_kdf_algo_pbkdf2hmacsha512iter100000')
+    def struct_0xbbf2dda0(self):
+        return ['salt' / TBytes]
+
+    @constructor(0x86471d92, 'secure_password_kdf_algo_sha512')
+    def struct_0x86471d92(self):
+        return ['salt' / TBytes]
+
+    @constructor(0x004a8537, 'secure_password_kdf_algo_unknown')
+    def struct_0x004a8537(self):
+        return []
+
+    @structures
+    def secure_password_kdf_algo_structures(self, name):
+        tag_map = {
+            0xbbf2dda0: LazyBound(self.struct_0xbbf2dda0),
+            0x86471d92: LazyBound(self.struct_0x86471d92),
+            0x004a8537: LazyBound(self.struct_0x004a8537)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group secure_plain_data of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x21ec5a5f, 'secure_plain_email')
+    def struct_0x21ec5a5f(self):
+        return ['email' / TString]
+
+    @constructor(0x7d6099dd, 'secure_plain_phone')
+    def struct_0x7d6099dd(self):
+        return ['phone' / TString]
+
+    @structures
+    def secure_plain_data_structures(self, name):
+        tag_map = {
+            0x21ec5a5f: LazyBound(self.struct_0x21ec5a5f),
+            0x7d6099dd: LazyBound(self.struct_0x7d6099dd)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group secure_required_type of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x829d99da, 'secure_required_type')
+    def struct_0x829d99da(self):
+        return Struct(
+            'sname' / Computed('secure_required_type'),
+            'signature' / Hex(Const(0x829d99da, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_native_names=1,
+                                is_selfie_required=2,
+                                is_translation_required=4),
+            'type' / self.secure_value_type_structures('type'))
+
+    @constructor(0x027477b4, 'secure_required_type_one_of')
+    def struct_0x027477b4(self):
+        return ['types' / self.vector(self.secure_required_type_structures('types'), 'types')]
+
+    @structures
+    def secure_required_type_structures(self, name):
+        tag_map = {
+            0x829d99da: LazyBound(self.struct_0x829d99da),
+            0x027477b4: LazyBound(self.struct_0x027477b4)
+        }
+        return TLUnion(name, tag_map)
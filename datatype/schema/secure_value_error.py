@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group secure_value_error of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x7a700873, 'secure_value_error_file')
+    def struct_0x7a700873(self):
+        return (
+            'type' / self.secure_value_type_structures('type'),
+            'file_hash' / TBytes,
+            'text' / TString)
+
+    @constructor(0x00be3dfa, 'secure_value_error_front_side')
+    def struct_0x00be3dfa(self):
+        return (
+            'type' / self.secure_value_type_structures('type'),
+            'file_hash' / TBytes,
+            'text' / TString)
+
+    @constructor(0x666220e9, 'secure_value_error_files')
+    def struct_0x666220e9(self):
+        return (
+            'type' / self.secure_value_type_structures('type'),
+            'file_hash' / self.vector(TBytes, 'file_hash'),
+            'text' / TString)
+
+    @constructor(0x868a2aa5, 'secure_value_error_reverse_side')
+    def struct_0x868a2aa5(self):
+        return (
+            'type' / self.secure_value_type_structures('type'),
+            'file_hash' / TBytes,
+            'text' / TString)
+
+    @constructor(0xa1144770, 'secure_value_error_translation_file')
+    def struct_0xa1144770(self):
+        return (
+            'type' / self.secure_value_type_structures('type'),
+            'file_hash' / TBytes,
+            'text' / TString)
+
+    @constructor(0x869d758f, 'secure_value_error')
+    def struct_0x869d758f(self):
+        return (
+            'type' / self.secure_value_type_structures('type'),
+            'hash' / TBytes,
+            'text' / TString)
+
+    @constructor(0xe8a40bd9, 'secure_value_error_data')
+    def struct_0xe8a40bd9(self):
+        return (
+            'type' / self.secure_value_type_structures('type'),
+            'data_hash' / TBytes,
+            'field' / TString,
+            'text' / TString)
+
+    @constructor(0x34636dd8, 'secure_value_error_translation_files')
+    def struct_0x34636dd8(self):
+        return (
+            'type' / self.secure_value_type_structures('type'),
+            'file_hash' / self.vector(TBytes, 'file_hash'),
+            'text' / TString)
+
+    @constructor(0xe537ced6, 'secure_value_error_selfie')
+    def struct_0xe537ced6(self):
+        return (
+            'type' / self.secure_value_type_structures('type'),
+            'file_hash' / TBytes,
+            'text' / TString)
+
+    @structures
+    def secure_value_error_structures(self, name):
+        tag_map = {
+            0x7a700873: LazyBound(self.struct_0x7a700873),
+            0x00be3dfa: LazyBound(self.struct_0x00be3dfa),
+            0x666220e9: LazyBound(self.struct_0x666220e9),
+            0x868a2aa5: LazyBound(self.struct_0x868a2aa5),
+            0xa1144770: LazyBound(self.struct_0xa1144770),
+            0x869d758f: LazyBound(self.struct_0x869d758f),
+            0xe8a40bd9: LazyBound(self.struct_0xe8a40bd9),
+            0x34636dd8: LazyBound(self.struct_0x34636dd8),
+            0xe537ced6: LazyBound(self.struct_0xe537ced6)
+        }
+        return TLUnion(name, tag_map)
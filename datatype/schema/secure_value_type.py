@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group secure_value_type of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xcbe31e26, 'secure_value_type_address')
+    def struct_0xcbe31e26(self):
+        return []
+
+    @constructor(0x99e3806a, 'secure_value_type_passport_registration')
+    def struct_0x99e3806a(self):
+        return []
+
+    @constructor(0xa0d0744b, 'secure_value_type_identity_card')
+    def struct_0xa0d0744b(self):
+        return []
+
+    @constructor(0xfc36954e, 'secure_value_type_utility_bill')
+    def struct_0xfc36954e(self):
+        return []
+
+    @constructor(0x89137c0d, 'secure_value_type_bank_statement')
+    def struct_0x89137c0d(self):
+        return []
+
+    @constructor(0x8e3ca7ee, 'secure_value_type_email')
+    def struct_0x8e3ca7ee(self):
+        return []
+
+    @constructor(0x9d2a81e3, 'secure_value_type_personal_details')
+    def struct_0x9d2a81e3(self):
+        return []
+
+    @constructor(0xea02ec33, 'secure_value_type_temporary_registration')
+    def struct_0xea02ec33(self):
+        return []
+
+    @constructor(0x3dac6a00, 'secure_value_type_passport')
+    def struct_0x3dac6a00(self):
+        return []
+
+    @constructor(0x8b883488, 'secure_value_type_rental_agreement')
+    def struct_0x8b883488(self):
+        return []
+
+    @constructor(0x06e425c4, 'secure_value_type_driver_license')
+    def struct_0x06e425c4(self):
+        return []
+
+    @constructor(0xb320aadb, 'secure_value_type_phone')
+    def struct_0xb320aadb(self):
+        return []
+
+    @constructor(0x99a48f23, 'secure_value_type_internal_passport')
+    def struct_0x99a48f23(self):
+        return []
+
+    @structures
+    def secure_value_type_structures(self, name):
+        tag_map = {
+            0xcbe31e26: LazyBound(self.struct_0xcbe31e26),
+            0x99e3806a: LazyBound(self.struct_0x99e3806a),
+            0xa0d0744b: LazyBound(self.struct_0xa0d0744b),
+            0xfc36954e: LazyBound(self.struct_0xfc36954e),
+            0x89137c0d: LazyBound(self.struct_0x89137c0d),
+            0x8e3ca7ee: LazyBound(self.struct_0x8e3ca7ee),
+            0x9d2a81e3: LazyBound(self.struct_0x9d2a81e3),
+            0xea02ec33: LazyBound(self.struct_0xea02ec33),
+            0x3dac6a00: LazyBound(self.struct_0x3dac6a00),
+            0x8b883488: LazyBound(self.struct_0x8b883488),
+            0x06e425c4: LazyBound(self.struct_0x06e425c4),
+            0xb320aadb: LazyBound(self.struct_0xb320aadb),
+            0x99a48f23: LazyBound(self.struct_0x99a48f23)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group send_message_action of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xdd6a8f48, 'send_message_game_play_action')
+    def struct_0xdd6a8f48(self):
+        return []
+
+    @constructor(0xd52f73f7, 'send_message_record_audio_action')
+    def struct_0xd52f73f7(self):
+        return []
+
+    @constructor(0x92042ff7, 'send_message_upload_video_action_old')
+    def struct_0x92042ff7(self):
+        return []
+
+    @constructor(0xe6ac8a6f, 'send_message_upload_audio_action_old')
+    def struct_0xe6ac8a6f(self):
+        return []
+
+    @constructor(0xf351d7ab, 'send_message_upload_audio_action')
+    def struct_0xf351d7ab(self):
+        return ['progress' / Int32ul]
+
+    @constructor(0xd1d34a26, 'send_message_upload_photo_action')
+    def struct_0xd1d34a26(self):
+        return ['progress' / Int32ul]
+
+    @constructor(0x8faee98e, 'send_message_upload_document_action_old')
+    def struct_0x8faee98e(self):
+        return []
+
+    @constructor(0xe9763aec, 'send_message_upload_video_action')
+    def struct_0xe9763aec(self):
+        return ['progress' / Int32ul]
+
+    @constructor(0xfd5ec8f5, 'send_message_cancel_action')
+    def struct_0xfd5ec8f5(self):
+        return []
+
+    @constructor(0x176f8ba1, 'send_message_geo_location_action')
+    def struct_0x176f8ba1(self):
+        return []
+
+    @constructor(0x628cbc6f, 'send_message_choose_contact_action')
+    def struct_0x628cbc6f(self):
+        return []
+
+    @constructor(0xb05ac6b1, 'send_message_choose_sticker_action')
+    def struct_0xb05ac6b1(self):
+        return []
+
+    @constructor(0x88f27fbc, 'send_message_record_round_action')
+    def struct_0x88f27fbc(self):
+        return []
+
+    @constructor(0x243e1c66, 'send_message_upload_round_action')
+    def struct_0x243e1c66(self):
+        return ['progress' / Int32ul]
+
+    @constructor(0x16bf744e, 'send_message_typing_action')
+    def struct_0x16bf744e(self):
+        return []
+
+    @constructor(0xdbda9246, 'send_message_history_import_action')
+    def struct_0xdbda9246(self):
+        return ['progress' / Int32ul]
+
+    @constructor(0x990a3c1a, 'send_message_upload_photo_action_old')
+    def struct_0x990a3c1a(self):
+        return []
+
+    @constructor(0xaa0cd9e4, 'send_message_upload_document_action')
+    def struct_0xaa0cd9e4(self):
+        return ['progress' / Int32ul]
+
+    @constructor(0xd92c2285, 'speaking_in_group_call_action')
+    def struct_0xd92c2285(self):
+        return []
+
+    @constructor(0xa187d66f, 'send_message_record_video_action')
+    def struct_0xa187d66f(self):
+        return []
+
+    @constructor(0x25972bcb, 'send_message_emoji_interaction')
+    def struct_0x25972bcb(self):
+        return (
+            'emoticon' / TString,
+            'msg_id' / Int32ul,
+            'interaction' / self.struct_0x7d748d04())
+
+    @constructor(0xb665902e, 'send_message_emoji_interaction_seen')
+    def struct_0xb665902e(self):
+        return ['emoticon' / TString]
+
+    @structures
+    def send_message_action_structures(self, name):
+        tag_map = {
+            0xdd6a8f48: LazyBound(self.struct_0xdd6a8f48),
+            0xd52f73f7: LazyBound(self.struct_0xd52f73f7),
+            0x92042ff7: LazyBound(self.struct_0x92042ff7),
+            0xe6ac8a6f: LazyBound(self.struct_0xe6ac8a6f),
+            0xf351d7ab: LazyBound(self.struct_0xf351d7ab),
+            0xd1d34a26: LazyBound(self.struct_0xd1d34a26),
+            0x8faee98e: LazyBound(self.struct_0x8faee98e),
+            0xe9763aec: LazyBound(self.struct_0xe9763aec),
+            0xfd5ec8f5: LazyBound(self.struct_0xfd5ec8f5),
+            0x176f8ba1: LazyBound(self.struct_0x176f8ba1),
+            0x628cbc6f: LazyBound(self.struct_0x628cbc6f),
+            0xb05ac6b1: LazyBound(self.struct_0xb05ac6b1),
+            0x88f27fbc: LazyBound(self.struct_0x88f27fbc),
+            0x243e1c66: LazyBound(self.struct_0x243e1c66),
+            0x16bf744e: LazyBound(self.struct_0x16bf744e),
+            0xdbda9246: LazyBound(self.struct_0xdbda9246),
+            0x990a3c1a: LazyBound(self.struct_0x990a3c1a),
+            0xaa0cd9e4: LazyBound(self.struct_0xaa0cd9e4),
+            0xd92c2285: LazyBound(self.struct_0xd92c2285),
+            0xa187d66f: LazyBound(self.struct_0xa187d66f),
+            0x25972bcb: LazyBound(self.struct_0x25972bcb),
+            0xb665902e: LazyBound(self.struct_0xb665902e)
+        }
+        return TLUnion(name, tag_map)
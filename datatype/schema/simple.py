@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group simple of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x882f76bb, 'simple_web_view_result_url')
+    def struct_0x882f76bb(self):
+        return ['url' / TString]
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group star of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x167bd90b, 'star_gift_upgrade_preview')
+    def struct_0x167bd90b(self):
+        return ['sample_attributes' / self.vector(self.star_gift_attribute_structures('sample_attributes'), 'sample_attributes')]
+
+    @constructor(0x84aa3a9c, 'star_gift_withdrawal_url')
+    def struct_0x84aa3a9c(self):
+        return ['url' / TString]
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group star_gift of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x02cc73c8, 'star_gift')
+    def struct_0x02cc73c8(self):
+        return Struct(
+            'sname' / Computed('star_gift'),
+            'signature' / Hex(Const(0x02cc73c8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_limited=1,
+                                is_sold_out=2,
+                                is_birthday=4,
+                                is_can_upgrade=8),
+            'id' / Int64ul,
+            'sticker' / self.document_structures('sticker'),
+            'stars' / Int64ul,
+            'availability_remains' / If(this.flags.is_limited, Int32ul),
+            'availability_total' / If(this.flags.is_limited, Int32ul),
+            'convert_stars' / Int64ul,
+            'first_sale_date' / If(this.flags.is_sold_out, TTimestamp),
+            'last_sale_date' / If(this.flags.is_sold_out, TTimestamp),
+            'upgrade_stars' / If(this.flags.is_can_upgrade, Int64ul))
+
+    @constructor(0x5c62d151, 'star_gift_unique')
+    def struct_0x5c62d151(self):
+        return Struct(
+            'sname' / Computed('star_gift_unique'),
+            'signature' / Hex(Const(0x5c62d151, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_owner_id=1,
+                                has_owner_name=2,
+                                has_owner_address=4,
+                                has_gift_address=8),
+            'id' / Int64ul,
+            'title' / TString,
+            'slug' / TString,
+            'num' / Int32ul,
+            'owner_id' / If(this.flags.has_owner_id, self.peer_structures('owner_id')),
+            'owner_name' / If(this.flags.has_owner_name, TString),
+            'owner_address' / If(this.flags.has_owner_address, TString),
+            'attributes' / self.vector(self.star_gift_attribute_structures('attributes'), 'attributes'),
+            'availability_issued' / Int32ul,
+            'availability_total' / Int32ul,
+            'gift_address' / If(this.flags.has_gift_address, TString))
+
+    @constructor(0xf2fe7e4a, 'star_gift_unique_layer198')
+    def struct_0xf2fe7e4a(self):
+        return Struct(
+            'sname' / Computed('star_gift_unique_layer198'),
+            'signature' / Hex(Const(0xf2fe7e4a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_owner_id=1,
+                                has_owner_name=2,
+                                has_owner_address=4),
+            'id' / Int64ul,
+            'title' / TString,
+            'slug' / TString,
+            'num' / Int32ul,
+            'owner_id' / If(this.flags.has_owner_id, self.peer_structures('owner_id')),
+            'owner_name' / If(this.flags.has_owner_name, TString),
+            'owner_address' / If(this.flags.has_owner_address, TString),
+            'attributes' / self.vector(self.star_gift_attribute_structures('attributes'), 'attributes'),
+            'availability_issued' / Int32ul,
+            'availability_total' / Int32ul)
+
+    @constructor(0x3482f322, 'star_gift_unique_layer197')
+    def struct_0x3482f322(self):
+        return Struct(
+            'sname' / Computed('star_gift_unique_layer197'),
+            'signature' / Hex(Const(0x3482f322, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_owner_user_id=1,
+                                has_owner_name=2),
+            'id' / Int64ul,
+            'title' / TString,
+            'slug' / TString,
+            'num' / Int32ul,
+            'owner_user_id' / If(this.flags.has_owner_user_id, Int64ul),
+            'owner_name' / If(this.flags.has_owner_name, TString),
+            'attributes' / self.vector(self.star_gift_attribute_structures('attributes'), 'attributes'),
+            'availability_issued' / Int32ul,
+            'availability_total' / Int32ul)
+
+    @constructor(0x6a1407cd, 'star_gift_unique_layer196')
+    def struct_0x6a1407cd(self):
+        return (
+            'id' / Int64ul,
+            'title' / TString,
+            'num' / Int32ul,
+            'owner_user_id' / Int64ul,
+            'attributes' / self.vector(self.star_gift_attribute_structures('attributes'), 'attributes'),
+            'availability_issued' / Int32ul,
+            'availability_total' / Int32ul)
+
+    @constructor(0xaea174ee, 'star_gift_layer190')
+    def struct_0xaea174ee(self):
+        return Struct(
+            'sname' / Computed('star_gift_layer190'),
+            'signature' / Hex(Const(0xaea174ee, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_limited=1),
+            'id' / Int64ul,
+            'sticker' / self.document_structures('sticker'),
+            'stars' / Int64ul,
+            'availability_remains' / If(this.flags.is_limited, Int32ul),
+            'availability_total' / If(this.flags.is_limited, Int32ul),
+            'convert_stars' / Int64ul)
+
+    @constructor(0x49c577cd, 'star_gift_layer195')
+    def struct_0x49c577cd(self):
+        return Struct(
+            'sname' / Computed('star_gift_layer195'),
+            'signature' / Hex(Const(0x49c577cd, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_limited=1,
+                                is_sold_out=2,
+                                is_birthday=4),
+            'id' / Int64ul,
+            'sticker' / self.document_structures('sticker'),
+            'stars' / Int64ul,
+            'availability_remains' / If(this.flags.is_limited, Int32ul),
+            'availability_total' / If(this.flags.is_limited, Int32ul),
+            'convert_stars' / Int64ul,
+            'first_sale_date' / If(this.flags.is_sold_out, TTimestamp),
+            'last_sale_date' / If(this.flags.is_sold_out, TTimestamp))
+
+    @structures
+    def star_gift_structures(self, name):
+        tag_map = {
+            0x02cc73c8: LazyBound(self.struct_0x02cc73c8),
+            0x5c62d151: LazyBound(self.struct_0x5c62d151),
+            0xf2fe7e4a: LazyBound(self.struct_0xf2fe7e4a),
+            0x3482f322: LazyBound(self.struct_0x3482f322),
+            0x6a1407cd: LazyBound(self.struct_0x6a1407cd),
+            0xaea174ee: LazyBound(self.struct_0xaea174ee),
+            0x49c577cd: LazyBound(self.struct_0x49c577cd)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group star_gift_attribute of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x39d99013, 'star_gift_attribute_model')
+    def struct_0x39d99013(self):
+        return (
+            'name' / TString,
+            'document' / self.document_structures('document'),
+            'rarity_permille' / Int32ul)
+
+    @constructor(0x13acff19, 'star_gift_attribute_pattern')
+    def struct_0x13acff19(self):
+        return (
+            'name' / TString,
+            'document' / self.document_structures('document'),
+            'rarity_permille' / Int32ul)
+
+    @constructor(0x94271762, 'star_gift_attribute_backdrop')
+    def struct_0x94271762(self):
+        return (
+            'name' / TString,
+            'center_color' / Int32ul,
+            'edge_color' / Int32ul,
+            'pattern_color' / Int32ul,
+            'text_color' / Int32ul,
+            'rarity_permille' / Int32ul)
+
+    @constructor(0xe0bff26c, 'star_gift_attribute_original_details')
+    def struct_0xe0bff26c(self):
+        return Struct(
+            'sname' / Computed('star_gift_attribute_original_details'),
+            'signature' / Hex(Const(0xe0bff26c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_sender_id=1,
+                                has_message=2),
+            'sender_id' / If(this.flags.has_sender_id, self.peer_structures('sender_id')),
+            'recipient_id' / self.peer_structures('recipient_id'),
+            'date' / TTimestamp,
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()))
+
+    @constructor(0xc02c4f4b, 'star_gift_attribute_original_details_layer197')
+    def struct_0xc02c4f4b(self):
+        return Struct(
+            'sname' / Computed('star_gift_attribute_original_details_layer197'),
+            'signature' / Hex(Const(0xc02c4f4b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_sender_user_id=1,
+                                has_message=2),
+            'sender_user_id' / If(this.flags.has_sender_user_id, Int64ul),
+            'recipient_user_id' / Int64ul,
+            'date' / TTimestamp,
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()))
+
+    @structures
+    def star_gift_attribute_structures(self, name):
+        tag_map = {
+            0x39d99013: LazyBound(self.struct_0x39d99013),
+            0x13acff19: LazyBound(self.struct_0x13acff19),
+            0x94271762: LazyBound(self.struct_0x94271762),
+            0xe0bff26c: LazyBound(self.struct_0xe0bff26c),
+            0xc02c4f4b: LazyBound(self.struct_0xc02c4f4b)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group star_gifts of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x901689ea, 'star_gifts')
+    def struct_0x901689ea(self):
+        return (
+            'hash' / Int32ul,
+            'gifts' / self.vector(self.star_gift_structures('gifts'), 'gifts'))
+
+    @constructor(0xa388a368, 'star_gifts_not_modified')
+    def struct_0xa388a368(self):
+        return []
+
+    @structures
+    def star_gifts_structures(self, name):
+        tag_map = {
+            0x901689ea: LazyBound(self.struct_0x901689ea),
+            0xa388a368: LazyBound(self.struct_0xa388a368)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stars of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x032512c5, 'stars_get_stars_subscriptions')
+    def struct_0x032512c5(self):
+        return Struct(
+            'sname' / Computed('stars_get_stars_subscriptions'),
+            'signature' / Hex(Const(0x032512c5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_missing_balance=1),
+            'peer' / self.input_peer_structures('peer'),
+            'offset' / TString)
+
+    @constructor(0x0bd915c0, 'stars_topup_option')
+    def struct_0x0bd915c0(self):
+        return Struct(
+            'sname' / Computed('stars_topup_option'),
+            'signature' / Hex(Const(0x0bd915c0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_extended=2,
+                                has_store_product=1),
+            'stars' / Int64ul,
+            'store_product' / If(this.flags.has_store_product, TString),
+            'currency' / TString,
+            'amount' / Int64ul)
+
+    @constructor(0x104fcfa7, 'stars_payments_get_stars_status')
+    def struct_0x104fcfa7(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x1513e7b0, 'stars_toggle_star_gifts_pinned_to_top')
+    def struct_0x1513e7b0(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'stargift' / self.vector(self.stars_input_saved_star_gift_structures('stargift'), 'stargift'))
+
+    @constructor(0x23830de9, 'stars_get_saved_star_gifts')
+    def struct_0x23830de9(self):
+        return Struct(
+            'sname' / Computed('stars_get_saved_star_gifts'),
+            'signature' / Hex(Const(0x23830de9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_exclude_unsaved=1,
+                                is_exclude_saved=2,
+                                is_exclude_unlimited=4,
+                                is_exclude_limited=8,
+                                is_exclude_unique=16,
+                                is_sort_by_value=32),
+            'peer' / self.input_peer_structures('peer'),
+            'offset' / TString,
+            'limit' / Int32ul)
+
+    @constructor(0x2a2a697c, 'stars_save_star_gift')
+    def struct_0x2a2a697c(self):
+        return Struct(
+            'sname' / Computed('stars_save_star_gift'),
+            'signature' / Hex(Const(0x2a2a697c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unsave=1),
+            'stargift' / self.stars_input_saved_star_gift_structures('stargift'))
+
+    @constructor(0x54236209, 'stars_giveaway_winners_option')
+    def struct_0x54236209(self):
+        return Struct(
+            'sname' / Computed('stars_giveaway_winners_option'),
+            'signature' / Hex(Const(0x54236209, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_default=1),
+            'users' / Int32ul,
+            'per_user_stars' / Int64ul)
+
+    @constructor(0x5e0589f1, 'stars_gift_option')
+    def struct_0x5e0589f1(self):
+        return Struct(
+            'sname' / Computed('stars_gift_option'),
+            'signature' / Hex(Const(0x5e0589f1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_extended=2,
+                                has_store_product=1),
+            'stars' / Int64ul,
+            'store_product' / If(this.flags.has_store_product, TString),
+            'currency' / TString,
+            'amount' / Int64ul)
+
+    @constructor(0x60eaefa1, 'stars_toggle_chat_star_gift_notifications')
+    def struct_0x60eaefa1(self):
+        return Struct(
+            'sname' / Computed('stars_toggle_chat_star_gift_notifications'),
+            'signature' / Hex(Const(0x60eaefa1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_enabled=1),
+            'peer' / self.input_peer_structures('peer'))
+
+    @constructor(0x673ac2f9, 'stars_payments_get_stars_transactions')
+    def struct_0x673ac2f9(self):
+        return Struct(
+            'sname' / Computed('stars_payments_get_stars_transactions'),
+            'signature' / Hex(Const(0x673ac2f9, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_inbound=1,
+                                is_outbound=2),
+            'peer' / self.input_peer_structures('peer'),
+            'offset' / TString)
+
+    @constructor(0x74bf076b, 'stars_convert_star_gift')
+    def struct_0x74bf076b(self):
+        return ['stargift' / self.stars_input_saved_star_gift_structures('stargift')]
+
+    @constructor(0x7998c914, 'stars_payments_send_stars_form')
+    def struct_0x7998c914(self):
+        return (
+            'form_id' / Int64ul,
+            'invoice' / self.input_invoice_structures('invoice'))
+
+    @constructor(0x7f18176a, 'stars_transfer_star_gift')
+    def struct_0x7f18176a(self):
+        return (
+            'stargift' / self.stars_input_saved_star_gift_structures('stargift'),
+            'to_id' / self.input_peer_structures('to_id'))
+
+    @constructor(0x94ce852a, 'stars_giveaway_option')
+    def struct_0x94ce852a(self):
+        return Struct(
+            'sname' / Computed('stars_giveaway_option'),
+            'signature' / Hex(Const(0x94ce852a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_extended=1,
+                                is_default=2,
+                                has_store_product=4),
+            'stars' / Int64ul,
+            'yearly_boosts' / Int32ul,
+            'store_product' / If(this.flags.has_store_product, TString),
+            'currency' / TString,
+            'amount' / Int64ul,
+            'winners' / self.vector(self.struct_0x54236209(), 'winners'))
+
+    @constructor(0x95f389b1, 'stars_payments_saved_star_gifts')
+    def struct_0x95f389b1(self):
+        return Struct(
+            'sname' / Computed('stars_payments_saved_star_gifts'),
+            'signature' / Hex(Const(0x95f389b1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_chat_notifications_enabled=2,
+                                has_next_offset=1),
+            'count' / Int32ul,
+            'chat_notifications_enabled' / If(this.flags.has_chat_notifications_enabled, TBool),
+            'gifts' / self.vector(self.struct_0x6056dba5(), 'gifts'),
+            'next_offset' / If(this.flags.has_next_offset, TString),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x9c9abcb1, 'stars_get_star_gift_upgrade_preview')
+    def struct_0x9c9abcb1(self):
+        return ['gift_id' / Int64ul]
+
+    @constructor(0xa1974d72, 'stars_get_unique_star_gift')
+    def struct_0xa1974d72(self):
+        return ['slug' / TString]
+
+    @constructor(0xaed6e4f5, 'stars_upgrade_star_gift')
+    def struct_0xaed6e4f5(self):
+        return Struct(
+            'sname' / Computed('stars_upgrade_star_gift'),
+            'signature' / Hex(Const(0xaed6e4f5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_keep_original_details=1),
+            'stargift' / self.stars_input_saved_star_gift_structures('stargift'))
+
+    @constructor(0xb455a106, 'stars_get_saved_star_gift')
+    def struct_0xb455a106(self):
+        return ['stargift' / self.vector(self.stars_input_saved_star_gift_structures('stargift'), 'stargift')]
+
+    @constructor(0xbd1efd3e, 'stars_payments_get_stars_giveaway_options')
+    def struct_0xbd1efd3e(self):
+        return []
+
+    @constructor(0xc00ec7d3, 'stars_payments_get_stars_topup_options')
+    def struct_0xc00ec7d3(self):
+        return []
+
+    @constructor(0xc4563590, 'stars_get_star_gifts')
+    def struct_0xc4563590(self):
+        return ['hash' / Int32ul]
+
+    @constructor(0xc7770878, 'stars_change_stars_subscription')
+    def struct_0xc7770878(self):
+        return Struct(
+            'sname' / Computed('stars_change_stars_subscription'),
+            'signature' / Hex(Const(0xc7770878, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_canceled=1),
+            'peer' / self.input_peer_structures('peer'),
+            'subscription_id' / TString,
+            'canceled' / If(this.flags.is_canceled, TBool))
+
+    @constructor(0xcaa2f60b, 'stars_payments_unique_star_gift')
+    def struct_0xcaa2f60b(self):
+        return (
+            'gift' / self.star_gift_structures('gift'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xcc5bebb3, 'stars_fulfill_stars_subscription')
+    def struct_0xcc5bebb3(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'subscription_id' / TString)
+
+    @constructor(0xd06e93a8, 'stars_get_star_gift_withdrawal_url')
+    def struct_0xd06e93a8(self):
+        return (
+            'stargift' / self.stars_input_saved_star_gift_structures('stargift'),
+            'password' / self.input_check_password_srp_structures('password'))
+
+    @constructor(0xd3c96bc8, 'stars_payments_get_stars_gift_options')
+    def struct_0xd3c96bc8(self):
+        return Struct(
+            'sname' / Computed('stars_payments_get_stars_gift_options'),
+            'signature' / Hex(Const(0xd3c96bc8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_user_id=1),
+            'user_id' / If(this.flags.has_user_id, self.input_user_structures('user_id')))
+
+    @constructor(0xfc84653f, 'stars_update_paid_messages_price')
+    def struct_0xfc84653f(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'send_paid_messages_stars' / Int64ul)
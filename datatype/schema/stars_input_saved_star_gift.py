@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stars_input_saved_star_gift of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x69279795, 'stars_input_saved_star_gift_user')
+    def struct_0x69279795(self):
+        return ['msg_id' / Int32ul]
+
+    @constructor(0xf101aa7f, 'stars_input_saved_star_gift_chat')
+    def struct_0xf101aa7f(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'saved_id' / Int64ul)
+
+    @structures
+    def stars_input_saved_star_gift_structures(self, name):
+        tag_map = {
+            0x69279795: LazyBound(self.struct_0x69279795),
+            0xf101aa7f: LazyBound(self.struct_0xf101aa7f)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stars_paid_reaction_privacy of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x206ad49e, 'stars_paid_reaction_privacy_default')
+    def struct_0x206ad49e(self):
+        return []
+
+    @constructor(0x1f0c1ad9, 'stars_paid_reaction_privacy_anonymous')
+    def struct_0x1f0c1ad9(self):
+        return []
+
+    @constructor(0xdc6cfcf0, 'stars_paid_reaction_privacy_peer')
+    def struct_0xdc6cfcf0(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @structures
+    def stars_paid_reaction_privacy_structures(self, name):
+        tag_map = {
+            0x206ad49e: LazyBound(self.struct_0x206ad49e),
+            0x1f0c1ad9: LazyBound(self.struct_0x1f0c1ad9),
+            0xdc6cfcf0: LazyBound(self.struct_0xdc6cfcf0)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stars_status of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xbbfa316c, 'stars_payments_stars_status_layer194')
+    def struct_0xbbfa316c(self):
+        return Struct(
+            'sname' / Computed('stars_payments_stars_status_layer194'),
+            'signature' / Hex(Const(0xbbfa316c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_subscriptions=2,
+                                has_subscriptions_next_offset=4,
+                                has_subscriptions_missing_balance=16,
+                                has_history=8,
+                                has_next_offset=1),
+            'balance_amount' / Int64ul,
+            'subscriptions' / If(this.flags.has_subscriptions, self.vector(self.stars_subscription_structures('subscriptions'), 'subscriptions')),
+            'subscriptions_next_offset' / If(this.flags.has_subscriptions_next_offset, TString),
+            'subscriptions_missing_balance' / If(this.flags.has_subscriptions_missing_balance, Int64ul),
+            'history' / If(this.flags.has_history, self.vector(self.stars_transaction_structures('history'), 'history')),
+            'next_offset' / If(this.flags.has_next_offset, TString),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x6c9ce8ed, 'stars_payments_stars_status')
+    def struct_0x6c9ce8ed(self):
+        return Struct(
+            'sname' / Computed('stars_payments_stars_status'),
+            'signature' / Hex(Const(0x6c9ce8ed, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_subscriptions=2,
+                                has_subscriptions_next_offset=4,
+                                has_subscriptions_missing_balance=16,
+                                has_history=8,
+                                has_next_offset=1),
+            'balance' / self.struct_0xbbb6b4a3(),
+            'subscriptions' / If(this.flags.has_subscriptions, self.vector(self.stars_subscription_structures('subscriptions'), 'subscriptions')),
+            'subscriptions_next_offset' / If(this.flags.has_subscriptions_next_offset, TString),
+            'subscriptions_missing_balance' / If(this.flags.has_subscriptions_missing_balance, Int64ul),
+            'history' / If(this.flags.has_history, self.vector(self.stars_transaction_structures('history'), 'history')),
+            'next_offset' / If(this.flags.has_next_offset, TString),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def stars_status_structures(self, name):
+        tag_map = {
+            0xbbfa316c: LazyBound(self.struct_0xbbfa316c),
+            0x6c9ce8ed: LazyBound(self.struct_0x6c9ce8ed)
+        }
+        return TLUnion(name, tag_map)
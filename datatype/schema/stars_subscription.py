@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stars_subscription of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x2e6eab1a, 'stars_subscription')
+    def struct_0x2e6eab1a(self):
+        return Struct(
+            'sname' / Computed('stars_subscription'),
+            'signature' / Hex(Const(0x2e6eab1a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_canceled=1,
+                                is_can_refulfill=2,
+                                is_missing_balance=4,
+                                is_bot_canceled=128,
+                                has_chat_invite_hash=8,
+                                has_title=16,
+                                has_photo=32,
+                                has_invoice_slug=64),
+            'id' / TString,
+            'peer' / self.peer_structures('peer'),
+            'until_date' / TTimestamp,
+            'pricing' / self.struct_0x05416d58(),
+            'chat_invite_hash' / If(this.flags.has_chat_invite_hash, TString),
+            'title' / If(this.flags.has_title, TString),
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'invoice_slug' / If(this.flags.has_invoice_slug, TString))
+
+    @constructor(0x538ecf18, 'stars_subscription_layer193')
+    def struct_0x538ecf18(self):
+        return Struct(
+            'sname' / Computed('stars_subscription_layer193'),
+            'signature' / Hex(Const(0x538ecf18, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_canceled=1,
+                                is_can_refulfill=2,
+                                is_missing_balance=4,
+                                has_chat_invite_hash=8),
+            'id' / TString,
+            'peer' / self.peer_structures('peer'),
+            'until_date' / TTimestamp,
+            'pricing' / self.struct_0x05416d58(),
+            'chat_invite_hash' / If(this.flags.has_chat_invite_hash, TString))
+
+    @constructor(0xd073f1e6, 'stars_subscription_old')
+    def struct_0xd073f1e6(self):
+        return Struct(
+            'sname' / Computed('stars_subscription_old'),
+            'signature' / Hex(Const(0xd073f1e6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_canceled=1,
+                                is_can_refulfill=2,
+                                is_missing_balance=4),
+            'id' / TString,
+            'peer' / self.peer_structures('peer'),
+            'until_date' / TTimestamp,
+            'pricing' / self.struct_0x05416d58())
+
+    @structures
+    def stars_subscription_structures(self, name):
+        tag_map = {
+            0x2e6eab1a: LazyBound(self.struct_0x2e6eab1a),
+            0x538ecf18: LazyBound(self.struct_0x538ecf18),
+            0xd073f1e6: LazyBound(self.struct_0xd073f1e6)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x05416d58, 'stars_subscription_pricing')
+    def struct_0x05416d58(self):
+        return (
+            'period' / Int32ul,
+            'amount' / Int64ul)
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stars_transaction of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xcc7079b2, 'stars_transaction_layer181')
+    def struct_0xcc7079b2(self):
+        return Struct(
+            'sname' / Computed('stars_transaction_layer181'),
+            'signature' / Hex(Const(0xcc7079b2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_refund=8,
+                                has_title=1,
+                                has_description=2,
+                                has_photo=4),
+            'stars_amount' / Int64ul,
+            'date' / TTimestamp,
+            'peer' / self.stars_transaction_peer_structures('peer'),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')))
+
+    @constructor(0xaa00c898, 'stars_transaction_layer182')
+    def struct_0xaa00c898(self):
+        return Struct(
+            'sname' / Computed('stars_transaction_layer182'),
+            'signature' / Hex(Const(0xaa00c898, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_refund=8,
+                                is_pending=16,
+                                is_failed=64,
+                                has_title=1,
+                                has_description=2,
+                                has_photo=4,
+                                has_transaction_date=32),
+            'stars_amount' / Int64ul,
+            'date' / TTimestamp,
+            'peer' / self.stars_transaction_peer_structures('peer'),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'transaction_date' / If(this.flags.has_transaction_date, TTimestamp),
+            'transaction_url' / If(this.flags.has_transaction_date, TString))
+
+    @constructor(0x2db5418f, 'stars_transaction_layer185')
+    def struct_0x2db5418f(self):
+        return Struct(
+            'sname' / Computed('stars_transaction_layer185'),
+            'signature' / Hex(Const(0x2db5418f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_refund=8,
+                                is_pending=16,
+                                is_failed=64,
+                                is_gift=1024,
+                                has_title=1,
+                                has_description=2,
+                                has_photo=4,
+                                has_transaction_date=32,
+                                has_bot_payload=128,
+                                has_msg_id=256,
+                                has_extended_media=512),
+            'stars_amount' / Int64ul,
+            'date' / TTimestamp,
+            'peer' / self.stars_transaction_peer_structures('peer'),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'transaction_date' / If(this.flags.has_transaction_date, TTimestamp),
+            'transaction_url' / If(this.flags.has_transaction_date, TString),
+            'bot_payload' / If(this.flags.has_bot_payload, TBytes),
+            'msg_id' / If(this.flags.has_msg_id, Int32ul),
+            'extended_media' / If(this.flags.has_extended_media, self.vector(self.message_media_structures('extended_media'), 'extended_media')))
+
+    @constructor(0x433aeb2b, 'stars_transaction_layer186')
+    def struct_0x433aeb2b(self):
+        return Struct(
+            'sname' / Computed('stars_transaction_layer186'),
+            'signature' / Hex(Const(0x433aeb2b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_refund=8,
+                                is_pending=16,
+                                is_failed=64,
+                                is_gift=1024,
+                                is_reaction=2048,
+                                is_subscription=4096,
+                                has_title=1,
+                                has_description=2,
+                                has_photo=4,
+                                has_transaction_date=32,
+                                has_bot_payload=128,
+                                has_msg_id=256,
+                                has_extended_media=512),
+            'stars_amount' / Int64ul,
+            'date' / TTimestamp,
+            'peer' / self.stars_transaction_peer_structures('peer'),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'transaction_date' / If(this.flags.has_transaction_date, TTimestamp),
+            'transaction_url' / If(this.flags.has_transaction_date, TString),
+            'bot_payload' / If(this.flags.has_bot_payload, TBytes),
+            'msg_id' / If(this.flags.has_msg_id, Int32ul),
+            'extended_media' / If(this.flags.has_extended_media, self.vector(self.message_media_structures('extended_media'), 'extended_media')),
+            'subscription_period' / If(this.flags.is_subscription, Int32ul))
+
+    @constructor(0xee7522d5, 'stars_transaction_layer188')
+    def struct_0xee7522d5(self):
+        return Struct(
+            'sname' / Computed('stars_transaction_layer188'),
+            'signature' / Hex(Const(0xee7522d5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_refund=8,
+                                is_pending=16,
+                                is_failed=64,
+                                is_gift=1024,
+                                is_reaction=2048,
+                                is_subscription=4096,
+                                has_title=1,
+                                has_description=2,
+                                has_photo=4,
+                                has_transaction_date=32,
+                                has_bot_payload=128,
+                                has_msg_id=256,
+                                has_extended_media=512,
+                                has_giveaway_post_id=8192),
+            'stars_amount' / Int64ul,
+            'date' / TTimestamp,
+            'peer' / self.stars_transaction_peer_structures('peer'),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'transaction_date' / If(this.flags.has_transaction_date, TTimestamp),
+            'transaction_url' / If(this.flags.has_transaction_date, TString),
+            'bot_payload' / If(this.flags.has_bot_payload, TBytes),
+            'msg_id' / If(this.flags.has_msg_id, Int32ul),
+            'extended_media' / If(this.flags.has_extended_media, self.vector(self.message_media_structures('extended_media'), 'extended_media')),
+            'subscription_period' / If(this.flags.is_subscription, Int32ul),
+            'giveaway_post_id' / If(this.flags.has_giveaway_post_id, Int32ul))
+
+    @constructor(0x0a9ee4c2, 'stars_transaction_layer191')
+    def struct_0x0a9ee4c2(self):
+        return Struct(
+            'sname' / Computed('stars_transaction_layer191'),
+            'signature' / Hex(Const(0x0a9ee4c2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_refund=8,
+                                is_pending=16,
+                                is_failed=64,
+                                is_gift=1024,
+                                is_reaction=2048,
+                                is_subscription=4096,
+                                has_title=1,
+                                has_description=2,
+                                has_photo=4,
+                                has_transaction_date=32,
+                                has_bot_payload=128,
+                                has_msg_id=256,
+                                has_extended_media=512,
+                                has_giveaway_post_id=8192,
+                                has_stargift=16384),
+            'stars_amount' / Int64ul,
+            'date' / TTimestamp,
+            'peer' / self.stars_transaction_peer_structures('peer'),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'transaction_date' / If(this.flags.has_transaction_date, TTimestamp),
+            'transaction_url' / If(this.flags.has_transaction_date, TString),
+            'bot_payload' / If(this.flags.has_bot_payload, TBytes),
+            'msg_id' / If(this.flags.has_msg_id, Int32ul),
+            'extended_media' / If(this.flags.has_extended_media, self.vector(self.message_media_structures('extended_media'), 'extended_media')),
+            'subscription_period' / If(this.flags.is_subscription, Int32ul),
+            'giveaway_post_id' / If(this.flags.has_giveaway_post_id, Int32ul),
+            'stargift' / If(this.flags.has_stargift, self.star_gift_structures('stargift')))
+
+    @constructor(0x35d4f276, 'stars_transaction_layer194')
+    def struct_0x35d4f276(self):
+        return Struct(
+            'sname' / Computed('stars_transaction_layer194'),
+            'signature' / Hex(Const(0x35d4f276, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_refund=8,
+                                is_pending=16,
+                                is_failed=64,
+                                is_gift=1024,
+                                is_reaction=2048,
+                                is_subscription=4096,
+                                is_floodskip=32768,
+                                has_title=1,
+                                has_description=2,
+                                has_photo=4,
+                                has_transaction_date=32,
+                                has_bot_payload=128,
+                                has_msg_id=256,
+                                has_extended_media=512,
+                                has_giveaway_post_id=8192,
+                                has_stargift=16384),
+            'stars_amount' / Int64ul,
+            'date' / TTimestamp,
+            'peer' / self.stars_transaction_peer_structures('peer'),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'transaction_date' / If(this.flags.has_transaction_date, TTimestamp),
+            'transaction_url' / If(this.flags.has_transaction_date, TString),
+            'bot_payload' / If(this.flags.has_bot_payload, TBytes),
+            'msg_id' / If(this.flags.has_msg_id, Int32ul),
+            'extended_media' / If(this.flags.has_extended_media, self.vector(self.message_media_structures('extended_media'), 'extended_media')),
+            'subscription_period' / If(this.flags.is_subscription, Int32ul),
+            'giveaway_post_id' / If(this.flags.has_giveaway_post_id, Int32ul),
+            'stargift' / If(this.flags.has_stargift, self.star_gift_structures('stargift')),
+            'floodskip_number' / If(this.flags.is_floodskip, Int32ul))
+
+    @constructor(0x64dfc926, 'stars_transaction_layer199')
+    def struct_0x64dfc926(self):
+        return Struct(
+            'sname' / Computed('stars_transaction_layer199'),
+            'signature' / Hex(Const(0x64dfc926, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_refund=8,
+                                is_pending=16,
+                                is_failed=64,
+                                is_gift=1024,
+                                is_reaction=2048,
+                                is_subscription=4096,
+                                is_floodskip=32768,
+                                is_stargift_upgrade=262144,
+                                is_paid_message=524288,
+                                has_title=1,
+                                has_description=2,
+                                has_photo=4,
+                                has_transaction_date=32,
+                                has_bot_payload=128,
+                                has_msg_id=256,
+                                has_extended_media=512,
+                                has_giveaway_post_id=8192,
+                                has_stargift=16384,
+                                has_starref_commission_permille=65536,
+                                has_starref_peer=131072),
+            'stars' / self.struct_0xbbb6b4a3(),
+            'date' / TTimestamp,
+            'peer' / self.stars_transaction_peer_structures('peer'),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'transaction_date' / If(this.flags.has_transaction_date, TTimestamp),
+            'transaction_url' / If(this.flags.has_transaction_date, TString),
+            'bot_payload' / If(this.flags.has_bot_payload, TBytes),
+            'msg_id' / If(this.flags.has_msg_id, Int32ul),
+            'extended_media' / If(this.flags.has_extended_media, self.vector(self.message_media_structures('extended_media'), 'extended_media')),
+            'subscription_period' / If(this.flags.is_subscription, Int32ul),
+            'giveaway_post_id' / If(this.flags.has_giveaway_post_id, Int32ul),
+            'stargift' / If(this.flags.has_stargift, self.star_gift_structures('stargift')),
+            'floodskip_number' / If(this.flags.is_floodskip, Int32ul),
+            'starref_commission_permille' / If(this.flags.has_starref_commission_permille, Int32ul),
+            'starref_peer' / If(this.flags.has_starref_peer, self.peer_structures('starref_peer')),
+            'starref_amount' / If(this.flags.has_starref_peer, self.struct_0xbbb6b4a3()))
+
+    @constructor(0xecd50924, 'stars_transaction_layer199_2')
+    def struct_0xecd50924(self):
+        return Struct(
+            'sname' / Computed('stars_transaction_layer199_2'),
+            'signature' / Hex(Const(0xecd50924, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_refund=8,
+                                is_pending=16,
+                                is_failed=64,
+                                is_gift=1024,
+                                is_reaction=2048,
+                                is_subscription=4096,
+                                is_floodskip=32768,
+                                is_stargift_upgrade=262144,
+                                is_paid_message=524288,
+                                is_premium_gift=1048576,
+                                has_title=1,
+                                has_description=2,
+                                has_photo=4,
+                                has_transaction_date=32,
+                                has_bot_payload=128,
+                                has_msg_id=256,
+                                has_extended_media=512,
+                                has_giveaway_post_id=8192,
+                                has_stargift=16384,
+                                has_starref_commission_permille=65536,
+                                has_starref_peer=131072),
+            'stars' / self.struct_0xbbb6b4a3(),
+            'date' / TTimestamp,
+            'peer' / self.stars_transaction_peer_structures('peer'),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'transaction_date' / If(this.flags.has_transaction_date, TTimestamp),
+            'transaction_url' / If(this.flags.has_transaction_date, TString),
+            'bot_payload' / If(this.flags.has_bot_payload, TBytes),
+            'msg_id' / If(this.flags.has_msg_id, Int32ul),
+            'extended_media' / If(this.flags.has_extended_media, self.vector(self.message_media_structures('extended_media'), 'extended_media')),
+            'subscription_period' / If(this.flags.is_subscription, Int32ul),
+            'giveaway_post_id' / If(this.flags.has_giveaway_post_id, Int32ul),
+            'stargift' / If(this.flags.has_stargift, self.star_gift_structures('stargift')),
+            'floodskip_number' / If(this.flags.is_floodskip, Int32ul),
+            'starref_commission_permille' / If(this.flags.has_starref_commission_permille, Int32ul),
+            'starref_peer' / If(this.flags.has_starref_peer, self.peer_structures('starref_peer')),
+            'starref_amount' / If(this.flags.has_starref_peer, self.struct_0xbbb6b4a3()),
+            'paid_messages' / If(this.flags.is_paid_message, Int32ul))
+
+    @constructor(0xa39fd94a, 'stars_transaction')
+    def struct_0xa39fd94a(self):
+        return Struct(
+            'sname' / Computed('stars_transaction'),
+            'signature' / Hex(Const(0xa39fd94a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_refund=8,
+                                is_pending=16,
+                                is_failed=64,
+                                is_gift=1024,
+                                is_reaction=2048,
+                                is_subscription=4096,
+                                is_floodskip=32768,
+                                is_stargift_upgrade=262144,
+                                is_paid_message=524288,
+                                is_premium_gift=1048576,
+                                has_title=1,
+                                has_description=2,
+                                has_photo=4,
+                                has_transaction_date=32,
+                                has_bot_payload=128,
+                                has_msg_id=256,
+                                has_extended_media=512,
+                                has_giveaway_post_id=8192,
+                                has_stargift=16384,
+                                has_starref_commission_permille=65536,
+                                has_starref_peer=131072),
+            'stars' / self.struct_0xbbb6b4a3(),
+            'date' / TTimestamp,
+            'peer' / self.stars_transaction_peer_structures('peer'),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.web_document_structures('photo')),
+            'transaction_date' / If(this.flags.has_transaction_date, TTimestamp),
+            'transaction_url' / If(this.flags.has_transaction_date, TString),
+            'bot_payload' / If(this.flags.has_bot_payload, TBytes),
+            'msg_id' / If(this.flags.has_msg_id, Int32ul),
+            'extended_media' / If(this.flags.has_extended_media, self.vector(self.message_media_structures('extended_media'), 'extended_media')),
+            'subscription_period' / If(this.flags.is_subscription, Int32ul),
+            'giveaway_post_id' / If(this.flags.has_giveaway_post_id, Int32ul),
+            'stargift' / If(this.flags.has_stargift, self.star_gift_structures('stargift')),
+            'floodskip_number' / If(this.flags.is_floodskip, Int32ul),
+            'starref_commission_permille' / If(this.flags.has_starref_commission_permille, Int32ul),
+            'starref_peer' / If(this.flags.has_starref_peer, self.peer_structures('starref_peer')),
+            'starref_amount' / If(this.flags.has_starref_peer, self.struct_0xbbb6b4a3()),
+            'paid_messages' / If(this.flags.is_paid_message, Int32ul),
+            'premium_gift_months' / If(this.flags.is_premium_gift, Int32ul))
+
+    @structures
+    def stars_transaction_structures(self, name):
+        tag_map = {
+            0xcc7079b2: LazyBound(self.struct_0xcc7079b2),
+            0xaa00c898: LazyBound(self.struct_0xaa00c898),
+            0x2db5418f: LazyBound(self.struct_0x2db5418f),
+            0x433aeb2b: LazyBound(self.struct_0x433aeb2b),
+            0xee7522d5: LazyBound(self.struct_0xee7522d5),
+            0x0a9ee4c2: LazyBound(self.struct_0x0a9ee4c2),
+            0x35d4f276: LazyBound(self.struct_0x35d4f276),
+            0x64dfc926: LazyBound(self.struct_0x64dfc926),
+            0xecd50924: LazyBound(self.struct_0xecd50924),
+            0xa39fd94a: LazyBound(self.struct_0xa39fd94a)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stars_transaction_peer of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd80da15d, 'stars_transaction_peer')
+    def struct_0xd80da15d(self):
+        return ['peer' / self.peer_structures('peer')]
+
+    @constructor(0xb457b375, 'stars_transaction_peer_app_store')
+    def struct_0xb457b375(self):
+        return []
+
+    @constructor(0x7b560a0b, 'stars_transaction_peer_play_market')
+    def struct_0x7b560a0b(self):
+        return []
+
+    @constructor(0xe92fd902, 'stars_transaction_peer_fragment')
+    def struct_0xe92fd902(self):
+        return []
+
+    @constructor(0x250dbaf8, 'stars_transaction_peer_premium_bot')
+    def struct_0x250dbaf8(self):
+        return []
+
+    @constructor(0x95f2bfe4, 'stars_transaction_peer_unsupported')
+    def struct_0x95f2bfe4(self):
+        return []
+
+    @constructor(0x60682812, 'stars_transaction_peer_ads')
+    def struct_0x60682812(self):
+        return []
+
+    @constructor(0xf9677aad, 'stars_transaction_peer_api')
+    def struct_0xf9677aad(self):
+        return []
+
+    @structures
+    def stars_transaction_peer_structures(self, name):
+        tag_map = {
+            0xd80da15d: LazyBound(self.struct_0xd80da15d),
+            0xb457b375: LazyBound(self.struct_0xb457b375),
+            0x7b560a0b: LazyBound(self.struct_0x7b560a0b),
+            0xe92fd902: LazyBound(self.struct_0xe92fd902),
+            0x250dbaf8: LazyBound(self.struct_0x250dbaf8),
+            0x95f2bfe4: LazyBound(self.struct_0x95f2bfe4),
+            0x60682812: LazyBound(self.struct_0x60682812),
+            0xf9677aad: LazyBound(self.struct_0xf9677aad)
+        }
+        return TLUnion(name, tag_map)
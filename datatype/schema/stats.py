@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stats of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x396ca5fc, 'stats_broadcast_stats')
+    def struct_0x396ca5fc(self):
+        return (
+            'period' / self.struct_0xb637edaf(),
+            'followers' / self.struct_0xcb43acde(),
+            'views_per_post' / self.struct_0xcb43acde(),
+            'shares_per_post' / self.struct_0xcb43acde(),
+            'reactions_per_post' / self.struct_0xcb43acde(),
+            'views_per_story' / self.struct_0xcb43acde(),
+            'shares_per_story' / self.struct_0xcb43acde(),
+            'reactions_per_story' / self.struct_0xcb43acde(),
+            'enabled_notifications' / self.struct_0xcbce2fe0(),
+            'growth_graph' / self.stats_graph_structures('growth_graph'),
+            'followers_graph' / self.stats_graph_structures('followers_graph'),
+            'mute_graph' / self.stats_graph_structures('mute_graph'),
+            'top_hours_graph' / self.stats_graph_structures('top_hours_graph'),
+            'interactions_graph' / self.stats_graph_structures('interactions_graph'),
+            'iv_interactions_graph' / self.stats_graph_structures('iv_interactions_graph'),
+            'views_by_source_graph' / self.stats_graph_structures('views_by_source_graph'),
+            'new_followers_by_source_graph' / self.stats_graph_structures('new_followers_by_source_graph'),
+            'languages_graph' / self.stats_graph_structures('languages_graph'),
+            'reactions_by_emotion_graph' / self.stats_graph_structures('reactions_by_emotion_graph'),
+            'story_interactions_graph' / self.stats_graph_structures('story_interactions_graph'),
+            'story_reactions_by_emotion_graph' / self.stats_graph_structures('story_reactions_by_emotion_graph'),
+            'recent_posts_interactions' / self.vector(self.stats_post_interaction_counters_structures('recent_posts_interactions'), 'recent_posts_interactions'))
+
+    @constructor(0x47a971e0, 'stats_url')
+    def struct_0x47a971e0(self):
+        return ['url' / TString]
+
+    @constructor(0x535f779d, 'stats_group_top_inviter')
+    def struct_0x535f779d(self):
+        return (
+            'user_id' / Int64ul,
+            'invitations' / Int32ul)
+
+    @constructor(0x5407e297, 'stats_broadcast_revenue_stats')
+    def struct_0x5407e297(self):
+        return (
+            'top_hours_graph' / self.stats_graph_structures('top_hours_graph'),
+            'revenue_graph' / self.stats_graph_structures('revenue_graph'),
+            'balances' / self.broadcast_revenue_balances_structures('balances'),
+            'usd_rate' / Double)
+
+    @constructor(0x5f150144, 'stats_get_message_public_forwards')
+    def struct_0x5f150144(self):
+        return (
+            'channel' / self.input_channel_structures('channel'),
+            'msg_id' / Int32ul,
+            'offset' / TString,
+            'limit' / Int32ul)
+
+    @constructor(0x621d5fa0, 'stats_load_async_graph')
+    def struct_0x621d5fa0(self):
+        return Struct(
+            'sname' / Computed('stats_load_async_graph'),
+            'signature' / Hex(Const(0x621d5fa0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_x=1),
+            'token' / TString,
+            'x' / If(this.flags.has_x, Int64ul))
+
+    @constructor(0x70990b6d, 'stats_get_broadcast_revenue_transactions')
+    def struct_0x70990b6d(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'offset' / Int32ul,
+            'limit' / Int32ul)
+
+    @constructor(0x7fe91c14, 'stats_message_stats')
+    def struct_0x7fe91c14(self):
+        return (
+            'views_graph' / self.stats_graph_structures('views_graph'),
+            'reactions_by_emotion_graph' / self.stats_graph_structures('reactions_by_emotion_graph'))
+
+    @constructor(0x87158466, 'stats_broadcast_revenue_transactions')
+    def struct_0x87158466(self):
+        return (
+            'count' / Int32ul,
+            'transactions' / self.vector(self.stats_broadcast_revenue_transaction_structures('transactions'), 'transactions'))
+
+    @constructor(0x93037e20, 'stats_public_forwards')
+    def struct_0x93037e20(self):
+        return Struct(
+            'sname' / Computed('stats_public_forwards'),
+            'signature' / Hex(Const(0x93037e20, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'count' / Int32ul,
+            'forwards' / self.vector(self.stats_public_forward_structures('forwards'), 'forwards'),
+            'next_offset' / If(this.flags.has_next_offset, TString),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x9d04af9b, 'stats_group_top_poster')
+    def struct_0x9d04af9b(self):
+        return (
+            'user_id' / Int64ul,
+            'messages' / Int32ul,
+            'avg_chars' / Int32ul)
+
+    @constructor(0x9df4faad, 'stats_get_broadcast_revenue_withdrawal_url')
+    def struct_0x9df4faad(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'password' / self.input_check_password_srp_structures('password'))
+
+    @constructor(0xa6437ef6, 'stats_get_story_public_forwards')
+    def struct_0xa6437ef6(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul,
+            'offset' / TString,
+            'limit' / Int32ul)
+
+    @constructor(0xab42441a, 'stats_get_broadcast_stats')
+    def struct_0xab42441a(self):
+        return Struct(
+            'sname' / Computed('stats_get_broadcast_stats'),
+            'signature' / Hex(Const(0xab42441a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_dark=1),
+            'channel' / self.input_channel_structures('channel'))
+
+    @constructor(0xb637edaf, 'stats_date_range_days')
+    def struct_0xb637edaf(self):
+        return (
+            'min_date' / TTimestamp,
+            'max_date' / TTimestamp)
+
+    @constructor(0xb6e0a3f5, 'stats_get_message_stats')
+    def struct_0xb6e0a3f5(self):
+        return Struct(
+            'sname' / Computed('stats_get_message_stats'),
+            'signature' / Hex(Const(0xb6e0a3f5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_dark=1),
+            'channel' / self.input_channel_structures('channel'),
+            'msg_id' / Int32ul)
+
+    @constructor(0xcb43acde, 'stats_abs_value_and_prev')
+    def struct_0xcb43acde(self):
+        return (
+            'current' / Double,
+            'previous' / Double)
+
+    @constructor(0xcbce2fe0, 'stats_percent_value')
+    def struct_0xcbce2fe0(self):
+        return (
+            'part' / Double,
+            'total' / Double)
+
+    @constructor(0xd7584c87, 'stats_group_top_admin')
+    def struct_0xd7584c87(self):
+        return (
+            'user_id' / Int64ul,
+            'deleted' / Int32ul,
+            'kicked' / Int32ul,
+            'banned' / Int32ul)
+
+    @constructor(0xdcdf8607, 'stats_get_megagroup_stats')
+    def struct_0xdcdf8607(self):
+        return Struct(
+            'sname' / Computed('stats_get_megagroup_stats'),
+            'signature' / Hex(Const(0xdcdf8607, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_dark=1),
+            'channel' / self.input_channel_structures('channel'))
+
+    @constructor(0xec659737, 'stats_broadcast_revenue_withdrawal_url')
+    def struct_0xec659737(self):
+        return ['url' / TString]
+
+    @constructor(0xef7ff916, 'stats_megagroup_stats')
+    def struct_0xef7ff916(self):
+        return (
+            'period' / self.struct_0xb637edaf(),
+            'members' / self.struct_0xcb43acde(),
+            'messages' / self.struct_0xcb43acde(),
+            'viewers' / self.struct_0xcb43acde(),
+            'posters' / self.struct_0xcb43acde(),
+            'growth_graph' / self.stats_graph_structures('growth_graph'),
+            'members_graph' / self.stats_graph_structures('members_graph'),
+            'new_members_by_source_graph' / self.stats_graph_structures('new_members_by_source_graph'),
+            'languages_graph' / self.stats_graph_structures('languages_graph'),
+            'messages_graph' / self.stats_graph_structures('messages_graph'),
+            'actions_graph' / self.stats_graph_structures('actions_graph'),
+            'top_hours_graph' / self.stats_graph_structures('top_hours_graph'),
+            'weekdays_graph' / self.stats_graph_structures('weekdays_graph'),
+            'top_posters' / self.vector(self.struct_0x9d04af9b(), 'top_posters'),
+            'top_admins' / self.vector(self.struct_0xd7584c87(), 'top_admins'),
+            'top_inviters' / self.vector(self.struct_0x535f779d(), 'top_inviters'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xf788ee19, 'stats_get_broadcast_revenue_stats')
+    def struct_0xf788ee19(self):
+        return Struct(
+            'sname' / Computed('stats_get_broadcast_revenue_stats'),
+            'signature' / Hex(Const(0xf788ee19, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_dark=1),
+            'peer' / self.input_peer_structures('peer'))
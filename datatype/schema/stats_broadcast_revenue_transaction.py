@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stats_broadcast_revenue_transaction of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x557e2cc4, 'stats_broadcast_revenue_transaction_proceeds')
+    def struct_0x557e2cc4(self):
+        return (
+            'amount' / Int64ul,
+            'from_date' / TTimestamp,
+            'to_date' / TTimestamp)
+
+    @constructor(0x5a590978, 'stats_broadcast_revenue_transaction_withdrawal')
+    def struct_0x5a590978(self):
+        return Struct(
+            'sname' / Computed('stats_broadcast_revenue_transaction_withdrawal'),
+            'signature' / Hex(Const(0x5a590978, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pending=1,
+                                is_failed=4,
+                                has_transaction_date=2),
+            'amount' / Int64ul,
+            'date' / TTimestamp,
+            'provider' / TString,
+            'transaction_date' / If(this.flags.has_transaction_date, TTimestamp),
+            'transaction_url' / If(this.flags.has_transaction_date, TString))
+
+    @constructor(0x42d30d2e, 'stats_broadcast_revenue_transaction_refund')
+    def struct_0x42d30d2e(self):
+        return (
+            'amount' / Int64ul,
+            'from_date' / TTimestamp,
+            'provider' / TString)
+
+    @structures
+    def stats_broadcast_revenue_transaction_structures(self, name):
+        tag_map = {
+            0x557e2cc4: LazyBound(self.struct_0x557e2cc4),
+            0x5a590978: LazyBound(self.struct_0x5a590978),
+            0x42d30d2e: LazyBound(self.struct_0x42d30d2e)
+        }
+        return TLUnion(name, tag_map)
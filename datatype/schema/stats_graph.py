@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stats_graph of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x8ea464b6, 'stats_graph')
+    def struct_0x8ea464b6(self):
+        return Struct(
+            'sname' / Computed('stats_graph'),
+            'signature' / Hex(Const(0x8ea464b6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_zoom_token=1),
+            'json' / self.struct_0x7d748d04(),
+            'zoom_token' / If(this.flags.has_zoom_token, TString))
+
+    @constructor(0x4a27eb2d, 'stats_graph_async')
+    def struct_0x4a27eb2d(self):
+        return ['token' / TString]
+
+    @constructor(0xbedc9822, 'stats_graph_error')
+    def struct_0xbedc9822(self):
+        return ['error' / TString]
+
+    @structures
+    def stats_graph_structures(self, name):
+        tag_map = {
+            0x8ea464b6: LazyBound(self.struct_0x8ea464b6),
+            0x4a27eb2d: LazyBound(self.struct_0x4a27eb2d),
+            0xbedc9822: LazyBound(self.struct_0xbedc9822)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stats_post_interaction_counters of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x8a480e27, 'stats_post_interaction_counters_story')
+    def struct_0x8a480e27(self):
+        return (
+            'story_id' / Int32ul,
+            'views' / Int32ul,
+            'forwards' / Int32ul,
+            'reactions' / Int32ul)
+
+    @constructor(0xe7058e7f, 'stats_post_interaction_counters_message')
+    def struct_0xe7058e7f(self):
+        return (
+            'msg_id' / Int32ul,
+            'views' / Int32ul,
+            'forwards' / Int32ul,
+            'reactions' / Int32ul)
+
+    @structures
+    def stats_post_interaction_counters_structures(self, name):
+        tag_map = {
+            0x8a480e27: LazyBound(self.struct_0x8a480e27),
+            0xe7058e7f: LazyBound(self.struct_0xe7058e7f)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stats_public_forward of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x01f2bf4a, 'stats_public_forward_message')
+    def struct_0x01f2bf4a(self):
+        return ['message' / self.message_structures('message')]
+
+    @constructor(0xedf3add0, 'stories_public_forward_story')
+    def struct_0xedf3add0(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'story' / self.story_item_structures('story'))
+
+    @structures
+    def stats_public_forward_structures(self, name):
+        tag_map = {
+            0x01f2bf4a: LazyBound(self.struct_0x01f2bf4a),
+            0xedf3add0: LazyBound(self.struct_0xedf3add0)
+        }
+        return TLUnion(name, tag_map)
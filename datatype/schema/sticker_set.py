@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group sticker_set of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa7a43b17, 'sticker_set_old')
+    def struct_0xa7a43b17(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'short_name' / TString)
+
+    @constructor(0x5585a139, 'sticker_set_layer96')
+    def struct_0x5585a139(self):
+        return Struct(
+            'sname' / Computed('sticker_set_layer96'),
+            'signature' / Hex(Const(0x5585a139, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_archived=2,
+                                is_official=4,
+                                is_masks=8,
+                                has_installed_date=1),
+            'installed_date' / If(this.flags.has_installed_date, TTimestamp),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'short_name' / TString,
+            'count' / Int32ul,
+            'hash' / Int32ul)
+
+    @constructor(0x6a90bcb7, 'sticker_set_layer97')
+    def struct_0x6a90bcb7(self):
+        return Struct(
+            'sname' / Computed('sticker_set_layer97'),
+            'signature' / Hex(Const(0x6a90bcb7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_archived=2,
+                                is_official=4,
+                                is_masks=8,
+                                has_installed_date=1,
+                                has_thumb=16),
+            'installed_date' / If(this.flags.has_installed_date, TTimestamp),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'short_name' / TString,
+            'thumb' / If(this.flags.has_thumb, self.photo_size_structures('thumb')),
+            'count' / Int32ul,
+            'hash' / Int32ul)
+
+    @constructor(0xeeb46f27, 'sticker_set_layer121')
+    def struct_0xeeb46f27(self):
+        return Struct(
+            'sname' / Computed('sticker_set_layer121'),
+            'signature' / Hex(Const(0xeeb46f27, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_archived=2,
+                                is_official=4,
+                                is_masks=8,
+                                has_installed_date=1,
+                                has_thumb=16),
+            'installed_date' / If(this.flags.has_installed_date, TTimestamp),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'short_name' / TString,
+            'thumb' / If(this.flags.has_thumb, self.photo_size_structures('thumb')),
+            'thumb_dc_id' / If(this.flags.has_thumb, Int32ul),
+            'count' / Int32ul,
+            'hash' / Int32ul)
+
+    @constructor(0x40e237a8, 'sticker_set_layer126')
+    def struct_0x40e237a8(self):
+        return Struct(
+            'sname' / Computed('sticker_set_layer126'),
+            'signature' / Hex(Const(0x40e237a8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_archived=2,
+                                is_official=4,
+                                is_masks=8,
+                                has_installed_date=1,
+                                has_thumbs=16),
+            'installed_date' / If(this.flags.has_installed_date, TTimestamp),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'short_name' / TString,
+            'thumbs' / If(this.flags.has_thumbs, self.vector(self.photo_size_structures('thumbs'), 'thumbs')),
+            'thumb_dc_id' / If(this.flags.has_thumbs, Int32ul),
+            'count' / Int32ul,
+            'hash' / Int32ul)
+
+    @constructor(0xcd303b41, 'sticker_set_layer75')
+    def struct_0xcd303b41(self):
+        return Struct(
+            'sname' / Computed('sticker_set_layer75'),
+            'signature' / Hex(Const(0xcd303b41, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_installed=1,
+                                is_archived=2,
+                                is_official=4,
+                                is_masks=8),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'short_name' / TString,
+            'count' / Int32ul,
+            'hash' / Int32ul)
+
+    @constructor(0xd7df217a, 'sticker_set_layer143')
+    def struct_0xd7df217a(self):
+        return Struct(
+            'sname' / Computed('sticker_set_layer143'),
+            'signature' / Hex(Const(0xd7df217a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_archived=2,
+                                is_official=4,
+                                is_masks=8,
+                                is_emojis=128,
+                                has_installed_date=1,
+                                has_thumbs=16,
+                                has_thumb_document_id=256),
+            'installed_date' / If(this.flags.has_installed_date, TTimestamp),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'short_name' / TString,
+            'thumbs' / If(this.flags.has_thumbs, self.vector(self.photo_size_structures('thumbs'), 'thumbs')),
+            'thumb_dc_id' / If(this.flags.has_thumbs, Int32ul),
+            'thumb_version' / If(this.flags.has_thumbs, Int32ul),
+            'thumb_document_id' / If(this.flags.has_thumb_document_id, Int64ul),
+            'count' / Int32ul,
+            'hash' / Int32ul)
+
+    @constructor(0x2dd14edc, 'sticker_set')
+    def struct_0x2dd14edc(self):
+        return Struct(
+            'sname' / Computed('sticker_set'),
+            'signature' / Hex(Const(0x2dd14edc, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_archived=2,
+                                is_official=4,
+                                is_masks=8,
+                                is_emojis=128,
+                                is_text_color=512,
+                                is_channel_emoji_status=1024,
+                                is_creator=2048,
+                                has_installed_date=1,
+                                has_thumbs=16,
+                                has_thumb_document_id=256),
+            'installed_date' / If(this.flags.has_installed_date, TTimestamp),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'title' / TString,
+            'short_name' / TString,
+            'thumbs' / If(this.flags.has_thumbs, self.vector(self.photo_size_structures('thumbs'), 'thumbs')),
+            'thumb_dc_id' / If(this.flags.has_thumbs, Int32ul),
+            'thumb_version' / If(this.flags.has_thumbs, Int32ul),
+            'thumb_document_id' / If(this.flags.has_thumb_document_id, Int64ul),
+            'count' / Int32ul,
+            'hash' / Int32ul)
+
+    @structures
+    def sticker_set_structures(self, name):
+        tag_map = {
+            0xa7a43b17: LazyBound(self.struct_0xa7a43b17),
+            0x5585a139: LazyBound(self.struct_0x5585a139),
+            0x6a90bcb7: LazyBound(self.struct_0x6a90bcb7),
+            0xeeb46f27: LazyBound(self.struct_0xeeb46f27),
+            0x40e237a8: LazyBound(self.struct_0x40e237a8),
+            0xcd303b41: LazyBound(self.struct_0xcd303b41),
+            0xd7df217a: LazyBound(self.struct_0xd7df217a),
+            0x2dd14edc: LazyBound(self.struct_0x2dd14edc)
+        }
+        return TLUnion(name, tag_map)
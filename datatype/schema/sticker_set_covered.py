@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group sticker_set_covered of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x3407e51b, 'sticker_set_multi_covered')
+    def struct_0x3407e51b(self):
+        return (
+            'set' / self.sticker_set_structures('set'),
+            'covers' / self.vector(self.document_structures('covers'), 'covers'))
+
+    @constructor(0x1aed5ee5, 'sticker_set_full_covered_layer146')
+    def struct_0x1aed5ee5(self):
+        return (
+            'set' / self.sticker_set_structures('set'),
+            'packs' / self.vector(self.struct_0x12b299d4(), 'packs'),
+            'documents' / self.vector(self.document_structures('documents'), 'documents'))
+
+    @constructor(0x40d13c0e, 'sticker_set_full_covered')
+    def struct_0x40d13c0e(self):
+        return (
+            'set' / self.sticker_set_structures('set'),
+            'packs' / self.vector(self.struct_0x12b299d4(), 'packs'),
+            'keywords' / self.vector(self.struct_0xfcfeb29c(), 'keywords'),
+            'documents' / self.vector(self.document_structures('documents'), 'documents'))
+
+    @constructor(0x77b15d1c, 'sticker_set_no_covered')
+    def struct_0x77b15d1c(self):
+        return ['set' / self.sticker_set_structures('set')]
+
+    @constructor(0x6410a5d2, 'sticker_set_covered')
+    def struct_0x6410a5d2(self):
+        return (
+            'set' / self.sticker_set_structures('set'),
+            'cover' / self.document_structures('cover'))
+
+    @structures
+    def sticker_set_covered_structures(self, name):
+        tag_map = {
+            0x3407e51b: LazyBound(self.struct_0x3407e51b),
+            0x1aed5ee5: LazyBound(self.struct_0x1aed5ee5),
+            0x40d13c0e: LazyBound(self.struct_0x40d13c0e),
+            0x77b15d1c: LazyBound(self.struct_0x77b15d1c),
+            0x6410a5d2: LazyBound(self.struct_0x6410a5d2)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x12b299d4, 'sticker_pack')
+    def struct_0x12b299d4(self):
+        return (
+            'emoticon' / TString,
+            'documents' / self.vector(Int64ul, 'documents'))
+
+    @constructor(0xfcfeb29c, 'sticker_keyword')
+    def struct_0xfcfeb29c(self):
+        return (
+            'document_id' / Int64ul,
+            'keyword' / self.vector(TString, 'keyword'))
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stickers of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x124b1c00, 'stickers_rename_sticker_set')
+    def struct_0x124b1c00(self):
+        return (
+            'stickerset' / self.input_sticker_set_structures('stickerset'),
+            'title' / TString)
+
+    @constructor(0x284b3639, 'stickers_check_short_name')
+    def struct_0x284b3639(self):
+        return ['short_name' / TString]
+
+    @constructor(0x4696459a, 'stickers_replace_sticker')
+    def struct_0x4696459a(self):
+        return (
+            'sticker' / self.input_document_structures('sticker'),
+            'new_sticker' / self.struct_0xffa0a496())
+
+    @constructor(0x4dafc503, 'stickers_suggest_short_name')
+    def struct_0x4dafc503(self):
+        return ['title' / TString]
+
+    @constructor(0x85fea03f, 'stickers_suggested_short_name')
+    def struct_0x85fea03f(self):
+        return ['short_name' / TString]
+
+    @constructor(0x8653febe, 'stickers_add_sticker_to_set')
+    def struct_0x8653febe(self):
+        return (
+            'stickerset' / self.input_sticker_set_structures('stickerset'),
+            'sticker' / self.struct_0xffa0a496())
+
+    @constructor(0x87704394, 'stickers_delete_sticker_set')
+    def struct_0x87704394(self):
+        return ['stickerset' / self.input_sticker_set_structures('stickerset')]
+
+    @constructor(0x9021ab67, 'stickers_create_sticker_set')
+    def struct_0x9021ab67(self):
+        return Struct(
+            'sname' / Computed('stickers_create_sticker_set'),
+            'signature' / Hex(Const(0x9021ab67, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_masks=1,
+                                is_emojis=32,
+                                has_thumb=4,
+                                has_software=8),
+            'user_id' / self.input_user_structures('user_id'),
+            'title' / TString,
+            'short_name' / TString,
+            'thumb' / If(this.flags.has_thumb, self.input_document_structures('thumb')),
+            'stickers' / self.vector(self.struct_0xffa0a496(), 'stickers'),
+            'software' / If(this.flags.has_software, TString))
+
+    @constructor(0xa76a5392, 'stickers_set_sticker_set_thumb')
+    def struct_0xa76a5392(self):
+        return Struct(
+            'sname' / Computed('stickers_set_sticker_set_thumb'),
+            'signature' / Hex(Const(0xa76a5392, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_thumb=1,
+                                has_thumb_document_id=2),
+            'stickerset' / self.input_sticker_set_structures('stickerset'),
+            'thumb' / If(this.flags.has_thumb, self.input_document_structures('thumb')),
+            'thumb_document_id' / If(this.flags.has_thumb_document_id, Int64ul))
+
+    @constructor(0xf5537ebc, 'stickers_change_sticker')
+    def struct_0xf5537ebc(self):
+        return Struct(
+            'sname' / Computed('stickers_change_sticker'),
+            'signature' / Hex(Const(0xf5537ebc, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_emoji=1,
+                                has_mask_coords=2,
+                                has_keywords=4),
+            'sticker' / self.input_document_structures('sticker'),
+            'emoji' / If(this.flags.has_emoji, TString),
+            'mask_coords' / If(this.flags.has_mask_coords, self.struct_0xaed6dbb2()),
+            'keywords' / If(this.flags.has_keywords, TString))
+
+    @constructor(0xf7760f51, 'stickers_remove_sticker_from_set')
+    def struct_0xf7760f51(self):
+        return ['sticker' / self.input_document_structures('sticker')]
+
+    @constructor(0xffa0a496, 'input_sticker_set_item')
+    def struct_0xffa0a496(self):
+        return Struct(
+            'sname' / Computed('input_sticker_set_item'),
+            'signature' / Hex(Const(0xffa0a496, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_mask_coords=1),
+            'document' / self.input_document_structures('document'),
+            'emoji' / TString,
+            'mask_coords' / If(this.flags.has_mask_coords, self.struct_0xaed6dbb2()))
+
+    @constructor(0xffb6d4ca, 'stickers_change_sticker_position')
+    def struct_0xffb6d4ca(self):
+        return (
+            'sticker' / self.input_document_structures('sticker'),
+            'position' / Int32ul)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group storage_file_type of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xaa963b05, 'storage_file_unknown')
+    def struct_0xaa963b05(self):
+        return []
+
+    @constructor(0xb3cea0e4, 'storage_file_mp4')
+    def struct_0xb3cea0e4(self):
+        return []
+
+    @constructor(0x1081464c, 'storage_file_webp')
+    def struct_0x1081464c(self):
+        return []
+
+    @constructor(0x0a4f63c0, 'storage_file_png')
+    def struct_0x0a4f63c0(self):
+        return []
+
+    @constructor(0xcae1aadf, 'storage_file_gif')
+    def struct_0xcae1aadf(self):
+        return []
+
+    @constructor(0xae1e508d, 'storage_file_pdf')
+    def struct_0xae1e508d(self):
+        return []
+
+    @constructor(0x528a0677, 'storage_file_mp3')
+    def struct_0x528a0677(self):
+        return []
+
+    @constructor(0x007efe0e, 'storage_file_jpeg')
+    def struct_0x007efe0e(self):
+        return []
+
+    @constructor(0x4b09ebbc, 'storage_file_mov')
+    def struct_0x4b09ebbc(self):
+        return []
+
+    @constructor(0x40bc6f52, 'storage_file_partial')
+    def struct_0x40bc6f52(self):
+        return []
+
+    @structures
+    def storage_file_type_structures(self, name):
+        tag_map = {
+            0xaa963b05: LazyBound(self.struct_0xaa963b05),
+            0xb3cea0e4: LazyBound(self.struct_0xb3cea0e4),
+            0x1081464c: LazyBound(self.struct_0x1081464c),
+            0x0a4f63c0: LazyBound(self.struct_0x0a4f63c0),
+            0xcae1aadf: LazyBound(self.struct_0xcae1aadf),
+            0xae1e508d: LazyBound(self.struct_0xae1e508d),
+            0x528a0677: LazyBound(self.struct_0x528a0677),
+            0x007efe0e: LazyBound(self.struct_0x007efe0e),
+            0x4b09ebbc: LazyBound(self.struct_0x4b09ebbc),
+            0x40bc6f52: LazyBound(self.struct_0x40bc6f52)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stories of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x042f1f61, 'stories_premium_get_boosts_status')
+    def struct_0x042f1f61(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x0b297e9b, 'stories_toggle_pinned_to_top')
+    def struct_0x0b297e9b(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0x0be77b4a, 'stories_premium_get_my_boosts')
+    def struct_0x0be77b4a(self):
+        return []
+
+    @constructor(0x1923fa8c, 'stories_report')
+    def struct_0x1923fa8c(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'),
+            'reason' / self.report_reason_structures('reason'),
+            'message' / TString)
+
+    @constructor(0x19d8eb45, 'stories_report')
+    def struct_0x19d8eb45(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'),
+            'option' / TBytes,
+            'message' / TString)
+
+    @constructor(0x28e16cc8, 'stories_get_stories_views')
+    def struct_0x28e16cc8(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0x2c4ada50, 'stories_get_peer_stories')
+    def struct_0x2c4ada50(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0x374fef40, 'stories_stats_get_story_stats')
+    def struct_0x374fef40(self):
+        return Struct(
+            'sname' / Computed('stories_stats_get_story_stats'),
+            'signature' / Hex(Const(0x374fef40, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_dark=1),
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul)
+
+    @constructor(0x3fc9053b, 'stories_exported_story_link')
+    def struct_0x3fc9053b(self):
+        return ['link' / TString]
+
+    @constructor(0x4959427a, 'stories_premium_boosts_status')
+    def struct_0x4959427a(self):
+        return Struct(
+            'sname' / Computed('stories_premium_boosts_status'),
+            'signature' / Hex(Const(0x4959427a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_my_boost=4,
+                                has_gift_boosts=16,
+                                has_next_level_boosts=1,
+                                has_premium_audience=2,
+                                has_prepaid_giveaways=8),
+            'level' / Int32ul,
+            'current_level_boosts' / Int32ul,
+            'boosts' / Int32ul,
+            'gift_boosts' / If(this.flags.has_gift_boosts, Int32ul),
+            'next_level_boosts' / If(this.flags.has_next_level_boosts, Int32ul),
+            'premium_audience' / If(this.flags.has_premium_audience, self.struct_0xcbce2fe0()),
+            'boost_url' / TString,
+            'prepaid_giveaways' / If(this.flags.has_prepaid_giveaways, self.vector(self.stories_prepaid_giveaway_structures('prepaid_giveaways'), 'prepaid_giveaways')),
+            'my_boost_slots' / If(this.flags.is_my_boost, self.vector(Int32ul, 'my_boost_slots')))
+
+    @constructor(0x50cd067c, 'stories_stats_story_stats')
+    def struct_0x50cd067c(self):
+        return (
+            'views_graph' / self.stats_graph_structures('views_graph'),
+            'reactions_by_emotion_graph' / self.stats_graph_structures('reactions_by_emotion_graph'))
+
+    @constructor(0x535983c3, 'stories_get_peer_max_ids')
+    def struct_0x535983c3(self):
+        return ['id' / self.vector(self.input_peer_structures('id'), 'id')]
+
+    @constructor(0x5774ca74, 'stories_get_stories_by_id')
+    def struct_0x5774ca74(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0x57bbd166, 'stories_activate_stealth_mode')
+    def struct_0x57bbd166(self):
+        return Struct(
+            'sname' / Computed('stories_activate_stealth_mode'),
+            'signature' / Hex(Const(0x57bbd166, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_past=1,
+                                is_future=2))
+
+    @constructor(0x5821a5dc, 'stories_get_pinned_stories')
+    def struct_0x5821a5dc(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'offset_id' / Int32ul,
+            'limit' / Int32ul)
+
+    @constructor(0x5dd8c3c8, 'stories_stories')
+    def struct_0x5dd8c3c8(self):
+        return (
+            'count' / Int32ul,
+            'stories' / self.vector(self.story_item_structures('stories'), 'stories'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x60f67660, 'stories_premium_get_boosts_list')
+    def struct_0x60f67660(self):
+        return Struct(
+            'sname' / Computed('stories_premium_get_boosts_list'),
+            'signature' / Hex(Const(0x60f67660, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_gifts=1),
+            'peer' / self.input_peer_structures('peer'),
+            'offset' / TString,
+            'limit' / Int32ul)
+
+    @constructor(0x63c3dd0a, 'stories_stories')
+    def struct_0x63c3dd0a(self):
+        return Struct(
+            'sname' / Computed('stories_stories'),
+            'signature' / Hex(Const(0x63c3dd0a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_pinned_to_top=1),
+            'count' / Int32ul,
+            'stories' / self.vector(self.story_item_structures('stories'), 'stories'),
+            'pinned_to_top' / If(this.flags.has_pinned_to_top, self.vector(Int32ul, 'pinned_to_top')),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x6b7da746, 'stories_premium_apply_boost')
+    def struct_0x6b7da746(self):
+        return Struct(
+            'sname' / Computed('stories_premium_apply_boost'),
+            'signature' / Hex(Const(0x6b7da746, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_slots=1),
+            'slots' / If(this.flags.has_slots, self.vector(Int32ul, 'slots')),
+            'peer' / self.input_peer_structures('peer'))
+
+    @constructor(0x7b8def20, 'stories_export_story_link')
+    def struct_0x7b8def20(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul)
+
+    @constructor(0x7ed23c57, 'stories_get_story_views_list')
+    def struct_0x7ed23c57(self):
+        return Struct(
+            'sname' / Computed('stories_get_story_views_list'),
+            'signature' / Hex(Const(0x7ed23c57, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_just_contacts=1,
+                                is_reactions_first=4,
+                                is_forwards_first=8,
+                                has_q=2),
+            'peer' / self.input_peer_structures('peer'),
+            'q' / If(this.flags.has_q, TString),
+            'id' / Int32ul,
+            'offset' / TString,
+            'limit' / Int32ul)
+
+    @constructor(0x7fd736b2, 'stories_send_reaction')
+    def struct_0x7fd736b2(self):
+        return Struct(
+            'sname' / Computed('stories_send_reaction'),
+            'signature' / Hex(Const(0x7fd736b2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_add_to_recent=1),
+            'peer' / self.input_peer_structures('peer'),
+            'story_id' / Int32ul,
+            'reaction' / self.reaction_structures('reaction'))
+
+    @constructor(0x86f8613c, 'stories_premium_boosts_list')
+    def struct_0x86f8613c(self):
+        return Struct(
+            'sname' / Computed('stories_premium_boosts_list'),
+            'signature' / Hex(Const(0x86f8613c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'count' / Int32ul,
+            'boosts' / self.vector(self.stories_boost_structures('boosts'), 'boosts'),
+            'next_offset' / If(this.flags.has_next_offset, TString),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x9a75a1ef, 'stories_toggle_pinned')
+    def struct_0x9a75a1ef(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'),
+            'pinned' / TBool)
+
+    @constructor(0x9ae228e2, 'stories_premium_my_boosts')
+    def struct_0x9ae228e2(self):
+        return (
+            'my_boosts' / self.vector(self.struct_0xc448415c(), 'my_boosts'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0x9b5ae7f9, 'stories_get_all_read_peer_stories')
+    def struct_0x9b5ae7f9(self):
+        return []
+
+    @constructor(0xa556dac8, 'stories_read_stories')
+    def struct_0xa556dac8(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'max_id' / Int32ul)
+
+    @constructor(0xa56a8b60, 'stories_get_chats_to_send')
+    def struct_0xa56a8b60(self):
+        return []
+
+    @constructor(0xae59db5f, 'stories_delete_stories')
+    def struct_0xae59db5f(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0xb2028afb, 'stories_increment_story_views')
+    def struct_0xb2028afb(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'id' / self.vector(Int32ul, 'id'))
+
+    @constructor(0xb4352016, 'stories_get_stories_archive')
+    def struct_0xb4352016(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'offset_id' / Int32ul,
+            'limit' / Int32ul)
+
+    @constructor(0xb583ba46, 'stories_edit_story')
+    def struct_0xb583ba46(self):
+        return Struct(
+            'sname' / Computed('stories_edit_story'),
+            'signature' / Hex(Const(0xb583ba46, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_media=1,
+                                has_media_areas=8,
+                                has_caption=2,
+                                has_privacy_rules=4),
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul,
+            'media' / If(this.flags.has_media, self.input_media_structures('media')),
+            'media_areas' / If(this.flags.has_media_areas, self.vector(self.stories_media_area_structures('media_areas'), 'media_areas')),
+            'caption' / If(this.flags.has_caption, TString),
+            'entities' / If(this.flags.has_caption, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'privacy_rules' / If(this.flags.has_privacy_rules, self.vector(self.input_privacy_rule_structures('privacy_rules'), 'privacy_rules')))
+
+    @constructor(0xb9b2881f, 'stories_get_story_reactions_list')
+    def struct_0xb9b2881f(self):
+        return Struct(
+            'sname' / Computed('stories_get_story_reactions_list'),
+            'signature' / Hex(Const(0xb9b2881f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_forwards_first=4,
+                                has_reaction=1,
+                                has_offset=2),
+            'peer' / self.input_peer_structures('peer'),
+            'id' / Int32ul,
+            'reaction' / If(this.flags.has_reaction, self.reaction_structures('reaction')),
+            'offset' / If(this.flags.has_offset, TString),
+            'limit' / Int32ul)
+
+    @constructor(0xbd0415c4, 'stories_toggle_peer_stories_hidden')
+    def struct_0xbd0415c4(self):
+        return (
+            'peer' / self.input_peer_structures('peer'),
+            'hidden' / TBool)
+
+    @constructor(0xc448415c, 'stories_my_boost')
+    def struct_0xc448415c(self):
+        return Struct(
+            'sname' / Computed('stories_my_boost'),
+            'signature' / Hex(Const(0xc448415c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_peer=1,
+                                has_cooldown_until_date=2),
+            'slot' / Int32ul,
+            'peer' / If(this.flags.has_peer, self.peer_structures('peer')),
+            'date' / TTimestamp,
+            'expires' / Int32ul,
+            'cooldown_until_date' / If(this.flags.has_cooldown_until_date, TTimestamp))
+
+    @constructor(0xc7dfdfdd, 'stories_can_send_story')
+    def struct_0xc7dfdfdd(self):
+        return ['peer' / self.input_peer_structures('peer')]
+
+    @constructor(0xcae68768, 'stories_peer_stories')
+    def struct_0xcae68768(self):
+        return (
+            'stories' / self.stories_peer_stories_structures('stories'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xd1810907, 'stories_search_posts')
+    def struct_0xd1810907(self):
+        return Struct(
+            'sname' / Computed('stories_search_posts'),
+            'signature' / Hex(Const(0xd1810907, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_hashtag=1,
+                                has_area=2,
+                                has_peer=4),
+            'hashtag' / If(this.flags.has_hashtag, TString),
+            'area' / If(this.flags.has_area, self.stories_media_area_structures('area')),
+            'peer' / If(this.flags.has_peer, self.input_peer_structures('peer')),
+            'offset' / TString,
+            'limit' / Int32ul)
+
+    @constructor(0xde9eed1d, 'stories_story_views')
+    def struct_0xde9eed1d(self):
+        return (
+            'views' / self.vector(self.story_views_structures('views'), 'views'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xe2de7737, 'stories_found_stories')
+    def struct_0xe2de7737(self):
+        return Struct(
+            'sname' / Computed('stories_found_stories'),
+            'signature' / Hex(Const(0xe2de7737, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'count' / Int32ul,
+            'stories' / self.vector(self.struct_0xe87acbc0(), 'stories'),
+            'next_offset' / If(this.flags.has_next_offset, TString),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xe4e6694b, 'stories_send_story')
+    def struct_0xe4e6694b(self):
+        return Struct(
+            'sname' / Computed('stories_send_story'),
+            'signature' / Hex(Const(0xe4e6694b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=4,
+                                is_noforwards=16,
+                                is_fwd_modified=128,
+                                has_media_areas=32,
+                                has_caption=1,
+                                has_entities=2,
+                                has_period=8,
+                                has_fwd_from_id=64),
+            'peer' / self.input_peer_structures('peer'),
+            'media' / self.input_media_structures('media'),
+            'media_areas' / If(this.flags.has_media_areas, self.vector(self.stories_media_area_structures('media_areas'), 'media_areas')),
+            'caption' / If(this.flags.has_caption, TString),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'privacy_rules' / self.vector(self.input_privacy_rule_structures('privacy_rules'), 'privacy_rules'),
+            'random_id' / Int64ul,
+            'period' / If(this.flags.has_period, Int32ul),
+            'fwd_from_id' / If(this.flags.has_fwd_from_id, self.input_peer_structures('fwd_from_id')),
+            'fwd_from_story' / If(this.flags.has_fwd_from_id, Int32ul))
+
+    @constructor(0xe87acbc0, 'stories_found_story')
+    def struct_0xe87acbc0(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'story_item' / self.story_item_structures('story_item'))
+
+    @constructor(0xeeb0d625, 'stories_get_all_stories')
+    def struct_0xeeb0d625(self):
+        return Struct(
+            'sname' / Computed('stories_get_all_stories'),
+            'signature' / Hex(Const(0xeeb0d625, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_next=2,
+                                is_include_hidden=4,
+                                has_state=1),
+            'state' / If(this.flags.has_state, TString))
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stories_all_stories of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x1158fe3e, 'stories_all_stories_not_modified')
+    def struct_0x1158fe3e(self):
+        return (
+            'flags' / Int32ul,
+            'state' / TString,
+            'stealth_mode' / self.struct_0x712e27fd())
+
+    @constructor(0x6efc5e81, 'stories_all_stories')
+    def struct_0x6efc5e81(self):
+        return Struct(
+            'sname' / Computed('stories_all_stories'),
+            'signature' / Hex(Const(0x6efc5e81, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_more=1),
+            'count' / Int32ul,
+            'state' / TString,
+            'peer_stories' / self.vector(self.stories_peer_stories_structures('peer_stories'), 'peer_stories'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'stealth_mode' / self.struct_0x712e27fd())
+
+    @structures
+    def stories_all_stories_structures(self, name):
+        tag_map = {
+            0x1158fe3e: LazyBound(self.struct_0x1158fe3e),
+            0x6efc5e81: LazyBound(self.struct_0x6efc5e81)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x712e27fd, 'stories_stealth_mode')
+    def struct_0x712e27fd(self):
+        return Struct(
+            'sname' / Computed('stories_stealth_mode'),
+            'signature' / Hex(Const(0x712e27fd, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_active_until_date=1,
+                                has_cooldown_until_date=2),
+            'active_until_date' / If(this.flags.has_active_until_date, TTimestamp),
+            'cooldown_until_date' / If(this.flags.has_cooldown_until_date, TTimestamp))
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stories_boost of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x4b3e14d6, 'stories_boost')
+    def struct_0x4b3e14d6(self):
+        return Struct(
+            'sname' / Computed('stories_boost'),
+            'signature' / Hex(Const(0x4b3e14d6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_gift=2,
+                                is_giveaway=4,
+                                is_unclaimed=8,
+                                has_user_id=1,
+                                has_used_gift_slug=16,
+                                has_multiplier=32,
+                                has_stars=64),
+            'id' / TString,
+            'user_id' / If(this.flags.has_user_id, Int64ul),
+            'giveaway_msg_id' / If(this.flags.is_giveaway, Int32ul),
+            'date' / TTimestamp,
+            'expires' / Int32ul,
+            'used_gift_slug' / If(this.flags.has_used_gift_slug, TString),
+            'multiplier' / If(this.flags.has_multiplier, Int32ul),
+            'stars' / If(this.flags.has_stars, Int64ul))
+
+    @constructor(0x2a1c8c71, 'stories_boost_layer186')
+    def struct_0x2a1c8c71(self):
+        return Struct(
+            'sname' / Computed('stories_boost_layer186'),
+            'signature' / Hex(Const(0x2a1c8c71, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_gift=2,
+                                is_giveaway=4,
+                                is_unclaimed=8,
+                                has_user_id=1,
+                                has_used_gift_slug=16,
+                                has_multiplier=32),
+            'id' / TString,
+            'user_id' / If(this.flags.has_user_id, Int64ul),
+            'giveaway_msg_id' / If(this.flags.is_giveaway, Int32ul),
+            'date' / TTimestamp,
+            'expires' / Int32ul,
+            'used_gift_slug' / If(this.flags.has_used_gift_slug, TString),
+            'multiplier' / If(this.flags.has_multiplier, Int32ul))
+
+    @structures
+    def stories_boost_structures(self, name):
+        tag_map = {
+            0x4b3e14d6: LazyBound(self.struct_0x4b3e14d6),
+            0x2a1c8c71: LazyBound(self.struct_0x2a1c8c71)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stories_media_area of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x37381085, 'stories_media_area_url')
+    def struct_0x37381085(self):
+        return (
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'url' / TString)
+
+    @constructor(0x5787686d, 'stories_media_area_star_gift')
+    def struct_0x5787686d(self):
+        return (
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'slug' / TString)
+
+    @constructor(0xbe82db9c, 'stories_media_area_venue')
+    def struct_0xbe82db9c(self):
+        return (
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'geo' / self.geo_point_structures('geo'),
+            'title' / TString,
+            'address' / TString,
+            'provider' / TString,
+            'venue_id' / TString,
+            'venue_type' / TString)
+
+    @constructor(0xcad5452d, 'stories_media_area_geo_point')
+    def struct_0xcad5452d(self):
+        return Struct(
+            'sname' / Computed('stories_media_area_geo_point'),
+            'signature' / Hex(Const(0xcad5452d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_address=1),
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'geo' / self.geo_point_structures('geo'),
+            'address' / If(this.flags.has_address, self.struct_0xde4c5d93()))
+
+    @constructor(0xdf8b3b22, 'stories_media_area_geo_point_layer181')
+    def struct_0xdf8b3b22(self):
+        return (
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'geo' / self.geo_point_structures('geo'))
+
+    @constructor(0x14455871, 'stories_media_area_suggested_reaction')
+    def struct_0x14455871(self):
+        return Struct(
+            'sname' / Computed('stories_media_area_suggested_reaction'),
+            'signature' / Hex(Const(0x14455871, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_dark=1,
+                                is_flipped=2),
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'reaction' / self.reaction_structures('reaction'))
+
+    @constructor(0x770416af, 'stories_media_area_channel_post')
+    def struct_0x770416af(self):
+        return (
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'channel_id' / Int64ul,
+            'msg_id' / Int32ul)
+
+    @constructor(0xb282217f, 'stories_input_media_area_venue')
+    def struct_0xb282217f(self):
+        return (
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'query_id' / Int64ul,
+            'result_id' / TString)
+
+    @constructor(0x2271f2bf, 'stories_input_media_area_channel_post')
+    def struct_0x2271f2bf(self):
+        return (
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'channel' / self.input_channel_structures('channel'),
+            'msg_id' / Int32ul)
+
+    @constructor(0x49a6549c, 'stories_media_area_weather')
+    def struct_0x49a6549c(self):
+        return (
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'emoji' / TString,
+            'temperature_c' / Double,
+            'color' / Int32ul)
+
+    @constructor(0x4386f849, 'stories_media_area_weather_old')
+    def struct_0x4386f849(self):
+        return Struct(
+            'sname' / Computed('stories_media_area_weather_old'),
+            'signature' / Hex(Const(0x4386f849, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_dark=1),
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'emoji' / TString,
+            'temperature_c' / Double)
+
+    @constructor(0x855f223e, 'stories_media_area_weather2')
+    def struct_0x855f223e(self):
+        return Struct(
+            'sname' / Computed('stories_media_area_weather2'),
+            'signature' / Hex(Const(0x855f223e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_dark=1),
+            'coordinates' / self.stories_media_area_coordinates_structures('coordinates'),
+            'emoji' / TString,
+            'temperature_c' / Int32ul)
+
+    @structures
+    def stories_media_area_structures(self, name):
+        tag_map = {
+            0x37381085: LazyBound(self.struct_0x37381085),
+            0x5787686d: LazyBound(self.struct_0x5787686d),
+            0xbe82db9c: LazyBound(self.struct_0xbe82db9c),
+            0xcad5452d: LazyBound(self.struct_0xcad5452d),
+            0xdf8b3b22: LazyBound(self.struct_0xdf8b3b22),
+            0x14455871: LazyBound(self.struct_0x14455871),
+            0x770416af: LazyBound(self.struct_0x770416af),
+            0xb282217f: LazyBound(self.struct_0xb282217f),
+            0x2271f2bf: LazyBound(self.struct_0x2271f2bf),
+            0x49a6549c: LazyBound(self.struct_0x49a6549c),
+            0x4386f849: LazyBound(self.struct_0x4386f849),
+            0x855f223e: LazyBound(self.struct_0x855f223e)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xde4c5d93, 'stories_geo_point_address')
+    def struct_0xde4c5d93(self):
+        return Struct(
+            'sname' / Computed('stories_geo_point_address'),
+            'signature' / Hex(Const(0xde4c5d93, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_state=1,
+                                has_city=2,
+                                has_street=4),
+            'country_iso2' / TString,
+            'state' / If(this.flags.has_state, TString),
+            'city' / If(this.flags.has_city, TString),
+            'street' / If(this.flags.has_street, TString))
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stories_media_area_coordinates of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xcfc9e002, 'stories_media_area_coordinates')
+    def struct_0xcfc9e002(self):
+        return Struct(
+            'sname' / Computed('stories_media_area_coordinates'),
+            'signature' / Hex(Const(0xcfc9e002, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_radius=1),
+            'x' / Double,
+            'y' / Double,
+            'w' / Double,
+            'h' / Double,
+            'rotation' / Double,
+            'radius' / If(this.flags.has_radius, Double))
+
+    @constructor(0x03d1ea4e, 'stories_media_area_coordinates_layer181')
+    def struct_0x03d1ea4e(self):
+        return (
+            'x' / Double,
+            'y' / Double,
+            'w' / Double,
+            'h' / Double,
+            'rotation' / Double)
+
+    @structures
+    def stories_media_area_coordinates_structures(self, name):
+        tag_map = {
+            0xcfc9e002: LazyBound(self.struct_0xcfc9e002),
+            0x03d1ea4e: LazyBound(self.struct_0x03d1ea4e)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stories_peer_stories of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x9a35e999, 'stories_peer_stories')
+    def struct_0x9a35e999(self):
+        return Struct(
+            'sname' / Computed('stories_peer_stories'),
+            'signature' / Hex(Const(0x9a35e999, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_max_read_id=1),
+            'peer' / self.peer_structures('peer'),
+            'max_read_id' / If(this.flags.has_max_read_id, Int32ul),
+            'stories' / self.vector(self.story_item_structures('stories'), 'stories'))
+
+    @constructor(0x8611a200, 'stories_peer_stories_layer162')
+    def struct_0x8611a200(self):
+        return Struct(
+            'sname' / Computed('stories_peer_stories_layer162'),
+            'signature' / Hex(Const(0x8611a200, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_max_read_id=1),
+            'peer_user_id' / Int64ul,
+            'max_read_id' / If(this.flags.has_max_read_id, Int32ul),
+            'stories' / self.vector(self.story_item_structures('stories'), 'stories'))
+
+    @structures
+    def stories_peer_stories_structures(self, name):
+        tag_map = {
+            0x9a35e999: LazyBound(self.struct_0x9a35e999),
+            0x8611a200: LazyBound(self.struct_0x8611a200)
+        }
+        return TLUnion(name, tag_map)
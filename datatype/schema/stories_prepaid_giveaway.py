@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group stories_prepaid_giveaway of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xb2539d54, 'stories_prepaid_giveaway')
+    def struct_0xb2539d54(self):
+        return (
+            'id' / Int64ul,
+            'months' / Int32ul,
+            'quantity' / Int32ul,
+            'date' / TTimestamp)
+
+    @constructor(0x9a9d77e0, 'stories_prepaid_stars_giveaway')
+    def struct_0x9a9d77e0(self):
+        return (
+            'id' / Int64ul,
+            'stars' / Int64ul,
+            'quantity' / Int32ul,
+            'boosts' / Int32ul,
+            'date' / TTimestamp)
+
+    @structures
+    def stories_prepaid_giveaway_structures(self, name):
+        tag_map = {
+            0xb2539d54: LazyBound(self.struct_0xb2539d54),
+            0x9a9d77e0: LazyBound(self.struct_0x9a9d77e0)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group story of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xaa5f789c, 'story_reactions_list')
+    def struct_0xaa5f789c(self):
+        return Struct(
+            'sname' / Computed('story_reactions_list'),
+            'signature' / Hex(Const(0xaa5f789c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'count' / Int32ul,
+            'reactions' / self.vector(self.story_reaction_structures('reactions'), 'reactions'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'next_offset' / If(this.flags.has_next_offset, TString))
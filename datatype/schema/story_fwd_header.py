@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group story_fwd_header of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xb826e150, 'story_fwd_header')
+    def struct_0xb826e150(self):
+        return Struct(
+            'sname' / Computed('story_fwd_header'),
+            'signature' / Hex(Const(0xb826e150, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_modified=8,
+                                has_from=1,
+                                has_from_name=2,
+                                has_story_id=4),
+            'from' / If(this.flags.has_from, self.peer_structures('from')),
+            'from_name' / If(this.flags.has_from_name, TString),
+            'story_id' / If(this.flags.has_story_id, Int32ul))
+
+    @structures
+    def story_fwd_header_structures(self, name):
+        tag_map = {
+            0xb826e150: LazyBound(self.struct_0xb826e150)
+        }
+        return TLUnion(name, tag_map)
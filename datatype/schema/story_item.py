@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group story_item of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x79b26a24, 'story_item')
+    def struct_0x79b26a24(self):
+        return Struct(
+            'sname' / Computed('story_item'),
+            'signature' / Hex(Const(0x79b26a24, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=32,
+                                is_public=128,
+                                is_close_friends=256,
+                                is_min=512,
+                                is_noforwards=1024,
+                                is_edited=2048,
+                                is_contacts=4096,
+                                is_selected_contacts=8192,
+                                is_out=65536,
+                                has_from_id=262144,
+                                has_fwd_from=131072,
+                                has_caption=1,
+                                has_entities=2,
+                                has_media_areas=16384,
+                                has_privacy=4,
+                                has_views=8,
+                                has_sent_reaction=32768),
+            'id' / Int32ul,
+            'date' / TTimestamp,
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'fwd_from' / If(this.flags.has_fwd_from, self.story_fwd_header_structures('fwd_from')),
+            'expire_date' / TTimestamp,
+            'caption' / If(this.flags.has_caption, TString),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'media' / self.message_media_structures('media'),
+            'media_areas' / If(this.flags.has_media_areas, self.vector(self.stories_media_area_structures('media_areas'), 'media_areas')),
+            'privacy' / If(this.flags.has_privacy, self.vector(self.privacy_rule_structures('privacy'), 'privacy')),
+            'views' / If(this.flags.has_views, self.story_views_structures('views')),
+            'sent_reaction' / If(this.flags.has_sent_reaction, self.reaction_structures('sent_reaction')))
+
+    @constructor(0xaf6365a1, 'story_item_layer174')
+    def struct_0xaf6365a1(self):
+        return Struct(
+            'sname' / Computed('story_item_layer174'),
+            'signature' / Hex(Const(0xaf6365a1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=32,
+                                is_public=128,
+                                is_close_friends=256,
+                                is_min=512,
+                                is_noforwards=1024,
+                                is_edited=2048,
+                                is_contacts=4096,
+                                is_selected_contacts=8192,
+                                is_out=65536,
+                                has_fwd_from=131072,
+                                has_caption=1,
+                                has_entities=2,
+                                has_media_areas=16384,
+                                has_privacy=4,
+                                has_views=8,
+                                has_sent_reaction=32768),
+            'id' / Int32ul,
+            'date' / TTimestamp,
+            'fwd_from' / If(this.flags.has_fwd_from, self.story_fwd_header_structures('fwd_from')),
+            'expire_date' / TTimestamp,
+            'caption' / If(this.flags.has_caption, TString),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'media' / self.message_media_structures('media'),
+            'media_areas' / If(this.flags.has_media_areas, self.vector(self.stories_media_area_structures('media_areas'), 'media_areas')),
+            'privacy' / If(this.flags.has_privacy, self.vector(self.privacy_rule_structures('privacy'), 'privacy')),
+            'views' / If(this.flags.has_views, self.story_views_structures('views')),
+            'sent_reaction' / If(this.flags.has_sent_reaction, self.reaction_structures('sent_reaction')))
+
+    @constructor(0x44c457ce, 'story_item_layer166')
+    def struct_0x44c457ce(self):
+        return Struct(
+            'sname' / Computed('story_item_layer166'),
+            'signature' / Hex(Const(0x44c457ce, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=32,
+                                is_public=128,
+                                is_close_friends=256,
+                                is_min=512,
+                                is_noforwards=1024,
+                                is_edited=2048,
+                                is_contacts=4096,
+                                is_selected_contacts=8192,
+                                is_out=65536,
+                                has_caption=1,
+                                has_entities=2,
+                                has_media_areas=16384,
+                                has_privacy=4,
+                                has_views=8,
+                                has_sent_reaction=32768),
+            'id' / Int32ul,
+            'date' / TTimestamp,
+            'expire_date' / TTimestamp,
+            'caption' / If(this.flags.has_caption, TString),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'media' / self.message_media_structures('media'),
+            'media_areas' / If(this.flags.has_media_areas, self.vector(self.stories_media_area_structures('media_areas'), 'media_areas')),
+            'privacy' / If(this.flags.has_privacy, self.vector(self.privacy_rule_structures('privacy'), 'privacy')),
+            'views' / If(this.flags.has_views, self.story_views_structures('views')),
+            'sent_reaction' / If(this.flags.has_sent_reaction, self.reaction_structures('sent_reaction')))
+
+    @constructor(0x562aa637, 'story_item_layer160')
+    def struct_0x562aa637(self):
+        return Struct(
+            'sname' / Computed('story_item_layer160'),
+            'signature' / Hex(Const(0x562aa637, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=32,
+                                is_public=128,
+                                is_close_friends=256,
+                                is_min=512,
+                                is_noforwards=1024,
+                                is_edited=2048,
+                                is_contacts=4096,
+                                is_selected_contacts=8192,
+                                has_caption=1,
+                                has_entities=2,
+                                has_privacy=4,
+                                has_views=8),
+            'id' / Int32ul,
+            'date' / TTimestamp,
+            'expire_date' / TTimestamp,
+            'caption' / If(this.flags.has_caption, TString),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'media' / self.message_media_structures('media'),
+            'privacy' / If(this.flags.has_privacy, self.vector(self.privacy_rule_structures('privacy'), 'privacy')),
+            'views' / If(this.flags.has_views, self.story_views_structures('views')))
+
+    @constructor(0x51e6ee4f, 'story_item_deleted')
+    def struct_0x51e6ee4f(self):
+        return ['id' / Int32ul]
+
+    @constructor(0xffadc913, 'story_item_skipped')
+    def struct_0xffadc913(self):
+        return Struct(
+            'sname' / Computed('story_item_skipped'),
+            'signature' / Hex(Const(0xffadc913, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_close_friends=256),
+            'id' / Int32ul,
+            'date' / TTimestamp,
+            'expire_date' / TTimestamp)
+
+    @structures
+    def story_item_structures(self, name):
+        tag_map = {
+            0x79b26a24: LazyBound(self.struct_0x79b26a24),
+            0xaf6365a1: LazyBound(self.struct_0xaf6365a1),
+            0x44c457ce: LazyBound(self.struct_0x44c457ce),
+            0x562aa637: LazyBound(self.struct_0x562aa637),
+            0x51e6ee4f: LazyBound(self.struct_0x51e6ee4f),
+            0xffadc913: LazyBound(self.struct_0xffadc913)
+        }
+        return TLUnion(name, tag_map)
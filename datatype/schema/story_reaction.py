@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group story_reaction of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x6090d6d5, 'story_reaction')
+    def struct_0x6090d6d5(self):
+        return (
+            'peer_id' / self.peer_structures('peer_id'),
+            'date' / TTimestamp,
+            'reaction' / self.reaction_structures('reaction'))
+
+    @constructor(0xbbab2643, 'story_reaction_public_forward')
+    def struct_0xbbab2643(self):
+        return ['message' / self.message_structures('message')]
+
+    @constructor(0xcfcd0f13, 'story_reaction_public_repost')
+    def struct_0xcfcd0f13(self):
+        return (
+            'peer_id' / self.peer_structures('peer_id'),
+            'story' / self.story_item_structures('story'))
+
+    @structures
+    def story_reaction_structures(self, name):
+        tag_map = {
+            0x6090d6d5: LazyBound(self.struct_0x6090d6d5),
+            0xbbab2643: LazyBound(self.struct_0xbbab2643),
+            0xcfcd0f13: LazyBound(self.struct_0xcfcd0f13)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group story_view of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xb0bdeac5, 'story_view')
+    def struct_0xb0bdeac5(self):
+        return Struct(
+            'sname' / Computed('story_view'),
+            'signature' / Hex(Const(0xb0bdeac5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_blocked_my_stories_from=2,
+                                has_reaction=4),
+            'user_id' / Int64ul,
+            'date' / TTimestamp,
+            'reaction' / If(this.flags.has_reaction, self.reaction_structures('reaction')))
+
+    @constructor(0x9083670b, 'story_view_public_forward')
+    def struct_0x9083670b(self):
+        return Struct(
+            'sname' / Computed('story_view_public_forward'),
+            'signature' / Hex(Const(0x9083670b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_blocked_my_stories_from=2),
+            'message' / self.message_structures('message'))
+
+    @constructor(0xbd74cf49, 'story_view_public_repost')
+    def struct_0xbd74cf49(self):
+        return Struct(
+            'sname' / Computed('story_view_public_repost'),
+            'signature' / Hex(Const(0xbd74cf49, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_blocked_my_stories_from=2),
+            'peer_id' / self.peer_structures('peer_id'),
+            'story' / self.story_item_structures('story'))
+
+    @structures
+    def story_view_structures(self, name):
+        tag_map = {
+            0xb0bdeac5: LazyBound(self.struct_0xb0bdeac5),
+            0x9083670b: LazyBound(self.struct_0x9083670b),
+            0xbd74cf49: LazyBound(self.struct_0xbd74cf49)
+        }
+        return TLUnion(name, tag_map)
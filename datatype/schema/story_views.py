@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group story_views of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd36760cf, 'story_views_layer160')
+    def struct_0xd36760cf(self):
+        return Struct(
+            'sname' / Computed('story_views_layer160'),
+            'signature' / Hex(Const(0xd36760cf, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_recent_viewers=1),
+            'views_count' / Int32ul,
+            'recent_viewers' / If(this.flags.has_recent_viewers, self.vector(Int64ul, 'recent_viewers')))
+
+    @constructor(0xc64c0b97, 'story_views_layer161')
+    def struct_0xc64c0b97(self):
+        return Struct(
+            'sname' / Computed('story_views_layer161'),
+            'signature' / Hex(Const(0xc64c0b97, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_recent_viewers=1),
+            'views_count' / Int32ul,
+            'reactions_count' / Int32ul,
+            'recent_viewers' / If(this.flags.has_recent_viewers, self.vector(Int64ul, 'recent_viewers')))
+
+    @constructor(0x8d595cd6, 'story_views')
+    def struct_0x8d595cd6(self):
+        return Struct(
+            'sname' / Computed('story_views'),
+            'signature' / Hex(Const(0x8d595cd6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_viewers=2,
+                                has_forwards_count=4,
+                                has_reactions=8,
+                                has_reactions_count=16,
+                                has_recent_viewers=1),
+            'views_count' / Int32ul,
+            'forwards_count' / If(this.flags.has_forwards_count, Int32ul),
+            'reactions' / If(this.flags.has_reactions, self.vector(self.reaction_count_structures('reactions'), 'reactions')),
+            'reactions_count' / If(this.flags.has_reactions_count, Int32ul),
+            'recent_viewers' / If(this.flags.has_recent_viewers, self.vector(Int64ul, 'recent_viewers')))
+
+    @structures
+    def story_views_structures(self, name):
+        tag_map = {
+            0xd36760cf: LazyBound(self.struct_0xd36760cf),
+            0xc64c0b97: LazyBound(self.struct_0xc64c0b97),
+            0x8d595cd6: LazyBound(self.struct_0x8d595cd6)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group story_views_list of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x59d78fc5, 'story_views_list')
+    def struct_0x59d78fc5(self):
+        return Struct(
+            'sname' / Computed('story_views_list'),
+            'signature' / Hex(Const(0x59d78fc5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'count' / Int32ul,
+            'views_count' / Int32ul,
+            'forwards_count' / Int32ul,
+            'reactions_count' / Int32ul,
+            'views' / self.vector(self.story_view_structures('views'), 'views'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'next_offset' / If(this.flags.has_next_offset, TString))
+
+    @constructor(0x46e9b9ec, 'story_views_list_layer167')
+    def struct_0x46e9b9ec(self):
+        return Struct(
+            'sname' / Computed('story_views_list_layer167'),
+            'signature' / Hex(Const(0x46e9b9ec, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_next_offset=1),
+            'count' / Int32ul,
+            'reactions_count' / Int32ul,
+            'views' / self.vector(self.story_view_structures('views'), 'views'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'next_offset' / If(this.flags.has_next_offset, TString))
+
+    @structures
+    def story_views_list_structures(self, name):
+        tag_map = {
+            0x59d78fc5: LazyBound(self.struct_0x59d78fc5),
+            0x46e9b9ec: LazyBound(self.struct_0x46e9b9ec)
+        }
+        return TLUnion(name, tag_map)
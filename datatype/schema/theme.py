@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group theme of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x028f1114, 'theme_layer131')
+    def struct_0x028f1114(self):
+        return Struct(
+            'sname' / Computed('theme_layer131'),
+            'signature' / Hex(Const(0x028f1114, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_default=2,
+                                has_document=4,
+                                has_setting=8),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'slug' / TString,
+            'title' / TString,
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'setting' / If(this.flags.has_setting, self.theme_settings_structures('setting')),
+            'installs_count' / Int32ul)
+
+    @constructor(0xf7d90ce0, 'theme_layer106')
+    def struct_0xf7d90ce0(self):
+        return Struct(
+            'sname' / Computed('theme_layer106'),
+            'signature' / Hex(Const(0xf7d90ce0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_default=2,
+                                has_document=4),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'slug' / TString,
+            'title' / TString,
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'installs_count' / Int32ul)
+
+    @constructor(0x483d270c, 'theme_document_not_modified_layer106')
+    def struct_0x483d270c(self):
+        return []
+
+    @constructor(0xa00e67d6, 'theme')
+    def struct_0xa00e67d6(self):
+        return Struct(
+            'sname' / Computed('theme'),
+            'signature' / Hex(Const(0xa00e67d6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_default=2,
+                                is_for_chat=32,
+                                has_document=4,
+                                has_settings=8,
+                                has_emoticon=64,
+                                has_installs_count=16),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'slug' / TString,
+            'title' / TString,
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'settings' / If(this.flags.has_settings, self.vector(self.theme_settings_structures('settings'), 'settings')),
+            'emoticon' / If(this.flags.has_emoticon, TString),
+            'installs_count' / If(this.flags.has_installs_count, Int32ul))
+
+    @constructor(0xe802b8dc, 'theme_layer133')
+    def struct_0xe802b8dc(self):
+        return Struct(
+            'sname' / Computed('theme_layer133'),
+            'signature' / Hex(Const(0xe802b8dc, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_default=2,
+                                is_for_chat=32,
+                                has_document=4,
+                                has_setting=8,
+                                has_installs_count=16),
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'slug' / TString,
+            'title' / TString,
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'setting' / If(this.flags.has_setting, self.theme_settings_structures('setting')),
+            'installs_count' / If(this.flags.has_installs_count, Int32ul))
+
+    @structures
+    def theme_structures(self, name):
+        tag_map = {
+            0x028f1114: LazyBound(self.struct_0x028f1114),
+            0xf7d90ce0: LazyBound(self.struct_0xf7d90ce0),
+            0x483d270c: LazyBound(self.struct_0x483d270c),
+            0xa00e67d6: LazyBound(self.struct_0xa00e67d6),
+            0xe802b8dc: LazyBound(self.struct_0xe802b8dc)
+        }
+        return TLUnion(name, tag_map)
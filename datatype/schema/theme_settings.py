@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group theme_settings of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xfa58b6d4, 'theme_settings')
+    def struct_0xfa58b6d4(self):
+        return Struct(
+            'sname' / Computed('theme_settings'),
+            'signature' / Hex(Const(0xfa58b6d4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_message_colors_animated=4,
+                                has_outbox_accent_color=8,
+                                has_message_colors=1,
+                                has_wallpaper=2),
+            'base_theme' / self.base_theme_structures('base_theme'),
+            'accent_color' / Int32ul,
+            'outbox_accent_color' / If(this.flags.has_outbox_accent_color, Int32ul),
+            'message_colors' / If(this.flags.has_message_colors, self.vector(Int32ul, 'message_colors')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')))
+
+    @constructor(0x8db4e76c, 'theme_settings_layer132')
+    def struct_0x8db4e76c(self):
+        return Struct(
+            'sname' / Computed('theme_settings_layer132'),
+            'signature' / Hex(Const(0x8db4e76c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_message_colors_animated=4,
+                                has_message_colors=1,
+                                has_wallpaper=2),
+            'base_theme' / self.base_theme_structures('base_theme'),
+            'accent_color' / Int32ul,
+            'message_colors' / If(this.flags.has_message_colors, self.vector(Int32ul, 'message_colors')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')))
+
+    @constructor(0x9c14984a, 'theme_settings_layer131')
+    def struct_0x9c14984a(self):
+        return Struct(
+            'sname' / Computed('theme_settings_layer131'),
+            'signature' / Hex(Const(0x9c14984a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_message_color=1,
+                                has_wallpaper=2),
+            'base_theme' / self.base_theme_structures('base_theme'),
+            'accent_color' / Int32ul,
+            'message_top_color' / If(this.flags.has_message_color, Int32ul),
+            'message_bottom_color' / If(this.flags.has_message_color, Int32ul),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')))
+
+    @structures
+    def theme_settings_structures(self, name):
+        tag_map = {
+            0xfa58b6d4: LazyBound(self.struct_0xfa58b6d4),
+            0x8db4e76c: LazyBound(self.struct_0x8db4e76c),
+            0x9c14984a: LazyBound(self.struct_0x9c14984a)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group top_peer_category of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x161d9628, 'top_peer_category_channels')
+    def struct_0x161d9628(self):
+        return []
+
+    @constructor(0x1e76a78c, 'top_peer_category_phone_calls')
+    def struct_0x1e76a78c(self):
+        return []
+
+    @constructor(0xbd17a14a, 'top_peer_category_groups')
+    def struct_0xbd17a14a(self):
+        return []
+
+    @constructor(0x148677e2, 'top_peer_category_bots_inline')
+    def struct_0x148677e2(self):
+        return []
+
+    @constructor(0xa8406ca9, 'top_peer_category_forward_users')
+    def struct_0xa8406ca9(self):
+        return []
+
+    @constructor(0xfbeec0f0, 'top_peer_category_forward_chats')
+    def struct_0xfbeec0f0(self):
+        return []
+
+    @constructor(0xab661b5b, 'top_peer_category_bots_pm')
+    def struct_0xab661b5b(self):
+        return []
+
+    @constructor(0x0637b7ed, 'top_peer_category_correspondents')
+    def struct_0x0637b7ed(self):
+        return []
+
+    @constructor(0xfd9e7bec, 'top_peer_category_bots_app')
+    def struct_0xfd9e7bec(self):
+        return []
+
+    @structures
+    def top_peer_category_structures(self, name):
+        tag_map = {
+            0x161d9628: LazyBound(self.struct_0x161d9628),
+            0x1e76a78c: LazyBound(self.struct_0x1e76a78c),
+            0xbd17a14a: LazyBound(self.struct_0xbd17a14a),
+            0x148677e2: LazyBound(self.struct_0x148677e2),
+            0xa8406ca9: LazyBound(self.struct_0xa8406ca9),
+            0xfbeec0f0: LazyBound(self.struct_0xfbeec0f0),
+            0xab661b5b: LazyBound(self.struct_0xab661b5b),
+            0x0637b7ed: LazyBound(self.struct_0x0637b7ed),
+            0xfd9e7bec: LazyBound(self.struct_0xfd9e7bec)
+        }
+        return TLUnion(name, tag_map)
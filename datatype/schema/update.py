@@ -0,0 +1,1130 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group update of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x24f40e77, 'update_message_poll_vote')
+    def struct_0x24f40e77(self):
+        return (
+            'poll_id' / Int64ul,
+            'peer' / self.peer_structures('peer'),
+            'options' / self.vector(TBytes, 'options'),
+            'qts' / Int32ul)
+
+    @constructor(0xd5a41724, 'update_message_extended_media')
+    def struct_0xd5a41724(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'extended_media' / self.vector(self.message_extended_media_structures('extended_media'), 'extended_media'))
+
+    @constructor(0xaca1657b, 'update_message_poll')
+    def struct_0xaca1657b(self):
+        return Struct(
+            'sname' / Computed('update_message_poll'),
+            'signature' / Hex(Const(0xaca1657b, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_poll=1),
+            'poll_id' / Int64ul,
+            'poll' / If(this.flags.has_poll, self.poll_structures('poll')),
+            'results' / self.poll_results_structures('results'))
+
+    @constructor(0xbb9bb9a5, 'update_peer_history_ttl')
+    def struct_0xbb9bb9a5(self):
+        return Struct(
+            'sname' / Computed('update_peer_history_ttl'),
+            'signature' / Hex(Const(0xbb9bb9a5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_ttl_period=1),
+            'peer' / self.peer_structures('peer'),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0xf89a6a4e, 'update_chat')
+    def struct_0xf89a6a4e(self):
+        return ['chat_id' / Int64ul]
+
+    @constructor(0xa20db0e5, 'update_delete_messages')
+    def struct_0xa20db0e5(self):
+        return (
+            'messages' / self.vector(Int32ul, 'messages'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0x5bb98608, 'update_pinned_channel_messages')
+    def struct_0x5bb98608(self):
+        return Struct(
+            'sname' / Computed('update_pinned_channel_messages'),
+            'signature' / Hex(Const(0x5bb98608, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=1),
+            'channel_id' / Int64ul,
+            'messages' / self.vector(Int32ul, 'messages'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0xf2ebdb4e, 'update_group_call_participants')
+    def struct_0xf2ebdb4e(self):
+        return (
+            'call' / self.struct_0xd8aa840f(),
+            'participants' / self.vector(self.struct_0xeba636fe(), 'participants'),
+            'version' / Int32ul)
+
+    @constructor(0x571d2742, 'update_read_featured_stickers')
+    def struct_0x571d2742(self):
+        return []
+
+    @constructor(0x1710f156, 'update_encrypted_chat_typing')
+    def struct_0x1710f156(self):
+        return ['chat_id' / Int32ul]
+
+    @constructor(0xd6b19546, 'update_read_channel_discussion_inbox')
+    def struct_0xd6b19546(self):
+        return Struct(
+            'sname' / Computed('update_read_channel_discussion_inbox'),
+            'signature' / Hex(Const(0xd6b19546, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_broadcast_id=1),
+            'channel_id' / Int64ul,
+            'top_msg_id' / Int32ul,
+            'read_max_id' / Int32ul,
+            'broadcast_id' / If(this.flags.has_broadcast_id, Int64ul),
+            'broadcast_post' / If(this.flags.has_broadcast_id, Int32ul))
+
+    @constructor(0x2f2f21bf, 'update_read_history_outbox')
+    def struct_0x2f2f21bf(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'max_id' / Int32ul,
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0x62ba04d9, 'update_new_channel_message')
+    def struct_0x62ba04d9(self):
+        return (
+            'message' / self.message_structures('message'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0x1592b79d, 'update_web_view_result_sent')
+    def struct_0x1592b79d(self):
+        return ['query_id' / Int64ul]
+
+    @constructor(0x6e6fe51c, 'update_dialog_pinned')
+    def struct_0x6e6fe51c(self):
+        return Struct(
+            'sname' / Computed('update_dialog_pinned'),
+            'signature' / Hex(Const(0x6e6fe51c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=1,
+                                has_folder_id=2),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'peer' / self.dialog_peer_structures('peer'))
+
+    @constructor(0x6a7e7366, 'update_peer_settings')
+    def struct_0x6a7e7366(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'settings' / self.peer_settings_structures('settings'))
+
+    @constructor(0x05492a13, 'update_user_phone')
+    def struct_0x05492a13(self):
+        return (
+            'user_id' / Int64ul,
+            'phone' / TString)
+
+    @constructor(0x4e90bfd6, 'update_message_id')
+    def struct_0x4e90bfd6(self):
+        return (
+            'id' / Int32ul,
+            'random_id' / Int64ul)
+
+    @constructor(0xb75f99a9, 'update_read_channel_outbox')
+    def struct_0xb75f99a9(self):
+        return (
+            'channel_id' / Int64ul,
+            'max_id' / Int32ul)
+
+    @constructor(0x8c88c923, 'update_channel_user_typing')
+    def struct_0x8c88c923(self):
+        return Struct(
+            'sname' / Computed('update_channel_user_typing'),
+            'signature' / Hex(Const(0x8c88c923, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_top_msg_id=1),
+            'channel_id' / Int64ul,
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'from_id' / self.peer_structures('from_id'),
+            'action' / self.send_message_action_structures('action'))
+
+    @constructor(0x1bf335b9, 'update_story_id')
+    def struct_0x1bf335b9(self):
+        return (
+            'id' / Int32ul,
+            'random_id' / Int64ul)
+
+    @constructor(0x31c24808, 'update_sticker_sets')
+    def struct_0x31c24808(self):
+        return Struct(
+            'sname' / Computed('update_sticker_sets'),
+            'signature' / Hex(Const(0x31c24808, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_masks=1,
+                                is_emojis=2))
+
+    @constructor(0x19360dc0, 'update_folder_peers')
+    def struct_0x19360dc0(self):
+        return (
+            'folder_peers' / self.vector(self.struct_0xe9baa668(), 'folder_peers'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0x1f2b0afd, 'update_new_message')
+    def struct_0x1f2b0afd(self):
+        return (
+            'message' / self.message_structures('message'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0x39a51dfb, 'update_new_scheduled_message')
+    def struct_0x39a51dfb(self):
+        return ['message' / self.message_structures('message')]
+
+    @constructor(0x12bcbd9a, 'update_new_encrypted_message')
+    def struct_0x12bcbd9a(self):
+        return (
+            'message' / self.encrypted_message_structures('message'),
+            'qts' / Int32ul)
+
+    @constructor(0x86fccf85, 'update_move_sticker_set_to_top')
+    def struct_0x86fccf85(self):
+        return Struct(
+            'sname' / Computed('update_move_sticker_set_to_top'),
+            'signature' / Hex(Const(0x86fccf85, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_masks=1,
+                                is_emojis=2),
+            'stickerset' / Int64ul)
+
+    @constructor(0xe5bdf8de, 'update_user_status')
+    def struct_0xe5bdf8de(self):
+        return (
+            'user_id' / Int64ul,
+            'status' / self.user_status_structures('status'))
+
+    @constructor(0x28373599, 'update_user_emoji_status')
+    def struct_0x28373599(self):
+        return (
+            'user_id' / Int64ul,
+            'emoji_status' / self.emoji_status_structures('emoji_status'))
+
+    @constructor(0xf226ac08, 'update_channel_message_views')
+    def struct_0xf226ac08(self):
+        return (
+            'channel_id' / Int64ul,
+            'id' / Int32ul,
+            'views' / Int32ul)
+
+    @constructor(0x0b783982, 'update_group_call_connection')
+    def struct_0x0b783982(self):
+        return Struct(
+            'sname' / Computed('update_group_call_connection'),
+            'signature' / Hex(Const(0x0b783982, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_presentation=1),
+            'params' / self.struct_0x7d748d04())
+
+    @constructor(0x4d712f2e, 'update_bot_commands')
+    def struct_0x4d712f2e(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'bot_id' / Int64ul,
+            'commands' / self.vector(self.struct_0xc27ac8c7(), 'commands'))
+
+    @constructor(0x871fb939, 'update_geo_live_viewed')
+    def struct_0x871fb939(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'msg_id' / Int32ul)
+
+    @constructor(0xbec268ef, 'update_notify_settings')
+    def struct_0xbec268ef(self):
+        return (
+            'peer' / self.notify_peer_structures('peer'),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'))
+
+    @constructor(0x985d3abb, 'update_channel_participant')
+    def struct_0x985d3abb(self):
+        return Struct(
+            'sname' / Computed('update_channel_participant'),
+            'signature' / Hex(Const(0x985d3abb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_via_chatlist=8,
+                                has_prev_participant=1,
+                                has_new_participant=2,
+                                has_invite=4),
+            'channel_id' / Int64ul,
+            'date' / TTimestamp,
+            'actor_id' / Int64ul,
+            'user_id' / Int64ul,
+            'prev_participant' / If(this.flags.has_prev_participant, self.channel_participant_structures('prev_participant')),
+            'new_participant' / If(this.flags.has_new_participant, self.channel_participant_structures('new_participant')),
+            'invite' / If(this.flags.has_invite, self.exported_chat_invite_structures('invite')),
+            'qts' / Int32ul)
+
+    @constructor(0x695c9e7c, 'update_read_channel_discussion_outbox')
+    def struct_0x695c9e7c(self):
+        return (
+            'channel_id' / Int64ul,
+            'top_msg_id' / Int32ul,
+            'read_max_id' / Int32ul)
+
+    @constructor(0xe32f3d77, 'update_chat_participant_delete')
+    def struct_0xe32f3d77(self):
+        return (
+            'chat_id' / Int64ul,
+            'user_id' / Int64ul,
+            'version' / Int32ul)
+
+    @constructor(0xfb4c496c, 'update_read_featured_emoji_stickers')
+    def struct_0xfb4c496c(self):
+        return []
+
+    @constructor(0xe40370a3, 'update_edit_message')
+    def struct_0xe40370a3(self):
+        return (
+            'message' / self.message_structures('message'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0x6f7863f4, 'update_recent_reactions')
+    def struct_0x6f7863f4(self):
+        return []
+
+    @constructor(0x39c67432, 'update_saved_reaction_tags')
+    def struct_0x39c67432(self):
+        return []
+
+    @constructor(0x7f891213, 'update_web_page')
+    def struct_0x7f891213(self):
+        return (
+            'webpage' / self.web_page_structures('webpage'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0xe511996d, 'update_faved_stickers')
+    def struct_0xe511996d(self):
+        return []
+
+    @constructor(0x3dda5451, 'update_chat_participant_add')
+    def struct_0x3dda5451(self):
+        return (
+            'chat_id' / Int64ul,
+            'user_id' / Int64ul,
+            'inviter_id' / Int64ul,
+            'date' / TTimestamp,
+            'version' / Int32ul)
+
+    @constructor(0x83487af0, 'update_chat_user_typing')
+    def struct_0x83487af0(self):
+        return (
+            'chat_id' / Int64ul,
+            'from_id' / self.peer_structures('from_id'),
+            'action' / self.send_message_action_structures('action'))
+
+    @constructor(0x564fe691, 'update_login_token')
+    def struct_0x564fe691(self):
+        return []
+
+    @constructor(0xb4a2e88d, 'update_encryption')
+    def struct_0xb4a2e88d(self):
+        return (
+            'chat' / self.encrypted_chat_structures('chat'),
+            'date' / TTimestamp)
+
+    @constructor(0x97d64341, 'update_group_call')
+    def struct_0x97d64341(self):
+        return Struct(
+            'sname' / Computed('update_group_call'),
+            'signature' / Hex(Const(0x97d64341, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_chat_id=1),
+            'chat_id' / If(this.flags.has_chat_id, Int64ul),
+            'call' / self.group_call_structures('call'))
+
+    @constructor(0x108d941f, 'update_channel_too_long')
+    def struct_0x108d941f(self):
+        return Struct(
+            'sname' / Computed('update_channel_too_long'),
+            'signature' / Hex(Const(0x108d941f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_pts=1),
+            'channel_id' / Int64ul,
+            'pts' / If(this.flags.has_pts, Int32ul))
+
+    @constructor(0xc01e857f, 'update_user_typing')
+    def struct_0xc01e857f(self):
+        return (
+            'user_id' / Int64ul,
+            'action' / self.send_message_action_structures('action'))
+
+    @constructor(0xf74e932b, 'stories_update_read_stories')
+    def struct_0xf74e932b(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'max_id' / Int32ul)
+
+    @constructor(0xebe46819, 'update_service_notification')
+    def struct_0xebe46819(self):
+        return Struct(
+            'sname' / Computed('update_service_notification'),
+            'signature' / Hex(Const(0xebe46819, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_popup=1,
+                                is_invert_media=4,
+                                has_inbox_date=2),
+            'inbox_date' / If(this.flags.has_inbox_date, TTimestamp),
+            'type' / TString,
+            'message' / TString,
+            'media' / self.message_media_structures('media'),
+            'entities' / self.vector(self.message_entity_structures('entities'), 'entities'))
+
+    @constructor(0x56022f4d, 'update_lang_pack')
+    def struct_0x56022f4d(self):
+        return ['difference' / self.struct_0xf385c1f6()]
+
+    @constructor(0xb23fc698, 'update_channel_available_messages')
+    def struct_0xb23fc698(self):
+        return (
+            'channel_id' / Int64ul,
+            'available_min_id' / Int32ul)
+
+    @constructor(0xd7ca61a2, 'update_chat_participant_admin')
+    def struct_0xd7ca61a2(self):
+        return (
+            'chat_id' / Int64ul,
+            'user_id' / Int64ul,
+            'is_admin' / TBool,
+            'version' / Int32ul)
+
+    @constructor(0xea29055d, 'update_channel_read_messages_contents')
+    def struct_0xea29055d(self):
+        return Struct(
+            'sname' / Computed('update_channel_read_messages_contents'),
+            'signature' / Hex(Const(0xea29055d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_top_msg_id=1),
+            'channel_id' / Int64ul,
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'messages' / self.vector(Int32ul, 'messages'))
+
+    @constructor(0xee3b272a, 'update_privacy')
+    def struct_0xee3b272a(self):
+        return (
+            'key' / self.privacy_key_structures('key'),
+            'rules' / self.vector(self.privacy_rule_structures('rules'), 'rules'))
+
+    @constructor(0xa229dd06, 'update_config')
+    def struct_0xa229dd06(self):
+        return []
+
+    @constructor(0xe16459c3, 'update_dialog_unread_mark')
+    def struct_0xe16459c3(self):
+        return Struct(
+            'sname' / Computed('update_dialog_unread_mark'),
+            'signature' / Hex(Const(0xe16459c3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unread=1),
+            'peer' / self.dialog_peer_structures('peer'))
+
+    @constructor(0x1b49ec6d, 'update_draft_message')
+    def struct_0x1b49ec6d(self):
+        return Struct(
+            'sname' / Computed('update_draft_message'),
+            'signature' / Hex(Const(0x1b49ec6d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_top_msg_id=1),
+            'peer' / self.peer_structures('peer'),
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'draft' / self.draft_message_structures('draft'))
+
+    @constructor(0x8951abef, 'update_new_authorization')
+    def struct_0x8951abef(self):
+        return Struct(
+            'sname' / Computed('update_new_authorization'),
+            'signature' / Hex(Const(0x8951abef, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_unconfirmed=1),
+            'hash' / Int64ul,
+            'date' / If(this.flags.is_unconfirmed, TTimestamp),
+            'device' / If(this.flags.is_unconfirmed, TString),
+            'location' / If(this.flags.is_unconfirmed, TString))
+
+    @constructor(0xa7848924, 'update_user_name')
+    def struct_0xa7848924(self):
+        return (
+            'user_id' / Int64ul,
+            'first_name' / TString,
+            'last_name' / TString,
+            'usernames' / self.vector(self.struct_0xb4073647(), 'usernames'))
+
+    @constructor(0x5e1b3cb8, 'update_message_reactions')
+    def struct_0x5e1b3cb8(self):
+        return Struct(
+            'sname' / Computed('update_message_reactions'),
+            'signature' / Hex(Const(0x5e1b3cb8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_top_msg_id=1),
+            'peer' / self.peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'top_msg_id' / If(this.flags.has_top_msg_id, Int32ul),
+            'reactions' / self.message_reactions_structures('reactions'))
+
+    @constructor(0xab0f6b1e, 'update_phone_call')
+    def struct_0xab0f6b1e(self):
+        return ['phone_call' / self.phone_call_structures('phone_call')]
+
+    @constructor(0x26ffde7d, 'update_dialog_filter')
+    def struct_0x26ffde7d(self):
+        return Struct(
+            'sname' / Computed('update_dialog_filter'),
+            'signature' / Hex(Const(0x26ffde7d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_filter=1),
+            'id' / Int32ul,
+            'filter' / If(this.flags.has_filter, self.dialog_filter_structures('filter')))
+
+    @constructor(0xebe07752, 'update_peer_blocked')
+    def struct_0xebe07752(self):
+        return Struct(
+            'sname' / Computed('update_peer_blocked'),
+            'signature' / Hex(Const(0xebe07752, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_blocked_my_stories_from=2),
+            'peer_id' / self.peer_structures('peer_id'))
+
+    @constructor(0xed85eab5, 'update_pinned_messages')
+    def struct_0xed85eab5(self):
+        return Struct(
+            'sname' / Computed('update_pinned_messages'),
+            'signature' / Hex(Const(0xed85eab5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=1),
+            'peer' / self.peer_structures('peer'),
+            'messages' / self.vector(Int32ul, 'messages'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0x2661bf09, 'update_phone_call_signaling_data')
+    def struct_0x2661bf09(self):
+        return (
+            'phone_call_id' / Int64ul,
+            'data' / TBytes)
+
+    @constructor(0x88617090, 'update_transcribe_audio')
+    def struct_0x88617090(self):
+        return Struct(
+            'sname' / Computed('update_transcribe_audio'),
+            'signature' / Hex(Const(0x88617090, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_final=1),
+            'transcription_id' / Int64ul,
+            'text' / TString)
+
+    @constructor(0xfa0f3ca2, 'update_pinned_dialogs')
+    def struct_0xfa0f3ca2(self):
+        return Struct(
+            'sname' / Computed('update_pinned_dialogs'),
+            'signature' / Hex(Const(0xfa0f3ca2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_folder_id=2,
+                                has_order=1),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'order' / If(this.flags.has_order, self.vector(self.dialog_peer_structures('order'), 'order')))
+
+    @constructor(0x74d8be99, 'update_saved_ringtones')
+    def struct_0x74d8be99(self):
+        return []
+
+    @constructor(0x2c084dc1, 'stories_update_stories_stealth_mode')
+    def struct_0x2c084dc1(self):
+        return ['stealth_mode' / self.struct_0x712e27fd()]
+
+    @constructor(0x0084cd5a, 'update_transcribed_audio')
+    def struct_0x0084cd5a(self):
+        return Struct(
+            'sname' / Computed('update_transcribed_audio'),
+            'signature' / Hex(Const(0x0084cd5a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pending=1),
+            'peer' / self.peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'transcription_id' / Int64ul,
+            'text' / TString)
+
+    @constructor(0xb4afcfb0, 'update_peer_located')
+    def struct_0xb4afcfb0(self):
+        return ['peers' / self.vector(self.peer_located_structures('peers'), 'peers')]
+
+    @constructor(0x9a422c20, 'update_recent_stickers')
+    def struct_0x9a422c20(self):
+        return []
+
+    @constructor(0x9c974fdf, 'update_read_history_inbox')
+    def struct_0x9c974fdf(self):
+        return Struct(
+            'sname' / Computed('update_read_history_inbox'),
+            'signature' / Hex(Const(0x9c974fdf, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_folder_id=1),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'peer' / self.peer_structures('peer'),
+            'max_id' / Int32ul,
+            'still_unread_count' / Int32ul,
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0xa5d72105, 'update_dialog_filter_order')
+    def struct_0xa5d72105(self):
+        return ['order' / self.vector(Int32ul, 'order')]
+
+    @constructor(0x9375341e, 'update_saved_gifs')
+    def struct_0x9375341e(self):
+        return []
+
+    @constructor(0x7084a7be, 'update_contacts_reset')
+    def struct_0x7084a7be(self):
+        return []
+
+    @constructor(0x635b4c09, 'update_channel')
+    def struct_0x635b4c09(self):
+        return ['channel_id' / Int64ul]
+
+    @constructor(0x2f2ba99f, 'update_channel_web_page')
+    def struct_0x2f2ba99f(self):
+        return (
+            'channel_id' / Int64ul,
+            'webpage' / self.web_page_structures('webpage'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0xf2a71983, 'update_delete_scheduled_messages')
+    def struct_0xf2a71983(self):
+        return Struct(
+            'sname' / Computed('update_delete_scheduled_messages'),
+            'signature' / Hex(Const(0xf2a71983, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_sent_messages=1),
+            'peer' / self.peer_structures('peer'),
+            'messages' / self.vector(Int32ul, 'messages'),
+            'sent_messages' / If(this.flags.has_sent_messages, self.vector(Int32ul, 'sent_messages')))
+
+    @constructor(0xd29a27f4, 'update_channel_message_forwards')
+    def struct_0xd29a27f4(self):
+        return (
+            'channel_id' / Int64ul,
+            'id' / Int32ul,
+            'forwards' / Int32ul)
+
+    @constructor(0xc32d5b12, 'update_delete_channel_messages')
+    def struct_0xc32d5b12(self):
+        return (
+            'channel_id' / Int64ul,
+            'messages' / self.vector(Int32ul, 'messages'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0x7d627683, 'update_sent_story_reaction')
+    def struct_0x7d627683(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'story_id' / Int32ul,
+            'reaction' / self.reaction_structures('reaction'))
+
+    @constructor(0xf227868c, 'update_user_photo')
+    def struct_0xf227868c(self):
+        return (
+            'user_id' / Int64ul,
+            'date' / TTimestamp,
+            'photo' / self.user_profile_photo_structures('photo'),
+            'previous' / TBool)
+
+    @constructor(0x20529438, 'update_user')
+    def struct_0x20529438(self):
+        return ['user_id' / Int64ul]
+
+    @constructor(0x17b7a20b, 'update_attach_menu_bots')
+    def struct_0x17b7a20b(self):
+        return []
+
+    @constructor(0x3504914f, 'update_dialog_filters')
+    def struct_0x3504914f(self):
+        return []
+
+    @constructor(0x30f443db, 'update_recent_emoji_statuses')
+    def struct_0x30f443db(self):
+        return []
+
+    @constructor(0x75b3b798, 'stories_update_story')
+    def struct_0x75b3b798(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'story' / self.story_item_structures('story'))
+
+    @constructor(0x7063c3db, 'update_pending_join_requests')
+    def struct_0x7063c3db(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'requests_pending' / Int32ul,
+            'recent_requesters' / self.vector(Int64ul, 'recent_requesters'))
+
+    @constructor(0x8e5e9873, 'update_dc_options')
+    def struct_0x8e5e9873(self):
+        return ['dc_options' / self.vector(self.struct_0x18b7a10d(), 'dc_options')]
+
+    @constructor(0x1b3f4df7, 'update_edit_channel_message')
+    def struct_0x1b3f4df7(self):
+        return (
+            'message' / self.message_structures('message'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul)
+
+    @constructor(0x688a30aa, 'update_new_sticker_set')
+    def struct_0x688a30aa(self):
+        return ['stickerset' / self.messages_sticker_set_structures('stickerset')]
+
+    @constructor(0x8216fba3, 'update_theme')
+    def struct_0x8216fba3(self):
+        return ['theme' / self.theme_structures('theme')]
+
+    @constructor(0x46560264, 'update_lang_pack_too_long')
+    def struct_0x46560264(self):
+        return ['lang_code' / TString]
+
+    @constructor(0x38fe25b7, 'update_encrypted_messages_read')
+    def struct_0x38fe25b7(self):
+        return (
+            'chat_id' / Int32ul,
+            'max_date' / TTimestamp,
+            'date' / TTimestamp)
+
+    @constructor(0x0bb2d201, 'update_sticker_sets_order')
+    def struct_0x0bb2d201(self):
+        return Struct(
+            'sname' / Computed('update_sticker_sets_order'),
+            'signature' / Hex(Const(0x0bb2d201, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_masks=1,
+                                is_emojis=2),
+            'order' / self.vector(Int64ul, 'order'))
+
+    @constructor(0x922e6e10, 'update_read_channel_inbox')
+    def struct_0x922e6e10(self):
+        return Struct(
+            'sname' / Computed('update_read_channel_inbox'),
+            'signature' / Hex(Const(0x922e6e10, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_folder_id=1),
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'channel_id' / Int64ul,
+            'max_id' / Int32ul,
+            'still_unread_count' / Int32ul,
+            'pts' / Int32ul)
+
+    @constructor(0xf8227181, 'update_read_messages_contents')
+    def struct_0xf8227181(self):
+        return Struct(
+            'sname' / Computed('update_read_messages_contents'),
+            'signature' / Hex(Const(0xf8227181, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_date=1),
+            'messages' / self.vector(Int32ul, 'messages'),
+            'pts' / Int32ul,
+            'pts_count' / Int32ul,
+            'date' / If(this.flags.has_date, TTimestamp))
+
+    @constructor(0x07761198, 'update_chat_participants')
+    def struct_0x07761198(self):
+        return ['participants' / self.chat_participants_structures('participants')]
+
+    @constructor(0x54c01850, 'update_chat_default_banned_rights')
+    def struct_0x54c01850(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'default_banned_rights' / self.struct_0x9f120418(),
+            'version' / Int32ul)
+
+    @constructor(0x14b85813, 'bots_update_bot_menu_button')
+    def struct_0x14b85813(self):
+        return (
+            'bot_id' / Int64ul,
+            'button' / self.bot_menu_button_structures('button'))
+
+    @constructor(0xfe198602, 'update_channel_pinned_topics')
+    def struct_0xfe198602(self):
+        return Struct(
+            'sname' / Computed('update_channel_pinned_topics'),
+            'signature' / Hex(Const(0xfe198602, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_order=1),
+            'channel_id' / Int64ul,
+            'order' / If(this.flags.has_order, self.vector(Int32ul, 'order')))
+
+    @constructor(0x192efbe3, 'update_channel_pinned_topic')
+    def struct_0x192efbe3(self):
+        return Struct(
+            'sname' / Computed('update_channel_pinned_topic'),
+            'signature' / Hex(Const(0x192efbe3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=1),
+            'channel_id' / Int64ul,
+            'topic_id' / Int32ul)
+
+    @constructor(0x07b68920, 'update_channel_view_forum_as_messages')
+    def struct_0x07b68920(self):
+        return (
+            'channel_id' / Int64ul,
+            'enabled' / TBool)
+
+    @constructor(0xae3f101d, 'update_peer_wallpaper')
+    def struct_0xae3f101d(self):
+        return Struct(
+            'sname' / Computed('update_peer_wallpaper'),
+            'signature' / Hex(Const(0xae3f101d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_wallpaper_overridden=2,
+                                has_wallpaper=1),
+            'peer' / self.peer_structures('peer'),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')))
+
+    @constructor(0xaeaf9e74, 'update_saved_dialog_pinned')
+    def struct_0xaeaf9e74(self):
+        return Struct(
+            'sname' / Computed('update_saved_dialog_pinned'),
+            'signature' / Hex(Const(0xaeaf9e74, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_pinned=1),
+            'peer' / self.dialog_peer_structures('peer'))
+
+    @constructor(0x686c85a6, 'update_pinned_saved_dialogs')
+    def struct_0x686c85a6(self):
+        return Struct(
+            'sname' / Computed('update_pinned_saved_dialogs'),
+            'signature' / Hex(Const(0x686c85a6, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_order=1),
+            'order' / If(this.flags.has_order, self.vector(self.dialog_peer_structures('order'), 'order')))
+
+    @constructor(0xf9470ab2, 'update_quick_replies')
+    def struct_0xf9470ab2(self):
+        return ['quick_replies' / self.vector(self.struct_0x0697102b(), 'quick_replies')]
+
+    @constructor(0xf53da717, 'update_new_quick_reply')
+    def struct_0xf53da717(self):
+        return ['quick_reply' / self.struct_0x0697102b()]
+
+    @constructor(0x53e6f1ec, 'update_delete_quick_reply')
+    def struct_0x53e6f1ec(self):
+        return ['shortcut_id' / Int32ul]
+
+    @constructor(0x3e050d0f, 'update_quick_reply_message')
+    def struct_0x3e050d0f(self):
+        return ['message' / self.message_structures('message')]
+
+    @constructor(0x566fe7cd, 'update_delete_quick_reply_messages')
+    def struct_0x566fe7cd(self):
+        return (
+            'shortcut_id' / Int32ul,
+            'messages' / self.vector(Int32ul, 'messages'))
+
+    @constructor(0x1824e40b, 'update_new_story_reaction')
+    def struct_0x1824e40b(self):
+        return (
+            'story_id' / Int32ul,
+            'peer' / self.peer_structures('peer'),
+            'reaction' / self.reaction_structures('reaction'))
+
+    @constructor(0xdfd961f5, 'update_broadcast_revenue_transactions')
+    def struct_0xdfd961f5(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'balances' / self.broadcast_revenue_balances_structures('balances'))
+
+    @constructor(0x4e80a379, 'update_stars_balance')
+    def struct_0x4e80a379(self):
+        return ['balance' / self.struct_0xbbb6b4a3()]
+
+    @constructor(0xa584b019, 'update_stars_revenue_status')
+    def struct_0xa584b019(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'status' / self.struct_0xfebe5491())
+
+    @constructor(0x283bd312, 'update_bot_purchased_paid_media')
+    def struct_0x283bd312(self):
+        return (
+            'user_id' / Int64ul,
+            'payload' / TString,
+            'qts' / Int32ul)
+
+    @constructor(0x8b725fce, 'update_paid_reaction_privacy')
+    def struct_0x8b725fce(self):
+        return ['privacy' / self.stars_paid_reaction_privacy_structures('privacy')]
+
+    @constructor(0xa8ae3eb1, 'update_bot_subscription_expire')
+    def struct_0xa8ae3eb1(self):
+        return (
+            'user_id' / Int64ul,
+            'payload' / TString,
+            'until_date' / TTimestamp,
+            'qts' / Int32ul)
+
+    @structures
+    def update_structures(self, name):
+        tag_map = {
+            0x24f40e77: LazyBound(self.struct_0x24f40e77),
+            0xd5a41724: LazyBound(self.struct_0xd5a41724),
+            0xaca1657b: LazyBound(self.struct_0xaca1657b),
+            0xbb9bb9a5: LazyBound(self.struct_0xbb9bb9a5),
+            0xf89a6a4e: LazyBound(self.struct_0xf89a6a4e),
+            0xa20db0e5: LazyBound(self.struct_0xa20db0e5),
+            0x5bb98608: LazyBound(self.struct_0x5bb98608),
+            0xf2ebdb4e: LazyBound(self.struct_0xf2ebdb4e),
+            0x571d2742: LazyBound(self.struct_0x571d2742),
+            0x1710f156: LazyBound(self.struct_0x1710f156),
+            0xd6b19546: LazyBound(self.struct_0xd6b19546),
+            0x2f2f21bf: LazyBound(self.struct_0x2f2f21bf),
+            0x62ba04d9: LazyBound(self.struct_0x62ba04d9),
+            0x1592b79d: LazyBound(self.struct_0x1592b79d),
+            0x6e6fe51c: LazyBound(self.struct_0x6e6fe51c),
+            0x6a7e7366: LazyBound(self.struct_0x6a7e7366),
+            0x05492a13: LazyBound(self.struct_0x05492a13),
+            0x4e90bfd6: LazyBound(self.struct_0x4e90bfd6),
+            0xb75f99a9: LazyBound(self.struct_0xb75f99a9),
+            0x8c88c923: LazyBound(self.struct_0x8c88c923),
+            0x1bf335b9: LazyBound(self.struct_0x1bf335b9),
+            0x31c24808: LazyBound(self.struct_0x31c24808),
+            0x19360dc0: LazyBound(self.struct_0x19360dc0),
+            0x1f2b0afd: LazyBound(self.struct_0x1f2b0afd),
+            0x39a51dfb: LazyBound(self.struct_0x39a51dfb),
+            0x12bcbd9a: LazyBound(self.struct_0x12bcbd9a),
+            0x86fccf85: LazyBound(self.struct_0x86fccf85),
+            0xe5bdf8de: LazyBound(self.struct_0xe5bdf8de),
+            0x28373599: LazyBound(self.struct_0x28373599),
+            0xf226ac08: LazyBound(self.struct_0xf226ac08),
+            0x0b783982: LazyBound(self.struct_0x0b783982),
+            0x4d712f2e: LazyBound(self.struct_0x4d712f2e),
+            0x871fb939: LazyBound(self.struct_0x871fb939),
+            0xbec268ef: LazyBound(self.struct_0xbec268ef),
+            0x985d3abb: LazyBound(self.struct_0x985d3abb),
+            0x695c9e7c: LazyBound(self.struct_0x695c9e7c),
+            0xe32f3d77: LazyBound(self.struct_0xe32f3d77),
+            0xfb4c496c: LazyBound(self.struct_0xfb4c496c),
+            0xe40370a3: LazyBound(self.struct_0xe40370a3),
+            0x6f7863f4: LazyBound(self.struct_0x6f7863f4),
+            0x39c67432: LazyBound(self.struct_0x39c67432),
+            0x7f891213: LazyBound(self.struct_0x7f891213),
+            0xe511996d: LazyBound(self.struct_0xe511996d),
+            0x3dda5451: LazyBound(self.struct_0x3dda5451),
+            0x83487af0: LazyBound(self.struct_0x83487af0),
+            0x564fe691: LazyBound(self.struct_0x564fe691),
+            0xb4a2e88d: LazyBound(self.struct_0xb4a2e88d),
+            0x97d64341: LazyBound(self.struct_0x97d64341),
+            0x108d941f: LazyBound(self.struct_0x108d941f),
+            0xc01e857f: LazyBound(self.struct_0xc01e857f),
+            0xf74e932b: LazyBound(self.struct_0xf74e932b),
+            0xebe46819: LazyBound(self.struct_0xebe46819),
+            0x56022f4d: LazyBound(self.struct_0x56022f4d),
+            0xb23fc698: LazyBound(self.struct_0xb23fc698),
+            0xd7ca61a2: LazyBound(self.struct_0xd7ca61a2),
+            0xea29055d: LazyBound(self.struct_0xea29055d),
+            0xee3b272a: LazyBound(self.struct_0xee3b272a),
+            0xa229dd06: LazyBound(self.struct_0xa229dd06),
+            0xe16459c3: LazyBound(self.struct_0xe16459c3),
+            0x1b49ec6d: LazyBound(self.struct_0x1b49ec6d),
+            0x8951abef: LazyBound(self.struct_0x8951abef),
+            0xa7848924: LazyBound(self.struct_0xa7848924),
+            0x5e1b3cb8: LazyBound(self.struct_0x5e1b3cb8),
+            0xab0f6b1e: LazyBound(self.struct_0xab0f6b1e),
+            0x26ffde7d: LazyBound(self.struct_0x26ffde7d),
+            0xebe07752: LazyBound(self.struct_0xebe07752),
+            0xed85eab5: LazyBound(self.struct_0xed85eab5),
+            0x2661bf09: LazyBound(self.struct_0x2661bf09),
+            0x88617090: LazyBound(self.struct_0x88617090),
+            0xfa0f3ca2: LazyBound(self.struct_0xfa0f3ca2),
+            0x74d8be99: LazyBound(self.struct_0x74d8be99),
+            0x2c084dc1: LazyBound(self.struct_0x2c084dc1),
+            0x0084cd5a: LazyBound(self.struct_0x0084cd5a),
+            0xb4afcfb0: LazyBound(self.struct_0xb4afcfb0),
+            0x9a422c20: LazyBound(self.struct_0x9a422c20),
+            0x9c974fdf: LazyBound(self.struct_0x9c974fdf),
+            0xa5d72105: LazyBound(self.struct_0xa5d72105),
+            0x9375341e: LazyBound(self.struct_0x9375341e),
+            0x7084a7be: LazyBound(self.struct_0x7084a7be),
+            0x635b4c09: LazyBound(self.struct_0x635b4c09),
+            0x2f2ba99f: LazyBound(self.struct_0x2f2ba99f),
+            0xf2a71983: LazyBound(self.struct_0xf2a71983),
+            0xd29a27f4: LazyBound(self.struct_0xd29a27f4),
+            0xc32d5b12: LazyBound(self.struct_0xc32d5b12),
+            0x7d627683: LazyBound(self.struct_0x7d627683),
+            0xf227868c: LazyBound(self.struct_0xf227868c),
+            0x20529438: LazyBound(self.struct_0x20529438),
+            0x17b7a20b: LazyBound(self.struct_0x17b7a20b),
+            0x3504914f: LazyBound(self.struct_0x3504914f),
+            0x30f443db: LazyBound(self.struct_0x30f443db),
+            0x75b3b798: LazyBound(self.struct_0x75b3b798),
+            0x7063c3db: LazyBound(self.struct_0x7063c3db),
+            0x8e5e9873: LazyBound(self.struct_0x8e5e9873),
+            0x1b3f4df7: LazyBound(self.struct_0x1b3f4df7),
+            0x688a30aa: LazyBound(self.struct_0x688a30aa),
+            0x8216fba3: LazyBound(self.struct_0x8216fba3),
+            0x46560264: LazyBound(self.struct_0x46560264),
+            0x38fe25b7: LazyBound(self.struct_0x38fe25b7),
+            0x0bb2d201: LazyBound(self.struct_0x0bb2d201),
+            0x922e6e10: LazyBound(self.struct_0x922e6e10),
+            0xf8227181: LazyBound(self.struct_0xf8227181),
+            0x07761198: LazyBound(self.struct_0x07761198),
+            0x54c01850: LazyBound(self.struct_0x54c01850),
+            0x14b85813: LazyBound(self.struct_0x14b85813),
+            0xfe198602: LazyBound(self.struct_0xfe198602),
+            0x192efbe3: LazyBound(self.struct_0x192efbe3),
+            0x07b68920: LazyBound(self.struct_0x07b68920),
+            0xae3f101d: LazyBound(self.struct_0xae3f101d),
+            0xaeaf9e74: LazyBound(self.struct_0xaeaf9e74),
+            0x686c85a6: LazyBound(self.struct_0x686c85a6),
+            0xf9470ab2: LazyBound(self.struct_0xf9470ab2),
+            0xf53da717: LazyBound(self.struct_0xf53da717),
+            0x53e6f1ec: LazyBound(self.struct_0x53e6f1ec),
+            0x3e050d0f: LazyBound(self.struct_0x3e050d0f),
+            0x566fe7cd: LazyBound(self.struct_0x566fe7cd),
+            0x1824e40b: LazyBound(self.struct_0x1824e40b),
+            0xdfd961f5: LazyBound(self.struct_0xdfd961f5),
+            0x4e80a379: LazyBound(self.struct_0x4e80a379),
+            0xa584b019: LazyBound(self.struct_0xa584b019),
+            0x283bd312: LazyBound(self.struct_0x283bd312),
+            0x8b725fce: LazyBound(self.struct_0x8b725fce),
+            0xa8ae3eb1: LazyBound(self.struct_0xa8ae3eb1)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x0fb85198, 'update_stars_balance_layer194')
+    def struct_0x0fb85198(self):
+        return ['balance' / Int64ul]
+
+    @constructor(0x14b24500, 'update_group_call')
+    def struct_0x14b24500(self):
+        return (
+            'chat_id' / Int64ul,
+            'call' / self.group_call_structures('call'))
+
+    @constructor(0x18b7a10d, 'dc_option')
+    def struct_0x18b7a10d(self):
+        return Struct(
+            'sname' / Computed('dc_option'),
+            'signature' / Hex(Const(0x18b7a10d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_ipv6=1,
+                                is_media_only=2,
+                                is_tcpo_only=4,
+                                is_cdn=8,
+                                is_static=16,
+                                has_secret=1024),
+            'id' / Int32ul,
+            'ip_address' / TString,
+            'port' / Int32ul,
+            'secret' / If(this.flags.has_secret, TBytes))
+
+    @constructor(0x5a73a98c, 'update_message_extended_media')
+    def struct_0x5a73a98c(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'msg_id' / Int32ul,
+            'extended_media' / self.message_extended_media_structures('extended_media'))
+
+    @constructor(0x6056dba5, 'stars_saved_star_gift')
+    def struct_0x6056dba5(self):
+        return Struct(
+            'sname' / Computed('stars_saved_star_gift'),
+            'signature' / Hex(Const(0x6056dba5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_name_hidden=1,
+                                is_unsaved=32,
+                                is_refunded=512,
+                                is_can_upgrade=1024,
+                                is_pinned_to_top=4096,
+                                has_from_id=2,
+                                has_message=4,
+                                has_msg_id=8,
+                                has_saved_id=2048,
+                                has_convert_stars=16,
+                                has_upgrade_stars=64,
+                                has_can_export_at=128,
+                                has_transfer_stars=256),
+            'from_id' / If(this.flags.has_from_id, self.peer_structures('from_id')),
+            'date' / TTimestamp,
+            'gift' / self.star_gift_structures('gift'),
+            'message' / If(this.flags.has_message, self.struct_0x751f3146()),
+            'msg_id' / If(this.flags.has_msg_id, Int32ul),
+            'saved_id' / If(this.flags.has_saved_id, Int64ul),
+            'convert_stars' / If(this.flags.has_convert_stars, Int64ul),
+            'upgrade_stars' / If(this.flags.has_upgrade_stars, Int64ul),
+            'can_export_at' / If(this.flags.has_can_export_at, Int32ul),
+            'transfer_stars' / If(this.flags.has_transfer_stars, Int64ul))
+
+    @constructor(0x767cde44, 'update_star_gift_upgraded')
+    def struct_0x767cde44(self):
+        return (
+            'gift' / self.struct_0x6056dba5(),
+            'to_gift' / self.struct_0x6056dba5())
+
+    @constructor(0x90866cee, 'update_delete_scheduled_messages')
+    def struct_0x90866cee(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'messages' / self.vector(Int32ul, 'messages'))
+
+    @constructor(0xbbb6b4a3, 'stars_amount')
+    def struct_0xbbb6b4a3(self):
+        return (
+            'amount' / Int64ul,
+            'nanos' / Int32ul)
+
+    @constructor(0xccf08ad6, 'update_group_invite_privacy_forbidden')
+    def struct_0xccf08ad6(self):
+        return ['user_id' / Int64ul]
+
+    @constructor(0xe9baa668, 'folder_peer')
+    def struct_0xe9baa668(self):
+        return (
+            'peer' / self.peer_structures('peer'),
+            'folder_id' / Int32ul)
+
+    @constructor(0xf385c1f6, 'lang_pack_difference')
+    def struct_0xf385c1f6(self):
+        return (
+            'lang_code' / TString,
+            'from_version' / Int32ul,
+            'version' / Int32ul,
+            'strings' / self.vector(self.lang_pack_string_structures('strings'), 'strings'))
+
+    @constructor(0xfebe5491, 'stars_revenue_status')
+    def struct_0xfebe5491(self):
+        return Struct(
+            'sname' / Computed('stars_revenue_status'),
+            'signature' / Hex(Const(0xfebe5491, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_withdrawal_enabled=1,
+                                has_next_withdrawal_at=2),
+            'current_balance' / self.struct_0xbbb6b4a3(),
+            'available_balance' / self.struct_0xbbb6b4a3(),
+            'overall_revenue' / self.struct_0xbbb6b4a3(),
+            'next_withdrawal_at' / If(this.flags.has_next_withdrawal_at, Int32ul))
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group updates of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x74ae4240, 'updates')
+    def struct_0x74ae4240(self):
+        return (
+            'updates' / self.vector(self.update_structures('updates'), 'updates'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'date' / TTimestamp,
+            'seq' / Int32ul)
+
+    @constructor(0x313bc7f8, 'update_short_message')
+    def struct_0x313bc7f8(self):
+        return Struct(
+            'sname' / Computed('update_short_message'),
+            'signature' / Hex(Const(0x313bc7f8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_entities=128,
+                                has_ttl_period=33554432),
+            'id' / Int32ul,
+            'user_id' / Int64ul,
+            'message' / TString,
+            'pts' / Int32ul,
+            'pts_count' / Int32ul,
+            'date' / TTimestamp,
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0x9015e101, 'update_short_sent_message')
+    def struct_0x9015e101(self):
+        return Struct(
+            'sname' / Computed('update_short_sent_message'),
+            'signature' / Hex(Const(0x9015e101, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                has_media=512,
+                                has_entities=128,
+                                has_ttl_period=33554432),
+            'id' / Int32ul,
+            'pts' / Int32ul,
+            'pts_count' / Int32ul,
+            'date' / TTimestamp,
+            'media' / If(this.flags.has_media, self.message_media_structures('media')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0x78d4dec1, 'update_short')
+    def struct_0x78d4dec1(self):
+        return (
+            'update' / self.update_structures('update'),
+            'date' / TTimestamp)
+
+    @constructor(0x4d6deea5, 'update_short_chat_message')
+    def struct_0x4d6deea5(self):
+        return Struct(
+            'sname' / Computed('update_short_chat_message'),
+            'signature' / Hex(Const(0x4d6deea5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_out=2,
+                                is_mentioned=16,
+                                is_media_unread=32,
+                                is_silent=8192,
+                                has_fwd_from=4,
+                                has_via_bot_id=2048,
+                                has_reply_to=8,
+                                has_entities=128,
+                                has_ttl_period=33554432),
+            'id' / Int32ul,
+            'from_id' / Int64ul,
+            'chat_id' / Int64ul,
+            'message' / TString,
+            'pts' / Int32ul,
+            'pts_count' / Int32ul,
+            'date' / TTimestamp,
+            'fwd_from' / If(this.flags.has_fwd_from, self.message_fwd_header_structures('fwd_from')),
+            'via_bot_id' / If(this.flags.has_via_bot_id, Int64ul),
+            'reply_to' / If(this.flags.has_reply_to, self.message_reply_header_structures('reply_to')),
+            'entities' / If(this.flags.has_entities, self.vector(self.message_entity_structures('entities'), 'entities')),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0x725b04c3, 'updates_combined')
+    def struct_0x725b04c3(self):
+        return (
+            'updates' / self.vector(self.update_structures('updates'), 'updates'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'date' / TTimestamp,
+            'seq_start' / Int32ul,
+            'seq' / Int32ul)
+
+    @constructor(0xe317af7e, 'updates_too_long')
+    def struct_0xe317af7e(self):
+        return []
+
+    @structures
+    def updates_structures(self, name):
+        tag_map = {
+            0x74ae4240: LazyBound(self.struct_0x74ae4240),
+            0x313bc7f8: LazyBound(self.struct_0x313bc7f8),
+            0x9015e101: LazyBound(self.struct_0x9015e101),
+            0x78d4dec1: LazyBound(self.struct_0x78d4dec1),
+            0x4d6deea5: LazyBound(self.struct_0x4d6deea5),
+            0x725b04c3: LazyBound(self.struct_0x725b04c3),
+            0xe317af7e: LazyBound(self.struct_0xe317af7e)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x03173d78, 'updates_get_channel_difference')
+    def struct_0x03173d78(self):
+        return Struct(
+            'sname' / Computed('updates_get_channel_difference'),
+            'signature' / Hex(Const(0x03173d78, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_force=1),
+            'channel' / self.input_channel_structures('channel'),
+            'filter' / self.channel_messages_filter_structures('filter'),
+            'pts' / Int32ul,
+            'limit' / Int32ul)
+
+    @constructor(0x25939651, 'updates_get_difference')
+    def struct_0x25939651(self):
+        return Struct(
+            'sname' / Computed('updates_get_difference'),
+            'signature' / Hex(Const(0x25939651, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_pts_total_limit=1),
+            'pts' / Int32ul,
+            'pts_total_limit' / If(this.flags.has_pts_total_limit, Int32ul),
+            'date' / TTimestamp,
+            'qts' / Int32ul)
+
+    @constructor(0xedd4882a, 'updates_get_state')
+    def struct_0xedd4882a(self):
+        return []
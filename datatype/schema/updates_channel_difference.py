@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group updates_channel_difference of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x3e11affb, 'updates_channel_difference_empty')
+    def struct_0x3e11affb(self):
+        return Struct(
+            'sname' / Computed('updates_channel_difference_empty'),
+            'signature' / Hex(Const(0x3e11affb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_final=1,
+                                has_timeout=2),
+            'pts' / Int32ul,
+            'timeout' / If(this.flags.has_timeout, Int32ul))
+
+    @constructor(0x2064674e, 'updates_channel_difference')
+    def struct_0x2064674e(self):
+        return Struct(
+            'sname' / Computed('updates_channel_difference'),
+            'signature' / Hex(Const(0x2064674e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_final=1,
+                                has_timeout=2),
+            'pts' / Int32ul,
+            'timeout' / If(this.flags.has_timeout, Int32ul),
+            'new_messages' / self.vector(self.message_structures('new_messages'), 'new_messages'),
+            'other_updates' / self.vector(self.update_structures('other_updates'), 'other_updates'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xa4bcc6fe, 'updates_channel_difference_too_long')
+    def struct_0xa4bcc6fe(self):
+        return Struct(
+            'sname' / Computed('updates_channel_difference_too_long'),
+            'signature' / Hex(Const(0xa4bcc6fe, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_final=1,
+                                has_timeout=2),
+            'timeout' / If(this.flags.has_timeout, Int32ul),
+            'dialog' / self.dialog_structures('dialog'),
+            'messages' / self.vector(self.message_structures('messages'), 'messages'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def updates_channel_difference_structures(self, name):
+        tag_map = {
+            0x3e11affb: LazyBound(self.struct_0x3e11affb),
+            0x2064674e: LazyBound(self.struct_0x2064674e),
+            0xa4bcc6fe: LazyBound(self.struct_0xa4bcc6fe)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group updates_difference of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x00f49ca0, 'updates_difference')
+    def struct_0x00f49ca0(self):
+        return (
+            'new_messages' / self.vector(self.message_structures('new_messages'), 'new_messages'),
+            'new_encrypted_messages' / self.vector(self.encrypted_message_structures('new_encrypted_messages'), 'new_encrypted_messages'),
+            'other_updates' / self.vector(self.update_structures('other_updates'), 'other_updates'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'state' / self.struct_0xa56c2a3e())
+
+    @constructor(0xa8fb1981, 'updates_difference_slice')
+    def struct_0xa8fb1981(self):
+        return (
+            'new_messages' / self.vector(self.message_structures('new_messages'), 'new_messages'),
+            'new_encrypted_messages' / self.vector(self.encrypted_message_structures('new_encrypted_messages'), 'new_encrypted_messages'),
+            'other_updates' / self.vector(self.update_structures('other_updates'), 'other_updates'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'),
+            'intermediate_state' / self.struct_0xa56c2a3e())
+
+    @constructor(0x4afe8f6d, 'updates_difference_too_long')
+    def struct_0x4afe8f6d(self):
+        return ['pts' / Int32ul]
+
+    @constructor(0x5d75a138, 'updates_difference_empty')
+    def struct_0x5d75a138(self):
+        return (
+            'date' / TTimestamp,
+            'seq' / Int32ul)
+
+    @structures
+    def updates_difference_structures(self, name):
+        tag_map = {
+            0x00f49ca0: LazyBound(self.struct_0x00f49ca0),
+            0xa8fb1981: LazyBound(self.struct_0xa8fb1981),
+            0x4afe8f6d: LazyBound(self.struct_0x4afe8f6d),
+            0x5d75a138: LazyBound(self.struct_0x5d75a138)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xa56c2a3e, 'updates_state')
+    def struct_0xa56c2a3e(self):
+        return (
+            'pts' / Int32ul,
+            'qts' / Int32ul,
+            'date' / TTimestamp,
+            'seq' / Int32ul,
+            'unread_count' / Int32ul)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group upload of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x21e753bc, 'upload_web_file')
+    def struct_0x21e753bc(self):
+        return (
+            'size' / Int32ul,
+            'mime_type' / TString,
+            'file_type' / self.storage_file_type_structures('file_type'),
+            'mtime' / Int32ul,
+            'bytes' / TBytes)
+
+    @constructor(0x24e6818d, 'upload_get_web_file')
+    def struct_0x24e6818d(self):
+        return (
+            'location' / self.input_web_file_location_structures('location'),
+            'offset' / Int32ul,
+            'limit' / Int32ul)
+
+    @constructor(0x395f69da, 'upload_get_cdn_file')
+    def struct_0x395f69da(self):
+        return (
+            'file_token' / TBytes,
+            'offset' / Int64ul,
+            'limit' / Int32ul)
+
+    @constructor(0x91dc3f31, 'upload_get_cdn_file_hashes')
+    def struct_0x91dc3f31(self):
+        return (
+            'file_token' / TBytes,
+            'offset' / Int64ul)
+
+    @constructor(0x9b2754a8, 'upload_reupload_cdn_file')
+    def struct_0x9b2754a8(self):
+        return (
+            'file_token' / TBytes,
+            'request_token' / TBytes)
+
+    @constructor(0xb304a621, 'upload_save_file_part')
+    def struct_0xb304a621(self):
+        return (
+            'file_id' / Int64ul,
+            'file_part' / Int32ul,
+            'bytes' / TBytes)
+
+    @constructor(0xbe5335be, 'upload_get_file')
+    def struct_0xbe5335be(self):
+        return Struct(
+            'sname' / Computed('upload_get_file'),
+            'signature' / Hex(Const(0xbe5335be, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_precise=1,
+                                is_cdn_supported=2),
+            'location' / self.input_file_location_structures('location'),
+            'offset' / Int64ul,
+            'limit' / Int32ul)
+
+    @constructor(0xc7025931, 'upload_get_file_hashes')
+    def struct_0xc7025931(self):
+        return (
+            'location' / self.input_file_location_structures('location'),
+            'offset' / Int32ul)
+
+    @constructor(0xde7b673d, 'upload_save_big_file_part')
+    def struct_0xde7b673d(self):
+        return (
+            'file_id' / Int64ul,
+            'file_part' / Int32ul,
+            'file_total_parts' / Int32ul,
+            'bytes' / TBytes)
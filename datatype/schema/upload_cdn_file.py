@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group upload_cdn_file of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa99fca4f, 'upload_cdn_file')
+    def struct_0xa99fca4f(self):
+        return ['bytes' / TBytes]
+
+    @constructor(0xeea8e46e, 'upload_cdn_file_reupload_needed')
+    def struct_0xeea8e46e(self):
+        return ['request_token' / TBytes]
+
+    @structures
+    def upload_cdn_file_structures(self, name):
+        tag_map = {
+            0xa99fca4f: LazyBound(self.struct_0xa99fca4f),
+            0xeea8e46e: LazyBound(self.struct_0xeea8e46e)
+        }
+        return TLUnion(name, tag_map)
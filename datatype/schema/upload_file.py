@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group upload_file of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x096a18d5, 'upload_file')
+    def struct_0x096a18d5(self):
+        return (
+            'type' / self.storage_file_type_structures('type'),
+            'mtime' / Int32ul,
+            'bytes' / TBytes)
+
+    @constructor(0xf18cda44, 'upload_file_cdn_redirect')
+    def struct_0xf18cda44(self):
+        return (
+            'dc_id' / Int32ul,
+            'file_token' / TBytes,
+            'encryption_key' / TBytes,
+            'encryption_iv' / TBytes,
+            'file_hashes' / self.vector(self.struct_0xf39b035c(), 'file_hashes'))
+
+    @structures
+    def upload_file_structures(self, name):
+        tag_map = {
+            0x096a18d5: LazyBound(self.struct_0x096a18d5),
+            0xf18cda44: LazyBound(self.struct_0xf18cda44)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xf39b035c, 'file_hash')
+    def struct_0xf39b035c(self):
+        return (
+            'offset' / Int64ul,
+            'limit' / Int32ul,
+            'hash' / TBytes)
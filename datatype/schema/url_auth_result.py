@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group url_auth_result of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa9d6db1f, 'url_auth_result_default')
+    def struct_0xa9d6db1f(self):
+        return []
+
+    @constructor(0x92d33a0e, 'url_auth_result_request')
+    def struct_0x92d33a0e(self):
+        return Struct(
+            'sname' / Computed('url_auth_result_request'),
+            'signature' / Hex(Const(0x92d33a0e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_request_write_access=1),
+            'bot' / self.user_structures('bot'),
+            'domain' / TString)
+
+    @constructor(0x8f8c0e4e, 'url_auth_result_accepted')
+    def struct_0x8f8c0e4e(self):
+        return ['url' / TString]
+
+    @structures
+    def url_auth_result_structures(self, name):
+        tag_map = {
+            0xa9d6db1f: LazyBound(self.struct_0xa9d6db1f),
+            0x92d33a0e: LazyBound(self.struct_0x92d33a0e),
+            0x8f8c0e4e: LazyBound(self.struct_0x8f8c0e4e)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,1079 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group user of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x020b1422, 'user')
+    def struct_0x020b1422(self):
+        return Struct(
+            'sname' / Computed('user'),
+            'signature' / Hex(Const(0x020b1422, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_username=8,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                is_attach_menu_enabled=536870912,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304,
+                                has_emoji_status=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_bot_can_edit=2,
+                                 is_close_friend=4,
+                                 is_stories_hidden=8,
+                                 is_stories_unavailable=16,
+                                 is_contact_require_premium=1024,
+                                 is_bot_business=2048,
+                                 is_bot_has_main_app=8192,
+                                 has_usernames=1,
+                                 has_stories_max_id=32,
+                                 has_color=256,
+                                 has_profile_color=512,
+                                 has_bot_active_users=4096,
+                                 has_bot_verification_icon=16384,
+                                 has_send_paid_messages_stars=32768),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString),
+            'emoji_status' / If(this.flags.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'bot_active_users' / If(this.flags2.has_bot_active_users, Int32ul),
+            'bot_verification_icon' / If(this.flags2.has_bot_verification_icon, Int64ul),
+            'send_paid_messages_stars' / If(this.flags2.has_send_paid_messages_stars, Int64ul))
+
+    @constructor(0x4b46c37e, 'user_layer199')
+    def struct_0x4b46c37e(self):
+        return Struct(
+            'sname' / Computed('user_layer199'),
+            'signature' / Hex(Const(0x4b46c37e, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_username=8,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                is_attach_menu_enabled=536870912,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304,
+                                has_emoji_status=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_bot_can_edit=2,
+                                 is_close_friend=4,
+                                 is_stories_hidden=8,
+                                 is_stories_unavailable=16,
+                                 is_contact_require_premium=1024,
+                                 is_bot_business=2048,
+                                 is_bot_has_main_app=8192,
+                                 has_usernames=1,
+                                 has_stories_max_id=32,
+                                 has_color=256,
+                                 has_profile_color=512,
+                                 has_bot_active_users=4096,
+                                 has_bot_verification_icon=16384),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString),
+            'emoji_status' / If(this.flags.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'bot_active_users' / If(this.flags2.has_bot_active_users, Int32ul),
+            'bot_verification_icon' / If(this.flags2.has_bot_verification_icon, Int64ul))
+
+    @constructor(0x59476956, 'user_layer196_2')
+    def struct_0x59476956(self):
+        return Struct(
+            'sname' / Computed('user_layer196_2'),
+            'signature' / Hex(Const(0x59476956, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_username=8,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                is_attach_menu_enabled=536870912,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304,
+                                has_emoji_status=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_bot_can_edit=2,
+                                 is_close_friend=4,
+                                 is_stories_hidden=8,
+                                 is_stories_unavailable=16,
+                                 is_contact_require_premium=1024,
+                                 is_bot_business=2048,
+                                 is_bot_has_main_app=8192,
+                                 has_usernames=1,
+                                 has_stories_max_id=32,
+                                 has_color=256,
+                                 has_profile_color=512,
+                                 has_bot_active_users=4096,
+                                 has_bot_verification_icon=16384),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString),
+            'emoji_status' / If(this.flags.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'bot_active_users' / If(this.flags2.has_bot_active_users, Int32ul),
+            'bot_verification_icon' / If(this.flags2.has_bot_verification_icon, Int64ul))
+
+    @constructor(0x685f5e21, 'user_layer196_1')
+    def struct_0x685f5e21(self):
+        return Struct(
+            'sname' / Computed('user_layer196_1'),
+            'signature' / Hex(Const(0x685f5e21, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_username=8,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                is_attach_menu_enabled=536870912,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304,
+                                has_emoji_status=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_bot_can_edit=2,
+                                 is_close_friend=4,
+                                 is_stories_hidden=8,
+                                 is_stories_unavailable=16,
+                                 is_contact_require_premium=1024,
+                                 is_bot_business=2048,
+                                 is_bot_has_main_app=8192,
+                                 has_usernames=1,
+                                 has_stories_max_id=32,
+                                 has_color=256,
+                                 has_profile_color=512,
+                                 has_bot_active_users=4096,
+                                 has_bot_verification_icon=16384),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString),
+            'emoji_status' / If(this.flags.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'bot_active_users' / If(this.flags2.has_bot_active_users, Int32ul),
+            'bot_verification_icon' / If(this.flags2.has_bot_verification_icon, Int64ul))
+
+    @constructor(0x83314fca, 'user_layer195')
+    def struct_0x83314fca(self):
+        return Struct(
+            'sname' / Computed('user_layer195'),
+            'signature' / Hex(Const(0x83314fca, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_username=8,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                is_attach_menu_enabled=536870912,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304,
+                                has_emoji_status=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_bot_can_edit=2,
+                                 is_close_friend=4,
+                                 is_stories_hidden=8,
+                                 is_stories_unavailable=16,
+                                 is_contact_require_premium=1024,
+                                 is_bot_business=2048,
+                                 is_bot_has_main_app=8192,
+                                 has_usernames=1,
+                                 has_stories_max_id=32,
+                                 has_color=256,
+                                 has_profile_color=512,
+                                 has_bot_active_users=4096),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString),
+            'emoji_status' / If(this.flags.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'bot_active_users' / If(this.flags2.has_bot_active_users, Int32ul))
+
+    @constructor(0x4fe9cce0, 'user_layer185')
+    def struct_0x4fe9cce0(self):
+        return Struct(
+            'sname' / Computed('user_layer185'),
+            'signature' / Hex(Const(0x4fe9cce0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_username=8,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                is_attach_menu_enabled=536870912,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304,
+                                has_emoji_status=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_bot_can_edit=2,
+                                 is_close_friend=4,
+                                 is_stories_hidden=8,
+                                 is_stories_unavailable=16,
+                                 is_contact_require_premium=1024,
+                                 is_bot_business=2048,
+                                 has_usernames=1,
+                                 has_stories_max_id=32,
+                                 has_color=256,
+                                 has_profile_color=512,
+                                 has_bot_active_users=4096),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString),
+            'emoji_status' / If(this.flags.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()),
+            'bot_active_users' / If(this.flags2.has_bot_active_users, Int32ul))
+
+    @constructor(0x215c4438, 'user_layer184')
+    def struct_0x215c4438(self):
+        return Struct(
+            'sname' / Computed('user_layer184'),
+            'signature' / Hex(Const(0x215c4438, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_username=8,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                is_attach_menu_enabled=536870912,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304,
+                                has_emoji_status=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_bot_can_edit=2,
+                                 is_close_friend=4,
+                                 is_stories_hidden=8,
+                                 is_stories_unavailable=16,
+                                 is_contact_require_premium=1024,
+                                 is_bot_business=2048,
+                                 has_usernames=1,
+                                 has_stories_max_id=32,
+                                 has_color=256,
+                                 has_profile_color=512),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString),
+            'emoji_status' / If(this.flags.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, self.struct_0xb54b5acf()),
+            'profile_color' / If(this.flags2.has_profile_color, self.struct_0xb54b5acf()))
+
+    @constructor(0xeb602f25, 'user_layer166')
+    def struct_0xeb602f25(self):
+        return Struct(
+            'sname' / Computed('user_layer166'),
+            'signature' / Hex(Const(0xeb602f25, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_username=8,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                is_attach_menu_enabled=536870912,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304,
+                                has_emoji_status=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_bot_can_edit=2,
+                                 is_close_friend=4,
+                                 is_stories_hidden=8,
+                                 is_stories_unavailable=16,
+                                 has_usernames=1,
+                                 has_stories_max_id=32,
+                                 has_color=128,
+                                 has_background_emoji_id=64),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString),
+            'emoji_status' / If(this.flags.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul),
+            'color' / If(this.flags2.has_color, Int32ul),
+            'background_emoji_id' / If(this.flags2.has_background_emoji_id, Int64ul))
+
+    @constructor(0xcab35e18, 'user_contact_old2')
+    def struct_0xcab35e18(self):
+        return (
+            'id' / Int32ul,
+            'first_name' / TString,
+            'last_name' / TString,
+            'username' / TString,
+            'access_hash' / Int64ul,
+            'phone' / TString,
+            'photo' / self.user_profile_photo_structures('photo'),
+            'status' / self.user_status_structures('status'))
+
+    @constructor(0xf2fb8319, 'user_contact_old')
+    def struct_0xf2fb8319(self):
+        return (
+            'id' / Int32ul,
+            'first_name' / TString,
+            'last_name' / TString,
+            'access_hash' / Int64ul,
+            'phone' / TString,
+            'photo' / self.user_profile_photo_structures('photo'),
+            'status' / self.user_status_structures('status'))
+
+    @constructor(0xd3bc4b7a, 'user_empty')
+    def struct_0xd3bc4b7a(self):
+        return ['id' / Int64ul]
+
+    @constructor(0xabb5f120, 'user_layer165')
+    def struct_0xabb5f120(self):
+        return Struct(
+            'sname' / Computed('user_layer165'),
+            'signature' / Hex(Const(0xabb5f120, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_username=8,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                is_attach_menu_enabled=536870912,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304,
+                                has_emoji_status=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_bot_can_edit=2,
+                                 is_close_friend=4,
+                                 is_stories_hidden=8,
+                                 is_stories_unavailable=16,
+                                 has_usernames=1,
+                                 has_stories_max_id=32),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString),
+            'emoji_status' / If(this.flags.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')),
+            'stories_max_id' / If(this.flags2.has_stories_max_id, Int32ul))
+
+    @constructor(0x8f97c628, 'user_layer159')
+    def struct_0x8f97c628(self):
+        return Struct(
+            'sname' / Computed('user_layer159'),
+            'signature' / Hex(Const(0x8f97c628, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_username=8,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                is_attach_menu_enabled=536870912,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304,
+                                has_emoji_status=1073741824),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_bot_can_edit=2,
+                                 is_close_friend=4,
+                                 is_stories_hidden=32,
+                                 has_usernames=1),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString),
+            'emoji_status' / If(this.flags.has_emoji_status, self.emoji_status_structures('emoji_status')),
+            'usernames' / If(this.flags2.has_usernames, self.vector(self.struct_0xb4073647(), 'usernames')))
+
+    @constructor(0x5d99adee, 'user_layer147')
+    def struct_0x5d99adee(self):
+        return Struct(
+            'sname' / Computed('user_layer147'),
+            'signature' / Hex(Const(0x5d99adee, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                is_attach_menu_enabled=536870912,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_username=8,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304,
+                                has_emoji_status=1073741824),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString),
+            'emoji_status' / If(this.flags.has_emoji_status, self.emoji_status_structures('emoji_status')))
+
+    @constructor(0x3ff6ecb0, 'user_layer144')
+    def struct_0x3ff6ecb0(self):
+        return Struct(
+            'sname' / Computed('user_layer144'),
+            'signature' / Hex(Const(0x3ff6ecb0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                is_bot_attach_menu=134217728,
+                                is_premium=268435456,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_username=8,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304),
+            'id' / Int64ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString))
+
+    @constructor(0x938458c1, 'user_layer131')
+    def struct_0x938458c1(self):
+        return Struct(
+            'sname' / Computed('user_layer131'),
+            'signature' / Hex(Const(0x938458c1, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                is_apply_min_photo=33554432,
+                                is_fake=67108864,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_username=8,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304),
+            'id' / Int32ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, self.vector(self.restriction_reason_structures('restriction_reason'), 'restriction_reason')),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString))
+
+    @constructor(0x2e13f4c3, 'user_layer104')
+    def struct_0x2e13f4c3(self):
+        return Struct(
+            'sname' / Computed('user_layer104'),
+            'signature' / Hex(Const(0x2e13f4c3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                is_support=8388608,
+                                is_scam=16777216,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_username=8,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288,
+                                has_lang_code=4194304),
+            'id' / Int32ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, TString),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString),
+            'lang_code' / If(this.flags.has_lang_code, TString))
+
+    @constructor(0x720535ec, 'user_self_old')
+    def struct_0x720535ec(self):
+        return (
+            'id' / Int32ul,
+            'first_name' / TString,
+            'last_name' / TString,
+            'phone' / TString,
+            'photo' / self.user_profile_photo_structures('photo'),
+            'status' / self.user_status_structures('status'),
+            'inactive' / TBool)
+
+    @constructor(0x1c60e608, 'user_self_old3')
+    def struct_0x1c60e608(self):
+        return (
+            'id' / Int32ul,
+            'first_name' / TString,
+            'last_name' / TString,
+            'username' / TString,
+            'phone' / TString,
+            'photo' / self.user_profile_photo_structures('photo'),
+            'status' / self.user_status_structures('status'))
+
+    @constructor(0xd6016d7a, 'user_deleted_old2')
+    def struct_0xd6016d7a(self):
+        return (
+            'id' / Int32ul,
+            'first_name' / TString,
+            'last_name' / TString,
+            'username' / TString)
+
+    @constructor(0x200250ba, 'user_empty_layer131')
+    def struct_0x200250ba(self):
+        return ['id' / Int32ul]
+
+    @constructor(0x22e8ceb0, 'user_request_old')
+    def struct_0x22e8ceb0(self):
+        return (
+            'id' / Int32ul,
+            'first_name' / TString,
+            'last_name' / TString,
+            'access_hash' / Int64ul,
+            'phone' / TString,
+            'photo' / self.user_profile_photo_structures('photo'),
+            'status' / self.user_status_structures('status'))
+
+    @constructor(0x5214c89d, 'user_foreign_old')
+    def struct_0x5214c89d(self):
+        return (
+            'id' / Int32ul,
+            'first_name' / TString,
+            'last_name' / TString,
+            'access_hash' / Int64ul,
+            'photo' / self.user_profile_photo_structures('photo'),
+            'status' / self.user_status_structures('status'))
+
+    @constructor(0x075cf7a8, 'user_foreign_old2')
+    def struct_0x075cf7a8(self):
+        return (
+            'id' / Int32ul,
+            'first_name' / TString,
+            'last_name' / TString,
+            'username' / TString,
+            'access_hash' / Int64ul,
+            'photo' / self.user_profile_photo_structures('photo'),
+            'status' / self.user_status_structures('status'))
+
+    @constructor(0xd9ccc4ef, 'user_request_old2')
+    def struct_0xd9ccc4ef(self):
+        return (
+            'id' / Int32ul,
+            'first_name' / TString,
+            'last_name' / TString,
+            'username' / TString,
+            'access_hash' / Int64ul,
+            'phone' / TString,
+            'photo' / self.user_profile_photo_structures('photo'),
+            'status' / self.user_status_structures('status'))
+
+    @constructor(0xb29ad7cc, 'user_deleted_old')
+    def struct_0xb29ad7cc(self):
+        return (
+            'id' / Int32ul,
+            'first_name' / TString,
+            'last_name' / TString)
+
+    @constructor(0xd10d979a, 'user_layer65')
+    def struct_0xd10d979a(self):
+        return Struct(
+            'sname' / Computed('user_layer65'),
+            'signature' / Hex(Const(0xd10d979a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_restricted=262144,
+                                is_min=1048576,
+                                is_bot_inline_geo=2097152,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_username=8,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64,
+                                has_bot_inline_placeholder=524288),
+            'id' / Int32ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul),
+            'restriction_reason' / If(this.flags.is_restricted, TString),
+            'bot_inline_placeholder' / If(this.flags.has_bot_inline_placeholder, TString))
+
+    @constructor(0x22e49072, 'user_old')
+    def struct_0x22e49072(self):
+        return Struct(
+            'sname' / Computed('user_old'),
+            'signature' / Hex(Const(0x22e49072, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_self=1024,
+                                is_contact=2048,
+                                is_mutual_contact=4096,
+                                is_deleted=8192,
+                                is_bot=16384,
+                                is_bot_chat_history=32768,
+                                is_bot_nochats=65536,
+                                is_verified=131072,
+                                is_explicit_content=262144,
+                                has_access_hash=1,
+                                has_first_name=2,
+                                has_last_name=4,
+                                has_username=8,
+                                has_phone=16,
+                                has_photo=32,
+                                has_status=64),
+            'id' / Int32ul,
+            'access_hash' / If(this.flags.has_access_hash, Int64ul),
+            'first_name' / If(this.flags.has_first_name, TString),
+            'last_name' / If(this.flags.has_last_name, TString),
+            'username' / If(this.flags.has_username, TString),
+            'phone' / If(this.flags.has_phone, TString),
+            'photo' / If(this.flags.has_photo, self.user_profile_photo_structures('photo')),
+            'status' / If(this.flags.has_status, self.user_status_structures('status')),
+            'bot_info_version' / If(this.flags.is_bot, Int32ul))
+
+    @constructor(0x7007b451, 'user_self_old2')
+    def struct_0x7007b451(self):
+        return (
+            'id' / Int32ul,
+            'first_name' / TString,
+            'last_name' / TString,
+            'username' / TString,
+            'phone' / TString,
+            'photo' / self.user_profile_photo_structures('photo'),
+            'status' / self.user_status_structures('status'),
+            'inactive' / TBool)
+
+    @structures
+    def user_structures(self, name):
+        tag_map = {
+            0x020b1422: LazyBound(self.struct_0x020b1422),
+            0x4b46c37e: LazyBound(self.struct_0x4b46c37e),
+            0x59476956: LazyBound(self.struct_0x59476956),
+            0x685f5e21: LazyBound(self.struct_0x685f5e21),
+            0x83314fca: LazyBound(self.struct_0x83314fca),
+            0x4fe9cce0: LazyBound(self.struct_0x4fe9cce0),
+            0x215c4438: LazyBound(self.struct_0x215c4438),
+            0xeb602f25: LazyBound(self.struct_0xeb602f25),
+            0xcab35e18: LazyBound(self.struct_0xcab35e18),
+            0xf2fb8319: LazyBound(self.struct_0xf2fb8319),
+            0xd3bc4b7a: LazyBound(self.struct_0xd3bc4b7a),
+            0xabb5f120: LazyBound(self.struct_0xabb5f120),
+            0x8f97c628: LazyBound(self.struct_0x8f97c628),
+            0x5d99adee: LazyBound(self.struct_0x5d99adee),
+            0x3ff6ecb0: LazyBound(self.struct_0x3ff6ecb0),
+            0x938458c1: LazyBound(self.struct_0x938458c1),
+            0x2e13f4c3: LazyBound(self.struct_0x2e13f4c3),
+            0x720535ec: LazyBound(self.struct_0x720535ec),
+            0x1c60e608: LazyBound(self.struct_0x1c60e608),
+            0xd6016d7a: LazyBound(self.struct_0xd6016d7a),
+            0x200250ba: LazyBound(self.struct_0x200250ba),
+            0x22e8ceb0: LazyBound(self.struct_0x22e8ceb0),
+            0x5214c89d: LazyBound(self.struct_0x5214c89d),
+            0x075cf7a8: LazyBound(self.struct_0x075cf7a8),
+            0xd9ccc4ef: LazyBound(self.struct_0xd9ccc4ef),
+            0xb29ad7cc: LazyBound(self.struct_0xb29ad7cc),
+            0xd10d979a: LazyBound(self.struct_0xd10d979a),
+            0x22e49072: LazyBound(self.struct_0x22e49072),
+            0x7007b451: LazyBound(self.struct_0x7007b451)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0xb4073647, 'username')
+    def struct_0xb4073647(self):
+        return Struct(
+            'sname' / Computed('username'),
+            'signature' / Hex(Const(0xb4073647, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_editable=1,
+                                is_active=2),
+            'username' / TString)
+
+    @constructor(0xb54b5acf, 'peer_color')
+    def struct_0xb54b5acf(self):
+        return Struct(
+            'sname' / Computed('peer_color'),
+            'signature' / Hex(Const(0xb54b5acf, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_color=1,
+                                has_background_emoji_id=2),
+            'color' / If(this.flags.has_color, Int32ul),
+            'background_emoji_id' / If(this.flags.has_background_emoji_id, Int64ul))
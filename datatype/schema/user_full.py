@@ -0,0 +1,1279 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group user_full of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xd2234ea0, 'user_full')
+    def struct_0xd2234ea0(self):
+        return Struct(
+            'sname' / Computed('user_full'),
+            'signature' / Hex(Const(0xd2234ea0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                is_stories_pinned_available=67108864,
+                                is_blocked_my_stories_from=134217728,
+                                is_wallpaper_overridden=268435456,
+                                is_contact_require_premium=536870912,
+                                is_read_dates_private=1073741824,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_wallpaper=16777216,
+                                has_stories=33554432),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_sponsored_enabled=128,
+                                 is_can_view_revenue=512,
+                                 is_bot_can_manage_emoji_status=1024,
+                                 has_business_work_hours=1,
+                                 has_business_location=2,
+                                 has_business_greeting_message=4,
+                                 has_business_away_message=8,
+                                 has_business_intro=16,
+                                 has_birthday=32,
+                                 has_personal_channel_id=64,
+                                 has_stargifts_count=256,
+                                 has_starref_program=2048,
+                                 has_bot_verification=4096,
+                                 has_send_paid_messages_stars=16384),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'stories' / If(this.flags.has_stories, self.stories_peer_stories_structures('stories')),
+            'business_work_hours' / If(this.flags2.has_business_work_hours, self.struct_0x8c92b098()),
+            'business_location' / If(this.flags2.has_business_location, self.struct_0xac5c1af7()),
+            'business_greeting_message' / If(this.flags2.has_business_greeting_message, self.struct_0xe519abab()),
+            'business_away_message' / If(this.flags2.has_business_away_message, self.struct_0xef156a5c()),
+            'business_intro' / If(this.flags2.has_business_intro, self.struct_0x5a0a066d()),
+            'birthday' / If(this.flags2.has_birthday, self.struct_0x6c8e1e06()),
+            'personal_channel_id' / If(this.flags2.has_personal_channel_id, Int64ul),
+            'personal_channel_message' / If(this.flags2.has_personal_channel_id, Int32ul),
+            'stargifts_count' / If(this.flags2.has_stargifts_count, Int32ul),
+            'starref_program' / If(this.flags2.has_starref_program, self.struct_0xdd0c66f2()),
+            'bot_verification' / If(this.flags2.has_bot_verification, self.struct_0xf93cd45c()),
+            'send_paid_messages_stars' / If(this.flags2.has_send_paid_messages_stars, Int64ul))
+
+    @constructor(0x8555f3c2, 'user_full_layer199_2')
+    def struct_0x8555f3c2(self):
+        return Struct(
+            'sname' / Computed('user_full_layer199_2'),
+            'signature' / Hex(Const(0x8555f3c2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                is_stories_pinned_available=67108864,
+                                is_blocked_my_stories_from=134217728,
+                                is_wallpaper_overridden=268435456,
+                                is_contact_require_premium=536870912,
+                                is_read_dates_private=1073741824,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288,
+                                has_wallpaper=16777216,
+                                has_stories=33554432),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_sponsored_enabled=128,
+                                 is_can_view_revenue=512,
+                                 is_bot_can_manage_emoji_status=1024,
+                                 has_business_work_hours=1,
+                                 has_business_location=2,
+                                 has_business_greeting_message=4,
+                                 has_business_away_message=8,
+                                 has_business_intro=16,
+                                 has_birthday=32,
+                                 has_personal_channel_id=64,
+                                 has_stargifts_count=256,
+                                 has_starref_program=2048,
+                                 has_bot_verification=4096,
+                                 has_send_paid_messages_stars=16384),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'stories' / If(this.flags.has_stories, self.stories_peer_stories_structures('stories')),
+            'business_work_hours' / If(this.flags2.has_business_work_hours, self.struct_0x8c92b098()),
+            'business_location' / If(this.flags2.has_business_location, self.struct_0xac5c1af7()),
+            'business_greeting_message' / If(this.flags2.has_business_greeting_message, self.struct_0xe519abab()),
+            'business_away_message' / If(this.flags2.has_business_away_message, self.struct_0xef156a5c()),
+            'business_intro' / If(this.flags2.has_business_intro, self.struct_0x5a0a066d()),
+            'birthday' / If(this.flags2.has_birthday, self.struct_0x6c8e1e06()),
+            'personal_channel_id' / If(this.flags2.has_personal_channel_id, Int64ul),
+            'personal_channel_message' / If(this.flags2.has_personal_channel_id, Int32ul),
+            'stargifts_count' / If(this.flags2.has_stargifts_count, Int32ul),
+            'starref_program' / If(this.flags2.has_starref_program, self.struct_0xdd0c66f2()),
+            'bot_verification' / If(this.flags2.has_bot_verification, self.struct_0xf93cd45c()),
+            'send_paid_messages_stars' / If(this.flags2.has_send_paid_messages_stars, Int64ul))
+
+    @constructor(0x4d975bbc, 'user_full_layer199')
+    def struct_0x4d975bbc(self):
+        return Struct(
+            'sname' / Computed('user_full_layer199'),
+            'signature' / Hex(Const(0x4d975bbc, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                is_stories_pinned_available=67108864,
+                                is_blocked_my_stories_from=134217728,
+                                is_wallpaper_overridden=268435456,
+                                is_contact_require_premium=536870912,
+                                is_read_dates_private=1073741824,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288,
+                                has_wallpaper=16777216,
+                                has_stories=33554432),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_sponsored_enabled=128,
+                                 is_can_view_revenue=512,
+                                 is_bot_can_manage_emoji_status=1024,
+                                 has_business_work_hours=1,
+                                 has_business_location=2,
+                                 has_business_greeting_message=4,
+                                 has_business_away_message=8,
+                                 has_business_intro=16,
+                                 has_birthday=32,
+                                 has_personal_channel_id=64,
+                                 has_stargifts_count=256,
+                                 has_starref_program=2048,
+                                 has_bot_verification=4096),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'stories' / If(this.flags.has_stories, self.stories_peer_stories_structures('stories')),
+            'business_work_hours' / If(this.flags2.has_business_work_hours, self.struct_0x8c92b098()),
+            'business_location' / If(this.flags2.has_business_location, self.struct_0xac5c1af7()),
+            'business_greeting_message' / If(this.flags2.has_business_greeting_message, self.struct_0xe519abab()),
+            'business_away_message' / If(this.flags2.has_business_away_message, self.struct_0xef156a5c()),
+            'business_intro' / If(this.flags2.has_business_intro, self.struct_0x5a0a066d()),
+            'birthday' / If(this.flags2.has_birthday, self.struct_0x6c8e1e06()),
+            'personal_channel_id' / If(this.flags2.has_personal_channel_id, Int64ul),
+            'personal_channel_message' / If(this.flags2.has_personal_channel_id, Int32ul),
+            'stargifts_count' / If(this.flags2.has_stargifts_count, Int32ul),
+            'starref_program' / If(this.flags2.has_starref_program, self.struct_0xdd0c66f2()),
+            'bot_verification' / If(this.flags2.has_bot_verification, self.struct_0xf93cd45c()))
+
+    @constructor(0x979d2376, 'user_full_layer195')
+    def struct_0x979d2376(self):
+        return Struct(
+            'sname' / Computed('user_full_layer195'),
+            'signature' / Hex(Const(0x979d2376, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                is_stories_pinned_available=67108864,
+                                is_blocked_my_stories_from=134217728,
+                                is_wallpaper_overridden=268435456,
+                                is_contact_require_premium=536870912,
+                                is_read_dates_private=1073741824,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288,
+                                has_wallpaper=16777216,
+                                has_stories=33554432),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_sponsored_enabled=128,
+                                 is_can_view_revenue=512,
+                                 is_bot_can_manage_emoji_status=1024,
+                                 has_business_work_hours=1,
+                                 has_business_location=2,
+                                 has_business_greeting_message=4,
+                                 has_business_away_message=8,
+                                 has_business_intro=16,
+                                 has_birthday=32,
+                                 has_personal_channel_id=64,
+                                 has_stargifts_count=256,
+                                 has_starref_program=2048),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'stories' / If(this.flags.has_stories, self.stories_peer_stories_structures('stories')),
+            'business_work_hours' / If(this.flags2.has_business_work_hours, self.struct_0x8c92b098()),
+            'business_location' / If(this.flags2.has_business_location, self.struct_0xac5c1af7()),
+            'business_greeting_message' / If(this.flags2.has_business_greeting_message, self.struct_0xe519abab()),
+            'business_away_message' / If(this.flags2.has_business_away_message, self.struct_0xef156a5c()),
+            'business_intro' / If(this.flags2.has_business_intro, self.struct_0x5a0a066d()),
+            'birthday' / If(this.flags2.has_birthday, self.struct_0x6c8e1e06()),
+            'personal_channel_id' / If(this.flags2.has_personal_channel_id, Int64ul),
+            'personal_channel_message' / If(this.flags2.has_personal_channel_id, Int32ul),
+            'stargifts_count' / If(this.flags2.has_stargifts_count, Int32ul),
+            'starref_program' / If(this.flags2.has_starref_program, self.struct_0xdd0c66f2()))
+
+    @constructor(0x1f58e369, 'user_full_layer194')
+    def struct_0x1f58e369(self):
+        return Struct(
+            'sname' / Computed('user_full_layer194'),
+            'signature' / Hex(Const(0x1f58e369, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                is_stories_pinned_available=67108864,
+                                is_blocked_my_stories_from=134217728,
+                                is_wallpaper_overridden=268435456,
+                                is_contact_require_premium=536870912,
+                                is_read_dates_private=1073741824,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288,
+                                has_wallpaper=16777216,
+                                has_stories=33554432),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_sponsored_enabled=128,
+                                 is_can_view_revenue=512,
+                                 is_bot_can_manage_emoji_status=1024,
+                                 has_business_work_hours=1,
+                                 has_business_location=2,
+                                 has_business_greeting_message=4,
+                                 has_business_away_message=8,
+                                 has_business_intro=16,
+                                 has_birthday=32,
+                                 has_personal_channel_id=64,
+                                 has_stargifts_count=256),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'stories' / If(this.flags.has_stories, self.stories_peer_stories_structures('stories')),
+            'business_work_hours' / If(this.flags2.has_business_work_hours, self.struct_0x8c92b098()),
+            'business_location' / If(this.flags2.has_business_location, self.struct_0xac5c1af7()),
+            'business_greeting_message' / If(this.flags2.has_business_greeting_message, self.struct_0xe519abab()),
+            'business_away_message' / If(this.flags2.has_business_away_message, self.struct_0xef156a5c()),
+            'business_intro' / If(this.flags2.has_business_intro, self.struct_0x5a0a066d()),
+            'birthday' / If(this.flags2.has_birthday, self.struct_0x6c8e1e06()),
+            'personal_channel_id' / If(this.flags2.has_personal_channel_id, Int64ul),
+            'personal_channel_message' / If(this.flags2.has_personal_channel_id, Int32ul),
+            'stargifts_count' / If(this.flags2.has_stargifts_count, Int32ul))
+
+    @constructor(0xcc997720, 'user_full_layer188')
+    def struct_0xcc997720(self):
+        return Struct(
+            'sname' / Computed('user_full_layer188'),
+            'signature' / Hex(Const(0xcc997720, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                is_stories_pinned_available=67108864,
+                                is_blocked_my_stories_from=134217728,
+                                is_wallpaper_overridden=268435456,
+                                is_contact_require_premium=536870912,
+                                is_read_dates_private=1073741824,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288,
+                                has_wallpaper=16777216,
+                                has_stories=33554432),
+            'flags2' / FlagsEnum(Int32ul,
+                                 is_sponsored_enabled=128,
+                                 has_business_work_hours=1,
+                                 has_business_location=2,
+                                 has_business_greeting_message=4,
+                                 has_business_away_message=8,
+                                 has_business_intro=16,
+                                 has_birthday=32,
+                                 has_personal_channel_id=64),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'stories' / If(this.flags.has_stories, self.stories_peer_stories_structures('stories')),
+            'business_work_hours' / If(this.flags2.has_business_work_hours, self.struct_0x8c92b098()),
+            'business_location' / If(this.flags2.has_business_location, self.struct_0xac5c1af7()),
+            'business_greeting_message' / If(this.flags2.has_business_greeting_message, self.struct_0xe519abab()),
+            'business_away_message' / If(this.flags2.has_business_away_message, self.struct_0xef156a5c()),
+            'business_intro' / If(this.flags2.has_business_intro, self.struct_0x5a0a066d()),
+            'birthday' / If(this.flags2.has_birthday, self.struct_0x6c8e1e06()),
+            'personal_channel_id' / If(this.flags2.has_personal_channel_id, Int64ul),
+            'personal_channel_message' / If(this.flags2.has_personal_channel_id, Int32ul))
+
+    @constructor(0xecdadceb, 'user_full_layer176_3')
+    def struct_0xecdadceb(self):
+        return Struct(
+            'sname' / Computed('user_full_layer176_3'),
+            'signature' / Hex(Const(0xecdadceb, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                is_stories_pinned_available=67108864,
+                                is_blocked_my_stories_from=134217728,
+                                is_wallpaper_overridden=268435456,
+                                is_contact_require_premium=536870912,
+                                is_read_dates_private=1073741824,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288,
+                                has_wallpaper=16777216,
+                                has_stories=33554432),
+            'flags2' / FlagsEnum(Int32ul,
+                                 has_business_work_hours=1,
+                                 has_business_location=2,
+                                 has_business_greeting_message=4,
+                                 has_business_away_message=8,
+                                 has_business_intro=16,
+                                 has_birthday=32),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'stories' / If(this.flags.has_stories, self.stories_peer_stories_structures('stories')),
+            'business_work_hours' / If(this.flags2.has_business_work_hours, self.struct_0x8c92b098()),
+            'business_location' / If(this.flags2.has_business_location, self.struct_0xac5c1af7()),
+            'business_greeting_message' / If(this.flags2.has_business_greeting_message, self.struct_0xe519abab()),
+            'business_away_message' / If(this.flags2.has_business_away_message, self.struct_0xef156a5c()),
+            'business_intro' / If(this.flags2.has_business_intro, self.struct_0x5a0a066d()),
+            'birthday' / If(this.flags2.has_birthday, self.struct_0x6c8e1e06()))
+
+    @constructor(0x670bbc9c, 'user_full_layer176_2')
+    def struct_0x670bbc9c(self):
+        return Struct(
+            'sname' / Computed('user_full_layer176_2'),
+            'signature' / Hex(Const(0x670bbc9c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                is_stories_pinned_available=67108864,
+                                is_blocked_my_stories_from=134217728,
+                                is_wallpaper_overridden=268435456,
+                                is_contact_require_premium=536870912,
+                                is_read_dates_private=1073741824,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288,
+                                has_wallpaper=16777216,
+                                has_stories=33554432),
+            'flags2' / FlagsEnum(Int32ul,
+                                 has_business_work_hours=1,
+                                 has_business_location=2,
+                                 has_business_greeting_message=4,
+                                 has_business_away_message=8,
+                                 has_business_intro=16),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'stories' / If(this.flags.has_stories, self.stories_peer_stories_structures('stories')),
+            'business_work_hours' / If(this.flags2.has_business_work_hours, self.struct_0x8c92b098()),
+            'business_location' / If(this.flags2.has_business_location, self.struct_0xac5c1af7()),
+            'business_greeting_message' / If(this.flags2.has_business_greeting_message, self.struct_0xe519abab()),
+            'business_away_message' / If(this.flags2.has_business_away_message, self.struct_0xef156a5c()),
+            'business_intro' / If(this.flags2.has_business_intro, self.struct_0x5a0a066d()))
+
+    @constructor(0x22ff3e85, 'user_full_layer176')
+    def struct_0x22ff3e85(self):
+        return Struct(
+            'sname' / Computed('user_full_layer176'),
+            'signature' / Hex(Const(0x22ff3e85, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                is_stories_pinned_available=67108864,
+                                is_blocked_my_stories_from=134217728,
+                                is_wallpaper_overridden=268435456,
+                                is_contact_require_premium=536870912,
+                                is_read_dates_private=1073741824,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288,
+                                has_wallpaper=16777216,
+                                has_stories=33554432),
+            'flags2' / FlagsEnum(Int32ul,
+                                 has_business_work_hours=1,
+                                 has_business_location=2,
+                                 has_business_greeting_message=4,
+                                 has_business_away_message=8),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'stories' / If(this.flags.has_stories, self.stories_peer_stories_structures('stories')),
+            'business_work_hours' / If(this.flags2.has_business_work_hours, self.struct_0x8c92b098()),
+            'business_location' / If(this.flags2.has_business_location, self.struct_0xac5c1af7()),
+            'business_greeting_message' / If(this.flags2.has_business_greeting_message, self.struct_0xe519abab()),
+            'business_away_message' / If(this.flags2.has_business_away_message, self.struct_0xef156a5c()))
+
+    @constructor(0xb9b12c6c, 'user_full_layer175')
+    def struct_0xb9b12c6c(self):
+        return Struct(
+            'sname' / Computed('user_full_layer175'),
+            'signature' / Hex(Const(0xb9b12c6c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                is_stories_pinned_available=67108864,
+                                is_blocked_my_stories_from=134217728,
+                                is_wallpaper_overridden=268435456,
+                                is_contact_require_premium=536870912,
+                                is_read_dates_private=1073741824,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288,
+                                has_wallpaper=16777216,
+                                has_stories=33554432),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'stories' / If(this.flags.has_stories, self.stories_peer_stories_structures('stories')))
+
+    @constructor(0x4fe1cc86, 'user_full_layer162')
+    def struct_0x4fe1cc86(self):
+        return Struct(
+            'sname' / Computed('user_full_layer162'),
+            'signature' / Hex(Const(0x4fe1cc86, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                is_stories_pinned_available=67108864,
+                                is_blocked_my_stories_from=134217728,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288,
+                                has_wallpaper=16777216,
+                                has_stories=33554432),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')),
+            'stories' / If(this.flags.has_stories, self.stories_peer_stories_structures('stories')))
+
+    @constructor(0x93eadb53, 'user_full_layer159')
+    def struct_0x93eadb53(self):
+        return Struct(
+            'sname' / Computed('user_full_layer159'),
+            'signature' / Hex(Const(0x93eadb53, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288,
+                                has_wallpaper=16777216),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')),
+            'wallpaper' / If(this.flags.has_wallpaper, self.wall_paper_structures('wallpaper')))
+
+    @constructor(0xf8d32aed, 'user_full_layer156')
+    def struct_0xf8d32aed(self):
+        return Struct(
+            'sname' / Computed('user_full_layer156'),
+            'signature' / Hex(Const(0xf8d32aed, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                is_translations_disabled=8388608,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_fallback_photo=4194304,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'fallback_photo' / If(this.flags.has_fallback_photo, self.photo_structures('fallback_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')))
+
+    @constructor(0xec6d41e3, 'user_full_layer150_rev2')
+    def struct_0xec6d41e3(self):
+        return Struct(
+            'sname' / Computed('user_full_layer150_rev2'),
+            'signature' / Hex(Const(0xec6d41e3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                has_about=2,
+                                has_personal_photo=2097152,
+                                has_profile_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'personal_photo' / If(this.flags.has_personal_photo, self.photo_structures('personal_photo')),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')))
+
+    @constructor(0xc4b1fc3f, 'user_full_layer150')
+    def struct_0xc4b1fc3f(self):
+        return Struct(
+            'sname' / Computed('user_full_layer150'),
+            'signature' / Hex(Const(0xc4b1fc3f, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                is_voice_messages_forbidden=1048576,
+                                has_about=2,
+                                has_profile_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144,
+                                has_premium_gifts=524288),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()),
+            'premium_gifts' / If(this.flags.has_premium_gifts, self.vector(self.premium_gift_option_structures('premium_gifts'), 'premium_gifts')))
+
+    @constructor(0x8c72ea81, 'user_full_layer143')
+    def struct_0x8c72ea81(self):
+        return Struct(
+            'sname' / Computed('user_full_layer143'),
+            'signature' / Hex(Const(0x8c72ea81, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                has_about=2,
+                                has_profile_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536,
+                                has_bot_group_admin_rights=131072,
+                                has_bot_broadcast_admin_rights=262144),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString),
+            'bot_group_admin_rights' / If(this.flags.has_bot_group_admin_rights, self.struct_0x5fb224d5()),
+            'bot_broadcast_admin_rights' / If(this.flags.has_bot_broadcast_admin_rights, self.struct_0x5fb224d5()))
+
+    @constructor(0xcf366521, 'user_full_layer139')
+    def struct_0xcf366521(self):
+        return Struct(
+            'sname' / Computed('user_full_layer139'),
+            'signature' / Hex(Const(0xcf366521, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                has_about=2,
+                                has_profile_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768,
+                                has_private_forward_name=65536),
+            'id' / Int64ul,
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString),
+            'private_forward_name' / If(this.flags.has_private_forward_name, TString))
+
+    @constructor(0xd697ff05, 'user_full_layer134')
+    def struct_0xd697ff05(self):
+        return Struct(
+            'sname' / Computed('user_full_layer134'),
+            'signature' / Hex(Const(0xd697ff05, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                has_about=2,
+                                has_profile_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384,
+                                has_theme_emoticon=32768),
+            'user' / self.user_structures('user'),
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul),
+            'theme_emoticon' / If(this.flags.has_theme_emoticon, TString))
+
+    @constructor(0x139a9a77, 'user_full_layer131')
+    def struct_0x139a9a77(self):
+        return Struct(
+            'sname' / Computed('user_full_layer131'),
+            'signature' / Hex(Const(0x139a9a77, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                is_video_calls_available=8192,
+                                has_about=2,
+                                has_profile_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048,
+                                has_ttl_period=16384),
+            'user' / self.user_structures('user'),
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul),
+            'ttl_period' / If(this.flags.has_ttl_period, Int32ul))
+
+    @constructor(0x745559cc, 'user_full_layer101')
+    def struct_0x745559cc(self):
+        return Struct(
+            'sname' / Computed('user_full_layer101'),
+            'signature' / Hex(Const(0x745559cc, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_about=2,
+                                has_profile_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048),
+            'user' / self.user_structures('user'),
+            'about' / If(this.flags.has_about, TString),
+            'link' / self.struct_0x3ace484c(),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul))
+
+    @constructor(0x8ea4a881, 'user_full_layer98')
+    def struct_0x8ea4a881(self):
+        return Struct(
+            'sname' / Computed('user_full_layer98'),
+            'signature' / Hex(Const(0x8ea4a881, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_about=2,
+                                has_profile_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64),
+            'user' / self.user_structures('user'),
+            'about' / If(this.flags.has_about, TString),
+            'link' / self.struct_0x3ace484c(),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul)
+
+    @constructor(0xedf17c12, 'user_full_layer123')
+    def struct_0xedf17c12(self):
+        return Struct(
+            'sname' / Computed('user_full_layer123'),
+            'signature' / Hex(Const(0xedf17c12, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blocked=1,
+                                is_phone_calls_available=16,
+                                is_phone_calls_private=32,
+                                is_can_pin_message=128,
+                                has_scheduled=4096,
+                                has_about=2,
+                                has_profile_photo=4,
+                                has_bot_info=8,
+                                has_pinned_msg_id=64,
+                                has_folder_id=2048),
+            'user' / self.user_structures('user'),
+            'about' / If(this.flags.has_about, TString),
+            'settings' / self.peer_settings_structures('settings'),
+            'profile_photo' / If(this.flags.has_profile_photo, self.photo_structures('profile_photo')),
+            'notify_settings' / self.peer_notify_settings_structures('notify_settings'),
+            'bot_info' / If(this.flags.has_bot_info, self.bot_info_structures('bot_info')),
+            'pinned_msg_id' / If(this.flags.has_pinned_msg_id, Int32ul),
+            'common_chats_count' / Int32ul,
+            'folder_id' / If(this.flags.has_folder_id, Int32ul))
+
+    @structures
+    def user_full_structures(self, name):
+        tag_map = {
+            0xd2234ea0: LazyBound(self.struct_0xd2234ea0),
+            0x8555f3c2: LazyBound(self.struct_0x8555f3c2),
+            0x4d975bbc: LazyBound(self.struct_0x4d975bbc),
+            0x979d2376: LazyBound(self.struct_0x979d2376),
+            0x1f58e369: LazyBound(self.struct_0x1f58e369),
+            0xcc997720: LazyBound(self.struct_0xcc997720),
+            0xecdadceb: LazyBound(self.struct_0xecdadceb),
+            0x670bbc9c: LazyBound(self.struct_0x670bbc9c),
+            0x22ff3e85: LazyBound(self.struct_0x22ff3e85),
+            0xb9b12c6c: LazyBound(self.struct_0xb9b12c6c),
+            0x4fe1cc86: LazyBound(self.struct_0x4fe1cc86),
+            0x93eadb53: LazyBound(self.struct_0x93eadb53),
+            0xf8d32aed: LazyBound(self.struct_0xf8d32aed),
+            0xec6d41e3: LazyBound(self.struct_0xec6d41e3),
+            0xc4b1fc3f: LazyBound(self.struct_0xc4b1fc3f),
+            0x8c72ea81: LazyBound(self.struct_0x8c72ea81),
+            0xcf366521: LazyBound(self.struct_0xcf366521),
+            0xd697ff05: LazyBound(self.struct_0xd697ff05),
+            0x139a9a77: LazyBound(self.struct_0x139a9a77),
+            0x745559cc: LazyBound(self.struct_0x745559cc),
+            0x8ea4a881: LazyBound(self.struct_0x8ea4a881),
+            0xedf17c12: LazyBound(self.struct_0xedf17c12)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x120b1ab9, 'account_business_weekly_open')
+    def struct_0x120b1ab9(self):
+        return (
+            'start_minute' / Int32ul,
+            'end_minute' / Int32ul)
+
+    @constructor(0x21108ff7, 'account_business_recipients')
+    def struct_0x21108ff7(self):
+        return Struct(
+            'sname' / Computed('account_business_recipients'),
+            'signature' / Hex(Const(0x21108ff7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_existing_chats=1,
+                                is_new_chats=2,
+                                is_contacts=4,
+                                is_non_contacts=8,
+                                is_exclude_selected=32,
+                                has_users=16),
+            'users' / If(this.flags.has_users, self.vector(Int64ul, 'users')))
+
+    @constructor(0x3ace484c, 'contacts_link_layer101')
+    def struct_0x3ace484c(self):
+        return (
+            'my_link' / self.contact_link_layer101_structures('my_link'),
+            'foreign_link' / self.contact_link_layer101_structures('foreign_link'),
+            'user' / self.user_structures('user'))
+
+    @constructor(0x5a0a066d, 'account_business_intro')
+    def struct_0x5a0a066d(self):
+        return Struct(
+            'sname' / Computed('account_business_intro'),
+            'signature' / Hex(Const(0x5a0a066d, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_sticker=1),
+            'title' / TString,
+            'description' / TString,
+            'sticker' / If(this.flags.has_sticker, self.document_structures('sticker')))
+
+    @constructor(0x8c92b098, 'account_business_work_hours')
+    def struct_0x8c92b098(self):
+        return Struct(
+            'sname' / Computed('account_business_work_hours'),
+            'signature' / Hex(Const(0x8c92b098, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_open_now=1),
+            'timezone_id' / TString,
+            'weekly_open' / self.vector(self.struct_0x120b1ab9(), 'weekly_open'))
+
+    @constructor(0xac5c1af7, 'business_location')
+    def struct_0xac5c1af7(self):
+        return Struct(
+            'sname' / Computed('business_location'),
+            'signature' / Hex(Const(0xac5c1af7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_geo_point=1),
+            'geo_point' / If(this.flags.has_geo_point, self.geo_point_structures('geo_point')),
+            'address' / TString)
+
+    @constructor(0xdd0c66f2, 'payments_star_ref_program')
+    def struct_0xdd0c66f2(self):
+        return Struct(
+            'sname' / Computed('payments_star_ref_program'),
+            'signature' / Hex(Const(0xdd0c66f2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_duration_months=1,
+                                has_end_date=2,
+                                has_daily_revenue_per_user=4),
+            'bot_id' / Int64ul,
+            'commission_permille' / Int32ul,
+            'duration_months' / If(this.flags.has_duration_months, Int32ul),
+            'end_date' / If(this.flags.has_end_date, TTimestamp),
+            'daily_revenue_per_user' / If(this.flags.has_daily_revenue_per_user, self.struct_0xbbb6b4a3()))
+
+    @constructor(0xe519abab, 'account_business_greeting_message')
+    def struct_0xe519abab(self):
+        return (
+            'shortcut_id' / Int32ul,
+            'recipients' / self.struct_0x21108ff7(),
+            'no_activity_days' / Int32ul)
+
+    @constructor(0xef156a5c, 'account_business_away_message')
+    def struct_0xef156a5c(self):
+        return Struct(
+            'sname' / Computed('account_business_away_message'),
+            'signature' / Hex(Const(0xef156a5c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_offline_only=1),
+            'shortcut_id' / Int32ul,
+            'schedule' / self.account_business_away_message_schedule_structures('schedule'),
+            'recipients' / self.struct_0x21108ff7())
+
+    @constructor(0xf93cd45c, 'bot_verification')
+    def struct_0xf93cd45c(self):
+        return (
+            'bot_id' / Int64ul,
+            'icon' / Int64ul,
+            'description' / TString)
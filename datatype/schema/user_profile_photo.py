@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group user_profile_photo of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x69d3ab26, 'user_profile_photo_layer126')
+    def struct_0x69d3ab26(self):
+        return Struct(
+            'sname' / Computed('user_profile_photo_layer126'),
+            'signature' / Hex(Const(0x69d3ab26, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_video=1),
+            'photo_id' / Int64ul,
+            'photo_small' / self.file_location_structures('photo_small'),
+            'photo_big' / self.file_location_structures('photo_big'),
+            'dc_id' / Int32ul)
+
+    @constructor(0xecd75d8c, 'user_profile_photo_layer115')
+    def struct_0xecd75d8c(self):
+        return (
+            'photo_id' / Int64ul,
+            'photo_small' / self.file_location_structures('photo_small'),
+            'photo_big' / self.file_location_structures('photo_big'),
+            'dc_id' / Int32ul)
+
+    @constructor(0x4f11bae1, 'user_profile_photo_empty')
+    def struct_0x4f11bae1(self):
+        return []
+
+    @constructor(0xd559d8c8, 'user_profile_photo_layer97')
+    def struct_0xd559d8c8(self):
+        return (
+            'photo_id' / Int64ul,
+            'photo_small' / self.file_location_structures('photo_small'),
+            'photo_big' / self.file_location_structures('photo_big'))
+
+    @constructor(0x990d1493, 'user_profile_photo_old')
+    def struct_0x990d1493(self):
+        return (
+            'photo_small' / self.file_location_structures('photo_small'),
+            'photo_big' / self.file_location_structures('photo_big'))
+
+    @constructor(0xcc656077, 'user_profile_photo_layer127')
+    def struct_0xcc656077(self):
+        return Struct(
+            'sname' / Computed('user_profile_photo_layer127'),
+            'signature' / Hex(Const(0xcc656077, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_video=1,
+                                has_stripped_thumb=2),
+            'photo_id' / Int64ul,
+            'photo_small' / self.file_location_structures('photo_small'),
+            'photo_big' / self.file_location_structures('photo_big'),
+            'stripped_thumb' / If(this.flags.has_stripped_thumb, TBytes),
+            'dc_id' / Int32ul)
+
+    @constructor(0x82d1f706, 'user_profile_photo')
+    def struct_0x82d1f706(self):
+        return Struct(
+            'sname' / Computed('user_profile_photo'),
+            'signature' / Hex(Const(0x82d1f706, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_video=1,
+                                is_personal=4,
+                                has_stripped_thumb=2),
+            'photo_id' / Int64ul,
+            'stripped_thumb' / If(this.flags.has_stripped_thumb, TBytes),
+            'dc_id' / Int32ul)
+
+    @structures
+    def user_profile_photo_structures(self, name):
+        tag_map = {
+            0x69d3ab26: LazyBound(self.struct_0x69d3ab26),
+            0xecd75d8c: LazyBound(self.struct_0xecd75d8c),
+            0x4f11bae1: LazyBound(self.struct_0x4f11bae1),
+            0xd559d8c8: LazyBound(self.struct_0xd559d8c8),
+            0x990d1493: LazyBound(self.struct_0x990d1493),
+            0xcc656077: LazyBound(self.struct_0xcc656077),
+            0x82d1f706: LazyBound(self.struct_0x82d1f706)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group user_status of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x008c703f, 'user_status_offline')
+    def struct_0x008c703f(self):
+        return ['expires' / Int32ul]
+
+    @constructor(0x541a1d1a, 'user_status_last_week')
+    def struct_0x541a1d1a(self):
+        return Struct(
+            'sname' / Computed('user_status_last_week'),
+            'signature' / Hex(Const(0x541a1d1a, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_by_me=1))
+
+    @constructor(0x07bf09fc, 'user_status_last_week_layer171')
+    def struct_0x07bf09fc(self):
+        return []
+
+    @constructor(0x09d05049, 'user_status_empty')
+    def struct_0x09d05049(self):
+        return []
+
+    @constructor(0x65899777, 'user_status_last_month')
+    def struct_0x65899777(self):
+        return Struct(
+            'sname' / Computed('user_status_last_month'),
+            'signature' / Hex(Const(0x65899777, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_by_me=1))
+
+    @constructor(0x77ebc742, 'user_status_last_month_layer171')
+    def struct_0x77ebc742(self):
+        return []
+
+    @constructor(0xedb93949, 'user_status_online')
+    def struct_0xedb93949(self):
+        return ['expires' / Int32ul]
+
+    @constructor(0x7b197dc8, 'user_status_recently')
+    def struct_0x7b197dc8(self):
+        return Struct(
+            'sname' / Computed('user_status_recently'),
+            'signature' / Hex(Const(0x7b197dc8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_by_me=1))
+
+    @constructor(0xe26f42f1, 'user_status_recently_layer171')
+    def struct_0xe26f42f1(self):
+        return []
+
+    @constructor(0xcf7d64b1, 'user_status_hidden')
+    def struct_0xcf7d64b1(self):
+        return []
+
+    @structures
+    def user_status_structures(self, name):
+        tag_map = {
+            0x008c703f: LazyBound(self.struct_0x008c703f),
+            0x541a1d1a: LazyBound(self.struct_0x541a1d1a),
+            0x07bf09fc: LazyBound(self.struct_0x07bf09fc),
+            0x09d05049: LazyBound(self.struct_0x09d05049),
+            0x65899777: LazyBound(self.struct_0x65899777),
+            0x77ebc742: LazyBound(self.struct_0x77ebc742),
+            0xedb93949: LazyBound(self.struct_0xedb93949),
+            0x7b197dc8: LazyBound(self.struct_0x7b197dc8),
+            0xe26f42f1: LazyBound(self.struct_0xe26f42f1),
+            0xcf7d64b1: LazyBound(self.struct_0xcf7d64b1)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group users of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x62d706b8, 'users')
+    def struct_0x62d706b8(self):
+        return ['users' / self.vector(self.user_structures('users'), 'users')]
+
+    @constructor(0x315a4974, 'users_slice')
+    def struct_0x315a4974(self):
+        return (
+            'count' / Int32ul,
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @structures
+    def users_structures(self, name):
+        tag_map = {
+            0x62d706b8: LazyBound(self.struct_0x62d706b8),
+            0x315a4974: LazyBound(self.struct_0x315a4974)
+        }
+        return TLUnion(name, tag_map)
+
+    @constructor(0x0d91a548, 'users_get_users')
+    def struct_0x0d91a548(self):
+        return ['id' / self.vector(self.input_user_structures('id'), 'id')]
+
+    @constructor(0x3b6d152e, 'users_user_full')
+    def struct_0x3b6d152e(self):
+        return (
+            'full_user' / self.user_full_structures('full_user'),
+            'chats' / self.vector(self.chat_structures('chats'), 'chats'),
+            'users' / self.vector(self.user_structures('users'), 'users'))
+
+    @constructor(0xa622aa10, 'users_get_is_premium_required_to_contact')
+    def struct_0xa622aa10(self):
+        return ['id' / self.vector(self.input_user_structures('id'), 'id')]
+
+    @constructor(0xb60f5918, 'users_get_full_user')
+    def struct_0xb60f5918(self):
+        return ['id' / self.input_user_structures('id')]
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group video of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xee9f4a4d, 'video_old3')
+    def struct_0xee9f4a4d(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'user_id' / Int32ul,
+            'date' / TTimestamp,
+            'duration' / Int32ul,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul,
+            'w' / Int32ul,
+            'h' / Int32ul)
+
+    @constructor(0xf72887d3, 'video_layer45')
+    def struct_0xf72887d3(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'date' / TTimestamp,
+            'duration' / Int32ul,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul,
+            'w' / Int32ul,
+            'h' / Int32ul)
+
+    @constructor(0x55555553, 'video_encrypted')
+    def struct_0x55555553(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'user_id' / Int32ul,
+            'date' / TTimestamp,
+            'caption' / TString,
+            'duration' / Int32ul,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'key' / TBytes,
+            'iv' / TBytes)
+
+    @constructor(0x5a04a49f, 'video_old')
+    def struct_0x5a04a49f(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'user_id' / Int32ul,
+            'date' / TTimestamp,
+            'caption' / TString,
+            'duration' / Int32ul,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul,
+            'w' / Int32ul,
+            'h' / Int32ul)
+
+    @constructor(0x388fa391, 'video_old2')
+    def struct_0x388fa391(self):
+        return (
+            'id' / Int64ul,
+            'access_hash' / Int64ul,
+            'user_id' / Int32ul,
+            'date' / TTimestamp,
+            'caption' / TString,
+            'duration' / Int32ul,
+            'mime_type' / TString,
+            'size' / Int32ul,
+            'thumb' / self.photo_size_structures('thumb'),
+            'dc_id' / Int32ul,
+            'w' / Int32ul,
+            'h' / Int32ul)
+
+    @constructor(0xc10658a8, 'video_empty_layer45')
+    def struct_0xc10658a8(self):
+        return ['id' / Int64ul]
+
+    @structures
+    def video_structures(self, name):
+        tag_map = {
+            0xee9f4a4d: LazyBound(self.struct_0xee9f4a4d),
+            0xf72887d3: LazyBound(self.struct_0xf72887d3),
+            0x55555553: LazyBound(self.struct_0x55555553),
+            0x5a04a49f: LazyBound(self.struct_0x5a04a49f),
+            0x388fa391: LazyBound(self.struct_0x388fa391),
+            0xc10658a8: LazyBound(self.struct_0xc10658a8)
+        }
+        return TLUnion(name, tag_map)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group video_size of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x435bb987, 'video_size_layer115')
+    def struct_0x435bb987(self):
+        return (
+            'type' / TString,
+            'location' / self.file_location_structures('location'),
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'size' / Int32ul)
+
+    @constructor(0xe831c556, 'video_size_layer127')
+    def struct_0xe831c556(self):
+        return Struct(
+            'sname' / Computed('video_size_layer127'),
+            'signature' / Hex(Const(0xe831c556, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_video_start_ts=1),
+            'type' / TString,
+            'location' / self.file_location_structures('location'),
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'size' / Int32ul,
+            'video_start_ts' / If(this.flags.has_video_start_ts, Double))
+
+    @constructor(0xde33b094, 'video_size')
+    def struct_0xde33b094(self):
+        return Struct(
+            'sname' / Computed('video_size'),
+            'signature' / Hex(Const(0xde33b094, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_video_start_ts=1),
+            'type' / TString,
+            'w' / Int32ul,
+            'h' / Int32ul,
+            'size' / Int32ul,
+            'video_start_ts' / If(this.flags.has_video_start_ts, Double))
+
+    @constructor(0x0da082fe, 'video_size_sticker_markup')
+    def struct_0x0da082fe(self):
+        return (
+            'stickerset' / self.input_sticker_set_structures('stickerset'),
+            'sticker_id' / Int64ul,
+            'background_colors' / self.vector(Int32ul, 'background_colors'))
+
+    @constructor(0xf85c413c, 'video_size_emoji_markup')
+    def struct_0xf85c413c(self):
+        return (
+            'emoji_id' / Int64ul,
+            'background_colors' / self.vector(Int32ul, 'background_colors'))
+
+    @structures
+    def video_size_structures(self, name):
+        tag_map = {
+            0x435bb987: LazyBound(self.struct_0x435bb987),
+            0xe831c556: LazyBound(self.struct_0xe831c556),
+            0xde33b094: LazyBound(self.struct_0xde33b094),
+            0x0da082fe: LazyBound(self.struct_0x0da082fe),
+            0xf85c413c: LazyBound(self.struct_0xf85c413c)
+        }
+        return TLUnion(name, tag_map)
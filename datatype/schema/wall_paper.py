@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group wall_paper of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa437c3ed, 'wall_paper')
+    def struct_0xa437c3ed(self):
+        return Struct(
+            'sname' / Computed('wall_paper'),
+            'signature' / Hex(Const(0xa437c3ed, Int32ul)),
+            'id' / Int64ul,
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_default=2,
+                                is_pattern=8,
+                                is_dark=16,
+                                has_settings=4),
+            'access_hash' / Int64ul,
+            'slug' / TString,
+            'document' / self.document_structures('document'),
+            'settings' / If(this.flags.has_settings, self.wall_paper_settings_structures('settings')))
+
+    @constructor(0xf04f91ec, 'wall_paper_layer94')
+    def struct_0xf04f91ec(self):
+        return Struct(
+            'sname' / Computed('wall_paper_layer94'),
+            'signature' / Hex(Const(0xf04f91ec, Int32ul)),
+            'id' / Int64ul,
+            'flags' / FlagsEnum(Int32ul,
+                                is_creator=1,
+                                is_default=2),
+            'access_hash' / Int64ul,
+            'slug' / TString,
+            'document' / self.document_structures('document'))
+
+    @constructor(0x8af40b25, 'wall_paper_no_file_layer128')
+    def struct_0x8af40b25(self):
+        return Struct(
+            'sname' / Computed('wall_paper_no_file_layer128'),
+            'signature' / Hex(Const(0x8af40b25, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_default=2,
+                                is_dark=16,
+                                has_settings=4),
+            'settings' / If(this.flags.has_settings, self.wall_paper_settings_structures('settings')))
+
+    @constructor(0xe0804116, 'wall_paper_no_file')
+    def struct_0xe0804116(self):
+        return Struct(
+            'sname' / Computed('wall_paper_no_file'),
+            'signature' / Hex(Const(0xe0804116, Int32ul)),
+            'id' / Int64ul,
+            'flags' / FlagsEnum(Int32ul,
+                                is_default=2,
+                                is_dark=16,
+                                has_settings=4),
+            'settings' / If(this.flags.has_settings, self.wall_paper_settings_structures('settings')))
+
+    @structures
+    def wall_paper_structures(self, name):
+        tag_map = {
+            0xa437c3ed: LazyBound(self.struct_0xa437c3ed),
+            0xf04f91ec: LazyBound(self.struct_0xf04f91ec),
+            0x8af40b25: LazyBound(self.struct_0x8af40b25),
+            0xe0804116: LazyBound(self.struct_0xe0804116)
+        }
+        return TLUnion(name, tag_map)
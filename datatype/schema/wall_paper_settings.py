@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group wall_paper_settings of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xa12f40b8, 'wall_paper_settings_layer106')
+    def struct_0xa12f40b8(self):
+        return Struct(
+            'sname' / Computed('wall_paper_settings_layer106'),
+            'signature' / Hex(Const(0xa12f40b8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blur=2,
+                                is_motion=4,
+                                has_background_color=1,
+                                has_intensity=8),
+            'background_color' / If(this.flags.has_background_color, Int32ul),
+            'intensity' / If(this.flags.has_intensity, Int32ul))
+
+    @constructor(0x05086cf8, 'wall_paper_settings_layer128')
+    def struct_0x05086cf8(self):
+        return Struct(
+            'sname' / Computed('wall_paper_settings_layer128'),
+            'signature' / Hex(Const(0x05086cf8, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blur=2,
+                                is_motion=4,
+                                has_background_color=1,
+                                has_second_background_color=16,
+                                has_intensity=8),
+            'background_color' / If(this.flags.has_background_color, Int32ul),
+            'second_background_color' / If(this.flags.has_second_background_color, Int32ul),
+            'intensity' / If(this.flags.has_intensity, Int32ul),
+            'rotation' / If(this.flags.has_second_background_color, Int32ul))
+
+    @constructor(0x1dc1bca4, 'wall_paper_settings_layer167')
+    def struct_0x1dc1bca4(self):
+        return Struct(
+            'sname' / Computed('wall_paper_settings_layer167'),
+            'signature' / Hex(Const(0x1dc1bca4, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blur=2,
+                                is_motion=4,
+                                has_background_color=1,
+                                has_second_background_color=16,
+                                has_third_background_color=32,
+                                has_fourth_background_color=64,
+                                has_intensity=8),
+            'background_color' / If(this.flags.has_background_color, Int32ul),
+            'second_background_color' / If(this.flags.has_second_background_color, Int32ul),
+            'third_background_color' / If(this.flags.has_third_background_color, Int32ul),
+            'fourth_background_color' / If(this.flags.has_fourth_background_color, Int32ul),
+            'intensity' / If(this.flags.has_intensity, Int32ul),
+            'rotation' / If(this.flags.has_second_background_color, Int32ul))
+
+    @constructor(0x372efcd0, 'wall_paper_settings')
+    def struct_0x372efcd0(self):
+        return Struct(
+            'sname' / Computed('wall_paper_settings'),
+            'signature' / Hex(Const(0x372efcd0, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_blur=2,
+                                is_motion=4,
+                                has_background_color=1,
+                                has_second_background_color=16,
+                                has_third_background_color=32,
+                                has_fourth_background_color=64,
+                                has_intensity=8,
+                                has_emoticon=128),
+            'background_color' / If(this.flags.has_background_color, Int32ul),
+            'second_background_color' / If(this.flags.has_second_background_color, Int32ul),
+            'third_background_color' / If(this.flags.has_third_background_color, Int32ul),
+            'fourth_background_color' / If(this.flags.has_fourth_background_color, Int32ul),
+            'intensity' / If(this.flags.has_intensity, Int32ul),
+            'rotation' / If(this.flags.has_second_background_color, Int32ul),
+            'emoticon' / If(this.flags.has_emoticon, TString))
+
+    @structures
+    def wall_paper_settings_structures(self, name):
+        tag_map = {
+            0xa12f40b8: LazyBound(self.struct_0xa12f40b8),
+            0x05086cf8: LazyBound(self.struct_0x05086cf8),
+            0x1dc1bca4: LazyBound(self.struct_0x1dc1bca4),
+            0x372efcd0: LazyBound(self.struct_0x372efcd0)
+        }
+        return TLUnion(name, tag_map)
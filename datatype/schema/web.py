@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group web of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x0c14557c, 'web_view_result_url')
+    def struct_0x0c14557c(self):
+        return (
+            'query_id' / Int64ul,
+            'url' / TString)
+
+    @constructor(0x0c94511c, 'web_view_message_sent')
+    def struct_0x0c94511c(self):
+        return Struct(
+            'sname' / Computed('web_view_message_sent'),
+            'signature' / Hex(Const(0x0c94511c, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_msg_id=1),
+            'msg_id' / If(this.flags.has_msg_id, self.struct_0x890c3d89()))
+
+    @constructor(0x4d22ff98, 'web_view_result_url')
+    def struct_0x4d22ff98(self):
+        return Struct(
+            'sname' / Computed('web_view_result_url'),
+            'signature' / Hex(Const(0x4d22ff98, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_fullsize=2,
+                                is_fullscreen=4,
+                                has_query_id=1),
+            'query_id' / If(this.flags.has_query_id, Int64ul),
+            'url' / TString)
+
+    @constructor(0x890c3d89, 'input_bot_inline_message_id')
+    def struct_0x890c3d89(self):
+        return (
+            'dc_id' / Int32ul,
+            'id' / Int64ul,
+            'access_hash' / Int64ul)
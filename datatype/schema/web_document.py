@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group web_document of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xf9c8bcc6, 'web_document_no_proxy')
+    def struct_0xf9c8bcc6(self):
+        return (
+            'url' / TString,
+            'size' / Int32ul,
+            'mime_type' / TString,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'))
+
+    @constructor(0xc61acbd8, 'web_document_layer81')
+    def struct_0xc61acbd8(self):
+        return (
+            'url' / TString,
+            'access_hash' / Int64ul,
+            'size' / Int32ul,
+            'mime_type' / TString,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'),
+            '_reserve' / Int32ul)
+
+    @constructor(0x1c570ed1, 'web_document')
+    def struct_0x1c570ed1(self):
+        return (
+            'url' / TString,
+            'access_hash' / Int64ul,
+            'size' / Int32ul,
+            'mime_type' / TString,
+            'attributes' / self.vector(self.document_attribute_structures('attributes'), 'attributes'))
+
+    @structures
+    def web_document_structures(self, name):
+        tag_map = {
+            0xf9c8bcc6: LazyBound(self.struct_0xf9c8bcc6),
+            0xc61acbd8: LazyBound(self.struct_0xc61acbd8),
+            0x1c570ed1: LazyBound(self.struct_0x1c570ed1)
+        }
+        return TLUnion(name, tag_map)
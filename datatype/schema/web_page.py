@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group web_page of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0xe89c45b2, 'web_page')
+    def struct_0xe89c45b2(self):
+        return Struct(
+            'sname' / Computed('web_page'),
+            'signature' / Hex(Const(0xe89c45b2, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_large_media=8192,
+                                is_video_cover_photo=16384,
+                                has_type=1,
+                                has_site_name=2,
+                                has_title=4,
+                                has_description=8,
+                                has_photo=16,
+                                has_embed_url=32,
+                                has_embed_width=64,
+                                has_duration=128,
+                                has_author=256,
+                                has_document=512,
+                                has_cached_page=1024,
+                                has_attributes=4096),
+            'id' / Int64ul,
+            'url' / TString,
+            'display_url' / TString,
+            'hash' / Int32ul,
+            'type' / If(this.flags.has_type, TString),
+            'site_name' / If(this.flags.has_site_name, TString),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.photo_structures('photo')),
+            'embed_url' / If(this.flags.has_embed_url, TString),
+            'embed_type' / If(this.flags.has_embed_url, TString),
+            'embed_width' / If(this.flags.has_embed_width, Int32ul),
+            'embed_height' / If(this.flags.has_embed_width, Int32ul),
+            'duration' / If(this.flags.has_duration, Int32ul),
+            'author' / If(this.flags.has_author, TString),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'cached_page' / If(this.flags.has_cached_page, self.page_structures('cached_page')),
+            'attributes' / If(this.flags.has_attributes, self.vector(self.web_page_attribute_structures('attributes'), 'attributes')))
+
+    @constructor(0xfa64e172, 'web_page_layer107')
+    def struct_0xfa64e172(self):
+        return Struct(
+            'sname' / Computed('web_page_layer107'),
+            'signature' / Hex(Const(0xfa64e172, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_type=1,
+                                has_site_name=2,
+                                has_title=4,
+                                has_description=8,
+                                has_photo=16,
+                                has_embed_url=32,
+                                has_embed_width=64,
+                                has_duration=128,
+                                has_author=256,
+                                has_document=512,
+                                has_cached_page=1024,
+                                has_attributes=2048),
+            'id' / Int64ul,
+            'url' / TString,
+            'display_url' / TString,
+            'hash' / Int32ul,
+            'type' / If(this.flags.has_type, TString),
+            'site_name' / If(this.flags.has_site_name, TString),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.photo_structures('photo')),
+            'embed_url' / If(this.flags.has_embed_url, TString),
+            'embed_type' / If(this.flags.has_embed_url, TString),
+            'embed_width' / If(this.flags.has_embed_width, Int32ul),
+            'embed_height' / If(this.flags.has_embed_width, Int32ul),
+            'duration' / If(this.flags.has_duration, Int32ul),
+            'author' / If(this.flags.has_author, TString),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'attributes' / If(this.flags.has_attributes, self.vector(self.document_structures('attributes'), 'attributes')),
+            'cached_page' / If(this.flags.has_cached_page, self.page_structures('cached_page')))
+
+    @constructor(0x5f07b4bc, 'web_page_layer104')
+    def struct_0x5f07b4bc(self):
+        return Struct(
+            'sname' / Computed('web_page_layer104'),
+            'signature' / Hex(Const(0x5f07b4bc, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_type=1,
+                                has_site_name=2,
+                                has_title=4,
+                                has_description=8,
+                                has_photo=16,
+                                has_embed_url=32,
+                                has_embed_width=64,
+                                has_duration=128,
+                                has_author=256,
+                                has_document=512,
+                                has_cached_page=1024),
+            'id' / Int64ul,
+            'url' / TString,
+            'display_url' / TString,
+            'hash' / Int32ul,
+            'type' / If(this.flags.has_type, TString),
+            'site_name' / If(this.flags.has_site_name, TString),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.photo_structures('photo')),
+            'embed_url' / If(this.flags.has_embed_url, TString),
+            'embed_type' / If(this.flags.has_embed_url, TString),
+            'embed_width' / If(this.flags.has_embed_width, Int32ul),
+            'embed_height' / If(this.flags.has_embed_width, Int32ul),
+            'duration' / If(this.flags.has_duration, Int32ul),
+            'author' / If(this.flags.has_author, TString),
+            'document' / If(this.flags.has_document, self.document_structures('document')),
+            'cached_page' / If(this.flags.has_cached_page, self.page_structures('cached_page')))
+
+    @constructor(0xa31ea0b5, 'web_page_old')
+    def struct_0xa31ea0b5(self):
+        return Struct(
+            'sname' / Computed('web_page_old'),
+            'signature' / Hex(Const(0xa31ea0b5, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_type=1,
+                                has_site_name=2,
+                                has_title=4,
+                                has_description=8,
+                                has_photo=16,
+                                has_embed_url=32,
+                                has_embed_width=64,
+                                has_duration=128,
+                                has_author=256),
+            'id' / Int64ul,
+            'url' / TString,
+            'display_url' / TString,
+            'type' / If(this.flags.has_type, TString),
+            'site_name' / If(this.flags.has_site_name, TString),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.photo_structures('photo')),
+            'embed_url' / If(this.flags.has_embed_url, TString),
+            'embed_type' / If(this.flags.has_embed_url, TString),
+            'embed_width' / If(this.flags.has_embed_width, Int32ul),
+            'embed_height' / If(this.flags.has_embed_width, Int32ul),
+            'duration' / If(this.flags.has_duration, Int32ul),
+            'author' / If(this.flags.has_author, TString))
+
+    @constructor(0x211a1788, 'web_page_empty')
+    def struct_0x211a1788(self):
+        return Struct(
+            'sname' / Computed('web_page_empty'),
+            'signature' / Hex(Const(0x211a1788, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_url=1),
+            'id' / Int64ul,
+            'url' / If(this.flags.has_url, TString))
+
+    @constructor(0xeb1477e8, 'web_page_empty_layer165')
+    def struct_0xeb1477e8(self):
+        return ['id' / Int64ul]
+
+    @constructor(0xd41a5167, 'web_page_url_pending')
+    def struct_0xd41a5167(self):
+        return ['url' / TString]
+
+    @constructor(0x7311ca11, 'web_page_not_modified')
+    def struct_0x7311ca11(self):
+        return Struct(
+            'sname' / Computed('web_page_not_modified'),
+            'signature' / Hex(Const(0x7311ca11, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_cached_page_views=1),
+            'cached_page_views' / If(this.flags.has_cached_page_views, Int32ul))
+
+    @constructor(0xb0d13e47, 'web_page_pending')
+    def struct_0xb0d13e47(self):
+        return Struct(
+            'sname' / Computed('web_page_pending'),
+            'signature' / Hex(Const(0xb0d13e47, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_url=1),
+            'id' / Int64ul,
+            'url' / If(this.flags.has_url, TString),
+            'date' / TTimestamp)
+
+    @constructor(0xc586da1c, 'web_page_pending_layer165')
+    def struct_0xc586da1c(self):
+        return (
+            'id' / Int64ul,
+            'date' / TTimestamp)
+
+    @constructor(0x85849473, 'web_page_not_modified_layer110')
+    def struct_0x85849473(self):
+        return []
+
+    @constructor(0xca820ed7, 'web_page_layer58')
+    def struct_0xca820ed7(self):
+        return Struct(
+            'sname' / Computed('web_page_layer58'),
+            'signature' / Hex(Const(0xca820ed7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_type=1,
+                                has_site_name=2,
+                                has_title=4,
+                                has_description=8,
+                                has_photo=16,
+                                has_embed_url=32,
+                                has_embed_width=64,
+                                has_duration=128,
+                                has_author=256,
+                                has_document=512),
+            'id' / Int64ul,
+            'url' / TString,
+            'display_url' / TString,
+            'type' / If(this.flags.has_type, TString),
+            'site_name' / If(this.flags.has_site_name, TString),
+            'title' / If(this.flags.has_title, TString),
+            'description' / If(this.flags.has_description, TString),
+            'photo' / If(this.flags.has_photo, self.photo_structures('photo')),
+            'embed_url' / If(this.flags.has_embed_url, TString),
+            'embed_type' / If(this.flags.has_embed_url, TString),
+            'embed_width' / If(this.flags.has_embed_width, Int32ul),
+            'embed_height' / If(this.flags.has_embed_width, Int32ul),
+            'duration' / If(this.flags.has_duration, Int32ul),
+            'author' / If(this.flags.has_author, TString),
+            'document' / If(this.flags.has_document, self.document_structures('document')))
+
+    @structures
+    def web_page_structures(self, name):
+        tag_map = {
+            0xe89c45b2: LazyBound(self.struct_0xe89c45b2),
+            0xfa64e172: LazyBound(self.struct_0xfa64e172),
+            0x5f07b4bc: LazyBound(self.struct_0x5f07b4bc),
+            0xa31ea0b5: LazyBound(self.struct_0xa31ea0b5),
+            0x211a1788: LazyBound(self.struct_0x211a1788),
+            0xeb1477e8: LazyBound(self.struct_0xeb1477e8),
+            0xd41a5167: LazyBound(self.struct_0xd41a5167),
+            0x7311ca11: LazyBound(self.struct_0x7311ca11),
+            0xb0d13e47: LazyBound(self.struct_0xb0d13e47),
+            0xc586da1c: LazyBound(self.struct_0xc586da1c),
+            0x85849473: LazyBound(self.struct_0x85849473),
+            0xca820ed7: LazyBound(self.struct_0xca820ed7)
+        }
+        return TLUnion(name, tag_map)
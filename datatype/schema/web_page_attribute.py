@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Schema group web_page_attribute of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+    @constructor(0x54b56617, 'web_page_attribute_theme')
+    def struct_0x54b56617(self):
+        return Struct(
+            'sname' / Computed('web_page_attribute_theme'),
+            'signature' / Hex(Const(0x54b56617, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_documents=1,
+                                has_settings=2),
+            'documents' / If(this.flags.has_documents, self.vector(self.document_structures('documents'), 'documents')),
+            'settings' / If(this.flags.has_settings, self.theme_settings_structures('settings')))
+
+    @constructor(0x939a4671, 'web_page_attribute_story_layer162')
+    def struct_0x939a4671(self):
+        return Struct(
+            'sname' / Computed('web_page_attribute_story_layer162'),
+            'signature' / Hex(Const(0x939a4671, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_story_item=1),
+            'peer_user_id' / Int64ul,
+            'id' / Int32ul,
+            'story_item' / If(this.flags.has_story_item, self.story_item_structures('story_item')))
+
+    @constructor(0x2e94c3e7, 'web_page_attribute_story')
+    def struct_0x2e94c3e7(self):
+        return Struct(
+            'sname' / Computed('web_page_attribute_story'),
+            'signature' / Hex(Const(0x2e94c3e7, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                has_story_item=1),
+            'peer' / self.peer_structures('peer'),
+            'id' / Int32ul,
+            'story_item' / If(this.flags.has_story_item, self.story_item_structures('story_item')))
+
+    @constructor(0x50cc03d3, 'web_page_attribute_sticker_set')
+    def struct_0x50cc03d3(self):
+        return Struct(
+            'sname' / Computed('web_page_attribute_sticker_set'),
+            'signature' / Hex(Const(0x50cc03d3, Int32ul)),
+            'flags' / FlagsEnum(Int32ul,
+                                is_emojis=1,
+                                is_text_color=2),
+            'stickers' / self.vector(self.document_structures('stickers'), 'stickers'))
+
+    @constructor(0xcf6f6db8, 'web_page_attribute_unique_star_gift')
+    def struct_0xcf6f6db8(self):
+        return ['gift' / self.star_gift_structures('gift')]
+
+    @structures
+    def web_page_attribute_structures(self, name):
+        tag_map = {
+            0x54b56617: LazyBound(self.struct_0x54b56617),
+            0x939a4671: LazyBound(self.struct_0x939a4671),
+            0x2e94c3e7: LazyBound(self.struct_0x2e94c3e7),
+            0x50cc03d3: LazyBound(self.struct_0x50cc03d3),
+            0xcf6f6db8: LazyBound(self.struct_0xcf6f6db8)
+        }
+        return TLUnion(name, tag_map)
@@ -5,7 +5,14 @@ Created on Thu Dec 15 14:22:33 2022
 @author: C. David
 """
 import json
-from construct import Container, ListContainer
+from functools import lru_cache
+from construct import Container
+from .common import Flags
+from .compact import Record
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
 
 
 MIME_TYPE = {
@@ -14,14 +21,126 @@ MIME_TYPE = {
     "audio/ogg": ".ogg"
 }
 
+ACCESSORS = {}
+
+BUFFER_SIZE = 1 << 16
+
+# types of values that are never or never hold floats, skipped by plain_floats
+SCALARS = frozenset((int, str, bytes, bool, type(None)))
+
+# orjson options of the text of format_dict, but indented by 2 spaces
+FAST_OPTIONS = 0 if orjson is None else (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS |
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+
+class Accessor:
+    '''A dotted path split once, getting its value as get_obj_value does'''
+    __slots__ = ('path', 'keys')
+
+    def __init__(self, path):
+        self.path = path
+        self.keys = tuple(path.split('.'))
+
+    def __call__(self, obj, default=None):
+        if not obj:
+            return None
+        cur = obj
+        for item in self.keys:
+            if cur and item in cur:
+                cur = cur[item]
+            else:
+                return default
+        return cur
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.path!r})'
+
+
+class Extractor:
+    '''
+    Values of several dotted paths, read in a single walk of the object.
+    The paths are merged into a tree so that a common prefix is looked up
+    once, 'flags.is_left' and 'flags.is_broadcast' share 'flags', and the
+    tree is compiled into a function of nested tests, as get_obj_value
+    makes them for each path.
+    '''
+    __slots__ = ('paths', 'tree', 'source', 'extract')
+
+    def __init__(self, paths):
+        self.paths = tuple(dict.fromkeys(paths))
+        # key -> [path ending at the key or None, subtree]
+        self.tree = {}
+        for path in self.paths:
+            node = self.tree
+            *parents, last = path.split('.')
+            for item in parents:
+                node = node.setdefault(item, [None, {}])[1]
+            node.setdefault(last, [None, {}])[0] = path
+        self.source = self.compile()
+        namespace = {'PATHS': self.paths}
+        exec(compile(self.source, f'<extractor {len(self.paths)}>', 'exec'),
+             namespace)
+        self.extract = namespace['extract']
+
+    def compile(self):
+        '''Source of extract(obj, default=None), a dict of the values'''
+        index = {x: i for i, x in enumerate(self.paths)}
+        lines = ['def extract(obj, default=None):',
+                 '    if not obj:',
+                 '        return dict.fromkeys(PATHS)']
+        lines.extend(f'    r{x} = default' for x in index.values())
+        count = 0
+
+        def emit(tree, var, indent):
+            nonlocal count
+            for item, (path, children) in tree.items():
+                count += 1
+                value = f'v{count}'
+                test = f'{item!r} in {var}'
+                if var != 'obj':
+                    test = f'{var} and {test}'
+                lines.append(f'{indent}if {test}:')
+                lines.append(f'{indent}    {value} = {var}[{item!r}]')
+                if path is not None:
+                    lines.append(f'{indent}    r{index[path]} = {value}')
+                if children:
+                    emit(children, value, indent + '    ')
+        emit(self.tree, 'obj', '    ')
+        items = ', '.join(f'{x!r}: r{i}' for x, i in index.items())
+        lines.append(f'    return {{{items}}}')
+        return '\n'.join(lines) + '\n'
+
+    def __call__(self, obj, default=None):
+        '''Map every path to its value, default when it is missing'''
+        return self.extract(obj, default)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.paths!r})'
+
+
+def get_accessor(path):
+    '''The Accessor of a dotted path, built once per path'''
+    if (accessor := ACCESSORS.get(path)) is None:
+        accessor = ACCESSORS.setdefault(path, Accessor(path))
+    return accessor
+
+
+@lru_cache(maxsize=None)
+def get_extractor(paths):
+    '''The Extractor of a tuple of dotted paths, built once per tuple'''
+    return Extractor(paths)
+
 
 def get_obj_value(obj, key, default=None):
     '''Get value from an object using dot notation'''
     if not obj:
         return None
-    key_list = key.split('.')
+    if (accessor := ACCESSORS.get(key)) is None:
+        accessor = get_accessor(key)
+    # the walk of Accessor inlined, this is called per field of every row
     cur = obj
-    for item in key_list:
+    for item in accessor.keys:
         if cur and item in cur:
             cur = cur[item]
         else:
@@ -29,6 +148,11 @@ def get_obj_value(obj, key, default=None):
     return cur
 
 
+def get_obj_values(obj, keys, default=None):
+    '''Get the values of several dot notation keys in one walk, as a dict'''
+    return get_extractor(tuple(keys))(obj, default)
+
+
 def pythonic(obj, key=None):
     '''Convert a Construct object to Python data structure'''
     if isinstance(obj, Container):
@@ -43,12 +167,103 @@ def pythonic(obj, key=None):
             return pythonic(obj[key])
         else:
             return {x: pythonic(obj[x], x) for x in obj if not x.startswith('_')}
-    elif isinstance(obj, ListContainer):
+    elif isinstance(obj, list):
         return [pythonic(x, key) for x in obj]
+    elif isinstance(obj, Flags):
+        return obj[key] if key in obj else dict(obj)
     else:
         return obj
 
 
+def double_indent(data: bytes):
+    '''JSON indented by 2 spaces indented by 4, a level per replace'''
+    # control characters are escaped in JSON strings, \x01 marks a level
+    data = data.replace(b'\n  ', b'\n\x01')
+    while b'\x01  ' in data:
+        data = data.replace(b'\x01  ', b'\x01\x01')
+    return data.replace(b'\x01', b'    ')
+
+
+def json_default(obj):
+    '''JSON value of what json does not encode, Records as dicts'''
+    if isinstance(obj, Record):
+        return dict(obj)
+    return str(obj)
+
+
+def plain_floats(obj):
+    '''
+    Whether the floats of obj are all spelt alike by orjson and json:
+    finite and without exponent, zero or from 1e-4 up to 1e16.
+    '''
+    kind = type(obj)
+    if kind is dict or isinstance(obj, Record):
+        values = obj.values()
+    elif kind is list:
+        values = obj
+    elif kind is float:
+        return obj == 0 or 1e-4 <= abs(obj) < 1e16
+    else:
+        return True
+    for value in values:
+        if type(value) not in SCALARS and not plain_floats(value):
+            return False
+    return True
+
+
 def format_dict(obj: dict):
     '''Format dictionary as JSON string and indented output'''
-    return json.dumps(obj, ensure_ascii=False, indent=4, default=str)
+    return json.dumps(obj, ensure_ascii=False, indent=4, default=json_default)
+
+
+class JsonWriter:
+    '''
+    Write text and objects formatted as format_dict does to a text file,
+    through a buffer of about buffer_size characters, so that a table dump
+    never holds more than one object as text. orjson encodes the objects
+    when it is installed, its 2 spaces indentation doubled; json does it
+    otherwise and for the objects orjson rejects, as integers over 64 bits,
+    or spells differently, those with NaN, infinite or exponent floats.
+    '''
+
+    def __init__(self, file, buffer_size=BUFFER_SIZE, fast=True):
+        self.file = file
+        self.buffer_size = buffer_size
+        self.fast = fast and orjson is not None
+        self.encoder = json.JSONEncoder(ensure_ascii=False, indent=4,
+                                        default=json_default)
+        self.buffer = []
+        self.size = 0
+
+    def encode(self, obj):
+        '''The text of obj, as format_dict returns it'''
+        if self.fast and plain_floats(obj):
+            try:
+                data = orjson.dumps(obj, default=json_default,
+                                    option=FAST_OPTIONS)
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                return double_indent(data).decode('utf-8')
+        return self.encoder.encode(obj)
+
+    def write(self, text):
+        self.buffer.append(text)
+        self.size += len(text)
+        if self.size >= self.buffer_size:
+            self.flush()
+
+    def write_object(self, obj):
+        self.write(self.encode(obj))
+
+    def flush(self):
+        if self.buffer:
+            self.file.write(''.join(self.buffer))
+            self.buffer.clear()
+            self.size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 10:12:45 2026
+
+@author: C. David
+"""
+import csv
+import json
+import random
+import struct
+import time
+from argparse import ArgumentParser
+from itertools import product
+from construct import (Renamed, IfThenElse, Const, Hex, Computed, FlagsEnum,
+                       FormatField, LazyBound)
+from datatype import TLStruct
+from datatype.common import (TString, TBytes, TBool, TTimestamp, TLUnion,
+                             BOOL_TRUE, BOOL_FALSE, Flags, pack_tl_bytes)
+try:
+    from .decoder import is_constructor, is_vector, is_pass
+except ImportError:
+    from generater.decoder import is_constructor, is_vector, is_pass
+
+
+STRING_SIZES = (0, 1, 11, 253, 254, 300)
+
+VECTOR_SIZES = (0, 1, 3)
+
+FLAG_LIMIT = 4
+
+MAX_DEPTH = 3
+
+FIELDS = ('cid', 'name', 'blobs', 'bytes', 'seconds', 'us_per_blob',
+          'mib_per_s')
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyz 0123456789éж'
+
+
+class BlobGenerator:
+    '''
+    Random blobs of the constructors of a schema, encoded by walking their
+    Structs as the decoders do, so that every one of them parses. Strings
+    and bytes take the sizes of STRING_SIZES, long ones included, vectors
+    the counts of VECTOR_SIZES and unions a random case. Past max_depth
+    flags are cleared, vectors are empty and unions take their shallowest
+    case, so that recursive types end.
+    '''
+
+    def __init__(self, parser=None, seed=None, max_depth=MAX_DEPTH):
+        self.parser = (parser or TLStruct()).unprofiled
+        self.random = random.Random(seed)
+        self.max_depth = max_depth
+        self.heights = {}
+
+    @property
+    def structs(self):
+        return self.parser.structs
+
+    def get_struct(self, obj):
+        if isinstance(obj, LazyBound):
+            return obj.subconfunc()
+        return obj
+
+    def height(self, obj):
+        '''
+        Depth of the shallowest object of a construct with its flags
+        cleared and its vectors empty, None while it is being measured.
+        '''
+        obj = self.get_struct(obj)
+        if isinstance(obj, TLUnion):
+            heights = [x for x in map(self.height, obj.cases.values())
+                       if x is not None]
+            return min(heights) if heights else None
+        if not is_constructor(obj) or is_vector(obj):
+            return 0
+        key = obj.subcons[1].subcon.subcon.value
+        if key in self.heights:
+            return self.heights[key]
+        self.heights[key] = None
+        result = 0
+        for sc in obj.subcons:
+            while isinstance(sc, (Renamed, Hex)):
+                sc = sc.subcon
+            if isinstance(sc, (TLUnion, LazyBound)) or is_constructor(sc):
+                if (height := self.height(sc)) is None:
+                    del self.heights[key]
+                    return None
+                result = max(result, height + 1)
+        self.heights[key] = result
+        return result
+
+    def choose_case(self, union: TLUnion, depth):
+        cases = list(union.cases.values())
+        if depth < self.max_depth:
+            return self.random.choice(cases)
+        heights = {}
+        for case in cases:
+            if (height := self.height(case)) is not None:
+                heights.setdefault(height, []).append(case)
+        return self.random.choice(heights[min(heights)] if heights else cases)
+
+    def payload(self, text):
+        '''Random bytes, or UTF-8 text, of one of the STRING_SIZES.'''
+        size = self.random.choice(STRING_SIZES)
+        if not text:
+            return self.random.randbytes(size)
+        chars = self.random.choices(LETTERS, k=size)
+        while len(data := ''.join(chars).encode('utf-8')) > size:
+            chars.pop()
+        return data + b'a' * (size - len(data))
+
+    def number(self, sc: FormatField):
+        if sc.fmtstr[-1] == 'd':
+            return struct.pack(sc.fmtstr, self.random.uniform(-1e6, 1e6))
+        return struct.pack(sc.fmtstr, self.random.getrandbits(8 * sc.length))
+
+    def encode_object(self, obj, depth, flags=None):
+        '''
+        Bytes of a random object of a constructor Struct, flags maps the
+        names of its flags fields to the value to use instead of a random
+        one.
+        '''
+        context = {}
+        return b''.join(self.encode(x, context, depth, flags)
+                        for x in obj.subcons)
+
+    def encode(self, sc, context, depth, flags=None):
+        '''
+        Bytes of a random value of sc, a field of the object whose flags
+        fields context maps to their Flags.
+        '''
+        # pylint: disable=R0911,R0912
+        if isinstance(sc, Renamed):
+            if isinstance(sc.subcon, FlagsEnum):
+                names = sc.subcon.flags
+                if flags is not None and sc.name in flags:
+                    value = flags[sc.name]
+                elif depth < self.max_depth:
+                    value = self.random.getrandbits(32)
+                else:
+                    value = 0
+                value &= sum(names.values())
+                context[sc.name] = Flags(value, names)
+                return value.to_bytes(4, 'little')
+            return self.encode(sc.subcon, context, depth, flags)
+        if sc is TString:
+            return pack_tl_bytes(self.payload(True))
+        if sc is TBytes:
+            return pack_tl_bytes(self.payload(False))
+        if sc is TBool:
+            value = self.random.choice((BOOL_TRUE, BOOL_FALSE))
+            return value.to_bytes(4, 'little')
+        if sc is TTimestamp:
+            return self.random.getrandbits(31).to_bytes(4, 'little')
+        if isinstance(sc, FormatField):
+            return self.number(sc)
+        if isinstance(sc, Hex):
+            return self.encode(sc.subcon, context, depth, flags)
+        if isinstance(sc, Const):
+            return sc.subcon.build(sc.value)
+        if isinstance(sc, Computed) or is_pass(sc):
+            return b''
+        if isinstance(sc, IfThenElse):
+            branch = sc.thensubcon if sc.condfunc(context) else sc.elsesubcon
+            return self.encode(branch, context, depth, flags)
+        if isinstance(sc, TLUnion):
+            case = self.choose_case(sc, depth)
+            return self.encode_object(case.subconfunc(), depth + 1)
+        if isinstance(sc, LazyBound):
+            return self.encode_object(sc.subconfunc(), depth)
+        if is_vector(sc):
+            datatype = sc.subcons[3].subcon.subcon
+            count = 0
+            if depth < self.max_depth:
+                count = self.random.choice(VECTOR_SIZES)
+            items = [self.encode(datatype, context, depth + 1)
+                     for _ in range(count)]
+            return b''.join([sc.subcons[1].subcon.subcon.build(None),
+                             count.to_bytes(4, 'little'), *items])
+        if is_constructor(sc):
+            return self.encode_object(sc, depth)
+        raise NotImplementedError(f'construct: {sc!r}')
+
+    def flag_variants(self, cid):
+        '''
+        Values of the flags fields of a constructor, as dicts of field name
+        to value. A field of up to FLAG_LIMIT flags takes all combinations,
+        a larger one none, all, each flag alone and all but each flag. The
+        fields are cycled along the longest list of values.
+        '''
+        fields = {}
+        for sc in self.structs[cid].subcons:
+            if isinstance(sc, Renamed) and isinstance(sc.subcon, FlagsEnum):
+                masks = list(sc.subcon.flags.values())
+                full = sum(masks)
+                if len(masks) <= FLAG_LIMIT:
+                    values = [sum(x) for x in
+                              product(*((0, y) for y in masks))]
+                else:
+                    values = [0, full, *masks, *(full ^ x for x in masks)]
+                fields[sc.name] = list(dict.fromkeys(values))
+        if not fields:
+            return [None]
+        count = max(map(len, fields.values()))
+        return [{x: y[i % len(y)] for x, y in fields.items()}
+                for i in range(count)]
+
+    def generate(self, cid, flags=None):
+        '''A random blob of the constructor cid.'''
+        return self.encode_object(self.structs[cid], 0, flags)
+
+    def generate_all(self, cids=None):
+        '''
+        Map every constructor id, or those of cids, to the blobs of its
+        flag_variants.
+        '''
+        result = {}
+        for cid in cids or self.structs:
+            result[cid] = [self.generate(cid, x)
+                           for x in self.flag_variants(cid)]
+        return result
+
+
+def check(parser, blobs: dict):
+    '''Constructor ids of blobs that parser fails to parse as a whole.'''
+    failed = []
+    for cid, items in blobs.items():
+        for data in items:
+            try:
+                _, end = parser.parse_from(data)
+            except Exception:  # pylint: disable=W0718
+                end = None
+            if end != len(data):
+                failed.append(cid)
+                break
+    return failed
+
+
+def measure(parser, blobs: dict, number=1):
+    '''
+    Rows of the decode throughput of parser per constructor, parsing its
+    blobs number times, by descending time per blob.
+    '''
+    rows = []
+    for cid, items in blobs.items():
+        if cid not in parser.dispatch:
+            continue
+        size = sum(map(len, items))
+        parse_blob = parser.parse_blob
+        start = time.perf_counter()
+        for _ in range(number):
+            for data in items:
+                parse_blob(data)
+        seconds = time.perf_counter() - start
+        count = len(items) * number
+        rows.append({'cid': f'0x{cid:08x}', 'name': parser.INFO.get(cid),
+                     'blobs': count, 'bytes': size * number,
+                     'seconds': round(seconds, 6),
+                     'us_per_blob': round(seconds / count * 1e6, 3),
+                     'mib_per_s': round(size * number / seconds / 2 ** 20, 3)
+                     if seconds else None})
+    rows.sort(key=lambda x: (-x['us_per_blob'], x['cid']))
+    return rows
+
+
+def save(rows, path):
+    '''Write the rows of measure as CSV for a .csv path, else as JSON.'''
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            writer = csv.DictWriter(f, FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = ArgumentParser(description='Decode throughput per constructor '
+                                        'over synthetic blobs of the schema')
+    parser.add_argument('output', nargs='?',
+                        help='write the rows to OUTPUT, CSV for *.csv else '
+                             'JSON, the slowest ten are printed otherwise')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the random values, default 0')
+    parser.add_argument('--number', type=int, default=10,
+                        help='times every blob is parsed, default 10')
+    parser.add_argument('--max-depth', type=int, default=MAX_DEPTH,
+                        help=f'nesting of random objects, default {MAX_DEPTH}')
+    parser.add_argument('--backend', default='interpreted',
+                        choices=('interpreted', 'compiled', 'decoder'))
+    args = parser.parse_args()
+
+    options = {'compiled': args.backend == 'compiled',
+               'decoder': args.backend == 'decoder'}
+    tl = TLStruct(**options)
+    blobs = BlobGenerator(tl, args.seed, args.max_depth).generate_all()
+    if (failed := check(tl, blobs)):
+        print(f'{len(failed)} constructors do not parse: '
+              f'{", ".join(f"0x{x:08x}" for x in failed)}')
+    rows = measure(tl, blobs, args.number)
+    if args.output:
+        save(rows, args.output)
+        print(f'{len(rows)} constructors written to {args.output}')
+    else:
+        for row in rows[:10]:
+            print(f'{row["cid"]} {row["name"]:<48} '
+                  f'{row["us_per_blob"]:10.2f} us/blob')
+
+
+if __name__ == '__main__':
+    main()
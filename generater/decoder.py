@@ -0,0 +1,492 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:20:41 2026
+
+@author: C. David
+"""
+import re
+from construct import (Struct, Renamed, IfThenElse, Const, Hex,
+                       Computed, FlagsEnum, FormatField, LazyBound)
+from datatype.common import TString, TBytes, TBool, TTimestamp, TLUnion
+
+
+HEADER = '''# -*- coding: utf-8 -*-
+# generated by teleparser from the construct schema, do not edit!
+# schema: {digest}
+# pylint: skip-file
+from struct import unpack_from
+from datatype.common import (INT32, INT64, DOUBLE, read_string, read_bytes,
+                             read_bool, skip_tl_bytes, hex_int, hex_const)
+
+
+def peek(buf, offset):
+    if len(buf) - offset < 4:
+        return None
+    return INT32(buf, offset)[0]
+
+
+def bad_signature(buf, offset, cid):
+    raise ValueError(f'expected signature 0x{{cid:08x}} at {{offset}}, '
+                     f'got 0x{{INT32(buf, offset)[0]:08x}}')
+'''
+
+FORMAT_INFO = {'<I': ('INT32', '<{}I', 4),
+               '<L': ('INT32', '<{}I', 4),
+               '<Q': ('INT64', '<{}Q', 8),
+               '>d': ('DOUBLE', '>{}d', 8)}
+
+CONDITION = re.compile(r"this\['(\w+)'\]\['(\w+)'\]")
+
+
+class FunctionWriter:
+    '''Collect the source lines of one generated function.'''
+
+    def __init__(self, name):
+        self.name = name
+        self.lines = [f'def {name}(buf, offset):']
+        self.level = 1
+        self.count = 0
+        self.flags = {}
+
+    def line(self, text):
+        self.lines.append(f'{"    " * self.level}{text}')
+
+    def indent(self):
+        self.level += 1
+
+    def dedent(self):
+        self.level -= 1
+
+    def block(self, header, emit, *args):
+        '''Emit an indented block, a block without statements gets a pass.'''
+        self.line(header)
+        self.indent()
+        size = len(self.lines)
+        emit(self, *args)
+        if len(self.lines) == size:
+            self.line('pass')
+        self.dedent()
+
+    def var(self, prefix='v'):
+        self.count += 1
+        return f'{prefix}{self.count}'
+
+    def source(self):
+        return '\n'.join(self.lines)
+
+
+def is_constructor(obj):
+    '''A constructor Struct starts with sname and a constant signature.'''
+    return (isinstance(obj, Struct) and len(obj.subcons) >= 2 and
+            obj.subcons[0].name == 'sname' and
+            obj.subcons[1].name == 'signature')
+
+
+def is_union(obj):
+    '''A *_structures union reads the signature and parses its case.'''
+    return isinstance(obj, TLUnion)
+
+
+def is_vector(obj):
+    return is_constructor(obj) and obj.subcons[0].subcon.func == 'vector'
+
+
+def is_pass(obj):
+    return type(obj).__name__ == 'Pass'
+
+
+def fixed_size(obj):
+    '''Byte size of a construct that always has the same size, else None.'''
+    if isinstance(obj, Renamed):
+        return fixed_size(obj.subcon)
+    if obj is TBool or obj is TTimestamp:
+        return 4
+    if isinstance(obj, FormatField):
+        return FORMAT_INFO[obj.fmtstr][2]
+    return None
+
+
+def get_path_tree(paths):
+    '''
+    Turn dotted paths into a nested dict, None marks a value requested as a
+    whole, it wins over any longer path below it.
+    '''
+    tree = {}
+    for path in sorted(paths, key=lambda x: x.count('.')):
+        node = tree
+        *parents, last = path.split('.')
+        for item in parents:
+            if (node := node.setdefault(item, {})) is None:
+                break
+        else:
+            node[last] = None
+    return tree
+
+
+def freeze_tree(tree):
+    if tree is None:
+        return None
+    return tuple(sorted((k, freeze_tree(v)) for k, v in tree.items()))
+
+
+class DecoderGenerator:
+    '''
+    Emit straight-line python decoders from the construct schema. Every
+    constructor becomes a function decode_0x<cid>(buf, offset) that reads
+    from a bytes-like buffer and returns the value pythonic() would build
+    from the construct result, plus the offset after the object, and a
+    function skip_0x<cid>(buf, offset) that only returns that offset, as
+    does skip_<name>(buf, offset) for every *_structures union.
+
+    Functions named in known already exist in the namespace the emitted
+    source is executed in, prefix keeps new tables apart from theirs.
+    '''
+
+    def __init__(self, dispatch: dict, known=None, prefix='', unions=None):
+        self.unions = dict(unions or {})
+        self.dispatch = dispatch
+        self.known = set(known or ())
+        self.prefix = prefix
+        self.functions = {}
+        self.pending = []
+        self.tags = {}
+        self.emitted_tags = set()
+        self.trees = {}
+
+    # ------------------------------------------------------------------------
+
+    def get_cid(self, obj):
+        if isinstance(obj, LazyBound):
+            name = obj.subconfunc.__name__
+            cid = int(name[7:], 16)
+            if cid not in self.dispatch:
+                self.dispatch[cid] = obj.subconfunc()
+            return cid
+        return obj.subcons[1].subcon.subcon.value
+
+    def request(self, name, emit, *args):
+        '''Queue the function name unless it is already available.'''
+        if name not in self.functions and name not in self.known:
+            self.functions[name] = None
+            self.pending.append((name, emit, args))
+        return name
+
+    def get_function(self, cid, key=None):
+        '''
+        Name of the decoder of a constructor, pythonic() collapses a
+        constructor reached with a key that is also one of its fields.
+        '''
+        struct = self.dispatch[cid]
+        if key is not None and key not in (x.name for x in struct.subcons):
+            key = None
+        name = f'decode_0x{cid:08x}' if key is None else \
+            f'decode_0x{cid:08x}_{key}'
+        return self.request(name, self.emit_constructor, struct, key)
+
+    def get_skip(self, cid):
+        '''Name of the function returning the offset after a constructor.'''
+        struct = self.dispatch[cid]
+        return self.request(f'skip_0x{cid:08x}', self.emit_skip_constructor,
+                            struct)
+
+    def get_union_skip(self, name):
+        '''Name of the function returning the offset after a union.'''
+        return self.request(f'skip_{name}', self.emit_skip_union,
+                            self.unions[name])
+
+    def get_projection(self, cid, tree, key=None):
+        '''Name of the decoder of only the tree paths of a constructor.'''
+        struct = self.dispatch[cid]
+        names = {x.name for x in struct.subcons}
+        if tree is None or (key is not None and key in names):
+            return self.get_function(cid, key)
+        frozen = freeze_tree(tree)
+        if frozen not in self.trees:
+            self.trees[frozen] = len(self.trees) + 1
+        name = f'{self.prefix}project{self.trees[frozen]}_0x{cid:08x}'
+        return self.request(name, self.emit_projection_constructor, struct,
+                            tree)
+
+    def get_tags(self, union: TLUnion, select, *args):
+        '''Name of the table mapping every case signature to a function.'''
+        items = tuple((k, self.get_cid(v)) for k, v in union.cases.items())
+        entry = tuple((k, select(cid, *args)) for k, cid in items)
+        if entry not in self.tags:
+            self.tags[entry] = f'{self.prefix}TAGS_{len(self.tags) + 1}'
+        return self.tags[entry]
+
+    # ------------------------------------------------------------------------
+
+    def condition(self, w: FunctionWriter, cond):
+        if not (m := CONDITION.fullmatch(repr(cond))):
+            raise NotImplementedError(f'condition: {cond!r}')
+        field, flag = m.groups()
+        var, flags = w.flags[field]
+        mask = flags[flag]
+        return f'{var} & {mask} == {mask}'
+
+    def emit_flags(self, w: FunctionWriter, name, sc: FlagsEnum, key,
+                   target=None):
+        var = w.var('flags')
+        w.line(f'{var} = INT32(buf, offset)[0]')
+        w.line('offset += 4')
+        w.flags[name] = (var, sc.flags)
+        if target is None:
+            return
+        if key in sc.flags:
+            mask = sc.flags[key]
+            w.line(f'{target} = {var} & {mask} == {mask}')
+            return
+        items = ', '.join(f'{k!r}: {var} & {v} == {v}'
+                          for k, v in sc.flags.items())
+        w.line(f'{target} = {{{items}}}')
+
+    def emit_call(self, w: FunctionWriter, tags, target):
+        func = w.var('func')
+        w.line(f'{func} = {tags}.get(peek(buf, offset))')
+        w.line(f'if {func} is None:')
+        w.line(f'    {target} = None')
+        w.line('else:')
+        w.line(f'    {target}, offset = {func}(buf, offset)')
+
+    def emit_union(self, w: FunctionWriter, union: TLUnion, key, target,
+                   tree=None):
+        name = union.name
+        if key == name:
+            tags = self.get_tags(union, self.get_projection, tree)
+            return self.emit_call(w, tags, target)
+        if tree is not None:
+            if name not in tree:
+                self.emit_skip(w, union)
+                return w.line(f'{target} = {{}}')
+            tree = tree[name]
+        value = w.var()
+        tags = self.get_tags(union, self.get_projection, tree, name)
+        self.emit_call(w, tags, value)
+        return w.line(f'{target} = {{{name!r}: {value}}}')
+
+    def emit_const(self, w: FunctionWriter, sc: Const, target, value):
+        w.line(f'if INT32(buf, offset)[0] != 0x{sc.value:08x}:')
+        w.line(f'    bad_signature(buf, offset, 0x{sc.value:08x})')
+        w.line(f'{target} = {value}')
+        w.line('offset += 4')
+
+    def emit_hex(self, w: FunctionWriter, sc, key, target):
+        '''Emit sc wrapped by Hex, its integers display as Hex makes them.'''
+        if isinstance(sc, Const):
+            value = f'hex_const(0x{sc.value:08x})'
+            return self.emit_const(w, sc, target, value)
+        self.emit(w, sc, key, target)
+        if isinstance(sc, FormatField) and sc.fmtstr in FORMAT_INFO and \
+                sc.fmtstr[-1] != 'd':
+            w.line(f'{target} = hex_int({target}, {sc.length})')
+        return None
+
+    def emit_vector(self, w: FunctionWriter, struct, key, target):
+        cid = struct.subcons[1].subcon.subcon.value
+        datatype = struct.subcons[3].subcon.subcon
+        count = w.var('count')
+        w.line(f'if INT32(buf, offset)[0] != 0x{cid:08x}:')
+        w.line(f'    bad_signature(buf, offset, 0x{cid:08x})')
+        w.line(f'{count} = INT32(buf, offset + 4)[0]')
+        w.line('offset += 8')
+        if isinstance(datatype, FormatField):
+            _, code, size = FORMAT_INFO[datatype.fmtstr]
+            code = code.format(f'{{{count}}}')
+            w.line(f"{target} = list(unpack_from(f'{code}', buf, offset))")
+            w.line(f'offset += {size} * {count}')
+            return
+        item = w.var('item')
+        w.line(f'{target} = []')
+        w.line(f'for _ in range({count}):')
+        w.indent()
+        self.emit(w, datatype, key, item)
+        w.line(f'{target}.append({item})')
+        w.dedent()
+
+    def emit(self, w: FunctionWriter, sc, key, target, tree=None):
+        '''
+        Emit code that stores pythonic(sc.parse(...), key) into target, with
+        a tree only its paths are decoded inside constructors and unions.
+        '''
+        # pylint: disable=R0911,R0912
+        if isinstance(sc, Renamed):
+            if isinstance(sc.subcon, FlagsEnum):
+                return self.emit_flags(w, sc.name, sc.subcon, key, target)
+            return self.emit(w, sc.subcon, key, target, tree)
+        if sc is TString:
+            return w.line(f'{target}, offset = read_string(buf, offset)')
+        if sc is TBytes:
+            return w.line(f'{target}, offset = read_bytes(buf, offset)')
+        if sc is TBool:
+            return w.line(f'{target}, offset = read_bool(buf, offset)')
+        if sc is TTimestamp:
+            w.line(f'{target} = INT32(buf, offset)[0]')
+            return w.line('offset += 4')
+        if isinstance(sc, FormatField):
+            reader, _, size = FORMAT_INFO[sc.fmtstr]
+            w.line(f'{target} = {reader}(buf, offset)[0]')
+            return w.line(f'offset += {size}')
+        if isinstance(sc, Hex):
+            return self.emit_hex(w, sc.subcon, key, target)
+        if isinstance(sc, Const):
+            return self.emit_const(w, sc, target, f'0x{sc.value:08x}')
+        if isinstance(sc, Computed) and not callable(sc.func):
+            return w.line(f'{target} = {sc.func!r}')
+        if isinstance(sc, IfThenElse):
+            w.line(f'if {self.condition(w, sc.condfunc)}:')
+            w.indent()
+            self.emit(w, sc.thensubcon, key, target, tree)
+            w.dedent()
+            w.line('else:')
+            w.indent()
+            if is_pass(sc.elsesubcon):
+                w.line(f'{target} = None')
+            else:
+                self.emit(w, sc.elsesubcon, key, target, tree)
+            return w.dedent()
+        if is_union(sc):
+            return self.emit_union(w, sc, key, target, tree)
+        if is_vector(sc):
+            return self.emit_vector(w, sc, key, target)
+        if is_constructor(sc):
+            name = self.get_projection(self.get_cid(sc), tree, key)
+            return w.line(f'{target}, offset = {name}(buf, offset)')
+        raise NotImplementedError(f'construct: {sc!r}')
+
+    def emit_skip(self, w: FunctionWriter, sc):
+        '''Emit code that only moves offset over sc.'''
+        # pylint: disable=R0911,R0912
+        if isinstance(sc, Renamed):
+            if isinstance(sc.subcon, FlagsEnum):
+                return self.emit_flags(w, sc.name, sc.subcon, None)
+            return self.emit_skip(w, sc.subcon)
+        if sc is TString or sc is TBytes:
+            return w.line('offset = skip_tl_bytes(buf, offset)')
+        if (size := fixed_size(sc)) is not None:
+            return w.line(f'offset += {size}')
+        if isinstance(sc, Hex):
+            return self.emit_skip(w, sc.subcon)
+        if isinstance(sc, Const):
+            w.line(f'if INT32(buf, offset)[0] != 0x{sc.value:08x}:')
+            w.line(f'    bad_signature(buf, offset, 0x{sc.value:08x})')
+            return w.line('offset += 4')
+        if isinstance(sc, Computed) and not callable(sc.func):
+            return None
+        if isinstance(sc, IfThenElse):
+            w.block(f'if {self.condition(w, sc.condfunc)}:',
+                    self.emit_skip, sc.thensubcon)
+            if not is_pass(sc.elsesubcon):
+                w.block('else:', self.emit_skip, sc.elsesubcon)
+            return None
+        if is_union(sc):
+            tags = self.get_tags(sc, self.get_skip)
+            func = w.var('func')
+            w.line(f'{func} = {tags}.get(peek(buf, offset))')
+            w.line(f'if {func} is not None:')
+            return w.line(f'    offset = {func}(buf, offset)')
+        if is_vector(sc):
+            cid = sc.subcons[1].subcon.subcon.value
+            datatype = sc.subcons[3].subcon.subcon
+            count = w.var('count')
+            w.line(f'if INT32(buf, offset)[0] != 0x{cid:08x}:')
+            w.line(f'    bad_signature(buf, offset, 0x{cid:08x})')
+            w.line(f'{count} = INT32(buf, offset + 4)[0]')
+            w.line('offset += 8')
+            if (size := fixed_size(datatype)) is not None:
+                return w.line(f'offset += {size} * {count}')
+            return w.block(f'for _ in range({count}):',
+                           self.emit_skip, datatype)
+        if is_constructor(sc):
+            name = self.get_skip(self.get_cid(sc))
+            return w.line(f'offset = {name}(buf, offset)')
+        raise NotImplementedError(f'construct: {sc!r}')
+
+    def emit_constructor(self, name, struct, key):
+        w = FunctionWriter(name)
+        values = []
+        for sc in struct.subcons:
+            var = w.var()
+            subkey = None if key is not None else sc.name
+            self.emit(w, sc, subkey, var)
+            if sc.name == key and key is not None:
+                result = var
+            elif sc.name and not sc.name.startswith('_'):
+                values.append(f'{sc.name!r}: {var}')
+        if key is None:
+            result = f'{{{", ".join(values)}}}'
+        w.line(f'return {result}, offset')
+        return w.source()
+
+    def emit_skip_constructor(self, name, struct):
+        w = FunctionWriter(name)
+        for sc in struct.subcons:
+            self.emit_skip(w, sc)
+        w.line('return offset')
+        return w.source()
+
+    def emit_skip_union(self, name, struct):
+        w = FunctionWriter(name)
+        self.emit_skip(w, struct)
+        w.line('return offset')
+        return w.source()
+
+    def emit_projection_constructor(self, name, struct, tree):
+        w = FunctionWriter(name)
+        values = []
+        for sc in struct.subcons:
+            if sc.name in tree:
+                var = w.var()
+                self.emit(w, sc, sc.name, var, tree[sc.name])
+                values.append(f'{sc.name!r}: {var}')
+            else:
+                self.emit_skip(w, sc)
+        w.line(f'return {{{", ".join(values)}}}, offset')
+        return w.source()
+
+    # ------------------------------------------------------------------------
+
+    def flush(self):
+        '''Emit the queued functions and new tables, return their source.'''
+        while self.pending:
+            name, emit, args = self.pending.pop(0)
+            self.functions[name] = emit(name, *args)
+        result = list(self.functions.values())
+        for entry, name in self.tags.items():
+            if name in self.emitted_tags:
+                continue
+            self.emitted_tags.add(name)
+            items = ''.join(f'\n    0x{k:08x}: {v},' for k, v in entry)
+            result.append(f'{name} = {{{items}\n}}')
+        self.known.update(self.functions)
+        self.functions = {}
+        return '\n\n\n'.join(result)
+
+    def generate(self, digest=''):
+        '''Return the source of the decoder module.'''
+        for cid in list(self.dispatch):
+            self.get_function(cid)
+            self.get_skip(cid)
+        for name in self.unions:
+            self.get_union_skip(name)
+        result = [HEADER.format(digest=digest), self.flush()]
+        for table, prefix in (('DECODERS', 'decode'), ('SKIPPERS', 'skip')):
+            items = ''.join(f'\n    0x{x:08x}: {prefix}_0x{x:08x},'
+                            for x in self.dispatch)
+            result.append(f'{table} = {{{items}\n}}')
+        items = ''.join(f'\n    {x!r}: skip_{x},' for x in self.unions)
+        result.append(f'UNION_SKIPPERS = {{{items}\n}}')
+        return '\n\n\n'.join(result) + '\n'
+
+    def generate_projection(self, cid, paths):
+        '''
+        Return the name of the decoder of only the given dotted paths of a
+        constructor and the source of everything it needs that is not known.
+        '''
+        name = self.get_projection(cid, get_path_tree(paths))
+        return name, self.flush()
+
+
+def generate_decoder_source(dispatch: dict, digest='', unions=None):
+    '''Generate the plain python decoder module of a dispatch table.'''
+    return DecoderGenerator(dispatch, unions=unions).generate(digest)
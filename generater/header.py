@@ -5,19 +5,59 @@ Created on Fri Dec  9 09:12:01 2022
 @author: C. David
 """
 # pylint: disable=protected-access,too-many-lines,too-many-public-methods,line-too-long
+import sys
+from array import array
+from threading import RLock, local
 from functools import wraps, lru_cache
-from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
-                       FlagsEnum, Array, If, Peek,
-                       Const, LazyBound, Switch, this,
-                       setGlobalPrintFullStrings, setGlobalPrintPrivateEntries)
+from importlib import import_module
+from construct import (Struct, Computed, Int32ul, Hex, Container, Const,
+                       this, setGlobalPrintFullStrings,
+                       setGlobalPrintPrivateEntries)
 import logger
-from .common import TString, TBytes, TBool, TTimestamp
+from tools.lazy import lazy_property
+from .common import TLArray, TLUnion, open_stream
+from .compiler import load_compiled, load_decoders, iter_subcons, Projector
+from .profiler import ConstructorProfiler
+from .schema import INFO, GROUPS
+from .layers import LAYERS
 # -----------------------------------------------------------------------------
 
-INFO = {}
-
 STRUCT_CACHE = {}
 
+BUILDERS = {}
+
+SCHEMA_LOCK = RLock()
+
+VECTOR = 0x1cb5c415
+
+RESYNC_WORDS = 4096
+
+
+def get_cached(cache: dict, key, build):
+    '''
+    The value of cache at key, else the result of build() stored there. A
+    lookup takes no lock, a miss builds under SCHEMA_LOCK so that threads
+    racing for the same key build it once and share it.
+    '''
+    if (ret := cache.get(key)) is None:
+        with SCHEMA_LOCK:
+            if (ret := cache.get(key)) is None:
+                ret = cache[key] = build()
+    return ret
+
+
+def get_builder(cls, profiler):
+    '''
+    The instance of a TLStruct class the schema functions run on to build
+    Structs recording into profiler, shared by all the parsers of the class,
+    so a built Struct holds no reference to the parser first needing it.
+    '''
+    def build():
+        builder = cls()
+        builder.profiler = profiler
+        return builder
+    return get_cached(BUILDERS, (cls, profiler), build)
+
 
 def constructor(cid, name, use_lru=False):
     INFO[cid] = name
@@ -25,51 +65,205 @@ def constructor(cid, name, use_lru=False):
     if not use_lru:  # pylint: disable=R1705
         def decorator(func):
             @wraps(func)
-            def wrapper(*args, **kwargs):
-                if cid in STRUCT_CACHE:
-                    ret = STRUCT_CACHE[cid]
-                else:
-                    result = func(*args, **kwargs)
+            def wrapper(self):
+                def build():
+                    result = func(self.builder)
                     if isinstance(result, (list, tuple)):
-                        ret = Struct('sname' / Computed(name),
-                                     'signature' / Hex(Const(cid, Int32ul)),
-                                     *result)
-                    elif isinstance(result, dict):
-                        ret = Struct('sname' / Computed(name),
-                                     'signature' / Hex(Const(cid, Int32ul)),
-                                     **result)
-                    else:
-                        ret = result
-                    STRUCT_CACHE[cid] = ret
+                        return Struct('sname' / Computed(name),
+                                      'signature' / Hex(Const(cid, Int32ul)),
+                                      *result)
+                    if isinstance(result, dict):
+                        return Struct('sname' / Computed(name),
+                                      'signature' / Hex(Const(cid, Int32ul)),
+                                      **result)
+                    return result
+                profiler = self.build_profiler
+                ret = get_cached(STRUCT_CACHE, (self.LAYER, cid, profiler),
+                                 build)
+                if profiler is not None:
+                    ret = profiler.wrap_struct(cid, name, ret)
                 return ret
             return wrapper
         return decorator
     else:
-        return lru_cache()
+        def decorator(func):
+            @wraps(func)
+            def wrapper(self, *args):
+                key = (self.LAYER, cid, *args)
+                return get_cached(STRUCT_CACHE, key,
+                                  lambda: func(self.builder, *args))
+            return wrapper
+        return decorator
 
 
-structures = lru_cache()
+def structures(func):
+    '''
+    Cache the union a *_structures function returns per layer, name and
+    profiler, in STRUCT_CACHE along with the constructors.
+    '''
+    @wraps(func)
+    def wrapper(self, name):
+        key = (self.LAYER, func.__name__, name, self.build_profiler)
+        return get_cached(STRUCT_CACHE, key, lambda: func(self.builder, name))
+    return wrapper
 
 # -----------------------------------------------------------------------------
 
+
 def raise_exception(text, *args):
     string = text % args
     raise ValueError(string)
 
 
+class StructTable(dict):
+    '''
+    Map a constructor id to its built Struct, a Struct and the schema group
+    defining it are only loaded by the first lookup of the id. Iterating the
+    table loads every constructor.
+    '''
+
+    def __init__(self, parser):
+        super().__init__()
+        self.parser = parser
+
+    def __missing__(self, cid):
+        func = getattr(self.parser, f'struct_0x{cid:08x}', None)
+        if func is None:
+            raise KeyError(cid)
+        self[cid] = result = func()
+        return result
+
+    def __contains__(self, cid):
+        return self.get(cid) is not None
+
+    def get(self, cid, default=None):
+        try:
+            return self[cid]
+        except KeyError:
+            return default
+
+    def load(self):
+        '''Build every constructor of the schema.'''
+        for cid in self.parser.INFO:
+            self.get(cid)
+        return self
+
+    def __iter__(self):
+        self.load()
+        return super().__iter__()
+
+    def __len__(self):
+        self.load()
+        return super().__len__()
+
+    def keys(self):
+        self.load()
+        return super().keys()
+
+    def values(self):
+        self.load()
+        return super().values()
+
+    def items(self):
+        self.load()
+        return super().items()
+
+
+class LayerFunction:
+    '''
+    Placeholder of a schema function a layer defines differently from
+    TLStruct. The first lookup imports the group module of the layer
+    defining it and replaces all its placeholders by the functions.
+    '''
+
+    def __init__(self, package, group):
+        self.package = package
+        self.group = group
+        self.owner = self.name = None
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        module = import_module(f'{self.package}.{self.group}')
+        for key, value in vars(module.Schema).items():
+            if isinstance(vars(self.owner).get(key), LayerFunction):
+                setattr(self.owner, key, value)
+        return getattr(self.owner if obj is None else obj, self.name)
+
+
 class TLStruct:
-    LAYER = 198
+    LAYER = 200
+    INFO = INFO
+    GROUPS = GROUPS
 
-    def __init__(self, raise_error=True):
+    def __init__(self, raise_error=True, compiled=False, cache_dir=None,
+                 decoder=False, salvage=False, profile=False):
         setGlobalPrintFullStrings(True)
         setGlobalPrintPrivateEntries(False)
-        if raise_error:
+        self.raise_error = raise_error
+        self.compiled = compiled
+        self.cache_dir = cache_dir
+        self.decoder = decoder
+        self.salvage = salvage
+        self.local = local()
+        self.projectors = {}
+        self.profiler = ConstructorProfiler() if profile else None
+
+    def __getattr__(self, name):
+        '''
+        Import the schema group defining name on the first lookup and add
+        all its functions to the class.
+        '''
+        if (group := GROUPS.get(name)) is None:
+            raise AttributeError(f'{type(self).__name__!r} object has no '
+                                 f'attribute {name!r}')
+        module = import_module(f'{__package__}.schema.{group}')
+        for key, value in vars(module.Schema).items():
+            if key in GROUPS:
+                setattr(TLStruct, key, value)
+        return getattr(self, name)
+
+    @property
+    def raise_error(self):
+        return self._raise_error
+
+    @raise_error.setter
+    def raise_error(self, value):
+        if value:
             self.exception = raise_exception
         else:
             self.exception = logger.exception
+        self._raise_error = value
+
+    @property
+    def build_profiler(self):
+        '''The profiler of the built Structs, when they do the parsing.'''
+        if self.compiled or self.decoder:
+            return None
+        return self.profiler
+
+    @property
+    def builder(self):
+        '''The instance the schema functions build the Structs with.'''
+        return get_builder(type(self), self.build_profiler)
+
+    @property
+    def skipped(self):
+        '''Byte ranges the last parse of this thread skipped in salvage.'''
+        return getattr(self.local, 'skipped', [])
 
-    def parse_blob(self, data):
-        result = self.parse(data)
+    @skipped.setter
+    def skipped(self, value):
+        self.local.skipped = value
+
+    def parse_blob(self, data, python=False):
+        '''
+        Parse the objects of a blob, the only one or a list of them. With
+        python, they are decoded straight into their pythonic() shape.
+        '''
+        result = self.parse(data, python)
         if not result:
             return None
         elif len(result) == 1:
@@ -77,37 +271,255 @@ class TLStruct:
         else:
             return result
 
+    @lazy_property
+    def structs(self):
+        '''Map every registered constructor id to its built Struct.'''
+        return StructTable(self)
+
+    @lazy_property
+    def dispatch(self):
+        '''The table parse uses, structs unless compiled.'''
+        if self.compiled:
+            with SCHEMA_LOCK:
+                return load_compiled(self.structs, self.LAYER,
+                                     self.cache_dir, self.profiler, self.INFO)
+        return self.structs
+
+    @lazy_property
+    def unions(self):
+        '''Map every *_structures name to its union Struct.'''
+        return {x: getattr(self, x)(x[:-11]) for x in self.GROUPS
+                if x.endswith('_structures')}
+
+    @lazy_property
+    def signatures(self):
+        '''Constructor ids an object of a blob can start with.'''
+        return frozenset(self.INFO).difference((VECTOR,))
+
+    @lazy_property
+    def unprofiled(self):
+        '''
+        This parser, or a copy without profiler when the built Structs of
+        this one are wrapped by it, code generation walks the plain ones.
+        '''
+        if self.build_profiler is None:
+            return self
+        return type(self)(cache_dir=self.cache_dir)
+
+    @lazy_property
+    def decoder_module(self):
+        '''Plain python decoders generated from the schema.'''
+        with SCHEMA_LOCK:
+            module = load_decoders(self.unprofiled)
+        if self.profiler is not None:
+            self.profiler.instrument(vars(module), 'decode_0x',
+                                     self.profiler.wrap_decoder, self.INFO)
+        return module
+
+    @lazy_property
+    def decoders(self):
+        '''Map every registered constructor id to its plain python decoder.'''
+        return self.decoder_module.DECODERS
+
+    def get_projector(self, paths):
+        key = tuple(paths)
+        if (projector := self.projectors.get(key)) is None:
+            projector = Projector(self.decoder_module,
+                                  self.unprofiled.structs, key,
+                                  self.profiler, self.INFO)
+            self.projectors[key] = projector
+        return projector
+
+    def build(self):
+        '''
+        Build every Struct of the schema, resolve the cases of all its unions
+        and load the compiled module or the decoders this parser uses, so
+        nothing is built or changed by later parses. The parser can then be
+        shared by threads and, built before a fork, by the child processes.
+        '''
+        stack = list(self.structs.values())
+        seen = set()
+        while stack:
+            if id(obj := stack.pop()) in seen:
+                continue
+            seen.add(id(obj))
+            if isinstance(obj, TLUnion):
+                obj.load()
+            stack.extend(iter_subcons(obj))
+        table = self.decoders if self.decoder else self.dispatch
+        logger.debug('schema layer %d built, %d constructors, %d Structs',
+                     self.LAYER, len(table), len(seen))
+        return self
+
     def get_parser(self, data):
         signature = int.from_bytes(data[:4], 'little')
-        return getattr(self, f'struct_0x{signature:08x}', None)
+        return self.dispatch.get(signature)
+
+    def parse_from(self, buffer, offset=0, python=False):
+        '''
+        Parse the object at offset of buffer, any bytes-like object, without
+        copying the buffer. Returns the object and the offset after it. With
+        python, or in decoder mode, the object is built by the decoders in
+        its pythonic() shape, without any Container.
+        '''
+        signature = int.from_bytes(buffer[offset:offset + 4], 'little')
+        if self.decoder or python:
+            if (decoder := self.decoders.get(signature)) is not None:
+                return decoder(memoryview(buffer), offset)
+        elif (parser := self.dispatch.get(signature)) is not None:
+            stream = open_stream(buffer, offset)
+            return parser.parse_stream(stream), stream.tell()
+        self.exception('unknown signature: 0x%08x, offset: %d',
+                       signature, offset)
+        return None, offset
+
+    def sizeof_at(self, buffer, offset=0, name=None):
+        '''
+        Byte length of the object at offset of buffer, found by walking its
+        flags, strings, vectors and unions without building anything. With
+        name, a *_structures union is sized instead of the constructor of the
+        signature at offset, an unknown signature there takes no bytes.
+        '''
+        if name is not None:
+            skip = self.decoder_module.UNION_SKIPPERS[name]
+        else:
+            signature = int.from_bytes(buffer[offset:offset + 4], 'little')
+            if (skip := self.decoder_module.SKIPPERS.get(signature)) is None:
+                self.exception('unknown signature: 0x%08x, offset: %d',
+                               signature, offset)
+                return None
+        return skip(memoryview(buffer), offset) - offset
+
+    def parse_fields(self, data, paths, offset=0):
+        '''
+        Decode only the dotted paths, as get_obj_value takes them, of the
+        object at offset, subtrees nobody asked for are skipped by length.
+        Returns a dict in the pythonic shape holding just those paths. In
+        salvage mode, an object of an unknown signature or failing to decode
+        is parsed by parse_blob instead, an empty dict when it is skipped.
+        '''
+        signature = int.from_bytes(data[offset:offset + 4], 'little')
+        try:
+            projection = self.get_projector(paths)[signature]
+        except KeyError:
+            projection = None
+        if projection is not None:
+            try:
+                return projection(memoryview(data), offset)[0]
+            except Exception:  # pylint: disable=W0718
+                if not self.salvage:
+                    raise
+        elif not self.salvage:
+            self.exception('unknown signature: 0x%08x, offset: %d',
+                           signature, offset)
+            return None
+        result = self.parse_blob(data[offset:], True)
+        if not result or (self.skipped and self.skipped[0][0] == 0):
+            return {}
+        return result[0] if isinstance(result, list) else result
+
+    def parse_many(self, blobs, python=False):
+        '''
+        Parse blobs like parse_blob, yielding (result, None) or (None, error)
+        per blob, skipped then holds the salvage ranges of that blob.
+        '''
+        dispatch = self.dispatch
+        decoders = self.decoders if self.decoder or python else None
+        context = Container(_parsing=True, _building=False, _sizing=False)
+        context._params = context
+        for data in blobs:
+            self.skipped = []
+            signature = int.from_bytes(data[:4], 'little')
+            result = end = None
+            try:
+                if decoders is not None:
+                    if (decode := decoders.get(signature)) is not None:
+                        result, end = decode(memoryview(data), 0)
+                elif (parser := dispatch.get(signature)) is not None:
+                    stream = open_stream(data)
+                    result = parser._parsereport(stream, context,
+                                                 '(parsing)')
+                    end = stream.tell()
+            except Exception:  # pylint: disable=W0718
+                end = None
+            error = None
+            if end != len(data):
+                try:
+                    result = self.parse_blob(data, python)
+                except Exception as e:  # pylint: disable=W0718
+                    result, error = None, e
+            yield result, error
 
-    def parse(self, data):
+    def resync(self, data, offset):
+        '''
+        Offset of the first known signature after the object at offset,
+        objects are 4 byte aligned, the length of data when there is none.
+        The words are tested in bulk, by map over an array of each block.
+        '''
+        known = self.signatures.__contains__
+        view = memoryview(data)
+        start = offset + 4
+        end = start + (len(data) - start) // 4 * 4
+        for block in range(start, end, 4 * RESYNC_WORDS):
+            words = array('I')
+            words.frombytes(view[block:min(block + 4 * RESYNC_WORDS, end)])
+            if sys.byteorder == 'big':
+                words.byteswap()
+            hits = list(map(known, words))
+            if True in hits:
+                return block + 4 * hits.index(True)
+        return len(data)
+
+    def skip_unknown(self, data, offset, signature):
+        '''Salvage mode: skip to the next known signature, record the gap.'''
+        end = self.resync(data, offset)
+        logger.warning('salvage: skipped bytes %d-%d of %d, signature '
+                       '0x%08x', offset, end, len(data), signature)
+        self.skipped.append((offset, end))
+        return end
+
+    def parse(self, data, python=False):
+        '''
+        Parse every object of data, with python in their pythonic() shape.
+        In salvage mode, an unknown signature or an object failing to parse
+        is skipped up to the next known signature and the skipped byte
+        ranges are kept in skipped.
+        '''
         result = []
-        parser = self.get_parser(data)
-        if parser is None:
+        dispatch = self.dispatch
+        self.skipped = []
+        if self.get_parser(data) is None:
             count = int.from_bytes(data[:4], 'little')
-            unparsed = data[4:]
             parsed_len = 4
             unknown = count
         else:
             count = 256
-            unparsed = data
             parsed_len = 0
             unknown = None
         data_len = len(data)
         for _ in range(count):
-            parser = self.get_parser(unparsed)
-            if parser:
-                ret = parser().parse(unparsed)
-                result.append(ret)
-                parsed_len += ret._io.tell()
+            signature = int.from_bytes(data[parsed_len:parsed_len + 4],
+                                       'little')
+            if signature in dispatch:
+                try:
+                    ret, parsed_len = self.parse_from(data, parsed_len,
+                                                      python)
+                except Exception:  # pylint: disable=W0718
+                    if not self.salvage:
+                        raise
+                    parsed_len = self.skip_unknown(data, parsed_len,
+                                                   signature)
+                else:
+                    result.append(ret)
+                if data_len == parsed_len:
+                    break
+            elif self.salvage:
+                parsed_len = self.skip_unknown(data, parsed_len, signature)
                 if data_len == parsed_len:
                     break
-                unparsed = data[parsed_len:]
             else:
-                signature = int.from_bytes(unparsed[:4], 'little')
-                if signature in INFO:
-                    name = INFO.get(signature)
+                if signature in self.INFO:
+                    name = self.INFO.get(signature)
                     self.exception('Not all data parsed for object: %s [0x%08x], '
                                    'input: %d, parsed: %d, missed: %s',
                                    name, signature, data_len, parsed_len,
@@ -127,7 +539,47 @@ class TLStruct:
             'sname' / Computed('vector'),
             'signature' / Hex(Const(0x1cb5c415, Int32ul)),
             'count' / Int32ul,
-            'content' / Array(this.count, datatype))
+            'content' / TLArray(this.count, datatype))
 
     # ---------------------------- Common end ---------------------------------
 
+
+@lru_cache()
+def get_layer_class(layer):
+    '''
+    The TLStruct class parsing a schema layer. A layer of LAYERS only has
+    its own functions where they differ from TLStruct, it shares the rest
+    and none of them is imported before its first use.
+    '''
+    if layer == TLStruct.LAYER:
+        return TLStruct
+    if layer not in LAYERS:
+        logger.warning('no schema of layer %d, using layer %d',
+                       layer, TLStruct.LAYER)
+        return TLStruct
+    package = f'{__package__}.layers.layer_{layer}'
+    module = import_module(package)
+    namespace = {x: LayerFunction(package, y)
+                 for x, y in module.GROUPS.items()}
+    namespace.update(LAYER=layer, INFO={**INFO, **module.INFO},
+                     GROUPS={**GROUPS, **module.GROUPS})
+    return type(f'TLStruct{layer}', (TLStruct,), namespace)
+
+
+def get_layer(user_version, tables=()):
+    '''
+    Schema layer of the client writing a database of user_version, the
+    oldest layer of LAYERS whose newest user_version it does not exceed,
+    else TLStruct.LAYER. Without user_version, as for a database rebuilt
+    from a dump, one lacking the messages_v2 table of the current clients
+    is taken for the oldest layer.
+    '''
+    versions = sorted(LAYERS.items(), key=lambda x: (x[1], x[0]))
+    if not user_version:
+        if versions and tables and 'messages_v2' not in tables:
+            return versions[0][0]
+        return TLStruct.LAYER
+    for layer, version in versions:
+        if user_version <= version:
+            return layer
+    return TLStruct.LAYER
@@ -7,10 +7,13 @@ Created on Wed Dec  7 08:47:59 2022
 import os
 import os.path as osp
 import re
+import shutil
 import logging
+import tempfile
 from glob import iglob
 from enum import IntEnum
 from functools import lru_cache
+from importlib.util import spec_from_file_location, module_from_spec
 from javalang.parse import parse
 from javalang.tree import (Node, ClassDeclaration,
                            FieldDeclaration, FormalParameter,
@@ -24,14 +27,20 @@ from javalang.tree import (Node, ClassDeclaration,
                            ForControl, BinaryOperation, TernaryExpression,
                            Cast, This, MemberReference, Literal)
 from tools import name_convert_to_snake, lazy_property
+from datatype.compiler import (get_schema_digest, get_schema_paths,
+                               DECODER_GENERATOR)
 try:
     from .common import STRUCT_CACHE, HEADER
+    from .decoder import generate_decoder_source
+    from .schema import split_schema, split_layer, join_schema
     from .utils import (save_code, get_struct_content,
                         get_structures_content,
                         get_simple_struct_content,
                         get_todo_struct_content)
 except ImportError:
     from generater.common import STRUCT_CACHE, HEADER
+    from generater.decoder import generate_decoder_source
+    from generater.schema import split_schema, split_layer, join_schema
     from generater.utils import (save_code, get_struct_content,
                                  get_structures_content,
                                  get_simple_struct_content,
@@ -1164,6 +1173,11 @@ class ClassParser(BaseParser):
         return result
 
     def generate(self):
+        '''
+        The schema function sources of the class. The plain python decoders
+        are not generated here but by JavaParser.generate from the whole
+        schema, as a decoder inlines the constructors and unions it reads.
+        '''
         ret = self.parse()
         if ret is None:
             return None
@@ -1410,15 +1424,33 @@ class JavaParser(BaseParser):
                                          item)
         return result
 
-    def generate(self, target):
+    def generate(self, target, decoder=None):
         '''
         TL_inputStorePaymentGiftPremium case 0x44618a7d 0x616f7fe8
 
+        The schema is split into the TLStruct module at target and its
+        groups in the schema package next to it. When decoder is a path, the
+        plain python decoders of the generated schema are written there too.
+
         Returns
         -------
         None.
 
         '''
+        split_schema(self.get_schema_content(), target)
+        if decoder:
+            self.generate_decoder(target, decoder)
+
+    def generate_layer(self, base, user_version):
+        '''
+        Add the schema of the parsed sources as layer LAYER next to the
+        TLStruct module at base, for the databases up to user_version. Only
+        the functions differing from base are written, see split_layer.
+        '''
+        split_layer(self.get_schema_content(), base, self.LAYER, user_version)
+
+    def get_schema_content(self):
+        '''The source of the whole schema module of the parsed sources.'''
         result = self.get_parse_result()
         structures_names = sorted([x for x in result if x.endswith('_structures')])
         sorted_names = []
@@ -1463,13 +1495,27 @@ class JavaParser(BaseParser):
         result_text += sorted_text
         result_text += '\r\n'
         result_text += left_text
-        save_code(target, result_text)
+        return result_text
+
+    def generate_decoder(self, schema, target):
+        '''
+        Emit the plain python decoder backend of a generated schema module,
+        TLStruct(decoder=True) uses it instead of the construct structs.
+        '''
+        name = osp.splitext(osp.basename(schema))[0]
+        spec = spec_from_file_location(f'datatype.{name}', schema)
+        module = module_from_spec(spec)
+        spec.loader.exec_module(module)
+        parser = module.TLStruct()
+        digest = get_schema_digest(*get_schema_paths(schema),
+                                   DECODER_GENERATOR)
+        content = generate_decoder_source(parser.structs, digest,
+                                          parser.unions)
+        save_code(target, content)
 
     def merge(self, path, target, replace=False):
         parse_result = self.get_parse_result()
-        with open(path, 'rb') as f:
-            content = f.read()
-        content = re.sub(b'\r*\n', b'\r\n', content).decode('utf-8')
+        content = re.sub('\r*\n', '\r\n', join_schema(path))
         if self.LAYER:
             content = re.sub(r'LAYER = \d+',
                              f'LAYER = {self.LAYER}',
@@ -1549,12 +1595,11 @@ class JavaParser(BaseParser):
         for key in append_items:
             result_list.append(parse_result[key])
         content_text = '\r\n\r\n'.join(result_list)
-        save_code(target, content_text)
+        split_schema(content_text, target)
 
     @classmethod
     def remove_duplicate(cls, path, target, all_same=True):
-        with open(path, encoding='utf-8') as f:
-            c = f.read()
+        c = join_schema(path)
         func_map = {}
         func_index_map = {}
         start = 0
@@ -1583,8 +1628,7 @@ class JavaParser(BaseParser):
 
     @classmethod
     def remove_sname(cls, path, target):
-        with open(path, encoding='utf-8') as f:
-            c = f.read()
+        c = join_schema(path)
         start = 0
         result = []
         result_index = 0
@@ -1611,8 +1655,7 @@ class JavaParser(BaseParser):
 
     @classmethod
     def sort_file(cls, path, target):
-        with open(path, encoding='utf-8') as f:
-            c = f.read()
+        c = join_schema(path)
         func_map = {}
         start = 0
         result = []
@@ -1668,8 +1711,7 @@ class JavaParser(BaseParser):
     @classmethod
     def sort(cls, path, target):
         parse_result = {}
-        with open(path, encoding='utf-8') as f:
-            c = f.read()
+        c = join_schema(path)
         parse_result = {}
         left = []
         start = 0
@@ -1726,7 +1768,54 @@ class JavaParser(BaseParser):
         result_text += header_text
         result_text += sorted_text
         result_text += left_text
-        save_code(target, result_text)
+        split_schema(result_text, target)
+
+SNAPSHOT_PATTERN = re.compile(r'TLRPC-([\d.]+)-(\d+)-\w+\.java')
+
+DB_VERSION_PATTERN = re.compile(r'\bLAST_DB_VERSION\s*=\s*(\d+)')
+
+
+def get_snapshots(directory):
+    '''
+    Map a layer to the newest of its TLRPC sources in directory, named
+    TLRPC-<version>-<layer>-<commit>.java as repo/git_checkout.py does.
+    '''
+    snapshots = []
+    for path in iglob(osp.join(directory, 'TLRPC-*.java')):
+        if (match := SNAPSHOT_PATTERN.fullmatch(osp.basename(path))):
+            version = tuple(int(x) for x in match.group(1).split('.'))
+            snapshots.append((version, int(match.group(2)), path))
+    return {y: z for x, y, z in sorted(snapshots)}
+
+
+def get_user_version(path):
+    '''The LAST_DB_VERSION of a MessagesStorage.java source, if any.'''
+    with open(path, encoding='utf-8') as f:
+        match = DB_VERSION_PATTERN.search(f.read())
+    return int(match.group(1)) if match else None
+
+
+def generate_layers(directory, base, versions, level=logging.INFO):
+    '''
+    Add the layers of versions next to the TLStruct module at base from
+    their newest TLRPC source in directory, see JavaParser.generate_layer.
+    versions maps a layer to the newest database user_version of its
+    clients, which the TLRPC sources do not record: it is LAST_DB_VERSION
+    of MessagesStorage.java at the commit named by the source, see
+    get_user_version.
+    '''
+    snapshots = get_snapshots(directory)
+    relpath = f'{JavaParser.ROOT.replace(".", os.sep)}.java'
+    for layer, user_version in sorted(versions.items()):
+        if layer not in snapshots:
+            raise ValueError(f'no TLRPC source of layer {layer}')
+        with tempfile.TemporaryDirectory() as root:
+            target = osp.join(root, relpath)
+            os.makedirs(osp.dirname(target))
+            shutil.copyfile(snapshots[layer], target)
+            parser = JavaParser(root, level=level)
+            parser.generate_layer(base, user_version)
+
 
 def test():
     path = r'E:\Project\Godsix\Telegram\TMessagesProj\src\main\java'
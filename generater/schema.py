@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:20:41 2026
+
+@author: C. David
+"""
+import os
+import os.path as osp
+import re
+from glob import glob
+try:
+    from .utils import save_code
+except ImportError:
+    from generater.utils import save_code
+
+
+FUNC_PATTERN = re.compile(r"(?m:^) +@(?:constructor|structures)\b.*\n"
+                          r" +def (\w+)\(.+\)(?s:.+?)(?=\n\n|$)")
+
+CONSTRUCTOR_PATTERN = re.compile(r"@constructor\((\w+), '(\w+)'")
+
+STRUCT_PATTERN = re.compile(r'self\.(struct_0x\w{8})')
+
+TODO_PATTERN = re.compile(r'#\s*TODO\b')
+
+SPLIT_LINE = f'{" " * 4}# {"-" * 73}'
+
+SCHEMA_PACKAGE = 'schema'
+
+LAYERS_PACKAGE = 'layers'
+
+LAYER_PATTERN = re.compile(r'^USER_VERSION = (\d+)$', re.M)
+
+GROUP_HEADER = '''# -*- coding: utf-8 -*-
+"""
+Schema group {name} of TLStruct, generated by generater.schema, do not edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ..common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ..telegram import constructor, structures
+
+
+class Schema:
+
+'''
+
+LAYER_GROUP_HEADER = '''# -*- coding: utf-8 -*-
+"""
+Schema group {name} of layer {layer}, generated by generater.schema, do not
+edit!
+"""
+# pylint: disable=unused-import,too-many-lines,too-many-public-methods,line-too-long
+from construct import (Struct, Computed, Int32ul, Int64ul, Double, Hex,
+                       Array, If,
+                       Const, LazyBound, this)
+from ...common import TString, TBytes, TBool, TTimestamp, TLUnion, FlagsEnum
+from ...telegram import constructor, structures
+
+
+class Schema:
+
+'''
+
+LAYER_INDEX_HEADER = '''# -*- coding: utf-8 -*-
+"""
+Index of the schema functions of layer {layer} differing from TLStruct,
+generated by generater.schema, do not edit! USER_VERSION is the newest
+database user_version written by its clients, INFO and GROUPS are as in
+the schema package.
+"""
+# pylint: disable=too-many-lines
+'''
+
+LAYERS_HEADER = '''# -*- coding: utf-8 -*-
+"""
+Registry of the schema layers besides the one of TLStruct, generated by
+generater.schema, do not edit! LAYERS maps a layer to the newest database
+user_version written by its clients, the package layer_<layer> holds only
+the schema functions of the layer differing from TLStruct. The TLRPC sources
+of repo/files do not record that user_version, see generater.parser
+generate_layers, so a layer is only registered once it is known.
+"""
+'''
+
+INDEX_HEADER = '''# -*- coding: utf-8 -*-
+"""
+Index of the TLStruct schema groups, generated by generater.schema, do not
+edit! INFO maps a constructor id to its name, GROUPS maps a schema function
+name to the module of this package defining it.
+"""
+# pylint: disable=too-many-lines
+'''
+
+
+def get_schema_dir(path):
+    '''The package of the schema groups next to the TLStruct module at path.'''
+    return osp.join(osp.dirname(path), SCHEMA_PACKAGE)
+
+
+def get_layers_dir(path):
+    '''The package of the schema layers next to the TLStruct module at path.'''
+    return osp.join(osp.dirname(path), LAYERS_PACKAGE)
+
+
+def get_functions(content):
+    '''
+    Map every struct_0x* and *_structures function to its source, those
+    decorated by constructor or structures, not the methods of TLStruct.
+    '''
+    result = {}
+    for item in FUNC_PATTERN.finditer(content):
+        name = item.group(1)
+        if name.startswith('struct_') or name.endswith('_structures'):
+            result.setdefault(name, item)
+    return result
+
+
+def get_groups(functions: dict):
+    '''
+    Assign every function to a group: a union with its members, a
+    constructor only referenced directly goes along with the first one
+    referencing it, the rest are grouped by the namespace of their name.
+    Functions are visited by name, so the groups do not depend on the
+    order of functions: a split schema joined and split again is the same.
+    '''
+    owner = {}
+    unions = sorted(x for x in functions if x.endswith('_structures'))
+    for name in unions:
+        group = name[:-11]
+        for item in STRUCT_PATTERN.findall(functions[name]):
+            owner.setdefault(item, group)
+        owner[name] = group
+    references = {}
+    for name in sorted(functions):
+        for item in STRUCT_PATTERN.findall(functions[name]):
+            if item != name:
+                references.setdefault(item, name)
+
+    def get_owner(name, seen=()):
+        if name in owner:
+            return owner[name]
+        if (referer := references.get(name)) and referer not in seen:
+            return get_owner(referer, (*seen, name))
+        sname = CONSTRUCTOR_PATTERN.search(functions[name]).group(2)
+        return sname.split('_')[0]
+
+    result = {}
+    for name in unions:
+        group = result.setdefault(owner[name], [])
+        group.extend(x for x in STRUCT_PATTERN.findall(functions[name])
+                     if x in functions and owner[x] == owner[name] and
+                     x not in group)
+        group.append(name)
+    for name in sorted(functions):
+        if name.startswith('struct_') and name not in owner:
+            owner[name] = get_owner(name)
+            result.setdefault(owner[name], []).append(name)
+    return result
+
+
+def split_schema(content, target):
+    '''
+    Split the source of a whole schema module into the TLStruct module at
+    target, holding everything before the first schema function, and one
+    module per group in the schema package next to it. TLStruct imports a
+    group the first time one of its functions is looked up.
+    '''
+    content = re.sub('\r\n', '\n', content)
+    functions = get_functions(content)
+    start = min(x.start() for x in functions.values())
+    header = re.sub(r'(\n+ *# -+ *)+\n*$', '\n', content[:start])
+    contents = {x: y.group(0) for x, y in functions.items()}
+    groups = get_groups(contents)
+    directory = get_schema_dir(target)
+    os.makedirs(directory, exist_ok=True)
+    for path in glob(osp.join(directory, '*.py')):
+        os.remove(path)
+    info = {}
+    index = {}
+    for group, names in sorted(groups.items()):
+        for name in names:
+            index[name] = group
+            if (match := CONSTRUCTOR_PATTERN.search(contents[name])):
+                info[match.group(1)] = match.group(2)
+        text = '\n\n'.join(contents[x] for x in names)
+        save_code(osp.join(directory, f'{group}.py'),
+                  f'{GROUP_HEADER.format(name=group)}{text}\n')
+    lines = [INDEX_HEADER, 'INFO = {']
+    lines.extend(f'    {x}: {y!r},' for x, y in info.items())
+    lines.extend(['}', '', 'GROUPS = {'])
+    lines.extend(f'    {x!r}: {y!r},' for x, y in index.items())
+    lines.append('}\n')
+    save_code(osp.join(directory, '__init__.py'), '\n'.join(lines))
+    save_code(target, header)
+
+
+def join_schema(path):
+    '''
+    Return the source of the whole schema module split by split_schema, the
+    TLStruct module at path followed by the functions of every group.
+    '''
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    directory = get_schema_dir(path)
+    groups = sorted(x for x in glob(osp.join(directory, '*.py'))
+                    if not osp.basename(x).startswith('_'))
+    if not groups or get_functions(content):
+        return content
+    result = [content.rstrip('\n'), SPLIT_LINE]
+    for group in groups:
+        with open(group, encoding='utf-8') as f:
+            text = f.read()
+        result.append(text.split('class Schema:\n\n', 1)[1].rstrip('\n'))
+        result.append(SPLIT_LINE)
+    return '\n\n'.join(result) + '\n'
+
+
+def save_layers(directory):
+    '''Write the LAYERS registry of the layer packages in directory.'''
+    layers = {}
+    for path in glob(osp.join(directory, 'layer_*', '__init__.py')):
+        with open(path, encoding='utf-8') as f:
+            version = int(LAYER_PATTERN.search(f.read()).group(1))
+        layers[int(osp.basename(osp.dirname(path))[6:])] = version
+    lines = [LAYERS_HEADER, 'LAYERS = {']
+    lines.extend(f'    {x}: {y},' for x, y in sorted(layers.items()))
+    lines.append('}\n')
+    save_code(osp.join(directory, '__init__.py'), '\n'.join(lines))
+
+
+def split_layer(content, base, layer, user_version):
+    '''
+    Write the functions of the source of a whole schema module of another
+    layer which differ from the TLStruct module at base into the package
+    layer_<layer> of the layers package next to it, grouped as split_schema
+    does, and register the layer for databases up to user_version. The
+    functions alike in both are left out, the layer shares them, as are
+    the TODO stubs of classes the sources of the layer did not hold.
+    '''
+    content = re.sub('\r\n', '\n', content)
+    origin = {x: y.group(0) for x, y in get_functions(join_schema(base)).items()}
+    contents = {x: y.group(0) for x, y in get_functions(content).items()
+                if not TODO_PATTERN.search(y.group(0))}
+    layers_dir = get_layers_dir(base)
+    directory = osp.join(layers_dir, f'layer_{layer}')
+    os.makedirs(directory, exist_ok=True)
+    for path in glob(osp.join(directory, '*.py')):
+        os.remove(path)
+    info = {}
+    index = {}
+    for group, names in sorted(get_groups(contents).items()):
+        if not (names := [x for x in names if contents[x] != origin.get(x)]):
+            continue
+        for name in names:
+            index[name] = group
+            if (match := CONSTRUCTOR_PATTERN.search(contents[name])):
+                info[match.group(1)] = match.group(2)
+        text = '\n\n'.join(contents[x] for x in names)
+        header = LAYER_GROUP_HEADER.format(name=group, layer=layer)
+        save_code(osp.join(directory, f'{group}.py'), f'{header}{text}\n')
+    lines = [LAYER_INDEX_HEADER.format(layer=layer),
+             f'USER_VERSION = {user_version}', '', 'INFO = {']
+    lines.extend(f'    {x}: {y!r},' for x, y in info.items())
+    lines.extend(['}', '', 'GROUPS = {'])
+    lines.extend(f'    {x!r}: {y!r},' for x, y in index.items())
+    lines.append('}\n')
+    save_code(osp.join(directory, '__init__.py'), '\n'.join(lines))
+    save_layers(layers_dir)
+
+
+def split(path, target=None):
+    '''Split the whole schema module at path, in place unless target.'''
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    split_schema(content, target or path)
@@ -28,12 +28,15 @@
 '''Telegram sqlite3 DB parser.'''
 
 # pylint: disable=C0103,C0115,C0116,C0302,R0902,R0914,R0913
+import gc
 import os
 from datetime import datetime, UTC
+from concurrent.futures import ProcessPoolExecutor
 from sqlalchemy import BLOB
 import logger
 from database import TelegramDB
-from datatype import pythonic, get_obj_value, format_dict
+from datatype import (pythonic, get_obj_value, get_extractor, format_dict,
+                      JsonWriter)
 from tools.lazy import lazy_property, del_lazy_attr
 
 # ------------------------------------------------------------------------------
@@ -47,6 +50,27 @@ TYPE_MSG_TO_CHANNEL = 'channel'
 TYPE_MSG_TO_USER = 'chat'
 TYPE_USER_STATUS_UPDATE = 'user_status_update'
 
+# paths the timeline reads, each group in a single walk of the object
+CHAT_VALUES = get_extractor((
+    'flags', 'flags.is_creator', 'flags.is_left', 'flags.is_broadcast',
+    'flags.is_megagroup', 'flags.has_participants_count', 'participants_count'))
+CHAT_TYPE_VALUES = get_extractor((
+    'flags', 'flags.is_broadcast', 'flags.is_megagroup', 'flags.has_username',
+    'flags.is_left'))
+MEDIA_VALUES = get_extractor((
+    'media', 'media.sname', 'media.document', 'media.document.id',
+    'media.document.date', 'media.document.mime_type', 'media.document.size',
+    'media.document.attributes', 'media.photo', 'media.photo.id',
+    'media.photo.date', 'media.webpage', 'media.webpage.id',
+    'media.webpage.title', 'media.webpage.description'))
+MESSAGE_VALUES = get_extractor((
+    'sname', 'from_id.user_id', 'fwd_from', 'fwd_from.from_id',
+    'fwd_from.date', 'views'))
+REPLY_VALUES = get_extractor(('id', 'date', 'message'))
+USER_VALUES = get_extractor((
+    'flags', 'flags.has_status', 'flags.is_bot', 'flags.is_mutual_contact',
+    'flags.is_contact', 'status.sname'))
+
 # ------------------------------------------------------------------------------
 
 
@@ -67,10 +91,16 @@ def to_date(epoch):
 
 class TDB():
 
-    def __init__(self, outdirectory, db: TelegramDB):
+    def __init__(self, outdirectory, db: TelegramDB, jobs=1, project=False):
+        '''
+        project: decode only the FIELDS of the message blobs the timeline
+        reads, for a TDB whose tables are not saved.
+        '''
         assert outdirectory
         self._outdirectory = outdirectory
         self._db = db
+        self._jobs = jobs
+        self._project = project
         self._separator = CSV_SEPARATOR
         self._table_chats = {}
         self._table_contacts = {}
@@ -92,10 +122,10 @@ class TDB():
 
     def __save_table_chats(self, outdir):
         path = os.path.join(outdir, 'table_chats.txt')
-        with open(path, 'w+', encoding='utf-8') as f:
+        with open(path, 'w+', encoding='utf-8') as f, JsonWriter(f) as writer:
             for _uid, chat in self._table_chats.items():
-                f.write(self.separator)
-                f.write(chat.dump('\n\n'))
+                writer.write(self.separator)
+                chat.write(writer, '\n\n')
 
     def __parse_table_contacts(self):
         entries = self._db.get_contacts()
@@ -128,10 +158,10 @@ class TDB():
 
     def __save_table_dialogs(self, outdir):
         path = os.path.join(outdir, 'table_dialogs.txt')
-        with open(path, 'w+', encoding='utf-8') as f:
+        with open(path, 'w+', encoding='utf-8') as f, JsonWriter(f) as writer:
             for _did, dialog in self._table_dialogs.items():
-                f.write(self.separator)
-                f.write(dialog.dump())
+                writer.write(self.separator)
+                dialog.write(writer)
 
     def __parse_table_enc_chats(self):
         entries = self._db.get_enc_chats()
@@ -145,11 +175,11 @@ class TDB():
 
     def __save_table_enc_chats(self, outdir):
         path = os.path.join(outdir, 'table_enc_chats.txt')
-        with open(path, 'w+', encoding='utf-8') as f:
+        with open(path, 'w+', encoding='utf-8') as f, JsonWriter(f) as writer:
             for uid, tec in self._table_enc_chats.items():
                 assert uid == tec.uid
-                f.write(self.separator)
-                f.write(tec.dump())
+                writer.write(self.separator)
+                tec.write(writer)
 
     def __parse_table_media(self):
         entries = self._db.get_media()
@@ -162,10 +192,10 @@ class TDB():
 
     def __save_table_media(self, outdir):
         path = os.path.join(outdir, 'table_media.txt')
-        with open(path, 'w+', encoding='utf-8') as f:
+        with open(path, 'w+', encoding='utf-8') as f, JsonWriter(f) as writer:
             for mid, media in self._table_media.items():
-                f.write(self.separator)
-                f.write(media.dump())
+                writer.write(self.separator)
+                media.write(writer)
 
     def __parse_table_messages(self):
         entries = self._db.get_messages()
@@ -175,7 +205,7 @@ class TDB():
             # assert mid not in self._table_messages
             logger.info('parsing messages, entry mid: %s', mid)
 
-            message = TMessage(entry)
+            message = TMessage(entry, self._project)
 
             # The difference should be less than 5 seconds.
             date_from_blob = message.message_date_from_blob
@@ -189,10 +219,10 @@ class TDB():
 
     def __save_table_messages(self, outdir):
         path = os.path.join(outdir, 'table_messages.txt')
-        with open(path, 'w+', encoding='utf-8') as f:
+        with open(path, 'w+', encoding='utf-8') as f, JsonWriter(f) as writer:
             for mid, tmsg in self._table_messages.items():
-                f.write(self.separator)
-                f.write(tmsg.dump())
+                writer.write(self.separator)
+                tmsg.write(writer)
 
     def __parse_table_sent_files(self):
         entries = self._db.get_sent_files()
@@ -207,11 +237,11 @@ class TDB():
 
     def __save_table_sent_files(self, outdir):
         path = os.path.join(outdir, 'table_sent_files.txt')
-        with open(path, 'w+', encoding='utf-8') as f:
+        with open(path, 'w+', encoding='utf-8') as f, JsonWriter(f) as writer:
             for uid, sentfile in self._table_sent_files.items():
                 assert uid == sentfile.uid
-                f.write(self.separator)
-                f.write(sentfile.dump())
+                writer.write(self.separator)
+                sentfile.write(writer)
 
     def __parse_table_users(self):
         entries = self._db.get_users()
@@ -232,17 +262,17 @@ class TDB():
 
     def __save_table_users(self, outdir):
         path = os.path.join(outdir, 'table_users.txt')
-        with open(path, 'w+', encoding='utf-8') as f:
+        with open(path, 'w+', encoding='utf-8') as f, JsonWriter(f) as writer:
             for uid, user in self._table_users.items():
                 assert uid == user.uid
-                f.write(self.separator)
+                writer.write(self.separator)
                 # It seems status is the last update timestamp of the status,
                 # but only if the number is greater than 0.
                 if user.status > 0:
                     status = to_date(user.status)
                 else:
                     status = user.status
-                f.write(user.dump())
+                user.write(writer)
 
     def __parse_table_user_settings(self):
         entries = self._db.get_user_settings()
@@ -256,18 +286,39 @@ class TDB():
 
     def __save_table_user_settings(self, outdir):
         path = os.path.join(outdir, 'table_user_settings.txt')
-        with open(path, 'w+', encoding='utf-8') as f:
+        with open(path, 'w+', encoding='utf-8') as f, JsonWriter(f) as writer:
             for _uid, tus in self._table_user_settings.items():
-                f.write(self.separator)
+                writer.write(self.separator)
                 # if uid in self._table_users:
                 #     tid = self._table_users[uid].full_text_id
-                #     f.write(f'From [users] -> {tid}\n\n')
+                #     writer.write(f'From [users] -> {tid}\n\n')
                 # else:
-                #     f.write('User uid missing in [users]\n\n')
-                f.write(tus.dump())
+                #     writer.write('User uid missing in [users]\n\n')
+                tus.write(writer)
+
+    def __decode_tables(self):
+        tables = (('chats', TChat), ('dialogs', TDialog),
+                  ('enc_chats', TEchat), ('media', TMedia),
+                  ('messages', TMessage), ('sent_files', TSentFile),
+                  ('users', TUser), ('user_settings', TUserSettings))
+        # the forked workers share the schema built here, frozen out of the
+        # collector so that it does not copy its pages in every worker
+        self._db.parser.build()
+        gc.freeze()
+        try:
+            with ProcessPoolExecutor(self._jobs) as executor:
+                for name, cls in tables:
+                    for column in cls.BLOB_COLUMNS or (cls.BLOB_COLUMN,):
+                        logger.info('decoding %s.%s with %d jobs',
+                                    name, column, self._jobs)
+                        self._db.decode_blobs(name, column, executor)
+        finally:
+            gc.unfreeze()
 
     def parse(self):
         # TODO check new 9.2.0 tables
+        if self._jobs > 1:
+            self.__decode_tables()
         self.__parse_table_chats()
         self.__parse_table_contacts()
         self.__parse_table_dialogs()
@@ -305,19 +356,19 @@ class TDB():
             else:
                 row.type = sname
 
-            if (flags := get_obj_value(chat.blob, 'flags')):
+            values = CHAT_VALUES(chat.blob)
+            if values['flags']:
                 df = {}
-                if get_obj_value(flags, 'is_creator'):
+                if values['flags.is_creator']:
                     df['creator'] = 'true'
-                if get_obj_value(flags, 'is_left'):
+                if values['flags.is_left']:
                     df['left'] = 'true'
-                if get_obj_value(flags, 'is_broadcast'):
+                if values['flags.is_broadcast']:
                     df['broadcast'] = 'true'
-                if get_obj_value(flags, 'is_megagroup'):
+                if values['flags.is_megagroup']:
                     df['megagroup'] = 'true'
-                if get_obj_value(flags, 'has_participants_count'):
-                    df['members'] = get_obj_value(
-                        chat.blob, 'participants_count')
+                if values['flags.has_participants_count']:
+                    df['members'] = values['participants_count']
                 row.content += f' {TRow.dict_to_string(df)}'
 
             if chat.photo_info:
@@ -397,32 +448,34 @@ class TDB():
     def __message_media(self, mid, msg):
         # pylint: disable=R0201
         assert mid
-        if not (media := get_obj_value(msg.blob, 'media')):
+        values = MEDIA_VALUES(msg.fields)
+        if not values['media']:
             return None
         media_field = None
-        if (document := get_obj_value(media, 'document')):
+        if values['media.document']:
             result = []
             result.append('document')
-            info = {'id': get_obj_value(document, 'id'),
-                    'date': to_date(get_obj_value(document, 'date')),
-                    'mime': get_obj_value(document, 'mime_type'),
-                    'size': get_obj_value(document, 'size'),
+            info = {'id': values['media.document.id'],
+                    'date': to_date(values['media.document.date']),
+                    'mime': values['media.document.mime_type'],
+                    'size': values['media.document.size'],
                     }
             result.append(' '.join(f'{k}:{v}' for k, v in info.items()))
 
-            for entry in get_obj_value(document, 'attributes', []):
+            for entry in values['media.document.attributes'] or []:
                 if get_obj_value(entry, 'sname') == 'document_attribute_filename':
                     file_name = get_obj_value(entry, 'file_name')
                     result.append(f'file_name:{file_name}')
             media_field = ' '.join(result)
-        elif (photo := get_obj_value(media, 'photo')):
+        elif values['media.photo']:
             result = []
             result.append('photo')
-            info = {'id': get_obj_value(photo, 'id'),
-                    'date': to_date(get_obj_value(photo, 'date')),
+            info = {'id': values['media.photo.id'],
+                    'date': to_date(values['media.photo.date']),
                     }
             result.append(' '.join(f'{k}:{v}' for k, v in info.items()))
 
+            document = values['media.document']
             if (sizes := get_obj_value(document, 'sizes')):
                 for entry in sizes:
                     if not (location := get_obj_value(entry, 'location')):
@@ -434,21 +487,22 @@ class TDB():
                     local_id = get_obj_value(location, 'local_id')
                     result.append(f'{w}x{h}({size} bytes):{volume_id}_{local_id}.jpg')
             media_field = ' '.join(result)
-        elif (webpage := get_obj_value(media, 'webpage')):
+        elif values['media.webpage']:
             result = []
             result.append('webpage')
-            info = {'id': get_obj_value(webpage, 'id'),
+            webpage = values['media.webpage']
+            info = {'id': values['media.webpage.id'],
                     'url': get_obj_value(webpage, 'url', ''),
                     }
             result.append(' '.join(f'{k}:{v}' for k, v in info.items()))
-            if (title := get_obj_value(webpage, 'title')):
+            if (title := values['media.webpage.title']):
                 result.append(f'title:{title}')
 
-            if (description := get_obj_value(webpage, 'description')):
+            if (description := values['media.webpage.description']):
                 result.append(f'description:{description}')
             media_field = ' '.join(result)
         else:
-            media_field = get_obj_value(media, 'sname')
+            media_field = values['media.sname']
         return media_field
 
     def __messages_to_timeline(self):
@@ -457,8 +511,9 @@ class TDB():
             row = TRow()
             row.source = 'messages'
             row.id = mid
+            values = MESSAGE_VALUES(msg.fields)
 
-            if (from_id := get_obj_value(msg.blob, 'from_id.user_id')):
+            if (from_id := values['from_id.user_id']):
                 row.from_id = from_id
                 if from_id in self._table_users:
                     user = self._table_users[from_id]
@@ -494,7 +549,7 @@ class TDB():
                 logger.error('message %s, unmanaged to_id!', msg.mid)
                 row.to_who = to_who
 
-            row.type = get_obj_value(msg.blob, 'sname')
+            row.type = values['sname']
             action, action_dict = msg.action_string_and_dict
             if action:
                 assert not msg.message_content
@@ -504,17 +559,18 @@ class TDB():
                 row.content = msg.message_content.strip('"\'')
 
             if msg.reply_blob:
-                reply_id = get_obj_value(msg.reply_blob, 'id')
-                reply_date = to_date(get_obj_value(msg.reply_blob, 'date'))
-                reply_content = get_obj_value(msg.reply_blob, 'message', '').strip('"\'')
+                reply = REPLY_VALUES(msg.reply_blob)
+                reply_id = reply['id']
+                reply_date = to_date(reply['date'])
+                reply_content = (reply['message'] or '').strip('"\'')
                 row.content += f' [IS REPLY TO MSG ID {reply_id} {reply_date}]\n{reply_content}'
 
-            if (fwd_from := get_obj_value(msg.blob, 'fwd_from')):
-                fwd_from_id = get_obj_value(fwd_from, 'from_id')
-                fwd_from_date = to_date(get_obj_value(fwd_from, 'date'))
+            if values['fwd_from']:
+                fwd_from_id = values['fwd_from.from_id']
+                fwd_from_date = to_date(values['fwd_from.date'])
                 row.content += f' [FORWARDED OF MSG BY {fwd_from_id} {fwd_from_date}]'
 
-            if (views := get_obj_value(msg.blob, 'views')):
+            if (views := values['views']):
                 row.extra.update({'views': views})
 
             if (media := self.__message_media(mid, msg)):
@@ -537,14 +593,15 @@ class TDB():
 
             row.content = TRow.dict_to_string(user.dict_id)
             ui_dict = {}
-            if (flags := get_obj_value(user.blob, 'flags')):
-                if get_obj_value(flags, 'has_status'):
-                    ui_dict['status'] = get_obj_value(user.blob, 'status.sname')
-                if get_obj_value(flags, 'is_bot'):
+            values = USER_VALUES(user.blob)
+            if values['flags']:
+                if values['flags.has_status']:
+                    ui_dict['status'] = values['status.sname']
+                if values['flags.is_bot']:
                     ui_dict['bot'] = 'true'
-                if get_obj_value(flags, 'is_mutual_contact'):
+                if values['flags.is_mutual_contact']:
                     ui_dict['mutual_contact'] = 'true'
-                elif get_obj_value(flags, 'is_contact'):
+                elif values['flags.is_contact']:
                     ui_dict['contact'] = 'true'
             if ui_dict:
                 row.content += f' {TRow.dict_to_string(ui_dict)}'
@@ -574,9 +631,12 @@ class TDB():
 
 class TBase:
     BLOB_COLUMN = 'data'
+    BLOB_COLUMNS = ()
+    FIELDS = ()
 
-    def __init__(self, entry):
+    def __init__(self, entry, project=False):
         self.entry = entry
+        self.project = project
 
     def __getattr__(self, name):
         if not name.startswith('_') and hasattr(self.entry, name):
@@ -604,6 +664,20 @@ class TBase:
         return pythonic(blob)
 
     @lazy_property
+    def fields(self):
+        '''With project, only the FIELDS paths of the blob, else the blob.'''
+        if not (self.project and self.FIELDS):
+            return self.blob
+        data = getattr(self.entry, self.BLOB_COLUMN)
+        parser = self.entry.PARSER
+        if data is None or parser.get_parser(data) is None:
+            return self.blob
+        fields = parser.parse_fields(data, self.FIELDS)
+        if (compactor := self.entry.COMPACTOR) is not None:
+            fields = compactor.compact(fields)
+        return fields
+
+    @property
     def vkeys(self):
         cols = self.entry.__table__.columns
         vkeys = (k for k, v in cols.items() if not isinstance(v.type, BLOB))
@@ -616,21 +690,30 @@ class TBase:
         else:
             return f'{attr}: {value}'
 
-    @lazy_property
+    @property
     def vdata_list(self):
         return [self.get_vdata(x) for x in self.vkeys]
 
-    @lazy_property
+    @property
     def vdata(self):
         return ' '.join(self.vdata_list)
 
-    @lazy_property
+    @property
     def bdata(self):
         return format_dict(self.blob)
 
     def dump(self, newline='\n'):
         return f'{self.vdata}{newline}{self.bdata}{newline}'
 
+    def write_blob(self, writer: JsonWriter):
+        writer.write_object(self.blob)
+
+    def write(self, writer: JsonWriter, newline='\n'):
+        '''Write the dump through writer, the blob text is not kept.'''
+        writer.write(f'{self.vdata}{newline}')
+        self.write_blob(writer)
+        writer.write(newline)
+
 
 class TRow:
     FIELDS = ('timestamp', 'source', 'id', 'type', 'from', 'from_id', 'to',
@@ -785,10 +868,11 @@ class TChat(TBase):
     @lazy_property
     def chat_type(self):
         ct = ''
-        if not get_obj_value(self.blob, 'flags'):
+        values = CHAT_TYPE_VALUES(self.blob)
+        if not values['flags']:
             return ct
-        is_broadcast = get_obj_value(self.blob, 'flags.is_broadcast')
-        is_megagroup = get_obj_value(self.blob, 'flags.is_megagroup')
+        is_broadcast = values['flags.is_broadcast']
+        is_megagroup = values['flags.is_megagroup']
         if is_broadcast:
             assert not is_megagroup
             ct = '1-N'
@@ -797,11 +881,11 @@ class TChat(TBase):
             ct = 'N-N'
         else:
             ct = '?-?'
-        if get_obj_value(self.blob, 'flags.has_username'):
+        if values['flags.has_username']:
             ct += ' pub'
         else:
             ct += ' prv'
-        if get_obj_value(self.blob, 'flags.is_left'):
+        if values['flags.is_left']:
             ct += ' left'
         return ct
 
@@ -846,7 +930,7 @@ class TDialog(TBase):
                  'pinned', 'flags', 'folder_id', 'data', 'unread_reactions',
                  'last_mid_group', 'ttl_period']
 
-    @lazy_property
+    @property
     def vdata(self):
         newline = '\n'
         result = []
@@ -860,13 +944,16 @@ class TDialog(TBase):
         result.append(newline)
         return ''.join(result)
 
-    @lazy_property
+    @property
     def bdata(self):
         return ''
 
     def dump(self, newline='\n'):
         return f'{self.vdata}{newline}{self.bdata}{newline}'
 
+    def write_blob(self, writer: JsonWriter):
+        pass
+
 
 # ------------------------------------------------------------------------------
 
@@ -911,7 +998,7 @@ class TEchat(TBase):
                        self.uid)
         return None
 
-    @lazy_property
+    @property
     def vdata(self):
         newline = '\n'
         result = []
@@ -944,6 +1031,12 @@ class TMessage(TBase):
                  'forwards', 'replies_data', 'thread_reply_id', 'is_channel',
                  'reply_to_message_id', 'custom_params', 'group_id',
                  'reply_to_story_id']
+    FIELDS = ('sname', 'date', 'peer_id', 'from_id.user_id', 'message',
+              'action', 'views', 'fwd_from.from_id', 'fwd_from.date',
+              'media.sname', 'media.document', 'media.photo',
+              'media.webpage.sname', 'media.webpage.id', 'media.webpage.url',
+              'media.webpage.title', 'media.webpage.description')
+    BLOB_COLUMNS = ('data', 'replydata')
 
     @lazy_property
     def reply_blob(self):
@@ -952,7 +1045,7 @@ class TMessage(TBase):
 
     @property
     def to_id_and_type(self):
-        to_id = get_obj_value(self.blob, 'peer_id')
+        to_id = get_obj_value(self.fields, 'peer_id')
         sname = get_obj_value(to_id, 'sname')
         if sname == 'peer_channel':
             return (get_obj_value(to_id, 'channel_id'), TYPE_MSG_TO_CHANNEL)
@@ -962,13 +1055,13 @@ class TMessage(TBase):
 
     @property
     def message_content(self):
-        if (message := get_obj_value(self.blob, 'message')):
+        if (message := get_obj_value(self.fields, 'message')):
             return escape_csv_string(message)
         return ''
 
     @property
     def message_date_from_blob(self):
-        return get_obj_value(self.blob, 'date')
+        return get_obj_value(self.fields, 'date')
 
     @property
     def dialog_and_sequence(self):
@@ -995,11 +1088,11 @@ class TMessage(TBase):
 
     @property
     def action_string_and_dict(self):
-        if (action := get_obj_value(self.blob, 'action')):
+        if (action := get_obj_value(self.fields, 'action')):
             return get_obj_value(action, 'sname'), action
         return None, None
 
-    @lazy_property
+    @property
     def breply(self):
         return format_dict(self.reply_blob)
 
@@ -1011,6 +1104,13 @@ class TMessage(TBase):
                     f'{self.breply}{newline}')
         return f'{self.vdata}{newline}{self.bdata}{newline}'
 
+    def write(self, writer: JsonWriter, newline='\n'):
+        super().write(writer, newline)
+        if self.reply_blob:
+            writer.write(f'----- IS REPLY  TO ---{newline}')
+            writer.write_object(self.reply_blob)
+            writer.write(newline)
+
 # ------------------------------------------------------------------------------
 
 
@@ -47,7 +47,10 @@
 import sys
 import os.path as osp
 from argparse import ArgumentParser
-from database import TelegramDB
+from concurrent.futures import ProcessPoolExecutor
+from database import TelegramDB, PARSER
+from database.profile import load_profile
+from datatype.profiler import ConstructorProfiler
 import logger
 import tdb2 as tdb
 
@@ -56,14 +59,59 @@ VERSION = '20250306'
 # ------------------------------------------------------------------------------
 
 
-def process(db_path, outdir):
+def extract(db_path, outdir, profile_path, jobs=1, salvage=False,
+            profile=None):
+    PARSER.salvage = salvage
+    if profile:
+        PARSER.profiler = ConstructorProfiler()
+        if jobs > 1:
+            logger.warning('profiling constructors decodes with 1 job')
+            jobs = 1
+    tables = load_profile(profile_path)
     db = TelegramDB(db_path)
+    logger.info('database user_version %d, schema layer %d',
+                db.user_version, db.layer)
+    if jobs > 1:
+        with ProcessPoolExecutor(jobs) as executor:
+            counts = db.extract(tables, outdir, executor)
+    else:
+        counts = db.extract(tables, outdir)
+    db.close()
+    for table in tables:
+        if table.name in counts:
+            logger.info('%d rows of %s written to %s', counts[table.name],
+                        table.table, table.get_path(outdir))
+        else:
+            logger.warning('table %s not found in the database', table.table)
+    if profile:
+        rows = PARSER.profiler.save(profile)
+        logger.info('profile of %d constructors written to %s',
+                    len(rows), profile)
+
+
+def process(db_path, outdir, cache_dir=None, cache_size=1024, jobs=1,
+            salvage=False, profile=None, decoders=False, compact=False):
+    PARSER.salvage = salvage
+    PARSER.decoder = decoders
+    if profile:
+        PARSER.profiler = ConstructorProfiler()
+        if jobs > 1:
+            logger.warning('profiling constructors decodes with 1 job')
+            jobs = 1
+    db = TelegramDB(db_path, cache_dir, cache_size << 20, compact=compact)
+    logger.info('database user_version %d, schema layer %d',
+                db.user_version, db.layer)
 
-    teledb = tdb.TDB(outdir, db)
+    teledb = tdb.TDB(outdir, db, jobs)
     teledb.parse()
 
     teledb.save_parsed_tables()
     teledb.create_timeline()
+    db.close()
+    if profile:
+        rows = PARSER.profiler.save(profile)
+        logger.info('profile of %d constructors written to %s',
+                    len(rows), profile)
 
 
 def main():
@@ -73,6 +121,28 @@ def main():
     parser.add_argument('outdir', help='output directory, must exist')
     parser.add_argument('-v', '--verbose', action='count',
                         help='verbose level, -v to -vvv')
+    parser.add_argument('--cache-dir',
+                        help='directory of a decode cache kept across runs')
+    parser.add_argument('--cache-size', type=int, default=1024,
+                        help='decode cache size limit in MiB, default 1024')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='processes decoding the blobs, default 1')
+    parser.add_argument('--salvage', action='store_true',
+                        help='skip unknown objects of a blob up to the next '
+                             'known signature instead of failing')
+    parser.add_argument('--decoders', action='store_true',
+                        help='decode the blobs with python decoders generated '
+                             'from the schema and cached, faster once cached')
+    parser.add_argument('--compact', action='store_true',
+                        help='keep the decoded blobs as compact records, '
+                             'less memory on large databases')
+    parser.add_argument('--profile-constructors', metavar='PATH',
+                        help='write the count, bytes and time decoded per '
+                             'constructor to PATH, CSV for *.csv else JSON')
+    parser.add_argument('--extract', metavar='PROFILE',
+                        help='write only the columns and blob fields listed '
+                             'per table by PROFILE, a YAML or JSON file, to '
+                             'a CSV or JSONL file per table')
     args = parser.parse_args()
 
     logger.configure_logging(args.verbose)
@@ -89,8 +159,17 @@ def main():
             logger.error('The provided input file does not exist: %s',
                          args.database)
             return
-    if osp.isdir(args.outdir):
-        process(database, args.outdir)
+    if args.extract and args.cache_dir:
+        logger.error('--cache-dir is not used by --extract, which decodes '
+                     'only the fields of the profile')
+        return
+    if osp.isdir(args.outdir) and args.extract:
+        extract(database, args.outdir, args.extract, args.jobs, args.salvage,
+                args.profile_constructors)
+    elif osp.isdir(args.outdir):
+        process(database, args.outdir, args.cache_dir, args.cache_size,
+                args.jobs, args.salvage, args.profile_constructors,
+                args.decoders, args.compact)
     else:
         logger.error('Output directory [%s] does not exist!',
                      args.outdir)
@@ -0,0 +1,745 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:12:30 2026
+
+@author: C. David
+"""
+import os
+import os.path as osp
+import sys
+import time
+import sqlite3
+import tracemalloc
+import tempfile
+import subprocess
+from io import BytesIO
+import struct
+from timeit import timeit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import construct as cs
+from datatype import (TLStruct, pythonic, get_obj_value, get_extractor,
+                      JsonWriter)
+from datatype.utils import orjson
+from datatype.common import TString, TBool, TLArray, decode_string
+from database import TelegramDB
+from database.profile import load_profile
+from generater.blobs import BlobGenerator, check, measure
+
+
+NUMBER = 20000
+
+ROOT = osp.dirname(osp.dirname(osp.realpath(__file__)))
+
+FIRST_BLOB = '''
+import time
+start = time.perf_counter()
+from datatype import TLStruct
+imported = time.perf_counter()
+from tests.benchmark import sample_message
+data = sample_message()
+parser = TLStruct()
+parser.parse_blob(data)
+parsed = time.perf_counter()
+print(imported - start, parsed - imported)
+'''
+
+
+def pack_int(value):
+    return struct.pack('<I', value)
+
+
+def pack_long(value):
+    return struct.pack('<Q', value)
+
+
+def pack_string(value):
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    length = len(value)
+    if length < 254:
+        data = bytes([length]) + value
+    else:
+        data = b'\xfe' + length.to_bytes(3, 'little') + value
+    return data + b'\x00' * (-len(data) % 4)
+
+
+def sample_message(text='hello world', mid=7, user_id=5, peer_id=6,
+                   fwd_date=None, entities=0, views=None):
+    '''Build a message (0xeabcdd4d) blob with from_id and peer_id set.'''
+    flags = 256 | 2
+    fwd_from = entity_list = counters = b''
+    if fwd_date is not None:
+        flags |= 4
+        fwd_from = b''.join([pack_int(0x4e4df4bb), pack_int(1),
+                             pack_int(0x59511722), pack_long(user_id + 1),
+                             pack_int(fwd_date)])
+    if entities:
+        flags |= 128
+        entity_list = b''.join(
+            [pack_int(0x1cb5c415), pack_int(entities)] +
+            [pack_int(0xbd610bc9) + pack_int(x) + pack_int(1)
+             for x in range(entities)])
+    if views is not None:
+        flags |= 1024
+        counters = pack_int(views) + pack_int(views // 10)
+    return b''.join([
+        pack_int(0xeabcdd4d),
+        pack_int(flags),
+        pack_int(0),
+        pack_int(mid),
+        pack_int(0x59511722), pack_long(user_id),
+        pack_int(0x59511722), pack_long(peer_id),
+        fwd_from,
+        pack_int(1700000000 + mid),
+        pack_string(text),
+        entity_list,
+        counters,
+        pack_string('')])
+
+
+def sample_corpus(count=10000):
+    '''Build a list of varied message blobs.'''
+    result = []
+    for i in range(count):
+        text = 'message text ' * (i % 40)
+        result.append(sample_message(
+            text, mid=i, user_id=1000 + i % 97, peer_id=2000 + i % 13,
+            fwd_date=1600000000 + i if i % 5 == 0 else None,
+            entities=i % 4, views=i if i % 3 == 0 else None))
+    return result
+
+
+def report(name, seconds, number=NUMBER):
+    print(f'{name:<40} {seconds / number * 1e6:10.2f} us/op')
+
+
+def bench_dispatch(number=NUMBER):
+    '''Constructor lookup: f-string + getattr versus the dispatch table.'''
+    parser = TLStruct()
+    data = sample_message()
+    signature = int.from_bytes(data[:4], 'little')
+    dispatch = parser.dispatch
+
+    def lookup_getattr():
+        return getattr(parser, f'struct_0x{signature:08x}', None)()
+
+    def lookup_dispatch():
+        return dispatch.get(int.from_bytes(data[:4], 'little'))
+
+    assert lookup_getattr() is lookup_dispatch()
+    report('lookup getattr', timeit(lookup_getattr, number=number), number)
+    report('lookup dispatch', timeit(lookup_dispatch, number=number), number)
+    report('parse_blob message',
+           timeit(lambda: parser.parse_blob(data), number=number), number)
+
+
+def bench_compiled(count=10000):
+    '''Interpreted versus compiled constructs on a messages corpus.'''
+    corpus = sample_corpus(count)
+    interpreted = TLStruct()
+    compiled = TLStruct(compiled=True)
+    start = time.perf_counter()
+    _ = compiled.dispatch
+    print(f'compiled dispatch ready in {time.perf_counter() - start:.3f} s')
+    for item in corpus[:100]:
+        assert (pythonic(interpreted.parse_blob(item)) ==
+                pythonic(compiled.parse_blob(item)))
+    for name, parser in (('interpreted', interpreted),
+                         ('compiled', compiled)):
+        seconds = timeit(lambda p=parser: [p.parse_blob(x) for x in corpus],
+                         number=1)
+        report(f'parse_blob {name}', seconds, count)
+
+
+def bench_decoder(count=10000):
+    '''Construct parse + pythonic() versus the generated plain decoders.'''
+    corpus = sample_corpus(count)
+    interpreted = TLStruct()
+    compiled = TLStruct(compiled=True)
+    decoder = TLStruct(decoder=True)
+    start = time.perf_counter()
+    _ = decoder.decoders
+    print(f'decoders ready in {time.perf_counter() - start:.3f} s')
+    for item in corpus:
+        assert (pythonic(interpreted.parse_blob(item)) ==
+                decoder.parse_blob(item))
+    for name, parser in (('interpreted', interpreted),
+                         ('compiled', compiled)):
+        seconds = timeit(
+            lambda p=parser: [pythonic(p.parse_blob(x)) for x in corpus],
+            number=1)
+        report(f'parse_blob + pythonic {name}', seconds, count)
+    seconds = timeit(lambda: [decoder.parse_blob(x) for x in corpus],
+                     number=1)
+    report('parse_blob decoder', seconds, count)
+
+
+def bench_parse_from(count=256):
+    '''Slicing the unparsed tail per object versus offsets into one buffer.'''
+    parser = TLStruct(compiled=True)
+    data = b''.join(sample_corpus(count))
+
+    def parse_sliced():
+        result = []
+        parsed_len = 0
+        while parsed_len < len(data):
+            stream = BytesIO(data[parsed_len:])
+            result.append(parser.get_parser(data[parsed_len:])
+                          .parse_stream(stream))
+            parsed_len += stream.tell()
+        return result
+
+    assert len(parse_sliced()) == len(parser.parse(data)) == count
+    report('parse sliced tail', timeit(parse_sliced, number=10), 10 * count)
+    report('parse offsets', timeit(lambda: parser.parse(data), number=10),
+           10 * count)
+
+
+def bench_parse_fields(count=10000):
+    '''Full decode versus decoding only the paths the timeline reads.'''
+    corpus = sample_corpus(count)
+    parser = TLStruct(decoder=True)
+    paths = ('sname', 'date', 'peer_id', 'from_id.user_id', 'message',
+             'fwd_from.date', 'views', 'media.sname')
+    for item in corpus[:100]:
+        full = parser.parse_blob(item)
+        fields = parser.parse_fields(item, paths)
+        assert all(get_obj_value(full, x) == get_obj_value(fields, x)
+                   for x in paths)
+    seconds = timeit(lambda: [parser.parse_blob(x) for x in corpus],
+                     number=1)
+    report('parse_blob decoder', seconds, count)
+    seconds = timeit(lambda: [parser.parse_fields(x, paths) for x in corpus],
+                     number=1)
+    report('parse_fields decoder', seconds, count)
+
+
+def bench_sizeof(count=10000):
+    '''Object length by skipping versus by a full parse.'''
+    corpus = sample_corpus(count)
+    interpreted = TLStruct()
+    decoder = TLStruct(decoder=True)
+    for item in corpus:
+        assert decoder.sizeof_at(item) == len(item)
+    seconds = timeit(lambda: [interpreted.parse_from(x)[1] for x in corpus],
+                     number=1)
+    report('parse_from interpreted', seconds, count)
+    seconds = timeit(lambda: [decoder.parse_from(x)[1] for x in corpus],
+                     number=1)
+    report('parse_from decoder', seconds, count)
+    seconds = timeit(lambda: [decoder.sizeof_at(x) for x in corpus],
+                     number=1)
+    report('sizeof_at', seconds, count)
+
+
+def legacy_string():
+    '''The Struct based TString the TLBytes construct replaced.'''
+    def parse_varint(ctx):
+        return ctx._pl >> 8 if ctx._check >= 254 else ctx._pl
+
+    return cs.Struct(
+        'sname' / cs.Computed('string'),
+        '_check' / cs.Peek(cs.Byte),
+        '_pl' / cs.IfThenElse(cs.this._check >= 254, cs.Int32ul, cs.Byte),
+        'len' / cs.Computed(parse_varint),
+        '_value' / cs.Bytes(cs.this.len),
+        'value' / cs.Computed(lambda ctx: decode_string(ctx._value)),
+        cs.IfThenElse(cs.this._check >= 254,
+                      cs.If(cs.this.len % 4,
+                            cs.Padding(4 - cs.this.len % 4)),
+                      cs.If((cs.this.len + 1) % 4,
+                            cs.Padding(4 - (cs.this.len + 1) % 4))))
+
+
+def legacy_union(union):
+    '''The Peek and Switch Struct of a union the TLUnion construct replaced.'''
+    return cs.Struct('_signature' / cs.Peek(cs.Int32ul),
+                     union.name / cs.Switch(cs.this._signature, union.cases))
+
+
+def bench_unions(number=NUMBER):
+    '''Peek and Switch union Struct versus the single read TLUnion.'''
+    parser = TLStruct()
+    union = parser.peer_structures('peer_id')
+    legacy = legacy_union(union)
+    data = pack_int(0x59511722) + pack_long(5)
+    assert legacy.parse(data) == union.parse(data)
+    report('legacy union', timeit(lambda: legacy.parse(data), number=number),
+           number)
+    report('TLUnion', timeit(lambda: union.parse(data), number=number),
+           number)
+    corpus = sample_corpus(number)
+    report('parse_blob message', timeit(
+        lambda: [parser.parse_blob(x) for x in corpus], number=1), number)
+
+
+def bench_primitives(number=NUMBER):
+    '''Struct based TString versus the single _parse TLBytes construct.'''
+    legacy = legacy_string()
+    for text in ('', 'hello world', 'x' * 300):
+        data = pack_string(text)
+        assert legacy.parse(data).value == TString.parse(data).value == text
+        report(f'legacy string {len(text)}',
+               timeit(lambda d=data: legacy.parse(d), number=number), number)
+        report(f'TString {len(text)}',
+               timeit(lambda d=data: TString.parse(d), number=number), number)
+    data = pack_int(0x997275b5)
+    report('TBool', timeit(lambda: TBool.parse(data), number=number), number)
+
+
+FORKED_WORKER = '''
+import gc
+import sys
+from multiprocessing import get_context
+from concurrent.futures import ProcessPoolExecutor
+from database.telegram import PARSER, decode_chunk, get_options
+from tests.benchmark import sample_corpus
+
+
+def private_dirty():
+    with open('/proc/self/smaps_rollup', encoding='ascii') as f:
+        for line in f:
+            if line.startswith('Private_Dirty:'):
+                return int(line.split()[1])
+    return 0
+
+
+def work(chunk):
+    decode_chunk(chunk, PARSER.LAYER, get_options(PARSER))
+    gc.collect()
+    return private_dirty()
+
+
+if sys.argv[1] != 'lazy':
+    PARSER.build()
+if sys.argv[1] == 'frozen':
+    gc.freeze()
+chunk = list(enumerate(sample_corpus(200)))
+with ProcessPoolExecutor(1, get_context('fork')) as executor:
+    print(executor.submit(work, chunk).result())
+'''
+
+LOADED_TABLE = '''
+import sys
+import resource
+from database import TelegramDB
+from tdb2 import TMessage
+db = TelegramDB(sys.argv[1], compact=sys.argv[2] == 'compact')
+messages = {}
+for entry in db.get_messages():
+    message = TMessage(entry)
+    _ = message.message_date_from_blob, message.blob
+    messages[entry.mid] = message
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+'''
+
+
+def bench_startup(number=5):
+    '''Fresh interpreters: import time of datatype and of the first blob.'''
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                             'import datatype'], cwd=ROOT, check=True,
+                            capture_output=True, text=True)
+    for line in result.stderr.splitlines():
+        own, total, name = line.split('|')
+        if name.strip() in ('datatype', 'datatype.telegram',
+                            'datatype.schema'):
+            print(f'importtime {name.strip():<20} self {own[12:].strip():>8} '
+                  f'us, cumulative {total.strip():>8} us')
+    imports = []
+    blobs = []
+    for _ in range(number):
+        result = subprocess.run([sys.executable, '-c', FIRST_BLOB], cwd=ROOT,
+                                check=True, capture_output=True, text=True)
+        imported, parsed = map(float, result.stdout.split())
+        imports.append(imported)
+        blobs.append(parsed)
+    report('import datatype', min(imports), 1)
+    report('first parse_blob', min(blobs), 1)
+
+
+def bench_shared_schema(count=2000, threads=8):
+    '''
+    Threads parsing with one shared parser, and the private memory of a
+    forked worker with the schema built lazily in it, built in the parent
+    before the fork, and built and frozen out of the collector.
+    '''
+    parser = TLStruct().build()
+    corpus = sample_corpus(count)
+    expected = [pythonic(parser.parse_blob(x)) for x in corpus]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        result = list(executor.map(
+            lambda x: pythonic(parser.parse_blob(x)), corpus))
+    report(f'parse_blob {threads} threads', time.perf_counter() - start,
+           count)
+    assert result == expected
+    if not osp.exists('/proc/self/smaps_rollup'):
+        return
+    for mode in ('lazy', 'built', 'frozen'):
+        result = subprocess.run([sys.executable, '-c', FORKED_WORKER, mode],
+                                cwd=ROOT, check=True, capture_output=True,
+                                text=True)
+        print(f'forked worker schema {mode:<19} '
+              f'{int(result.stdout) / 1024:10.2f} MiB private')
+
+
+def bench_vectors(number=2000):
+    '''Vectors of numbers: per element Array versus one unpack.'''
+    parser = TLStruct()
+    for datatype, size in ((cs.Int32ul, 4), (cs.Int64ul, 8), (cs.Double, 8)):
+        legacy = cs.Struct('count' / cs.Int32ul,
+                           'content' / cs.Array(cs.this.count, datatype))
+        vector = parser.vector(datatype, 'content')
+        fast = cs.Struct('count' / cs.Int32ul,
+                         'content' / TLArray(cs.this.count, datatype))
+        data = pack_int(1000) + bytes(range(256)) * (1000 * size // 256)
+        data = data + b'\x00' * (4 + 1000 * size - len(data))
+        assert legacy.parse(data).content == fast.parse(data).content
+        assert (vector.parse(pack_int(0x1cb5c415) + data).content ==
+                fast.parse(data).content)
+        name = datatype.fmtstr
+        report(f'Array 1000 {name}',
+               timeit(lambda: legacy.parse(data), number=number), number)
+        report(f'TLArray 1000 {name}',
+               timeit(lambda: fast.parse(data), number=number), number)
+
+
+def bench_flags(count=10000):
+    '''Time and retained memory of parsing a large messages corpus.'''
+    corpus = sample_corpus(count)
+    parser = TLStruct()
+    parser.parse_blob(corpus[0])
+    start = time.perf_counter()
+    _ = [parser.parse_blob(x) for x in corpus]
+    report('parse_blob messages', time.perf_counter() - start, count)
+    tracemalloc.start()
+    result = [parser.parse_blob(x) for x in corpus]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{"parsed messages retained":<40} {size / count:10.0f} B/blob')
+    assert all(pythonic(x.flags)['has_from_id'] for x in result)
+
+
+def bench_resync(size=1 << 20, number=20):
+    '''Salvage: find the next known signature after a run of junk words.'''
+    parser = TLStruct(salvage=True)
+    tail = sample_message()
+    data = pack_int(0xdeadbeef) + pack_int(5) * (size // 4) + tail
+    known = parser.signatures
+
+    def resync_loop():
+        for offset in range(4, len(data), 4):
+            if int.from_bytes(data[offset:offset + 4], 'little') in known:
+                return offset
+        return len(data)
+
+    assert resync_loop() == parser.resync(data, 0) == len(data) - len(tail)
+    report('resync word loop', timeit(resync_loop, number=number), number)
+    report('resync bulk', timeit(lambda: parser.resync(data, 0),
+                                 number=number), number)
+
+
+def bench_profile(count=10000):
+    '''Overhead of the per-constructor profiler on each backend.'''
+    corpus = sample_corpus(count)
+    for options in ({}, {'compiled': True}, {'decoder': True}):
+        name = next(iter(options), 'interpreted')
+        for profile in (False, True):
+            parser = TLStruct(profile=profile, **options)
+            parser.parse_blob(corpus[0])
+            seconds = timeit(lambda p=parser: [p.parse_blob(x)
+                                               for x in corpus], number=1)
+            label = 'profiled' if profile else 'plain'
+            report(f'parse_blob {name} {label}', seconds, count)
+        top = parser.profiler.report()[0]
+        assert top['name'] == 'message' and top['count'] == count + 1
+
+
+def bench_parse_many(count=100000):
+    '''A loop of parse_blob versus parse_many over a large corpus.'''
+    corpus = sample_corpus(count)
+    for options in ({}, {'compiled': True}, {'decoder': True}):
+        name = next(iter(options), 'interpreted')
+        parser = TLStruct(**options)
+        parser.parse_blob(corpus[0])
+        start = time.perf_counter()
+        expected = [parser.parse_blob(x) for x in corpus]
+        report(f'parse_blob loop {name}', time.perf_counter() - start, count)
+        start = time.perf_counter()
+        result = [x for x, _ in parser.parse_many(corpus)]
+        report(f'parse_many {name}', time.perf_counter() - start, count)
+        assert pythonic(result[-1]) == pythonic(expected[-1])
+        del expected, result
+
+
+def bench_python(count=10000):
+    '''pythonic() over the parsed Containers versus decoding into it.'''
+    corpus = sample_corpus(count)
+    for options in ({}, {'compiled': True}):
+        name = next(iter(options), 'interpreted')
+        parser = TLStruct(**options)
+        parser.parse_blob(corpus[0], True)
+        start = time.perf_counter()
+        expected = [pythonic(parser.parse_blob(x)) for x in corpus]
+        report(f'pythonic(parse_blob) {name}', time.perf_counter() - start,
+               count)
+        start = time.perf_counter()
+        result = [parser.parse_blob(x, True) for x in corpus]
+        report(f'parse_blob python {name}', time.perf_counter() - start,
+               count)
+        assert result == expected
+
+
+MESSAGE_PATHS = ('sname', 'from_id.user_id', 'peer_id.user_id', 'fwd_from',
+                 'fwd_from.from_id', 'fwd_from.date', 'views', 'flags',
+                 'flags.has_media', 'flags.has_reply_to', 'media')
+
+
+def legacy_get_obj_value(obj, key, default=None):
+    '''get_obj_value splitting the key on every call.'''
+    if not obj:
+        return None
+    cur = obj
+    for item in key.split('.'):
+        if cur and item in cur:
+            cur = cur[item]
+        else:
+            return default
+    return cur
+
+
+def bench_accessors(count=10000):
+    '''The message paths of the timeline, one by one versus in one walk.'''
+    parser = TLStruct()
+    objs = [parser.parse_blob(x, True) for x in sample_corpus(count)]
+    extractor = get_extractor(MESSAGE_PATHS)
+    start = time.perf_counter()
+    expected = [{x: legacy_get_obj_value(y, x) for x in MESSAGE_PATHS}
+                for y in objs]
+    report('get_obj_value split per call', time.perf_counter() - start,
+           count)
+    start = time.perf_counter()
+    result = [{x: get_obj_value(y, x) for x in MESSAGE_PATHS} for y in objs]
+    report('get_obj_value cached accessor', time.perf_counter() - start,
+           count)
+    assert result == expected
+    start = time.perf_counter()
+    result = [extractor(x) for x in objs]
+    report('extractor one walk', time.perf_counter() - start, count)
+    assert result == expected
+
+
+def sample_database(directory, count=2000, replies=False):
+    '''
+    Write a cache4.db holding only a messages_v2 table of sample blobs, with
+    every other message replying to the previous one when replies is set.
+    '''
+    path = osp.join(directory, 'cache4.db')
+    con = sqlite3.connect(path)
+    con.execute('CREATE TABLE messages_v2 (mid INTEGER PRIMARY KEY, '
+                'data BLOB, custom_params BLOB, replydata BLOB)')
+    corpus = sample_corpus(count)
+    con.executemany('INSERT INTO messages_v2 VALUES (?, ?, NULL, ?)',
+                    [(i, x, corpus[i - 2] if replies and i % 2 == 0 else None)
+                     for i, x in enumerate(corpus, 1)])
+    con.commit()
+    con.close()
+    return path
+
+
+def bench_decode_cache(count=2000):
+    '''Blobs of a messages table without, into and from the decode cache.'''
+    with tempfile.TemporaryDirectory() as directory:
+        path = sample_database(directory, count)
+        expected = None
+        for name, cache_dir in (('no cache', None), ('cold cache', directory),
+                                ('warm cache', directory)):
+            db = TelegramDB(path, cache_dir)
+            rows = db.get_messages()
+            start = time.perf_counter()
+            result = [pythonic(x.data_blob) for x in rows]
+            report(f'data_blob {name}', time.perf_counter() - start, count)
+            db.close()
+            assert expected is None or result == expected
+            expected = result
+
+
+def bench_table_dump(count=5000):
+    '''
+    A table_messages.txt from the dump strings, as kept on the rows before,
+    versus through JsonWriter with json and, if installed, orjson.
+    '''
+    from tdb2 import TMessage
+    with tempfile.TemporaryDirectory() as directory:
+        db = TelegramDB(sample_database(directory, count, True))
+        rows = [TMessage(x) for x in db.get_messages()]
+        for x in rows:
+            _ = x.blob, x.reply_blob
+        output = osp.join(directory, 'table_messages.txt')
+        expected = None
+        for name, fast in (('dump strings', None), ('writer json', False),
+                           ('writer orjson', True)):
+            if fast and orjson is None:
+                continue
+            tracemalloc.start()
+            start = time.perf_counter()
+            with open(output, 'w', encoding='utf-8') as f:
+                if fast is None:
+                    kept = [x.dump() for x in rows]
+                    f.writelines(kept)
+                else:
+                    with JsonWriter(f, fast=fast) as writer:
+                        for x in rows:
+                            x.write(writer)
+            seconds = time.perf_counter() - start
+            size, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            kept = None
+            report(f'table dump {name}', seconds, count)
+            print(f'{"table dump " + name + " retained":<40} '
+                  f'{size / count:10.0f} B/row, peak {peak / 2 ** 20:.1f} MiB')
+            with open(output, encoding='utf-8') as f:
+                result = f.read()
+            assert expected is None or result == expected
+            expected = result
+        db.close()
+
+
+def bench_extract(count=10000):
+    '''A CSV of five message fields from full decodes versus a profile.'''
+    profile = load_profile({'messages': {
+        'columns': ['mid'],
+        'fields': {'date': 'date', 'from': 'from_id.user_id',
+                   'text': 'message', 'views': 'views',
+                   'forwarded': 'fwd_from.date'}}})
+    table = profile[0]
+    with tempfile.TemporaryDirectory() as directory:
+        db = TelegramDB(sample_database(directory, count))
+        start = time.perf_counter()
+        with table.open(directory) as writer:
+            rows = db.execute('SELECT mid, data FROM messages_v2').fetchall()
+            writer.write([(x, *(get_obj_value(pythonic(db.parse_blob(y)), z)
+                                for z in table.paths)) for x, y in rows])
+        report('extract full decode', time.perf_counter() - start, count)
+        with open(table.get_path(directory), encoding='utf-8') as f:
+            expected = f.read()
+        start = time.perf_counter()
+        db.extract(profile, directory)
+        report('extract profile', time.perf_counter() - start, count)
+        with open(table.get_path(directory), encoding='utf-8') as f:
+            assert f.read() == expected
+        db.close()
+
+
+def bench_compact(count=1000000):
+    '''
+    Peak RSS of a process holding the messages of a table as TDB does, with
+    their blobs decoded as dicts and as compact Records.
+    '''
+    if os.name != 'posix':
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        path = sample_database(directory, count)
+        for mode in ('dicts', 'compact'):
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, '-c', LOADED_TABLE, path,
+                                     mode], cwd=ROOT, check=True,
+                                    capture_output=True, text=True)
+            report(f'messages table {mode}', time.perf_counter() - start,
+                   count)
+            print(f'{"messages table " + mode + " peak RSS":<40} '
+                  f'{int(result.stdout) / 1024:10.1f} MiB')
+
+
+def bench_columns(count=10000):
+    '''Message dicts versus NumPy columns: time and retained memory.'''
+    with tempfile.TemporaryDirectory() as directory:
+        db = TelegramDB(sample_database(directory, count))
+        db.get_message_columns()
+        for name, func in (
+                ('dicts', lambda: [pythonic(x.data_blob)
+                                   for x in db.get_messages()]),
+                ('columns', db.get_message_columns)):
+            db.session.expunge_all()
+            tracemalloc.start()
+            start = time.perf_counter()
+            result = func()
+            seconds = time.perf_counter() - start
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            report(f'messages {name}', seconds, count)
+            print(f'{"messages " + name + " retained":<40} '
+                  f'{size / count:10.0f} B/row')
+            del result
+        db.close()
+
+
+def bench_decode_jobs(count=10000):
+    '''Blobs of a messages table decoded in the main or worker processes.'''
+    with tempfile.TemporaryDirectory() as directory:
+        path = sample_database(directory, count)
+        db = TelegramDB(path)
+        start = time.perf_counter()
+        expected = [pythonic(x.data_blob) for x in db.get_messages()]
+        report('data_blob sequential', time.perf_counter() - start, count)
+        for jobs in sorted({2, os.cpu_count() or 1} - {1}):
+            db = TelegramDB(path)
+            start = time.perf_counter()
+            with ProcessPoolExecutor(jobs) as executor:
+                db.decode_blobs('messages', 'data', executor)
+            result = [pythonic(x.data_blob) for x in db.get_messages()]
+            report(f'data_blob {jobs} jobs', time.perf_counter() - start,
+                   count)
+            assert result == expected
+
+
+def bench_synthetic(number=3):
+    '''
+    Decode throughput over synthetic blobs of every constructor, in total
+    and for the slowest constructors of each backend.
+    '''
+    blobs = BlobGenerator(seed=0).generate_all()
+    count = sum(map(len, blobs.values()))
+    size = sum(len(x) for items in blobs.values() for x in items)
+    print(f'synthetic blobs {count}, {size / 2 ** 20:.2f} MiB')
+    for options in ({}, {'compiled': True}, {'decoder': True}):
+        name = next(iter(options), 'interpreted')
+        parser = TLStruct(**options)
+        assert not check(parser, blobs)
+        rows = measure(parser, blobs, number)
+        seconds = sum(x['seconds'] for x in rows)
+        report(f'synthetic {name}', seconds, count * number)
+        for row in rows[:3]:
+            report(f'  {row["name"]}', row['seconds'], row['blobs'])
+
+
+def main(count=100000):
+    '''Run every benchmark, bench_compact with a table of count messages.'''
+    bench_startup()
+    bench_shared_schema()
+    bench_dispatch()
+    bench_compiled()
+    bench_decoder()
+    bench_parse_from()
+    bench_parse_fields()
+    bench_sizeof()
+    bench_primitives()
+    bench_unions()
+    bench_vectors()
+    bench_flags()
+    bench_resync()
+    bench_profile()
+    bench_parse_many()
+    bench_python()
+    bench_accessors()
+    bench_decode_cache()
+    bench_decode_jobs()
+    bench_columns()
+    bench_table_dump()
+    bench_extract()
+    bench_compact(count)
+    bench_synthetic()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
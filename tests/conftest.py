@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 26 09:17:32 2026
+
+@author: C. David
+"""
+import sqlite3
+import pytest
+from datatype import TLStruct
+from generater.blobs import BlobGenerator
+
+
+@pytest.fixture(scope='session')
+def message_blobs():
+    '''A function of the generated blobs of constructor names for a seed.'''
+    def generate(names=('message',), seed=None):
+        parser = TLStruct()
+        cids = [x for x, y in parser.INFO.items() if y in names]
+        generated = BlobGenerator(parser, seed=seed).generate_all(cids)
+        return [y for x in generated.values() for y in x]
+    return generate
+
+
+@pytest.fixture(scope='session')
+def messages_database(tmp_path_factory):
+    '''A function writing blobs to the messages_v2 table of a new database.'''
+    def create(blobs):
+        path = str(tmp_path_factory.mktemp('messages') / 'cache4.db')
+        con = sqlite3.connect(path)
+        con.execute('CREATE TABLE messages_v2 (mid INTEGER PRIMARY KEY, '
+                    'uid INTEGER, date INTEGER, data BLOB, '
+                    'custom_params BLOB, replydata BLOB)')
+        con.executemany('INSERT INTO messages_v2 (mid, uid, data) '
+                        'VALUES (?, ?, ?)',
+                        [(x, x % 7, y) for x, y in enumerate(blobs, 1)])
+        con.commit()
+        con.close()
+        return path
+    return create
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 09:40:17 2026
+
+@author: C. David
+"""
+import sqlite3
+import pytest
+from construct.lib import HexDisplayedBytes, HexDisplayedInteger
+from database import cache
+from database.cache import DecodeCache, MISSING
+
+
+LAYER = 0
+
+
+def entries(directory):
+    with sqlite3.connect(str(directory / cache.CACHE_NAME)) as con:
+        return con.execute('SELECT COUNT(*) FROM blobs').fetchone()[0]
+
+
+def test_round_trip(tmp_path):
+    value = {'sname': 'message', 'signature': HexDisplayedInteger.new(
+        0x38116ee0, '08X'), 'ok': True, 'rate': 1.5,
+        'items': [HexDisplayedBytes(b'\x01\x02'), None, {'id': 1 << 63}]}
+    db = DecodeCache(str(tmp_path), LAYER)
+    db.put(b'blob', value)
+    db.commit()
+    db.close()
+    db = DecodeCache(str(tmp_path), LAYER)
+    result = db.get(b'blob')
+    db.close()
+    assert result == value
+    assert str(result['signature']) == '0x38116EE0'
+    assert type(result['items'][0]) is HexDisplayedBytes
+    assert type(result['ok']) is bool
+
+
+def test_missing_and_unstored(tmp_path):
+    db = DecodeCache(str(tmp_path), LAYER)
+    assert db.get(b'blob') is MISSING
+    assert db.get(b'blob', None) is None
+    db.put(b'blob', {'value': object()})
+    assert db.get(b'blob') is MISSING
+    db.close()
+
+
+def test_salvage_and_layer_keys(tmp_path):
+    strict = DecodeCache(str(tmp_path), LAYER)
+    strict.put(b'blob', 'strict')
+    strict.commit()
+    salvage = DecodeCache(str(tmp_path), LAYER, salvage=True)
+    assert salvage.get(b'blob') is MISSING
+    salvage.put(b'blob', 'salvage')
+    salvage.commit()
+    other = DecodeCache(str(tmp_path), LAYER + 1)
+    assert other.get(b'blob') is MISSING
+    other.put(b'blob', 'other')
+    other.commit()
+    assert strict.get(b'blob') == 'strict'
+    assert salvage.get(b'blob') == 'salvage'
+    for db in (strict, salvage, other):
+        db.close()
+    assert entries(tmp_path) == 3
+
+
+def test_eviction(tmp_path):
+    value = 'x' * 1000
+    db = DecodeCache(str(tmp_path), LAYER, max_size=20000)
+    for i in range(100):
+        db.put(b'%d' % i, value)
+        if i == 95:
+            assert db.get(b'0') == value
+    db.commit()
+    assert db.size <= db.max_size
+    assert db.get(b'0') == value
+    assert db.get(b'99') == value
+    assert db.get(b'50') is MISSING
+    db.close()
+    assert 0 < entries(tmp_path) <= 20
+
+
+def test_put_again(tmp_path):
+    db = DecodeCache(str(tmp_path), LAYER, max_size=20000)
+    for value in ('x' * 1000, 'y' * 2000, 'z' * 500):
+        db.put(b'blob', value)
+    db.commit()
+    with sqlite3.connect(str(tmp_path / cache.CACHE_NAME)) as con:
+        size = con.execute('SELECT SUM(size) FROM blobs').fetchone()[0]
+    assert db.size == size
+    assert db.get(b'blob') == 'z' * 500
+    db.close()
+
+
+def test_schema_change(tmp_path, monkeypatch):
+    db = DecodeCache(str(tmp_path), LAYER)
+    db.put(b'blob', 'value')
+    db.close()
+    other = DecodeCache(str(tmp_path), LAYER + 1)
+    other.put(b'blob', 'other')
+    other.close()
+    monkeypatch.setattr(cache, 'get_schema_digest',
+                        lambda *paths: 'changed')
+    db = DecodeCache(str(tmp_path), LAYER)
+    assert db.get(b'blob') is MISSING
+    db.close()
+    monkeypatch.undo()
+    other = DecodeCache(str(tmp_path), LAYER + 1)
+    assert other.get(b'blob') == 'other'
+    other.close()
+
+
+@pytest.mark.parametrize('salvage', (False, True))
+def test_prefix(tmp_path, salvage):
+    db = DecodeCache(str(tmp_path), LAYER, salvage=salvage)
+    mode = b'salvage' if salvage else b'strict'
+    assert db.prefix == b'%d:%s:' % (LAYER, mode)
+    db.close()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 14:20:55 2026
+
+@author: C. David
+"""
+import pytest
+from database import TelegramDB
+from database.columns import to_int64, get_peer_id, to_arrow
+from datatype import TLStruct, pythonic
+
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.fixture(scope='module')
+def database(message_blobs, messages_database):
+    blobs = message_blobs(('message', 'message_service'), seed=2)
+    return messages_database(blobs), blobs
+
+
+def test_to_int64():
+    assert to_int64(5) == 5
+    assert to_int64((1 << 64) - 1) == -1
+    assert to_int64(-(1 << 63)) == -(1 << 63)
+    assert get_peer_id({'channel_id': 7}) == -7
+    assert get_peer_id({'user_id': 1 << 63}) == -(1 << 63)
+
+
+def test_message_columns(database):
+    path, blobs = database
+    parser = TLStruct()
+    db = TelegramDB(path)
+    rows, texts = db.get_message_columns()
+    db.close()
+    assert len(rows) == len(blobs) == len(texts)
+    assert max(rows['id']) >= 1 << 31
+    for row, text, data in zip(rows, texts, blobs):
+        obj = parser.parse_blob(data)
+        value = pythonic(obj)
+        assert row['signature'] == int.from_bytes(data[:4], 'little')
+        for name in ('id', 'date', 'views', 'forwards'):
+            assert row[name] == (value.get(name) or 0), name
+        for name in ('flags', 'flags2'):
+            assert row[name] == (obj[name].value if name in obj else 0)
+        for name in ('peer_id', 'from_id'):
+            assert row[name] == get_peer_id(value.get(name)), name
+        assert text == value.get('message')
+
+
+def test_to_arrow(database):
+    pytest.importorskip('pyarrow')
+    db = TelegramDB(database[0])
+    rows, texts = db.get_message_columns()
+    db.close()
+    texts = [b'\xff\xfe', *texts[1:]]
+    table = to_arrow(rows, texts)
+    assert table.num_rows == len(rows)
+    assert table['message'].to_pylist() == [None, *texts[1:]]
+    assert table['message_bytes'].to_pylist() == [
+        b'\xff\xfe', *[None] * (len(texts) - 1)]
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 16:47:09 2026
+
+@author: C. David
+"""
+import pickle
+from construct.lib import HexDisplayedInteger
+from datatype.compact import Compactor, Record, get_record_class
+
+
+PEER = {'sname': 'peer_user', 'user_id': 5}
+
+
+def test_record_access():
+    record = Compactor().compact({'sname': 'message', 'id': 7, 'peer': PEER})
+    assert isinstance(record, Record) and isinstance(record['peer'], Record)
+    assert record.id == record['id'] == 7
+    assert list(record) == ['sname', 'id', 'peer']
+    assert 'peer' in record and 'flags' not in record
+    assert record.get('flags') is None
+    assert record == {'sname': 'message', 'id': 7, 'peer': PEER}
+    assert dict(record['peer']) == PEER
+
+
+def test_record_equality():
+    cls = get_record_class(('value',))
+    assert cls([1]) == cls([1]) and hash(cls([1])) == hash(cls([1]))
+    for value, other in ((True, 1), (1, 1.0), (0, False), (0.0, -0.0),
+                         (1, HexDisplayedInteger.new(1, '08X'))):
+        assert cls([value]) != cls([other])
+    outer = get_record_class(('inner',))
+    assert outer([cls([True])]) != outer([cls([1])])
+    assert get_record_class(('other',))([1]) != cls([1])
+
+
+def test_compactor_shares():
+    compactor = Compactor()
+    first = compactor.compact({'peer': PEER, 'items': [PEER]})
+    second = compactor.compact({'peer': dict(PEER), 'items': [dict(PEER)]})
+    assert first['peer'] is second['peer'] is first['items'][0]
+    assert first is not second
+
+
+def test_compactor_keeps_types():
+    compactor = Compactor()
+    values = [True, 1, 1.0, 0, False, 0.0, -0.0]
+    records = [compactor.compact({'value': x}) for x in values]
+    assert [type(x.value) for x in records] == list(map(type, values))
+    assert [str(x.value) for x in records] == list(map(str, values))
+    nested = [compactor.compact({'peer': {'value': x}}) for x in values]
+    assert [str(x.peer.value) for x in nested] == list(map(str, values))
+
+
+def test_record_pickle():
+    record = Compactor().compact({'sname': 'message', 'peer': PEER,
+                                  'entities': [PEER], 'signature':
+                                  HexDisplayedInteger.new(0x38116ee0, '08X')})
+    result = pickle.loads(pickle.dumps(record, pickle.HIGHEST_PROTOCOL))
+    assert type(result) is type(record)
+    assert result == record
+    assert str(result.signature) == '0x38116EE0'
+    assert type(result.peer) is type(record.peer)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 11:18:52 2026
+
+@author: C. David
+"""
+import os
+import pytest
+from datatype import TLStruct, pythonic
+from datatype.compiler import write_file, load_code
+from generater.blobs import BlobGenerator
+
+
+NAMES = ('message', 'user', 'message_media_document')
+
+
+def test_write_file(tmp_path):
+    path = str(tmp_path / 'cache' / 'decoder_0.py')
+    write_file(path, b'first')
+    write_file(path, b'second')
+    with open(path, 'rb') as f:
+        assert f.read() == b'second'
+    assert os.listdir(tmp_path / 'cache') == ['decoder_0.py']
+
+
+def test_load_code(tmp_path):
+    path = str(tmp_path / 'layer_0.py')
+    write_file(path, b'VALUE = 1\n')
+    namespace = {}
+    exec(load_code(path, 'a'), namespace)  # pylint: disable=W0122
+    assert namespace['VALUE'] == 1
+    write_file(path, b'VALUE = 2\n')
+    exec(load_code(path, 'a'), namespace)  # pylint: disable=W0122
+    assert namespace['VALUE'] == 1
+    exec(load_code(path, 'b'), namespace)  # pylint: disable=W0122
+    assert namespace['VALUE'] == 2
+
+
+@pytest.fixture(scope='module')
+def unwritable(tmp_path_factory):
+    path = tmp_path_factory.mktemp('compiler') / 'file'
+    path.write_bytes(b'')
+    return str(path / 'cache')
+
+
+@pytest.mark.parametrize('option', ('compiled', 'decoder'))
+def test_unwritable_cache_dir(unwritable, option):
+    parser = TLStruct(cache_dir=unwritable, **{option: True})
+    reference = TLStruct()
+    cids = [x for x, y in reference.INFO.items() if y in NAMES]
+    generated = BlobGenerator(reference, seed=3).generate_all(cids)
+    for data in (y for x in generated.values() for y in x):
+        expected = pythonic(reference.parse_blob(data))
+        result = parser.parse_blob(data)
+        if option == 'compiled':
+            result = pythonic(result)
+        assert result == expected
+        assert str(result['signature']) == str(expected['signature'])
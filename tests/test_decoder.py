@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 10:31:08 2026
+
+@author: C. David
+"""
+import pytest
+from construct import Struct, Int32ul
+from datatype import TLStruct, pythonic
+from generater.blobs import BlobGenerator
+
+
+NAMES = ('message', 'message_service', 'user', 'channel', 'chat',
+         'message_media_web_page', 'message_media_document')
+
+
+def displayed(obj):
+    '''obj with every value as its type name and str, as the outputs show'''
+    if isinstance(obj, dict):
+        return {x: displayed(y) for x, y in obj.items()}
+    if isinstance(obj, list):
+        return [displayed(x) for x in obj]
+    return type(obj).__name__, str(obj)
+
+
+@pytest.fixture(scope='module')
+def parser():
+    return TLStruct()
+
+
+@pytest.fixture(scope='module')
+def blobs(parser):
+    cids = [x for x, y in parser.INFO.items() if y in NAMES]
+    generated = BlobGenerator(parser, seed=0).generate_all(cids)
+    return [y for x in generated.values() for y in x]
+
+
+def test_decoder_matches_interpreted(parser, blobs):
+    decoder = TLStruct(decoder=True)
+    for data in blobs:
+        expected = displayed(pythonic(parser.parse_blob(data)))
+        assert displayed(decoder.parse_blob(data)) == expected
+
+
+def test_signature_displayed_as_hex(parser, blobs):
+    for data in blobs:
+        value = parser.parse_blob(data, True)['signature']
+        assert str(value) == f'0x{int.from_bytes(data[:4], "little"):08X}'
+
+
+def test_fields_match_interpreted(parser, blobs):
+    paths = ('sname', 'signature', 'peer_id', 'media.webpage.sname')
+    for data in blobs:
+        full = pythonic(parser.parse_blob(data))
+        fields = parser.parse_fields(data, paths)
+        for key in ('sname', 'signature', 'peer_id'):
+            if key in full:
+                assert displayed(fields[key]) == displayed(full[key])
+
+
+def test_union_shape(parser):
+    struct = Struct('value' / Int32ul,
+                    'other' / parser.peer_structures('peer'),
+                    'peer' / parser.peer_structures('peer'))
+    data = b''.join(x.to_bytes(y, 'little') for x, y in (
+        (1, 4), (0x59511722, 4), (5, 8), (0xffffffff, 4)))
+    for obj in (struct.parse(data), struct.compile().parse(data)):
+        assert obj.other._signature == 0x59511722
+        assert obj.other.peer.user_id == 5
+        assert obj.peer._signature == 0xffffffff
+        assert pythonic(obj) == {
+            'value': 1, 'peer': None, 'other': {'peer': {
+                'sname': 'peer_user', 'signature': 0x59511722,
+                'user_id': 5}}}
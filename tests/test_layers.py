@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 25 10:12:36 2026
+
+@author: C. David
+"""
+import os.path as osp
+import sqlite3
+import pytest
+import datatype.layers
+from datatype import TLStruct, pythonic, compiler, telegram
+from database import TelegramDB
+from generater.schema import join_schema, split_schema, split_layer
+from generater.parser import get_snapshots
+
+
+ROOT = osp.dirname(osp.dirname(osp.realpath(__file__)))
+
+SCHEMA_PATH = osp.join(ROOT, 'datatype', 'telegram.py')
+
+FILES_PATH = osp.join(ROOT, 'repo', 'files')
+
+LAYER = 150
+
+USER_VERSION = 500
+
+PEER_USER = '''    @constructor(0x59511722, 'peer_user')
+    def struct_0x59511722(self):
+        return ['user_id' / Int64ul]'''
+
+# a peer_user with a 32 bit user_id as the fixture layer defines it
+DATA = bytes.fromhex('22175159') + (5).to_bytes(4, 'little')
+
+
+@pytest.fixture()
+def layers(tmp_path, monkeypatch):
+    '''A fixture layer split next to a copy of the schema, registered.'''
+    content = join_schema(SCHEMA_PATH)
+    base = str(tmp_path / 'telegram.py')
+    split_schema(content, base)
+    assert PEER_USER in content
+    changed = content.replace(PEER_USER, PEER_USER.replace('Int64', 'Int32'))
+    # a TODO stub is left to TLStruct
+    changed = changed.replace("'user_id' / Int64ul,", '# TODO', 1)
+    split_layer(changed, base, LAYER, USER_VERSION)
+    directory = tmp_path / 'layers'
+    monkeypatch.setattr(datatype.layers, '__path__',
+                        [*datatype.layers.__path__, str(directory)])
+    monkeypatch.setitem(telegram.LAYERS, LAYER, USER_VERSION)
+    monkeypatch.setattr(compiler, 'COMPILED_CACHE', str(tmp_path / 'cache'))
+    return directory
+
+
+def test_split_layer(layers):
+    package = layers / f'layer_{LAYER}'
+    assert sorted(x.name for x in package.glob('*.py')) == ['__init__.py',
+                                                            'peer.py']
+    index = (package / '__init__.py').read_text(encoding='utf-8')
+    assert f'USER_VERSION = {USER_VERSION}\n' in index
+    assert "'struct_0x59511722': 'peer'," in index
+    assert "'struct_0xa2a5371e'" not in index
+    registry = (layers / '__init__.py').read_text(encoding='utf-8')
+    assert f'    {LAYER}: {USER_VERSION},\n' in registry
+
+
+def test_get_layer(layers):
+    assert telegram.get_layer(USER_VERSION) == LAYER
+    assert telegram.get_layer(USER_VERSION - 100) == LAYER
+    assert telegram.get_layer(USER_VERSION + 1) == TLStruct.LAYER
+    assert telegram.get_layer(0, ('users', 'messages')) == LAYER
+    assert telegram.get_layer(0, ('users', 'messages_v2')) == TLStruct.LAYER
+
+
+def test_layer_database(layers, tmp_path):
+    path = str(tmp_path / 'cache4.db')
+    con = sqlite3.connect(path)
+    con.execute(f'PRAGMA user_version = {USER_VERSION - 10}')
+    con.execute('CREATE TABLE users (uid INTEGER PRIMARY KEY, data BLOB)')
+    con.commit()
+    con.close()
+    db = TelegramDB(path)
+    assert db.layer == LAYER
+    parser = db.parser
+    assert parser.LAYER == LAYER and isinstance(parser, TLStruct)
+    expected = {'sname': 'peer_user', 'signature': 0x59511722, 'user_id': 5}
+    assert pythonic(parser.parse_blob(DATA)) == expected
+    assert db.parse_blob(DATA) == expected
+    db.close()
+    # the shared constructors are those of TLStruct, the changed one not
+    assert type(parser).struct_0xa2a5371e is TLStruct.struct_0xa2a5371e
+    assert type(parser).struct_0x59511722 is not TLStruct.struct_0x59511722
+    with pytest.raises(Exception):
+        TLStruct().parse_blob(DATA)
+
+
+def test_get_snapshots():
+    snapshots = get_snapshots(FILES_PATH)
+    assert osp.basename(snapshots[150]) == 'TLRPC-9.2.1-150-03e899e4.java'
+    assert len(snapshots) == 88 and max(snapshots) == TLStruct.LAYER
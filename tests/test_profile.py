@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 25 16:08:54 2026
+
+@author: C. David
+"""
+import csv
+import json
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from database import TelegramDB, PARSER
+from database.profile import TableProfile, load_profile, to_cell, JSON
+from datatype import TLStruct, get_obj_value, pythonic
+
+
+PROFILE = {
+    'messages': {
+        'table': 'messages_v2',
+        'columns': ['mid', 'uid'],
+        'fields': {'date': 'date', 'peer': 'peer_id.user_id',
+                   'text': 'message', 'media': 'media.sname',
+                   'reply': 'reply_to', 'out': 'flags.is_out'},
+    },
+    'messages_jsonl': {
+        'table': 'messages_v2',
+        'format': 'jsonl',
+        'fields': ['id', 'peer_id', 'entities'],
+    },
+}
+
+YAML = '''\
+messages:
+  table: messages_v2
+  columns: [mid]
+  fields:
+    text: message
+users:
+'''
+
+
+@pytest.fixture(scope='module')
+def database(message_blobs, messages_database):
+    blobs = [*message_blobs(seed=5), None]
+    return messages_database(blobs), blobs
+
+
+def test_table_profile():
+    table = TableProfile('users', ['id', 'status.was_online'], ['uid'])
+    assert table.fields == {'id': 'id',
+                            'status.was_online': 'status.was_online'}
+    assert table.names == ('uid', 'id', 'status.was_online')
+    assert table.get_path('out').endswith('extract_users.csv')
+    table = TableProfile('users', {'a': 'id', 'b': 'id'})
+    assert table.paths == ('id',)
+    assert table.get_rows([(b'blob',)], [(5,)]) == [(5, 5)]
+    with pytest.raises(ValueError):
+        TableProfile('users', ['id'], format='xml')
+    with pytest.raises(ValueError):
+        TableProfile('users', ['uid'], ['uid'])
+
+
+def test_load_profile(tmp_path):
+    path = tmp_path / 'profile.json'
+    path.write_text(json.dumps(PROFILE), encoding='utf-8')
+    for data in (PROFILE, str(path)):
+        profile = load_profile(data)
+        assert [x.name for x in profile] == list(PROFILE)
+        assert [x.table for x in profile] == ['messages_v2'] * 2
+        assert [x.format for x in profile] == ['csv', 'jsonl']
+        assert profile[0].columns == ('mid', 'uid')
+        assert profile[1].fields == {x: x for x in PROFILE['messages_jsonl']
+                                     ['fields']}
+    pytest.importorskip('yaml')
+    path = tmp_path / 'profile.yaml'
+    path.write_text(YAML, encoding='utf-8')
+    messages, users = load_profile(str(path))
+    assert messages.fields == {'text': 'message'}
+    assert (users.table, users.fields, users.blob) == ('users', {}, 'data')
+
+
+def test_to_cell():
+    assert to_cell(None) == ''
+    assert to_cell(b'\x01\xff') == '01ff'
+    assert to_cell(True) == 'true'
+    assert to_cell({'a': [1, 'ж']}) == '{"a": [1, "ж"]}'
+    assert to_cell(5) == 5 and to_cell('text') == 'text'
+
+
+def expected_rows(table, blobs):
+    for mid, data in enumerate(blobs, 1):
+        obj = pythonic(TLStruct().parse_blob(data)) if data else None
+        columns = {'mid': mid, 'uid': mid % 7}
+        yield ([columns[x] for x in table.columns] +
+               [get_obj_value(obj, x) for x in table.fields.values()])
+
+
+@pytest.mark.parametrize('jobs', (1, 2))
+def test_extract(database, tmp_path, jobs):
+    path, blobs = database
+    profile = load_profile(PROFILE)
+    db = TelegramDB(path)
+    if jobs > 1:
+        with ProcessPoolExecutor(jobs) as executor:
+            counts = db.extract(profile, str(tmp_path), executor, window=2)
+    else:
+        counts = db.extract(profile, str(tmp_path))
+    db.close()
+    assert counts == {x: len(blobs) for x in PROFILE}
+    messages, lines = profile
+    with open(messages.get_path(str(tmp_path)), encoding='utf-8',
+              newline='') as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == messages.names
+    expected = [[str(to_cell(x)) for x in y]
+                for y in expected_rows(messages, blobs)]
+    assert rows[1:] == expected
+    with open(lines.get_path(str(tmp_path)), encoding='utf-8') as f:
+        rows = [json.loads(x) for x in f]
+    expected = [json.loads(json.dumps(dict(zip(lines.names, x)), **JSON))
+                for x in expected_rows(lines, blobs)]
+    assert rows == expected
+
+
+@pytest.mark.parametrize('salvage', (False, True))
+def test_extract_errors(message_blobs, messages_database, tmp_path,
+                        monkeypatch, salvage):
+    message = message_blobs(seed=5)[0]
+    junk = bytes.fromhex('efbeadde') + bytes(8)
+    blobs = [junk, message[:40], junk + message, message]
+    monkeypatch.setattr(PARSER, 'salvage', salvage)
+    table = TableProfile('messages', ['date'], ['mid'], table='messages_v2')
+    db = TelegramDB(messages_database(blobs))
+    assert db.extract([table], str(tmp_path)) == {'messages': 4}
+    db.close()
+    with open(table.get_path(str(tmp_path)), encoding='utf-8') as f:
+        rows = list(csv.reader(f))[1:]
+    date = str(TLStruct().parse_blob(message, True)['date'])
+    assert rows == [['1', ''], ['2', ''], ['3', date if salvage else ''],
+                    ['4', date]]
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 25 14:31:20 2026
+
+@author: C. David
+"""
+import pytest
+from database import TelegramDB, PARSER
+from datatype import TLStruct, pythonic
+from tdb2 import TDB, TMessage
+
+
+# an unknown signature followed by two words that are no signature either
+JUNK = bytes.fromhex('efbeadde') + bytes(8)
+
+
+@pytest.fixture(scope='module')
+def message(message_blobs):
+    return message_blobs(seed=4)[0]
+
+
+@pytest.mark.parametrize('python', (False, True))
+def test_skip_unknown(message, python):
+    parser = TLStruct(salvage=True)
+    data = message + JUNK + message
+    result = parser.parse_blob(data, python)
+    expected = pythonic(TLStruct().parse_blob(message))
+    assert [pythonic(x) for x in result] == [expected, expected]
+    assert parser.skipped == [(len(message), len(message) + len(JUNK))]
+    parser.parse_blob(message, python)
+    assert parser.skipped == []
+
+
+def test_strict(message):
+    with pytest.raises(Exception):
+        TLStruct().parse_blob(message + JUNK + message)
+
+
+@pytest.mark.parametrize('python', (False, True))
+def test_skip_broken(message, python):
+    parser = TLStruct(salvage=True)
+    result = parser.parse_blob(message + message[:12], python)
+    assert pythonic(result) == pythonic(TLStruct().parse_blob(message))
+    assert parser.skipped == [(len(message), len(message) + 12)]
+
+
+def test_parse_many_skipped(message):
+    parser = TLStruct(salvage=True)
+    blobs = [message + JUNK + message, message, message + JUNK]
+    ranges = []
+    for value, error in parser.parse_many(blobs, True):
+        assert error is None and value
+        ranges.append(parser.skipped)
+    assert ranges == [[(len(message), len(message) + len(JUNK))], [],
+                      [(len(message), len(message) + len(JUNK))]]
+
+
+def test_parse_fields(message):
+    parser = TLStruct(salvage=True)
+    expected = TLStruct().parse_fields(message, TMessage.FIELDS)
+    assert parser.parse_fields(JUNK + message, TMessage.FIELDS) == \
+        pythonic(TLStruct().parse_blob(message))
+    assert parser.parse_fields(message, TMessage.FIELDS) == expected
+    assert parser.parse_fields(message[:40], TMessage.FIELDS) == {}
+    assert parser.skipped[0][0] == 0
+    with pytest.raises(ValueError):
+        TLStruct().parse_fields(message[:40], TMessage.FIELDS)
+
+
+@pytest.mark.parametrize('project', (False, True))
+@pytest.mark.parametrize('salvage', (False, True))
+def test_tdb_truncated(message, messages_database, tmp_path, monkeypatch,
+                       salvage, project):
+    path = messages_database([message, message[:40]])
+    monkeypatch.setattr(PARSER, 'salvage', salvage)
+    db = TelegramDB(path)
+    teledb = TDB(str(tmp_path), db, project=project)
+    try:
+        if not salvage:
+            with pytest.raises(Exception):
+                teledb._TDB__parse_table_messages()
+            return
+        teledb._TDB__parse_table_messages()
+        teledb._TDB__save_table_messages(str(tmp_path))
+    finally:
+        db.close()
+    messages = teledb._table_messages
+    assert messages[2].message_date_from_blob is None
+    assert messages[1].message_date_from_blob == \
+        TLStruct().parse_blob(message, True)['date']
+    assert (tmp_path / 'table_messages.txt').stat().st_size
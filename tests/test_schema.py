@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 09:12:40 2026
+
+@author: C. David
+"""
+import os.path as osp
+from glob import glob
+from generater.schema import (join_schema, split_schema, get_functions,
+                              get_groups)
+
+
+ROOT = osp.dirname(osp.dirname(osp.realpath(__file__)))
+
+SCHEMA_PATH = osp.join(ROOT, 'datatype', 'telegram.py')
+
+SCHEMA_DIR = osp.join(ROOT, 'datatype', 'schema')
+
+
+def test_join_schema():
+    content = join_schema(SCHEMA_PATH)
+    functions = get_functions(content)
+    assert len(functions) > 1000
+    assert 'bool_structures' in functions
+    assert all(x.startswith('struct_0x') or x.endswith('_structures')
+               for x in functions)
+
+
+def test_join_split_schema(tmp_path):
+    content = join_schema(SCHEMA_PATH)
+    target = str(tmp_path / 'telegram.py')
+    split_schema(content, target)
+    for path in [SCHEMA_PATH, *glob(osp.join(SCHEMA_DIR, '*.py'))]:
+        with open(path, encoding='utf-8') as f:
+            expected = f.read()
+        name = osp.relpath(path, osp.dirname(SCHEMA_PATH))
+        with open(tmp_path / name, encoding='utf-8') as f:
+            assert f.read() == expected, name
+    assert len(glob(str(tmp_path / 'schema' / '*.py'))) == \
+        len(glob(osp.join(SCHEMA_DIR, '*.py')))
+    assert join_schema(target) == content
+
+
+def test_get_groups_order():
+    content = join_schema(SCHEMA_PATH)
+    functions = {x: y.group(0) for x, y in get_functions(content).items()}
+    groups = get_groups(functions)
+    reverse = get_groups(dict(reversed(functions.items())))
+    assert reverse == groups
+    names = [x for y in groups.values() for x in y]
+    assert sorted(names) == sorted(functions)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 11:02:46 2026
+
+@author: C. David
+"""
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+import pytest
+from construct import Container
+from database import TelegramDB, PARSER
+from datatype import TLStruct, pythonic, format_dict
+from tdb2 import TMessage, MESSAGE_VALUES, MEDIA_VALUES
+
+
+NAMES = ('message', 'message_service')
+
+
+def displayed(obj):
+    '''obj with every value as its type name and str, as the outputs show'''
+    if isinstance(obj, Mapping):
+        return {x: displayed(y) for x, y in obj.items()}
+    if isinstance(obj, list):
+        return [displayed(x) for x in obj]
+    return type(obj).__name__, str(obj)
+
+
+@pytest.fixture(scope='module')
+def database(message_blobs, messages_database):
+    blobs = message_blobs(NAMES, seed=1)
+    return messages_database(blobs), blobs
+
+
+@pytest.mark.parametrize('compact', (False, True))
+def test_blobs_match_interpreted(database, compact):
+    path, blobs = database
+    parser = TLStruct()
+    db = TelegramDB(path, compact=compact)
+    for entry in db.get_messages():
+        expected = pythonic(parser.parse_blob(blobs[entry.mid - 1]))
+        message = TMessage(entry)
+        assert displayed(message.blob) == displayed(expected)
+        assert message.bdata == format_dict(expected)
+    db.close()
+
+
+@pytest.mark.parametrize('decoder', (False, True))
+def test_blob_backend(database, monkeypatch, decoder):
+    path, blobs = database
+    monkeypatch.setattr(PARSER, 'decoder', decoder)
+    db = TelegramDB(path)
+    assert db.parser.decoder is decoder
+    entry = db.get_messages()[0]
+    assert isinstance(entry.data_blob, Container) is not decoder
+    assert pythonic(entry.data_blob) == \
+        pythonic(TLStruct().parse_blob(blobs[0]))
+    db.close()
+
+
+def test_timeline_fields(database):
+    path, blobs = database
+    parser = TLStruct()
+    db = TelegramDB(path, compact=True)
+    for entry in db.get_messages():
+        blob = pythonic(parser.parse_blob(blobs[entry.mid - 1]))
+        assert TMessage(entry).fields == TMessage(entry).blob
+        fields = TMessage(entry, project=True).fields
+        for extractor in (MESSAGE_VALUES, MEDIA_VALUES):
+            expected = extractor(blob)
+            for key, value in extractor(fields).items():
+                if isinstance(value, (Mapping, list)):
+                    assert bool(value) == bool(expected[key]), key
+                else:
+                    assert displayed(value) == displayed(expected[key]), key
+    db.close()
+
+
+def test_decode_blobs_spawn(message_blobs, messages_database, monkeypatch):
+    parser = TLStruct(salvage=True)
+    data = message_blobs(seed=1)[0]
+    blobs = [data, data + b'\xef\xbe\xad\xde' + bytes(8) + data]
+    path = messages_database(blobs)
+    monkeypatch.setattr(PARSER, 'salvage', True)
+    db = TelegramDB(path)
+    with ProcessPoolExecutor(1, get_context('spawn')) as executor:
+        db.decode_blobs('messages', 'data', executor)
+    decoded = db.decoded[('messages_v2', 'data')]
+    db.close()
+    assert decoded == {(x,): parser.parse_blob(y, True)
+                       for x, y in enumerate(blobs, 1)}
+    assert len(decoded[(2,)]) == 2
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 14:05:33 2026
+
+@author: C. David
+"""
+import io
+import math
+import pytest
+from construct.lib import HexDisplayedInteger
+from datatype import format_dict, JsonWriter
+from datatype.compact import Compactor
+from datatype.utils import plain_floats
+
+
+OBJECTS = [
+    {'sname': 'geo_point', 'long': 12.5, 'lat': -0.00001, 'id': 1 << 70},
+    {'duration': 1e16, 'values': [1.5, 0.0, -2.25e-7, 3]},
+    {'w': math.nan, 'h': [math.inf, {'x': -math.inf}]},
+    {'signature': HexDisplayedInteger.new(0x1f4661b9, '08X'),
+     'text': 'ünïcode', 'data': b'\x00\x01', 'flags': {'out': True}},
+    [], {}, None, 'text', 1.0,
+]
+
+
+def test_plain_floats():
+    assert plain_floats({'a': [1.5, {'b': 0.0001}], 'c': 9999999999999998.0})
+    assert not plain_floats({'a': [{'b': 1e16}]})
+    assert not plain_floats([0.00009])
+    assert not plain_floats({'a': math.nan})
+    assert plain_floats(Compactor().compact({'a': 1.5, 'b': [2.5]}))
+    assert not plain_floats(Compactor().compact({'a': {'b': math.inf}}))
+
+
+@pytest.mark.parametrize('fast', (False, True))
+def test_json_writer(fast):
+    f = io.StringIO()
+    with JsonWriter(f, buffer_size=64, fast=fast) as writer:
+        for obj in OBJECTS:
+            writer.write_object(obj)
+            writer.write('\n')
+        writer.write_object(Compactor().compact(OBJECTS[0]))
+    expected = ''.join(f'{format_dict(x)}\n' for x in OBJECTS)
+    assert f.getvalue() == expected + format_dict(OBJECTS[0])